@@ -18,11 +18,134 @@ __version__ = "5.0.2.post4"
 
 # Define package exports
 __all__ = [
+    "AiplacementCourseassistApi",
+    "AiplacementEditorApi",
+    "AuthEmailApi",
+    "BlockAccessreviewApi",
+    "BlockRecentlyaccesseditemsApi",
+    "BlockStarredcoursesApi",
+    "CoreApi",
+    "CoreAdminApi",
+    "CoreAiApi",
+    "CoreAuthApi",
+    "CoreBackupApi",
+    "CoreBadgesApi",
+    "CoreBlockApi",
+    "CoreBlogApi",
+    "CoreCalendarApi",
+    "CoreCheckApi",
+    "CoreCohortApi",
+    "CoreCommentApi",
+    "CoreCompetencyApi",
+    "CoreCompletionApi",
+    "CoreContentbankApi",
+    "CoreCourseApi",
+    "CoreCourseformatApi",
+    "CoreCustomfieldApi",
+    "CoreEnrolApi",
+    "CoreFilesApi",
+    "CoreFiltersApi",
+    "CoreFormApi",
+    "CoreGradesApi",
+    "CoreGradingApi",
+    "CoreGroupApi",
+    "CoreH5pApi",
+    "CoreLoginApi",
+    "CoreMessageApi",
+    "CoreMoodlenetApi",
+    "CoreMyApi",
+    "CoreNotesApi",
+    "CoreOutputApi",
+    "CorePaymentApi",
+    "CoreQuestionApi",
+    "CoreRatingApi",
+    "CoreReportbuilderApi",
+    "CoreRoleApi",
+    "CoreSearchApi",
+    "CoreSmsApi",
+    "CoreTableApi",
+    "CoreTagApi",
+    "CoreUserApi",
+    "CoreWebserviceApi",
+    "CoreXapiApi",
+    "CustomfieldNumberApi",
+    "EditorTinyApi",
+    "EnrolGuestApi",
+    "EnrolManualApi",
+    "EnrolMetaApi",
+    "EnrolSelfApi",
+    "GradereportGraderApi",
+    "GradereportOverviewApi",
+    "GradereportSingleviewApi",
+    "GradereportUserApi",
+    "GradingformGuideApi",
+    "GradingformRubricApi",
+    "MediaVideojsApi",
+    "MessageAirnotifierApi",
+    "MessagePopupApi",
+    "ModAssignApi",
+    "ModBigbluebuttonbnApi",
+    "ModBookApi",
+    "ModChoiceApi",
+    "ModDataApi",
+    "ModFeedbackApi",
+    "ModFolderApi",
+    "ModForumApi",
+    "ModGlossaryApi",
+    "ModH5pactivityApi",
+    "ModImscpApi",
+    "ModLabelApi",
+    "ModLessonApi",
+    "ModLtiApi",
+    "ModPageApi",
+    "ModQuizApi",
+    "ModResourceApi",
+    "ModScormApi",
+    "ModUrlApi",
+    "ModWikiApi",
+    "ModWorkshopApi",
+    "PaygwPaypalApi",
+    "QbankColumnsortorderApi",
+    "QbankEditquestionApi",
+    "QbankManagecategoriesApi",
+    "QbankTagquestionApi",
+    "QbankViewquestiontextApi",
+    "QuizaccessSebApi",
+    "ReportCompetencyApi",
+    "ReportInsightsApi",
+    "TinyAutosaveApi",
+    "TinyEquationApi",
+    "TinyMediaApi",
+    "TinyPremiumApi",
+    "ToolAdminApi",
+    "ToolAnalyticsApi",
+    "ToolBehatApi",
+    "ToolDataprivacyApi",
+    "ToolLpApi",
+    "ToolMobileApi",
+    "ToolMoodlenetApi",
+    "ToolPolicyApi",
+    "ToolTemplatelibraryApi",
+    "ToolUsertoursApi",
+    "ToolXmldbApi",
     "DefaultApi",
     "ApiResponse",
     "ApiClient",
     "Configuration",
     "settings",
+    "FileMirror",
+    "MirrorReport",
+    "CourseSync",
+    "CourseChange",
+    "PreparedCall",
+    "Paginator",
+    "ResponseCache",
+    "DiskResponseCache",
+    "ClientManager",
+    "TokenProvider",
+    "Instrumentation",
+    "PrometheusExporter",
+    "LogExporter",
     "OpenApiException",
     "ApiTypeError",
     "ApiValueError",
@@ -1150,11 +1273,134 @@ __all__ = [
 
 if __import__("typing").TYPE_CHECKING:
     # import apis into sdk package
+    from poodle_async_full.api.aiplacement_courseassist_api import AiplacementCourseassistApi as AiplacementCourseassistApi
+    from poodle_async_full.api.aiplacement_editor_api import AiplacementEditorApi as AiplacementEditorApi
+    from poodle_async_full.api.auth_email_api import AuthEmailApi as AuthEmailApi
+    from poodle_async_full.api.block_accessreview_api import BlockAccessreviewApi as BlockAccessreviewApi
+    from poodle_async_full.api.block_recentlyaccesseditems_api import BlockRecentlyaccesseditemsApi as BlockRecentlyaccesseditemsApi
+    from poodle_async_full.api.block_starredcourses_api import BlockStarredcoursesApi as BlockStarredcoursesApi
+    from poodle_async_full.api.core_api import CoreApi as CoreApi
+    from poodle_async_full.api.core_admin_api import CoreAdminApi as CoreAdminApi
+    from poodle_async_full.api.core_ai_api import CoreAiApi as CoreAiApi
+    from poodle_async_full.api.core_auth_api import CoreAuthApi as CoreAuthApi
+    from poodle_async_full.api.core_backup_api import CoreBackupApi as CoreBackupApi
+    from poodle_async_full.api.core_badges_api import CoreBadgesApi as CoreBadgesApi
+    from poodle_async_full.api.core_block_api import CoreBlockApi as CoreBlockApi
+    from poodle_async_full.api.core_blog_api import CoreBlogApi as CoreBlogApi
+    from poodle_async_full.api.core_calendar_api import CoreCalendarApi as CoreCalendarApi
+    from poodle_async_full.api.core_check_api import CoreCheckApi as CoreCheckApi
+    from poodle_async_full.api.core_cohort_api import CoreCohortApi as CoreCohortApi
+    from poodle_async_full.api.core_comment_api import CoreCommentApi as CoreCommentApi
+    from poodle_async_full.api.core_competency_api import CoreCompetencyApi as CoreCompetencyApi
+    from poodle_async_full.api.core_completion_api import CoreCompletionApi as CoreCompletionApi
+    from poodle_async_full.api.core_contentbank_api import CoreContentbankApi as CoreContentbankApi
+    from poodle_async_full.api.core_course_api import CoreCourseApi as CoreCourseApi
+    from poodle_async_full.api.core_courseformat_api import CoreCourseformatApi as CoreCourseformatApi
+    from poodle_async_full.api.core_customfield_api import CoreCustomfieldApi as CoreCustomfieldApi
+    from poodle_async_full.api.core_enrol_api import CoreEnrolApi as CoreEnrolApi
+    from poodle_async_full.api.core_files_api import CoreFilesApi as CoreFilesApi
+    from poodle_async_full.api.core_filters_api import CoreFiltersApi as CoreFiltersApi
+    from poodle_async_full.api.core_form_api import CoreFormApi as CoreFormApi
+    from poodle_async_full.api.core_grades_api import CoreGradesApi as CoreGradesApi
+    from poodle_async_full.api.core_grading_api import CoreGradingApi as CoreGradingApi
+    from poodle_async_full.api.core_group_api import CoreGroupApi as CoreGroupApi
+    from poodle_async_full.api.core_h5p_api import CoreH5pApi as CoreH5pApi
+    from poodle_async_full.api.core_login_api import CoreLoginApi as CoreLoginApi
+    from poodle_async_full.api.core_message_api import CoreMessageApi as CoreMessageApi
+    from poodle_async_full.api.core_moodlenet_api import CoreMoodlenetApi as CoreMoodlenetApi
+    from poodle_async_full.api.core_my_api import CoreMyApi as CoreMyApi
+    from poodle_async_full.api.core_notes_api import CoreNotesApi as CoreNotesApi
+    from poodle_async_full.api.core_output_api import CoreOutputApi as CoreOutputApi
+    from poodle_async_full.api.core_payment_api import CorePaymentApi as CorePaymentApi
+    from poodle_async_full.api.core_question_api import CoreQuestionApi as CoreQuestionApi
+    from poodle_async_full.api.core_rating_api import CoreRatingApi as CoreRatingApi
+    from poodle_async_full.api.core_reportbuilder_api import CoreReportbuilderApi as CoreReportbuilderApi
+    from poodle_async_full.api.core_role_api import CoreRoleApi as CoreRoleApi
+    from poodle_async_full.api.core_search_api import CoreSearchApi as CoreSearchApi
+    from poodle_async_full.api.core_sms_api import CoreSmsApi as CoreSmsApi
+    from poodle_async_full.api.core_table_api import CoreTableApi as CoreTableApi
+    from poodle_async_full.api.core_tag_api import CoreTagApi as CoreTagApi
+    from poodle_async_full.api.core_user_api import CoreUserApi as CoreUserApi
+    from poodle_async_full.api.core_webservice_api import CoreWebserviceApi as CoreWebserviceApi
+    from poodle_async_full.api.core_xapi_api import CoreXapiApi as CoreXapiApi
+    from poodle_async_full.api.customfield_number_api import CustomfieldNumberApi as CustomfieldNumberApi
+    from poodle_async_full.api.editor_tiny_api import EditorTinyApi as EditorTinyApi
+    from poodle_async_full.api.enrol_guest_api import EnrolGuestApi as EnrolGuestApi
+    from poodle_async_full.api.enrol_manual_api import EnrolManualApi as EnrolManualApi
+    from poodle_async_full.api.enrol_meta_api import EnrolMetaApi as EnrolMetaApi
+    from poodle_async_full.api.enrol_self_api import EnrolSelfApi as EnrolSelfApi
+    from poodle_async_full.api.gradereport_grader_api import GradereportGraderApi as GradereportGraderApi
+    from poodle_async_full.api.gradereport_overview_api import GradereportOverviewApi as GradereportOverviewApi
+    from poodle_async_full.api.gradereport_singleview_api import GradereportSingleviewApi as GradereportSingleviewApi
+    from poodle_async_full.api.gradereport_user_api import GradereportUserApi as GradereportUserApi
+    from poodle_async_full.api.gradingform_guide_api import GradingformGuideApi as GradingformGuideApi
+    from poodle_async_full.api.gradingform_rubric_api import GradingformRubricApi as GradingformRubricApi
+    from poodle_async_full.api.media_videojs_api import MediaVideojsApi as MediaVideojsApi
+    from poodle_async_full.api.message_airnotifier_api import MessageAirnotifierApi as MessageAirnotifierApi
+    from poodle_async_full.api.message_popup_api import MessagePopupApi as MessagePopupApi
+    from poodle_async_full.api.mod_assign_api import ModAssignApi as ModAssignApi
+    from poodle_async_full.api.mod_bigbluebuttonbn_api import ModBigbluebuttonbnApi as ModBigbluebuttonbnApi
+    from poodle_async_full.api.mod_book_api import ModBookApi as ModBookApi
+    from poodle_async_full.api.mod_choice_api import ModChoiceApi as ModChoiceApi
+    from poodle_async_full.api.mod_data_api import ModDataApi as ModDataApi
+    from poodle_async_full.api.mod_feedback_api import ModFeedbackApi as ModFeedbackApi
+    from poodle_async_full.api.mod_folder_api import ModFolderApi as ModFolderApi
+    from poodle_async_full.api.mod_forum_api import ModForumApi as ModForumApi
+    from poodle_async_full.api.mod_glossary_api import ModGlossaryApi as ModGlossaryApi
+    from poodle_async_full.api.mod_h5pactivity_api import ModH5pactivityApi as ModH5pactivityApi
+    from poodle_async_full.api.mod_imscp_api import ModImscpApi as ModImscpApi
+    from poodle_async_full.api.mod_label_api import ModLabelApi as ModLabelApi
+    from poodle_async_full.api.mod_lesson_api import ModLessonApi as ModLessonApi
+    from poodle_async_full.api.mod_lti_api import ModLtiApi as ModLtiApi
+    from poodle_async_full.api.mod_page_api import ModPageApi as ModPageApi
+    from poodle_async_full.api.mod_quiz_api import ModQuizApi as ModQuizApi
+    from poodle_async_full.api.mod_resource_api import ModResourceApi as ModResourceApi
+    from poodle_async_full.api.mod_scorm_api import ModScormApi as ModScormApi
+    from poodle_async_full.api.mod_url_api import ModUrlApi as ModUrlApi
+    from poodle_async_full.api.mod_wiki_api import ModWikiApi as ModWikiApi
+    from poodle_async_full.api.mod_workshop_api import ModWorkshopApi as ModWorkshopApi
+    from poodle_async_full.api.paygw_paypal_api import PaygwPaypalApi as PaygwPaypalApi
+    from poodle_async_full.api.qbank_columnsortorder_api import QbankColumnsortorderApi as QbankColumnsortorderApi
+    from poodle_async_full.api.qbank_editquestion_api import QbankEditquestionApi as QbankEditquestionApi
+    from poodle_async_full.api.qbank_managecategories_api import QbankManagecategoriesApi as QbankManagecategoriesApi
+    from poodle_async_full.api.qbank_tagquestion_api import QbankTagquestionApi as QbankTagquestionApi
+    from poodle_async_full.api.qbank_viewquestiontext_api import QbankViewquestiontextApi as QbankViewquestiontextApi
+    from poodle_async_full.api.quizaccess_seb_api import QuizaccessSebApi as QuizaccessSebApi
+    from poodle_async_full.api.report_competency_api import ReportCompetencyApi as ReportCompetencyApi
+    from poodle_async_full.api.report_insights_api import ReportInsightsApi as ReportInsightsApi
+    from poodle_async_full.api.tiny_autosave_api import TinyAutosaveApi as TinyAutosaveApi
+    from poodle_async_full.api.tiny_equation_api import TinyEquationApi as TinyEquationApi
+    from poodle_async_full.api.tiny_media_api import TinyMediaApi as TinyMediaApi
+    from poodle_async_full.api.tiny_premium_api import TinyPremiumApi as TinyPremiumApi
+    from poodle_async_full.api.tool_admin_api import ToolAdminApi as ToolAdminApi
+    from poodle_async_full.api.tool_analytics_api import ToolAnalyticsApi as ToolAnalyticsApi
+    from poodle_async_full.api.tool_behat_api import ToolBehatApi as ToolBehatApi
+    from poodle_async_full.api.tool_dataprivacy_api import ToolDataprivacyApi as ToolDataprivacyApi
+    from poodle_async_full.api.tool_lp_api import ToolLpApi as ToolLpApi
+    from poodle_async_full.api.tool_mobile_api import ToolMobileApi as ToolMobileApi
+    from poodle_async_full.api.tool_moodlenet_api import ToolMoodlenetApi as ToolMoodlenetApi
+    from poodle_async_full.api.tool_policy_api import ToolPolicyApi as ToolPolicyApi
+    from poodle_async_full.api.tool_templatelibrary_api import ToolTemplatelibraryApi as ToolTemplatelibraryApi
+    from poodle_async_full.api.tool_usertours_api import ToolUsertoursApi as ToolUsertoursApi
+    from poodle_async_full.api.tool_xmldb_api import ToolXmldbApi as ToolXmldbApi
     from poodle_async_full.api.default_api import DefaultApi as DefaultApi
     
     # import ApiClient
     from poodle_async_full.api_response import ApiResponse as ApiResponse
     from poodle_async_full.api_client import ApiClient as ApiClient
+    from poodle_async_full.sync import FileMirror as FileMirror
+    from poodle_async_full.sync import MirrorReport as MirrorReport
+    from poodle_async_full.sync import CourseSync as CourseSync
+    from poodle_async_full.sync import CourseChange as CourseChange
+    from poodle_async_full.api_client import PreparedCall as PreparedCall
+    from poodle_async_full.api_client import Paginator as Paginator
+    from poodle_async_full.cache import ResponseCache as ResponseCache
+    from poodle_async_full.cache import DiskResponseCache as DiskResponseCache
+    from poodle_async_full.client_manager import ClientManager as ClientManager
+    from poodle_async_full.tokens import TokenProvider as TokenProvider
+    from poodle_async_full.instrumentation import Instrumentation as Instrumentation
+    from poodle_async_full.instrumentation import PrometheusExporter as PrometheusExporter
+    from poodle_async_full.instrumentation import LogExporter as LogExporter
     from poodle_async_full.configuration import Configuration as Configuration
     from poodle_async_full.configuration import settings as settings
     from poodle_async_full.exceptions import OpenApiException as OpenApiException
@@ -2292,11 +2538,134 @@ else:
             ("__version__", __version__),
             ("__all__", __all__),
             """# import apis into sdk package
+from poodle_async_full.api.aiplacement_courseassist_api import AiplacementCourseassistApi as AiplacementCourseassistApi
+from poodle_async_full.api.aiplacement_editor_api import AiplacementEditorApi as AiplacementEditorApi
+from poodle_async_full.api.auth_email_api import AuthEmailApi as AuthEmailApi
+from poodle_async_full.api.block_accessreview_api import BlockAccessreviewApi as BlockAccessreviewApi
+from poodle_async_full.api.block_recentlyaccesseditems_api import BlockRecentlyaccesseditemsApi as BlockRecentlyaccesseditemsApi
+from poodle_async_full.api.block_starredcourses_api import BlockStarredcoursesApi as BlockStarredcoursesApi
+from poodle_async_full.api.core_api import CoreApi as CoreApi
+from poodle_async_full.api.core_admin_api import CoreAdminApi as CoreAdminApi
+from poodle_async_full.api.core_ai_api import CoreAiApi as CoreAiApi
+from poodle_async_full.api.core_auth_api import CoreAuthApi as CoreAuthApi
+from poodle_async_full.api.core_backup_api import CoreBackupApi as CoreBackupApi
+from poodle_async_full.api.core_badges_api import CoreBadgesApi as CoreBadgesApi
+from poodle_async_full.api.core_block_api import CoreBlockApi as CoreBlockApi
+from poodle_async_full.api.core_blog_api import CoreBlogApi as CoreBlogApi
+from poodle_async_full.api.core_calendar_api import CoreCalendarApi as CoreCalendarApi
+from poodle_async_full.api.core_check_api import CoreCheckApi as CoreCheckApi
+from poodle_async_full.api.core_cohort_api import CoreCohortApi as CoreCohortApi
+from poodle_async_full.api.core_comment_api import CoreCommentApi as CoreCommentApi
+from poodle_async_full.api.core_competency_api import CoreCompetencyApi as CoreCompetencyApi
+from poodle_async_full.api.core_completion_api import CoreCompletionApi as CoreCompletionApi
+from poodle_async_full.api.core_contentbank_api import CoreContentbankApi as CoreContentbankApi
+from poodle_async_full.api.core_course_api import CoreCourseApi as CoreCourseApi
+from poodle_async_full.api.core_courseformat_api import CoreCourseformatApi as CoreCourseformatApi
+from poodle_async_full.api.core_customfield_api import CoreCustomfieldApi as CoreCustomfieldApi
+from poodle_async_full.api.core_enrol_api import CoreEnrolApi as CoreEnrolApi
+from poodle_async_full.api.core_files_api import CoreFilesApi as CoreFilesApi
+from poodle_async_full.api.core_filters_api import CoreFiltersApi as CoreFiltersApi
+from poodle_async_full.api.core_form_api import CoreFormApi as CoreFormApi
+from poodle_async_full.api.core_grades_api import CoreGradesApi as CoreGradesApi
+from poodle_async_full.api.core_grading_api import CoreGradingApi as CoreGradingApi
+from poodle_async_full.api.core_group_api import CoreGroupApi as CoreGroupApi
+from poodle_async_full.api.core_h5p_api import CoreH5pApi as CoreH5pApi
+from poodle_async_full.api.core_login_api import CoreLoginApi as CoreLoginApi
+from poodle_async_full.api.core_message_api import CoreMessageApi as CoreMessageApi
+from poodle_async_full.api.core_moodlenet_api import CoreMoodlenetApi as CoreMoodlenetApi
+from poodle_async_full.api.core_my_api import CoreMyApi as CoreMyApi
+from poodle_async_full.api.core_notes_api import CoreNotesApi as CoreNotesApi
+from poodle_async_full.api.core_output_api import CoreOutputApi as CoreOutputApi
+from poodle_async_full.api.core_payment_api import CorePaymentApi as CorePaymentApi
+from poodle_async_full.api.core_question_api import CoreQuestionApi as CoreQuestionApi
+from poodle_async_full.api.core_rating_api import CoreRatingApi as CoreRatingApi
+from poodle_async_full.api.core_reportbuilder_api import CoreReportbuilderApi as CoreReportbuilderApi
+from poodle_async_full.api.core_role_api import CoreRoleApi as CoreRoleApi
+from poodle_async_full.api.core_search_api import CoreSearchApi as CoreSearchApi
+from poodle_async_full.api.core_sms_api import CoreSmsApi as CoreSmsApi
+from poodle_async_full.api.core_table_api import CoreTableApi as CoreTableApi
+from poodle_async_full.api.core_tag_api import CoreTagApi as CoreTagApi
+from poodle_async_full.api.core_user_api import CoreUserApi as CoreUserApi
+from poodle_async_full.api.core_webservice_api import CoreWebserviceApi as CoreWebserviceApi
+from poodle_async_full.api.core_xapi_api import CoreXapiApi as CoreXapiApi
+from poodle_async_full.api.customfield_number_api import CustomfieldNumberApi as CustomfieldNumberApi
+from poodle_async_full.api.editor_tiny_api import EditorTinyApi as EditorTinyApi
+from poodle_async_full.api.enrol_guest_api import EnrolGuestApi as EnrolGuestApi
+from poodle_async_full.api.enrol_manual_api import EnrolManualApi as EnrolManualApi
+from poodle_async_full.api.enrol_meta_api import EnrolMetaApi as EnrolMetaApi
+from poodle_async_full.api.enrol_self_api import EnrolSelfApi as EnrolSelfApi
+from poodle_async_full.api.gradereport_grader_api import GradereportGraderApi as GradereportGraderApi
+from poodle_async_full.api.gradereport_overview_api import GradereportOverviewApi as GradereportOverviewApi
+from poodle_async_full.api.gradereport_singleview_api import GradereportSingleviewApi as GradereportSingleviewApi
+from poodle_async_full.api.gradereport_user_api import GradereportUserApi as GradereportUserApi
+from poodle_async_full.api.gradingform_guide_api import GradingformGuideApi as GradingformGuideApi
+from poodle_async_full.api.gradingform_rubric_api import GradingformRubricApi as GradingformRubricApi
+from poodle_async_full.api.media_videojs_api import MediaVideojsApi as MediaVideojsApi
+from poodle_async_full.api.message_airnotifier_api import MessageAirnotifierApi as MessageAirnotifierApi
+from poodle_async_full.api.message_popup_api import MessagePopupApi as MessagePopupApi
+from poodle_async_full.api.mod_assign_api import ModAssignApi as ModAssignApi
+from poodle_async_full.api.mod_bigbluebuttonbn_api import ModBigbluebuttonbnApi as ModBigbluebuttonbnApi
+from poodle_async_full.api.mod_book_api import ModBookApi as ModBookApi
+from poodle_async_full.api.mod_choice_api import ModChoiceApi as ModChoiceApi
+from poodle_async_full.api.mod_data_api import ModDataApi as ModDataApi
+from poodle_async_full.api.mod_feedback_api import ModFeedbackApi as ModFeedbackApi
+from poodle_async_full.api.mod_folder_api import ModFolderApi as ModFolderApi
+from poodle_async_full.api.mod_forum_api import ModForumApi as ModForumApi
+from poodle_async_full.api.mod_glossary_api import ModGlossaryApi as ModGlossaryApi
+from poodle_async_full.api.mod_h5pactivity_api import ModH5pactivityApi as ModH5pactivityApi
+from poodle_async_full.api.mod_imscp_api import ModImscpApi as ModImscpApi
+from poodle_async_full.api.mod_label_api import ModLabelApi as ModLabelApi
+from poodle_async_full.api.mod_lesson_api import ModLessonApi as ModLessonApi
+from poodle_async_full.api.mod_lti_api import ModLtiApi as ModLtiApi
+from poodle_async_full.api.mod_page_api import ModPageApi as ModPageApi
+from poodle_async_full.api.mod_quiz_api import ModQuizApi as ModQuizApi
+from poodle_async_full.api.mod_resource_api import ModResourceApi as ModResourceApi
+from poodle_async_full.api.mod_scorm_api import ModScormApi as ModScormApi
+from poodle_async_full.api.mod_url_api import ModUrlApi as ModUrlApi
+from poodle_async_full.api.mod_wiki_api import ModWikiApi as ModWikiApi
+from poodle_async_full.api.mod_workshop_api import ModWorkshopApi as ModWorkshopApi
+from poodle_async_full.api.paygw_paypal_api import PaygwPaypalApi as PaygwPaypalApi
+from poodle_async_full.api.qbank_columnsortorder_api import QbankColumnsortorderApi as QbankColumnsortorderApi
+from poodle_async_full.api.qbank_editquestion_api import QbankEditquestionApi as QbankEditquestionApi
+from poodle_async_full.api.qbank_managecategories_api import QbankManagecategoriesApi as QbankManagecategoriesApi
+from poodle_async_full.api.qbank_tagquestion_api import QbankTagquestionApi as QbankTagquestionApi
+from poodle_async_full.api.qbank_viewquestiontext_api import QbankViewquestiontextApi as QbankViewquestiontextApi
+from poodle_async_full.api.quizaccess_seb_api import QuizaccessSebApi as QuizaccessSebApi
+from poodle_async_full.api.report_competency_api import ReportCompetencyApi as ReportCompetencyApi
+from poodle_async_full.api.report_insights_api import ReportInsightsApi as ReportInsightsApi
+from poodle_async_full.api.tiny_autosave_api import TinyAutosaveApi as TinyAutosaveApi
+from poodle_async_full.api.tiny_equation_api import TinyEquationApi as TinyEquationApi
+from poodle_async_full.api.tiny_media_api import TinyMediaApi as TinyMediaApi
+from poodle_async_full.api.tiny_premium_api import TinyPremiumApi as TinyPremiumApi
+from poodle_async_full.api.tool_admin_api import ToolAdminApi as ToolAdminApi
+from poodle_async_full.api.tool_analytics_api import ToolAnalyticsApi as ToolAnalyticsApi
+from poodle_async_full.api.tool_behat_api import ToolBehatApi as ToolBehatApi
+from poodle_async_full.api.tool_dataprivacy_api import ToolDataprivacyApi as ToolDataprivacyApi
+from poodle_async_full.api.tool_lp_api import ToolLpApi as ToolLpApi
+from poodle_async_full.api.tool_mobile_api import ToolMobileApi as ToolMobileApi
+from poodle_async_full.api.tool_moodlenet_api import ToolMoodlenetApi as ToolMoodlenetApi
+from poodle_async_full.api.tool_policy_api import ToolPolicyApi as ToolPolicyApi
+from poodle_async_full.api.tool_templatelibrary_api import ToolTemplatelibraryApi as ToolTemplatelibraryApi
+from poodle_async_full.api.tool_usertours_api import ToolUsertoursApi as ToolUsertoursApi
+from poodle_async_full.api.tool_xmldb_api import ToolXmldbApi as ToolXmldbApi
 from poodle_async_full.api.default_api import DefaultApi as DefaultApi
 
 # import ApiClient
 from poodle_async_full.api_response import ApiResponse as ApiResponse
 from poodle_async_full.api_client import ApiClient as ApiClient
+from poodle_async_full.sync import FileMirror as FileMirror
+from poodle_async_full.sync import MirrorReport as MirrorReport
+from poodle_async_full.sync import CourseSync as CourseSync
+from poodle_async_full.sync import CourseChange as CourseChange
+from poodle_async_full.api_client import PreparedCall as PreparedCall
+from poodle_async_full.api_client import Paginator as Paginator
+from poodle_async_full.cache import ResponseCache as ResponseCache
+from poodle_async_full.cache import DiskResponseCache as DiskResponseCache
+from poodle_async_full.client_manager import ClientManager as ClientManager
+from poodle_async_full.tokens import TokenProvider as TokenProvider
+from poodle_async_full.instrumentation import Instrumentation as Instrumentation
+from poodle_async_full.instrumentation import PrometheusExporter as PrometheusExporter
+from poodle_async_full.instrumentation import LogExporter as LogExporter
 from poodle_async_full.configuration import Configuration as Configuration
 from poodle_async_full.configuration import settings as settings
 from poodle_async_full.exceptions import OpenApiException as OpenApiException
@@ -2,6 +2,116 @@
 
 if __import__("typing").TYPE_CHECKING:
     # import apis into api package
+    from poodle_async_full.api.aiplacement_courseassist_api import AiplacementCourseassistApi
+    from poodle_async_full.api.aiplacement_editor_api import AiplacementEditorApi
+    from poodle_async_full.api.auth_email_api import AuthEmailApi
+    from poodle_async_full.api.block_accessreview_api import BlockAccessreviewApi
+    from poodle_async_full.api.block_recentlyaccesseditems_api import BlockRecentlyaccesseditemsApi
+    from poodle_async_full.api.block_starredcourses_api import BlockStarredcoursesApi
+    from poodle_async_full.api.core_api import CoreApi
+    from poodle_async_full.api.core_admin_api import CoreAdminApi
+    from poodle_async_full.api.core_ai_api import CoreAiApi
+    from poodle_async_full.api.core_auth_api import CoreAuthApi
+    from poodle_async_full.api.core_backup_api import CoreBackupApi
+    from poodle_async_full.api.core_badges_api import CoreBadgesApi
+    from poodle_async_full.api.core_block_api import CoreBlockApi
+    from poodle_async_full.api.core_blog_api import CoreBlogApi
+    from poodle_async_full.api.core_calendar_api import CoreCalendarApi
+    from poodle_async_full.api.core_check_api import CoreCheckApi
+    from poodle_async_full.api.core_cohort_api import CoreCohortApi
+    from poodle_async_full.api.core_comment_api import CoreCommentApi
+    from poodle_async_full.api.core_competency_api import CoreCompetencyApi
+    from poodle_async_full.api.core_completion_api import CoreCompletionApi
+    from poodle_async_full.api.core_contentbank_api import CoreContentbankApi
+    from poodle_async_full.api.core_course_api import CoreCourseApi
+    from poodle_async_full.api.core_courseformat_api import CoreCourseformatApi
+    from poodle_async_full.api.core_customfield_api import CoreCustomfieldApi
+    from poodle_async_full.api.core_enrol_api import CoreEnrolApi
+    from poodle_async_full.api.core_files_api import CoreFilesApi
+    from poodle_async_full.api.core_filters_api import CoreFiltersApi
+    from poodle_async_full.api.core_form_api import CoreFormApi
+    from poodle_async_full.api.core_grades_api import CoreGradesApi
+    from poodle_async_full.api.core_grading_api import CoreGradingApi
+    from poodle_async_full.api.core_group_api import CoreGroupApi
+    from poodle_async_full.api.core_h5p_api import CoreH5pApi
+    from poodle_async_full.api.core_login_api import CoreLoginApi
+    from poodle_async_full.api.core_message_api import CoreMessageApi
+    from poodle_async_full.api.core_moodlenet_api import CoreMoodlenetApi
+    from poodle_async_full.api.core_my_api import CoreMyApi
+    from poodle_async_full.api.core_notes_api import CoreNotesApi
+    from poodle_async_full.api.core_output_api import CoreOutputApi
+    from poodle_async_full.api.core_payment_api import CorePaymentApi
+    from poodle_async_full.api.core_question_api import CoreQuestionApi
+    from poodle_async_full.api.core_rating_api import CoreRatingApi
+    from poodle_async_full.api.core_reportbuilder_api import CoreReportbuilderApi
+    from poodle_async_full.api.core_role_api import CoreRoleApi
+    from poodle_async_full.api.core_search_api import CoreSearchApi
+    from poodle_async_full.api.core_sms_api import CoreSmsApi
+    from poodle_async_full.api.core_table_api import CoreTableApi
+    from poodle_async_full.api.core_tag_api import CoreTagApi
+    from poodle_async_full.api.core_user_api import CoreUserApi
+    from poodle_async_full.api.core_webservice_api import CoreWebserviceApi
+    from poodle_async_full.api.core_xapi_api import CoreXapiApi
+    from poodle_async_full.api.customfield_number_api import CustomfieldNumberApi
+    from poodle_async_full.api.editor_tiny_api import EditorTinyApi
+    from poodle_async_full.api.enrol_guest_api import EnrolGuestApi
+    from poodle_async_full.api.enrol_manual_api import EnrolManualApi
+    from poodle_async_full.api.enrol_meta_api import EnrolMetaApi
+    from poodle_async_full.api.enrol_self_api import EnrolSelfApi
+    from poodle_async_full.api.gradereport_grader_api import GradereportGraderApi
+    from poodle_async_full.api.gradereport_overview_api import GradereportOverviewApi
+    from poodle_async_full.api.gradereport_singleview_api import GradereportSingleviewApi
+    from poodle_async_full.api.gradereport_user_api import GradereportUserApi
+    from poodle_async_full.api.gradingform_guide_api import GradingformGuideApi
+    from poodle_async_full.api.gradingform_rubric_api import GradingformRubricApi
+    from poodle_async_full.api.media_videojs_api import MediaVideojsApi
+    from poodle_async_full.api.message_airnotifier_api import MessageAirnotifierApi
+    from poodle_async_full.api.message_popup_api import MessagePopupApi
+    from poodle_async_full.api.mod_assign_api import ModAssignApi
+    from poodle_async_full.api.mod_bigbluebuttonbn_api import ModBigbluebuttonbnApi
+    from poodle_async_full.api.mod_book_api import ModBookApi
+    from poodle_async_full.api.mod_choice_api import ModChoiceApi
+    from poodle_async_full.api.mod_data_api import ModDataApi
+    from poodle_async_full.api.mod_feedback_api import ModFeedbackApi
+    from poodle_async_full.api.mod_folder_api import ModFolderApi
+    from poodle_async_full.api.mod_forum_api import ModForumApi
+    from poodle_async_full.api.mod_glossary_api import ModGlossaryApi
+    from poodle_async_full.api.mod_h5pactivity_api import ModH5pactivityApi
+    from poodle_async_full.api.mod_imscp_api import ModImscpApi
+    from poodle_async_full.api.mod_label_api import ModLabelApi
+    from poodle_async_full.api.mod_lesson_api import ModLessonApi
+    from poodle_async_full.api.mod_lti_api import ModLtiApi
+    from poodle_async_full.api.mod_page_api import ModPageApi
+    from poodle_async_full.api.mod_quiz_api import ModQuizApi
+    from poodle_async_full.api.mod_resource_api import ModResourceApi
+    from poodle_async_full.api.mod_scorm_api import ModScormApi
+    from poodle_async_full.api.mod_url_api import ModUrlApi
+    from poodle_async_full.api.mod_wiki_api import ModWikiApi
+    from poodle_async_full.api.mod_workshop_api import ModWorkshopApi
+    from poodle_async_full.api.paygw_paypal_api import PaygwPaypalApi
+    from poodle_async_full.api.qbank_columnsortorder_api import QbankColumnsortorderApi
+    from poodle_async_full.api.qbank_editquestion_api import QbankEditquestionApi
+    from poodle_async_full.api.qbank_managecategories_api import QbankManagecategoriesApi
+    from poodle_async_full.api.qbank_tagquestion_api import QbankTagquestionApi
+    from poodle_async_full.api.qbank_viewquestiontext_api import QbankViewquestiontextApi
+    from poodle_async_full.api.quizaccess_seb_api import QuizaccessSebApi
+    from poodle_async_full.api.report_competency_api import ReportCompetencyApi
+    from poodle_async_full.api.report_insights_api import ReportInsightsApi
+    from poodle_async_full.api.tiny_autosave_api import TinyAutosaveApi
+    from poodle_async_full.api.tiny_equation_api import TinyEquationApi
+    from poodle_async_full.api.tiny_media_api import TinyMediaApi
+    from poodle_async_full.api.tiny_premium_api import TinyPremiumApi
+    from poodle_async_full.api.tool_admin_api import ToolAdminApi
+    from poodle_async_full.api.tool_analytics_api import ToolAnalyticsApi
+    from poodle_async_full.api.tool_behat_api import ToolBehatApi
+    from poodle_async_full.api.tool_dataprivacy_api import ToolDataprivacyApi
+    from poodle_async_full.api.tool_lp_api import ToolLpApi
+    from poodle_async_full.api.tool_mobile_api import ToolMobileApi
+    from poodle_async_full.api.tool_moodlenet_api import ToolMoodlenetApi
+    from poodle_async_full.api.tool_policy_api import ToolPolicyApi
+    from poodle_async_full.api.tool_templatelibrary_api import ToolTemplatelibraryApi
+    from poodle_async_full.api.tool_usertours_api import ToolUsertoursApi
+    from poodle_async_full.api.tool_xmldb_api import ToolXmldbApi
     from poodle_async_full.api.default_api import DefaultApi
     
 else:
@@ -11,6 +121,116 @@ else:
         LazyModule(
             *as_package(__file__),
             """# import apis into api package
+from poodle_async_full.api.aiplacement_courseassist_api import AiplacementCourseassistApi
+from poodle_async_full.api.aiplacement_editor_api import AiplacementEditorApi
+from poodle_async_full.api.auth_email_api import AuthEmailApi
+from poodle_async_full.api.block_accessreview_api import BlockAccessreviewApi
+from poodle_async_full.api.block_recentlyaccesseditems_api import BlockRecentlyaccesseditemsApi
+from poodle_async_full.api.block_starredcourses_api import BlockStarredcoursesApi
+from poodle_async_full.api.core_api import CoreApi
+from poodle_async_full.api.core_admin_api import CoreAdminApi
+from poodle_async_full.api.core_ai_api import CoreAiApi
+from poodle_async_full.api.core_auth_api import CoreAuthApi
+from poodle_async_full.api.core_backup_api import CoreBackupApi
+from poodle_async_full.api.core_badges_api import CoreBadgesApi
+from poodle_async_full.api.core_block_api import CoreBlockApi
+from poodle_async_full.api.core_blog_api import CoreBlogApi
+from poodle_async_full.api.core_calendar_api import CoreCalendarApi
+from poodle_async_full.api.core_check_api import CoreCheckApi
+from poodle_async_full.api.core_cohort_api import CoreCohortApi
+from poodle_async_full.api.core_comment_api import CoreCommentApi
+from poodle_async_full.api.core_competency_api import CoreCompetencyApi
+from poodle_async_full.api.core_completion_api import CoreCompletionApi
+from poodle_async_full.api.core_contentbank_api import CoreContentbankApi
+from poodle_async_full.api.core_course_api import CoreCourseApi
+from poodle_async_full.api.core_courseformat_api import CoreCourseformatApi
+from poodle_async_full.api.core_customfield_api import CoreCustomfieldApi
+from poodle_async_full.api.core_enrol_api import CoreEnrolApi
+from poodle_async_full.api.core_files_api import CoreFilesApi
+from poodle_async_full.api.core_filters_api import CoreFiltersApi
+from poodle_async_full.api.core_form_api import CoreFormApi
+from poodle_async_full.api.core_grades_api import CoreGradesApi
+from poodle_async_full.api.core_grading_api import CoreGradingApi
+from poodle_async_full.api.core_group_api import CoreGroupApi
+from poodle_async_full.api.core_h5p_api import CoreH5pApi
+from poodle_async_full.api.core_login_api import CoreLoginApi
+from poodle_async_full.api.core_message_api import CoreMessageApi
+from poodle_async_full.api.core_moodlenet_api import CoreMoodlenetApi
+from poodle_async_full.api.core_my_api import CoreMyApi
+from poodle_async_full.api.core_notes_api import CoreNotesApi
+from poodle_async_full.api.core_output_api import CoreOutputApi
+from poodle_async_full.api.core_payment_api import CorePaymentApi
+from poodle_async_full.api.core_question_api import CoreQuestionApi
+from poodle_async_full.api.core_rating_api import CoreRatingApi
+from poodle_async_full.api.core_reportbuilder_api import CoreReportbuilderApi
+from poodle_async_full.api.core_role_api import CoreRoleApi
+from poodle_async_full.api.core_search_api import CoreSearchApi
+from poodle_async_full.api.core_sms_api import CoreSmsApi
+from poodle_async_full.api.core_table_api import CoreTableApi
+from poodle_async_full.api.core_tag_api import CoreTagApi
+from poodle_async_full.api.core_user_api import CoreUserApi
+from poodle_async_full.api.core_webservice_api import CoreWebserviceApi
+from poodle_async_full.api.core_xapi_api import CoreXapiApi
+from poodle_async_full.api.customfield_number_api import CustomfieldNumberApi
+from poodle_async_full.api.editor_tiny_api import EditorTinyApi
+from poodle_async_full.api.enrol_guest_api import EnrolGuestApi
+from poodle_async_full.api.enrol_manual_api import EnrolManualApi
+from poodle_async_full.api.enrol_meta_api import EnrolMetaApi
+from poodle_async_full.api.enrol_self_api import EnrolSelfApi
+from poodle_async_full.api.gradereport_grader_api import GradereportGraderApi
+from poodle_async_full.api.gradereport_overview_api import GradereportOverviewApi
+from poodle_async_full.api.gradereport_singleview_api import GradereportSingleviewApi
+from poodle_async_full.api.gradereport_user_api import GradereportUserApi
+from poodle_async_full.api.gradingform_guide_api import GradingformGuideApi
+from poodle_async_full.api.gradingform_rubric_api import GradingformRubricApi
+from poodle_async_full.api.media_videojs_api import MediaVideojsApi
+from poodle_async_full.api.message_airnotifier_api import MessageAirnotifierApi
+from poodle_async_full.api.message_popup_api import MessagePopupApi
+from poodle_async_full.api.mod_assign_api import ModAssignApi
+from poodle_async_full.api.mod_bigbluebuttonbn_api import ModBigbluebuttonbnApi
+from poodle_async_full.api.mod_book_api import ModBookApi
+from poodle_async_full.api.mod_choice_api import ModChoiceApi
+from poodle_async_full.api.mod_data_api import ModDataApi
+from poodle_async_full.api.mod_feedback_api import ModFeedbackApi
+from poodle_async_full.api.mod_folder_api import ModFolderApi
+from poodle_async_full.api.mod_forum_api import ModForumApi
+from poodle_async_full.api.mod_glossary_api import ModGlossaryApi
+from poodle_async_full.api.mod_h5pactivity_api import ModH5pactivityApi
+from poodle_async_full.api.mod_imscp_api import ModImscpApi
+from poodle_async_full.api.mod_label_api import ModLabelApi
+from poodle_async_full.api.mod_lesson_api import ModLessonApi
+from poodle_async_full.api.mod_lti_api import ModLtiApi
+from poodle_async_full.api.mod_page_api import ModPageApi
+from poodle_async_full.api.mod_quiz_api import ModQuizApi
+from poodle_async_full.api.mod_resource_api import ModResourceApi
+from poodle_async_full.api.mod_scorm_api import ModScormApi
+from poodle_async_full.api.mod_url_api import ModUrlApi
+from poodle_async_full.api.mod_wiki_api import ModWikiApi
+from poodle_async_full.api.mod_workshop_api import ModWorkshopApi
+from poodle_async_full.api.paygw_paypal_api import PaygwPaypalApi
+from poodle_async_full.api.qbank_columnsortorder_api import QbankColumnsortorderApi
+from poodle_async_full.api.qbank_editquestion_api import QbankEditquestionApi
+from poodle_async_full.api.qbank_managecategories_api import QbankManagecategoriesApi
+from poodle_async_full.api.qbank_tagquestion_api import QbankTagquestionApi
+from poodle_async_full.api.qbank_viewquestiontext_api import QbankViewquestiontextApi
+from poodle_async_full.api.quizaccess_seb_api import QuizaccessSebApi
+from poodle_async_full.api.report_competency_api import ReportCompetencyApi
+from poodle_async_full.api.report_insights_api import ReportInsightsApi
+from poodle_async_full.api.tiny_autosave_api import TinyAutosaveApi
+from poodle_async_full.api.tiny_equation_api import TinyEquationApi
+from poodle_async_full.api.tiny_media_api import TinyMediaApi
+from poodle_async_full.api.tiny_premium_api import TinyPremiumApi
+from poodle_async_full.api.tool_admin_api import ToolAdminApi
+from poodle_async_full.api.tool_analytics_api import ToolAnalyticsApi
+from poodle_async_full.api.tool_behat_api import ToolBehatApi
+from poodle_async_full.api.tool_dataprivacy_api import ToolDataprivacyApi
+from poodle_async_full.api.tool_lp_api import ToolLpApi
+from poodle_async_full.api.tool_mobile_api import ToolMobileApi
+from poodle_async_full.api.tool_moodlenet_api import ToolMoodlenetApi
+from poodle_async_full.api.tool_policy_api import ToolPolicyApi
+from poodle_async_full.api.tool_templatelibrary_api import ToolTemplatelibraryApi
+from poodle_async_full.api.tool_usertours_api import ToolUsertoursApi
+from poodle_async_full.api.tool_xmldb_api import ToolXmldbApi
 from poodle_async_full.api.default_api import DefaultApi
 
 """,
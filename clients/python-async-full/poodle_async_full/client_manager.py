@@ -0,0 +1,151 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from pydantic import TypeAdapter
+
+from poodle_async_full.api_client import ApiClient
+from poodle_async_full.configuration import Configuration
+from poodle_async_full import rest
+
+
+class ClientManager:
+    """Hands out an ApiClient per site and token, for applications acting
+    for many users.
+
+    The clients share one `rest.ConnectionPool`, so one session and one
+    SSL context per certificate settings, and the decoders and adapters
+    built for the response types. Their configurations are shallow copies
+    of `configuration` differing only in host and token, so a client
+    costs a few kilobytes.
+
+    The least recently used clients are dropped beyond `max_clients`, or
+    when unused for `idle_timeout` seconds. Dropped clients are still
+    usable by whoever holds them, they are just no longer handed out.
+
+    :param configuration: template of the clients' configurations,
+        defaults to `Configuration.get_default()`. Its connection pool,
+        rate limiter and response cache are shared by all clients.
+    :param max_clients: number of clients kept.
+    :param idle_timeout: seconds after which an unused client is dropped,
+        None to keep clients until `max_clients` is reached.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[Configuration]=None,
+        max_clients: int=1024,
+        idle_timeout: Optional[float]=None
+    ) -> None:
+        if configuration is None:
+            configuration = Configuration.get_default()
+        configuration = copy.deepcopy(configuration)
+        self.owns_pool = configuration.connection_pool is None
+        if configuration.connection_pool is None:
+            configuration.connection_pool = rest.ConnectionPool(
+                limit=configuration.connection_pool_maxsize,
+                limit_per_host=configuration.connection_pool_per_host,
+                keepalive_timeout=configuration.keepalive_timeout,
+                dns_cache_ttl=configuration.dns_cache_ttl,
+            )
+        self.configuration = configuration
+        self.connection_pool: rest.ConnectionPool = configuration.connection_pool
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        # client and time of last use, least recently used first
+        self._clients: OrderedDict[Tuple[str, str], Tuple[ApiClient, float]] = OrderedDict()
+        self._decoders: Dict[Any, Callable[[Any], Any]] = {}
+        self._adapters: Dict[Any, Optional[TypeAdapter[Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def client(self, token: str, host: Optional[str]=None) -> ApiClient:
+        """Returns the client for `token` on `host`, defaults to the host
+        of the template configuration.
+        """
+        if host is None:
+            host = self.configuration.host
+        key = (host, token)
+        now = time.monotonic()
+        self._evict(now)
+        entry = self._clients.pop(key, None)
+        if entry is not None:
+            self.hits += 1
+            client = entry[0]
+        else:
+            self.misses += 1
+            client = ApiClient(self._configuration(host, token))
+            client._decoders = self._decoders
+            client._adapters = self._adapters
+        self._clients[key] = (client, now)
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+            self.evictions += 1
+        return client
+
+    def _configuration(self, host: str, token: str) -> Configuration:
+        """Returns a shallow copy of the template for `host` and `token`."""
+        configuration = copy.copy(self.configuration)
+        if host != self.configuration.host:
+            configuration.host = host
+        configuration.api_key = {**self.configuration.api_key, 'wstoken': token}
+        return configuration
+
+    def _evict(self, now: float) -> None:
+        """Drops the clients unused for `idle_timeout` seconds."""
+        if self.idle_timeout is None:
+            return
+        while self._clients:
+            _, used = next(iter(self._clients.values()))
+            if now - used < self.idle_timeout:
+                break
+            self._clients.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, token: str, host: Optional[str]=None) -> None:
+        """Drops the client for `token`, e.g. once the token is revoked."""
+        if self._clients.pop((host or self.configuration.host, token), None) is not None:
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the number of clients, the hit/miss metrics of `client`,
+        the pool statistics of `rest.ConnectionPool.stats` and the rate
+        limiter metrics by host, if any.
+        """
+        rate_limiter = self.configuration.rate_limiter
+        return {
+            'clients': len(self._clients),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'pool': self.connection_pool.stats(),
+            'hosts': rate_limiter.metrics() if rate_limiter is not None else {},
+        }
+
+    async def close(self) -> None:
+        """Drops all clients, and closes the connection pool unless it
+        was passed in the configuration.
+        """
+        self._clients.clear()
+        if self.owns_pool:
+            await self.connection_pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
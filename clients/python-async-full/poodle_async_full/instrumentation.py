@@ -0,0 +1,145 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import bisect
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from poodle_async_full import rest
+
+
+class Instrumentation:
+    """Records the phases of webservice calls and passes them to
+    exporters, see `Configuration.instrumentation`.
+
+    Each call gets a `rest.CallTiming`, which is passed to every exporter
+    once the call finished. Exporters are callables, e.g. a function
+    collecting the timings, a `PrometheusExporter` or a `LogExporter`.
+
+    :param exporters: callables receiving the `rest.CallTiming` of each
+        finished call.
+    """
+
+    def __init__(self, *exporters: Callable[[rest.CallTiming], Any]) -> None:
+        self.exporters = list(exporters)
+
+    def start(self, url: str) -> Optional[rest.CallTiming]:
+        """Starts the timing of a call of `url`, None if it calls no
+        wsfunction, e.g. a file download.
+        """
+        parts = urlsplit(url)
+        wsfunction = dict(parse_qsl(parts.query)).get('wsfunction')
+        return rest.CallTiming(wsfunction, parts.netloc, self.export) if wsfunction is not None else None
+
+    def export(self, timing: rest.CallTiming) -> None:
+        for exporter in self.exporters:
+            exporter(timing)
+
+
+class PrometheusExporter:
+    """Aggregates call timings into counters and histograms by wsfunction,
+    returned in the Prometheus text format by `render`, e.g. to serve
+    them on a metrics endpoint:
+
+    - `<prefix>_calls_total`: calls by wsfunction and outcome
+    - `<prefix>_request_bytes_total`, `<prefix>_response_bytes_total`
+    - `<prefix>_phase_seconds`: histogram by wsfunction and phase, the
+      phases of `rest.CallTiming` and "total" for the whole call
+
+    :param prefix: prefix of the metric names.
+    :param buckets: upper bounds of the histogram buckets in seconds.
+    """
+
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, prefix: str='moodle_ws', buckets: Tuple[float, ...]=DEFAULT_BUCKETS) -> None:
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._calls: Dict[Tuple[str, str], int] = {}
+        self._bytes: Dict[Tuple[str, str], int] = {}
+        # counts per bucket, the last one above all bounds, then sum and count
+        self._histograms: Dict[Tuple[str, str], List[float]] = {}
+
+    def __call__(self, timing: rest.CallTiming) -> None:
+        key = (timing.wsfunction, timing.outcome or '')
+        self._calls[key] = self._calls.get(key, 0) + 1
+        for direction, size in (('request', timing.request_bytes), ('response', timing.response_bytes)):
+            if size is not None:
+                key = (timing.wsfunction, direction)
+                self._bytes[key] = self._bytes.get(key, 0) + size
+        for phase in rest.CallTiming.PHASES + ('total',):
+            seconds = timing.duration if phase == 'total' else getattr(timing, phase)
+            if seconds is None:
+                continue
+            histogram = self._histograms.get((timing.wsfunction, phase))
+            if histogram is None:
+                histogram = self._histograms[(timing.wsfunction, phase)] = [0.0] * (len(self.buckets) + 3)
+            histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+            histogram[-2] += seconds
+            histogram[-1] += 1
+
+    @staticmethod
+    def _labels(**labels: str) -> str:
+        """Returns the label set of a sample, the values escaped."""
+        return '{' + ','.join(
+            '%s="%s"' % (name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for name, value in labels.items()
+        ) + '}'
+
+    def render(self) -> str:
+        prefix = self.prefix
+        labels = self._labels
+        lines = [f'# TYPE {prefix}_calls_total counter']
+        for (wsfunction, outcome), count in sorted(self._calls.items()):
+            lines.append(f'{prefix}_calls_total{labels(wsfunction=wsfunction, outcome=outcome)} {count}')
+        for direction in ('request', 'response'):
+            lines.append(f'# TYPE {prefix}_{direction}_bytes_total counter')
+            for (wsfunction, key), size in sorted(self._bytes.items()):
+                if key == direction:
+                    lines.append(f'{prefix}_{direction}_bytes_total{labels(wsfunction=wsfunction)} {size}')
+        lines.append(f'# TYPE {prefix}_phase_seconds histogram')
+        for (wsfunction, phase), histogram in sorted(self._histograms.items()):
+            cumulative = 0
+            for bound, in_bucket in zip(self.buckets + (float('inf'),), histogram):
+                cumulative += int(in_bucket)
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_phase_seconds_bucket{labels(wsfunction=wsfunction, phase=phase, le=le)} {cumulative}')
+            lines.append(f'{prefix}_phase_seconds_sum{labels(wsfunction=wsfunction, phase=phase)} {histogram[-2]!r}')
+            lines.append(f'{prefix}_phase_seconds_count{labels(wsfunction=wsfunction, phase=phase)} {int(histogram[-1])}')
+        return '\n'.join(lines) + '\n'
+
+
+class LogExporter:
+    """Logs each call as one line of `key=value` pairs (logfmt), and
+    passes the values as the `call` attribute of the log record, for
+    structured log handlers.
+
+    :param logger: defaults to the `poodle_async_full.calls` logger.
+    :param level: level of the records.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger]=None, level: int=logging.INFO) -> None:
+        self.logger = logger if logger is not None else logging.getLogger('poodle_async_full.calls')
+        self.level = level
+
+    def __call__(self, timing: rest.CallTiming) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        fields = timing.as_dict()
+        message = ' '.join(
+            f'{name}={value:.6f}' if isinstance(value, float) else f'{name}={value}'
+            for name, value in fields.items()
+            if value is not None
+        )
+        self.logger.log(self.level, message, extra={'call': fields})
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -37,6 +38,24 @@ class AiplacementCourseassistSummariseTextResponse(BaseModel):
     timecreated: Optional[StrictInt] = Field(description="The time the request was created")
     __properties: ClassVar[List[str]] = ["error", "errorcode", "finishreason", "generatedcontent", "prompttext", "success", "timecreated"]
 
+    @field_validator('error', mode='before')
+    @classmethod
+    def error_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('errorcode', mode='before')
+    @classmethod
+    def errorcode_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('finishreason', mode='before')
+    @classmethod
+    def finishreason_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'stop' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -51,12 +70,12 @@ class AiplacementCourseassistSummariseTextResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AiplacementCourseassistSummariseTextResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -124,7 +143,7 @@ class AiplacementCourseassistSummariseTextResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "error": obj.get("error") if obj.get("error") is not None else '',
             "errorcode": obj.get("errorcode") if obj.get("errorcode") is not None else 0,
             "finishreason": obj.get("finishreason") if obj.get("finishreason") is not None else 'stop',
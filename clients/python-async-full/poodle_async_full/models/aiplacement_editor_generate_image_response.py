@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,30 @@ class AiplacementEditorGenerateImageResponse(BaseModel):
     success: Optional[StrictBool] = Field(description="Was the request successful")
     __properties: ClassVar[List[str]] = ["drafturl", "error", "errorcode", "revisedprompt", "success"]
 
+    @field_validator('drafturl', mode='before')
+    @classmethod
+    def drafturl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('error', mode='before')
+    @classmethod
+    def error_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('errorcode', mode='before')
+    @classmethod
+    def errorcode_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('revisedprompt', mode='before')
+    @classmethod
+    def revisedprompt_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +74,12 @@ class AiplacementEditorGenerateImageResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AiplacementEditorGenerateImageResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -112,7 +137,7 @@ class AiplacementEditorGenerateImageResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "drafturl": obj.get("drafturl") if obj.get("drafturl") is not None else '',
             "error": obj.get("error") if obj.get("error") is not None else '',
             "errorcode": obj.get("errorcode") if obj.get("errorcode") is not None else 0,
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.auth_email_get_signup_settings_response_profilefields_inner import AuthEmailGetSignupSettingsResponseProfilefieldsInner
 from poodle_async_full.models.auth_email_get_signup_settings_response_warnings_inner import AuthEmailGetSignupSettingsResponseWarningsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -59,12 +60,12 @@ class AuthEmailGetSignupSettingsResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AuthEmailGetSignupSettingsResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -161,7 +162,7 @@ class AuthEmailGetSignupSettingsResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "country": obj.get("country"),
             "defaultcity": obj.get("defaultcity"),
             "extendedusernamechars": obj.get("extendedusernamechars"),
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.auth_email_signup_user_parameters_customprofilefields_inner import AuthEmailSignupUserParametersCustomprofilefieldsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -42,6 +43,36 @@ class AuthEmailSignupUserParameters(BaseModel):
     username: Optional[StrictStr] = Field(description="Username")
     __properties: ClassVar[List[str]] = ["city", "country", "customprofilefields", "email", "firstname", "lastname", "password", "recaptchachallengehash", "recaptcharesponse", "redirect", "username"]
 
+    @field_validator('city', mode='before')
+    @classmethod
+    def city_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('country', mode='before')
+    @classmethod
+    def country_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('recaptchachallengehash', mode='before')
+    @classmethod
+    def recaptchachallengehash_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('recaptcharesponse', mode='before')
+    @classmethod
+    def recaptcharesponse_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('redirect', mode='before')
+    @classmethod
+    def redirect_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -56,12 +87,12 @@ class AuthEmailSignupUserParameters(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AuthEmailSignupUserParameters from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -151,7 +182,7 @@ class AuthEmailSignupUserParameters(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "city": obj.get("city") if obj.get("city") is not None else '',
             "country": obj.get("country") if obj.get("country") is not None else '',
             "customprofilefields": [AuthEmailSignupUserParametersCustomprofilefieldsInner.from_dict(_item) for _item in obj["customprofilefields"]] if obj.get("customprofilefields") is not None else None,
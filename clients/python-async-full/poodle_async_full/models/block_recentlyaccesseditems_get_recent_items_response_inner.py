@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -43,6 +44,84 @@ class BlockRecentlyaccesseditemsGetRecentItemsResponseInner(BaseModel):
     viewurl: StrictStr = Field(description="viewurl")
     __properties: ClassVar[List[str]] = ["branded", "cmid", "courseid", "coursename", "courseviewurl", "icon", "id", "modname", "name", "purpose", "timeaccess", "userid", "viewurl"]
 
+    @field_validator('branded', mode='before')
+    @classmethod
+    def branded_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('cmid', mode='before')
+    @classmethod
+    def cmid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('courseid', mode='before')
+    @classmethod
+    def courseid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('coursename', mode='before')
+    @classmethod
+    def coursename_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('courseviewurl', mode='before')
+    @classmethod
+    def courseviewurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('icon', mode='before')
+    @classmethod
+    def icon_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('modname', mode='before')
+    @classmethod
+    def modname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('purpose', mode='before')
+    @classmethod
+    def purpose_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timeaccess', mode='before')
+    @classmethod
+    def timeaccess_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('userid', mode='before')
+    @classmethod
+    def userid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('viewurl', mode='before')
+    @classmethod
+    def viewurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -57,12 +136,12 @@ class BlockRecentlyaccesseditemsGetRecentItemsResponseInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of BlockRecentlyaccesseditemsGetRecentItemsResponseInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -95,7 +174,7 @@ class BlockRecentlyaccesseditemsGetRecentItemsResponseInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "branded": obj.get("branded") if obj.get("branded") is not None else False,
             "cmid": obj.get("cmid") if obj.get("cmid") is not None else 0,
             "courseid": obj.get("courseid") if obj.get("courseid") is not None else 0,
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -52,6 +53,114 @@ class BlockStarredcoursesGetStarredCoursesResponseInner(BaseModel):
     visible: StrictBool = Field(description="visible")
     __properties: ClassVar[List[str]] = ["coursecategory", "courseimage", "enddate", "fullname", "fullnamedisplay", "hasprogress", "hidden", "id", "idnumber", "isfavourite", "pdfexportfont", "progress", "shortname", "showactivitydates", "showcompletionconditions", "showshortname", "startdate", "summary", "summaryformat", "timeaccess", "viewurl", "visible"]
 
+    @field_validator('coursecategory', mode='before')
+    @classmethod
+    def coursecategory_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('courseimage', mode='before')
+    @classmethod
+    def courseimage_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('enddate', mode='before')
+    @classmethod
+    def enddate_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('fullname', mode='before')
+    @classmethod
+    def fullname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('fullnamedisplay', mode='before')
+    @classmethod
+    def fullnamedisplay_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('hasprogress', mode='before')
+    @classmethod
+    def hasprogress_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('hidden', mode='before')
+    @classmethod
+    def hidden_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('idnumber', mode='before')
+    @classmethod
+    def idnumber_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('isfavourite', mode='before')
+    @classmethod
+    def isfavourite_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('progress', mode='before')
+    @classmethod
+    def progress_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('shortname', mode='before')
+    @classmethod
+    def shortname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('showshortname', mode='before')
+    @classmethod
+    def showshortname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('startdate', mode='before')
+    @classmethod
+    def startdate_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('summaryformat', mode='before')
+    @classmethod
+    def summaryformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeaccess', mode='before')
+    @classmethod
+    def timeaccess_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('viewurl', mode='before')
+    @classmethod
+    def viewurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('visible', mode='before')
+    @classmethod
+    def visible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -66,12 +175,12 @@ class BlockStarredcoursesGetStarredCoursesResponseInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of BlockStarredcoursesGetStarredCoursesResponseInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -129,7 +238,7 @@ class BlockStarredcoursesGetStarredCoursesResponseInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "coursecategory": obj.get("coursecategory") if obj.get("coursecategory") is not None else '',
             "courseimage": obj.get("courseimage") if obj.get("courseimage") is not None else '',
             "enddate": obj.get("enddate") if obj.get("enddate") is not None else 0,
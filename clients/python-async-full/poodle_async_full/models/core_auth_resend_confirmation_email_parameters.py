@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,12 @@ class CoreAuthResendConfirmationEmailParameters(BaseModel):
     username: Optional[StrictStr] = Field(description="Username.")
     __properties: ClassVar[List[str]] = ["password", "redirect", "username"]
 
+    @field_validator('redirect', mode='before')
+    @classmethod
+    def redirect_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +54,12 @@ class CoreAuthResendConfirmationEmailParameters(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreAuthResendConfirmationEmailParameters from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +107,7 @@ class CoreAuthResendConfirmationEmailParameters(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "password": obj.get("password"),
             "redirect": obj.get("redirect") if obj.get("redirect") is not None else '',
             "username": obj.get("username")
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_badges_get_badge_response_badge_alignment_inner import CoreBadgesGetBadgeResponseBadgeAlignmentInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -43,6 +44,72 @@ class CoreBadgesGetBadgeResponseBadge(BaseModel):
     type: StrictStr = Field(description="BadgeClass")
     __properties: ClassVar[List[str]] = ["alignment", "coursefullname", "courseid", "criteriaNarrative", "criteriaUrl", "description", "hostedUrl", "id", "image", "issuer", "name", "type"]
 
+    @field_validator('coursefullname', mode='before')
+    @classmethod
+    def coursefullname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('courseid', mode='before')
+    @classmethod
+    def courseid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('criteria_narrative', mode='before')
+    @classmethod
+    def criteria_narrative_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('criteria_url', mode='before')
+    @classmethod
+    def criteria_url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('description', mode='before')
+    @classmethod
+    def description_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('hosted_url', mode='before')
+    @classmethod
+    def hosted_url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('image', mode='before')
+    @classmethod
+    def image_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('issuer', mode='before')
+    @classmethod
+    def issuer_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('type', mode='before')
+    @classmethod
+    def type_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -57,12 +124,12 @@ class CoreBadgesGetBadgeResponseBadge(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBadgesGetBadgeResponseBadge from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -102,7 +169,7 @@ class CoreBadgesGetBadgeResponseBadge(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "alignment": [CoreBadgesGetBadgeResponseBadgeAlignmentInner.from_dict(_item) for _item in obj["alignment"]] if obj.get("alignment") is not None else None,
             "coursefullname": obj.get("coursefullname") if obj.get("coursefullname") is not None else '',
             "courseid": obj.get("courseid") if obj.get("courseid") is not None else 0,
@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_badges_get_badge_response_badge_alignment_inner import CoreBadgesGetBadgeResponseBadgeAlignmentInner
 from poodle_async_full.models.core_badges_get_user_badge_by_hash_response_badge_inner_endorsement import CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsement
 from poodle_async_full.models.core_badges_get_user_badge_by_hash_response_badge_inner_relatedbadges_inner import CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -69,6 +70,144 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInner(BaseModel):
     visible: Optional[StrictInt] = Field(default=0, description="Visible")
     __properties: ClassVar[List[str]] = ["alignment", "attachment", "badgeurl", "coursefullname", "courseid", "dateexpire", "dateissued", "description", "email", "endorsement", "expiredate", "expireperiod", "id", "imagecaption", "issuedid", "issuercontact", "issuername", "issuerurl", "language", "message", "messagesubject", "name", "nextcron", "notification", "recipientfullname", "recipientid", "relatedbadges", "status", "timecreated", "timemodified", "type", "uniquehash", "usercreated", "usermodified", "version", "visible"]
 
+    @field_validator('attachment', mode='before')
+    @classmethod
+    def attachment_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('badgeurl', mode='before')
+    @classmethod
+    def badgeurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('coursefullname', mode='before')
+    @classmethod
+    def coursefullname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('dateissued', mode='before')
+    @classmethod
+    def dateissued_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('email', mode='before')
+    @classmethod
+    def email_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('issuedid', mode='before')
+    @classmethod
+    def issuedid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('issuername', mode='before')
+    @classmethod
+    def issuername_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('issuerurl', mode='before')
+    @classmethod
+    def issuerurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('message', mode='before')
+    @classmethod
+    def message_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('messagesubject', mode='before')
+    @classmethod
+    def messagesubject_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('notification', mode='before')
+    @classmethod
+    def notification_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('recipientfullname', mode='before')
+    @classmethod
+    def recipientfullname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('recipientid', mode='before')
+    @classmethod
+    def recipientid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('status', mode='before')
+    @classmethod
+    def status_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('type', mode='before')
+    @classmethod
+    def type_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('uniquehash', mode='before')
+    @classmethod
+    def uniquehash_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('usercreated', mode='before')
+    @classmethod
+    def usercreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usermodified', mode='before')
+    @classmethod
+    def usermodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('visible', mode='before')
+    @classmethod
+    def visible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -83,12 +222,12 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBadgesGetUserBadgeByHashResponseBadgeInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -188,7 +327,7 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "alignment": [CoreBadgesGetBadgeResponseBadgeAlignmentInner.from_dict(_item) for _item in obj["alignment"]] if obj.get("alignment") is not None else None,
             "attachment": obj.get("attachment") if obj.get("attachment") is not None else 0,
             "badgeurl": obj.get("badgeurl") if obj.get("badgeurl") is not None else '',
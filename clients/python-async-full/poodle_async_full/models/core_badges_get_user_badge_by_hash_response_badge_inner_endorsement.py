@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -38,6 +39,42 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsement(BaseModel):
     issuerurl: StrictStr = Field(description="Endorsement issuer URL")
     __properties: ClassVar[List[str]] = ["badgeid", "claimcomment", "claimid", "dateissued", "id", "issueremail", "issuername", "issuerurl"]
 
+    @field_validator('badgeid', mode='before')
+    @classmethod
+    def badgeid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('dateissued', mode='before')
+    @classmethod
+    def dateissued_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('issueremail', mode='before')
+    @classmethod
+    def issueremail_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('issuername', mode='before')
+    @classmethod
+    def issuername_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('issuerurl', mode='before')
+    @classmethod
+    def issuerurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -52,12 +89,12 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsement(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsement from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +137,7 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsement(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "badgeid": obj.get("badgeid") if obj.get("badgeid") is not None else 0,
             "claimcomment": obj.get("claimcomment"),
             "claimid": obj.get("claimid"),
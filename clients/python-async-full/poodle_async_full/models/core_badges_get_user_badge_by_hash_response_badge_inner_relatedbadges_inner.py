@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,24 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInner(BaseModel
     version: Optional[StrictStr] = Field(default=None, description="Version")
     __properties: ClassVar[List[str]] = ["id", "language", "name", "type", "version"]
 
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('type', mode='before')
+    @classmethod
+    def type_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +68,12 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInner(BaseModel
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -97,7 +116,7 @@ class CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInner(BaseModel
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "id": obj.get("id") if obj.get("id") is not None else 0,
             "language": obj.get("language"),
             "name": obj.get("name") if obj.get("name") is not None else '',
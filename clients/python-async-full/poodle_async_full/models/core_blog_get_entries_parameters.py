@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_blog_get_entries_parameters_filters_inner import CoreBlogGetEntriesParametersFiltersInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -34,6 +35,18 @@ class CoreBlogGetEntriesParameters(BaseModel):
     perpage: Optional[StrictInt] = Field(default=0, description="The number of posts to return per page.")
     __properties: ClassVar[List[str]] = ["filters", "page", "perpage"]
 
+    @field_validator('page', mode='before')
+    @classmethod
+    def page_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('perpage', mode='before')
+    @classmethod
+    def perpage_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -48,12 +61,12 @@ class CoreBlogGetEntriesParameters(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBlogGetEntriesParameters from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -103,7 +116,7 @@ class CoreBlogGetEntriesParameters(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "filters": [CoreBlogGetEntriesParametersFiltersInner.from_dict(_item) for _item in obj["filters"]] if obj.get("filters") is not None else None,
             "page": obj.get("page") if obj.get("page") is not None else 0,
             "perpage": obj.get("perpage") if obj.get("perpage") is not None else 0
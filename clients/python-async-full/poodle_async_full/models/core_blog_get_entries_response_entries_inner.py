@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, Strict
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_attachmentfiles_inner import CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_tags_inner import CoreBlogGetEntriesResponseEntriesInnerTagsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -55,6 +56,96 @@ class CoreBlogGetEntriesResponseEntriesInner(BaseModel):
     usermodified: Optional[StrictInt] = Field(description="User that updated the post.")
     __properties: ClassVar[List[str]] = ["attachment", "attachmentfiles", "canedit", "content", "courseid", "coursemoduleid", "created", "format", "groupid", "id", "lastmodified", "module", "moduleid", "publishstate", "rating", "subject", "summary", "summaryfiles", "summaryformat", "tags", "uniquehash", "userid", "usermodified"]
 
+    @field_validator('canedit', mode='before')
+    @classmethod
+    def canedit_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('courseid', mode='before')
+    @classmethod
+    def courseid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('coursemoduleid', mode='before')
+    @classmethod
+    def coursemoduleid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('created', mode='before')
+    @classmethod
+    def created_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('format', mode='before')
+    @classmethod
+    def format_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('groupid', mode='before')
+    @classmethod
+    def groupid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('lastmodified', mode='before')
+    @classmethod
+    def lastmodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('module', mode='before')
+    @classmethod
+    def module_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('moduleid', mode='before')
+    @classmethod
+    def moduleid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('publishstate', mode='before')
+    @classmethod
+    def publishstate_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'draft' if value is None else value
+
+    @field_validator('rating', mode='before')
+    @classmethod
+    def rating_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('subject', mode='before')
+    @classmethod
+    def subject_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('summaryformat', mode='before')
+    @classmethod
+    def summaryformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('uniquehash', mode='before')
+    @classmethod
+    def uniquehash_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('userid', mode='before')
+    @classmethod
+    def userid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -69,12 +160,12 @@ class CoreBlogGetEntriesResponseEntriesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBlogGetEntriesResponseEntriesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -158,7 +249,7 @@ class CoreBlogGetEntriesResponseEntriesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "attachment": obj.get("attachment"),
             "attachmentfiles": [CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner.from_dict(_item) for _item in obj["attachmentfiles"]] if obj.get("attachmentfiles") is not None else None,
             "canedit": obj.get("canedit") if obj.get("canedit") is not None else False,
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -39,6 +40,48 @@ class CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner(BaseModel):
     timemodified: Optional[StrictInt] = Field(default=0, description="Time modified.")
     __properties: ClassVar[List[str]] = ["filename", "filepath", "filesize", "fileurl", "icon", "isexternalfile", "mimetype", "repositorytype", "timemodified"]
 
+    @field_validator('filename', mode='before')
+    @classmethod
+    def filename_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('filepath', mode='before')
+    @classmethod
+    def filepath_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('filesize', mode='before')
+    @classmethod
+    def filesize_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('fileurl', mode='before')
+    @classmethod
+    def fileurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('isexternalfile', mode='before')
+    @classmethod
+    def isexternalfile_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('mimetype', mode='before')
+    @classmethod
+    def mimetype_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -53,12 +96,12 @@ class CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -101,7 +144,7 @@ class CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "filename": obj.get("filename") if obj.get("filename") is not None else '',
             "filepath": obj.get("filepath") if obj.get("filepath") is not None else '',
             "filesize": obj.get("filesize") if obj.get("filesize") is not None else 0,
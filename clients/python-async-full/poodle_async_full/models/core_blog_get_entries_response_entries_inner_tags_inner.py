@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -41,6 +42,66 @@ class CoreBlogGetEntriesResponseEntriesInnerTagsInner(BaseModel):
     viewurl: Optional[StrictStr] = Field(default=None, description="The url to view the tag.")
     __properties: ClassVar[List[str]] = ["flag", "id", "isstandard", "itemid", "name", "ordering", "rawname", "tagcollid", "taginstancecontextid", "taginstanceid", "viewurl"]
 
+    @field_validator('flag', mode='before')
+    @classmethod
+    def flag_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('isstandard', mode='before')
+    @classmethod
+    def isstandard_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('itemid', mode='before')
+    @classmethod
+    def itemid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('ordering', mode='before')
+    @classmethod
+    def ordering_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('rawname', mode='before')
+    @classmethod
+    def rawname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('tagcollid', mode='before')
+    @classmethod
+    def tagcollid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('taginstancecontextid', mode='before')
+    @classmethod
+    def taginstancecontextid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('taginstanceid', mode='before')
+    @classmethod
+    def taginstanceid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -55,12 +116,12 @@ class CoreBlogGetEntriesResponseEntriesInnerTagsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreBlogGetEntriesResponseEntriesInnerTagsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -103,7 +164,7 @@ class CoreBlogGetEntriesResponseEntriesInnerTagsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "flag": obj.get("flag") if obj.get("flag") is not None else 0,
             "id": obj.get("id") if obj.get("id") is not None else 0,
             "isstandard": obj.get("isstandard") if obj.get("isstandard") is not None else False,
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -41,6 +42,66 @@ class CoreCalendarCreateCalendarEventsParametersEventsInner(BaseModel):
     visible: Optional[StrictInt] = Field(default=0, description="visible")
     __properties: ClassVar[List[str]] = ["courseid", "description", "eventtype", "format", "groupid", "name", "repeats", "sequence", "timeduration", "timestart", "visible"]
 
+    @field_validator('courseid', mode='before')
+    @classmethod
+    def courseid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('eventtype', mode='before')
+    @classmethod
+    def eventtype_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'user' if value is None else value
+
+    @field_validator('format', mode='before')
+    @classmethod
+    def format_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
+    @field_validator('groupid', mode='before')
+    @classmethod
+    def groupid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('repeats', mode='before')
+    @classmethod
+    def repeats_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('sequence', mode='before')
+    @classmethod
+    def sequence_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeduration', mode='before')
+    @classmethod
+    def timeduration_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timestart', mode='before')
+    @classmethod
+    def timestart_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('visible', mode='before')
+    @classmethod
+    def visible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -55,12 +116,12 @@ class CoreCalendarCreateCalendarEventsParametersEventsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarCreateCalendarEventsParametersEventsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -103,7 +164,7 @@ class CoreCalendarCreateCalendarEventsParametersEventsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "courseid": obj.get("courseid") if obj.get("courseid") is not None else 0,
             "description": obj.get("description"),
             "eventtype": obj.get("eventtype") if obj.get("eventtype") is not None else 'user',
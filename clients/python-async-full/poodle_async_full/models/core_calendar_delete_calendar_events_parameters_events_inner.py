@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -32,6 +33,12 @@ class CoreCalendarDeleteCalendarEventsParametersEventsInner(BaseModel):
     repeat: Optional[StrictBool] = Field(description="Delete comeplete series if repeated event")
     __properties: ClassVar[List[str]] = ["eventid", "repeat"]
 
+    @field_validator('eventid', mode='before')
+    @classmethod
+    def eventid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -46,12 +53,12 @@ class CoreCalendarDeleteCalendarEventsParametersEventsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarDeleteCalendarEventsParametersEventsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -89,7 +96,7 @@ class CoreCalendarDeleteCalendarEventsParametersEventsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "eventid": obj.get("eventid") if obj.get("eventid") is not None else 0,
             "repeat": obj.get("repeat")
         }
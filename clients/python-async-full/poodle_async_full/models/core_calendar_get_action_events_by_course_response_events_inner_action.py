@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,36 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerAction(BaseModel):
     url: StrictStr = Field(description="url")
     __properties: ClassVar[List[str]] = ["actionable", "itemcount", "name", "showitemcount", "url"]
 
+    @field_validator('actionable', mode='before')
+    @classmethod
+    def actionable_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('itemcount', mode='before')
+    @classmethod
+    def itemcount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('showitemcount', mode='before')
+    @classmethod
+    def showitemcount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('url', mode='before')
+    @classmethod
+    def url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +80,12 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerAction(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetActionEventsByCourseResponseEventsInnerAction from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -87,7 +118,7 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerAction(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "actionable": obj.get("actionable") if obj.get("actionable") is not None else False,
             "itemcount": obj.get("itemcount") if obj.get("itemcount") is not None else 0,
             "name": obj.get("name") if obj.get("name") is not None else '',
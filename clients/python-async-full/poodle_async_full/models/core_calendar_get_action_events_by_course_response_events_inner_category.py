@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -41,6 +42,66 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerCategory(BaseModel):
     visible: StrictInt = Field(description="visible")
     __properties: ClassVar[List[str]] = ["coursecount", "depth", "description", "id", "idnumber", "name", "nestedname", "parent", "timemodified", "url", "visible"]
 
+    @field_validator('coursecount', mode='before')
+    @classmethod
+    def coursecount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('depth', mode='before')
+    @classmethod
+    def depth_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('description', mode='before')
+    @classmethod
+    def description_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('nestedname', mode='before')
+    @classmethod
+    def nestedname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('parent', mode='before')
+    @classmethod
+    def parent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('url', mode='before')
+    @classmethod
+    def url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('visible', mode='before')
+    @classmethod
+    def visible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -55,12 +116,12 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerCategory(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetActionEventsByCourseResponseEventsInnerCategory from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -98,7 +159,7 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerCategory(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "coursecount": obj.get("coursecount") if obj.get("coursecount") is not None else 0,
             "depth": obj.get("depth") if obj.get("depth") is not None else 0,
             "description": obj.get("description") if obj.get("description") is not None else '',
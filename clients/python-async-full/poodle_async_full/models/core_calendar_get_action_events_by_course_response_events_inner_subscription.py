@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,24 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscription(BaseMod
     subscriptionurl: Optional[StrictStr] = Field(default='', description="subscriptionurl")
     __properties: ClassVar[List[str]] = ["displayeventsource", "subscriptionname", "subscriptionurl"]
 
+    @field_validator('displayeventsource', mode='before')
+    @classmethod
+    def displayeventsource_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('subscriptionname', mode='before')
+    @classmethod
+    def subscriptionname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('subscriptionurl', mode='before')
+    @classmethod
+    def subscriptionurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +66,12 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscription(BaseMod
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscription from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -85,7 +104,7 @@ class CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscription(BaseMod
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "displayeventsource": obj.get("displayeventsource") if obj.get("displayeventsource") is not None else False,
             "subscriptionname": obj.get("subscriptionname") if obj.get("subscriptionname") is not None else '',
             "subscriptionurl": obj.get("subscriptionurl") if obj.get("subscriptionurl") is not None else ''
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_calendar_get_action_events_by_courses_response_groupedbycourse_inner import CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -46,12 +47,12 @@ class CoreCalendarGetActionEventsByCoursesResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetActionEventsByCoursesResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -91,7 +92,7 @@ class CoreCalendarGetActionEventsByCoursesResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "groupedbycourse": [CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInner.from_dict(_item) for _item in obj["groupedbycourse"]] if obj.get("groupedbycourse") is not None else None
         }
         _obj = cls.model_construct(**data) if relaxed else cls.model_validate(data)
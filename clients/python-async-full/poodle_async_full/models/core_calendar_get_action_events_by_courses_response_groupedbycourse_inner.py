@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_calendar_get_action_events_by_course_response_events_inner import CoreCalendarGetActionEventsByCourseResponseEventsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,12 @@ class CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInner(BaseModel
     lastid: Optional[StrictInt] = Field(description="lastid")
     __properties: ClassVar[List[str]] = ["courseid", "events", "firstid", "lastid"]
 
+    @field_validator('courseid', mode='before')
+    @classmethod
+    def courseid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +56,12 @@ class CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInner(BaseModel
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -104,7 +111,7 @@ class CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInner(BaseModel
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "courseid": obj.get("courseid") if obj.get("courseid") is not None else 0,
             "events": [CoreCalendarGetActionEventsByCourseResponseEventsInner.from_dict(_item) for _item in obj["events"]] if obj.get("events") is not None else None,
             "firstid": obj.get("firstid"),
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -41,6 +42,72 @@ class CoreCalendarGetCalendarDayViewResponseDate(BaseModel):
     year: StrictInt = Field(description="year")
     __properties: ClassVar[List[str]] = ["hours", "mday", "minutes", "mon", "month", "seconds", "timestamp", "wday", "weekday", "yday", "year"]
 
+    @field_validator('hours', mode='before')
+    @classmethod
+    def hours_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('mday', mode='before')
+    @classmethod
+    def mday_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('minutes', mode='before')
+    @classmethod
+    def minutes_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('mon', mode='before')
+    @classmethod
+    def mon_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('month', mode='before')
+    @classmethod
+    def month_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('seconds', mode='before')
+    @classmethod
+    def seconds_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def timestamp_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('wday', mode='before')
+    @classmethod
+    def wday_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('weekday', mode='before')
+    @classmethod
+    def weekday_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('yday', mode='before')
+    @classmethod
+    def yday_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('year', mode='before')
+    @classmethod
+    def year_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -55,12 +122,12 @@ class CoreCalendarGetCalendarDayViewResponseDate(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetCalendarDayViewResponseDate from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -93,7 +160,7 @@ class CoreCalendarGetCalendarDayViewResponseDate(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "hours": obj.get("hours") if obj.get("hours") is not None else 0,
             "mday": obj.get("mday") if obj.get("mday") is not None else 0,
             "minutes": obj.get("minutes") if obj.get("minutes") is not None else 0,
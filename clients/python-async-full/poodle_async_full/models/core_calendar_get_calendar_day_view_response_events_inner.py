@@ -24,6 +24,7 @@ from poodle_async_full.models.core_calendar_get_action_events_by_course_response
 from poodle_async_full.models.core_calendar_get_action_events_by_course_response_events_inner_category import CoreCalendarGetActionEventsByCourseResponseEventsInnerCategory
 from poodle_async_full.models.core_calendar_get_action_events_by_course_response_events_inner_icon import CoreCalendarGetActionEventsByCourseResponseEventsInnerIcon
 from poodle_async_full.models.core_calendar_get_action_events_by_course_response_events_inner_subscription import CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscription
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -86,6 +87,204 @@ class CoreCalendarGetCalendarDayViewResponseEventsInner(BaseModel):
     visible: StrictInt = Field(description="visible")
     __properties: ClassVar[List[str]] = ["action", "activityname", "activitystr", "branded", "candelete", "canedit", "category", "categoryid", "component", "course", "deleteurl", "description", "descriptionformat", "draggable", "editurl", "eventcount", "eventtype", "formattedlocation", "formattedtime", "groupid", "groupname", "icon", "id", "instance", "isactionevent", "iscategoryevent", "iscourseevent", "islastday", "location", "maxdayerror", "maxdaytimestamp", "mindayerror", "mindaytimestamp", "modulename", "name", "normalisedeventtype", "normalisedeventtypetext", "overdue", "popupname", "purpose", "repeatid", "subscription", "timeduration", "timemodified", "timesort", "timestart", "timeusermidnight", "url", "userid", "viewurl", "visible"]
 
+    @field_validator('branded', mode='before')
+    @classmethod
+    def branded_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('candelete', mode='before')
+    @classmethod
+    def candelete_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('canedit', mode='before')
+    @classmethod
+    def canedit_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('deleteurl', mode='before')
+    @classmethod
+    def deleteurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('descriptionformat', mode='before')
+    @classmethod
+    def descriptionformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
+    @field_validator('draggable', mode='before')
+    @classmethod
+    def draggable_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('editurl', mode='before')
+    @classmethod
+    def editurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('eventtype', mode='before')
+    @classmethod
+    def eventtype_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('formattedlocation', mode='before')
+    @classmethod
+    def formattedlocation_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('formattedtime', mode='before')
+    @classmethod
+    def formattedtime_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('isactionevent', mode='before')
+    @classmethod
+    def isactionevent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('iscategoryevent', mode='before')
+    @classmethod
+    def iscategoryevent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('iscourseevent', mode='before')
+    @classmethod
+    def iscourseevent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('islastday', mode='before')
+    @classmethod
+    def islastday_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('maxdayerror', mode='before')
+    @classmethod
+    def maxdayerror_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('maxdaytimestamp', mode='before')
+    @classmethod
+    def maxdaytimestamp_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('mindayerror', mode='before')
+    @classmethod
+    def mindayerror_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('mindaytimestamp', mode='before')
+    @classmethod
+    def mindaytimestamp_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('normalisedeventtype', mode='before')
+    @classmethod
+    def normalisedeventtype_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('normalisedeventtypetext', mode='before')
+    @classmethod
+    def normalisedeventtypetext_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('overdue', mode='before')
+    @classmethod
+    def overdue_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('popupname', mode='before')
+    @classmethod
+    def popupname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('purpose', mode='before')
+    @classmethod
+    def purpose_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timeduration', mode='before')
+    @classmethod
+    def timeduration_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timesort', mode='before')
+    @classmethod
+    def timesort_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timestart', mode='before')
+    @classmethod
+    def timestart_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeusermidnight', mode='before')
+    @classmethod
+    def timeusermidnight_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('url', mode='before')
+    @classmethod
+    def url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('viewurl', mode='before')
+    @classmethod
+    def viewurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('visible', mode='before')
+    @classmethod
+    def visible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -100,12 +299,12 @@ class CoreCalendarGetCalendarDayViewResponseEventsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetCalendarDayViewResponseEventsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -228,7 +427,7 @@ class CoreCalendarGetCalendarDayViewResponseEventsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "action": CoreCalendarGetActionEventsByCourseResponseEventsInnerAction.from_dict(obj["action"]) if obj.get("action") is not None else None,
             "activityname": obj.get("activityname"),
             "activitystr": obj.get("activitystr"),
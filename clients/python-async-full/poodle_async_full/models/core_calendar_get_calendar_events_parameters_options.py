@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,36 @@ class CoreCalendarGetCalendarEventsParametersOptions(BaseModel):
     userevents: Optional[StrictBool] = Field(default=True, description="Set to true to return current user's user events")
     __properties: ClassVar[List[str]] = ["ignorehidden", "siteevents", "timeend", "timestart", "userevents"]
 
+    @field_validator('ignorehidden', mode='before')
+    @classmethod
+    def ignorehidden_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('siteevents', mode='before')
+    @classmethod
+    def siteevents_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('timeend', mode='before')
+    @classmethod
+    def timeend_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timestart', mode='before')
+    @classmethod
+    def timestart_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('userevents', mode='before')
+    @classmethod
+    def userevents_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +80,12 @@ class CoreCalendarGetCalendarEventsParametersOptions(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetCalendarEventsParametersOptions from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -112,7 +143,7 @@ class CoreCalendarGetCalendarEventsParametersOptions(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "ignorehidden": obj.get("ignorehidden") if obj.get("ignorehidden") is not None else True,
             "siteevents": obj.get("siteevents") if obj.get("siteevents") is not None else True,
             "timeend": obj.get("timeend") if obj.get("timeend") is not None else 0,
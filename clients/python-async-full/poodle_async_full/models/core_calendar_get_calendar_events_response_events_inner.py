@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -49,6 +50,12 @@ class CoreCalendarGetCalendarEventsResponseEventsInner(BaseModel):
     visible: Optional[StrictInt] = Field(description="visible")
     __properties: ClassVar[List[str]] = ["categoryid", "courseid", "description", "eventtype", "format", "groupid", "id", "instance", "modulename", "name", "repeatid", "sequence", "subscriptionid", "timeduration", "timemodified", "timestart", "userid", "uuid", "visible"]
 
+    @field_validator('uuid', mode='before')
+    @classmethod
+    def uuid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -63,12 +70,12 @@ class CoreCalendarGetCalendarEventsResponseEventsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetCalendarEventsResponseEventsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -191,7 +198,7 @@ class CoreCalendarGetCalendarEventsResponseEventsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "categoryid": obj.get("categoryid"),
             "courseid": obj.get("courseid"),
             "description": obj.get("description"),
@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_calendar_get_calendar_day_view_response_date import CoreCalendarGetCalendarDayViewResponseDate
 from poodle_async_full.models.core_calendar_get_calendar_monthly_view_response_daynames_inner import CoreCalendarGetCalendarMonthlyViewResponseDaynamesInner
 from poodle_async_full.models.core_calendar_get_calendar_monthly_view_response_weeks_inner import CoreCalendarGetCalendarMonthlyViewResponseWeeksInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -57,6 +58,120 @@ class CoreCalendarGetCalendarMonthlyViewResponse(BaseModel):
     weeks: List[CoreCalendarGetCalendarMonthlyViewResponseWeeksInner] = Field(description="weeks")
     __properties: ClassVar[List[str]] = ["calendarinstanceid", "categoryid", "courseid", "date", "daynames", "defaulteventcontext", "filter_selector", "includenavigation", "initialeventsloaded", "larrow", "nextperiod", "nextperiodlink", "nextperiodname", "periodname", "previousperiod", "previousperiodlink", "previousperiodname", "rarrow", "showviewselector", "url", "view", "viewinginblock", "viewingmonth", "weeks"]
 
+    @field_validator('calendarinstanceid', mode='before')
+    @classmethod
+    def calendarinstanceid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('categoryid', mode='before')
+    @classmethod
+    def categoryid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('courseid', mode='before')
+    @classmethod
+    def courseid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('defaulteventcontext', mode='before')
+    @classmethod
+    def defaulteventcontext_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('filter_selector', mode='before')
+    @classmethod
+    def filter_selector_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('includenavigation', mode='before')
+    @classmethod
+    def includenavigation_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('initialeventsloaded', mode='before')
+    @classmethod
+    def initialeventsloaded_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('larrow', mode='before')
+    @classmethod
+    def larrow_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('nextperiodlink', mode='before')
+    @classmethod
+    def nextperiodlink_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('nextperiodname', mode='before')
+    @classmethod
+    def nextperiodname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('periodname', mode='before')
+    @classmethod
+    def periodname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('previousperiodlink', mode='before')
+    @classmethod
+    def previousperiodlink_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('previousperiodname', mode='before')
+    @classmethod
+    def previousperiodname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('rarrow', mode='before')
+    @classmethod
+    def rarrow_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('showviewselector', mode='before')
+    @classmethod
+    def showviewselector_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('url', mode='before')
+    @classmethod
+    def url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('view', mode='before')
+    @classmethod
+    def view_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('viewinginblock', mode='before')
+    @classmethod
+    def viewinginblock_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('viewingmonth', mode='before')
+    @classmethod
+    def viewingmonth_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -71,12 +186,12 @@ class CoreCalendarGetCalendarMonthlyViewResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetCalendarMonthlyViewResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -132,7 +247,7 @@ class CoreCalendarGetCalendarMonthlyViewResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "calendarinstanceid": obj.get("calendarinstanceid") if obj.get("calendarinstanceid") is not None else 0,
             "categoryid": obj.get("categoryid") if obj.get("categoryid") is not None else 0,
             "courseid": obj.get("courseid") if obj.get("courseid") is not None else 0,
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,24 @@ class CoreCalendarGetCalendarMonthlyViewResponseDaynamesInner(BaseModel):
     shortname: StrictStr = Field(description="shortname")
     __properties: ClassVar[List[str]] = ["dayno", "fullname", "shortname"]
 
+    @field_validator('dayno', mode='before')
+    @classmethod
+    def dayno_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('fullname', mode='before')
+    @classmethod
+    def fullname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('shortname', mode='before')
+    @classmethod
+    def shortname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +66,12 @@ class CoreCalendarGetCalendarMonthlyViewResponseDaynamesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetCalendarMonthlyViewResponseDaynamesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -85,7 +104,7 @@ class CoreCalendarGetCalendarMonthlyViewResponseDaynamesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "dayno": obj.get("dayno") if obj.get("dayno") is not None else 0,
             "fullname": obj.get("fullname") if obj.get("fullname") is not None else '',
             "shortname": obj.get("shortname") if obj.get("shortname") is not None else ''
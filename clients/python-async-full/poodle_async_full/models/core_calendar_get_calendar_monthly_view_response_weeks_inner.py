@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_calendar_get_calendar_monthly_view_response_weeks_inner_days_inner import CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDaysInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,12 +49,12 @@ class CoreCalendarGetCalendarMonthlyViewResponseWeeksInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarGetCalendarMonthlyViewResponseWeeksInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -93,7 +94,7 @@ class CoreCalendarGetCalendarMonthlyViewResponseWeeksInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "days": [CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDaysInner.from_dict(_item) for _item in obj["days"]] if obj.get("days") is not None else None,
             "postpadding": obj.get("postpadding"),
             "prepadding": obj.get("prepadding")
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_calendar_get_action_events_by_course_response_events_inner import CoreCalendarGetActionEventsByCourseResponseEventsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,12 @@ class CoreCalendarSubmitCreateUpdateFormResponse(BaseModel):
     validationerror: Optional[StrictBool] = Field(default=False, description="Invalid form data")
     __properties: ClassVar[List[str]] = ["event", "validationerror"]
 
+    @field_validator('validationerror', mode='before')
+    @classmethod
+    def validationerror_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +54,12 @@ class CoreCalendarSubmitCreateUpdateFormResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCalendarSubmitCreateUpdateFormResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -93,7 +100,7 @@ class CoreCalendarSubmitCreateUpdateFormResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "event": CoreCalendarGetActionEventsByCourseResponseEventsInner.from_dict(obj["event"]) if obj.get("event") is not None else None,
             "validationerror": obj.get("validationerror") if obj.get("validationerror") is not None else False
         }
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_cohort_add_cohort_members_parameters_members_inner_cohorttype import CoreCohortAddCohortMembersParametersMembersInnerCohorttype
 from poodle_async_full.models.core_cohort_add_cohort_members_parameters_members_inner_usertype import CoreCohortAddCohortMembersParametersMembersInnerUsertype
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,12 +49,12 @@ class CoreCohortAddCohortMembersParametersMembersInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCohortAddCohortMembersParametersMembersInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -92,7 +93,7 @@ class CoreCohortAddCohortMembersParametersMembersInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "cohorttype": CoreCohortAddCohortMembersParametersMembersInnerCohorttype.from_dict(obj["cohorttype"]) if obj.get("cohorttype") is not None else None,
             "usertype": CoreCohortAddCohortMembersParametersMembersInnerUsertype.from_dict(obj["usertype"]) if obj.get("usertype") is not None else None
         }
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, Strict
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_cohort_create_cohorts_parameters_cohorts_inner_categorytype import CoreCohortCreateCohortsParametersCohortsInnerCategorytype
 from poodle_async_full.models.core_cohort_create_cohorts_parameters_cohorts_inner_customfields_inner import CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -40,6 +41,18 @@ class CoreCohortCreateCohortsParametersCohortsInner(BaseModel):
     visible: Optional[StrictBool] = Field(default=True, description="cohort visible")
     __properties: ClassVar[List[str]] = ["categorytype", "customfields", "description", "descriptionformat", "idnumber", "name", "theme", "visible"]
 
+    @field_validator('descriptionformat', mode='before')
+    @classmethod
+    def descriptionformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
+    @field_validator('visible', mode='before')
+    @classmethod
+    def visible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -54,12 +67,12 @@ class CoreCohortCreateCohortsParametersCohortsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCohortCreateCohortsParametersCohortsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -132,7 +145,7 @@ class CoreCohortCreateCohortsParametersCohortsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "categorytype": CoreCohortCreateCohortsParametersCohortsInnerCategorytype.from_dict(obj["categorytype"]) if obj.get("categorytype") is not None else None,
             "customfields": [CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInner.from_dict(_item) for _item in obj["customfields"]] if obj.get("customfields") is not None else None,
             "description": obj.get("description"),
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,24 @@ class CoreCohortSearchCohortsParametersContext(BaseModel):
     instanceid: Optional[StrictInt] = Field(default=0, description="Context instance ID. To be used with level")
     __properties: ClassVar[List[str]] = ["contextid", "contextlevel", "instanceid"]
 
+    @field_validator('contextid', mode='before')
+    @classmethod
+    def contextid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('contextlevel', mode='before')
+    @classmethod
+    def contextlevel_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('instanceid', mode='before')
+    @classmethod
+    def instanceid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +66,12 @@ class CoreCohortSearchCohortsParametersContext(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCohortSearchCohortsParametersContext from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +119,7 @@ class CoreCohortSearchCohortsParametersContext(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "contextid": obj.get("contextid") if obj.get("contextid") is not None else 0,
             "contextlevel": obj.get("contextlevel") if obj.get("contextlevel") is not None else '',
             "instanceid": obj.get("instanceid") if obj.get("instanceid") is not None else 0
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,12 @@ class CoreCommentAddCommentsParametersCommentsInner(BaseModel):
     itemid: Optional[StrictInt] = Field(description="associated id")
     __properties: ClassVar[List[str]] = ["area", "component", "content", "contextlevel", "instanceid", "itemid"]
 
+    @field_validator('area', mode='before')
+    @classmethod
+    def area_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +57,12 @@ class CoreCommentAddCommentsParametersCommentsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCommentAddCommentsParametersCommentsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -118,7 +125,7 @@ class CoreCommentAddCommentsParametersCommentsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "area": obj.get("area") if obj.get("area") is not None else '',
             "component": obj.get("component"),
             "content": obj.get("content"),
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -44,6 +45,72 @@ class CoreCompetencyCreateCompetencyFrameworkParametersCompetencyframework(BaseM
     visible: Optional[StrictBool] = Field(default=True, description="visible")
     __properties: ClassVar[List[str]] = ["contextid", "contextlevel", "description", "descriptionformat", "idnumber", "instanceid", "scaleconfiguration", "scaleid", "shortname", "taxonomies", "timecreated", "timemodified", "usermodified", "visible"]
 
+    @field_validator('description', mode='before')
+    @classmethod
+    def description_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('descriptionformat', mode='before')
+    @classmethod
+    def descriptionformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
+    @field_validator('idnumber', mode='before')
+    @classmethod
+    def idnumber_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('scaleconfiguration', mode='before')
+    @classmethod
+    def scaleconfiguration_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('scaleid', mode='before')
+    @classmethod
+    def scaleid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('shortname', mode='before')
+    @classmethod
+    def shortname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('taxonomies', mode='before')
+    @classmethod
+    def taxonomies_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usermodified', mode='before')
+    @classmethod
+    def usermodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('visible', mode='before')
+    @classmethod
+    def visible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -58,12 +125,12 @@ class CoreCompetencyCreateCompetencyFrameworkParametersCompetencyframework(BaseM
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCompetencyCreateCompetencyFrameworkParametersCompetencyframework from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -116,7 +183,7 @@ class CoreCompetencyCreateCompetencyFrameworkParametersCompetencyframework(BaseM
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "contextid": obj.get("contextid"),
             "contextlevel": obj.get("contextlevel"),
             "description": obj.get("description") if obj.get("description") is not None else '',
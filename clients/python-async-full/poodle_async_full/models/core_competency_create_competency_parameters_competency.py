@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -46,6 +47,78 @@ class CoreCompetencyCreateCompetencyParametersCompetency(BaseModel):
     usermodified: Optional[StrictInt] = Field(default=0, description="usermodified")
     __properties: ClassVar[List[str]] = ["competencyframeworkid", "description", "descriptionformat", "idnumber", "parentid", "path", "ruleconfig", "ruleoutcome", "ruletype", "scaleconfiguration", "scaleid", "shortname", "sortorder", "timecreated", "timemodified", "usermodified"]
 
+    @field_validator('competencyframeworkid', mode='before')
+    @classmethod
+    def competencyframeworkid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('description', mode='before')
+    @classmethod
+    def description_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('descriptionformat', mode='before')
+    @classmethod
+    def descriptionformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
+    @field_validator('idnumber', mode='before')
+    @classmethod
+    def idnumber_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('parentid', mode='before')
+    @classmethod
+    def parentid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('path', mode='before')
+    @classmethod
+    def path_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '/0/' if value is None else value
+
+    @field_validator('ruleoutcome', mode='before')
+    @classmethod
+    def ruleoutcome_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('shortname', mode='before')
+    @classmethod
+    def shortname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('sortorder', mode='before')
+    @classmethod
+    def sortorder_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usermodified', mode='before')
+    @classmethod
+    def usermodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -60,12 +133,12 @@ class CoreCompetencyCreateCompetencyParametersCompetency(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCompetencyCreateCompetencyParametersCompetency from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -123,7 +196,7 @@ class CoreCompetencyCreateCompetencyParametersCompetency(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "competencyframeworkid": obj.get("competencyframeworkid") if obj.get("competencyframeworkid") is not None else 0,
             "description": obj.get("description") if obj.get("description") is not None else '',
             "descriptionformat": obj.get("descriptionformat") if obj.get("descriptionformat") is not None else 1,
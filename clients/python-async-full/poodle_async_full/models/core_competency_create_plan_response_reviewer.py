@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -42,6 +43,78 @@ class CoreCompetencyCreatePlanResponseReviewer(BaseModel):
     profileurl: StrictStr = Field(description="profileurl")
     __properties: ClassVar[List[str]] = ["department", "email", "fullname", "id", "identity", "idnumber", "institution", "phone1", "phone2", "profileimageurl", "profileimageurlsmall", "profileurl"]
 
+    @field_validator('department', mode='before')
+    @classmethod
+    def department_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('email', mode='before')
+    @classmethod
+    def email_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('fullname', mode='before')
+    @classmethod
+    def fullname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('identity', mode='before')
+    @classmethod
+    def identity_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('idnumber', mode='before')
+    @classmethod
+    def idnumber_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('institution', mode='before')
+    @classmethod
+    def institution_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('phone1', mode='before')
+    @classmethod
+    def phone1_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('phone2', mode='before')
+    @classmethod
+    def phone2_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('profileimageurl', mode='before')
+    @classmethod
+    def profileimageurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('profileimageurlsmall', mode='before')
+    @classmethod
+    def profileimageurlsmall_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('profileurl', mode='before')
+    @classmethod
+    def profileurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -56,12 +129,12 @@ class CoreCompetencyCreatePlanResponseReviewer(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCompetencyCreatePlanResponseReviewer from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -94,7 +167,7 @@ class CoreCompetencyCreatePlanResponseReviewer(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "department": obj.get("department") if obj.get("department") is not None else '',
             "email": obj.get("email") if obj.get("email") is not None else '',
             "fullname": obj.get("fullname") if obj.get("fullname") is not None else '',
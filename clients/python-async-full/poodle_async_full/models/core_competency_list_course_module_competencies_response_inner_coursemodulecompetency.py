@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -39,6 +40,60 @@ class CoreCompetencyListCourseModuleCompetenciesResponseInnerCoursemodulecompete
     usermodified: StrictInt = Field(description="usermodified")
     __properties: ClassVar[List[str]] = ["cmid", "competencyid", "id", "overridegrade", "ruleoutcome", "sortorder", "timecreated", "timemodified", "usermodified"]
 
+    @field_validator('cmid', mode='before')
+    @classmethod
+    def cmid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('competencyid', mode='before')
+    @classmethod
+    def competencyid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('overridegrade', mode='before')
+    @classmethod
+    def overridegrade_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('ruleoutcome', mode='before')
+    @classmethod
+    def ruleoutcome_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('sortorder', mode='before')
+    @classmethod
+    def sortorder_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usermodified', mode='before')
+    @classmethod
+    def usermodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -53,12 +108,12 @@ class CoreCompetencyListCourseModuleCompetenciesResponseInnerCoursemodulecompete
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCompetencyListCourseModuleCompetenciesResponseInnerCoursemodulecompetency from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -91,7 +146,7 @@ class CoreCompetencyListCourseModuleCompetenciesResponseInnerCoursemodulecompete
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "cmid": obj.get("cmid") if obj.get("cmid") is not None else 0,
             "competencyid": obj.get("competencyid") if obj.get("competencyid") is not None else 0,
             "id": obj.get("id") if obj.get("id") is not None else 0,
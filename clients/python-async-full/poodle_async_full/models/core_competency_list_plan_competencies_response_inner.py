@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_competency_list_competencies_in_template_response_inner import CoreCompetencyListCompetenciesInTemplateResponseInner
 from poodle_async_full.models.core_competency_list_plan_competencies_response_inner_usercompetency import CoreCompetencyListPlanCompetenciesResponseInnerUsercompetency
 from poodle_async_full.models.core_competency_list_plan_competencies_response_inner_usercompetencyplan import CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplan
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -50,12 +51,12 @@ class CoreCompetencyListPlanCompetenciesResponseInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCompetencyListPlanCompetenciesResponseInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -97,7 +98,7 @@ class CoreCompetencyListPlanCompetenciesResponseInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "competency": CoreCompetencyListCompetenciesInTemplateResponseInner.from_dict(obj["competency"]) if obj.get("competency") is not None else None,
             "usercompetency": CoreCompetencyListPlanCompetenciesResponseInnerUsercompetency.from_dict(obj["usercompetency"]) if obj.get("usercompetency") is not None else None,
             "usercompetencyplan": CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplan.from_dict(obj["usercompetencyplan"]) if obj.get("usercompetencyplan") is not None else None
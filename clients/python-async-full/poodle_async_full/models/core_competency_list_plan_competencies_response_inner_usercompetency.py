@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_competency_create_plan_response_reviewer import CoreCompetencyCreatePlanResponseReviewer
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -55,6 +56,126 @@ class CoreCompetencyListPlanCompetenciesResponseInnerUsercompetency(BaseModel):
     usermodified: StrictInt = Field(description="usermodified")
     __properties: ClassVar[List[str]] = ["canrequestreview", "canreview", "competencyid", "grade", "gradename", "id", "iscancelreviewrequestallowed", "isrequestreviewallowed", "isstartreviewallowed", "isstatusidle", "isstatusinreview", "isstatuswaitingforreview", "isstopreviewallowed", "proficiency", "proficiencyname", "reviewer", "reviewerid", "status", "statusname", "timecreated", "timemodified", "url", "userid", "usermodified"]
 
+    @field_validator('canrequestreview', mode='before')
+    @classmethod
+    def canrequestreview_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('canreview', mode='before')
+    @classmethod
+    def canreview_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('competencyid', mode='before')
+    @classmethod
+    def competencyid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('gradename', mode='before')
+    @classmethod
+    def gradename_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('iscancelreviewrequestallowed', mode='before')
+    @classmethod
+    def iscancelreviewrequestallowed_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isrequestreviewallowed', mode='before')
+    @classmethod
+    def isrequestreviewallowed_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isstartreviewallowed', mode='before')
+    @classmethod
+    def isstartreviewallowed_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isstatusidle', mode='before')
+    @classmethod
+    def isstatusidle_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isstatusinreview', mode='before')
+    @classmethod
+    def isstatusinreview_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isstatuswaitingforreview', mode='before')
+    @classmethod
+    def isstatuswaitingforreview_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isstopreviewallowed', mode='before')
+    @classmethod
+    def isstopreviewallowed_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('proficiencyname', mode='before')
+    @classmethod
+    def proficiencyname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('status', mode='before')
+    @classmethod
+    def status_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('statusname', mode='before')
+    @classmethod
+    def statusname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('url', mode='before')
+    @classmethod
+    def url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('userid', mode='before')
+    @classmethod
+    def userid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usermodified', mode='before')
+    @classmethod
+    def usermodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -69,12 +190,12 @@ class CoreCompetencyListPlanCompetenciesResponseInnerUsercompetency(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCompetencyListPlanCompetenciesResponseInnerUsercompetency from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -125,7 +246,7 @@ class CoreCompetencyListPlanCompetenciesResponseInnerUsercompetency(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "canrequestreview": obj.get("canrequestreview") if obj.get("canrequestreview") is not None else False,
             "canreview": obj.get("canreview") if obj.get("canreview") is not None else False,
             "competencyid": obj.get("competencyid") if obj.get("competencyid") is not None else 0,
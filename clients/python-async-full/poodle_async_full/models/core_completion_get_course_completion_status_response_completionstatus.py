@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_completion_get_course_completion_status_response_completionstatus_completions_inner import CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,12 +49,12 @@ class CoreCompletionGetCourseCompletionStatusResponseCompletionstatus(BaseModel)
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCompletionGetCourseCompletionStatusResponseCompletionstatus from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -103,7 +104,7 @@ class CoreCompletionGetCourseCompletionStatusResponseCompletionstatus(BaseModel)
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "aggregation": obj.get("aggregation"),
             "completed": obj.get("completed"),
             "completions": [CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInner.from_dict(_item) for _item in obj["completions"]] if obj.get("completions") is not None else None
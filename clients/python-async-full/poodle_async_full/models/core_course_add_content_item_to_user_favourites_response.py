@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -43,6 +44,84 @@ class CoreCourseAddContentItemToUserFavouritesResponse(BaseModel):
     title: StrictStr = Field(description="The string title of the content item, human readable")
     __properties: ClassVar[List[str]] = ["archetype", "branded", "componentname", "favourite", "help", "icon", "id", "legacyitem", "link", "name", "purpose", "recommended", "title"]
 
+    @field_validator('archetype', mode='before')
+    @classmethod
+    def archetype_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('branded', mode='before')
+    @classmethod
+    def branded_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('componentname', mode='before')
+    @classmethod
+    def componentname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('favourite', mode='before')
+    @classmethod
+    def favourite_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('help', mode='before')
+    @classmethod
+    def help_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('icon', mode='before')
+    @classmethod
+    def icon_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('legacyitem', mode='before')
+    @classmethod
+    def legacyitem_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('link', mode='before')
+    @classmethod
+    def link_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('purpose', mode='before')
+    @classmethod
+    def purpose_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('recommended', mode='before')
+    @classmethod
+    def recommended_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('title', mode='before')
+    @classmethod
+    def title_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -57,12 +136,12 @@ class CoreCourseAddContentItemToUserFavouritesResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCourseAddContentItemToUserFavouritesResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -95,7 +174,7 @@ class CoreCourseAddContentItemToUserFavouritesResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "archetype": obj.get("archetype") if obj.get("archetype") is not None else '',
             "branded": obj.get("branded") if obj.get("branded") is not None else False,
             "componentname": obj.get("componentname") if obj.get("componentname") is not None else '',
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_cohort_create_cohorts_parameters_cohorts_inner_customfields_inner import CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInner
 from poodle_async_full.models.core_course_create_courses_parameters_courses_inner_courseformatoptions_inner import CoreCourseCreateCoursesParametersCoursesInnerCourseformatoptionsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -57,6 +58,60 @@ class CoreCourseCreateCoursesParametersCoursesInner(BaseModel):
     visible: Optional[StrictInt] = Field(default=None, description="1: available to student, 0:not available")
     __properties: ClassVar[List[str]] = ["categoryid", "completionnotify", "courseformatoptions", "customfields", "defaultgroupingid", "enablecompletion", "enddate", "forcetheme", "format", "fullname", "groupmode", "groupmodeforce", "hiddensections", "idnumber", "lang", "maxbytes", "newsitems", "numsections", "shortname", "showgrades", "showreports", "startdate", "summary", "summaryformat", "visible"]
 
+    @field_validator('defaultgroupingid', mode='before')
+    @classmethod
+    def defaultgroupingid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('format', mode='before')
+    @classmethod
+    def format_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'topics' if value is None else value
+
+    @field_validator('groupmode', mode='before')
+    @classmethod
+    def groupmode_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('groupmodeforce', mode='before')
+    @classmethod
+    def groupmodeforce_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('maxbytes', mode='before')
+    @classmethod
+    def maxbytes_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('newsitems', mode='before')
+    @classmethod
+    def newsitems_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 5 if value is None else value
+
+    @field_validator('showgrades', mode='before')
+    @classmethod
+    def showgrades_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
+    @field_validator('showreports', mode='before')
+    @classmethod
+    def showreports_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('summaryformat', mode='before')
+    @classmethod
+    def summaryformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -71,12 +126,12 @@ class CoreCourseCreateCoursesParametersCoursesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCourseCreateCoursesParametersCoursesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -238,7 +293,7 @@ class CoreCourseCreateCoursesParametersCoursesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "categoryid": obj.get("categoryid"),
             "completionnotify": obj.get("completionnotify"),
             "courseformatoptions": [CoreCourseCreateCoursesParametersCoursesInnerCourseformatoptionsInner.from_dict(_item) for _item in obj["courseformatoptions"]] if obj.get("courseformatoptions") is not None else None,
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_course_get_contents_response_inner_modules_inner_completiondata_details_inner import CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -41,6 +42,54 @@ class CoreCourseGetContentsResponseInnerModulesInnerCompletiondata(BaseModel):
     valueused: StrictBool = Field(description="True if module is used in a condition, false otherwise.")
     __properties: ClassVar[List[str]] = ["details", "hascompletion", "isautomatic", "isoverallcomplete", "istrackeduser", "overrideby", "state", "timecompleted", "uservisible", "valueused"]
 
+    @field_validator('hascompletion', mode='before')
+    @classmethod
+    def hascompletion_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isautomatic', mode='before')
+    @classmethod
+    def isautomatic_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('isoverallcomplete', mode='before')
+    @classmethod
+    def isoverallcomplete_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('istrackeduser', mode='before')
+    @classmethod
+    def istrackeduser_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('state', mode='before')
+    @classmethod
+    def state_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timecompleted', mode='before')
+    @classmethod
+    def timecompleted_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('uservisible', mode='before')
+    @classmethod
+    def uservisible_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('valueused', mode='before')
+    @classmethod
+    def valueused_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -55,12 +104,12 @@ class CoreCourseGetContentsResponseInnerModulesInnerCompletiondata(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCourseGetContentsResponseInnerModulesInnerCompletiondata from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -105,7 +154,7 @@ class CoreCourseGetContentsResponseInnerModulesInnerCompletiondata(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "details": [CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInner.from_dict(_item) for _item in obj["details"]] if obj.get("details") is not None else None,
             "hascompletion": obj.get("hascompletion") if obj.get("hascompletion") is not None else False,
             "isautomatic": obj.get("isautomatic") if obj.get("isautomatic") is not None else False,
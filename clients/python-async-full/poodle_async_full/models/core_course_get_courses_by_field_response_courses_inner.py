@@ -24,6 +24,7 @@ from poodle_async_full.models.core_cohort_get_cohorts_response_inner_customfield
 from poodle_async_full.models.core_course_get_courses_by_field_response_courses_inner_contacts_inner import CoreCourseGetCoursesByFieldResponseCoursesInnerContactsInner
 from poodle_async_full.models.core_course_get_courses_by_field_response_courses_inner_courseformatoptions_inner import CoreCourseGetCoursesByFieldResponseCoursesInnerCourseformatoptionsInner
 from poodle_async_full.models.core_course_get_courses_by_field_response_courses_inner_filters_inner import CoreCourseGetCoursesByFieldResponseCoursesInnerFiltersInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -93,12 +94,12 @@ class CoreCourseGetCoursesByFieldResponseCoursesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCourseGetCoursesByFieldResponseCoursesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -358,7 +359,7 @@ class CoreCourseGetCoursesByFieldResponseCoursesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "cacherev": obj.get("cacherev"),
             "calendartype": obj.get("calendartype"),
             "categoryid": obj.get("categoryid"),
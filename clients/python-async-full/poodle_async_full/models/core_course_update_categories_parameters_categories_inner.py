@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -37,6 +38,12 @@ class CoreCourseUpdateCategoriesParametersCategoriesInner(BaseModel):
     theme: Optional[StrictStr] = Field(default=None, description="the category theme. This option must be enabled on moodle")
     __properties: ClassVar[List[str]] = ["description", "descriptionformat", "id", "idnumber", "name", "parent", "theme"]
 
+    @field_validator('descriptionformat', mode='before')
+    @classmethod
+    def descriptionformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 1 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -51,12 +58,12 @@ class CoreCourseUpdateCategoriesParametersCategoriesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCourseUpdateCategoriesParametersCategoriesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -124,7 +131,7 @@ class CoreCourseUpdateCategoriesParametersCategoriesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "description": obj.get("description"),
             "descriptionformat": obj.get("descriptionformat") if obj.get("descriptionformat") is not None else 1,
             "id": obj.get("id"),
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_customfield_reload_template_response_categories_inner_fields_inner import CoreCustomfieldReloadTemplateResponseCategoriesInnerFieldsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -49,12 +50,12 @@ class CoreCustomfieldReloadTemplateResponseCategoriesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreCustomfieldReloadTemplateResponseCategoriesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -109,7 +110,7 @@ class CoreCustomfieldReloadTemplateResponseCategoriesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "addfieldmenu": obj.get("addfieldmenu"),
             "fields": [CoreCustomfieldReloadTemplateResponseCategoriesInnerFieldsInner.from_dict(_item) for _item in obj["fields"]] if obj.get("fields") is not None else None,
             "id": obj.get("id"),
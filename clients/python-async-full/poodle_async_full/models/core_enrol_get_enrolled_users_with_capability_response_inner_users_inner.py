@@ -24,6 +24,7 @@ from poodle_async_full.models.core_enrol_get_enrolled_users_response_inner_prefe
 from poodle_async_full.models.core_enrol_get_enrolled_users_response_inner_roles_inner import CoreEnrolGetEnrolledUsersResponseInnerRolesInner
 from poodle_async_full.models.core_enrol_get_enrolled_users_with_capability_response_inner_users_inner_customfields_inner import CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerCustomfieldsInner
 from poodle_async_full.models.core_enrol_get_enrolled_users_with_capability_response_inner_users_inner_groups_inner import CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerGroupsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -75,12 +76,12 @@ class CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -253,7 +254,7 @@ class CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "address": obj.get("address"),
             "city": obj.get("city"),
             "country": obj.get("country"),
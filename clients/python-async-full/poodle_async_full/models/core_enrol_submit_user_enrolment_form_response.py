@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -32,6 +33,12 @@ class CoreEnrolSubmitUserEnrolmentFormResponse(BaseModel):
     validationerror: Optional[StrictBool] = Field(default=False, description="Indicates invalid form data")
     __properties: ClassVar[List[str]] = ["result", "validationerror"]
 
+    @field_validator('validationerror', mode='before')
+    @classmethod
+    def validationerror_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -46,12 +53,12 @@ class CoreEnrolSubmitUserEnrolmentFormResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreEnrolSubmitUserEnrolmentFormResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -94,7 +101,7 @@ class CoreEnrolSubmitUserEnrolmentFormResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "result": obj.get("result"),
             "validationerror": obj.get("validationerror") if obj.get("validationerror") is not None else False
         }
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,24 @@ class CoreFormGetFiletypesBrowserDataParameters(BaseModel):
     onlytypes: Optional[StrictStr] = Field(default='', description="Limit the browser to the given groups and extensions")
     __properties: ClassVar[List[str]] = ["allowall", "current", "onlytypes"]
 
+    @field_validator('allowall', mode='before')
+    @classmethod
+    def allowall_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('current', mode='before')
+    @classmethod
+    def current_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('onlytypes', mode='before')
+    @classmethod
+    def onlytypes_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +66,12 @@ class CoreFormGetFiletypesBrowserDataParameters(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreFormGetFiletypesBrowserDataParameters from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +119,7 @@ class CoreFormGetFiletypesBrowserDataParameters(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "allowall": obj.get("allowall") if obj.get("allowall") is not None else True,
             "current": obj.get("current") if obj.get("current") is not None else '',
             "onlytypes": obj.get("onlytypes") if obj.get("onlytypes") is not None else ''
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_get_string_parameters_stringparams_inner import CoreGetStringParametersStringparamsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,12 @@ class CoreGetStringParameters(BaseModel):
     stringparams: Optional[List[CoreGetStringParametersStringparamsInner]] = Field(default=None, description="the definition of a string param (i.e. {$a->name})")
     __properties: ClassVar[List[str]] = ["component", "lang", "stringid", "stringparams"]
 
+    @field_validator('component', mode='before')
+    @classmethod
+    def component_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'moodle' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +56,12 @@ class CoreGetStringParameters(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreGetStringParameters from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -109,7 +116,7 @@ class CoreGetStringParameters(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "component": obj.get("component") if obj.get("component") is not None else 'moodle',
             "lang": obj.get("lang"),
             "stringid": obj.get("stringid"),
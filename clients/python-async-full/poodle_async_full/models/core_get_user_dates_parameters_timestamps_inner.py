@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,18 @@ class CoreGetUserDatesParametersTimestampsInner(BaseModel):
     type: Optional[StrictStr] = Field(default=None, description="The calendar type")
     __properties: ClassVar[List[str]] = ["fixday", "fixhour", "format", "timestamp", "type"]
 
+    @field_validator('fixday', mode='before')
+    @classmethod
+    def fixday_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('fixhour', mode='before')
+    @classmethod
+    def fixhour_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +62,12 @@ class CoreGetUserDatesParametersTimestampsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreGetUserDatesParametersTimestampsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -112,7 +125,7 @@ class CoreGetUserDatesParametersTimestampsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "fixday": obj.get("fixday") if obj.get("fixday") is not None else 0,
             "fixhour": obj.get("fixhour") if obj.get("fixhour") is not None else 0,
             "format": obj.get("format"),
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_grades_grader_gradingpanel_scale_fetch_response_grade_options_inner import CoreGradesGraderGradingpanelScaleFetchResponseGradeOptionsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -51,12 +52,12 @@ class CoreGradesGraderGradingpanelScaleFetchResponseGrade(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreGradesGraderGradingpanelScaleFetchResponseGrade from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -121,7 +122,7 @@ class CoreGradesGraderGradingpanelScaleFetchResponseGrade(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "gradedby": obj.get("gradedby"),
             "maxgrade": obj.get("maxgrade"),
             "options": [CoreGradesGraderGradingpanelScaleFetchResponseGradeOptionsInner.from_dict(_item) for _item in obj["options"]] if obj.get("options") is not None else None,
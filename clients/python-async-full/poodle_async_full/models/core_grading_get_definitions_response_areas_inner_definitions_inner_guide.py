@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_grading_get_definitions_response_areas_inner_definitions_inner_guide_guide_comments_inner import CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCommentsInner
 from poodle_async_full.models.core_grading_get_definitions_response_areas_inner_definitions_inner_guide_guide_criteria_inner import CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCriteriaInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,12 +49,12 @@ class CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuide(BaseModel
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuide from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +101,7 @@ class CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuide(BaseModel
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "guide_comments": [CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCommentsInner.from_dict(_item) for _item in obj["guide_comments"]] if obj.get("guide_comments") is not None else None,
             "guide_criteria": [CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCriteriaInner.from_dict(_item) for _item in obj["guide_criteria"]] if obj.get("guide_criteria") is not None else None
         }
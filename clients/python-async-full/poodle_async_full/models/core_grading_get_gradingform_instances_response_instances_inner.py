@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_grading_get_gradingform_instances_response_instances_inner_guide import CoreGradingGetGradingformInstancesResponseInstancesInnerGuide
 from poodle_async_full.models.core_grading_get_gradingform_instances_response_instances_inner_rubric import CoreGradingGetGradingformInstancesResponseInstancesInnerRubric
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -56,12 +57,12 @@ class CoreGradingGetGradingformInstancesResponseInstancesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreGradingGetGradingformInstancesResponseInstancesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -140,7 +141,7 @@ class CoreGradingGetGradingformInstancesResponseInstancesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "feedback": obj.get("feedback"),
             "feedbackformat": obj.get("feedbackformat"),
             "guide": CoreGradingGetGradingformInstancesResponseInstancesInnerGuide.from_dict(obj["guide"]) if obj.get("guide") is not None else None,
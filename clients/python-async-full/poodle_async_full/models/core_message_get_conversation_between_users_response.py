@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, Strict
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_message_get_contact_requests_response_inner import CoreMessageGetContactRequestsResponseInner
 from poodle_async_full.models.core_message_get_conversation_between_users_response_messages_inner import CoreMessageGetConversationBetweenUsersResponseMessagesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -45,6 +46,12 @@ class CoreMessageGetConversationBetweenUsersResponse(BaseModel):
     unreadcount: Optional[StrictInt] = Field(default=None, description="The number of unread messages in this conversation")
     __properties: ClassVar[List[str]] = ["candeletemessagesforallusers", "id", "imageurl", "isfavourite", "ismuted", "isread", "membercount", "members", "messages", "name", "subname", "type", "unreadcount"]
 
+    @field_validator('candeletemessagesforallusers', mode='before')
+    @classmethod
+    def candeletemessagesforallusers_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -59,12 +66,12 @@ class CoreMessageGetConversationBetweenUsersResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreMessageGetConversationBetweenUsersResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -166,7 +173,7 @@ class CoreMessageGetConversationBetweenUsersResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "candeletemessagesforallusers": obj.get("candeletemessagesforallusers") if obj.get("candeletemessagesforallusers") is not None else False,
             "id": obj.get("id"),
             "imageurl": obj.get("imageurl"),
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,24 @@ class CoreMessageGetUnsentMessageResponse(BaseModel):
     otheruserid: Optional[StrictInt] = Field(default=0, description="The other user id")
     __properties: ClassVar[List[str]] = ["conversationid", "message", "otheruserid"]
 
+    @field_validator('conversationid', mode='before')
+    @classmethod
+    def conversationid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('message', mode='before')
+    @classmethod
+    def message_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('otheruserid', mode='before')
+    @classmethod
+    def otheruserid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +66,12 @@ class CoreMessageGetUnsentMessageResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreMessageGetUnsentMessageResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +119,7 @@ class CoreMessageGetUnsentMessageResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "conversationid": obj.get("conversationid") if obj.get("conversationid") is not None else 0,
             "message": obj.get("message") if obj.get("message") is not None else '',
             "otheruserid": obj.get("otheruserid") if obj.get("otheruserid") is not None else 0
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_message_get_user_message_preferences_response_preferences_components_inner_notifications_inner import CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -47,12 +48,12 @@ class CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInner(Bas
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -97,7 +98,7 @@ class CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInner(Bas
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "displayname": obj.get("displayname"),
             "notifications": [CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInner.from_dict(_item) for _item in obj["notifications"]] if obj.get("notifications") is not None else None
         }
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -34,6 +35,12 @@ class CoreMessageSendInstantMessagesParametersMessagesInner(BaseModel):
     touserid: Optional[StrictInt] = Field(description="id of the user to send the private message")
     __properties: ClassVar[List[str]] = ["clientmsgid", "text", "textformat", "touserid"]
 
+    @field_validator('textformat', mode='before')
+    @classmethod
+    def textformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -48,12 +55,12 @@ class CoreMessageSendInstantMessagesParametersMessagesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreMessageSendInstantMessagesParametersMessagesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -106,7 +113,7 @@ class CoreMessageSendInstantMessagesParametersMessagesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "clientmsgid": obj.get("clientmsgid"),
             "text": obj.get("text"),
             "textformat": obj.get("textformat") if obj.get("textformat") is not None else 0,
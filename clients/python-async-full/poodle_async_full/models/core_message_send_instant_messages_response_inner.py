@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -38,6 +39,12 @@ class CoreMessageSendInstantMessagesResponseInner(BaseModel):
     useridfrom: Optional[StrictInt] = Field(default=None, description="The user id who sent the message")
     __properties: ClassVar[List[str]] = ["candeletemessagesforallusers", "clientmsgid", "conversationid", "errormessage", "msgid", "text", "timecreated", "useridfrom"]
 
+    @field_validator('candeletemessagesforallusers', mode='before')
+    @classmethod
+    def candeletemessagesforallusers_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -52,12 +59,12 @@ class CoreMessageSendInstantMessagesResponseInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreMessageSendInstantMessagesResponseInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -130,7 +137,7 @@ class CoreMessageSendInstantMessagesResponseInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "candeletemessagesforallusers": obj.get("candeletemessagesforallusers") if obj.get("candeletemessagesforallusers") is not None else False,
             "clientmsgid": obj.get("clientmsgid"),
             "conversationid": obj.get("conversationid"),
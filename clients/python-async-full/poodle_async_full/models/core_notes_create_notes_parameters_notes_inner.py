@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,12 @@ class CoreNotesCreateNotesParametersNotesInner(BaseModel):
     userid: Optional[StrictInt] = Field(description="id of the user the note is about")
     __properties: ClassVar[List[str]] = ["clientnoteid", "courseid", "format", "publishstate", "text", "userid"]
 
+    @field_validator('format', mode='before')
+    @classmethod
+    def format_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +57,12 @@ class CoreNotesCreateNotesParametersNotesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreNotesCreateNotesParametersNotesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -118,7 +125,7 @@ class CoreNotesCreateNotesParametersNotesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "clientnoteid": obj.get("clientnoteid"),
             "courseid": obj.get("courseid"),
             "format": obj.get("format") if obj.get("format") is not None else 0,
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_output_load_template_with_dependencies_response_strings_inner import CoreOutputLoadTemplateWithDependenciesResponseStringsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -47,12 +48,12 @@ class CoreOutputLoadTemplateWithDependenciesResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreOutputLoadTemplateWithDependenciesResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -99,7 +100,7 @@ class CoreOutputLoadTemplateWithDependenciesResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "strings": [CoreOutputLoadTemplateWithDependenciesResponseStringsInner.from_dict(_item) for _item in obj["strings"]] if obj.get("strings") is not None else None,
             "templates": [CoreOutputLoadTemplateWithDependenciesResponseStringsInner.from_dict(_item) for _item in obj["templates"]] if obj.get("templates") is not None else None
         }
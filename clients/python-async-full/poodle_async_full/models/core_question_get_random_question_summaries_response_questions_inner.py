@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_question_get_random_question_summaries_response_questions_inner_icon import CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIcon
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -37,6 +38,36 @@ class CoreQuestionGetRandomQuestionSummariesResponseQuestionsInner(BaseModel):
     qtype: StrictStr = Field(description="qtype")
     __properties: ClassVar[List[str]] = ["category", "icon", "id", "name", "parent", "qtype"]
 
+    @field_validator('category', mode='before')
+    @classmethod
+    def category_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('parent', mode='before')
+    @classmethod
+    def parent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('qtype', mode='before')
+    @classmethod
+    def qtype_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -51,12 +82,12 @@ class CoreQuestionGetRandomQuestionSummariesResponseQuestionsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreQuestionGetRandomQuestionSummariesResponseQuestionsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -92,7 +123,7 @@ class CoreQuestionGetRandomQuestionSummariesResponseQuestionsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "category": obj.get("category") if obj.get("category") is not None else 0,
             "icon": CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIcon.from_dict(obj["icon"]) if obj.get("icon") is not None else None,
             "id": obj.get("id") if obj.get("id") is not None else 0,
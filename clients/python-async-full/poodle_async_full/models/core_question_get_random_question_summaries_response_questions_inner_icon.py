@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,24 @@ class CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIcon(BaseModel
     key: StrictStr = Field(description="key")
     __properties: ClassVar[List[str]] = ["alttext", "component", "key"]
 
+    @field_validator('alttext', mode='before')
+    @classmethod
+    def alttext_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('component', mode='before')
+    @classmethod
+    def component_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('key', mode='before')
+    @classmethod
+    def key_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +66,12 @@ class CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIcon(BaseModel
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIcon from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -85,7 +104,7 @@ class CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIcon(BaseModel
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "alttext": obj.get("alttext") if obj.get("alttext") is not None else '',
             "component": obj.get("component") if obj.get("component") is not None else '',
             "key": obj.get("key") if obj.get("key") is not None else ''
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_reportbuilder_columns_add_response_sortablecolumns_inner_sorticon import CoreReportbuilderColumnsAddResponseSortablecolumnsInnerSorticon
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -40,6 +41,54 @@ class CoreReportbuilderColumnsAddResponseSortablecolumnsInner(BaseModel):
     title: StrictStr = Field(description="title")
     __properties: ClassVar[List[str]] = ["heading", "id", "movetitle", "sortdirection", "sortenabled", "sortenabledtitle", "sorticon", "sortorder", "title"]
 
+    @field_validator('heading', mode='before')
+    @classmethod
+    def heading_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('movetitle', mode='before')
+    @classmethod
+    def movetitle_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('sortdirection', mode='before')
+    @classmethod
+    def sortdirection_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('sortenabled', mode='before')
+    @classmethod
+    def sortenabled_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('sortenabledtitle', mode='before')
+    @classmethod
+    def sortenabledtitle_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('sortorder', mode='before')
+    @classmethod
+    def sortorder_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('title', mode='before')
+    @classmethod
+    def title_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -54,12 +103,12 @@ class CoreReportbuilderColumnsAddResponseSortablecolumnsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderColumnsAddResponseSortablecolumnsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -95,7 +144,7 @@ class CoreReportbuilderColumnsAddResponseSortablecolumnsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "heading": obj.get("heading") if obj.get("heading") is not None else '',
             "id": obj.get("id") if obj.get("id") is not None else 0,
             "movetitle": obj.get("movetitle") if obj.get("movetitle") is not None else '',
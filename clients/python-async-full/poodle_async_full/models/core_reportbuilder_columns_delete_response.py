@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_reportbuilder_columns_add_response_sortablecolumns_inner import CoreReportbuilderColumnsAddResponseSortablecolumnsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -34,6 +35,18 @@ class CoreReportbuilderColumnsDeleteResponse(BaseModel):
     sortablecolumns: List[CoreReportbuilderColumnsAddResponseSortablecolumnsInner] = Field(description="sortablecolumns")
     __properties: ClassVar[List[str]] = ["hassortablecolumns", "helpicon", "sortablecolumns"]
 
+    @field_validator('hassortablecolumns', mode='before')
+    @classmethod
+    def hassortablecolumns_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('helpicon', mode='before')
+    @classmethod
+    def helpicon_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -48,12 +61,12 @@ class CoreReportbuilderColumnsDeleteResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderColumnsDeleteResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -93,7 +106,7 @@ class CoreReportbuilderColumnsDeleteResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "hassortablecolumns": obj.get("hassortablecolumns") if obj.get("hassortablecolumns") is not None else False,
             "helpicon": obj.get("helpicon") if obj.get("helpicon") is not None else '',
             "sortablecolumns": [CoreReportbuilderColumnsAddResponseSortablecolumnsInner.from_dict(_item) for _item in obj["sortablecolumns"]] if obj.get("sortablecolumns") is not None else None
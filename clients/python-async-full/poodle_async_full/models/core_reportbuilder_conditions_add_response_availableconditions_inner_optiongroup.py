@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_reportbuilder_conditions_add_response_availableconditions_inner_optiongroup_values_inner import CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupValuesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,12 @@ class CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroup(
     values: List[CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupValuesInner] = Field(description="values")
     __properties: ClassVar[List[str]] = ["text", "values"]
 
+    @field_validator('text', mode='before')
+    @classmethod
+    def text_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +54,12 @@ class CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroup(
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroup from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -92,7 +99,7 @@ class CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroup(
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "text": obj.get("text") if obj.get("text") is not None else '',
             "values": [CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupValuesInner.from_dict(_item) for _item in obj["values"]] if obj.get("values") is not None else None
         }
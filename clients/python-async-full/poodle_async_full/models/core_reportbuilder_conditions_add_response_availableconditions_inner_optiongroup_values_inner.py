@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -32,6 +33,18 @@ class CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupV
     visiblename: StrictStr = Field(description="visiblename")
     __properties: ClassVar[List[str]] = ["value", "visiblename"]
 
+    @field_validator('value', mode='before')
+    @classmethod
+    def value_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('visiblename', mode='before')
+    @classmethod
+    def visiblename_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -46,12 +59,12 @@ class CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupV
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupValuesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -84,7 +97,7 @@ class CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupV
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "value": obj.get("value") if obj.get("value") is not None else '',
             "visiblename": obj.get("visiblename") if obj.get("visiblename") is not None else ''
         }
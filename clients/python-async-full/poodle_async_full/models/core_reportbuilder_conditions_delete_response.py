@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_reportbuilder_conditions_add_response_availableconditions_inner import CoreReportbuilderConditionsAddResponseAvailableconditionsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -37,6 +38,36 @@ class CoreReportbuilderConditionsDeleteResponse(BaseModel):
     javascript: Optional[StrictStr] = Field(default='', description="javascript")
     __properties: ClassVar[List[str]] = ["activeconditionsform", "availableconditions", "hasactiveconditions", "hasavailableconditions", "helpicon", "javascript"]
 
+    @field_validator('activeconditionsform', mode='before')
+    @classmethod
+    def activeconditionsform_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('hasactiveconditions', mode='before')
+    @classmethod
+    def hasactiveconditions_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('hasavailableconditions', mode='before')
+    @classmethod
+    def hasavailableconditions_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('helpicon', mode='before')
+    @classmethod
+    def helpicon_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('javascript', mode='before')
+    @classmethod
+    def javascript_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -51,12 +82,12 @@ class CoreReportbuilderConditionsDeleteResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderConditionsDeleteResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -96,7 +127,7 @@ class CoreReportbuilderConditionsDeleteResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "activeconditionsform": obj.get("activeconditionsform") if obj.get("activeconditionsform") is not None else '',
             "availableconditions": [CoreReportbuilderConditionsAddResponseAvailableconditionsInner.from_dict(_item) for _item in obj["availableconditions"]] if obj.get("availableconditions") is not None else None,
             "hasactiveconditions": obj.get("hasactiveconditions") if obj.get("hasactiveconditions") is not None else False,
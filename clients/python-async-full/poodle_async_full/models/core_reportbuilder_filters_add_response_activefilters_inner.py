@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,42 @@ class CoreReportbuilderFiltersAddResponseActivefiltersInner(BaseModel):
     sortorder: StrictInt = Field(description="sortorder")
     __properties: ClassVar[List[str]] = ["entityname", "heading", "headingeditable", "id", "movetitle", "sortorder"]
 
+    @field_validator('entityname', mode='before')
+    @classmethod
+    def entityname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('heading', mode='before')
+    @classmethod
+    def heading_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('headingeditable', mode='before')
+    @classmethod
+    def headingeditable_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('movetitle', mode='before')
+    @classmethod
+    def movetitle_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('sortorder', mode='before')
+    @classmethod
+    def sortorder_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +87,12 @@ class CoreReportbuilderFiltersAddResponseActivefiltersInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderFiltersAddResponseActivefiltersInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -88,7 +125,7 @@ class CoreReportbuilderFiltersAddResponseActivefiltersInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "entityname": obj.get("entityname") if obj.get("entityname") is not None else '',
             "heading": obj.get("heading") if obj.get("heading") is not None else '',
             "headingeditable": obj.get("headingeditable") if obj.get("headingeditable") is not None else '',
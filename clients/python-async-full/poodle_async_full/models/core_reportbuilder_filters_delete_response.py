@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_reportbuilder_conditions_add_response_availableconditions_inner import CoreReportbuilderConditionsAddResponseAvailableconditionsInner
 from poodle_async_full.models.core_reportbuilder_filters_add_response_activefilters_inner import CoreReportbuilderFiltersAddResponseActivefiltersInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -37,6 +38,24 @@ class CoreReportbuilderFiltersDeleteResponse(BaseModel):
     helpicon: StrictStr = Field(description="helpicon")
     __properties: ClassVar[List[str]] = ["activefilters", "availablefilters", "hasactivefilters", "hasavailablefilters", "helpicon"]
 
+    @field_validator('hasactivefilters', mode='before')
+    @classmethod
+    def hasactivefilters_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('hasavailablefilters', mode='before')
+    @classmethod
+    def hasavailablefilters_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('helpicon', mode='before')
+    @classmethod
+    def helpicon_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -51,12 +70,12 @@ class CoreReportbuilderFiltersDeleteResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderFiltersDeleteResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -103,7 +122,7 @@ class CoreReportbuilderFiltersDeleteResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "activefilters": [CoreReportbuilderFiltersAddResponseActivefiltersInner.from_dict(_item) for _item in obj["activefilters"]] if obj.get("activefilters") is not None else None,
             "availablefilters": [CoreReportbuilderConditionsAddResponseAvailableconditionsInner.from_dict(_item) for _item in obj["availablefilters"]] if obj.get("availablefilters") is not None else None,
             "hasactivefilters": obj.get("hasactivefilters") if obj.get("hasactivefilters") is not None else False,
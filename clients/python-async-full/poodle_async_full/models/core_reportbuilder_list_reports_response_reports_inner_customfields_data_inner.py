@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,36 @@ class CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDataInner(Base
     value: Optional[StrictStr] = Field(description="value")
     __properties: ClassVar[List[str]] = ["hasvalue", "instanceid", "name", "shortname", "type", "value"]
 
+    @field_validator('hasvalue', mode='before')
+    @classmethod
+    def hasvalue_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('instanceid', mode='before')
+    @classmethod
+    def instanceid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('shortname', mode='before')
+    @classmethod
+    def shortname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('type', mode='before')
+    @classmethod
+    def type_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +81,12 @@ class CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDataInner(Base
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDataInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -93,7 +124,7 @@ class CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDataInner(Base
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "hasvalue": obj.get("hasvalue") if obj.get("hasvalue") is not None else False,
             "instanceid": obj.get("instanceid") if obj.get("instanceid") is not None else 0,
             "name": obj.get("name") if obj.get("name") is not None else '',
@@ -26,6 +26,7 @@ from poodle_async_full.models.core_reportbuilder_reports_get_response_conditions
 from poodle_async_full.models.core_reportbuilder_reports_get_response_filters import CoreReportbuilderReportsGetResponseFilters
 from poodle_async_full.models.core_reportbuilder_reports_get_response_sidebarmenucards import CoreReportbuilderReportsGetResponseSidebarmenucards
 from poodle_async_full.models.core_reportbuilder_reports_get_response_sorting import CoreReportbuilderReportsGetResponseSorting
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -67,6 +68,126 @@ class CoreReportbuilderReportsGetResponse(BaseModel):
     usermodified: StrictInt = Field(description="usermodified")
     __properties: ClassVar[List[str]] = ["area", "attributes", "button", "cardview", "classes", "component", "conditiondata", "conditions", "contextid", "editmode", "filters", "filtersapplied", "filtersform", "filterspresent", "id", "infocontainer", "itemid", "javascript", "name", "settingsdata", "sidebarmenucards", "sorting", "source", "table", "timecreated", "timemodified", "type", "uniquerows", "usercreated", "usermodified"]
 
+    @field_validator('area', mode='before')
+    @classmethod
+    def area_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('classes', mode='before')
+    @classmethod
+    def classes_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('component', mode='before')
+    @classmethod
+    def component_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('contextid', mode='before')
+    @classmethod
+    def contextid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('editmode', mode='before')
+    @classmethod
+    def editmode_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('filtersapplied', mode='before')
+    @classmethod
+    def filtersapplied_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('filtersform', mode='before')
+    @classmethod
+    def filtersform_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('filterspresent', mode='before')
+    @classmethod
+    def filterspresent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('infocontainer', mode='before')
+    @classmethod
+    def infocontainer_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('itemid', mode='before')
+    @classmethod
+    def itemid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('javascript', mode='before')
+    @classmethod
+    def javascript_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('source', mode='before')
+    @classmethod
+    def source_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('table', mode='before')
+    @classmethod
+    def table_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('type', mode='before')
+    @classmethod
+    def type_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('uniquerows', mode='before')
+    @classmethod
+    def uniquerows_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('usercreated', mode='before')
+    @classmethod
+    def usercreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usermodified', mode='before')
+    @classmethod
+    def usermodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -81,12 +202,12 @@ class CoreReportbuilderReportsGetResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderReportsGetResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -159,7 +280,7 @@ class CoreReportbuilderReportsGetResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "area": obj.get("area") if obj.get("area") is not None else '',
             "attributes": [CoreReportbuilderReportsGetResponseAttributesInner.from_dict(_item) for _item in obj["attributes"]] if obj.get("attributes") is not None else None,
             "button": CoreReportbuilderReportsGetResponseButton.from_dict(obj["button"]) if obj.get("button") is not None else None,
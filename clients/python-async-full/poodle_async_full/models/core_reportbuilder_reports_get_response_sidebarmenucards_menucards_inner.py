@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_reportbuilder_reports_get_response_sidebarmenucards_menucards_inner_items_inner import CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -34,6 +35,18 @@ class CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInner(BaseMode
     name: StrictStr = Field(description="name")
     __properties: ClassVar[List[str]] = ["items", "key", "name"]
 
+    @field_validator('key', mode='before')
+    @classmethod
+    def key_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -48,12 +61,12 @@ class CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInner(BaseMode
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -93,7 +106,7 @@ class CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInner(BaseMode
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "items": [CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInner.from_dict(_item) for _item in obj["items"]] if obj.get("items") is not None else None,
             "key": obj.get("key") if obj.get("key") is not None else '',
             "name": obj.get("name") if obj.get("name") is not None else ''
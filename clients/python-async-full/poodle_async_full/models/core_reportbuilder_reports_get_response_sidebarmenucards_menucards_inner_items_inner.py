@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,36 @@ class CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInne
     title: StrictStr = Field(description="title")
     __properties: ClassVar[List[str]] = ["action", "disabled", "identifier", "name", "title"]
 
+    @field_validator('action', mode='before')
+    @classmethod
+    def action_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('disabled', mode='before')
+    @classmethod
+    def disabled_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('identifier', mode='before')
+    @classmethod
+    def identifier_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('title', mode='before')
+    @classmethod
+    def title_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +80,12 @@ class CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInne
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -87,7 +118,7 @@ class CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInne
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "action": obj.get("action") if obj.get("action") is not None else '',
             "disabled": obj.get("disabled") if obj.get("disabled") is not None else False,
             "identifier": obj.get("identifier") if obj.get("identifier") is not None else '',
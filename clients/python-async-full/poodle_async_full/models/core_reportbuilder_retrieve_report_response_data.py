@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_reportbuilder_retrieve_report_response_data_rows_inner import CoreReportbuilderRetrieveReportResponseDataRowsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -34,6 +35,12 @@ class CoreReportbuilderRetrieveReportResponseData(BaseModel):
     totalrowcount: StrictInt = Field(description="totalrowcount")
     __properties: ClassVar[List[str]] = ["headers", "rows", "totalrowcount"]
 
+    @field_validator('totalrowcount', mode='before')
+    @classmethod
+    def totalrowcount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -48,12 +55,12 @@ class CoreReportbuilderRetrieveReportResponseData(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreReportbuilderRetrieveReportResponseData from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -93,7 +100,7 @@ class CoreReportbuilderRetrieveReportResponseData(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "headers": obj.get("headers"),
             "rows": [CoreReportbuilderRetrieveReportResponseDataRowsInner.from_dict(_item) for _item in obj["rows"]] if obj.get("rows") is not None else None,
             "totalrowcount": obj.get("totalrowcount") if obj.get("totalrowcount") is not None else 0
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -41,6 +42,36 @@ class CoreSearchGetResultsParametersFilters(BaseModel):
     userids: Optional[List[Optional[StrictInt]]] = Field(default=None, description="restrict results to these users")
     __properties: ClassVar[List[str]] = ["areaids", "cat", "contextids", "courseids", "groupids", "mycoursesonly", "order", "timeend", "timestart", "title", "userids"]
 
+    @field_validator('cat', mode='before')
+    @classmethod
+    def cat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('mycoursesonly', mode='before')
+    @classmethod
+    def mycoursesonly_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('order', mode='before')
+    @classmethod
+    def order_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timeend', mode='before')
+    @classmethod
+    def timeend_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timestart', mode='before')
+    @classmethod
+    def timestart_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -55,12 +86,12 @@ class CoreSearchGetResultsParametersFilters(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreSearchGetResultsParametersFilters from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -123,7 +154,7 @@ class CoreSearchGetResultsParametersFilters(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "areaids": obj.get("areaids"),
             "cat": obj.get("cat") if obj.get("cat") is not None else '',
             "contextids": obj.get("contextids"),
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -38,6 +39,36 @@ class CoreTagGetTagindexParametersTagindex(BaseModel):
     tc: Optional[StrictInt] = Field(description="tag collection id")
     __properties: ClassVar[List[str]] = ["ctx", "excl", "from", "page", "rec", "ta", "tag", "tc"]
 
+    @field_validator('ctx', mode='before')
+    @classmethod
+    def ctx_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('excl', mode='before')
+    @classmethod
+    def excl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('var_from', mode='before')
+    @classmethod
+    def var_from_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('page', mode='before')
+    @classmethod
+    def page_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('rec', mode='before')
+    @classmethod
+    def rec_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -52,12 +83,12 @@ class CoreTagGetTagindexParametersTagindex(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreTagGetTagindexParametersTagindex from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -130,7 +161,7 @@ class CoreTagGetTagindexParametersTagindex(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "ctx": obj.get("ctx") if obj.get("ctx") is not None else 0,
             "excl": obj.get("excl") if obj.get("excl") is not None else False,
             "from": obj.get("from") if obj.get("from") is not None else 0,
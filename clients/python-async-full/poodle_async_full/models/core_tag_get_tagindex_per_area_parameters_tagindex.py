@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -39,6 +40,60 @@ class CoreTagGetTagindexPerAreaParametersTagindex(BaseModel):
     tc: Optional[StrictInt] = Field(default=0, description="tag collection id")
     __properties: ClassVar[List[str]] = ["ctx", "excl", "from", "id", "page", "rec", "ta", "tag", "tc"]
 
+    @field_validator('ctx', mode='before')
+    @classmethod
+    def ctx_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('excl', mode='before')
+    @classmethod
+    def excl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('var_from', mode='before')
+    @classmethod
+    def var_from_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('page', mode='before')
+    @classmethod
+    def page_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('rec', mode='before')
+    @classmethod
+    def rec_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('ta', mode='before')
+    @classmethod
+    def ta_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('tag', mode='before')
+    @classmethod
+    def tag_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('tc', mode='before')
+    @classmethod
+    def tc_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -53,12 +108,12 @@ class CoreTagGetTagindexPerAreaParametersTagindex(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreTagGetTagindexPerAreaParametersTagindex from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -136,7 +191,7 @@ class CoreTagGetTagindexPerAreaParametersTagindex(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "ctx": obj.get("ctx") if obj.get("ctx") is not None else 0,
             "excl": obj.get("excl") if obj.get("excl") is not None else False,
             "from": obj.get("from") if obj.get("from") is not None else 0,
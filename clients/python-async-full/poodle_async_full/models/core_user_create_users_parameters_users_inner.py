@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, Strict
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_user_create_users_parameters_users_inner_customfields_inner import CoreUserCreateUsersParametersUsersInnerCustomfieldsInner
 from poodle_async_full.models.core_user_create_users_parameters_users_inner_preferences_inner import CoreUserCreateUsersParametersUsersInnerPreferencesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -61,6 +62,30 @@ class CoreUserCreateUsersParametersUsersInner(BaseModel):
     username: Optional[StrictStr] = Field(description="Username policy is defined in Moodle security config.")
     __properties: ClassVar[List[str]] = ["address", "alternatename", "auth", "calendartype", "city", "country", "createpassword", "customfields", "department", "description", "email", "firstname", "firstnamephonetic", "idnumber", "institution", "interests", "lang", "lastname", "lastnamephonetic", "maildisplay", "mailformat", "middlename", "password", "phone1", "phone2", "preferences", "theme", "timezone", "username"]
 
+    @field_validator('auth', mode='before')
+    @classmethod
+    def auth_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'manual' if value is None else value
+
+    @field_validator('calendartype', mode='before')
+    @classmethod
+    def calendartype_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'gregorian' if value is None else value
+
+    @field_validator('idnumber', mode='before')
+    @classmethod
+    def idnumber_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('lang', mode='before')
+    @classmethod
+    def lang_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'en' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -75,12 +100,12 @@ class CoreUserCreateUsersParametersUsersInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of CoreUserCreateUsersParametersUsersInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -252,7 +277,7 @@ class CoreUserCreateUsersParametersUsersInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "address": obj.get("address"),
             "alternatename": obj.get("alternatename"),
             "auth": obj.get("auth") if obj.get("auth") is not None else 'manual',
@@ -30,6 +30,7 @@ from poodle_async_full.models.gradereport_user_get_grades_table_response_tables_
 from poodle_async_full.models.gradereport_user_get_grades_table_response_tables_inner_tabledata_inner_range import GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRange
 from poodle_async_full.models.gradereport_user_get_grades_table_response_tables_inner_tabledata_inner_rank import GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRank
 from poodle_async_full.models.gradereport_user_get_grades_table_response_tables_inner_tabledata_inner_weight import GradereportUserGetGradesTableResponseTablesInnerTabledataInnerWeight
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -67,12 +68,12 @@ class GradereportUserGetGradesTableResponseTablesInnerTabledataInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of GradereportUserGetGradesTableResponseTablesInnerTabledataInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -138,7 +139,7 @@ class GradereportUserGetGradesTableResponseTablesInnerTabledataInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "average": GradereportUserGetGradesTableResponseTablesInnerTabledataInnerAverage.from_dict(obj["average"]) if obj.get("average") is not None else None,
             "contributiontocoursetotal": GradereportUserGetGradesTableResponseTablesInnerTabledataInnerContributiontocoursetotal.from_dict(obj["contributiontocoursetotal"]) if obj.get("contributiontocoursetotal") is not None else None,
             "feedback": GradereportUserGetGradesTableResponseTablesInnerTabledataInnerFeedback.from_dict(obj["feedback"]) if obj.get("feedback") is not None else None,
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.gradingform_rubric_grader_gradingpanel_fetch_response_grade_criteria_inner import GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -54,12 +55,12 @@ class GradingformRubricGraderGradingpanelFetchResponseGrade(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of GradingformRubricGraderGradingpanelFetchResponseGrade from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -139,7 +140,7 @@ class GradingformRubricGraderGradingpanelFetchResponseGrade(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "canedit": obj.get("canedit"),
             "criteria": [GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInner.from_dict(_item) for _item in obj["criteria"]] if obj.get("criteria") is not None else None,
             "gradedby": obj.get("gradedby"),
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.gradingform_rubric_grader_gradingpanel_fetch_response_grade_criteria_inner_levels_inner import GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerLevelsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -49,12 +50,12 @@ class GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInner(BaseMod
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -109,7 +110,7 @@ class GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInner(BaseMod
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "description": obj.get("description"),
             "id": obj.get("id"),
             "levels": [GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerLevelsInner.from_dict(_item) for _item in obj["levels"]] if obj.get("levels") is not None else None,
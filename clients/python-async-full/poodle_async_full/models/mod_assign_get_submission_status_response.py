@@ -25,6 +25,7 @@ from poodle_async_full.models.mod_assign_get_submission_status_response_feedback
 from poodle_async_full.models.mod_assign_get_submission_status_response_gradingsummary import ModAssignGetSubmissionStatusResponseGradingsummary
 from poodle_async_full.models.mod_assign_get_submission_status_response_lastattempt import ModAssignGetSubmissionStatusResponseLastattempt
 from poodle_async_full.models.mod_assign_get_submission_status_response_previousattempts_inner import ModAssignGetSubmissionStatusResponsePreviousattemptsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -56,12 +57,12 @@ class ModAssignGetSubmissionStatusResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModAssignGetSubmissionStatusResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -120,7 +121,7 @@ class ModAssignGetSubmissionStatusResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "assignmentdata": ModAssignGetSubmissionStatusResponseAssignmentdata.from_dict(obj["assignmentdata"]) if obj.get("assignmentdata") is not None else None,
             "feedback": ModAssignGetSubmissionStatusResponseFeedback.from_dict(obj["feedback"]) if obj.get("feedback") is not None else None,
             "gradingsummary": ModAssignGetSubmissionStatusResponseGradingsummary.from_dict(obj["gradingsummary"]) if obj.get("gradingsummary") is not None else None,
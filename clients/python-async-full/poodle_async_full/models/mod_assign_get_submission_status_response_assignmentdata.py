@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_assign_get_submission_status_response_assignmentdata_attachments import ModAssignGetSubmissionStatusResponseAssignmentdataAttachments
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,12 +49,12 @@ class ModAssignGetSubmissionStatusResponseAssignmentdata(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModAssignGetSubmissionStatusResponseAssignmentdata from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -99,7 +100,7 @@ class ModAssignGetSubmissionStatusResponseAssignmentdata(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "activity": obj.get("activity"),
             "activityformat": obj.get("activityformat"),
             "attachments": ModAssignGetSubmissionStatusResponseAssignmentdataAttachments.from_dict(obj["attachments"]) if obj.get("attachments") is not None else None
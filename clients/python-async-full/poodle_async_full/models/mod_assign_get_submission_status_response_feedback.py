@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_assign_get_grades_response_assignments_inner_grades_inner import ModAssignGetGradesResponseAssignmentsInnerGradesInner
 from poodle_async_full.models.mod_assign_get_submission_status_response_feedback_plugins_inner import ModAssignGetSubmissionStatusResponseFeedbackPluginsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -50,12 +51,12 @@ class ModAssignGetSubmissionStatusResponseFeedback(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModAssignGetSubmissionStatusResponseFeedback from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -108,7 +109,7 @@ class ModAssignGetSubmissionStatusResponseFeedback(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "grade": ModAssignGetGradesResponseAssignmentsInnerGradesInner.from_dict(obj["grade"]) if obj.get("grade") is not None else None,
             "gradeddate": obj.get("gradeddate"),
             "gradefordisplay": obj.get("gradefordisplay"),
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_assign_get_submission_status_response_feedback_plugins_inner_editorfields_inner import ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerEditorfieldsInner
 from poodle_async_full.models.mod_assign_get_submission_status_response_feedback_plugins_inner_fileareas_inner import ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerFileareasInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -50,12 +51,12 @@ class ModAssignGetSubmissionStatusResponseFeedbackPluginsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModAssignGetSubmissionStatusResponseFeedbackPluginsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -112,7 +113,7 @@ class ModAssignGetSubmissionStatusResponseFeedbackPluginsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "editorfields": [ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerEditorfieldsInner.from_dict(_item) for _item in obj["editorfields"]] if obj.get("editorfields") is not None else None,
             "fileareas": [ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerFileareasInner.from_dict(_item) for _item in obj["fileareas"]] if obj.get("fileareas") is not None else None,
             "name": obj.get("name"),
@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_assign_get_grades_response_assignments_inner_grades_inner import ModAssignGetGradesResponseAssignmentsInnerGradesInner
 from poodle_async_full.models.mod_assign_get_submission_status_response_feedback_plugins_inner import ModAssignGetSubmissionStatusResponseFeedbackPluginsInner
 from poodle_async_full.models.mod_assign_get_submission_status_response_lastattempt_submission import ModAssignGetSubmissionStatusResponseLastattemptSubmission
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -51,12 +52,12 @@ class ModAssignGetSubmissionStatusResponsePreviousattemptsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModAssignGetSubmissionStatusResponsePreviousattemptsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -107,7 +108,7 @@ class ModAssignGetSubmissionStatusResponsePreviousattemptsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "attemptnumber": obj.get("attemptnumber"),
             "feedbackplugins": [ModAssignGetSubmissionStatusResponseFeedbackPluginsInner.from_dict(_item) for _item in obj["feedbackplugins"]] if obj.get("feedbackplugins") is not None else None,
             "grade": ModAssignGetGradesResponseAssignmentsInnerGradesInner.from_dict(obj["grade"]) if obj.get("grade") is not None else None,
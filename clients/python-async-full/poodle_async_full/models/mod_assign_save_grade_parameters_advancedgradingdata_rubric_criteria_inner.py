@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_assign_save_grade_parameters_advancedgradingdata_rubric_criteria_inner_fillings_inner import ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerFillingsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -47,12 +48,12 @@ class ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInner(BaseMod
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -97,7 +98,7 @@ class ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInner(BaseMod
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "criterionid": obj.get("criterionid"),
             "fillings": [ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerFillingsInner.from_dict(_item) for _item in obj["fillings"]] if obj.get("fillings") is not None else None
         }
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_bigbluebuttonbn_get_recordings_response_tabledata_columns_inner import ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -51,12 +52,12 @@ class ModBigbluebuttonbnGetRecordingsResponseTabledata(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModBigbluebuttonbnGetRecordingsResponseTabledata from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -116,7 +117,7 @@ class ModBigbluebuttonbnGetRecordingsResponseTabledata(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "activity": obj.get("activity"),
             "columns": [ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInner.from_dict(_item) for _item in obj["columns"]] if obj.get("columns") is not None else None,
             "data": obj.get("data"),
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -37,6 +38,18 @@ class ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInner(BaseModel):
     width: Optional[StrictStr]
     __properties: ClassVar[List[str]] = ["allowHTML", "formatter", "key", "label", "sortable", "type", "width"]
 
+    @field_validator('allow_html', mode='before')
+    @classmethod
+    def allow_html_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('sortable', mode='before')
+    @classmethod
+    def sortable_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -51,12 +64,12 @@ class ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -124,7 +137,7 @@ class ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "allowHTML": obj.get("allowHTML") if obj.get("allowHTML") is not None else False,
             "formatter": obj.get("formatter"),
             "key": obj.get("key"),
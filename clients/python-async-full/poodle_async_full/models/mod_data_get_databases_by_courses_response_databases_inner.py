@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_attachmentfiles_inner import CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -69,6 +70,162 @@ class ModDataGetDatabasesByCoursesResponseDatabasesInner(BaseModel):
     timeviewto: StrictInt = Field(description="timeviewto field")
     __properties: ClassVar[List[str]] = ["addtemplate", "approval", "asearchtemplate", "assessed", "assesstimefinish", "assesstimestart", "comments", "course", "coursemodule", "csstemplate", "defaultsort", "defaultsortdir", "editany", "id", "intro", "introfiles", "introformat", "jstemplate", "lang", "listtemplate", "listtemplatefooter", "listtemplateheader", "manageapproved", "maxentries", "name", "notification", "requiredentries", "requiredentriestoview", "rssarticles", "rsstemplate", "rsstitletemplate", "scale", "singletemplate", "timeavailablefrom", "timeavailableto", "timemodified", "timeviewfrom", "timeviewto"]
 
+    @field_validator('approval', mode='before')
+    @classmethod
+    def approval_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('assessed', mode='before')
+    @classmethod
+    def assessed_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('assesstimefinish', mode='before')
+    @classmethod
+    def assesstimefinish_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('assesstimestart', mode='before')
+    @classmethod
+    def assesstimestart_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('comments', mode='before')
+    @classmethod
+    def comments_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('course', mode='before')
+    @classmethod
+    def course_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('coursemodule', mode='before')
+    @classmethod
+    def coursemodule_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('defaultsort', mode='before')
+    @classmethod
+    def defaultsort_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('defaultsortdir', mode='before')
+    @classmethod
+    def defaultsortdir_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('editany', mode='before')
+    @classmethod
+    def editany_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('intro', mode='before')
+    @classmethod
+    def intro_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('introformat', mode='before')
+    @classmethod
+    def introformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('manageapproved', mode='before')
+    @classmethod
+    def manageapproved_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('maxentries', mode='before')
+    @classmethod
+    def maxentries_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('notification', mode='before')
+    @classmethod
+    def notification_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('requiredentries', mode='before')
+    @classmethod
+    def requiredentries_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('requiredentriestoview', mode='before')
+    @classmethod
+    def requiredentriestoview_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('rssarticles', mode='before')
+    @classmethod
+    def rssarticles_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('scale', mode='before')
+    @classmethod
+    def scale_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeavailablefrom', mode='before')
+    @classmethod
+    def timeavailablefrom_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeavailableto', mode='before')
+    @classmethod
+    def timeavailableto_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeviewfrom', mode='before')
+    @classmethod
+    def timeviewfrom_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeviewto', mode='before')
+    @classmethod
+    def timeviewto_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -83,12 +240,12 @@ class ModDataGetDatabasesByCoursesResponseDatabasesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModDataGetDatabasesByCoursesResponseDatabasesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -188,7 +345,7 @@ class ModDataGetDatabasesByCoursesResponseDatabasesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "addtemplate": obj.get("addtemplate"),
             "approval": obj.get("approval") if obj.get("approval") is not None else False,
             "asearchtemplate": obj.get("asearchtemplate"),
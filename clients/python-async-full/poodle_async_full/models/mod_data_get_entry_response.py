@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.auth_email_get_signup_settings_response_warnings_inner import AuthEmailGetSignupSettingsResponseWarningsInner
 from poodle_async_full.models.mod_data_get_entries_response_entries_inner import ModDataGetEntriesResponseEntriesInner
 from poodle_async_full.models.mod_data_get_entry_response_ratinginfo import ModDataGetEntryResponseRatinginfo
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -51,12 +52,12 @@ class ModDataGetEntryResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModDataGetEntryResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -107,7 +108,7 @@ class ModDataGetEntryResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "entry": ModDataGetEntriesResponseEntriesInner.from_dict(obj["entry"]) if obj.get("entry") is not None else None,
             "entryviewcontents": obj.get("entryviewcontents"),
             "ratinginfo": ModDataGetEntryResponseRatinginfo.from_dict(obj["ratinginfo"]) if obj.get("ratinginfo") is not None else None,
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -38,6 +39,54 @@ class ModFeedbackGetCurrentCompletedTmpResponseFeedback(BaseModel):
     userid: StrictInt = Field(description="The user who completed the feedback (0 for anonymous).")
     __properties: ClassVar[List[str]] = ["anonymous_response", "courseid", "feedback", "guestid", "id", "random_response", "timemodified", "userid"]
 
+    @field_validator('anonymous_response', mode='before')
+    @classmethod
+    def anonymous_response_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('courseid', mode='before')
+    @classmethod
+    def courseid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('feedback', mode='before')
+    @classmethod
+    def feedback_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('guestid', mode='before')
+    @classmethod
+    def guestid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('random_response', mode='before')
+    @classmethod
+    def random_response_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('userid', mode='before')
+    @classmethod
+    def userid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -52,12 +101,12 @@ class ModFeedbackGetCurrentCompletedTmpResponseFeedback(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModFeedbackGetCurrentCompletedTmpResponseFeedback from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -90,7 +139,7 @@ class ModFeedbackGetCurrentCompletedTmpResponseFeedback(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "anonymous_response": obj.get("anonymous_response") if obj.get("anonymous_response") is not None else 0,
             "courseid": obj.get("courseid") if obj.get("courseid") is not None else 0,
             "feedback": obj.get("feedback") if obj.get("feedback") is not None else 0,
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_attachmentfiles_inner import CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -52,6 +53,114 @@ class ModFeedbackGetFeedbacksByCoursesResponseFeedbacksInner(BaseModel):
     timeopen: Optional[StrictInt] = Field(default=0, description="Allow answers from this time.")
     __properties: ClassVar[List[str]] = ["anonymous", "autonumbering", "completionsubmit", "course", "coursemodule", "email_notification", "id", "intro", "introfiles", "introformat", "lang", "multiple_submit", "name", "page_after_submit", "page_after_submitformat", "pageaftersubmitfiles", "publish_stats", "site_after_submit", "timeclose", "timemodified", "timeopen"]
 
+    @field_validator('anonymous', mode='before')
+    @classmethod
+    def anonymous_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('autonumbering', mode='before')
+    @classmethod
+    def autonumbering_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('completionsubmit', mode='before')
+    @classmethod
+    def completionsubmit_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('course', mode='before')
+    @classmethod
+    def course_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('coursemodule', mode='before')
+    @classmethod
+    def coursemodule_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('email_notification', mode='before')
+    @classmethod
+    def email_notification_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('intro', mode='before')
+    @classmethod
+    def intro_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('introformat', mode='before')
+    @classmethod
+    def introformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('multiple_submit', mode='before')
+    @classmethod
+    def multiple_submit_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('page_after_submit', mode='before')
+    @classmethod
+    def page_after_submit_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('page_after_submitformat', mode='before')
+    @classmethod
+    def page_after_submitformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('publish_stats', mode='before')
+    @classmethod
+    def publish_stats_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('site_after_submit', mode='before')
+    @classmethod
+    def site_after_submit_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timeclose', mode='before')
+    @classmethod
+    def timeclose_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timeopen', mode='before')
+    @classmethod
+    def timeopen_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -66,12 +175,12 @@ class ModFeedbackGetFeedbacksByCoursesResponseFeedbacksInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModFeedbackGetFeedbacksByCoursesResponseFeedbacksInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -133,7 +242,7 @@ class ModFeedbackGetFeedbacksByCoursesResponseFeedbacksInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "anonymous": obj.get("anonymous") if obj.get("anonymous") is not None else 0,
             "autonumbering": obj.get("autonumbering") if obj.get("autonumbering") is not None else True,
             "completionsubmit": obj.get("completionsubmit") if obj.get("completionsubmit") is not None else False,
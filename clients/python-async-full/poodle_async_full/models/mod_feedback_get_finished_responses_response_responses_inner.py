@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,42 @@ class ModFeedbackGetFinishedResponsesResponseResponsesInner(BaseModel):
     value: StrictStr = Field(description="The response value.")
     __properties: ClassVar[List[str]] = ["completed", "course_id", "id", "item", "tmp_completed", "value"]
 
+    @field_validator('completed', mode='before')
+    @classmethod
+    def completed_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('course_id', mode='before')
+    @classmethod
+    def course_id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('item', mode='before')
+    @classmethod
+    def item_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('tmp_completed', mode='before')
+    @classmethod
+    def tmp_completed_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('value', mode='before')
+    @classmethod
+    def value_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +87,12 @@ class ModFeedbackGetFinishedResponsesResponseResponsesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModFeedbackGetFinishedResponsesResponseResponsesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -88,7 +125,7 @@ class ModFeedbackGetFinishedResponsesResponseResponsesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "completed": obj.get("completed") if obj.get("completed") is not None else 0,
             "course_id": obj.get("course_id") if obj.get("course_id") is not None else 0,
             "id": obj.get("id") if obj.get("id") is not None else 0,
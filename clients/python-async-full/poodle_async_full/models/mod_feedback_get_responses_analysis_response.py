@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.auth_email_get_signup_settings_response_warnings_inner import AuthEmailGetSignupSettingsResponseWarningsInner
 from poodle_async_full.models.mod_feedback_get_responses_analysis_response_anonattempts_inner import ModFeedbackGetResponsesAnalysisResponseAnonattemptsInner
 from poodle_async_full.models.mod_feedback_get_responses_analysis_response_attempts_inner import ModFeedbackGetResponsesAnalysisResponseAttemptsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -52,12 +53,12 @@ class ModFeedbackGetResponsesAnalysisResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModFeedbackGetResponsesAnalysisResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -121,7 +122,7 @@ class ModFeedbackGetResponsesAnalysisResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "anonattempts": [ModFeedbackGetResponsesAnalysisResponseAnonattemptsInner.from_dict(_item) for _item in obj["anonattempts"]] if obj.get("anonattempts") is not None else None,
             "attempts": [ModFeedbackGetResponsesAnalysisResponseAttemptsInner.from_dict(_item) for _item in obj["attempts"]] if obj.get("attempts") is not None else None,
             "totalanonattempts": obj.get("totalanonattempts"),
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.mod_forum_add_discussion_post_response_post_author_groups_inner_urls import ModForumAddDiscussionPostResponsePostAuthorGroupsInnerUrls
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -34,6 +35,18 @@ class ModForumAddDiscussionPostResponsePostAuthorGroupsInner(BaseModel):
     urls: ModForumAddDiscussionPostResponsePostAuthorGroupsInnerUrls
     __properties: ClassVar[List[str]] = ["id", "name", "urls"]
 
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -48,12 +61,12 @@ class ModForumAddDiscussionPostResponsePostAuthorGroupsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModForumAddDiscussionPostResponsePostAuthorGroupsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -89,7 +102,7 @@ class ModForumAddDiscussionPostResponsePostAuthorGroupsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "id": obj.get("id") if obj.get("id") is not None else 0,
             "name": obj.get("name") if obj.get("name") is not None else '',
             "urls": ModForumAddDiscussionPostResponsePostAuthorGroupsInnerUrls.from_dict(obj["urls"]) if obj.get("urls") is not None else None
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.mod_forum_add_discussion_post_response_post_tags_inner_urls import ModForumAddDiscussionPostResponsePostTagsInnerUrls
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -37,6 +38,36 @@ class ModForumAddDiscussionPostResponsePostTagsInner(BaseModel):
     urls: ModForumAddDiscussionPostResponsePostTagsInnerUrls
     __properties: ClassVar[List[str]] = ["displayname", "flag", "id", "isstandard", "tagid", "urls"]
 
+    @field_validator('displayname', mode='before')
+    @classmethod
+    def displayname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('flag', mode='before')
+    @classmethod
+    def flag_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('isstandard', mode='before')
+    @classmethod
+    def isstandard_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('tagid', mode='before')
+    @classmethod
+    def tagid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -51,12 +82,12 @@ class ModForumAddDiscussionPostResponsePostTagsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModForumAddDiscussionPostResponsePostTagsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -92,7 +123,7 @@ class ModForumAddDiscussionPostResponsePostTagsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "displayname": obj.get("displayname") if obj.get("displayname") is not None else '',
             "flag": obj.get("flag") if obj.get("flag") is not None else False,
             "id": obj.get("id") if obj.get("id") is not None else 0,
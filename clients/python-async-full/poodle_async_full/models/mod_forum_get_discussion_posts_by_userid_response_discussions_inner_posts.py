@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.mod_forum_add_discussion_post_response_post import ModForumAddDiscussionPostResponsePost
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -47,12 +48,12 @@ class ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerPosts(BaseModel)
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerPosts from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -99,7 +100,7 @@ class ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerPosts(BaseModel)
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "parentposts": [ModForumAddDiscussionPostResponsePost.from_dict(_item) for _item in obj["parentposts"]] if obj.get("parentposts") is not None else None,
             "userposts": [ModForumAddDiscussionPostResponsePost.from_dict(_item) for _item in obj["userposts"]] if obj.get("userposts") is not None else None
         }
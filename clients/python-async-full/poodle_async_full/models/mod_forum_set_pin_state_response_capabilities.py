@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
 from typing import Any, ClassVar, Dict, List
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,42 @@ class ModForumSetPinStateResponseCapabilities(BaseModel):
     subscribe: StrictBool = Field(description="subscribe")
     __properties: ClassVar[List[str]] = ["favourite", "manage", "move", "pin", "post", "subscribe"]
 
+    @field_validator('favourite', mode='before')
+    @classmethod
+    def favourite_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('manage', mode='before')
+    @classmethod
+    def manage_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('move', mode='before')
+    @classmethod
+    def move_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('pin', mode='before')
+    @classmethod
+    def pin_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('post', mode='before')
+    @classmethod
+    def post_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('subscribe', mode='before')
+    @classmethod
+    def subscribe_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +87,12 @@ class ModForumSetPinStateResponseCapabilities(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModForumSetPinStateResponseCapabilities from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -88,7 +125,7 @@ class ModForumSetPinStateResponseCapabilities(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "favourite": obj.get("favourite") if obj.get("favourite") is not None else False,
             "manage": obj.get("manage") if obj.get("manage") is not None else False,
             "move": obj.get("move") if obj.get("move") is not None else False,
@@ -25,6 +25,7 @@ from poodle_async_full.models.mod_forum_set_pin_state_response_timed import ModF
 from poodle_async_full.models.mod_forum_set_pin_state_response_times import ModForumSetPinStateResponseTimes
 from poodle_async_full.models.mod_forum_set_pin_state_response_urls import ModForumSetPinStateResponseUrls
 from poodle_async_full.models.mod_forum_set_pin_state_response_userstate import ModForumSetPinStateResponseUserstate
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -49,6 +50,48 @@ class ModForumSetSubscriptionStateResponse(BaseModel):
     userstate: ModForumSetPinStateResponseUserstate
     __properties: ClassVar[List[str]] = ["capabilities", "firstpostid", "forumid", "group", "id", "istimelocked", "locked", "name", "pinned", "timed", "times", "urls", "userstate"]
 
+    @field_validator('firstpostid', mode='before')
+    @classmethod
+    def firstpostid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('forumid', mode='before')
+    @classmethod
+    def forumid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('istimelocked', mode='before')
+    @classmethod
+    def istimelocked_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('locked', mode='before')
+    @classmethod
+    def locked_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('pinned', mode='before')
+    @classmethod
+    def pinned_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -63,12 +106,12 @@ class ModForumSetSubscriptionStateResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModForumSetSubscriptionStateResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -119,7 +162,7 @@ class ModForumSetSubscriptionStateResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "capabilities": ModForumSetPinStateResponseCapabilities.from_dict(obj["capabilities"]) if obj.get("capabilities") is not None else None,
             "firstpostid": obj.get("firstpostid") if obj.get("firstpostid") is not None else 0,
             "forumid": obj.get("forumid") if obj.get("forumid") is not None else 0,
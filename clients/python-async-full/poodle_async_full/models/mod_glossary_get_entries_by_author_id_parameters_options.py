@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -31,6 +32,12 @@ class ModGlossaryGetEntriesByAuthorIdParametersOptions(BaseModel):
     includenotapproved: Optional[StrictBool] = Field(default=False, description="When false, includes the non-approved entries created by the user. When true, also includes the ones that the user has the permission to approve.")
     __properties: ClassVar[List[str]] = ["includenotapproved"]
 
+    @field_validator('includenotapproved', mode='before')
+    @classmethod
+    def includenotapproved_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -45,12 +52,12 @@ class ModGlossaryGetEntriesByAuthorIdParametersOptions(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModGlossaryGetEntriesByAuthorIdParametersOptions from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -88,7 +95,7 @@ class ModGlossaryGetEntriesByAuthorIdParametersOptions(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "includenotapproved": obj.get("includenotapproved") if obj.get("includenotapproved") is not None else False
         }
         _obj = cls.model_construct(**data) if relaxed else cls.model_validate(data)
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, Strict
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_block_get_course_blocks_response_blocks_inner_contents_files_inner import CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInner
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_tags_inner import CoreBlogGetEntriesResponseEntriesInnerTagsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -55,6 +56,18 @@ class ModGlossaryGetEntriesByCategoryResponseEntriesInner(BaseModel):
     userpictureurl: Optional[StrictStr] = Field(description="Author picture")
     __properties: ClassVar[List[str]] = ["approved", "attachment", "attachments", "casesensitive", "categoryid", "categoryname", "concept", "definition", "definitionformat", "definitioninlinefiles", "definitiontrust", "fullmatch", "glossaryid", "id", "sourceglossaryid", "tags", "teacherentry", "timecreated", "timemodified", "usedynalink", "userfullname", "userid", "userpictureurl"]
 
+    @field_validator('categoryid', mode='before')
+    @classmethod
+    def categoryid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('categoryname', mode='before')
+    @classmethod
+    def categoryname_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -69,12 +82,12 @@ class ModGlossaryGetEntriesByCategoryResponseEntriesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModGlossaryGetEntriesByCategoryResponseEntriesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -228,7 +241,7 @@ class ModGlossaryGetEntriesByCategoryResponseEntriesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "approved": obj.get("approved"),
             "attachment": obj.get("attachment"),
             "attachments": [CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInner.from_dict(_item) for _item in obj["attachments"]] if obj.get("attachments") is not None else None,
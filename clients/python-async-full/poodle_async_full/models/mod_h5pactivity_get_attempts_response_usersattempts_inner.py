@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_h5pactivity_get_attempts_response_usersattempts_inner_attempts_inner import ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInner
 from poodle_async_full.models.mod_h5pactivity_get_attempts_response_usersattempts_inner_scored import ModH5pactivityGetAttemptsResponseUsersattemptsInnerScored
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -49,12 +50,12 @@ class ModH5pactivityGetAttemptsResponseUsersattemptsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModH5pactivityGetAttemptsResponseUsersattemptsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -102,7 +103,7 @@ class ModH5pactivityGetAttemptsResponseUsersattemptsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "attempts": [ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInner.from_dict(_item) for _item in obj["attempts"]] if obj.get("attempts") is not None else None,
             "scored": ModH5pactivityGetAttemptsResponseUsersattemptsInnerScored.from_dict(obj["scored"]) if obj.get("scored") is not None else None,
             "userid": obj.get("userid")
@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.auth_email_get_signup_settings_response_warnings_inner import AuthEmailGetSignupSettingsResponseWarningsInner
 from poodle_async_full.models.mod_h5pactivity_get_h5pactivities_by_courses_response_h5pactivities_inner import ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInner
 from poodle_async_full.models.mod_h5pactivity_get_h5pactivities_by_courses_response_h5pglobalsettings import ModH5pactivityGetH5pactivitiesByCoursesResponseH5pglobalsettings
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -50,12 +51,12 @@ class ModH5pactivityGetH5pactivitiesByCoursesResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModH5pactivityGetH5pactivitiesByCoursesResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -105,7 +106,7 @@ class ModH5pactivityGetH5pactivitiesByCoursesResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "h5pactivities": [ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInner.from_dict(_item) for _item in obj["h5pactivities"]] if obj.get("h5pactivities") is not None else None,
             "h5pglobalsettings": ModH5pactivityGetH5pactivitiesByCoursesResponseH5pglobalsettings.from_dict(obj["h5pglobalsettings"]) if obj.get("h5pglobalsettings") is not None else None,
             "warnings": [AuthEmailGetSignupSettingsResponseWarningsInner.from_dict(_item) for _item in obj["warnings"]] if obj.get("warnings") is not None else None
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_attachmentfiles_inner import CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner
 from poodle_async_full.models.mod_h5pactivity_get_h5pactivities_by_courses_response_h5pactivities_inner_deployedfile import ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInnerDeployedfile
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -49,6 +50,90 @@ class ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInner(BaseMode
     timemodified: Optional[StrictInt] = Field(default=0, description="Timestamp of when the instance was last modified.")
     __properties: ClassVar[List[str]] = ["contenthash", "context", "course", "coursemodule", "deployedfile", "displayoptions", "enabletracking", "grade", "grademethod", "id", "intro", "introfiles", "introformat", "name", "package", "timecreated", "timemodified"]
 
+    @field_validator('contenthash', mode='before')
+    @classmethod
+    def contenthash_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('context', mode='before')
+    @classmethod
+    def context_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('course', mode='before')
+    @classmethod
+    def course_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('coursemodule', mode='before')
+    @classmethod
+    def coursemodule_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('displayoptions', mode='before')
+    @classmethod
+    def displayoptions_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('enabletracking', mode='before')
+    @classmethod
+    def enabletracking_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('grade', mode='before')
+    @classmethod
+    def grade_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('grademethod', mode='before')
+    @classmethod
+    def grademethod_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('intro', mode='before')
+    @classmethod
+    def intro_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('introformat', mode='before')
+    @classmethod
+    def introformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -63,12 +148,12 @@ class ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInner(BaseMode
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -128,7 +213,7 @@ class ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInner(BaseMode
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "contenthash": obj.get("contenthash") if obj.get("contenthash") is not None else '',
             "context": obj.get("context") if obj.get("context") is not None else 0,
             "course": obj.get("course") if obj.get("course") is not None else 0,
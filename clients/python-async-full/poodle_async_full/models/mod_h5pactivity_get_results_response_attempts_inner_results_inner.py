@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_h5pactivity_get_results_response_attempts_inner_results_inner_options_inner import ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,6 +49,12 @@ class ModH5pactivityGetResultsResponseAttemptsInnerResultsInner(BaseModel):
     track: Optional[StrictBool] = Field(default=None, description="If the result has valid track information")
     __properties: ClassVar[List[str]] = ["answerlabel", "attemptid", "completion", "content", "correctlabel", "description", "duration", "id", "interactiontype", "maxscore", "options", "optionslabel", "rawscore", "subcontent", "success", "timecreated", "track"]
 
+    @field_validator('duration', mode='before')
+    @classmethod
+    def duration_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -62,12 +69,12 @@ class ModH5pactivityGetResultsResponseAttemptsInnerResultsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModH5pactivityGetResultsResponseAttemptsInnerResultsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -187,7 +194,7 @@ class ModH5pactivityGetResultsResponseAttemptsInnerResultsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "answerlabel": obj.get("answerlabel"),
             "attemptid": obj.get("attemptid"),
             "completion": obj.get("completion"),
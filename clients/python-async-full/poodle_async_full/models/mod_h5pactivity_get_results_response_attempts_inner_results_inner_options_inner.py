@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_h5pactivity_get_results_response_attempts_inner_results_inner_options_inner_correctanswer import ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerCorrectanswer
 from poodle_async_full.models.mod_h5pactivity_get_results_response_attempts_inner_results_inner_options_inner_useranswer import ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerUseranswer
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -50,12 +51,12 @@ class ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInner(Base
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -104,7 +105,7 @@ class ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInner(Base
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "correctanswer": ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerCorrectanswer.from_dict(obj["correctanswer"]) if obj.get("correctanswer") is not None else None,
             "description": obj.get("description"),
             "id": obj.get("id"),
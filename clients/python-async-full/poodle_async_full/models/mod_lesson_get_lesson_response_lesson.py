@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_attachmentfiles_inner import CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -77,6 +78,264 @@ class ModLessonGetLessonResponseLesson(BaseModel):
     width: Optional[StrictInt] = Field(default=0, description="Slideshow width")
     __properties: ClassVar[List[str]] = ["activitylink", "allowofflineattempts", "available", "bgcolor", "completionendreached", "completiontimespent", "conditions", "course", "coursemodule", "custom", "deadline", "dependency", "displayleft", "displayleftif", "feedback", "grade", "height", "id", "intro", "introfiles", "introformat", "lang", "maxanswers", "maxattempts", "maxpages", "mediaclose", "mediafile", "mediafiles", "mediaheight", "mediawidth", "minquestions", "modattempts", "name", "nextpagedefault", "ongoing", "password", "practice", "progressbar", "retake", "review", "slideshow", "timelimit", "timemodified", "usemaxgrade", "usepassword", "width"]
 
+    @field_validator('activitylink', mode='before')
+    @classmethod
+    def activitylink_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('allowofflineattempts', mode='before')
+    @classmethod
+    def allowofflineattempts_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('available', mode='before')
+    @classmethod
+    def available_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('bgcolor', mode='before')
+    @classmethod
+    def bgcolor_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('completionendreached', mode='before')
+    @classmethod
+    def completionendreached_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('completiontimespent', mode='before')
+    @classmethod
+    def completiontimespent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('conditions', mode='before')
+    @classmethod
+    def conditions_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('course', mode='before')
+    @classmethod
+    def course_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('coursemodule', mode='before')
+    @classmethod
+    def coursemodule_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('custom', mode='before')
+    @classmethod
+    def custom_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('deadline', mode='before')
+    @classmethod
+    def deadline_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('dependency', mode='before')
+    @classmethod
+    def dependency_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('displayleft', mode='before')
+    @classmethod
+    def displayleft_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('displayleftif', mode='before')
+    @classmethod
+    def displayleftif_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('feedback', mode='before')
+    @classmethod
+    def feedback_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('grade', mode='before')
+    @classmethod
+    def grade_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('height', mode='before')
+    @classmethod
+    def height_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('intro', mode='before')
+    @classmethod
+    def intro_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('introformat', mode='before')
+    @classmethod
+    def introformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('maxanswers', mode='before')
+    @classmethod
+    def maxanswers_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('maxattempts', mode='before')
+    @classmethod
+    def maxattempts_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('maxpages', mode='before')
+    @classmethod
+    def maxpages_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('mediaclose', mode='before')
+    @classmethod
+    def mediaclose_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('mediafile', mode='before')
+    @classmethod
+    def mediafile_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('mediaheight', mode='before')
+    @classmethod
+    def mediaheight_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('mediawidth', mode='before')
+    @classmethod
+    def mediawidth_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('minquestions', mode='before')
+    @classmethod
+    def minquestions_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('modattempts', mode='before')
+    @classmethod
+    def modattempts_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('nextpagedefault', mode='before')
+    @classmethod
+    def nextpagedefault_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('ongoing', mode='before')
+    @classmethod
+    def ongoing_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('password', mode='before')
+    @classmethod
+    def password_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('practice', mode='before')
+    @classmethod
+    def practice_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('progressbar', mode='before')
+    @classmethod
+    def progressbar_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('retake', mode='before')
+    @classmethod
+    def retake_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('review', mode='before')
+    @classmethod
+    def review_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('slideshow', mode='before')
+    @classmethod
+    def slideshow_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('timelimit', mode='before')
+    @classmethod
+    def timelimit_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usemaxgrade', mode='before')
+    @classmethod
+    def usemaxgrade_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usepassword', mode='before')
+    @classmethod
+    def usepassword_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('width', mode='before')
+    @classmethod
+    def width_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -91,12 +350,12 @@ class ModLessonGetLessonResponseLesson(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModLessonGetLessonResponseLesson from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -153,7 +412,7 @@ class ModLessonGetLessonResponseLesson(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "activitylink": obj.get("activitylink") if obj.get("activitylink") is not None else 0,
             "allowofflineattempts": obj.get("allowofflineattempts") if obj.get("allowofflineattempts") is not None else False,
             "available": obj.get("available") if obj.get("available") is not None else 0,
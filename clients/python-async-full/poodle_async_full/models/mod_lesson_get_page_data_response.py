@@ -24,6 +24,7 @@ from poodle_async_full.models.core_block_get_course_blocks_response_blocks_inner
 from poodle_async_full.models.mod_lesson_finish_attempt_response_messages_inner import ModLessonFinishAttemptResponseMessagesInner
 from poodle_async_full.models.mod_lesson_get_page_data_response_answers_inner import ModLessonGetPageDataResponseAnswersInner
 from poodle_async_full.models.mod_lesson_get_page_data_response_page import ModLessonGetPageDataResponsePage
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -59,12 +60,12 @@ class ModLessonGetPageDataResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModLessonGetPageDataResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -153,7 +154,7 @@ class ModLessonGetPageDataResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "answers": [ModLessonGetPageDataResponseAnswersInner.from_dict(_item) for _item in obj["answers"]] if obj.get("answers") is not None else None,
             "contentfiles": [CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInner.from_dict(_item) for _item in obj["contentfiles"]] if obj.get("contentfiles") is not None else None,
             "displaymenu": obj.get("displaymenu"),
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_lesson_get_page_data_response_page import ModLessonGetPageDataResponsePage
 from poodle_async_full.models.mod_lesson_get_user_attempt_response_answerpages_inner_answerdata import ModLessonGetUserAttemptResponseAnswerpagesInnerAnswerdata
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -52,12 +53,12 @@ class ModLessonGetUserAttemptResponseAnswerpagesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModLessonGetUserAttemptResponseAnswerpagesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -116,7 +117,7 @@ class ModLessonGetUserAttemptResponseAnswerpagesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "answerdata": ModLessonGetUserAttemptResponseAnswerpagesInnerAnswerdata.from_dict(obj["answerdata"]) if obj.get("answerdata") is not None else None,
             "contents": obj.get("contents"),
             "grayout": obj.get("grayout"),
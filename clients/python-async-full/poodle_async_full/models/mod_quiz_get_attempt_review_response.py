@@ -23,6 +23,7 @@ from poodle_async_full.models.auth_email_get_signup_settings_response_warnings_i
 from poodle_async_full.models.mod_quiz_get_attempt_data_response_attempt import ModQuizGetAttemptDataResponseAttempt
 from poodle_async_full.models.mod_quiz_get_attempt_data_response_questions_inner import ModQuizGetAttemptDataResponseQuestionsInner
 from poodle_async_full.models.mod_quiz_get_attempt_review_response_additionaldata_inner import ModQuizGetAttemptReviewResponseAdditionaldataInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -53,12 +54,12 @@ class ModQuizGetAttemptReviewResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModQuizGetAttemptReviewResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -120,7 +121,7 @@ class ModQuizGetAttemptReviewResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "additionaldata": [ModQuizGetAttemptReviewResponseAdditionaldataInner.from_dict(_item) for _item in obj["additionaldata"]] if obj.get("additionaldata") is not None else None,
             "attempt": ModQuizGetAttemptDataResponseAttempt.from_dict(obj["attempt"]) if obj.get("attempt") is not None else None,
             "grade": obj.get("grade"),
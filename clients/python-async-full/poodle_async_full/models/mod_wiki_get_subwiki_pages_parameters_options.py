@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -33,6 +34,24 @@ class ModWikiGetSubwikiPagesParametersOptions(BaseModel):
     sortdirection: Optional[StrictStr] = Field(default='ASC', description="Sort direction: ASC or DESC.")
     __properties: ClassVar[List[str]] = ["includecontent", "sortby", "sortdirection"]
 
+    @field_validator('includecontent', mode='before')
+    @classmethod
+    def includecontent_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('sortby', mode='before')
+    @classmethod
+    def sortby_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'title' if value is None else value
+
+    @field_validator('sortdirection', mode='before')
+    @classmethod
+    def sortdirection_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 'ASC' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -47,12 +66,12 @@ class ModWikiGetSubwikiPagesParametersOptions(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModWikiGetSubwikiPagesParametersOptions from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +119,7 @@ class ModWikiGetSubwikiPagesParametersOptions(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "includecontent": obj.get("includecontent") if obj.get("includecontent") is not None else 0,
             "sortby": obj.get("sortby") if obj.get("sortby") is not None else 'title',
             "sortdirection": obj.get("sortdirection") if obj.get("sortdirection") is not None else 'ASC'
@@ -25,6 +25,7 @@ from poodle_async_full.models.mod_workshop_get_assessment_form_definition_respon
 from poodle_async_full.models.mod_workshop_get_assessment_form_definition_response_dimensionsinfo_inner import ModWorkshopGetAssessmentFormDefinitionResponseDimensionsinfoInner
 from poodle_async_full.models.mod_workshop_get_assessment_form_definition_response_fields_inner import ModWorkshopGetAssessmentFormDefinitionResponseFieldsInner
 from poodle_async_full.models.mod_workshop_get_assessment_form_definition_response_options_inner import ModWorkshopGetAssessmentFormDefinitionResponseOptionsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -57,12 +58,12 @@ class ModWorkshopGetAssessmentFormDefinitionResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModWorkshopGetAssessmentFormDefinitionResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -142,7 +143,7 @@ class ModWorkshopGetAssessmentFormDefinitionResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "current": [ModWorkshopGetAssessmentFormDefinitionResponseCurrentInner.from_dict(_item) for _item in obj["current"]] if obj.get("current") is not None else None,
             "descriptionfiles": [CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInner.from_dict(_item) for _item in obj["descriptionfiles"]] if obj.get("descriptionfiles") is not None else None,
             "dimensionsinfo": [ModWorkshopGetAssessmentFormDefinitionResponseDimensionsinfoInner.from_dict(_item) for _item in obj["dimensionsinfo"]] if obj.get("dimensionsinfo") is not None else None,
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.mod_workshop_get_user_plan_response_userplan_examples_inner import ModWorkshopGetUserPlanResponseUserplanExamplesInner
 from poodle_async_full.models.mod_workshop_get_user_plan_response_userplan_phases_inner import ModWorkshopGetUserPlanResponseUserplanPhasesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,12 +49,12 @@ class ModWorkshopGetUserPlanResponseUserplan(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModWorkshopGetUserPlanResponseUserplan from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -100,7 +101,7 @@ class ModWorkshopGetUserPlanResponseUserplan(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "examples": [ModWorkshopGetUserPlanResponseUserplanExamplesInner.from_dict(_item) for _item in obj["examples"]] if obj.get("examples") is not None else None,
             "phases": [ModWorkshopGetUserPlanResponseUserplanPhasesInner.from_dict(_item) for _item in obj["phases"]] if obj.get("phases") is not None else None
         }
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, Strict
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.mod_workshop_get_user_plan_response_userplan_phases_inner_actions_inner import ModWorkshopGetUserPlanResponseUserplanPhasesInnerActionsInner
 from poodle_async_full.models.mod_workshop_get_user_plan_response_userplan_phases_inner_tasks_inner import ModWorkshopGetUserPlanResponseUserplanPhasesInnerTasksInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -51,12 +52,12 @@ class ModWorkshopGetUserPlanResponseUserplanPhasesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModWorkshopGetUserPlanResponseUserplanPhasesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -118,7 +119,7 @@ class ModWorkshopGetUserPlanResponseUserplanPhasesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "actions": [ModWorkshopGetUserPlanResponseUserplanPhasesInnerActionsInner.from_dict(_item) for _item in obj["actions"]] if obj.get("actions") is not None else None,
             "active": obj.get("active"),
             "code": obj.get("code"),
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional, Union
 from poodle_async_full.models.core_blog_get_entries_response_entries_inner_attachmentfiles_inner import CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -74,6 +75,204 @@ class ModWorkshopGetWorkshopsByCoursesResponseWorkshopsInner(BaseModel):
     useselfassessment: Optional[StrictBool] = Field(default=False, description="Optional feature: students perform self assessment of their own work.")
     __properties: ClassVar[List[str]] = ["assessmentend", "assessmentstart", "conclusion", "conclusionfiles", "conclusionformat", "course", "coursemodule", "evaluation", "examplesmode", "grade", "gradedecimals", "gradinggrade", "id", "instructauthors", "instructauthorsfiles", "instructauthorsformat", "instructreviewers", "instructreviewersfiles", "instructreviewersformat", "intro", "introfiles", "introformat", "lang", "latesubmissions", "maxbytes", "name", "nattachments", "overallfeedbackfiles", "overallfeedbackfiletypes", "overallfeedbackmaxbytes", "overallfeedbackmode", "phase", "phaseswitchassessment", "strategy", "submissionend", "submissionfiletypes", "submissionstart", "submissiontypefile", "submissiontypetext", "timemodified", "useexamples", "usepeerassessment", "useselfassessment"]
 
+    @field_validator('assessmentend', mode='before')
+    @classmethod
+    def assessmentend_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('assessmentstart', mode='before')
+    @classmethod
+    def assessmentstart_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('conclusionformat', mode='before')
+    @classmethod
+    def conclusionformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('course', mode='before')
+    @classmethod
+    def course_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('coursemodule', mode='before')
+    @classmethod
+    def coursemodule_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('evaluation', mode='before')
+    @classmethod
+    def evaluation_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('examplesmode', mode='before')
+    @classmethod
+    def examplesmode_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('grade', mode='before')
+    @classmethod
+    def grade_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 80 if value is None else value
+
+    @field_validator('gradedecimals', mode='before')
+    @classmethod
+    def gradedecimals_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('gradinggrade', mode='before')
+    @classmethod
+    def gradinggrade_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 20 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('instructauthorsformat', mode='before')
+    @classmethod
+    def instructauthorsformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('instructreviewersformat', mode='before')
+    @classmethod
+    def instructreviewersformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('intro', mode='before')
+    @classmethod
+    def intro_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('introformat', mode='before')
+    @classmethod
+    def introformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('latesubmissions', mode='before')
+    @classmethod
+    def latesubmissions_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('maxbytes', mode='before')
+    @classmethod
+    def maxbytes_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('nattachments', mode='before')
+    @classmethod
+    def nattachments_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('overallfeedbackfiles', mode='before')
+    @classmethod
+    def overallfeedbackfiles_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('overallfeedbackmaxbytes', mode='before')
+    @classmethod
+    def overallfeedbackmaxbytes_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('overallfeedbackmode', mode='before')
+    @classmethod
+    def overallfeedbackmode_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('phase', mode='before')
+    @classmethod
+    def phase_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('phaseswitchassessment', mode='before')
+    @classmethod
+    def phaseswitchassessment_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('strategy', mode='before')
+    @classmethod
+    def strategy_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('submissionend', mode='before')
+    @classmethod
+    def submissionend_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('submissionstart', mode='before')
+    @classmethod
+    def submissionstart_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('submissiontypefile', mode='before')
+    @classmethod
+    def submissiontypefile_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('submissiontypetext', mode='before')
+    @classmethod
+    def submissiontypetext_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('useexamples', mode='before')
+    @classmethod
+    def useexamples_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('usepeerassessment', mode='before')
+    @classmethod
+    def usepeerassessment_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('useselfassessment', mode='before')
+    @classmethod
+    def useselfassessment_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -88,12 +287,12 @@ class ModWorkshopGetWorkshopsByCoursesResponseWorkshopsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ModWorkshopGetWorkshopsByCoursesResponseWorkshopsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -209,7 +408,7 @@ class ModWorkshopGetWorkshopsByCoursesResponseWorkshopsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "assessmentend": obj.get("assessmentend") if obj.get("assessmentend") is not None else 0,
             "assessmentstart": obj.get("assessmentstart") if obj.get("assessmentstart") is not None else 0,
             "conclusion": obj.get("conclusion"),
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.report_competency_data_for_report_response_usercompetencies_inner_competency_comppath_ancestors_inner import ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,24 @@ class ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppa
     showlinks: StrictBool = Field(description="showlinks")
     __properties: ClassVar[List[str]] = ["ancestors", "framework", "pagecontextid", "pluginbaseurl", "showlinks"]
 
+    @field_validator('pagecontextid', mode='before')
+    @classmethod
+    def pagecontextid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('pluginbaseurl', mode='before')
+    @classmethod
+    def pluginbaseurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('showlinks', mode='before')
+    @classmethod
+    def showlinks_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +69,12 @@ class ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppa
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppath from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -98,7 +117,7 @@ class ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppa
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "ancestors": [ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInner.from_dict(_item) for _item in obj["ancestors"]] if obj.get("ancestors") is not None else None,
             "framework": ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInner.from_dict(obj["framework"]) if obj.get("framework") is not None else None,
             "pagecontextid": obj.get("pagecontextid") if obj.get("pagecontextid") is not None else 0,
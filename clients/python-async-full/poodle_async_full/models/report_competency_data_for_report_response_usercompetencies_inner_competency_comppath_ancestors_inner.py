@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -35,6 +36,30 @@ class ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppa
     position: StrictInt = Field(description="position")
     __properties: ClassVar[List[str]] = ["first", "id", "last", "name", "position"]
 
+    @field_validator('first', mode='before')
+    @classmethod
+    def first_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('last', mode='before')
+    @classmethod
+    def last_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('position', mode='before')
+    @classmethod
+    def position_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -49,12 +74,12 @@ class ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppa
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -92,7 +117,7 @@ class ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppa
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "first": obj.get("first") if obj.get("first") is not None else False,
             "id": obj.get("id"),
             "last": obj.get("last") if obj.get("last") is not None else False,
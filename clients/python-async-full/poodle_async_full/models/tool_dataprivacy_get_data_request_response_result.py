@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_competency_create_plan_response_reviewer import CoreCompetencyCreatePlanResponseReviewer
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -59,6 +60,156 @@ class ToolDataprivacyGetDataRequestResponseResult(BaseModel):
     usermodified: StrictInt = Field(description="usermodified")
     __properties: ClassVar[List[str]] = ["allowfiltering", "approvedeny", "canmarkcomplete", "canreview", "comments", "commentsformat", "creationmethod", "downloadlink", "dpo", "dpocomment", "dpocommentformat", "dpouser", "foruser", "id", "messagehtml", "requestedby", "requestedbyuser", "status", "statuslabel", "statuslabelclass", "systemapproved", "timecreated", "timemodified", "type", "typename", "typenameshort", "userid", "usermodified"]
 
+    @field_validator('allowfiltering', mode='before')
+    @classmethod
+    def allowfiltering_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('approvedeny', mode='before')
+    @classmethod
+    def approvedeny_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('canmarkcomplete', mode='before')
+    @classmethod
+    def canmarkcomplete_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('canreview', mode='before')
+    @classmethod
+    def canreview_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('comments', mode='before')
+    @classmethod
+    def comments_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('commentsformat', mode='before')
+    @classmethod
+    def commentsformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 2 if value is None else value
+
+    @field_validator('creationmethod', mode='before')
+    @classmethod
+    def creationmethod_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('downloadlink', mode='before')
+    @classmethod
+    def downloadlink_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('dpo', mode='before')
+    @classmethod
+    def dpo_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('dpocomment', mode='before')
+    @classmethod
+    def dpocomment_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('dpocommentformat', mode='before')
+    @classmethod
+    def dpocommentformat_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 2 if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('messagehtml', mode='before')
+    @classmethod
+    def messagehtml_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('requestedby', mode='before')
+    @classmethod
+    def requestedby_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('status', mode='before')
+    @classmethod
+    def status_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('statuslabel', mode='before')
+    @classmethod
+    def statuslabel_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('statuslabelclass', mode='before')
+    @classmethod
+    def statuslabelclass_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('systemapproved', mode='before')
+    @classmethod
+    def systemapproved_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('timecreated', mode='before')
+    @classmethod
+    def timecreated_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('timemodified', mode='before')
+    @classmethod
+    def timemodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('type', mode='before')
+    @classmethod
+    def type_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('typename', mode='before')
+    @classmethod
+    def typename_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('typenameshort', mode='before')
+    @classmethod
+    def typenameshort_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('userid', mode='before')
+    @classmethod
+    def userid_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usermodified', mode='before')
+    @classmethod
+    def usermodified_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -73,12 +224,12 @@ class ToolDataprivacyGetDataRequestResponseResult(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolDataprivacyGetDataRequestResponseResult from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -130,7 +281,7 @@ class ToolDataprivacyGetDataRequestResponseResult(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "allowfiltering": obj.get("allowfiltering") if obj.get("allowfiltering") is not None else False,
             "approvedeny": obj.get("approvedeny") if obj.get("approvedeny") is not None else False,
             "canmarkcomplete": obj.get("canmarkcomplete") if obj.get("canmarkcomplete") is not None else False,
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.tool_dataprivacy_tree_extra_branches_response_branches_inner_branches_inner import ToolDataprivacyTreeExtraBranchesResponseBranchesInnerBranchesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -52,12 +53,12 @@ class ToolDataprivacyTreeExtraBranchesResponseBranchesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolDataprivacyTreeExtraBranchesResponseBranchesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -127,7 +128,7 @@ class ToolDataprivacyTreeExtraBranchesResponseBranchesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "branches": [ToolDataprivacyTreeExtraBranchesResponseBranchesInnerBranchesInner.from_dict(_item) for _item in obj["branches"]] if obj.get("branches") is not None else None,
             "contextid": obj.get("contextid"),
             "contextlevel": obj.get("contextlevel"),
@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.tool_lp_data_for_course_competencies_page_response_competencies_inner import ToolLpDataForCourseCompetenciesPageResponseCompetenciesInner
 from poodle_async_full.models.tool_lp_data_for_course_competencies_page_response_settings import ToolLpDataForCourseCompetenciesPageResponseSettings
 from poodle_async_full.models.tool_lp_data_for_course_competencies_page_response_statistics import ToolLpDataForCourseCompetenciesPageResponseStatistics
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -59,12 +60,12 @@ class ToolLpDataForCourseCompetenciesPageResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForCourseCompetenciesPageResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -155,7 +156,7 @@ class ToolLpDataForCourseCompetenciesPageResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "canconfigurecoursecompetencies": obj.get("canconfigurecoursecompetencies"),
             "cangradecompetencies": obj.get("cangradecompetencies"),
             "canmanagecompetencyframeworks": obj.get("canmanagecompetencyframeworks"),
@@ -26,6 +26,7 @@ from poodle_async_full.models.report_competency_data_for_report_response_usercom
 from poodle_async_full.models.report_competency_data_for_report_response_usercompetencies_inner_usercompetencycourse import ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourse
 from poodle_async_full.models.tool_lp_data_for_course_competencies_page_response_competencies_inner_coursemodules_inner import ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInner
 from poodle_async_full.models.tool_lp_data_for_course_competencies_page_response_competencies_inner_ruleoutcomeoptions_inner import ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerRuleoutcomeoptionsInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -58,12 +59,12 @@ class ToolLpDataForCourseCompetenciesPageResponseCompetenciesInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForCourseCompetenciesPageResponseCompetenciesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -129,7 +130,7 @@ class ToolLpDataForCourseCompetenciesPageResponseCompetenciesInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "competency": CoreCompetencyListCompetenciesInTemplateResponseInner.from_dict(obj["competency"]) if obj.get("competency") is not None else None,
             "comppath": ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppath.from_dict(obj["comppath"]) if obj.get("comppath") is not None else None,
             "coursecompetency": CoreCompetencyListCourseCompetenciesResponseInnerCoursecompetency.from_dict(obj["coursecompetency"]) if obj.get("coursecompetency") is not None else None,
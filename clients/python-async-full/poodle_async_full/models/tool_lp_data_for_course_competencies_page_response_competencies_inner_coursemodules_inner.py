@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -34,6 +35,30 @@ class ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesI
     url: Optional[StrictStr] = Field(default='', description="url")
     __properties: ClassVar[List[str]] = ["iconurl", "id", "name", "url"]
 
+    @field_validator('iconurl', mode='before')
+    @classmethod
+    def iconurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def id_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('name', mode='before')
+    @classmethod
+    def name_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('url', mode='before')
+    @classmethod
+    def url_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -48,12 +73,12 @@ class ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesI
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -86,7 +111,7 @@ class ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesI
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "iconurl": obj.get("iconurl") if obj.get("iconurl") is not None else '',
             "id": obj.get("id") if obj.get("id") is not None else 0,
             "name": obj.get("name") if obj.get("name") is not None else '',
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Union
 from poodle_async_full.models.core_competency_list_competencies_in_template_response_inner import CoreCompetencyListCompetenciesInTemplateResponseInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -39,6 +40,48 @@ class ToolLpDataForCourseCompetenciesPageResponseStatistics(BaseModel):
     proficientcompetencypercentageformatted: StrictStr = Field(description="proficientcompetencypercentageformatted")
     __properties: ClassVar[List[str]] = ["canbegradedincourse", "canmanagecoursecompetencies", "competencycount", "leastproficient", "leastproficientcount", "proficientcompetencycount", "proficientcompetencypercentage", "proficientcompetencypercentageformatted"]
 
+    @field_validator('canbegradedincourse', mode='before')
+    @classmethod
+    def canbegradedincourse_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('canmanagecoursecompetencies', mode='before')
+    @classmethod
+    def canmanagecoursecompetencies_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('competencycount', mode='before')
+    @classmethod
+    def competencycount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('leastproficientcount', mode='before')
+    @classmethod
+    def leastproficientcount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('proficientcompetencycount', mode='before')
+    @classmethod
+    def proficientcompetencycount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('proficientcompetencypercentage', mode='before')
+    @classmethod
+    def proficientcompetencypercentage_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('proficientcompetencypercentageformatted', mode='before')
+    @classmethod
+    def proficientcompetencypercentageformatted_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -53,12 +96,12 @@ class ToolLpDataForCourseCompetenciesPageResponseStatistics(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForCourseCompetenciesPageResponseStatistics from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -98,7 +141,7 @@ class ToolLpDataForCourseCompetenciesPageResponseStatistics(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "canbegradedincourse": obj.get("canbegradedincourse") if obj.get("canbegradedincourse") is not None else False,
             "canmanagecoursecompetencies": obj.get("canmanagecoursecompetencies") if obj.get("canmanagecoursecompetencies") is not None else False,
             "competencycount": obj.get("competencycount") if obj.get("competencycount") is not None else 0,
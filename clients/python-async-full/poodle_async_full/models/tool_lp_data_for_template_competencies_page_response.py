@@ -22,6 +22,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 from poodle_async_full.models.core_competency_create_plan_response_template import CoreCompetencyCreatePlanResponseTemplate
 from poodle_async_full.models.report_competency_data_for_report_response_usercompetencies_inner_competency import ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetency
 from poodle_async_full.models.tool_lp_data_for_template_competencies_page_response_statistics import ToolLpDataForTemplateCompetenciesPageResponseStatistics
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -55,12 +56,12 @@ class ToolLpDataForTemplateCompetenciesPageResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForTemplateCompetenciesPageResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -131,7 +132,7 @@ class ToolLpDataForTemplateCompetenciesPageResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "canmanagecompetencyframeworks": obj.get("canmanagecompetencyframeworks"),
             "canmanagetemplatecompetencies": obj.get("canmanagetemplatecompetencies"),
             "competencies": [ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetency.from_dict(_item) for _item in obj["competencies"]] if obj.get("competencies") is not None else None,
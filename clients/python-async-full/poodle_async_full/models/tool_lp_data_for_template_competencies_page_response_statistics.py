@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Union
 from poodle_async_full.models.core_competency_list_competencies_in_template_response_inner import CoreCompetencyListCompetenciesInTemplateResponseInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -46,6 +47,90 @@ class ToolLpDataForTemplateCompetenciesPageResponseStatistics(BaseModel):
     usercompetencyplancount: StrictInt = Field(description="usercompetencyplancount")
     __properties: ClassVar[List[str]] = ["competencycount", "completedplancount", "completedplanpercentage", "completedplanpercentageformatted", "leastproficient", "leastproficientcount", "linkedcompetencycount", "linkedcompetencypercentage", "linkedcompetencypercentageformatted", "plancount", "proficientusercompetencyplancount", "proficientusercompetencyplanpercentage", "proficientusercompetencyplanpercentageformatted", "unlinkedcompetencycount", "usercompetencyplancount"]
 
+    @field_validator('competencycount', mode='before')
+    @classmethod
+    def competencycount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('completedplancount', mode='before')
+    @classmethod
+    def completedplancount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('completedplanpercentage', mode='before')
+    @classmethod
+    def completedplanpercentage_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('completedplanpercentageformatted', mode='before')
+    @classmethod
+    def completedplanpercentageformatted_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('leastproficientcount', mode='before')
+    @classmethod
+    def leastproficientcount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('linkedcompetencycount', mode='before')
+    @classmethod
+    def linkedcompetencycount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('linkedcompetencypercentage', mode='before')
+    @classmethod
+    def linkedcompetencypercentage_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('linkedcompetencypercentageformatted', mode='before')
+    @classmethod
+    def linkedcompetencypercentageformatted_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('plancount', mode='before')
+    @classmethod
+    def plancount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('proficientusercompetencyplancount', mode='before')
+    @classmethod
+    def proficientusercompetencyplancount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('proficientusercompetencyplanpercentage', mode='before')
+    @classmethod
+    def proficientusercompetencyplanpercentage_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('proficientusercompetencyplanpercentageformatted', mode='before')
+    @classmethod
+    def proficientusercompetencyplanpercentageformatted_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('unlinkedcompetencycount', mode='before')
+    @classmethod
+    def unlinkedcompetencycount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
+    @field_validator('usercompetencyplancount', mode='before')
+    @classmethod
+    def usercompetencyplancount_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return 0 if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -60,12 +145,12 @@ class ToolLpDataForTemplateCompetenciesPageResponseStatistics(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForTemplateCompetenciesPageResponseStatistics from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -105,7 +190,7 @@ class ToolLpDataForTemplateCompetenciesPageResponseStatistics(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "competencycount": obj.get("competencycount") if obj.get("competencycount") is not None else 0,
             "completedplancount": obj.get("completedplancount") if obj.get("completedplancount") is not None else 0,
             "completedplanpercentage": obj.get("completedplanpercentage") if obj.get("completedplanpercentage") is not None else 0,
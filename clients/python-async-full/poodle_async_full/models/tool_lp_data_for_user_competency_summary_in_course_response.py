@@ -23,6 +23,7 @@ from poodle_async_full.models.block_starredcourses_get_starred_courses_response_
 from poodle_async_full.models.core_competency_list_user_plans_response_inner import CoreCompetencyListUserPlansResponseInner
 from poodle_async_full.models.tool_lp_data_for_course_competencies_page_response_competencies_inner_coursemodules_inner import ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInner
 from poodle_async_full.models.tool_lp_data_for_user_competency_summary_in_course_response_usercompetencysummary import ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummary
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -39,6 +40,12 @@ class ToolLpDataForUserCompetencySummaryInCourseResponse(BaseModel):
     usercompetencysummary: ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummary
     __properties: ClassVar[List[str]] = ["course", "coursemodules", "plans", "pluginbaseurl", "usercompetencysummary"]
 
+    @field_validator('pluginbaseurl', mode='before')
+    @classmethod
+    def pluginbaseurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -53,12 +60,12 @@ class ToolLpDataForUserCompetencySummaryInCourseResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForUserCompetencySummaryInCourseResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -111,7 +118,7 @@ class ToolLpDataForUserCompetencySummaryInCourseResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "course": BlockStarredcoursesGetStarredCoursesResponseInner.from_dict(obj["course"]) if obj.get("course") is not None else None,
             "coursemodules": [ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInner.from_dict(_item) for _item in obj["coursemodules"]] if obj.get("coursemodules") is not None else None,
             "plans": [CoreCompetencyListUserPlansResponseInner.from_dict(_item) for _item in obj["plans"]] if obj.get("plans") is not None else None,
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict
 from typing import Any, ClassVar, Dict, List
 from poodle_async_full.models.core_competency_list_user_plans_response_inner import CoreCompetencyListUserPlansResponseInner
 from poodle_async_full.models.tool_lp_data_for_user_competency_summary_in_course_response_usercompetencysummary import ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummary
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -48,12 +49,12 @@ class ToolLpDataForUserCompetencySummaryInPlanResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForUserCompetencySummaryInPlanResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -92,7 +93,7 @@ class ToolLpDataForUserCompetencySummaryInPlanResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "plan": CoreCompetencyListUserPlansResponseInner.from_dict(obj["plan"]) if obj.get("plan") is not None else None,
             "usercompetencysummary": ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummary.from_dict(obj["usercompetencysummary"]) if obj.get("usercompetencysummary") is not None else None
         }
@@ -26,6 +26,7 @@ from poodle_async_full.models.core_competency_list_plan_competencies_response_in
 from poodle_async_full.models.report_competency_data_for_report_response_usercompetencies_inner_competency import ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetency
 from poodle_async_full.models.report_competency_data_for_report_response_usercompetencies_inner_usercompetencycourse import ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourse
 from poodle_async_full.models.tool_lp_data_for_user_competency_summary_in_course_response_usercompetencysummary_evidence_inner import ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryEvidenceInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -46,6 +47,18 @@ class ToolLpDataForUserCompetencySummaryResponse(BaseModel):
     usercompetencyplan: Optional[CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplan] = None
     __properties: ClassVar[List[str]] = ["cangrade", "commentarea", "competency", "evidence", "showrelatedcompetencies", "user", "usercompetency", "usercompetencycourse", "usercompetencyplan"]
 
+    @field_validator('cangrade', mode='before')
+    @classmethod
+    def cangrade_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('showrelatedcompetencies', mode='before')
+    @classmethod
+    def showrelatedcompetencies_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -60,12 +73,12 @@ class ToolLpDataForUserCompetencySummaryResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolLpDataForUserCompetencySummaryResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -123,7 +136,7 @@ class ToolLpDataForUserCompetencySummaryResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "cangrade": obj.get("cangrade") if obj.get("cangrade") is not None else False,
             "commentarea": CoreCompetencyCreatePlanResponseCommentarea.from_dict(obj["commentarea"]) if obj.get("commentarea") is not None else None,
             "competency": ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetency.from_dict(obj["competency"]) if obj.get("competency") is not None else None,
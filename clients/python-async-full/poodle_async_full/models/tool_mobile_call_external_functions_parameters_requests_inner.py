@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -36,6 +37,36 @@ class ToolMobileCallExternalFunctionsParametersRequestsInner(BaseModel):
     settingraw: Optional[StrictBool] = Field(default=False, description="Return raw text")
     __properties: ClassVar[List[str]] = ["arguments", "function", "settingfileurl", "settingfilter", "settinglang", "settingraw"]
 
+    @field_validator('arguments', mode='before')
+    @classmethod
+    def arguments_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '{}' if value is None else value
+
+    @field_validator('settingfileurl', mode='before')
+    @classmethod
+    def settingfileurl_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return True if value is None else value
+
+    @field_validator('settingfilter', mode='before')
+    @classmethod
+    def settingfilter_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
+    @field_validator('settinglang', mode='before')
+    @classmethod
+    def settinglang_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return '' if value is None else value
+
+    @field_validator('settingraw', mode='before')
+    @classmethod
+    def settingraw_default_if_none(cls, value):
+        """Replaces null by the default, as `from_dict` does"""
+        return False if value is None else value
+
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
@@ -50,12 +81,12 @@ class ToolMobileCallExternalFunctionsParametersRequestsInner(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolMobileCallExternalFunctionsParametersRequestsInner from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -118,7 +149,7 @@ class ToolMobileCallExternalFunctionsParametersRequestsInner(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "arguments": obj.get("arguments") if obj.get("arguments") is not None else '{}',
             "function": obj.get("function"),
             "settingfileurl": obj.get("settingfileurl") if obj.get("settingfileurl") is not None else True,
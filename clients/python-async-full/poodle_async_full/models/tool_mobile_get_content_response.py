@@ -23,6 +23,7 @@ from poodle_async_full.models.core_block_get_course_blocks_response_blocks_inner
 from poodle_async_full.models.tool_mobile_get_content_response_otherdata_inner import ToolMobileGetContentResponseOtherdataInner
 from poodle_async_full.models.tool_mobile_get_content_response_restrict import ToolMobileGetContentResponseRestrict
 from poodle_async_full.models.tool_mobile_get_content_response_templates_inner import ToolMobileGetContentResponseTemplatesInner
+from pydantic import field_validator  # noqa: F401
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -54,12 +55,12 @@ class ToolMobileGetContentResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return settings.json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ToolMobileGetContentResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(settings.json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -126,7 +127,7 @@ class ToolMobileGetContentResponse(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_construct(**obj) if relaxed else cls.model_validate(obj)
 
-        data = {
+        data: Dict[str, Any] = {
             "disabled": obj.get("disabled"),
             "files": [CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInner.from_dict(_item) for _item in obj["files"]] if obj.get("files") is not None else None,
             "javascript": obj.get("javascript"),
@@ -12,34 +12,111 @@
 """  # noqa: E501
 
 
+import asyncio
+from collections import deque
+import contextvars
+import functools
 import io
-import json
 import re
 import ssl
-from typing import Optional, Union
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, quote_plus, urlsplit
 
 import aiohttp
 import aiohttp_retry
+from multidict import CIMultiDict, CIMultiDictProxy
 
 from poodle_async_full.exceptions import ApiException, ApiValueError
 
 RESTResponseType = aiohttp.ClientResponse
 
-ALLOW_RETRY_METHODS = frozenset({'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'})
+# the endpoint of all wsfunctions
+WEBSERVICE_PATH = '/webservice/rest/server.php'
+
+RETRY_EXCEPTIONS = frozenset({aiohttp.ClientConnectionError, asyncio.TimeoutError})
+
+# streamed downloads may take long, so only bound the time between reads
+STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=60, sock_read=5 * 60)
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+_quote_form_key = functools.lru_cache(maxsize=4096)(quote_plus)
+
+# the timing of the call made by the current task, see `CallTiming`
+CALL_TIMING: contextvars.ContextVar[Optional["CallTiming"]] = contextvars.ContextVar('call_timing', default=None)
+_is_form_safe = re.compile(r'[A-Za-z0-9_.~-]*').fullmatch
+
+
+def encode_form(params) -> str:
+    """Encodes form fields like `urllib.parse.urlencode`, but faster for
+    the many fields of nested Moodle arguments: keys like
+    `comments[0][content]` repeat across calls and are quoted only once,
+    and values which need no quoting are taken as they are.
+    """
+    fields = []
+    for key, value in params:
+        if not isinstance(key, (str, bytes)):
+            key = str(key)
+        if isinstance(value, bytes):
+            value = quote_plus(value)
+        else:
+            if not isinstance(value, str):
+                value = str(value)
+            if not _is_form_safe(value):
+                value = quote_plus(value)
+        fields.append(_quote_form_key(key) + '=' + value)
+    return '&'.join(fields)
 
 class RESTResponse(io.IOBase):
 
-    def __init__(self, resp) -> None:
+    # the timing of the call, see `CallTiming`
+    timing: Optional["CallTiming"] = None
+
+    def __init__(self, resp, timing: Optional["CallTiming"]=None) -> None:
         self.response = resp
         self.status = resp.status
         self.reason = resp.reason
-        self.data = None
+        self.data: Optional[bytes] = None
+        self.timing = timing
 
     async def read(self):
         if self.data is None:
-            self.data = await self.response.read()
+            if self.timing is None:
+                self.data = await self.response.read()
+            else:
+                started = time.monotonic()
+                self.data = await self.response.read()
+                self.timing.add('body_read', time.monotonic() - started)
         return self.data
 
+    async def iter_chunked(self, chunk_size=STREAM_CHUNK_SIZE):
+        """Yields the body in chunks of at most `chunk_size` bytes,
+        without holding it in memory. Releases the connection when done,
+        which finishes the timing of the call."""
+        size = 0
+        error = None
+        try:
+            async for chunk in self.response.content.iter_chunked(chunk_size):
+                size += len(chunk)
+                yield chunk
+        except GeneratorExit:
+            # the caller stopped reading
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.response.release()
+            if self.timing is not None:
+                self.timing.response_bytes = size
+                self.timing.finish(self.status, error)
+
+    def finish_timing(self) -> None:
+        """Finishes the timing of the call once the response headers
+        arrived, for callers reading the body on their own."""
+        if self.timing is not None:
+            self.timing.finish(self.status)
+
     def getheaders(self):
         """Returns a CIMultiDictProxy of the response headers."""
         return self.response.headers
@@ -49,6 +126,499 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
+class RESTBufferedResponse(RESTResponse):
+    """A RESTResponse whose body is already held in memory.
+
+    Used where a response is not backed by its own HTTP exchange, e.g. an
+    entry split out of a batched `tool_mobile_call_external_functions` call.
+    """
+
+    def __init__(self, status, reason, headers, data: bytes) -> None:
+        self.response = None
+        self.status = status
+        self.reason = reason
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.data: bytes = data
+
+    async def read(self):
+        return self.data
+
+    async def iter_chunked(self, chunk_size=STREAM_CHUNK_SIZE):
+        """Yields the body in chunks of at most `chunk_size` bytes."""
+        for start in range(0, len(self.data), chunk_size):
+            yield self.data[start:start + chunk_size]
+
+    def getheaders(self):
+        """Returns a CIMultiDictProxy of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+class CallTiming:
+    """Phases of a webservice call, recorded if
+    `Configuration.instrumentation` is set.
+
+    Durations are in seconds, None if the phase did not occur, e.g.
+    `connect` for a reused connection:
+
+    - `queue_wait`: waiting for the rate limiter, the batch window and a
+      free connection of the pool
+    - `connect`: opening the connection, including the TLS handshake
+    - `ttfb`: from sending the request until the response headers
+      arrived, including retries
+    - `body_read`: reading the response body, None for streamed items,
+      see `ApiClient.stream_items`, and for the responses of the
+      `_without_preload_content` methods, timed until their headers arrived
+    - `json_parse`: parsing the body into dicts and lists
+    - `model_build`: building the models. Models validated by pydantic
+      straight from the body are parsed in the same pass, which is
+      counted here and leaves `json_parse` None.
+    - `duration`: the whole call
+
+    `outcome` is "ok", "error" for Moodle and HTTP errors, or the name of
+    the exception which ended the call, e.g. "TimeoutError". `batched`
+    calls share the request of their batch, its size is not attributed
+    to them.
+    """
+
+    PHASES = ('queue_wait', 'connect', 'ttfb', 'body_read', 'json_parse', 'model_build')
+
+    __slots__ = (
+        'wsfunction', 'host', 'started', 'queue_wait', 'connect', 'ttfb',
+        'body_read', 'json_parse', 'model_build', 'duration',
+        'request_bytes', 'response_bytes', 'status', 'outcome', 'batched',
+        '_on_finish', '_mark', '_excluded',
+    )
+
+    def __init__(self, wsfunction: str, host: str, on_finish: Callable[["CallTiming"], Any]) -> None:
+        self.wsfunction = wsfunction
+        self.host = host
+        self.started = time.monotonic()
+        self.queue_wait: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.body_read: Optional[float] = None
+        self.json_parse: Optional[float] = None
+        self.model_build: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.request_bytes: Optional[int] = None
+        self.response_bytes: Optional[int] = None
+        self.status: Optional[int] = None
+        self.outcome: Optional[str] = None
+        self.batched = False
+        self._on_finish = on_finish
+        self._mark = self.started
+        self._excluded = 0.0
+
+    def add(self, phase: str, seconds: float) -> None:
+        setattr(self, phase, (getattr(self, phase) or 0.0) + seconds)
+
+    def sending(self, data: Any=None) -> None:
+        """Marks the request as about to be sent, with body `data`."""
+        if isinstance(data, (bytes, str)):
+            # form encoded bodies are ASCII
+            self.request_bytes = len(data)
+        self._mark = time.monotonic()
+        self._excluded = (self.queue_wait or 0.0) + (self.connect or 0.0)
+
+    def sent(self) -> None:
+        """Marks the end of the wait for the rate limiter."""
+        self.add('queue_wait', time.monotonic() - self._mark)
+        self.sending()
+
+    def received(self) -> None:
+        """Marks the arrival of the response headers."""
+        # waits for a connection and connecting are traced meanwhile
+        excluded = (self.queue_wait or 0.0) + (self.connect or 0.0) - self._excluded
+        self.ttfb = time.monotonic() - self._mark - excluded
+
+    def adopt(self, batch: "CallTiming") -> None:
+        """Takes the phases of the batched request sending this call."""
+        self.batched = True
+        self.add('queue_wait', batch.started - self.started + (batch.queue_wait or 0.0))
+        self.connect = batch.connect
+        self.ttfb = batch.ttfb
+        self.body_read = batch.body_read
+
+    def finish(self, status: Optional[int], error: Optional[BaseException]=None) -> None:
+        """Ends the call and passes it to the exporters, only once."""
+        if self.outcome is not None:
+            return
+        self.duration = time.monotonic() - self.started
+        self.status = status
+        if error is None:
+            self.outcome = 'ok'
+        elif isinstance(error, ApiException):
+            self.outcome = 'error'
+        else:
+            self.outcome = type(error).__name__
+        self._on_finish(self)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith('_')}
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    """Traces the waits for a free connection and the time to connect
+    into the `CallTiming` of the current call. Only fires when a request
+    has to wait or to connect.
+    """
+    async def on_queued_start(session, context, params):
+        context.queued = time.monotonic()
+
+    async def on_queued_end(session, context, params):
+        timing = CALL_TIMING.get()
+        if timing is not None:
+            timing.add('queue_wait', time.monotonic() - context.queued)
+
+    async def on_create_start(session, context, params):
+        context.connecting = time.monotonic()
+
+    async def on_create_end(session, context, params):
+        timing = CALL_TIMING.get()
+        if timing is not None:
+            timing.add('connect', time.monotonic() - context.connecting)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_queued_start.append(on_queued_start)
+    trace_config.on_connection_queued_end.append(on_queued_end)
+    trace_config.on_connection_create_start.append(on_create_start)
+    trace_config.on_connection_create_end.append(on_create_end)
+    return trace_config
+
+
+class ConnectionPool:
+    """Keep-alive connections shared by all ApiClients using it, see
+    `Configuration.connection_pool`.
+
+    :param limit: maximum number of simultaneous connections, 0 for
+        no limit.
+    :param limit_per_host: maximum number of simultaneous connections to
+        the same host, 0 for no limit.
+    :param keepalive_timeout: seconds to keep idle connections open.
+    :param dns_cache_ttl: seconds to cache resolved host names, None to
+        cache them forever.
+    :param trust_env: whether to read proxy settings from the environment.
+    """
+
+    def __init__(
+        self,
+        limit=100,
+        limit_per_host=0,
+        keepalive_timeout=15.0,
+        dns_cache_ttl=10,
+        trust_env=True
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.trust_env = trust_env
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ssl_contexts: Dict[Tuple[Any, ...], ssl.SSLContext] = {}
+
+    def ssl_context(
+        self,
+        cafile=None,
+        cadata=None,
+        cert_file=None,
+        key_file=None,
+        verify=True
+    ) -> ssl.SSLContext:
+        """Returns the SSL context for these settings.
+
+        Connections are only reused for requests with the same SSL context,
+        so ApiClients with equal settings get the same one.
+        """
+        key = (cafile, cadata, cert_file, key_file, verify)
+        context = self._ssl_contexts.get(key)
+        if context is None:
+            context = ssl.create_default_context(cafile=cafile, cadata=cadata)
+            if cert_file:
+                context.load_cert_chain(cert_file, keyfile=key_file)
+            if not verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_contexts[key] = context
+        return context
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session, created on first use within the event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                ),
+                trust_env=self.trust_env,
+                trace_configs=[_trace_config()],
+            )
+        return self._session
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of SSL contexts, and of the connections in
+        use (`acquired`) and kept open for reuse (`idle`).
+        """
+        acquired = idle = 0
+        if self._session is not None and not self._session.closed:
+            # aiohttp has no public counters
+            connector = self._session.connector
+            acquired = len(getattr(connector, '_acquired', ()))
+            idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+        return {
+            'ssl_contexts': len(self._ssl_contexts),
+            'acquired': acquired,
+            'idle': idle,
+        }
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, and bursts of up to
+    `burst` requests.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Takes a token, returns the seconds to wait until it is available.
+
+        Tokens may be taken ahead, so waiting callers are served in order.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - 1
+        self.updated = now
+        return max(0.0, -self.tokens / self.rate)
+
+    def refund(self) -> None:
+        """Returns a token taken by a caller which gave up waiting."""
+        self.tokens = min(self.burst, self.tokens + 1)
+
+    def idle(self) -> bool:
+        """Whether the bucket has refilled since its last use."""
+        return self.tokens + (time.monotonic() - self.updated) * self.rate >= self.burst
+
+
+class AdaptiveConcurrency:
+    """Limits the number of concurrent requests, adapting the limit by
+    additive increase and multiplicative decrease (AIMD).
+
+    Each healthy response received while the limit is used up raises it by
+    1/limit, so by about one per round of requests. A congested one
+    multiplies it by `backoff`, at most once per round: responses to
+    requests sent before the last decrease don't decrease it again.
+    Callers waiting for a slot are served in order.
+    """
+
+    def __init__(
+        self,
+        limit: int=8,
+        min_limit: int=1,
+        max_limit: int=64,
+        backoff: float=0.5
+    ) -> None:
+        self.limit = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.in_flight = 0
+        self.decreases = 0
+        self._waiters: "Deque[asyncio.Future[None]]" = deque()
+
+    @property
+    def queued(self) -> int:
+        """Number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> int:
+        """Waits for a slot. Returns the epoch to pass to `release`."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return self.decreases
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the slot was handed over already
+                self.release(self.decreases, None)
+            else:
+                self._waiters.remove(future)
+            raise
+        return self.decreases
+
+    def release(self, epoch: int, congested: Optional[bool]) -> None:
+        """Frees a slot and adapts the limit.
+
+        :param epoch: returned by `acquire`.
+        :param congested: whether the response showed the server is
+            overloaded, None if the request was abandoned.
+        """
+        self.in_flight -= 1
+        if congested:
+            if epoch == self.decreases and self.limit > self.min_limit:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self.decreases += 1
+        elif congested is not None and self.in_flight + 1 >= int(self.limit):
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+
+class RateLimiter:
+    """Throttles the requests to each host, see `Configuration.rate_limiter`.
+
+    A request takes a token from the `TokenBucket` of its host and from
+    the one of its host and wstoken, then waits for a slot of the
+    `AdaptiveConcurrency` of its host. A response with status 429 or 5xx,
+    a timeout, a failed connection or headers arriving later than
+    `latency_threshold` count as congestion and shrink the concurrency
+    limit, other responses grow it.
+
+    Retries of a request count as one request.
+
+    :param rate: requests per second to a host, None for no limit.
+    :param burst: requests to a host which may be sent at once.
+    :param token_rate: requests per second to a host with the same
+        wstoken, None for no limit.
+    :param token_burst: requests to a host with the same wstoken which
+        may be sent at once.
+    :param concurrency: initial limit of concurrent requests to a host.
+    :param min_concurrency: lower bound of the concurrency limit.
+    :param max_concurrency: upper bound of the concurrency limit.
+    :param latency_threshold: seconds until the response headers, above
+        which a response counts as congestion.
+    :param backoff: factor of the concurrency limit on congestion.
+    """
+
+    # buckets kept before dropping the idle ones
+    MAX_BUCKETS = 1024
+
+    def __init__(
+        self,
+        rate: Optional[float]=None,
+        burst: int=10,
+        token_rate: Optional[float]=None,
+        token_burst: int=5,
+        concurrency: int=8,
+        min_concurrency: int=1,
+        max_concurrency: int=64,
+        latency_threshold: float=10.0,
+        backoff: float=0.5
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.token_rate = token_rate
+        self.token_burst = token_burst
+        self.concurrency = concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_threshold = latency_threshold
+        self.backoff = backoff
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._limits: Dict[str, AdaptiveConcurrency] = {}
+        # callers waiting for a token, by host
+        self._throttled: Dict[str, int] = {}
+
+    def _bucket(self, host: str, token: Optional[str], rate: float, burst: int) -> TokenBucket:
+        bucket = self._buckets.get((host, token))
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_BUCKETS:
+                for key in [key for key, value in self._buckets.items() if value.idle()]:
+                    del self._buckets[key]
+            bucket = self._buckets[(host, token)] = TokenBucket(rate, burst)
+        return bucket
+
+    async def acquire(self, url: str) -> Tuple[AdaptiveConcurrency, int, float]:
+        """Waits until a request to `url` may be sent. Returns the permit
+        to pass to `release` once the response headers arrived.
+        """
+        parts = urlsplit(url)
+        host = parts.netloc
+        buckets: List[TokenBucket] = []
+        if self.rate is not None:
+            buckets.append(self._bucket(host, None, self.rate, self.burst))
+        if self.token_rate is not None:
+            token = dict(parse_qsl(parts.query)).get('wstoken')
+            buckets.append(self._bucket(host, token, self.token_rate, self.token_burst))
+        delay = max([bucket.reserve() for bucket in buckets], default=0.0)
+        if delay:
+            self._throttled[host] = self._throttled.get(host, 0) + 1
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                for bucket in buckets:
+                    bucket.refund()
+                raise
+            finally:
+                self._throttled[host] -= 1
+
+        limit = self._limits.get(host)
+        if limit is None:
+            limit = self._limits[host] = AdaptiveConcurrency(
+                self.concurrency, self.min_concurrency, self.max_concurrency, self.backoff
+            )
+        epoch = await limit.acquire()
+        return limit, epoch, time.monotonic()
+
+    def release(self, permit: Tuple[AdaptiveConcurrency, int, float], status: Optional[int]) -> None:
+        """Frees the slot of a request.
+
+        :param permit: returned by `acquire`.
+        :param status: HTTP status of the response, 0 if none was received,
+            e.g. on a timeout, None if the request was abandoned.
+        """
+        limit, epoch, start = permit
+        congested = None
+        if status is not None:
+            congested = (
+                status == 0
+                or status == 429
+                or status >= 500
+                or time.monotonic() - start > self.latency_threshold
+            )
+        limit.release(epoch, congested)
+
+    def metrics(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Returns by host the concurrency limit, the requests in flight,
+        the callers waiting for a slot (`queued`) or a token (`throttled`)
+        and the number of times the limit was decreased.
+        """
+        return {
+            host: {
+                'limit': int(limit.limit),
+                'in_flight': limit.in_flight,
+                'queued': limit.queued,
+                'throttled': self._throttled.get(host, 0),
+                'decreases': limit.decreases,
+            }
+            for host, limit in self._limits.items()
+        }
+
+
 class RESTClientObject:
 
     def __init__(self, configuration) -> None:
@@ -56,32 +626,41 @@ class RESTClientObject:
         # maxsize is number of requests to host that are allowed in parallel
         self.maxsize = configuration.connection_pool_maxsize
 
-        self.ssl_context = ssl.create_default_context(
+        self.pool = configuration.connection_pool
+        self.owns_pool = self.pool is None
+        if self.pool is None:
+            self.pool = ConnectionPool(
+                limit=self.maxsize,
+                limit_per_host=configuration.connection_pool_per_host,
+                keepalive_timeout=configuration.keepalive_timeout,
+                dns_cache_ttl=configuration.dns_cache_ttl,
+            )
+
+        self.ssl_context = self.pool.ssl_context(
             cafile=configuration.ssl_ca_cert,
             cadata=configuration.ca_cert_data,
+            cert_file=configuration.cert_file,
+            key_file=configuration.key_file,
+            verify=configuration.verify_ssl,
         )
-        if configuration.cert_file:
-            self.ssl_context.load_cert_chain(
-                configuration.cert_file, keyfile=configuration.key_file
-            )
-
-        if not configuration.verify_ssl:
-            self.ssl_context.check_hostname = False
-            self.ssl_context.verify_mode = ssl.CERT_NONE
 
         self.proxy = configuration.proxy
         self.proxy_headers = configuration.proxy_headers
 
         self.retries = configuration.retries
+        self.retry_policy = configuration.retry_policy
+        self.json_codec = configuration.json_codec
+        self.rate_limiter = configuration.rate_limiter
 
         self.pool_manager: Optional[aiohttp.ClientSession] = None
         self.retry_client: Optional[aiohttp_retry.RetryClient] = None
 
     async def close(self) -> None:
-        if self.pool_manager:
-            await self.pool_manager.close()
-        if self.retry_client is not None:
-            await self.retry_client.close()
+        # the retry client only wraps the session of the pool
+        if self.owns_pool:
+            await self.pool.close()
+        self.pool_manager = None
+        self.retry_client = None
 
     def build_request(
         self,
@@ -123,6 +702,9 @@ class RESTClientObject:
             "headers": headers
         }
 
+        # passed per request, as the connections may be shared
+        args["ssl"] = self.ssl_context
+
         if self.proxy:
             args["proxy"] = self.proxy
         if self.proxy_headers:
@@ -132,10 +714,12 @@ class RESTClientObject:
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
                 if body is not None:
-                    body = json.dumps(body)
+                    body = self.json_codec.dumpb(body)
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
-                args["data"] = aiohttp.FormData(post_params)
+                # encode eagerly, so the same args can be sent again
+                # on retries or repeated `*_from_args` calls
+                args["data"] = encode_form(post_params)
             elif headers['Content-Type'] == 'multipart/form-data':
                 # must del headers['Content-Type'], or the correct
                 # Content-Type which generated by aiohttp
@@ -153,7 +737,7 @@ class RESTClientObject:
                     else:
                         # Ensures that dict objects are serialized
                         if isinstance(v, dict):
-                            v = json.dumps(v)
+                            v = self.json_codec.dumps(v)
                         elif isinstance(v, int):
                             v = str(v)
                         data.add_field(k, v)
@@ -179,7 +763,8 @@ class RESTClientObject:
         headers=None,
         body=None,
         post_params=None,
-        _request_timeout=None
+        _request_timeout=None,
+        _read_only=None
     ):
         """Execute request
 
@@ -194,6 +779,8 @@ class RESTClientObject:
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _read_only: whether the called wsfunction is read-only,
+                           see `RetryPolicy.is_retryable`.
         """
 
         args = self.build_request(
@@ -205,36 +792,61 @@ class RESTClientObject:
             _request_timeout
         )
 
-        return await self.do_request(args)
+        return await self.do_request(args, _read_only=_read_only)
 
     async def do_request(
         self,
-        args
+        args,
+        _read_only=None
     ):
         pool_manager: Union[aiohttp.ClientSession, aiohttp_retry.RetryClient]
 
         # https pool manager
-        if self.pool_manager is None:
-            self.pool_manager = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=self.maxsize, ssl=self.ssl_context),
-                trust_env=True,
-            )
+        session = self.pool.session
+        if session is not self.pool_manager:
+            self.pool_manager = session
+            self.retry_client = None
         pool_manager = self.pool_manager
 
-        if self.retries is not None and args["method"] in ALLOW_RETRY_METHODS:
+        attempts = self.retry_policy.attempts if self.retries is None else self.retries
+        if attempts > 1 and self.retry_policy.is_retryable(
+            args["method"], args["url"], _read_only
+        ):
             if self.retry_client is None:
                 self.retry_client = aiohttp_retry.RetryClient(
                     client_session=self.pool_manager,
-                    retry_options=aiohttp_retry.ExponentialRetry(
-                        attempts=self.retries,
-                        factor=2.0,
-                        start_timeout=0.1,
-                        max_timeout=120.0
+                    retry_options=aiohttp_retry.JitterRetry(
+                        attempts=attempts,
+                        factor=self.retry_policy.factor,
+                        start_timeout=self.retry_policy.start_timeout,
+                        max_timeout=self.retry_policy.max_timeout,
+                        random_interval_size=self.retry_policy.jitter,
+                        statuses=set(self.retry_policy.statuses),
+                        exceptions=set(RETRY_EXCEPTIONS)
                     )
                 )
             pool_manager = self.retry_client
 
-        r = await pool_manager.request(**args)
-
-        return RESTResponse(r)
+        timing = CALL_TIMING.get()
+        if timing is not None:
+            timing.sending(args.get("data"))
+        if self.rate_limiter is None:
+            r = await pool_manager.request(**args)
+        else:
+            permit = await self.rate_limiter.acquire(args["url"])
+            if timing is not None:
+                timing.sent()
+            status = None
+            try:
+                r = await pool_manager.request(**args)
+                status = r.status
+            except tuple(RETRY_EXCEPTIONS):
+                status = 0
+                raise
+            finally:
+                self.rate_limiter.release(permit, status)
+
+        if timing is not None:
+            timing.received()
+        return RESTResponse(r, timing)
 
@@ -0,0 +1,11007 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any, List, Optional, TypedDict  # noqa: F401
+from typing_extensions import NotRequired
+
+# The responses returned in raw mode (`Configuration.raw_responses` or the
+# `_raw` argument of an operation), typed by JSON key. Only used for static
+# typing, e.g. `cast(CoreWebserviceGetSiteInfoResponseDict, info)`.
+
+
+AiplacementCourseassistExplainTextResponseDict = TypedDict('AiplacementCourseassistExplainTextResponseDict', {
+    'error': NotRequired[Optional[str]],
+    'errorcode': NotRequired[Optional[int]],
+    'finishreason': NotRequired[Optional[str]],
+    'generatedcontent': NotRequired[Optional[str]],
+    'prompttext': Optional[str],
+    'success': Optional[bool],
+    'timecreated': Optional[int],
+})
+
+
+AiplacementCourseassistSummariseTextResponseDict = TypedDict('AiplacementCourseassistSummariseTextResponseDict', {
+    'error': NotRequired[Optional[str]],
+    'errorcode': NotRequired[Optional[int]],
+    'finishreason': NotRequired[Optional[str]],
+    'generatedcontent': NotRequired[Optional[str]],
+    'prompttext': Optional[str],
+    'success': Optional[bool],
+    'timecreated': Optional[int],
+})
+
+
+AiplacementEditorGenerateImageResponseDict = TypedDict('AiplacementEditorGenerateImageResponseDict', {
+    'drafturl': NotRequired[Optional[str]],
+    'error': NotRequired[Optional[str]],
+    'errorcode': NotRequired[Optional[int]],
+    'revisedprompt': NotRequired[Optional[str]],
+    'success': Optional[bool],
+})
+
+
+AiplacementEditorGenerateTextResponseDict = TypedDict('AiplacementEditorGenerateTextResponseDict', {
+    'error': NotRequired[Optional[str]],
+    'errorcode': NotRequired[Optional[int]],
+    'finishreason': NotRequired[Optional[str]],
+    'generatedcontent': NotRequired[Optional[str]],
+    'prompttext': Optional[str],
+    'success': Optional[bool],
+    'timecreated': Optional[int],
+})
+
+
+AuthEmailGetSignupSettingsResponseDict = TypedDict('AuthEmailGetSignupSettingsResponseDict', {
+    'country': NotRequired[Optional[str]],
+    'defaultcity': NotRequired[Optional[str]],
+    'extendedusernamechars': NotRequired[Optional[bool]],
+    'namefields': List[str],
+    'passwordpolicy': NotRequired[Optional[str]],
+    'profilefields': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseProfilefieldsInnerDict']]],
+    'recaptchachallengehash': NotRequired[Optional[str]],
+    'recaptchachallengeimage': NotRequired[Optional[str]],
+    'recaptchachallengejs': NotRequired[Optional[str]],
+    'recaptchapublickey': NotRequired[Optional[str]],
+    'sitepolicy': NotRequired[Optional[str]],
+    'sitepolicyhandler': NotRequired[Optional[str]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+AuthEmailGetSignupSettingsResponseProfilefieldsInnerDict = TypedDict('AuthEmailGetSignupSettingsResponseProfilefieldsInnerDict', {
+    'categoryid': NotRequired[Optional[int]],
+    'categoryname': NotRequired[Optional[str]],
+    'datatype': NotRequired[Optional[str]],
+    'defaultdata': NotRequired[Optional[str]],
+    'defaultdataformat': Optional[int],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': Optional[int],
+    'forceunique': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'locked': NotRequired[Optional[int]],
+    'name': NotRequired[Optional[str]],
+    'param1': NotRequired[Optional[str]],
+    'param2': NotRequired[Optional[str]],
+    'param3': NotRequired[Optional[str]],
+    'param4': NotRequired[Optional[str]],
+    'param5': NotRequired[Optional[str]],
+    'required': NotRequired[Optional[int]],
+    'shortname': NotRequired[Optional[str]],
+    'signup': NotRequired[Optional[int]],
+    'sortorder': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+AuthEmailGetSignupSettingsResponseWarningsInnerDict = TypedDict('AuthEmailGetSignupSettingsResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+AuthEmailSignupUserParametersDict = TypedDict('AuthEmailSignupUserParametersDict', {
+    'city': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'customprofilefields': NotRequired[Optional[List['AuthEmailSignupUserParametersCustomprofilefieldsInnerDict']]],
+    'email': Optional[str],
+    'firstname': Optional[str],
+    'lastname': Optional[str],
+    'password': Optional[str],
+    'recaptchachallengehash': NotRequired[Optional[str]],
+    'recaptcharesponse': NotRequired[Optional[str]],
+    'redirect': NotRequired[Optional[str]],
+    'username': Optional[str],
+})
+
+
+AuthEmailSignupUserParametersCustomprofilefieldsInnerDict = TypedDict('AuthEmailSignupUserParametersCustomprofilefieldsInnerDict', {
+    'name': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+AuthEmailSignupUserResponseDict = TypedDict('AuthEmailSignupUserResponseDict', {
+    'success': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+BlockAccessreviewGetModuleDataResponseInnerDict = TypedDict('BlockAccessreviewGetModuleDataResponseInnerDict', {
+    'cmid': Optional[int],
+    'numchecks': Optional[int],
+    'numerrors': Optional[int],
+})
+
+
+BlockAccessreviewGetSectionDataResponseInnerDict = TypedDict('BlockAccessreviewGetSectionDataResponseInnerDict', {
+    'numchecks': Optional[int],
+    'numerrors': Optional[int],
+    'section': Optional[int],
+})
+
+
+BlockRecentlyaccesseditemsGetRecentItemsResponseInnerDict = TypedDict('BlockRecentlyaccesseditemsGetRecentItemsResponseInnerDict', {
+    'branded': NotRequired[Optional[bool]],
+    'cmid': int,
+    'courseid': int,
+    'coursename': str,
+    'courseviewurl': str,
+    'icon': str,
+    'id': int,
+    'modname': str,
+    'name': str,
+    'purpose': str,
+    'timeaccess': int,
+    'userid': int,
+    'viewurl': str,
+})
+
+
+BlockStarredcoursesGetStarredCoursesResponseInnerDict = TypedDict('BlockStarredcoursesGetStarredCoursesResponseInnerDict', {
+    'coursecategory': str,
+    'courseimage': str,
+    'enddate': int,
+    'fullname': str,
+    'fullnamedisplay': str,
+    'hasprogress': bool,
+    'hidden': bool,
+    'id': int,
+    'idnumber': str,
+    'isfavourite': bool,
+    'pdfexportfont': Optional[str],
+    'progress': NotRequired[Optional[int]],
+    'shortname': str,
+    'showactivitydates': Optional[bool],
+    'showcompletionconditions': Optional[bool],
+    'showshortname': bool,
+    'startdate': int,
+    'summary': Optional[str],
+    'summaryformat': NotRequired[Optional[int]],
+    'timeaccess': NotRequired[Optional[int]],
+    'viewurl': str,
+    'visible': bool,
+})
+
+
+CoreAiDeleteProviderInstanceResponseDict = TypedDict('CoreAiDeleteProviderInstanceResponseDict', {
+    'message': Optional[str],
+    'messagetype': Optional[str],
+    'result': Optional[bool],
+})
+
+
+CoreAiGetPolicyStatusResponseDict = TypedDict('CoreAiGetPolicyStatusResponseDict', {
+    'status': Optional[bool],
+})
+
+
+CoreAiSetPolicyStatusResponseDict = TypedDict('CoreAiSetPolicyStatusResponseDict', {
+    'success': Optional[bool],
+})
+
+
+CoreAiSetProviderStatusResponseDict = TypedDict('CoreAiSetProviderStatusResponseDict', {
+    'message': Optional[str],
+    'messagetype': Optional[str],
+    'result': Optional[bool],
+})
+
+
+CoreAuthConfirmUserParametersDict = TypedDict('CoreAuthConfirmUserParametersDict', {
+    'secret': Optional[str],
+    'username': Optional[str],
+})
+
+
+CoreAuthConfirmUserResponseDict = TypedDict('CoreAuthConfirmUserResponseDict', {
+    'success': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreAuthIsAgeDigitalConsentVerificationEnabledResponseDict = TypedDict('CoreAuthIsAgeDigitalConsentVerificationEnabledResponseDict', {
+    'status': Optional[bool],
+})
+
+
+CoreAuthIsMinorParametersDict = TypedDict('CoreAuthIsMinorParametersDict', {
+    'age': Optional[int],
+    'country': Optional[str],
+})
+
+
+CoreAuthIsMinorResponseDict = TypedDict('CoreAuthIsMinorResponseDict', {
+    'status': Optional[bool],
+})
+
+
+CoreAuthRequestPasswordResetParametersDict = TypedDict('CoreAuthRequestPasswordResetParametersDict', {
+    'email': NotRequired[Optional[str]],
+    'username': NotRequired[Optional[str]],
+})
+
+
+CoreAuthRequestPasswordResetResponseDict = TypedDict('CoreAuthRequestPasswordResetResponseDict', {
+    'notice': Optional[str],
+    'status': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreAuthResendConfirmationEmailParametersDict = TypedDict('CoreAuthResendConfirmationEmailParametersDict', {
+    'password': Optional[str],
+    'redirect': NotRequired[Optional[str]],
+    'username': Optional[str],
+})
+
+
+CoreAuthResendConfirmationEmailResponseDict = TypedDict('CoreAuthResendConfirmationEmailResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBackupGetAsyncBackupLinksBackupResponseDict = TypedDict('CoreBackupGetAsyncBackupLinksBackupResponseDict', {
+    'filesize': Optional[str],
+    'fileurl': Optional[str],
+    'restoreurl': Optional[str],
+})
+
+
+CoreBackupGetAsyncBackupLinksRestoreResponseDict = TypedDict('CoreBackupGetAsyncBackupLinksRestoreResponseDict', {
+    'restoreurl': Optional[str],
+})
+
+
+CoreBackupGetAsyncBackupProgressResponseInnerDict = TypedDict('CoreBackupGetAsyncBackupProgressResponseInnerDict', {
+    'backupid': Optional[str],
+    'operation': Optional[str],
+    'progress': Optional[float],
+    'status': Optional[int],
+})
+
+
+CoreBackupGetCopyProgressParametersCopiesInnerDict = TypedDict('CoreBackupGetCopyProgressParametersCopiesInnerDict', {
+    'backupid': Optional[str],
+    'operation': Optional[str],
+    'restoreid': Optional[str],
+})
+
+
+CoreBackupGetCopyProgressResponseInnerDict = TypedDict('CoreBackupGetCopyProgressResponseInnerDict', {
+    'backupid': Optional[str],
+    'operation': Optional[str],
+    'progress': Optional[float],
+    'status': Optional[int],
+})
+
+
+CoreBadgesDisableBadgesResponseDict = TypedDict('CoreBadgesDisableBadgesResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBadgesEnableBadgesResponseDict = TypedDict('CoreBadgesEnableBadgesResponseDict', {
+    'result': List['CoreBadgesEnableBadgesResponseResultInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBadgesEnableBadgesResponseResultInnerDict = TypedDict('CoreBadgesEnableBadgesResponseResultInnerDict', {
+    'awards': Optional[str],
+    'badgeid': Optional[int],
+})
+
+
+CoreBadgesGetBadgeResponseDict = TypedDict('CoreBadgesGetBadgeResponseDict', {
+    'badge': 'CoreBadgesGetBadgeResponseBadgeDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBadgesGetBadgeResponseBadgeDict = TypedDict('CoreBadgesGetBadgeResponseBadgeDict', {
+    'alignment': NotRequired[Optional[List['CoreBadgesGetBadgeResponseBadgeAlignmentInnerDict']]],
+    'coursefullname': NotRequired[Optional[str]],
+    'courseid': NotRequired[Optional[int]],
+    'criteriaNarrative': NotRequired[Optional[str]],
+    'criteriaUrl': NotRequired[Optional[str]],
+    'description': str,
+    'hostedUrl': NotRequired[Optional[str]],
+    'id': str,
+    'image': str,
+    'issuer': NotRequired[Optional[str]],
+    'name': str,
+    'type': str,
+})
+
+
+CoreBadgesGetBadgeResponseBadgeAlignmentInnerDict = TypedDict('CoreBadgesGetBadgeResponseBadgeAlignmentInnerDict', {
+    'badgeid': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'targetCode': NotRequired[Optional[str]],
+    'targetDescription': NotRequired[Optional[str]],
+    'targetFramework': NotRequired[Optional[str]],
+    'targetName': NotRequired[Optional[str]],
+    'targetUrl': NotRequired[Optional[str]],
+})
+
+
+CoreBadgesGetUserBadgeByHashResponseDict = TypedDict('CoreBadgesGetUserBadgeByHashResponseDict', {
+    'badge': List['CoreBadgesGetUserBadgeByHashResponseBadgeInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBadgesGetUserBadgeByHashResponseBadgeInnerDict = TypedDict('CoreBadgesGetUserBadgeByHashResponseBadgeInnerDict', {
+    'alignment': List['CoreBadgesGetBadgeResponseBadgeAlignmentInnerDict'],
+    'attachment': NotRequired[Optional[int]],
+    'badgeurl': str,
+    'coursefullname': NotRequired[Optional[str]],
+    'courseid': NotRequired[Optional[int]],
+    'dateexpire': Optional[int],
+    'dateissued': int,
+    'description': Optional[str],
+    'email': NotRequired[Optional[str]],
+    'endorsement': NotRequired[Optional['CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsementDict']],
+    'expiredate': NotRequired[Optional[int]],
+    'expireperiod': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'imagecaption': NotRequired[Optional[str]],
+    'issuedid': NotRequired[Optional[int]],
+    'issuercontact': Optional[str],
+    'issuername': str,
+    'issuerurl': str,
+    'language': NotRequired[Optional[str]],
+    'message': NotRequired[Optional[str]],
+    'messagesubject': NotRequired[Optional[str]],
+    'name': str,
+    'nextcron': NotRequired[Optional[int]],
+    'notification': NotRequired[Optional[int]],
+    'recipientfullname': str,
+    'recipientid': int,
+    'relatedbadges': List['CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInnerDict'],
+    'status': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'type': NotRequired[Optional[int]],
+    'uniquehash': str,
+    'usercreated': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+    'version': NotRequired[Optional[str]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsementDict = TypedDict('CoreBadgesGetUserBadgeByHashResponseBadgeInnerEndorsementDict', {
+    'badgeid': int,
+    'claimcomment': Optional[str],
+    'claimid': Optional[str],
+    'dateissued': int,
+    'id': int,
+    'issueremail': str,
+    'issuername': str,
+    'issuerurl': str,
+})
+
+
+CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInnerDict = TypedDict('CoreBadgesGetUserBadgeByHashResponseBadgeInnerRelatedbadgesInnerDict', {
+    'id': int,
+    'language': NotRequired[Optional[str]],
+    'name': str,
+    'type': NotRequired[Optional[int]],
+    'version': NotRequired[Optional[str]],
+})
+
+
+CoreBadgesGetUserBadgesResponseDict = TypedDict('CoreBadgesGetUserBadgesResponseDict', {
+    'badges': List['CoreBadgesGetUserBadgeByHashResponseBadgeInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlockFetchAddableBlocksResponseInnerDict = TypedDict('CoreBlockFetchAddableBlocksResponseInnerDict', {
+    'blockform': Optional[str],
+    'name': Optional[str],
+    'title': Optional[str],
+})
+
+
+CoreBlockGetCourseBlocksResponseDict = TypedDict('CoreBlockGetCourseBlocksResponseDict', {
+    'blocks': List['CoreBlockGetCourseBlocksResponseBlocksInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlockGetCourseBlocksResponseBlocksInnerDict = TypedDict('CoreBlockGetCourseBlocksResponseBlocksInnerDict', {
+    'collapsible': Optional[bool],
+    'configs': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerConfigsInnerDict']]],
+    'contents': NotRequired[Optional['CoreBlockGetCourseBlocksResponseBlocksInnerContentsDict']],
+    'dockable': Optional[bool],
+    'instanceid': Optional[int],
+    'name': Optional[str],
+    'positionid': Optional[int],
+    'region': Optional[str],
+    'visible': NotRequired[Optional[bool]],
+    'weight': NotRequired[Optional[int]],
+})
+
+
+CoreBlockGetCourseBlocksResponseBlocksInnerConfigsInnerDict = TypedDict('CoreBlockGetCourseBlocksResponseBlocksInnerConfigsInnerDict', {
+    'name': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreBlockGetCourseBlocksResponseBlocksInnerContentsDict = TypedDict('CoreBlockGetCourseBlocksResponseBlocksInnerContentsDict', {
+    'content': Optional[str],
+    'contentformat': Optional[int],
+    'files': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'footer': Optional[str],
+    'title': Optional[str],
+})
+
+
+CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict = TypedDict('CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict', {
+    'filename': NotRequired[Optional[str]],
+    'filepath': NotRequired[Optional[str]],
+    'filesize': NotRequired[Optional[int]],
+    'fileurl': NotRequired[Optional[str]],
+    'icon': NotRequired[Optional[str]],
+    'isexternalfile': NotRequired[Optional[bool]],
+    'mimetype': NotRequired[Optional[str]],
+    'repositorytype': NotRequired[Optional[str]],
+    'timemodified': NotRequired[Optional[int]],
+})
+
+
+CoreBlockGetDashboardBlocksResponseDict = TypedDict('CoreBlockGetDashboardBlocksResponseDict', {
+    'blocks': List['CoreBlockGetCourseBlocksResponseBlocksInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlogAddEntryParametersOptionsInnerDict = TypedDict('CoreBlogAddEntryParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreBlogAddEntryResponseDict = TypedDict('CoreBlogAddEntryResponseDict', {
+    'entryid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlogDeleteEntryResponseDict = TypedDict('CoreBlogDeleteEntryResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlogGetAccessInformationResponseDict = TypedDict('CoreBlogGetAccessInformationResponseDict', {
+    'cancreate': Optional[bool],
+    'canmanageentries': Optional[bool],
+    'canmanageexternal': Optional[bool],
+    'cansearch': Optional[bool],
+    'canview': Optional[bool],
+    'canviewdrafts': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlogGetEntriesParametersDict = TypedDict('CoreBlogGetEntriesParametersDict', {
+    'filters': NotRequired[Optional[List['CoreBlogGetEntriesParametersFiltersInnerDict']]],
+    'page': NotRequired[Optional[int]],
+    'perpage': NotRequired[Optional[int]],
+})
+
+
+CoreBlogGetEntriesParametersFiltersInnerDict = TypedDict('CoreBlogGetEntriesParametersFiltersInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreBlogGetEntriesResponseDict = TypedDict('CoreBlogGetEntriesResponseDict', {
+    'entries': List['CoreBlogGetEntriesResponseEntriesInnerDict'],
+    'totalentries': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlogGetEntriesResponseEntriesInnerDict = TypedDict('CoreBlogGetEntriesResponseEntriesInnerDict', {
+    'attachment': Optional[str],
+    'attachmentfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'canedit': NotRequired[Optional[bool]],
+    'content': Optional[str],
+    'courseid': int,
+    'coursemoduleid': int,
+    'created': int,
+    'format': int,
+    'groupid': int,
+    'id': Optional[int],
+    'lastmodified': int,
+    'module': str,
+    'moduleid': int,
+    'publishstate': str,
+    'rating': int,
+    'subject': str,
+    'summary': Optional[str],
+    'summaryfiles': List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict'],
+    'summaryformat': NotRequired[Optional[int]],
+    'tags': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict']]],
+    'uniquehash': str,
+    'userid': int,
+    'usermodified': Optional[int],
+})
+
+
+CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict = TypedDict('CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict', {
+    'filename': NotRequired[Optional[str]],
+    'filepath': NotRequired[Optional[str]],
+    'filesize': NotRequired[Optional[int]],
+    'fileurl': NotRequired[Optional[str]],
+    'icon': NotRequired[Optional[str]],
+    'isexternalfile': NotRequired[Optional[bool]],
+    'mimetype': NotRequired[Optional[str]],
+    'repositorytype': NotRequired[Optional[str]],
+    'timemodified': NotRequired[Optional[int]],
+})
+
+
+CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict = TypedDict('CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict', {
+    'flag': Optional[int],
+    'id': int,
+    'isstandard': bool,
+    'itemid': int,
+    'name': str,
+    'ordering': int,
+    'rawname': str,
+    'tagcollid': int,
+    'taginstancecontextid': int,
+    'taginstanceid': int,
+    'viewurl': NotRequired[Optional[str]],
+})
+
+
+CoreBlogPrepareEntryForEditionResponseDict = TypedDict('CoreBlogPrepareEntryForEditionResponseDict', {
+    'areas': List['CoreBlogPrepareEntryForEditionResponseAreasInnerDict'],
+    'attachmentsid': Optional[int],
+    'inlineattachmentsid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlogPrepareEntryForEditionResponseAreasInnerDict = TypedDict('CoreBlogPrepareEntryForEditionResponseAreasInnerDict', {
+    'area': Optional[str],
+    'options': List['CoreBlogPrepareEntryForEditionResponseAreasInnerOptionsInnerDict'],
+})
+
+
+CoreBlogPrepareEntryForEditionResponseAreasInnerOptionsInnerDict = TypedDict('CoreBlogPrepareEntryForEditionResponseAreasInnerOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreBlogUpdateEntryResponseDict = TypedDict('CoreBlogUpdateEntryResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreBlogViewEntriesParametersDict = TypedDict('CoreBlogViewEntriesParametersDict', {
+    'filters': NotRequired[Optional[List['CoreBlogViewEntriesParametersFiltersInnerDict']]],
+})
+
+
+CoreBlogViewEntriesParametersFiltersInnerDict = TypedDict('CoreBlogViewEntriesParametersFiltersInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreBlogViewEntriesResponseDict = TypedDict('CoreBlogViewEntriesResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarCreateCalendarEventsParametersEventsInnerDict = TypedDict('CoreCalendarCreateCalendarEventsParametersEventsInnerDict', {
+    'courseid': NotRequired[Optional[int]],
+    'description': NotRequired[Optional[str]],
+    'eventtype': NotRequired[Optional[str]],
+    'format': NotRequired[Optional[int]],
+    'groupid': NotRequired[Optional[int]],
+    'name': str,
+    'repeats': NotRequired[Optional[int]],
+    'sequence': NotRequired[Optional[int]],
+    'timeduration': NotRequired[Optional[int]],
+    'timestart': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreCalendarCreateCalendarEventsResponseDict = TypedDict('CoreCalendarCreateCalendarEventsResponseDict', {
+    'events': List['CoreCalendarCreateCalendarEventsResponseEventsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarCreateCalendarEventsResponseEventsInnerDict = TypedDict('CoreCalendarCreateCalendarEventsResponseEventsInnerDict', {
+    'courseid': Optional[int],
+    'description': NotRequired[Optional[str]],
+    'eventtype': Optional[str],
+    'format': Optional[int],
+    'groupid': Optional[int],
+    'id': Optional[int],
+    'instance': Optional[int],
+    'modulename': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'repeatid': NotRequired[Optional[int]],
+    'sequence': Optional[int],
+    'subscriptionid': NotRequired[Optional[int]],
+    'timeduration': Optional[int],
+    'timemodified': Optional[int],
+    'timestart': Optional[int],
+    'userid': Optional[int],
+    'uuid': NotRequired[Optional[str]],
+    'visible': Optional[int],
+})
+
+
+CoreCalendarDeleteCalendarEventsParametersEventsInnerDict = TypedDict('CoreCalendarDeleteCalendarEventsParametersEventsInnerDict', {
+    'eventid': int,
+    'repeat': Optional[bool],
+})
+
+
+CoreCalendarDeleteSubscriptionResponseDict = TypedDict('CoreCalendarDeleteSubscriptionResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarGetActionEventsByCourseResponseDict = TypedDict('CoreCalendarGetActionEventsByCourseResponseDict', {
+    'events': List['CoreCalendarGetActionEventsByCourseResponseEventsInnerDict'],
+    'firstid': Optional[int],
+    'lastid': Optional[int],
+})
+
+
+CoreCalendarGetActionEventsByCourseResponseEventsInnerDict = TypedDict('CoreCalendarGetActionEventsByCourseResponseEventsInnerDict', {
+    'action': NotRequired[Optional['CoreCalendarGetActionEventsByCourseResponseEventsInnerActionDict']],
+    'activityname': NotRequired[Optional[str]],
+    'activitystr': NotRequired[Optional[str]],
+    'branded': NotRequired[Optional[bool]],
+    'candelete': bool,
+    'canedit': bool,
+    'category': NotRequired[Optional['CoreCalendarGetActionEventsByCourseResponseEventsInnerCategoryDict']],
+    'categoryid': NotRequired[Optional[int]],
+    'component': NotRequired[Optional[str]],
+    'course': NotRequired[Optional['BlockStarredcoursesGetStarredCoursesResponseInnerDict']],
+    'deleteurl': str,
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'editurl': str,
+    'eventcount': NotRequired[Optional[int]],
+    'eventtype': str,
+    'formattedlocation': str,
+    'formattedtime': str,
+    'groupid': NotRequired[Optional[int]],
+    'groupname': NotRequired[Optional[str]],
+    'icon': 'CoreCalendarGetActionEventsByCourseResponseEventsInnerIconDict',
+    'id': int,
+    'instance': NotRequired[Optional[int]],
+    'isactionevent': bool,
+    'iscategoryevent': bool,
+    'iscourseevent': bool,
+    'location': NotRequired[Optional[str]],
+    'modulename': NotRequired[Optional[str]],
+    'name': str,
+    'normalisedeventtype': str,
+    'normalisedeventtypetext': str,
+    'overdue': NotRequired[Optional[bool]],
+    'purpose': str,
+    'repeatid': NotRequired[Optional[int]],
+    'subscription': NotRequired[Optional['CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscriptionDict']],
+    'timeduration': int,
+    'timemodified': int,
+    'timesort': int,
+    'timestart': int,
+    'timeusermidnight': int,
+    'url': str,
+    'userid': NotRequired[Optional[int]],
+    'viewurl': str,
+    'visible': int,
+})
+
+
+CoreCalendarGetActionEventsByCourseResponseEventsInnerActionDict = TypedDict('CoreCalendarGetActionEventsByCourseResponseEventsInnerActionDict', {
+    'actionable': bool,
+    'itemcount': int,
+    'name': str,
+    'showitemcount': bool,
+    'url': str,
+})
+
+
+CoreCalendarGetActionEventsByCourseResponseEventsInnerCategoryDict = TypedDict('CoreCalendarGetActionEventsByCourseResponseEventsInnerCategoryDict', {
+    'coursecount': int,
+    'depth': int,
+    'description': NotRequired[Optional[str]],
+    'id': int,
+    'idnumber': Optional[str],
+    'name': str,
+    'nestedname': str,
+    'parent': int,
+    'timemodified': int,
+    'url': str,
+    'visible': int,
+})
+
+
+CoreCalendarGetActionEventsByCourseResponseEventsInnerIconDict = TypedDict('CoreCalendarGetActionEventsByCourseResponseEventsInnerIconDict', {
+    'alttext': str,
+    'component': str,
+    'iconclass': str,
+    'iconurl': str,
+    'key': str,
+})
+
+
+CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscriptionDict = TypedDict('CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscriptionDict', {
+    'displayeventsource': bool,
+    'subscriptionname': NotRequired[Optional[str]],
+    'subscriptionurl': NotRequired[Optional[str]],
+})
+
+
+CoreCalendarGetActionEventsByCoursesResponseDict = TypedDict('CoreCalendarGetActionEventsByCoursesResponseDict', {
+    'groupedbycourse': List['CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInnerDict'],
+})
+
+
+CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInnerDict = TypedDict('CoreCalendarGetActionEventsByCoursesResponseGroupedbycourseInnerDict', {
+    'courseid': int,
+    'events': List['CoreCalendarGetActionEventsByCourseResponseEventsInnerDict'],
+    'firstid': Optional[int],
+    'lastid': Optional[int],
+})
+
+
+CoreCalendarGetActionEventsByTimesortResponseDict = TypedDict('CoreCalendarGetActionEventsByTimesortResponseDict', {
+    'events': List['CoreCalendarGetActionEventsByCourseResponseEventsInnerDict'],
+    'firstid': Optional[int],
+    'lastid': Optional[int],
+})
+
+
+CoreCalendarGetAllowedEventTypesResponseDict = TypedDict('CoreCalendarGetAllowedEventTypesResponseDict', {
+    'allowedeventtypes': List[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarGetCalendarAccessInformationResponseDict = TypedDict('CoreCalendarGetCalendarAccessInformationResponseDict', {
+    'canmanageentries': Optional[bool],
+    'canmanagegroupentries': Optional[bool],
+    'canmanageownentries': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarGetCalendarDayViewResponseDict = TypedDict('CoreCalendarGetCalendarDayViewResponseDict', {
+    'categoryid': NotRequired[Optional[int]],
+    'courseid': int,
+    'date': 'CoreCalendarGetCalendarDayViewResponseDateDict',
+    'defaulteventcontext': int,
+    'events': List['CoreCalendarGetCalendarDayViewResponseEventsInnerDict'],
+    'filter_selector': str,
+    'larrow': str,
+    'neweventtimestamp': int,
+    'nextperiod': 'CoreCalendarGetCalendarDayViewResponseDateDict',
+    'nextperiodlink': str,
+    'nextperiodname': str,
+    'periodname': str,
+    'previousperiod': 'CoreCalendarGetCalendarDayViewResponseDateDict',
+    'previousperiodlink': str,
+    'previousperiodname': str,
+    'rarrow': str,
+})
+
+
+CoreCalendarGetCalendarDayViewResponseDateDict = TypedDict('CoreCalendarGetCalendarDayViewResponseDateDict', {
+    'hours': int,
+    'mday': int,
+    'minutes': int,
+    'mon': int,
+    'month': str,
+    'seconds': int,
+    'timestamp': int,
+    'wday': int,
+    'weekday': str,
+    'yday': int,
+    'year': int,
+})
+
+
+CoreCalendarGetCalendarDayViewResponseEventsInnerDict = TypedDict('CoreCalendarGetCalendarDayViewResponseEventsInnerDict', {
+    'action': NotRequired[Optional['CoreCalendarGetActionEventsByCourseResponseEventsInnerActionDict']],
+    'activityname': NotRequired[Optional[str]],
+    'activitystr': NotRequired[Optional[str]],
+    'branded': NotRequired[Optional[bool]],
+    'candelete': bool,
+    'canedit': bool,
+    'category': NotRequired[Optional['CoreCalendarGetActionEventsByCourseResponseEventsInnerCategoryDict']],
+    'categoryid': NotRequired[Optional[int]],
+    'component': NotRequired[Optional[str]],
+    'course': NotRequired[Optional['BlockStarredcoursesGetStarredCoursesResponseInnerDict']],
+    'deleteurl': str,
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'draggable': bool,
+    'editurl': str,
+    'eventcount': NotRequired[Optional[int]],
+    'eventtype': str,
+    'formattedlocation': str,
+    'formattedtime': str,
+    'groupid': NotRequired[Optional[int]],
+    'groupname': NotRequired[Optional[str]],
+    'icon': 'CoreCalendarGetActionEventsByCourseResponseEventsInnerIconDict',
+    'id': int,
+    'instance': NotRequired[Optional[int]],
+    'isactionevent': bool,
+    'iscategoryevent': bool,
+    'iscourseevent': bool,
+    'islastday': bool,
+    'location': NotRequired[Optional[str]],
+    'maxdayerror': NotRequired[Optional[str]],
+    'maxdaytimestamp': NotRequired[Optional[int]],
+    'mindayerror': NotRequired[Optional[str]],
+    'mindaytimestamp': NotRequired[Optional[int]],
+    'modulename': NotRequired[Optional[str]],
+    'name': str,
+    'normalisedeventtype': str,
+    'normalisedeventtypetext': str,
+    'overdue': NotRequired[Optional[bool]],
+    'popupname': str,
+    'purpose': str,
+    'repeatid': NotRequired[Optional[int]],
+    'subscription': NotRequired[Optional['CoreCalendarGetActionEventsByCourseResponseEventsInnerSubscriptionDict']],
+    'timeduration': int,
+    'timemodified': int,
+    'timesort': int,
+    'timestart': int,
+    'timeusermidnight': int,
+    'url': str,
+    'userid': NotRequired[Optional[int]],
+    'viewurl': str,
+    'visible': int,
+})
+
+
+CoreCalendarGetCalendarEventByIdResponseDict = TypedDict('CoreCalendarGetCalendarEventByIdResponseDict', {
+    'event': 'CoreCalendarGetActionEventsByCourseResponseEventsInnerDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarGetCalendarEventsParametersEventsDict = TypedDict('CoreCalendarGetCalendarEventsParametersEventsDict', {
+    'categoryids': NotRequired[Optional[List[int]]],
+    'courseids': NotRequired[Optional[List[int]]],
+    'eventids': NotRequired[Optional[List[int]]],
+    'groupids': NotRequired[Optional[List[int]]],
+})
+
+
+CoreCalendarGetCalendarEventsParametersOptionsDict = TypedDict('CoreCalendarGetCalendarEventsParametersOptionsDict', {
+    'ignorehidden': NotRequired[Optional[bool]],
+    'siteevents': NotRequired[Optional[bool]],
+    'timeend': NotRequired[Optional[int]],
+    'timestart': NotRequired[Optional[int]],
+    'userevents': NotRequired[Optional[bool]],
+})
+
+
+CoreCalendarGetCalendarEventsResponseDict = TypedDict('CoreCalendarGetCalendarEventsResponseDict', {
+    'events': List['CoreCalendarGetCalendarEventsResponseEventsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarGetCalendarEventsResponseEventsInnerDict = TypedDict('CoreCalendarGetCalendarEventsResponseEventsInnerDict', {
+    'categoryid': NotRequired[Optional[int]],
+    'courseid': Optional[int],
+    'description': NotRequired[Optional[str]],
+    'eventtype': Optional[str],
+    'format': Optional[int],
+    'groupid': Optional[int],
+    'id': Optional[int],
+    'instance': Optional[int],
+    'modulename': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'repeatid': Optional[int],
+    'sequence': Optional[int],
+    'subscriptionid': NotRequired[Optional[int]],
+    'timeduration': Optional[int],
+    'timemodified': Optional[int],
+    'timestart': Optional[int],
+    'userid': Optional[int],
+    'uuid': NotRequired[Optional[str]],
+    'visible': Optional[int],
+})
+
+
+CoreCalendarGetCalendarExportTokenResponseDict = TypedDict('CoreCalendarGetCalendarExportTokenResponseDict', {
+    'token': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCalendarGetCalendarMonthlyViewResponseDict = TypedDict('CoreCalendarGetCalendarMonthlyViewResponseDict', {
+    'calendarinstanceid': int,
+    'categoryid': NotRequired[Optional[int]],
+    'courseid': int,
+    'date': 'CoreCalendarGetCalendarDayViewResponseDateDict',
+    'daynames': List['CoreCalendarGetCalendarMonthlyViewResponseDaynamesInnerDict'],
+    'defaulteventcontext': int,
+    'filter_selector': NotRequired[Optional[str]],
+    'includenavigation': bool,
+    'initialeventsloaded': bool,
+    'larrow': str,
+    'nextperiod': 'CoreCalendarGetCalendarDayViewResponseDateDict',
+    'nextperiodlink': str,
+    'nextperiodname': str,
+    'periodname': str,
+    'previousperiod': 'CoreCalendarGetCalendarDayViewResponseDateDict',
+    'previousperiodlink': str,
+    'previousperiodname': str,
+    'rarrow': str,
+    'showviewselector': bool,
+    'url': str,
+    'view': str,
+    'viewinginblock': bool,
+    'viewingmonth': bool,
+    'weeks': List['CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDict'],
+})
+
+
+CoreCalendarGetCalendarMonthlyViewResponseDaynamesInnerDict = TypedDict('CoreCalendarGetCalendarMonthlyViewResponseDaynamesInnerDict', {
+    'dayno': int,
+    'fullname': str,
+    'shortname': str,
+})
+
+
+CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDict = TypedDict('CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDict', {
+    'days': List['CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDaysInnerDict'],
+    'postpadding': List[int],
+    'prepadding': List[int],
+})
+
+
+CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDaysInnerDict = TypedDict('CoreCalendarGetCalendarMonthlyViewResponseWeeksInnerDaysInnerDict', {
+    'calendareventtypes': List[str],
+    'daytitle': str,
+    'events': List['CoreCalendarGetCalendarDayViewResponseEventsInnerDict'],
+    'hasevents': bool,
+    'haslastdayofevent': bool,
+    'hours': int,
+    'istoday': bool,
+    'isweekend': bool,
+    'mday': int,
+    'minutes': int,
+    'neweventtimestamp': int,
+    'nextperiod': int,
+    'popovertitle': str,
+    'previousperiod': int,
+    'seconds': int,
+    'timestamp': int,
+    'viewdaylink': NotRequired[Optional[str]],
+    'viewdaylinktitle': NotRequired[Optional[str]],
+    'wday': int,
+    'yday': int,
+    'year': int,
+})
+
+
+CoreCalendarGetCalendarUpcomingViewResponseDict = TypedDict('CoreCalendarGetCalendarUpcomingViewResponseDict', {
+    'categoryid': NotRequired[Optional[int]],
+    'courseid': int,
+    'date': 'CoreCalendarGetCalendarDayViewResponseDateDict',
+    'defaulteventcontext': int,
+    'events': List['CoreCalendarGetCalendarDayViewResponseEventsInnerDict'],
+    'filter_selector': str,
+    'isloggedin': bool,
+})
+
+
+CoreCalendarGetTimestampsParametersDataInnerDict = TypedDict('CoreCalendarGetTimestampsParametersDataInnerDict', {
+    'day': Optional[int],
+    'hour': NotRequired[Optional[int]],
+    'key': NotRequired[Optional[str]],
+    'minute': NotRequired[Optional[int]],
+    'month': Optional[int],
+    'year': Optional[int],
+})
+
+
+CoreCalendarGetTimestampsResponseDict = TypedDict('CoreCalendarGetTimestampsResponseDict', {
+    'timestamps': List['CoreCalendarGetTimestampsResponseTimestampsInnerDict'],
+})
+
+
+CoreCalendarGetTimestampsResponseTimestampsInnerDict = TypedDict('CoreCalendarGetTimestampsResponseTimestampsInnerDict', {
+    'key': Optional[str],
+    'timestamp': Optional[int],
+})
+
+
+CoreCalendarSubmitCreateUpdateFormResponseDict = TypedDict('CoreCalendarSubmitCreateUpdateFormResponseDict', {
+    'event': NotRequired[Optional['CoreCalendarGetActionEventsByCourseResponseEventsInnerDict']],
+    'validationerror': NotRequired[Optional[bool]],
+})
+
+
+CoreCalendarUpdateEventStartDayResponseDict = TypedDict('CoreCalendarUpdateEventStartDayResponseDict', {
+    'event': 'CoreCalendarGetActionEventsByCourseResponseEventsInnerDict',
+})
+
+
+CoreChangeEditmodeResponseDict = TypedDict('CoreChangeEditmodeResponseDict', {
+    'success': Optional[bool],
+})
+
+
+CoreCheckGetResultAdmintreeResponseDict = TypedDict('CoreCheckGetResultAdmintreeResponseDict', {
+    'details': NotRequired[Optional[str]],
+    'html': NotRequired[Optional[str]],
+    'status': Optional[str],
+    'summary': Optional[str],
+})
+
+
+CoreCohortAddCohortMembersParametersMembersInnerDict = TypedDict('CoreCohortAddCohortMembersParametersMembersInnerDict', {
+    'cohorttype': 'CoreCohortAddCohortMembersParametersMembersInnerCohorttypeDict',
+    'usertype': 'CoreCohortAddCohortMembersParametersMembersInnerUsertypeDict',
+})
+
+
+CoreCohortAddCohortMembersParametersMembersInnerCohorttypeDict = TypedDict('CoreCohortAddCohortMembersParametersMembersInnerCohorttypeDict', {
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCohortAddCohortMembersParametersMembersInnerUsertypeDict = TypedDict('CoreCohortAddCohortMembersParametersMembersInnerUsertypeDict', {
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCohortAddCohortMembersResponseDict = TypedDict('CoreCohortAddCohortMembersResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCohortCreateCohortsParametersCohortsInnerDict = TypedDict('CoreCohortCreateCohortsParametersCohortsInnerDict', {
+    'categorytype': 'CoreCohortCreateCohortsParametersCohortsInnerCategorytypeDict',
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'theme': NotRequired[Optional[str]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+CoreCohortCreateCohortsParametersCohortsInnerCategorytypeDict = TypedDict('CoreCohortCreateCohortsParametersCohortsInnerCategorytypeDict', {
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict = TypedDict('CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict', {
+    'shortname': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCohortCreateCohortsResponseInnerDict = TypedDict('CoreCohortCreateCohortsResponseInnerDict', {
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'theme': NotRequired[Optional[str]],
+    'visible': Optional[bool],
+})
+
+
+CoreCohortDeleteCohortMembersParametersMembersInnerDict = TypedDict('CoreCohortDeleteCohortMembersParametersMembersInnerDict', {
+    'cohortid': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreCohortGetCohortMembersResponseInnerDict = TypedDict('CoreCohortGetCohortMembersResponseInnerDict', {
+    'cohortid': Optional[int],
+    'userids': List[int],
+})
+
+
+CoreCohortGetCohortsResponseInnerDict = TypedDict('CoreCohortGetCohortsResponseInnerDict', {
+    'customfields': NotRequired[Optional[List['CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'theme': NotRequired[Optional[str]],
+    'visible': Optional[bool],
+})
+
+
+CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict = TypedDict('CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict', {
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+    'valueraw': Optional[str],
+})
+
+
+CoreCohortSearchCohortsParametersContextDict = TypedDict('CoreCohortSearchCohortsParametersContextDict', {
+    'contextid': NotRequired[Optional[int]],
+    'contextlevel': NotRequired[Optional[str]],
+    'instanceid': NotRequired[Optional[int]],
+})
+
+
+CoreCohortSearchCohortsResponseDict = TypedDict('CoreCohortSearchCohortsResponseDict', {
+    'cohorts': List['CoreCohortGetCohortsResponseInnerDict'],
+})
+
+
+CoreCohortUpdateCohortsParametersCohortsInnerDict = TypedDict('CoreCohortUpdateCohortsParametersCohortsInnerDict', {
+    'categorytype': 'CoreCohortCreateCohortsParametersCohortsInnerCategorytypeDict',
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'theme': NotRequired[Optional[str]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+CoreCommentAddCommentsParametersCommentsInnerDict = TypedDict('CoreCommentAddCommentsParametersCommentsInnerDict', {
+    'area': NotRequired[Optional[str]],
+    'component': Optional[str],
+    'content': Optional[str],
+    'contextlevel': Optional[str],
+    'instanceid': Optional[int],
+    'itemid': Optional[int],
+})
+
+
+CoreCommentAddCommentsResponseInnerDict = TypedDict('CoreCommentAddCommentsResponseInnerDict', {
+    'avatar': Optional[str],
+    'content': Optional[str],
+    'delete': NotRequired[Optional[bool]],
+    'format': Optional[int],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'profileurl': Optional[str],
+    'strftimeformat': Optional[str],
+    'time': Optional[str],
+    'timecreated': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreCommentGetCommentsResponseDict = TypedDict('CoreCommentGetCommentsResponseDict', {
+    'canpost': NotRequired[Optional[bool]],
+    'comments': List['CoreCommentAddCommentsResponseInnerDict'],
+    'count': NotRequired[Optional[int]],
+    'perpage': NotRequired[Optional[int]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCompetencyCountCompetenciesParametersFiltersInnerDict = TypedDict('CoreCompetencyCountCompetenciesParametersFiltersInnerDict', {
+    'column': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCompetencyCreateCompetencyFrameworkParametersCompetencyframeworkDict = TypedDict('CoreCompetencyCreateCompetencyFrameworkParametersCompetencyframeworkDict', {
+    'contextid': NotRequired[Optional[int]],
+    'contextlevel': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'idnumber': str,
+    'instanceid': NotRequired[Optional[int]],
+    'scaleconfiguration': str,
+    'scaleid': int,
+    'shortname': str,
+    'taxonomies': NotRequired[Optional[str]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+CoreCompetencyCreateCompetencyFrameworkResponseDict = TypedDict('CoreCompetencyCreateCompetencyFrameworkResponseDict', {
+    'canmanage': bool,
+    'competenciescount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': str,
+    'scaleconfiguration': str,
+    'scaleid': int,
+    'shortname': str,
+    'taxonomies': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyCreateCompetencyParametersCompetencyDict = TypedDict('CoreCompetencyCreateCompetencyParametersCompetencyDict', {
+    'competencyframeworkid': NotRequired[Optional[int]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'idnumber': str,
+    'parentid': NotRequired[Optional[int]],
+    'path': NotRequired[Optional[str]],
+    'ruleconfig': NotRequired[Optional[str]],
+    'ruleoutcome': NotRequired[Optional[int]],
+    'ruletype': NotRequired[Optional[str]],
+    'scaleconfiguration': NotRequired[Optional[str]],
+    'scaleid': NotRequired[Optional[int]],
+    'shortname': str,
+    'sortorder': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+})
+
+
+CoreCompetencyCreateCompetencyResponseDict = TypedDict('CoreCompetencyCreateCompetencyResponseDict', {
+    'competencyframeworkid': int,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': str,
+    'parentid': int,
+    'path': str,
+    'ruleconfig': Optional[str],
+    'ruleoutcome': int,
+    'ruletype': Optional[str],
+    'scaleconfiguration': Optional[str],
+    'scaleid': Optional[int],
+    'shortname': str,
+    'sortorder': int,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyCreatePlanParametersPlanDict = TypedDict('CoreCompetencyCreatePlanParametersPlanDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': NotRequired[Optional[int]],
+    'name': str,
+    'origtemplateid': NotRequired[Optional[int]],
+    'reviewerid': NotRequired[Optional[int]],
+    'status': NotRequired[Optional[int]],
+    'templateid': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'userid': int,
+    'usermodified': NotRequired[Optional[int]],
+})
+
+
+CoreCompetencyCreatePlanResponseDict = TypedDict('CoreCompetencyCreatePlanResponseDict', {
+    'canbeedited': bool,
+    'canmanage': bool,
+    'canrequestreview': bool,
+    'canreview': bool,
+    'commentarea': 'CoreCompetencyCreatePlanResponseCommentareaDict',
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'isactive': bool,
+    'isapproveallowed': bool,
+    'isbasedontemplate': bool,
+    'iscancelreviewrequestallowed': bool,
+    'iscompleteallowed': bool,
+    'iscompleted': bool,
+    'isdraft': bool,
+    'isinreview': bool,
+    'isreopenallowed': bool,
+    'isrequestreviewallowed': bool,
+    'isstartreviewallowed': bool,
+    'isstopreviewallowed': bool,
+    'isunapproveallowed': bool,
+    'isunlinkallowed': bool,
+    'iswaitingforreview': bool,
+    'name': str,
+    'origtemplateid': Optional[int],
+    'reviewer': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'reviewerid': Optional[int],
+    'status': int,
+    'statusname': str,
+    'template': NotRequired[Optional['CoreCompetencyCreatePlanResponseTemplateDict']],
+    'templateid': Optional[int],
+    'timecreated': int,
+    'timemodified': int,
+    'url': str,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyCreatePlanResponseCommentareaDict = TypedDict('CoreCompetencyCreatePlanResponseCommentareaDict', {
+    'autostart': bool,
+    'canpost': bool,
+    'canpostorhascomments': bool,
+    'canview': bool,
+    'cid': str,
+    'collapsediconkey': str,
+    'commentarea': str,
+    'component': str,
+    'contextid': int,
+    'count': int,
+    'courseid': int,
+    'displaycancel': bool,
+    'displaytotalcount': bool,
+    'fullwidth': bool,
+    'itemid': int,
+    'linktext': str,
+    'notoggle': bool,
+    'template': str,
+})
+
+
+CoreCompetencyCreatePlanResponseReviewerDict = TypedDict('CoreCompetencyCreatePlanResponseReviewerDict', {
+    'department': str,
+    'email': str,
+    'fullname': str,
+    'id': int,
+    'identity': str,
+    'idnumber': str,
+    'institution': str,
+    'phone1': str,
+    'phone2': str,
+    'profileimageurl': str,
+    'profileimageurlsmall': str,
+    'profileurl': str,
+})
+
+
+CoreCompetencyCreatePlanResponseTemplateDict = TypedDict('CoreCompetencyCreatePlanResponseTemplateDict', {
+    'canmanage': bool,
+    'canread': bool,
+    'cohortscount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'planscount': int,
+    'shortname': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyCreateTemplateParametersTemplateDict = TypedDict('CoreCompetencyCreateTemplateParametersTemplateDict', {
+    'contextid': NotRequired[Optional[int]],
+    'contextlevel': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': NotRequired[Optional[int]],
+    'instanceid': NotRequired[Optional[int]],
+    'shortname': str,
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+CoreCompetencyCreateTemplateResponseDict = TypedDict('CoreCompetencyCreateTemplateResponseDict', {
+    'canmanage': bool,
+    'canread': bool,
+    'cohortscount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'planscount': int,
+    'shortname': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyCreateUserEvidenceCompetencyResponseDict = TypedDict('CoreCompetencyCreateUserEvidenceCompetencyResponseDict', {
+    'competencyid': int,
+    'id': int,
+    'timecreated': int,
+    'timemodified': int,
+    'userevidenceid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyDuplicateCompetencyFrameworkResponseDict = TypedDict('CoreCompetencyDuplicateCompetencyFrameworkResponseDict', {
+    'canmanage': bool,
+    'competenciescount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': str,
+    'scaleconfiguration': str,
+    'scaleid': int,
+    'shortname': str,
+    'taxonomies': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyDuplicateTemplateResponseDict = TypedDict('CoreCompetencyDuplicateTemplateResponseDict', {
+    'canmanage': bool,
+    'canread': bool,
+    'cohortscount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'planscount': int,
+    'shortname': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyGetScaleValuesResponseInnerDict = TypedDict('CoreCompetencyGetScaleValuesResponseInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+CoreCompetencyGradeCompetencyInCourseResponseDict = TypedDict('CoreCompetencyGradeCompetencyInCourseResponseDict', {
+    'action': int,
+    'actionuser': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'actionuserid': Optional[int],
+    'candelete': bool,
+    'contextid': int,
+    'desca': Optional[str],
+    'desccomponent': str,
+    'descidentifier': str,
+    'description': str,
+    'grade': Optional[int],
+    'gradename': str,
+    'id': int,
+    'note': Optional[str],
+    'timecreated': int,
+    'timemodified': int,
+    'url': Optional[str],
+    'usercompetencyid': int,
+    'userdate': str,
+    'usermodified': int,
+})
+
+
+CoreCompetencyGradeCompetencyInPlanResponseDict = TypedDict('CoreCompetencyGradeCompetencyInPlanResponseDict', {
+    'action': int,
+    'actionuser': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'actionuserid': Optional[int],
+    'candelete': bool,
+    'contextid': int,
+    'desca': Optional[str],
+    'desccomponent': str,
+    'descidentifier': str,
+    'description': str,
+    'grade': Optional[int],
+    'gradename': str,
+    'id': int,
+    'note': Optional[str],
+    'timecreated': int,
+    'timemodified': int,
+    'url': Optional[str],
+    'usercompetencyid': int,
+    'userdate': str,
+    'usermodified': int,
+})
+
+
+CoreCompetencyGradeCompetencyResponseDict = TypedDict('CoreCompetencyGradeCompetencyResponseDict', {
+    'action': int,
+    'actionuser': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'actionuserid': Optional[int],
+    'candelete': bool,
+    'contextid': int,
+    'desca': Optional[str],
+    'desccomponent': str,
+    'descidentifier': str,
+    'description': str,
+    'grade': Optional[int],
+    'gradename': str,
+    'id': int,
+    'note': Optional[str],
+    'timecreated': int,
+    'timemodified': int,
+    'url': Optional[str],
+    'usercompetencyid': int,
+    'userdate': str,
+    'usermodified': int,
+})
+
+
+CoreCompetencyListCompetenciesInTemplateResponseInnerDict = TypedDict('CoreCompetencyListCompetenciesInTemplateResponseInnerDict', {
+    'competencyframeworkid': int,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': str,
+    'parentid': int,
+    'path': str,
+    'ruleconfig': Optional[str],
+    'ruleoutcome': int,
+    'ruletype': Optional[str],
+    'scaleconfiguration': Optional[str],
+    'scaleid': Optional[int],
+    'shortname': str,
+    'sortorder': int,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyListCompetencyFrameworksResponseInnerDict = TypedDict('CoreCompetencyListCompetencyFrameworksResponseInnerDict', {
+    'canmanage': bool,
+    'competenciescount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': str,
+    'scaleconfiguration': str,
+    'scaleid': int,
+    'shortname': str,
+    'taxonomies': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyListCourseCompetenciesResponseInnerDict = TypedDict('CoreCompetencyListCourseCompetenciesResponseInnerDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'coursecompetency': 'CoreCompetencyListCourseCompetenciesResponseInnerCoursecompetencyDict',
+})
+
+
+CoreCompetencyListCourseCompetenciesResponseInnerCoursecompetencyDict = TypedDict('CoreCompetencyListCourseCompetenciesResponseInnerCoursecompetencyDict', {
+    'competencyid': int,
+    'courseid': int,
+    'id': int,
+    'ruleoutcome': int,
+    'sortorder': int,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyListCourseModuleCompetenciesResponseInnerDict = TypedDict('CoreCompetencyListCourseModuleCompetenciesResponseInnerDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'coursemodulecompetency': 'CoreCompetencyListCourseModuleCompetenciesResponseInnerCoursemodulecompetencyDict',
+})
+
+
+CoreCompetencyListCourseModuleCompetenciesResponseInnerCoursemodulecompetencyDict = TypedDict('CoreCompetencyListCourseModuleCompetenciesResponseInnerCoursemodulecompetencyDict', {
+    'cmid': int,
+    'competencyid': int,
+    'id': int,
+    'overridegrade': bool,
+    'ruleoutcome': int,
+    'sortorder': int,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyListPlanCompetenciesResponseInnerDict = TypedDict('CoreCompetencyListPlanCompetenciesResponseInnerDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'usercompetency': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyDict']],
+    'usercompetencyplan': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplanDict']],
+})
+
+
+CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyDict = TypedDict('CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyDict', {
+    'canrequestreview': bool,
+    'canreview': bool,
+    'competencyid': int,
+    'grade': Optional[int],
+    'gradename': str,
+    'id': int,
+    'iscancelreviewrequestallowed': bool,
+    'isrequestreviewallowed': bool,
+    'isstartreviewallowed': bool,
+    'isstatusidle': bool,
+    'isstatusinreview': bool,
+    'isstatuswaitingforreview': bool,
+    'isstopreviewallowed': bool,
+    'proficiency': Optional[bool],
+    'proficiencyname': str,
+    'reviewer': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'reviewerid': Optional[int],
+    'status': int,
+    'statusname': str,
+    'timecreated': int,
+    'timemodified': int,
+    'url': str,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplanDict = TypedDict('CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplanDict', {
+    'competencyid': int,
+    'grade': Optional[int],
+    'gradename': str,
+    'id': int,
+    'planid': int,
+    'proficiency': Optional[bool],
+    'proficiencyname': str,
+    'sortorder': int,
+    'timecreated': int,
+    'timemodified': int,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyListUserPlansResponseInnerDict = TypedDict('CoreCompetencyListUserPlansResponseInnerDict', {
+    'canbeedited': bool,
+    'canmanage': bool,
+    'canrequestreview': bool,
+    'canreview': bool,
+    'commentarea': 'CoreCompetencyCreatePlanResponseCommentareaDict',
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'isactive': bool,
+    'isapproveallowed': bool,
+    'isbasedontemplate': bool,
+    'iscancelreviewrequestallowed': bool,
+    'iscompleteallowed': bool,
+    'iscompleted': bool,
+    'isdraft': bool,
+    'isinreview': bool,
+    'isreopenallowed': bool,
+    'isrequestreviewallowed': bool,
+    'isstartreviewallowed': bool,
+    'isstopreviewallowed': bool,
+    'isunapproveallowed': bool,
+    'isunlinkallowed': bool,
+    'iswaitingforreview': bool,
+    'name': str,
+    'origtemplateid': Optional[int],
+    'reviewer': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'reviewerid': Optional[int],
+    'status': int,
+    'statusname': str,
+    'template': NotRequired[Optional['CoreCompetencyCreatePlanResponseTemplateDict']],
+    'templateid': Optional[int],
+    'timecreated': int,
+    'timemodified': int,
+    'url': str,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyReadCompetencyFrameworkResponseDict = TypedDict('CoreCompetencyReadCompetencyFrameworkResponseDict', {
+    'canmanage': bool,
+    'competenciescount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': str,
+    'scaleconfiguration': str,
+    'scaleid': int,
+    'shortname': str,
+    'taxonomies': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyReadCompetencyResponseDict = TypedDict('CoreCompetencyReadCompetencyResponseDict', {
+    'competencyframeworkid': int,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': str,
+    'parentid': int,
+    'path': str,
+    'ruleconfig': Optional[str],
+    'ruleoutcome': int,
+    'ruletype': Optional[str],
+    'scaleconfiguration': Optional[str],
+    'scaleid': Optional[int],
+    'shortname': str,
+    'sortorder': int,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyReadPlanResponseDict = TypedDict('CoreCompetencyReadPlanResponseDict', {
+    'canbeedited': bool,
+    'canmanage': bool,
+    'canrequestreview': bool,
+    'canreview': bool,
+    'commentarea': 'CoreCompetencyCreatePlanResponseCommentareaDict',
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'isactive': bool,
+    'isapproveallowed': bool,
+    'isbasedontemplate': bool,
+    'iscancelreviewrequestallowed': bool,
+    'iscompleteallowed': bool,
+    'iscompleted': bool,
+    'isdraft': bool,
+    'isinreview': bool,
+    'isreopenallowed': bool,
+    'isrequestreviewallowed': bool,
+    'isstartreviewallowed': bool,
+    'isstopreviewallowed': bool,
+    'isunapproveallowed': bool,
+    'isunlinkallowed': bool,
+    'iswaitingforreview': bool,
+    'name': str,
+    'origtemplateid': Optional[int],
+    'reviewer': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'reviewerid': Optional[int],
+    'status': int,
+    'statusname': str,
+    'template': NotRequired[Optional['CoreCompetencyCreatePlanResponseTemplateDict']],
+    'templateid': Optional[int],
+    'timecreated': int,
+    'timemodified': int,
+    'url': str,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyReadTemplateResponseDict = TypedDict('CoreCompetencyReadTemplateResponseDict', {
+    'canmanage': bool,
+    'canread': bool,
+    'cohortscount': int,
+    'contextid': int,
+    'contextname': str,
+    'contextnamenoprefix': str,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'planscount': int,
+    'shortname': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+    'visible': bool,
+})
+
+
+CoreCompetencyReadUserEvidenceResponseDict = TypedDict('CoreCompetencyReadUserEvidenceResponseDict', {
+    'canmanage': bool,
+    'competencies': List['CoreCompetencyListCompetenciesInTemplateResponseInnerDict'],
+    'competencycount': int,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'filecount': int,
+    'files': List['CoreCompetencyReadUserEvidenceResponseFilesInnerDict'],
+    'hasurlorfiles': bool,
+    'id': int,
+    'name': str,
+    'timecreated': int,
+    'timemodified': int,
+    'url': str,
+    'urlshort': str,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyReadUserEvidenceResponseFilesInnerDict = TypedDict('CoreCompetencyReadUserEvidenceResponseFilesInnerDict', {
+    'author': str,
+    'component': str,
+    'contextid': int,
+    'filearea': str,
+    'filename': str,
+    'filenameshort': str,
+    'filepath': str,
+    'filesize': int,
+    'filesizeformatted': str,
+    'icon': str,
+    'isdir': bool,
+    'isimage': bool,
+    'itemid': int,
+    'license': str,
+    'timecreated': int,
+    'timecreatedformatted': str,
+    'timemodified': int,
+    'timemodifiedformatted': str,
+    'url': str,
+})
+
+
+CoreCompetencyUpdateCompetencyFrameworkParametersCompetencyframeworkDict = TypedDict('CoreCompetencyUpdateCompetencyFrameworkParametersCompetencyframeworkDict', {
+    'contextid': NotRequired[Optional[int]],
+    'contextlevel': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': NotRequired[Optional[str]],
+    'instanceid': NotRequired[Optional[int]],
+    'scaleconfiguration': NotRequired[Optional[str]],
+    'scaleid': NotRequired[Optional[int]],
+    'shortname': NotRequired[Optional[str]],
+    'taxonomies': NotRequired[Optional[str]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+CoreCompetencyUpdateCompetencyParametersCompetencyDict = TypedDict('CoreCompetencyUpdateCompetencyParametersCompetencyDict', {
+    'competencyframeworkid': NotRequired[Optional[int]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'idnumber': NotRequired[Optional[str]],
+    'parentid': NotRequired[Optional[int]],
+    'path': NotRequired[Optional[str]],
+    'ruleconfig': NotRequired[Optional[str]],
+    'ruleoutcome': NotRequired[Optional[int]],
+    'ruletype': NotRequired[Optional[str]],
+    'scaleconfiguration': NotRequired[Optional[str]],
+    'scaleid': NotRequired[Optional[int]],
+    'shortname': NotRequired[Optional[str]],
+    'sortorder': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+})
+
+
+CoreCompetencyUpdateCourseCompetencySettingsParametersSettingsDict = TypedDict('CoreCompetencyUpdateCourseCompetencySettingsParametersSettingsDict', {
+    'pushratingstouserplans': Optional[bool],
+})
+
+
+CoreCompetencyUpdatePlanParametersPlanDict = TypedDict('CoreCompetencyUpdatePlanParametersPlanDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': NotRequired[Optional[int]],
+    'id': int,
+    'name': NotRequired[Optional[str]],
+    'origtemplateid': NotRequired[Optional[int]],
+    'reviewerid': NotRequired[Optional[int]],
+    'status': NotRequired[Optional[int]],
+    'templateid': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'userid': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+})
+
+
+CoreCompetencyUpdatePlanResponseDict = TypedDict('CoreCompetencyUpdatePlanResponseDict', {
+    'canbeedited': bool,
+    'canmanage': bool,
+    'canrequestreview': bool,
+    'canreview': bool,
+    'commentarea': 'CoreCompetencyCreatePlanResponseCommentareaDict',
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': int,
+    'duedateformatted': str,
+    'id': int,
+    'isactive': bool,
+    'isapproveallowed': bool,
+    'isbasedontemplate': bool,
+    'iscancelreviewrequestallowed': bool,
+    'iscompleteallowed': bool,
+    'iscompleted': bool,
+    'isdraft': bool,
+    'isinreview': bool,
+    'isreopenallowed': bool,
+    'isrequestreviewallowed': bool,
+    'isstartreviewallowed': bool,
+    'isstopreviewallowed': bool,
+    'isunapproveallowed': bool,
+    'isunlinkallowed': bool,
+    'iswaitingforreview': bool,
+    'name': str,
+    'origtemplateid': Optional[int],
+    'reviewer': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'reviewerid': Optional[int],
+    'status': int,
+    'statusname': str,
+    'template': NotRequired[Optional['CoreCompetencyCreatePlanResponseTemplateDict']],
+    'templateid': Optional[int],
+    'timecreated': int,
+    'timemodified': int,
+    'url': str,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+CoreCompetencyUpdateTemplateParametersTemplateDict = TypedDict('CoreCompetencyUpdateTemplateParametersTemplateDict', {
+    'contextid': NotRequired[Optional[int]],
+    'contextlevel': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'duedate': NotRequired[Optional[int]],
+    'id': int,
+    'instanceid': NotRequired[Optional[int]],
+    'shortname': NotRequired[Optional[str]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'usermodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+CoreCompletionGetActivitiesCompletionStatusResponseDict = TypedDict('CoreCompletionGetActivitiesCompletionStatusResponseDict', {
+    'statuses': List['CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDict = TypedDict('CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDict', {
+    'cmid': Optional[int],
+    'details': NotRequired[Optional[List['CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDetailsInnerDict']]],
+    'hascompletion': NotRequired[Optional[bool]],
+    'instance': Optional[int],
+    'isautomatic': NotRequired[Optional[bool]],
+    'isoverallcomplete': NotRequired[Optional[bool]],
+    'istrackeduser': NotRequired[Optional[bool]],
+    'modname': Optional[str],
+    'overrideby': NotRequired[Optional[int]],
+    'state': Optional[int],
+    'timecompleted': Optional[int],
+    'tracking': Optional[int],
+    'uservisible': NotRequired[Optional[bool]],
+    'valueused': NotRequired[Optional[bool]],
+})
+
+
+CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDetailsInnerDict = TypedDict('CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDetailsInnerDict', {
+    'rulename': Optional[str],
+    'rulevalue': 'CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDetailsInnerRulevalueDict',
+})
+
+
+CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDetailsInnerRulevalueDict = TypedDict('CoreCompletionGetActivitiesCompletionStatusResponseStatusesInnerDetailsInnerRulevalueDict', {
+    'description': Optional[str],
+    'status': Optional[int],
+})
+
+
+CoreCompletionGetCourseCompletionStatusResponseDict = TypedDict('CoreCompletionGetCourseCompletionStatusResponseDict', {
+    'completionstatus': 'CoreCompletionGetCourseCompletionStatusResponseCompletionstatusDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCompletionGetCourseCompletionStatusResponseCompletionstatusDict = TypedDict('CoreCompletionGetCourseCompletionStatusResponseCompletionstatusDict', {
+    'aggregation': Optional[int],
+    'completed': Optional[bool],
+    'completions': List['CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInnerDict'],
+})
+
+
+CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInnerDict = TypedDict('CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInnerDict', {
+    'complete': Optional[bool],
+    'details': 'CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInnerDetailsDict',
+    'status': Optional[str],
+    'timecompleted': Optional[int],
+    'title': Optional[str],
+    'type': Optional[int],
+})
+
+
+CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInnerDetailsDict = TypedDict('CoreCompletionGetCourseCompletionStatusResponseCompletionstatusCompletionsInnerDetailsDict', {
+    'criteria': Optional[str],
+    'requirement': Optional[str],
+    'status': Optional[str],
+    'type': Optional[str],
+})
+
+
+CoreCompletionMarkCourseSelfCompletedResponseDict = TypedDict('CoreCompletionMarkCourseSelfCompletedResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCompletionOverrideActivityCompletionStatusResponseDict = TypedDict('CoreCompletionOverrideActivityCompletionStatusResponseDict', {
+    'cmid': Optional[int],
+    'overrideby': Optional[int],
+    'state': Optional[int],
+    'timecompleted': Optional[int],
+    'tracking': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreCompletionUpdateActivityCompletionStatusManuallyResponseDict = TypedDict('CoreCompletionUpdateActivityCompletionStatusManuallyResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreContentbankCopyContentResponseDict = TypedDict('CoreContentbankCopyContentResponseDict', {
+    'id': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreContentbankDeleteContentResponseDict = TypedDict('CoreContentbankDeleteContentResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreContentbankRenameContentResponseDict = TypedDict('CoreContentbankRenameContentResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreContentbankSetContentVisibilityResponseDict = TypedDict('CoreContentbankSetContentVisibilityResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseAddContentItemToUserFavouritesResponseDict = TypedDict('CoreCourseAddContentItemToUserFavouritesResponseDict', {
+    'archetype': str,
+    'branded': bool,
+    'componentname': str,
+    'favourite': bool,
+    'help': str,
+    'icon': str,
+    'id': int,
+    'legacyitem': bool,
+    'link': str,
+    'name': str,
+    'purpose': str,
+    'recommended': bool,
+    'title': str,
+})
+
+
+CoreCourseCheckUpdatesParametersTocheckInnerDict = TypedDict('CoreCourseCheckUpdatesParametersTocheckInnerDict', {
+    'contextlevel': Optional[str],
+    'id': Optional[int],
+    'since': Optional[int],
+})
+
+
+CoreCourseCheckUpdatesResponseDict = TypedDict('CoreCourseCheckUpdatesResponseDict', {
+    'instances': List['CoreCourseCheckUpdatesResponseInstancesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseCheckUpdatesResponseInstancesInnerDict = TypedDict('CoreCourseCheckUpdatesResponseInstancesInnerDict', {
+    'contextlevel': Optional[str],
+    'id': Optional[int],
+    'updates': List['CoreCourseCheckUpdatesResponseInstancesInnerUpdatesInnerDict'],
+})
+
+
+CoreCourseCheckUpdatesResponseInstancesInnerUpdatesInnerDict = TypedDict('CoreCourseCheckUpdatesResponseInstancesInnerUpdatesInnerDict', {
+    'itemids': NotRequired[Optional[List[int]]],
+    'name': Optional[str],
+    'timeupdated': NotRequired[Optional[int]],
+})
+
+
+CoreCourseCreateCategoriesParametersCategoriesInnerDict = TypedDict('CoreCourseCreateCategoriesParametersCategoriesInnerDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'idnumber': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'parent': NotRequired[Optional[int]],
+    'theme': NotRequired[Optional[str]],
+})
+
+
+CoreCourseCreateCategoriesResponseInnerDict = TypedDict('CoreCourseCreateCategoriesResponseInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+CoreCourseCreateCoursesParametersCoursesInnerDict = TypedDict('CoreCourseCreateCoursesParametersCoursesInnerDict', {
+    'categoryid': Optional[int],
+    'completionnotify': NotRequired[Optional[int]],
+    'courseformatoptions': NotRequired[Optional[List['CoreCourseCreateCoursesParametersCoursesInnerCourseformatoptionsInnerDict']]],
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'defaultgroupingid': NotRequired[Optional[int]],
+    'enablecompletion': NotRequired[Optional[int]],
+    'enddate': NotRequired[Optional[int]],
+    'forcetheme': NotRequired[Optional[str]],
+    'format': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'groupmode': NotRequired[Optional[int]],
+    'groupmodeforce': NotRequired[Optional[int]],
+    'hiddensections': NotRequired[Optional[int]],
+    'idnumber': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'maxbytes': NotRequired[Optional[int]],
+    'newsitems': NotRequired[Optional[int]],
+    'numsections': NotRequired[Optional[int]],
+    'shortname': Optional[str],
+    'showgrades': NotRequired[Optional[int]],
+    'showreports': NotRequired[Optional[int]],
+    'startdate': NotRequired[Optional[int]],
+    'summary': NotRequired[Optional[str]],
+    'summaryformat': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreCourseCreateCoursesParametersCoursesInnerCourseformatoptionsInnerDict = TypedDict('CoreCourseCreateCoursesParametersCoursesInnerCourseformatoptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCourseCreateCoursesResponseInnerDict = TypedDict('CoreCourseCreateCoursesResponseInnerDict', {
+    'id': Optional[int],
+    'shortname': Optional[str],
+})
+
+
+CoreCourseDeleteCategoriesParametersCategoriesInnerDict = TypedDict('CoreCourseDeleteCategoriesParametersCategoriesInnerDict', {
+    'id': Optional[int],
+    'newparent': NotRequired[Optional[int]],
+    'recursive': NotRequired[Optional[bool]],
+})
+
+
+CoreCourseDeleteCoursesResponseDict = TypedDict('CoreCourseDeleteCoursesResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseDuplicateCourseParametersOptionsInnerDict = TypedDict('CoreCourseDuplicateCourseParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCourseDuplicateCourseResponseDict = TypedDict('CoreCourseDuplicateCourseResponseDict', {
+    'id': Optional[int],
+    'shortname': Optional[str],
+})
+
+
+CoreCourseGetActivityChooserFooterResponseDict = TypedDict('CoreCourseGetActivityChooserFooterResponseDict', {
+    'customcarouseltemplate': NotRequired[Optional[str]],
+    'customfooterjs': NotRequired[Optional[str]],
+    'customfootertemplate': NotRequired[Optional[str]],
+    'footer': Optional[bool],
+})
+
+
+CoreCourseGetCategoriesParametersCriteriaInnerDict = TypedDict('CoreCourseGetCategoriesParametersCriteriaInnerDict', {
+    'key': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCourseGetCategoriesResponseInnerDict = TypedDict('CoreCourseGetCategoriesResponseInnerDict', {
+    'coursecount': Optional[int],
+    'depth': Optional[int],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'parent': Optional[int],
+    'path': Optional[str],
+    'sortorder': Optional[int],
+    'theme': NotRequired[Optional[str]],
+    'timemodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+    'visibleold': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetContentsParametersOptionsInnerDict = TypedDict('CoreCourseGetContentsParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCourseGetContentsResponseInnerDict = TypedDict('CoreCourseGetContentsResponseInnerDict', {
+    'availabilityinfo': NotRequired[Optional[str]],
+    'component': NotRequired[Optional[str]],
+    'hiddenbynumsections': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'itemid': NotRequired[Optional[int]],
+    'modules': List['CoreCourseGetContentsResponseInnerModulesInnerDict'],
+    'name': Optional[str],
+    'section': NotRequired[Optional[int]],
+    'summary': Optional[str],
+    'summaryformat': Optional[int],
+    'uservisible': NotRequired[Optional[bool]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerDict', {
+    'activitybadge': NotRequired[Optional['CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeDict']],
+    'afterlink': NotRequired[Optional[str]],
+    'availability': NotRequired[Optional[str]],
+    'availabilityinfo': NotRequired[Optional[str]],
+    'branded': NotRequired[Optional[bool]],
+    'completion': NotRequired[Optional[int]],
+    'completiondata': NotRequired[Optional['CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDict']],
+    'contents': NotRequired[Optional[List['CoreCourseGetContentsResponseInnerModulesInnerContentsInnerDict']]],
+    'contentsinfo': NotRequired[Optional['CoreCourseGetContentsResponseInnerModulesInnerContentsinfoDict']],
+    'contextid': NotRequired[Optional[int]],
+    'customdata': NotRequired[Optional[str]],
+    'dates': NotRequired[Optional[List['CoreCourseGetContentsResponseInnerModulesInnerDatesInnerDict']]],
+    'description': NotRequired[Optional[str]],
+    'downloadcontent': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'indent': Optional[int],
+    'instance': NotRequired[Optional[int]],
+    'modicon': Optional[str],
+    'modname': Optional[str],
+    'modplural': Optional[str],
+    'name': Optional[str],
+    'noviewlink': NotRequired[Optional[bool]],
+    'onclick': NotRequired[Optional[str]],
+    'purpose': Optional[str],
+    'url': NotRequired[Optional[str]],
+    'uservisible': NotRequired[Optional[bool]],
+    'visible': NotRequired[Optional[int]],
+    'visibleoncoursepage': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeDict = Any
+
+
+CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfDict', {
+    'badgecontent': NotRequired[Optional[str]],
+    'badgeelementid': NotRequired[Optional[str]],
+    'badgeextraattributes': NotRequired[Optional[List['CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfBadgeextraattributesInnerDict']]],
+    'badgestyle': NotRequired[Optional[str]],
+    'badgeurl': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfBadgeextraattributesInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfBadgeextraattributesInnerDict', {
+    'name': NotRequired[Optional[str]],
+    'value': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDict', {
+    'details': List['CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerDict'],
+    'hascompletion': bool,
+    'isautomatic': bool,
+    'isoverallcomplete': NotRequired[Optional[bool]],
+    'istrackeduser': bool,
+    'overrideby': Optional[int],
+    'state': int,
+    'timecompleted': int,
+    'uservisible': bool,
+    'valueused': bool,
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerDict', {
+    'rulename': str,
+    'rulevalue': 'CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerRulevalueDict',
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerRulevalueDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerRulevalueDict', {
+    'description': str,
+    'status': int,
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerContentsInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerContentsInnerDict', {
+    'author': Optional[str],
+    'content': NotRequired[Optional[str]],
+    'filename': Optional[str],
+    'filepath': Optional[str],
+    'filesize': Optional[int],
+    'fileurl': NotRequired[Optional[str]],
+    'isexternalfile': NotRequired[Optional[bool]],
+    'license': Optional[str],
+    'mimetype': NotRequired[Optional[str]],
+    'repositorytype': NotRequired[Optional[str]],
+    'sortorder': Optional[int],
+    'tags': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict']]],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'type': Optional[str],
+    'userid': Optional[int],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerContentsinfoDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerContentsinfoDict', {
+    'filescount': Optional[int],
+    'filessize': Optional[int],
+    'lastmodified': Optional[int],
+    'mimetypes': List[str],
+    'repositorytype': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerDatesInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerDatesInnerDict', {
+    'dataid': NotRequired[Optional[str]],
+    'label': Optional[str],
+    'relativeto': NotRequired[Optional[int]],
+    'timestamp': Optional[int],
+})
+
+
+CoreCourseGetCourseContentItemsResponseDict = TypedDict('CoreCourseGetCourseContentItemsResponseDict', {
+    'content_items': List['CoreCourseGetCourseContentItemsResponseContentItemsInnerDict'],
+})
+
+
+CoreCourseGetCourseContentItemsResponseContentItemsInnerDict = TypedDict('CoreCourseGetCourseContentItemsResponseContentItemsInnerDict', {
+    'archetype': str,
+    'branded': bool,
+    'componentname': str,
+    'favourite': bool,
+    'help': str,
+    'icon': str,
+    'id': int,
+    'legacyitem': bool,
+    'link': str,
+    'name': str,
+    'purpose': str,
+    'recommended': bool,
+    'title': str,
+})
+
+
+CoreCourseGetCourseModuleByInstanceResponseDict = TypedDict('CoreCourseGetCourseModuleByInstanceResponseDict', {
+    'cm': 'CoreCourseGetCourseModuleByInstanceResponseCmDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseGetCourseModuleByInstanceResponseCmDict = TypedDict('CoreCourseGetCourseModuleByInstanceResponseCmDict', {
+    'added': NotRequired[Optional[int]],
+    'advancedgrading': NotRequired[Optional[List['CoreCourseGetCourseModuleByInstanceResponseCmAdvancedgradingInnerDict']]],
+    'availability': NotRequired[Optional[str]],
+    'completion': Optional[int],
+    'completionexpected': NotRequired[Optional[int]],
+    'completiongradeitemnumber': NotRequired[Optional[int]],
+    'completionpassgrade': NotRequired[Optional[int]],
+    'completionview': NotRequired[Optional[int]],
+    'course': Optional[int],
+    'downloadcontent': NotRequired[Optional[int]],
+    'grade': NotRequired[Optional[float]],
+    'gradecat': NotRequired[Optional[int]],
+    'gradepass': NotRequired[Optional[str]],
+    'groupingid': Optional[int],
+    'groupmode': Optional[int],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'indent': NotRequired[Optional[int]],
+    'instance': Optional[int],
+    'modname': Optional[str],
+    'module': Optional[int],
+    'name': Optional[str],
+    'outcomes': NotRequired[Optional[List['CoreCourseGetCourseModuleByInstanceResponseCmOutcomesInnerDict']]],
+    'scale': NotRequired[Optional[str]],
+    'score': NotRequired[Optional[int]],
+    'section': Optional[int],
+    'sectionnum': Optional[int],
+    'showdescription': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+    'visibleold': NotRequired[Optional[int]],
+    'visibleoncoursepage': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetCourseModuleByInstanceResponseCmAdvancedgradingInnerDict = TypedDict('CoreCourseGetCourseModuleByInstanceResponseCmAdvancedgradingInnerDict', {
+    'area': Optional[str],
+    'method': Optional[str],
+})
+
+
+CoreCourseGetCourseModuleByInstanceResponseCmOutcomesInnerDict = TypedDict('CoreCourseGetCourseModuleByInstanceResponseCmOutcomesInnerDict', {
+    'id': Optional[str],
+    'name': Optional[str],
+    'scale': Optional[str],
+})
+
+
+CoreCourseGetCourseModuleResponseDict = TypedDict('CoreCourseGetCourseModuleResponseDict', {
+    'cm': 'CoreCourseGetCourseModuleByInstanceResponseCmDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseGetCoursesByFieldResponseDict = TypedDict('CoreCourseGetCoursesByFieldResponseDict', {
+    'courses': List['CoreCourseGetCoursesByFieldResponseCoursesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseGetCoursesByFieldResponseCoursesInnerDict = TypedDict('CoreCourseGetCoursesByFieldResponseCoursesInnerDict', {
+    'cacherev': NotRequired[Optional[int]],
+    'calendartype': NotRequired[Optional[str]],
+    'categoryid': Optional[int],
+    'categoryname': Optional[str],
+    'communicationroomname': NotRequired[Optional[str]],
+    'communicationroomurl': NotRequired[Optional[str]],
+    'completionnotify': NotRequired[Optional[int]],
+    'contacts': List['CoreCourseGetCoursesByFieldResponseCoursesInnerContactsInnerDict'],
+    'courseformatoptions': NotRequired[Optional[List['CoreCourseGetCoursesByFieldResponseCoursesInnerCourseformatoptionsInnerDict']]],
+    'courseimage': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict']]],
+    'defaultgroupingid': NotRequired[Optional[int]],
+    'displayname': Optional[str],
+    'enablecompletion': NotRequired[Optional[int]],
+    'enddate': NotRequired[Optional[int]],
+    'enrollmentmethods': List[str],
+    'filters': NotRequired[Optional[List['CoreCourseGetCoursesByFieldResponseCoursesInnerFiltersInnerDict']]],
+    'format': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'groupmode': NotRequired[Optional[int]],
+    'groupmodeforce': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'legacyfiles': NotRequired[Optional[int]],
+    'marker': NotRequired[Optional[int]],
+    'maxbytes': NotRequired[Optional[int]],
+    'newsitems': NotRequired[Optional[int]],
+    'overviewfiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'requested': NotRequired[Optional[int]],
+    'shortname': Optional[str],
+    'showactivitydates': Optional[bool],
+    'showcompletionconditions': Optional[bool],
+    'showgrades': NotRequired[Optional[int]],
+    'showreports': NotRequired[Optional[int]],
+    'sortorder': NotRequired[Optional[int]],
+    'startdate': NotRequired[Optional[int]],
+    'summary': Optional[str],
+    'summaryfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'summaryformat': Optional[int],
+    'theme': NotRequired[Optional[str]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetCoursesByFieldResponseCoursesInnerContactsInnerDict = TypedDict('CoreCourseGetCoursesByFieldResponseCoursesInnerContactsInnerDict', {
+    'fullname': Optional[str],
+    'id': Optional[int],
+})
+
+
+CoreCourseGetCoursesByFieldResponseCoursesInnerCourseformatoptionsInnerDict = TypedDict('CoreCourseGetCoursesByFieldResponseCoursesInnerCourseformatoptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCourseGetCoursesByFieldResponseCoursesInnerFiltersInnerDict = TypedDict('CoreCourseGetCoursesByFieldResponseCoursesInnerFiltersInnerDict', {
+    'filter': Optional[str],
+    'inheritedstate': Optional[int],
+    'localstate': Optional[int],
+})
+
+
+CoreCourseGetCoursesParametersOptionsDict = TypedDict('CoreCourseGetCoursesParametersOptionsDict', {
+    'ids': NotRequired[Optional[List[int]]],
+})
+
+
+CoreCourseGetCoursesResponseInnerDict = TypedDict('CoreCourseGetCoursesResponseInnerDict', {
+    'categoryid': Optional[int],
+    'categorysortorder': NotRequired[Optional[int]],
+    'completionnotify': NotRequired[Optional[int]],
+    'courseformatoptions': NotRequired[Optional[List['CoreCourseCreateCoursesParametersCoursesInnerCourseformatoptionsInnerDict']]],
+    'customfields': NotRequired[Optional[List['CoreCourseGetCoursesResponseInnerCustomfieldsInnerDict']]],
+    'defaultgroupingid': NotRequired[Optional[int]],
+    'displayname': Optional[str],
+    'enablecompletion': NotRequired[Optional[int]],
+    'enddate': Optional[int],
+    'forcetheme': NotRequired[Optional[str]],
+    'format': Optional[str],
+    'fullname': Optional[str],
+    'groupmode': NotRequired[Optional[int]],
+    'groupmodeforce': NotRequired[Optional[int]],
+    'hiddensections': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'maxbytes': NotRequired[Optional[int]],
+    'newsitems': NotRequired[Optional[int]],
+    'numsections': NotRequired[Optional[int]],
+    'shortname': Optional[str],
+    'showactivitydates': Optional[bool],
+    'showcompletionconditions': Optional[bool],
+    'showgrades': NotRequired[Optional[int]],
+    'showreports': NotRequired[Optional[int]],
+    'startdate': Optional[int],
+    'summary': Optional[str],
+    'summaryformat': Optional[int],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetCoursesResponseInnerCustomfieldsInnerDict = TypedDict('CoreCourseGetCoursesResponseInnerCustomfieldsInnerDict', {
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+    'valueraw': Optional[str],
+})
+
+
+CoreCourseGetEnrolledCoursesByTimelineClassificationResponseDict = TypedDict('CoreCourseGetEnrolledCoursesByTimelineClassificationResponseDict', {
+    'courses': List['BlockStarredcoursesGetStarredCoursesResponseInnerDict'],
+    'nextoffset': Optional[int],
+})
+
+
+CoreCourseGetEnrolledCoursesWithActionEventsByTimelineClassificationResponseDict = TypedDict('CoreCourseGetEnrolledCoursesWithActionEventsByTimelineClassificationResponseDict', {
+    'courses': List['BlockStarredcoursesGetStarredCoursesResponseInnerDict'],
+    'morecoursesavailable': Optional[bool],
+    'nextoffset': Optional[int],
+})
+
+
+CoreCourseGetEnrolledUsersByCmidResponseDict = TypedDict('CoreCourseGetEnrolledUsersByCmidResponseDict', {
+    'users': List['CoreCourseGetEnrolledUsersByCmidResponseUsersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseGetEnrolledUsersByCmidResponseUsersInnerDict = TypedDict('CoreCourseGetEnrolledUsersByCmidResponseUsersInnerDict', {
+    'firstname': NotRequired[Optional[str]],
+    'fullname': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'lastname': NotRequired[Optional[str]],
+    'profileimage': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetUpdatesSinceResponseDict = TypedDict('CoreCourseGetUpdatesSinceResponseDict', {
+    'instances': List['CoreCourseCheckUpdatesResponseInstancesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseGetUserAdministrationOptionsResponseDict = TypedDict('CoreCourseGetUserAdministrationOptionsResponseDict', {
+    'courses': List['CoreCourseGetUserAdministrationOptionsResponseCoursesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseGetUserAdministrationOptionsResponseCoursesInnerDict = TypedDict('CoreCourseGetUserAdministrationOptionsResponseCoursesInnerDict', {
+    'id': Optional[int],
+    'options': List['CoreCourseGetUserAdministrationOptionsResponseCoursesInnerOptionsInnerDict'],
+})
+
+
+CoreCourseGetUserAdministrationOptionsResponseCoursesInnerOptionsInnerDict = TypedDict('CoreCourseGetUserAdministrationOptionsResponseCoursesInnerOptionsInnerDict', {
+    'available': Optional[bool],
+    'name': Optional[str],
+})
+
+
+CoreCourseGetUserNavigationOptionsResponseDict = TypedDict('CoreCourseGetUserNavigationOptionsResponseDict', {
+    'courses': List['CoreCourseGetUserAdministrationOptionsResponseCoursesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseImportCourseParametersOptionsInnerDict = TypedDict('CoreCourseImportCourseParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCourseRemoveContentItemFromUserFavouritesResponseDict = TypedDict('CoreCourseRemoveContentItemFromUserFavouritesResponseDict', {
+    'archetype': str,
+    'branded': bool,
+    'componentname': str,
+    'favourite': bool,
+    'help': str,
+    'icon': str,
+    'id': int,
+    'legacyitem': bool,
+    'link': str,
+    'name': str,
+    'purpose': str,
+    'recommended': bool,
+    'title': str,
+})
+
+
+CoreCourseSearchCoursesResponseDict = TypedDict('CoreCourseSearchCoursesResponseDict', {
+    'courses': List['CoreCourseSearchCoursesResponseCoursesInnerDict'],
+    'total': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseSearchCoursesResponseCoursesInnerDict = TypedDict('CoreCourseSearchCoursesResponseCoursesInnerDict', {
+    'categoryid': Optional[int],
+    'categoryname': Optional[str],
+    'contacts': List['CoreCourseGetCoursesByFieldResponseCoursesInnerContactsInnerDict'],
+    'courseimage': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict']]],
+    'displayname': Optional[str],
+    'enrollmentmethods': List[str],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'overviewfiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'shortname': Optional[str],
+    'showactivitydates': Optional[bool],
+    'showcompletionconditions': Optional[bool],
+    'sortorder': NotRequired[Optional[int]],
+    'summary': Optional[str],
+    'summaryfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'summaryformat': Optional[int],
+})
+
+
+CoreCourseSetFavouriteCoursesParametersCoursesInnerDict = TypedDict('CoreCourseSetFavouriteCoursesParametersCoursesInnerDict', {
+    'favourite': Optional[bool],
+    'id': Optional[int],
+})
+
+
+CoreCourseSetFavouriteCoursesResponseDict = TypedDict('CoreCourseSetFavouriteCoursesResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseToggleActivityRecommendationResponseDict = TypedDict('CoreCourseToggleActivityRecommendationResponseDict', {
+    'area': Optional[str],
+    'id': Optional[int],
+    'status': Optional[bool],
+})
+
+
+CoreCourseUpdateCategoriesParametersCategoriesInnerDict = TypedDict('CoreCourseUpdateCategoriesParametersCategoriesInnerDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'name': NotRequired[Optional[str]],
+    'parent': NotRequired[Optional[int]],
+    'theme': NotRequired[Optional[str]],
+})
+
+
+CoreCourseUpdateCoursesParametersCoursesInnerDict = TypedDict('CoreCourseUpdateCoursesParametersCoursesInnerDict', {
+    'categoryid': NotRequired[Optional[int]],
+    'completionnotify': NotRequired[Optional[int]],
+    'courseformatoptions': NotRequired[Optional[List['CoreCourseCreateCoursesParametersCoursesInnerCourseformatoptionsInnerDict']]],
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'defaultgroupingid': NotRequired[Optional[int]],
+    'enablecompletion': NotRequired[Optional[int]],
+    'enddate': NotRequired[Optional[int]],
+    'forcetheme': NotRequired[Optional[str]],
+    'format': NotRequired[Optional[str]],
+    'fullname': NotRequired[Optional[str]],
+    'groupmode': NotRequired[Optional[int]],
+    'groupmodeforce': NotRequired[Optional[int]],
+    'hiddensections': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'maxbytes': NotRequired[Optional[int]],
+    'newsitems': NotRequired[Optional[int]],
+    'numsections': NotRequired[Optional[int]],
+    'shortname': NotRequired[Optional[str]],
+    'showgrades': NotRequired[Optional[int]],
+    'showreports': NotRequired[Optional[int]],
+    'startdate': NotRequired[Optional[int]],
+    'summary': NotRequired[Optional[str]],
+    'summaryformat': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreCourseUpdateCoursesResponseDict = TypedDict('CoreCourseUpdateCoursesResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseViewCourseResponseDict = TypedDict('CoreCourseViewCourseResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreCourseformatFileHandlersResponseInnerDict = TypedDict('CoreCourseformatFileHandlersResponseInnerDict', {
+    'extension': Optional[str],
+    'message': Optional[str],
+    'module': Optional[str],
+})
+
+
+CoreCustomfieldReloadTemplateResponseDict = TypedDict('CoreCustomfieldReloadTemplateResponseDict', {
+    'area': Optional[str],
+    'categories': List['CoreCustomfieldReloadTemplateResponseCategoriesInnerDict'],
+    'component': Optional[str],
+    'itemid': Optional[int],
+    'usescategories': Optional[bool],
+})
+
+
+CoreCustomfieldReloadTemplateResponseCategoriesInnerDict = TypedDict('CoreCustomfieldReloadTemplateResponseCategoriesInnerDict', {
+    'addfieldmenu': Optional[str],
+    'fields': NotRequired[Optional[List['CoreCustomfieldReloadTemplateResponseCategoriesInnerFieldsInnerDict']]],
+    'id': Optional[int],
+    'nameeditable': Optional[str],
+})
+
+
+CoreCustomfieldReloadTemplateResponseCategoriesInnerFieldsInnerDict = TypedDict('CoreCustomfieldReloadTemplateResponseCategoriesInnerFieldsInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'type': Optional[str],
+})
+
+
+CoreDynamicTabsGetContentResponseDict = TypedDict('CoreDynamicTabsGetContentResponseDict', {
+    'content': Optional[str],
+    'javascript': Optional[str],
+    'template': Optional[str],
+})
+
+
+CoreEnrolGetCourseEnrolmentMethodsResponseInnerDict = TypedDict('CoreEnrolGetCourseEnrolmentMethodsResponseInnerDict', {
+    'courseid': Optional[int],
+    'id': Optional[int],
+    'name': Optional[str],
+    'status': Optional[str],
+    'type': Optional[str],
+    'wsfunction': NotRequired[Optional[str]],
+})
+
+
+CoreEnrolGetEnrolledUsersParametersOptionsInnerDict = TypedDict('CoreEnrolGetEnrolledUsersParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreEnrolGetEnrolledUsersResponseInnerDict = TypedDict('CoreEnrolGetEnrolledUsersResponseInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'email': NotRequired[Optional[str]],
+    'enrolledcourses': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerEnrolledcoursesInnerDict']]],
+    'firstaccess': NotRequired[Optional[int]],
+    'firstname': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'groups': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerGroupsInnerDict']]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'lastcourseaccess': NotRequired[Optional[int]],
+    'lastname': NotRequired[Optional[str]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerPreferencesInnerDict']]],
+    'profileimageurl': NotRequired[Optional[str]],
+    'profileimageurlsmall': NotRequired[Optional[str]],
+    'roles': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerRolesInnerDict']]],
+    'username': NotRequired[Optional[str]],
+})
+
+
+CoreEnrolGetEnrolledUsersResponseInnerCustomfieldsInnerDict = TypedDict('CoreEnrolGetEnrolledUsersResponseInnerCustomfieldsInnerDict', {
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreEnrolGetEnrolledUsersResponseInnerEnrolledcoursesInnerDict = TypedDict('CoreEnrolGetEnrolledUsersResponseInnerEnrolledcoursesInnerDict', {
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'shortname': Optional[str],
+})
+
+
+CoreEnrolGetEnrolledUsersResponseInnerGroupsInnerDict = TypedDict('CoreEnrolGetEnrolledUsersResponseInnerGroupsInnerDict', {
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+CoreEnrolGetEnrolledUsersResponseInnerPreferencesInnerDict = TypedDict('CoreEnrolGetEnrolledUsersResponseInnerPreferencesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreEnrolGetEnrolledUsersResponseInnerRolesInnerDict = TypedDict('CoreEnrolGetEnrolledUsersResponseInnerRolesInnerDict', {
+    'name': Optional[str],
+    'roleid': Optional[int],
+    'shortname': Optional[str],
+    'sortorder': Optional[int],
+})
+
+
+CoreEnrolGetEnrolledUsersWithCapabilityParametersCoursecapabilitiesInnerDict = TypedDict('CoreEnrolGetEnrolledUsersWithCapabilityParametersCoursecapabilitiesInnerDict', {
+    'capabilities': List[str],
+    'courseid': Optional[int],
+})
+
+
+CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerDict = TypedDict('CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerDict', {
+    'capability': Optional[str],
+    'courseid': Optional[int],
+    'users': List['CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerDict'],
+})
+
+
+CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerDict = TypedDict('CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'email': NotRequired[Optional[str]],
+    'enrolledcourses': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerEnrolledcoursesInnerDict']]],
+    'firstaccess': NotRequired[Optional[int]],
+    'firstname': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'groups': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerGroupsInnerDict']]],
+    'id': Optional[int],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'lastcourseaccess': NotRequired[Optional[int]],
+    'lastname': NotRequired[Optional[str]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerPreferencesInnerDict']]],
+    'profileimageurl': NotRequired[Optional[str]],
+    'profileimageurlsmall': NotRequired[Optional[str]],
+    'roles': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerRolesInnerDict']]],
+    'username': NotRequired[Optional[str]],
+})
+
+
+CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerCustomfieldsInnerDict = TypedDict('CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerCustomfieldsInnerDict', {
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerGroupsInnerDict = TypedDict('CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerGroupsInnerDict', {
+    'description': Optional[str],
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+CoreEnrolGetPotentialUsersResponseInnerDict = TypedDict('CoreEnrolGetPotentialUsersResponseInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'auth': NotRequired[Optional[str]],
+    'calendartype': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'confirmed': NotRequired[Optional[bool]],
+    'country': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreEnrolGetPotentialUsersResponseInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'email': NotRequired[Optional[str]],
+    'firstaccess': NotRequired[Optional[int]],
+    'firstname': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'lastname': NotRequired[Optional[str]],
+    'mailformat': NotRequired[Optional[int]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['CoreEnrolGetPotentialUsersResponseInnerPreferencesInnerDict']]],
+    'profileimageurl': Optional[str],
+    'profileimageurlsmall': Optional[str],
+    'suspended': NotRequired[Optional[bool]],
+    'theme': NotRequired[Optional[str]],
+    'timezone': NotRequired[Optional[str]],
+    'trackforums': NotRequired[Optional[int]],
+    'username': NotRequired[Optional[str]],
+})
+
+
+CoreEnrolGetPotentialUsersResponseInnerCustomfieldsInnerDict = TypedDict('CoreEnrolGetPotentialUsersResponseInnerCustomfieldsInnerDict', {
+    'displayvalue': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreEnrolGetPotentialUsersResponseInnerPreferencesInnerDict = TypedDict('CoreEnrolGetPotentialUsersResponseInnerPreferencesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreEnrolGetUsersCoursesResponseInnerDict = TypedDict('CoreEnrolGetUsersCoursesResponseInnerDict', {
+    'category': NotRequired[Optional[int]],
+    'completed': NotRequired[Optional[bool]],
+    'completionhascriteria': NotRequired[Optional[bool]],
+    'completionusertracked': NotRequired[Optional[bool]],
+    'courseimage': NotRequired[Optional[str]],
+    'displayname': NotRequired[Optional[str]],
+    'enablecompletion': NotRequired[Optional[bool]],
+    'enddate': NotRequired[Optional[int]],
+    'enrolledusercount': NotRequired[Optional[int]],
+    'format': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'hidden': NotRequired[Optional[bool]],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'isfavourite': NotRequired[Optional[bool]],
+    'lang': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'marker': NotRequired[Optional[int]],
+    'overviewfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'progress': NotRequired[Optional[float]],
+    'shortname': Optional[str],
+    'showactivitydates': Optional[bool],
+    'showcompletionconditions': Optional[bool],
+    'showgrades': NotRequired[Optional[bool]],
+    'startdate': NotRequired[Optional[int]],
+    'summary': NotRequired[Optional[str]],
+    'summaryformat': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'visible': Optional[int],
+})
+
+
+CoreEnrolSubmitUserEnrolmentFormResponseDict = TypedDict('CoreEnrolSubmitUserEnrolmentFormResponseDict', {
+    'result': Optional[bool],
+    'validationerror': NotRequired[Optional[bool]],
+})
+
+
+CoreEnrolUnenrolUserEnrolmentResponseDict = TypedDict('CoreEnrolUnenrolUserEnrolmentResponseDict', {
+    'errors': List['CoreEnrolUnenrolUserEnrolmentResponseErrorsInnerDict'],
+    'result': Optional[bool],
+})
+
+
+CoreEnrolUnenrolUserEnrolmentResponseErrorsInnerDict = TypedDict('CoreEnrolUnenrolUserEnrolmentResponseErrorsInnerDict', {
+    'key': Optional[str],
+    'message': Optional[str],
+})
+
+
+CoreFetchNotificationsParametersDict = TypedDict('CoreFetchNotificationsParametersDict', {
+    'contextid': Optional[int],
+})
+
+
+CoreFetchNotificationsResponseInnerDict = TypedDict('CoreFetchNotificationsResponseInnerDict', {
+    'template': Optional[str],
+    'variables': 'CoreFetchNotificationsResponseInnerVariablesDict',
+})
+
+
+CoreFetchNotificationsResponseInnerVariablesDict = TypedDict('CoreFetchNotificationsResponseInnerVariablesDict', {
+    'announce': Optional[str],
+    'closebutton': Optional[str],
+    'extraclasses': Optional[str],
+    'message': Optional[str],
+})
+
+
+CoreFilesDeleteDraftFilesParametersFilesInnerDict = TypedDict('CoreFilesDeleteDraftFilesParametersFilesInnerDict', {
+    'filename': Optional[str],
+    'filepath': Optional[str],
+})
+
+
+CoreFilesDeleteDraftFilesResponseDict = TypedDict('CoreFilesDeleteDraftFilesResponseDict', {
+    'parentpaths': List[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreFilesGetFilesResponseDict = TypedDict('CoreFilesGetFilesResponseDict', {
+    'files': List['CoreFilesGetFilesResponseFilesInnerDict'],
+    'parents': List['CoreFilesGetFilesResponseParentsInnerDict'],
+})
+
+
+CoreFilesGetFilesResponseFilesInnerDict = TypedDict('CoreFilesGetFilesResponseFilesInnerDict', {
+    'author': NotRequired[Optional[str]],
+    'component': Optional[str],
+    'contextid': Optional[int],
+    'filearea': Optional[str],
+    'filename': Optional[str],
+    'filepath': Optional[str],
+    'filesize': NotRequired[Optional[int]],
+    'isdir': Optional[bool],
+    'itemid': Optional[int],
+    'license': NotRequired[Optional[str]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+    'url': Optional[str],
+})
+
+
+CoreFilesGetFilesResponseParentsInnerDict = TypedDict('CoreFilesGetFilesResponseParentsInnerDict', {
+    'component': Optional[str],
+    'contextid': Optional[int],
+    'filearea': Optional[str],
+    'filename': Optional[str],
+    'filepath': Optional[str],
+    'itemid': Optional[int],
+})
+
+
+CoreFilesGetUnusedDraftItemidResponseDict = TypedDict('CoreFilesGetUnusedDraftItemidResponseDict', {
+    'component': Optional[str],
+    'contextid': Optional[int],
+    'filearea': Optional[str],
+    'itemid': Optional[int],
+    'userid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreFilesUploadResponseDict = TypedDict('CoreFilesUploadResponseDict', {
+    'component': Optional[str],
+    'contextid': Optional[int],
+    'filearea': Optional[str],
+    'filename': Optional[str],
+    'filepath': Optional[str],
+    'itemid': Optional[int],
+    'url': Optional[str],
+})
+
+
+CoreFiltersGetAllStatesResponseDict = TypedDict('CoreFiltersGetAllStatesResponseDict', {
+    'filters': List['CoreFiltersGetAllStatesResponseFiltersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreFiltersGetAllStatesResponseFiltersInnerDict = TypedDict('CoreFiltersGetAllStatesResponseFiltersInnerDict', {
+    'contextid': Optional[int],
+    'contextlevel': Optional[str],
+    'filter': Optional[str],
+    'instanceid': Optional[int],
+    'sortorder': Optional[int],
+    'state': Optional[int],
+})
+
+
+CoreFiltersGetAvailableInContextParametersContextsInnerDict = TypedDict('CoreFiltersGetAvailableInContextParametersContextsInnerDict', {
+    'contextlevel': Optional[str],
+    'instanceid': Optional[int],
+})
+
+
+CoreFiltersGetAvailableInContextResponseDict = TypedDict('CoreFiltersGetAvailableInContextResponseDict', {
+    'filters': List['CoreFiltersGetAvailableInContextResponseFiltersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreFiltersGetAvailableInContextResponseFiltersInnerDict = TypedDict('CoreFiltersGetAvailableInContextResponseFiltersInnerDict', {
+    'contextid': Optional[int],
+    'contextlevel': Optional[str],
+    'filter': Optional[str],
+    'inheritedstate': Optional[int],
+    'instanceid': Optional[int],
+    'localstate': Optional[int],
+})
+
+
+CoreFormDynamicFormResponseDict = TypedDict('CoreFormDynamicFormResponseDict', {
+    'data': NotRequired[Optional[str]],
+    'html': NotRequired[Optional[str]],
+    'javascript': NotRequired[Optional[str]],
+    'submitted': Optional[bool],
+})
+
+
+CoreFormGetFiletypesBrowserDataParametersDict = TypedDict('CoreFormGetFiletypesBrowserDataParametersDict', {
+    'allowall': NotRequired[Optional[bool]],
+    'current': NotRequired[Optional[str]],
+    'onlytypes': NotRequired[Optional[str]],
+})
+
+
+CoreFormGetFiletypesBrowserDataResponseDict = TypedDict('CoreFormGetFiletypesBrowserDataResponseDict', {
+    'groups': List['CoreFormGetFiletypesBrowserDataResponseGroupsInnerDict'],
+})
+
+
+CoreFormGetFiletypesBrowserDataResponseGroupsInnerDict = TypedDict('CoreFormGetFiletypesBrowserDataResponseGroupsInnerDict', {
+    'expanded': Optional[bool],
+    'ext': Optional[str],
+    'key': Optional[str],
+    'name': Optional[str],
+    'selectable': Optional[bool],
+    'selected': Optional[bool],
+    'types': List['CoreFormGetFiletypesBrowserDataResponseGroupsInnerTypesInnerDict'],
+})
+
+
+CoreFormGetFiletypesBrowserDataResponseGroupsInnerTypesInnerDict = TypedDict('CoreFormGetFiletypesBrowserDataResponseGroupsInnerTypesInnerDict', {
+    'ext': Optional[str],
+    'key': Optional[str],
+    'name': Optional[str],
+    'selected': Optional[bool],
+})
+
+
+CoreGetComponentStringsParametersDict = TypedDict('CoreGetComponentStringsParametersDict', {
+    'component': Optional[str],
+    'lang': NotRequired[Optional[str]],
+})
+
+
+CoreGetComponentStringsResponseInnerDict = TypedDict('CoreGetComponentStringsResponseInnerDict', {
+    'string': Optional[str],
+    'stringid': Optional[str],
+})
+
+
+CoreGetFragmentParametersArgsInnerDict = TypedDict('CoreGetFragmentParametersArgsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreGetFragmentResponseDict = TypedDict('CoreGetFragmentResponseDict', {
+    'html': Optional[str],
+    'javascript': Optional[str],
+})
+
+
+CoreGetStringParametersDict = TypedDict('CoreGetStringParametersDict', {
+    'component': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'stringid': Optional[str],
+    'stringparams': NotRequired[Optional[List['CoreGetStringParametersStringparamsInnerDict']]],
+})
+
+
+CoreGetStringParametersStringparamsInnerDict = TypedDict('CoreGetStringParametersStringparamsInnerDict', {
+    'name': NotRequired[Optional[str]],
+    'value': Optional[str],
+})
+
+
+CoreGetStringsParametersDict = TypedDict('CoreGetStringsParametersDict', {
+    'strings': List['CoreGetStringsParametersStringsInnerDict'],
+})
+
+
+CoreGetStringsParametersStringsInnerDict = TypedDict('CoreGetStringsParametersStringsInnerDict', {
+    'component': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'stringid': Optional[str],
+    'stringparams': NotRequired[Optional[List['CoreGetStringsParametersStringsInnerStringparamsInnerDict']]],
+})
+
+
+CoreGetStringsParametersStringsInnerStringparamsInnerDict = TypedDict('CoreGetStringsParametersStringsInnerStringparamsInnerDict', {
+    'name': NotRequired[Optional[str]],
+    'value': Optional[str],
+})
+
+
+CoreGetStringsResponseInnerDict = TypedDict('CoreGetStringsResponseInnerDict', {
+    'component': Optional[str],
+    'lang': Optional[str],
+    'string': Optional[str],
+    'stringid': Optional[str],
+})
+
+
+CoreGetUserDatesParametersTimestampsInnerDict = TypedDict('CoreGetUserDatesParametersTimestampsInnerDict', {
+    'fixday': NotRequired[Optional[int]],
+    'fixhour': NotRequired[Optional[int]],
+    'format': Optional[str],
+    'timestamp': Optional[int],
+    'type': NotRequired[Optional[str]],
+})
+
+
+CoreGetUserDatesResponseDict = TypedDict('CoreGetUserDatesResponseDict', {
+    'dates': List[str],
+})
+
+
+CoreGradesCreateGradecategoriesParametersCategoriesInnerDict = TypedDict('CoreGradesCreateGradecategoriesParametersCategoriesInnerDict', {
+    'fullname': Optional[str],
+    'options': NotRequired[Optional['CoreGradesCreateGradecategoriesParametersCategoriesInnerOptionsDict']],
+})
+
+
+CoreGradesCreateGradecategoriesParametersCategoriesInnerOptionsDict = TypedDict('CoreGradesCreateGradecategoriesParametersCategoriesInnerOptionsDict', {
+    'aggregateonlygraded': NotRequired[Optional[bool]],
+    'aggregateoutcomes': NotRequired[Optional[bool]],
+    'aggregation': NotRequired[Optional[int]],
+    'aggregationcoef2': NotRequired[Optional[str]],
+    'decimals': NotRequired[Optional[int]],
+    'display': NotRequired[Optional[int]],
+    'droplow': NotRequired[Optional[int]],
+    'grademax': NotRequired[Optional[int]],
+    'grademin': NotRequired[Optional[int]],
+    'gradepass': NotRequired[Optional[int]],
+    'gradetype': NotRequired[Optional[int]],
+    'hiddenuntil': NotRequired[Optional[int]],
+    'idnumber': NotRequired[Optional[str]],
+    'iteminfo': NotRequired[Optional[str]],
+    'itemname': NotRequired[Optional[str]],
+    'locktime': NotRequired[Optional[int]],
+    'parentcategoryid': NotRequired[Optional[int]],
+    'parentcategoryidnumber': NotRequired[Optional[str]],
+    'weightoverride': NotRequired[Optional[bool]],
+})
+
+
+CoreGradesCreateGradecategoriesResponseDict = TypedDict('CoreGradesCreateGradecategoriesResponseDict', {
+    'categoryids': List[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGetEnrolledUsersForSelectorResponseDict = TypedDict('CoreGradesGetEnrolledUsersForSelectorResponseDict', {
+    'users': List['CoreEnrolGetPotentialUsersResponseInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGetFeedbackResponseDict = TypedDict('CoreGradesGetFeedbackResponseDict', {
+    'additionalfield': Optional[str],
+    'feedbacktext': Optional[str],
+    'fullname': Optional[str],
+    'picture': Optional[str],
+    'title': Optional[str],
+})
+
+
+CoreGradesGetGradableUsersResponseDict = TypedDict('CoreGradesGetGradableUsersResponseDict', {
+    'users': List['CoreEnrolGetPotentialUsersResponseInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGetGradeitemsResponseDict = TypedDict('CoreGradesGetGradeitemsResponseDict', {
+    'gradeItems': List['CoreGradesGetGradeitemsResponseGradeItemsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGetGradeitemsResponseGradeItemsInnerDict = TypedDict('CoreGradesGetGradeitemsResponseGradeItemsInnerDict', {
+    'category': NotRequired[Optional[str]],
+    'id': Optional[str],
+    'itemname': Optional[str],
+})
+
+
+CoreGradesGetGroupsForSelectorResponseDict = TypedDict('CoreGradesGetGroupsForSelectorResponseDict', {
+    'groups': List['CoreGradesGetGroupsForSelectorResponseGroupsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGetGroupsForSelectorResponseGroupsInnerDict = TypedDict('CoreGradesGetGroupsForSelectorResponseGroupsInnerDict', {
+    'groupimageurl': NotRequired[Optional[str]],
+    'id': Optional[str],
+    'name': Optional[str],
+})
+
+
+CoreGradesGraderGradingpanelPointFetchResponseDict = TypedDict('CoreGradesGraderGradingpanelPointFetchResponseDict', {
+    'grade': 'CoreGradesGraderGradingpanelPointFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGraderGradingpanelPointFetchResponseGradeDict = TypedDict('CoreGradesGraderGradingpanelPointFetchResponseGradeDict', {
+    'grade': Optional[float],
+    'gradedby': Optional[str],
+    'maxgrade': Optional[str],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usergrade': Optional[str],
+})
+
+
+CoreGradesGraderGradingpanelPointStoreResponseDict = TypedDict('CoreGradesGraderGradingpanelPointStoreResponseDict', {
+    'grade': 'CoreGradesGraderGradingpanelPointFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGraderGradingpanelScaleFetchResponseDict = TypedDict('CoreGradesGraderGradingpanelScaleFetchResponseDict', {
+    'grade': 'CoreGradesGraderGradingpanelScaleFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesGraderGradingpanelScaleFetchResponseGradeDict = TypedDict('CoreGradesGraderGradingpanelScaleFetchResponseGradeDict', {
+    'gradedby': Optional[str],
+    'maxgrade': Optional[str],
+    'options': List['CoreGradesGraderGradingpanelScaleFetchResponseGradeOptionsInnerDict'],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usergrade': Optional[str],
+})
+
+
+CoreGradesGraderGradingpanelScaleFetchResponseGradeOptionsInnerDict = TypedDict('CoreGradesGraderGradingpanelScaleFetchResponseGradeOptionsInnerDict', {
+    'selected': Optional[bool],
+    'title': Optional[str],
+    'value': Optional[float],
+})
+
+
+CoreGradesGraderGradingpanelScaleStoreResponseDict = TypedDict('CoreGradesGraderGradingpanelScaleStoreResponseDict', {
+    'grade': 'CoreGradesGraderGradingpanelScaleFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradesUpdateGradesParametersGradesInnerDict = TypedDict('CoreGradesUpdateGradesParametersGradesInnerDict', {
+    'grade': Optional[float],
+    'str_feedback': NotRequired[Optional[str]],
+    'studentid': Optional[int],
+})
+
+
+CoreGradesUpdateGradesParametersItemdetailsDict = TypedDict('CoreGradesUpdateGradesParametersItemdetailsDict', {
+    'deleted': NotRequired[Optional[bool]],
+    'grademax': NotRequired[Optional[float]],
+    'grademin': NotRequired[Optional[float]],
+    'gradetype': NotRequired[Optional[int]],
+    'hidden': NotRequired[Optional[bool]],
+    'idnumber': NotRequired[Optional[int]],
+    'itemname': NotRequired[Optional[str]],
+    'multfactor': NotRequired[Optional[float]],
+    'plusfactor': NotRequired[Optional[float]],
+    'scaleid': NotRequired[Optional[int]],
+})
+
+
+CoreGradingGetDefinitionsResponseDict = TypedDict('CoreGradingGetDefinitionsResponseDict', {
+    'areas': List['CoreGradingGetDefinitionsResponseAreasInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDict', {
+    'activemethod': NotRequired[Optional[str]],
+    'areaname': Optional[str],
+    'cmid': Optional[int],
+    'component': Optional[str],
+    'contextid': Optional[int],
+    'definitions': List['CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerDict'],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerDict', {
+    'copiedfromid': NotRequired[Optional[int]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'guide': NotRequired[Optional['CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideDict']],
+    'id': NotRequired[Optional[int]],
+    'method': Optional[str],
+    'name': Optional[str],
+    'rubric': NotRequired[Optional['CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricDict']],
+    'status': Optional[int],
+    'timecopied': NotRequired[Optional[int]],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usercreated': Optional[int],
+    'usermodified': Optional[int],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideDict', {
+    'guide_comments': NotRequired[Optional[List['CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCommentsInnerDict']]],
+    'guide_criteria': NotRequired[Optional[List['CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCriteriaInnerDict']]],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCommentsInnerDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCommentsInnerDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'sortorder': NotRequired[Optional[int]],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCriteriaInnerDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerGuideGuideCriteriaInnerDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'descriptionmarkers': NotRequired[Optional[str]],
+    'descriptionmarkersformat': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'maxscore': Optional[float],
+    'shortname': Optional[str],
+    'sortorder': NotRequired[Optional[int]],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricDict', {
+    'rubric_criteria': NotRequired[Optional[List['CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricRubricCriteriaInnerDict']]],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricRubricCriteriaInnerDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricRubricCriteriaInnerDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'levels': NotRequired[Optional[List['CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricRubricCriteriaInnerLevelsInnerDict']]],
+    'sortorder': NotRequired[Optional[int]],
+})
+
+
+CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricRubricCriteriaInnerLevelsInnerDict = TypedDict('CoreGradingGetDefinitionsResponseAreasInnerDefinitionsInnerRubricRubricCriteriaInnerLevelsInnerDict', {
+    'definition': NotRequired[Optional[str]],
+    'definitionformat': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'score': NotRequired[Optional[float]],
+})
+
+
+CoreGradingGetGradingformInstancesResponseDict = TypedDict('CoreGradingGetGradingformInstancesResponseDict', {
+    'instances': List['CoreGradingGetGradingformInstancesResponseInstancesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGradingGetGradingformInstancesResponseInstancesInnerDict = TypedDict('CoreGradingGetGradingformInstancesResponseInstancesInnerDict', {
+    'feedback': NotRequired[Optional[str]],
+    'feedbackformat': NotRequired[Optional[int]],
+    'guide': NotRequired[Optional['CoreGradingGetGradingformInstancesResponseInstancesInnerGuideDict']],
+    'id': Optional[int],
+    'itemid': Optional[int],
+    'raterid': Optional[int],
+    'rawgrade': NotRequired[Optional[str]],
+    'rubric': NotRequired[Optional['CoreGradingGetGradingformInstancesResponseInstancesInnerRubricDict']],
+    'status': Optional[int],
+    'timemodified': Optional[int],
+})
+
+
+CoreGradingGetGradingformInstancesResponseInstancesInnerGuideDict = TypedDict('CoreGradingGetGradingformInstancesResponseInstancesInnerGuideDict', {
+    'criteria': NotRequired[Optional[List['CoreGradingGetGradingformInstancesResponseInstancesInnerGuideCriteriaInnerDict']]],
+})
+
+
+CoreGradingGetGradingformInstancesResponseInstancesInnerGuideCriteriaInnerDict = TypedDict('CoreGradingGetGradingformInstancesResponseInstancesInnerGuideCriteriaInnerDict', {
+    'criterionid': Optional[int],
+    'id': Optional[int],
+    'levelid': NotRequired[Optional[int]],
+    'remark': NotRequired[Optional[str]],
+    'remarkformat': NotRequired[Optional[int]],
+    'score': Optional[float],
+})
+
+
+CoreGradingGetGradingformInstancesResponseInstancesInnerRubricDict = TypedDict('CoreGradingGetGradingformInstancesResponseInstancesInnerRubricDict', {
+    'criteria': NotRequired[Optional[List['CoreGradingGetGradingformInstancesResponseInstancesInnerRubricCriteriaInnerDict']]],
+})
+
+
+CoreGradingGetGradingformInstancesResponseInstancesInnerRubricCriteriaInnerDict = TypedDict('CoreGradingGetGradingformInstancesResponseInstancesInnerRubricCriteriaInnerDict', {
+    'criterionid': Optional[int],
+    'id': Optional[int],
+    'levelid': NotRequired[Optional[int]],
+    'remark': NotRequired[Optional[str]],
+    'remarkformat': NotRequired[Optional[int]],
+})
+
+
+CoreGroupAddGroupMembersParametersMembersInnerDict = TypedDict('CoreGroupAddGroupMembersParametersMembersInnerDict', {
+    'groupid': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreGroupAssignGroupingParametersAssignmentsInnerDict = TypedDict('CoreGroupAssignGroupingParametersAssignmentsInnerDict', {
+    'groupid': Optional[int],
+    'groupingid': Optional[int],
+})
+
+
+CoreGroupCreateGroupingsParametersGroupingsInnerDict = TypedDict('CoreGroupCreateGroupingsParametersGroupingsInnerDict', {
+    'courseid': Optional[int],
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': NotRequired[Optional[int]],
+    'idnumber': NotRequired[Optional[str]],
+    'name': Optional[str],
+})
+
+
+CoreGroupCreateGroupingsResponseInnerDict = TypedDict('CoreGroupCreateGroupingsResponseInnerDict', {
+    'courseid': Optional[int],
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+})
+
+
+CoreGroupCreateGroupsParametersGroupsInnerDict = TypedDict('CoreGroupCreateGroupsParametersGroupsInnerDict', {
+    'courseid': Optional[int],
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': NotRequired[Optional[int]],
+    'enrolmentkey': NotRequired[Optional[str]],
+    'idnumber': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'participation': NotRequired[Optional[bool]],
+    'visibility': NotRequired[Optional[int]],
+})
+
+
+CoreGroupCreateGroupsResponseInnerDict = TypedDict('CoreGroupCreateGroupsResponseInnerDict', {
+    'courseid': Optional[int],
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'enrolmentkey': Optional[str],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'participation': Optional[bool],
+    'visibility': Optional[int],
+})
+
+
+CoreGroupGetActivityAllowedGroupsResponseDict = TypedDict('CoreGroupGetActivityAllowedGroupsResponseDict', {
+    'canaccessallgroups': NotRequired[Optional[bool]],
+    'groups': List['CoreGroupGetActivityAllowedGroupsResponseGroupsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGroupGetActivityAllowedGroupsResponseGroupsInnerDict = TypedDict('CoreGroupGetActivityAllowedGroupsResponseGroupsInnerDict', {
+    'courseid': NotRequired[Optional[int]],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+})
+
+
+CoreGroupGetActivityGroupmodeResponseDict = TypedDict('CoreGroupGetActivityGroupmodeResponseDict', {
+    'groupmode': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGroupGetCourseGroupingsResponseInnerDict = TypedDict('CoreGroupGetCourseGroupingsResponseInnerDict', {
+    'courseid': Optional[int],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+})
+
+
+CoreGroupGetCourseGroupsResponseInnerDict = TypedDict('CoreGroupGetCourseGroupsResponseInnerDict', {
+    'courseid': Optional[int],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'enrolmentkey': Optional[str],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'participation': Optional[bool],
+    'visibility': Optional[int],
+})
+
+
+CoreGroupGetCourseUserGroupsResponseDict = TypedDict('CoreGroupGetCourseUserGroupsResponseDict', {
+    'groups': List['CoreGroupGetActivityAllowedGroupsResponseGroupsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGroupGetGroupMembersResponseInnerDict = TypedDict('CoreGroupGetGroupMembersResponseInnerDict', {
+    'groupid': Optional[int],
+    'userids': List[int],
+})
+
+
+CoreGroupGetGroupingsResponseInnerDict = TypedDict('CoreGroupGetGroupingsResponseInnerDict', {
+    'courseid': Optional[int],
+    'customfields': NotRequired[Optional[List['CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'groups': NotRequired[Optional[List['CoreGroupGetGroupingsResponseInnerGroupsInnerDict']]],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+})
+
+
+CoreGroupGetGroupingsResponseInnerGroupsInnerDict = TypedDict('CoreGroupGetGroupingsResponseInnerGroupsInnerDict', {
+    'courseid': Optional[int],
+    'customfields': NotRequired[Optional[List['CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'enrolmentkey': Optional[str],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+})
+
+
+CoreGroupGetGroupsForSelectorResponseDict = TypedDict('CoreGroupGetGroupsForSelectorResponseDict', {
+    'groups': List['CoreGradesGetGroupsForSelectorResponseGroupsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreGroupGetGroupsResponseInnerDict = TypedDict('CoreGroupGetGroupsResponseInnerDict', {
+    'courseid': Optional[int],
+    'customfields': NotRequired[Optional[List['CoreCohortGetCohortsResponseInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'enrolmentkey': Optional[str],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'participation': Optional[bool],
+    'visibility': Optional[int],
+})
+
+
+CoreGroupUpdateGroupingsParametersGroupingsInnerDict = TypedDict('CoreGroupUpdateGroupingsParametersGroupingsInnerDict', {
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': Optional[str],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'name': Optional[str],
+})
+
+
+CoreGroupUpdateGroupsParametersGroupsInnerDict = TypedDict('CoreGroupUpdateGroupsParametersGroupsInnerDict', {
+    'customfields': NotRequired[Optional[List['CoreCohortCreateCohortsParametersCohortsInnerCustomfieldsInnerDict']]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'enrolmentkey': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'participation': NotRequired[Optional[bool]],
+    'visibility': NotRequired[Optional[str]],
+})
+
+
+CoreH5pGetTrustedH5pFileResponseDict = TypedDict('CoreH5pGetTrustedH5pFileResponseDict', {
+    'files': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageCreateContactRequestResponseDict = TypedDict('CoreMessageCreateContactRequestResponseDict', {
+    'request': NotRequired[Optional['CoreMessageCreateContactRequestResponseRequestDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageCreateContactRequestResponseRequestDict = TypedDict('CoreMessageCreateContactRequestResponseRequestDict', {
+    'id': Optional[int],
+    'requesteduserid': Optional[int],
+    'timecreated': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreMessageDataForMessageareaSearchMessagesResponseDict = TypedDict('CoreMessageDataForMessageareaSearchMessagesResponseDict', {
+    'contacts': List['CoreMessageDataForMessageareaSearchMessagesResponseContactsInnerDict'],
+})
+
+
+CoreMessageDataForMessageareaSearchMessagesResponseContactsInnerDict = TypedDict('CoreMessageDataForMessageareaSearchMessagesResponseContactsInnerDict', {
+    'conversationid': NotRequired[Optional[int]],
+    'fullname': Optional[str],
+    'isblocked': Optional[bool],
+    'ismessaging': Optional[bool],
+    'isonline': Optional[bool],
+    'isread': Optional[bool],
+    'lastmessage': Optional[str],
+    'lastmessagedate': NotRequired[Optional[int]],
+    'messageid': NotRequired[Optional[int]],
+    'profileimageurl': Optional[str],
+    'profileimageurlsmall': Optional[str],
+    'sentfromcurrentuser': Optional[bool],
+    'showonlinestatus': Optional[bool],
+    'unreadcount': NotRequired[Optional[int]],
+    'userid': Optional[int],
+})
+
+
+CoreMessageDeleteMessageResponseDict = TypedDict('CoreMessageDeleteMessageResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageGetBlockedUsersResponseDict = TypedDict('CoreMessageGetBlockedUsersResponseDict', {
+    'users': List['CoreMessageGetBlockedUsersResponseUsersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageGetBlockedUsersResponseUsersInnerDict = TypedDict('CoreMessageGetBlockedUsersResponseUsersInnerDict', {
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'profileimageurl': NotRequired[Optional[str]],
+})
+
+
+CoreMessageGetContactRequestsResponseInnerDict = TypedDict('CoreMessageGetContactRequestsResponseInnerDict', {
+    'cancreatecontact': Optional[bool],
+    'canmessage': Optional[bool],
+    'canmessageevenifblocked': Optional[bool],
+    'contactrequests': NotRequired[Optional[List['CoreMessageGetContactRequestsResponseInnerContactrequestsInnerDict']]],
+    'conversations': NotRequired[Optional[List['CoreMessageGetContactRequestsResponseInnerConversationsInnerDict']]],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'isblocked': Optional[bool],
+    'iscontact': Optional[bool],
+    'isdeleted': Optional[bool],
+    'isonline': Optional[bool],
+    'profileimageurl': Optional[str],
+    'profileimageurlsmall': Optional[str],
+    'profileurl': Optional[str],
+    'requirescontact': Optional[bool],
+    'showonlinestatus': Optional[bool],
+})
+
+
+CoreMessageGetContactRequestsResponseInnerContactrequestsInnerDict = TypedDict('CoreMessageGetContactRequestsResponseInnerContactrequestsInnerDict', {
+    'id': Optional[int],
+    'requesteduserid': Optional[int],
+    'timecreated': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreMessageGetContactRequestsResponseInnerConversationsInnerDict = TypedDict('CoreMessageGetContactRequestsResponseInnerConversationsInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+    'timecreated': Optional[int],
+    'type': Optional[int],
+})
+
+
+CoreMessageGetConversationBetweenUsersResponseDict = TypedDict('CoreMessageGetConversationBetweenUsersResponseDict', {
+    'candeletemessagesforallusers': NotRequired[Optional[bool]],
+    'id': Optional[int],
+    'imageurl': NotRequired[Optional[str]],
+    'isfavourite': Optional[bool],
+    'ismuted': Optional[bool],
+    'isread': Optional[bool],
+    'membercount': Optional[int],
+    'members': List['CoreMessageGetContactRequestsResponseInnerDict'],
+    'messages': List['CoreMessageGetConversationBetweenUsersResponseMessagesInnerDict'],
+    'name': NotRequired[Optional[str]],
+    'subname': NotRequired[Optional[str]],
+    'type': Optional[int],
+    'unreadcount': NotRequired[Optional[int]],
+})
+
+
+CoreMessageGetConversationBetweenUsersResponseMessagesInnerDict = TypedDict('CoreMessageGetConversationBetweenUsersResponseMessagesInnerDict', {
+    'id': Optional[int],
+    'text': Optional[str],
+    'timecreated': Optional[int],
+    'useridfrom': Optional[int],
+})
+
+
+CoreMessageGetConversationCountsResponseDict = TypedDict('CoreMessageGetConversationCountsResponseDict', {
+    'favourites': Optional[int],
+    'types': 'CoreMessageGetConversationCountsResponseTypesDict',
+})
+
+
+CoreMessageGetConversationCountsResponseTypesDict = TypedDict('CoreMessageGetConversationCountsResponseTypesDict', {
+    '1': Optional[int],
+    '2': Optional[int],
+    '3': Optional[int],
+})
+
+
+CoreMessageGetConversationMessagesResponseDict = TypedDict('CoreMessageGetConversationMessagesResponseDict', {
+    'id': Optional[int],
+    'members': List['CoreMessageGetContactRequestsResponseInnerDict'],
+    'messages': List['CoreMessageGetConversationBetweenUsersResponseMessagesInnerDict'],
+})
+
+
+CoreMessageGetConversationResponseDict = TypedDict('CoreMessageGetConversationResponseDict', {
+    'candeletemessagesforallusers': NotRequired[Optional[bool]],
+    'id': Optional[int],
+    'imageurl': NotRequired[Optional[str]],
+    'isfavourite': Optional[bool],
+    'ismuted': Optional[bool],
+    'isread': Optional[bool],
+    'membercount': Optional[int],
+    'members': List['CoreMessageGetContactRequestsResponseInnerDict'],
+    'messages': List['CoreMessageGetConversationBetweenUsersResponseMessagesInnerDict'],
+    'name': NotRequired[Optional[str]],
+    'subname': NotRequired[Optional[str]],
+    'type': Optional[int],
+    'unreadcount': NotRequired[Optional[int]],
+})
+
+
+CoreMessageGetConversationsResponseDict = TypedDict('CoreMessageGetConversationsResponseDict', {
+    'conversations': List['CoreMessageGetConversationsResponseConversationsInnerDict'],
+})
+
+
+CoreMessageGetConversationsResponseConversationsInnerDict = TypedDict('CoreMessageGetConversationsResponseConversationsInnerDict', {
+    'candeletemessagesforallusers': NotRequired[Optional[bool]],
+    'id': Optional[int],
+    'imageurl': NotRequired[Optional[str]],
+    'isfavourite': Optional[bool],
+    'ismuted': Optional[bool],
+    'isread': Optional[bool],
+    'membercount': Optional[int],
+    'members': List['CoreMessageGetContactRequestsResponseInnerDict'],
+    'messages': List['CoreMessageGetConversationBetweenUsersResponseMessagesInnerDict'],
+    'name': NotRequired[Optional[str]],
+    'subname': NotRequired[Optional[str]],
+    'type': Optional[int],
+    'unreadcount': NotRequired[Optional[int]],
+})
+
+
+CoreMessageGetMessageProcessorResponseDict = TypedDict('CoreMessageGetMessageProcessorResponseDict', {
+    'systemconfigured': Optional[bool],
+    'userconfigured': Optional[bool],
+})
+
+
+CoreMessageGetMessagesResponseDict = TypedDict('CoreMessageGetMessagesResponseDict', {
+    'messages': List['CoreMessageGetMessagesResponseMessagesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageGetMessagesResponseMessagesInnerDict = TypedDict('CoreMessageGetMessagesResponseMessagesInnerDict', {
+    'component': NotRequired[Optional[str]],
+    'contexturl': Optional[str],
+    'contexturlname': Optional[str],
+    'customdata': NotRequired[Optional[str]],
+    'eventtype': NotRequired[Optional[str]],
+    'fullmessage': Optional[str],
+    'fullmessageformat': Optional[int],
+    'fullmessagehtml': Optional[str],
+    'iconurl': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'notification': Optional[int],
+    'smallmessage': Optional[str],
+    'subject': Optional[str],
+    'text': Optional[str],
+    'timecreated': Optional[int],
+    'timeread': Optional[int],
+    'userfromfullname': Optional[str],
+    'useridfrom': Optional[int],
+    'useridto': Optional[int],
+    'usertofullname': Optional[str],
+})
+
+
+CoreMessageGetSelfConversationResponseDict = TypedDict('CoreMessageGetSelfConversationResponseDict', {
+    'candeletemessagesforallusers': NotRequired[Optional[bool]],
+    'id': Optional[int],
+    'imageurl': NotRequired[Optional[str]],
+    'isfavourite': Optional[bool],
+    'ismuted': Optional[bool],
+    'isread': Optional[bool],
+    'membercount': Optional[int],
+    'members': List['CoreMessageGetContactRequestsResponseInnerDict'],
+    'messages': List['CoreMessageGetConversationBetweenUsersResponseMessagesInnerDict'],
+    'name': NotRequired[Optional[str]],
+    'subname': NotRequired[Optional[str]],
+    'type': Optional[int],
+    'unreadcount': NotRequired[Optional[int]],
+})
+
+
+CoreMessageGetUnreadConversationCountsResponseDict = TypedDict('CoreMessageGetUnreadConversationCountsResponseDict', {
+    'favourites': Optional[int],
+    'types': 'CoreMessageGetUnreadConversationCountsResponseTypesDict',
+})
+
+
+CoreMessageGetUnreadConversationCountsResponseTypesDict = TypedDict('CoreMessageGetUnreadConversationCountsResponseTypesDict', {
+    '1': Optional[int],
+    '2': Optional[int],
+    '3': Optional[int],
+})
+
+
+CoreMessageGetUnsentMessageResponseDict = TypedDict('CoreMessageGetUnsentMessageResponseDict', {
+    'conversationid': NotRequired[Optional[int]],
+    'message': NotRequired[Optional[str]],
+    'otheruserid': NotRequired[Optional[int]],
+})
+
+
+CoreMessageGetUserMessagePreferencesResponseDict = TypedDict('CoreMessageGetUserMessagePreferencesResponseDict', {
+    'blocknoncontacts': Optional[int],
+    'entertosend': Optional[bool],
+    'preferences': 'CoreMessageGetUserMessagePreferencesResponsePreferencesDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageGetUserMessagePreferencesResponsePreferencesDict = TypedDict('CoreMessageGetUserMessagePreferencesResponsePreferencesDict', {
+    'components': List['CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerDict'],
+    'disableall': Optional[int],
+    'processors': List['CoreMessageGetUserMessagePreferencesResponsePreferencesProcessorsInnerDict'],
+    'userid': Optional[int],
+})
+
+
+CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerDict = TypedDict('CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerDict', {
+    'displayname': Optional[str],
+    'notifications': List['CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInnerDict'],
+})
+
+
+CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInnerDict = TypedDict('CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInnerDict', {
+    'displayname': Optional[str],
+    'preferencekey': Optional[str],
+    'processors': List['CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInnerProcessorsInnerDict'],
+})
+
+
+CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInnerProcessorsInnerDict = TypedDict('CoreMessageGetUserMessagePreferencesResponsePreferencesComponentsInnerNotificationsInnerProcessorsInnerDict', {
+    'displayname': Optional[str],
+    'enabled': Optional[bool],
+    'locked': Optional[bool],
+    'lockedmessage': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'userconfigured': Optional[int],
+})
+
+
+CoreMessageGetUserMessagePreferencesResponsePreferencesProcessorsInnerDict = TypedDict('CoreMessageGetUserMessagePreferencesResponsePreferencesProcessorsInnerDict', {
+    'contextid': Optional[int],
+    'displayname': Optional[str],
+    'hassettings': Optional[bool],
+    'name': Optional[str],
+    'userconfigured': Optional[int],
+})
+
+
+CoreMessageGetUserNotificationPreferencesResponseDict = TypedDict('CoreMessageGetUserNotificationPreferencesResponseDict', {
+    'preferences': 'CoreMessageGetUserMessagePreferencesResponsePreferencesDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageMarkMessageReadResponseDict = TypedDict('CoreMessageMarkMessageReadResponseDict', {
+    'messageid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageMarkNotificationReadResponseDict = TypedDict('CoreMessageMarkNotificationReadResponseDict', {
+    'notificationid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMessageMessageProcessorConfigFormParametersFormvaluesInnerDict = TypedDict('CoreMessageMessageProcessorConfigFormParametersFormvaluesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreMessageMessageSearchUsersResponseDict = TypedDict('CoreMessageMessageSearchUsersResponseDict', {
+    'contacts': List['CoreMessageGetContactRequestsResponseInnerDict'],
+    'noncontacts': List['CoreMessageGetContactRequestsResponseInnerDict'],
+})
+
+
+CoreMessageSearchContactsResponseInnerDict = TypedDict('CoreMessageSearchContactsResponseInnerDict', {
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'profileimageurl': NotRequired[Optional[str]],
+    'profileimageurlsmall': NotRequired[Optional[str]],
+})
+
+
+CoreMessageSendInstantMessagesParametersMessagesInnerDict = TypedDict('CoreMessageSendInstantMessagesParametersMessagesInnerDict', {
+    'clientmsgid': NotRequired[Optional[str]],
+    'text': Optional[str],
+    'textformat': NotRequired[Optional[int]],
+    'touserid': Optional[int],
+})
+
+
+CoreMessageSendInstantMessagesResponseInnerDict = TypedDict('CoreMessageSendInstantMessagesResponseInnerDict', {
+    'candeletemessagesforallusers': NotRequired[Optional[bool]],
+    'clientmsgid': NotRequired[Optional[str]],
+    'conversationid': NotRequired[Optional[int]],
+    'errormessage': NotRequired[Optional[str]],
+    'msgid': Optional[int],
+    'text': NotRequired[Optional[str]],
+    'timecreated': NotRequired[Optional[int]],
+    'useridfrom': NotRequired[Optional[int]],
+})
+
+
+CoreMessageSendMessagesToConversationParametersMessagesInnerDict = TypedDict('CoreMessageSendMessagesToConversationParametersMessagesInnerDict', {
+    'text': Optional[str],
+    'textformat': NotRequired[Optional[int]],
+})
+
+
+CoreMessageSetDefaultNotificationResponseDict = TypedDict('CoreMessageSetDefaultNotificationResponseDict', {
+    'successmessage': Optional[str],
+})
+
+
+CoreMoodlenetAuthCheckResponseDict = TypedDict('CoreMoodlenetAuthCheckResponseDict', {
+    'loginurl': Optional[str],
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMoodlenetGetShareInfoActivityResponseDict = TypedDict('CoreMoodlenetGetShareInfoActivityResponseDict', {
+    'issuerid': Optional[int],
+    'name': Optional[str],
+    'server': Optional[str],
+    'status': Optional[bool],
+    'supportpageurl': Optional[str],
+    'type': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMoodlenetGetSharedCourseInfoResponseDict = TypedDict('CoreMoodlenetGetSharedCourseInfoResponseDict', {
+    'issuerid': Optional[int],
+    'name': Optional[str],
+    'server': Optional[str],
+    'status': Optional[bool],
+    'supportpageurl': Optional[str],
+    'type': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMoodlenetSendActivityResponseDict = TypedDict('CoreMoodlenetSendActivityResponseDict', {
+    'resourceurl': Optional[str],
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMoodlenetSendCourseResponseDict = TypedDict('CoreMoodlenetSendCourseResponseDict', {
+    'resourceurl': Optional[str],
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreMyViewPageResponseDict = TypedDict('CoreMyViewPageResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreNotesCreateNotesParametersNotesInnerDict = TypedDict('CoreNotesCreateNotesParametersNotesInnerDict', {
+    'clientnoteid': NotRequired[Optional[str]],
+    'courseid': Optional[int],
+    'format': NotRequired[Optional[int]],
+    'publishstate': Optional[str],
+    'text': Optional[str],
+    'userid': Optional[int],
+})
+
+
+CoreNotesCreateNotesResponseInnerDict = TypedDict('CoreNotesCreateNotesResponseInnerDict', {
+    'clientnoteid': NotRequired[Optional[str]],
+    'errormessage': NotRequired[Optional[str]],
+    'noteid': Optional[int],
+})
+
+
+CoreNotesDeleteNotesResponseInnerDict = TypedDict('CoreNotesDeleteNotesResponseInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+CoreNotesGetCourseNotesResponseDict = TypedDict('CoreNotesGetCourseNotesResponseDict', {
+    'canmanagecoursenotes': NotRequired[Optional[bool]],
+    'canmanagesystemnotes': NotRequired[Optional[bool]],
+    'coursenotes': NotRequired[Optional[List['CoreNotesGetCourseNotesResponseCoursenotesInnerDict']]],
+    'personalnotes': NotRequired[Optional[List['CoreNotesGetCourseNotesResponseCoursenotesInnerDict']]],
+    'sitenotes': NotRequired[Optional[List['CoreNotesGetCourseNotesResponseCoursenotesInnerDict']]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreNotesGetCourseNotesResponseCoursenotesInnerDict = TypedDict('CoreNotesGetCourseNotesResponseCoursenotesInnerDict', {
+    'content': Optional[str],
+    'courseid': Optional[int],
+    'created': Optional[int],
+    'format': Optional[int],
+    'id': Optional[int],
+    'lastmodified': Optional[int],
+    'publishstate': Optional[str],
+    'userid': Optional[int],
+    'usermodified': Optional[int],
+})
+
+
+CoreNotesGetNotesResponseDict = TypedDict('CoreNotesGetNotesResponseDict', {
+    'notes': List['CoreNotesGetNotesResponseNotesInnerDict'],
+    'warnings': NotRequired[Optional[List['CoreNotesDeleteNotesResponseInnerDict']]],
+})
+
+
+CoreNotesGetNotesResponseNotesInnerDict = TypedDict('CoreNotesGetNotesResponseNotesInnerDict', {
+    'courseid': NotRequired[Optional[int]],
+    'format': NotRequired[Optional[int]],
+    'noteid': NotRequired[Optional[int]],
+    'publishstate': NotRequired[Optional[str]],
+    'text': NotRequired[Optional[str]],
+    'userid': NotRequired[Optional[int]],
+})
+
+
+CoreNotesUpdateNotesParametersNotesInnerDict = TypedDict('CoreNotesUpdateNotesParametersNotesInnerDict', {
+    'format': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'publishstate': Optional[str],
+    'text': Optional[str],
+})
+
+
+CoreNotesViewNotesResponseDict = TypedDict('CoreNotesViewNotesResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreOutputLoadFontawesomeIconSystemMapParametersDict = TypedDict('CoreOutputLoadFontawesomeIconSystemMapParametersDict', {
+    'themename': Optional[str],
+})
+
+
+CoreOutputLoadFontawesomeIconSystemMapResponseInnerDict = TypedDict('CoreOutputLoadFontawesomeIconSystemMapResponseInnerDict', {
+    'component': Optional[str],
+    'pix': Optional[str],
+    'to': Optional[str],
+})
+
+
+CoreOutputLoadTemplateParametersDict = TypedDict('CoreOutputLoadTemplateParametersDict', {
+    'component': Optional[str],
+    'includecomments': NotRequired[Optional[bool]],
+    'template': Optional[str],
+    'themename': Optional[str],
+})
+
+
+CoreOutputLoadTemplateWithDependenciesParametersDict = TypedDict('CoreOutputLoadTemplateWithDependenciesParametersDict', {
+    'component': Optional[str],
+    'includecomments': NotRequired[Optional[bool]],
+    'lang': NotRequired[Optional[str]],
+    'template': Optional[str],
+    'themename': Optional[str],
+})
+
+
+CoreOutputLoadTemplateWithDependenciesResponseDict = TypedDict('CoreOutputLoadTemplateWithDependenciesResponseDict', {
+    'strings': List['CoreOutputLoadTemplateWithDependenciesResponseStringsInnerDict'],
+    'templates': List['CoreOutputLoadTemplateWithDependenciesResponseStringsInnerDict'],
+})
+
+
+CoreOutputLoadTemplateWithDependenciesResponseStringsInnerDict = TypedDict('CoreOutputLoadTemplateWithDependenciesResponseStringsInnerDict', {
+    'component': Optional[str],
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreOutputPollStoredProgressResponseInnerDict = TypedDict('CoreOutputPollStoredProgressResponseInnerDict', {
+    'error': NotRequired[Optional[str]],
+    'estimated': Optional[str],
+    'id': Optional[int],
+    'message': Optional[str],
+    'progress': Optional[float],
+    'timeout': NotRequired[Optional[str]],
+    'uniqueid': Optional[str],
+})
+
+
+CorePaymentGetAvailableGatewaysResponseInnerDict = TypedDict('CorePaymentGetAvailableGatewaysResponseInnerDict', {
+    'cost': Optional[str],
+    'description': Optional[str],
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'surcharge': Optional[int],
+})
+
+
+CoreQuestionGetRandomQuestionSummariesResponseDict = TypedDict('CoreQuestionGetRandomQuestionSummariesResponseDict', {
+    'questions': List['CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerDict'],
+    'totalcount': Optional[int],
+})
+
+
+CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerDict = TypedDict('CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerDict', {
+    'category': int,
+    'icon': 'CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIconDict',
+    'id': int,
+    'name': str,
+    'parent': int,
+    'qtype': str,
+})
+
+
+CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIconDict = TypedDict('CoreQuestionGetRandomQuestionSummariesResponseQuestionsInnerIconDict', {
+    'alttext': str,
+    'component': str,
+    'key': str,
+})
+
+
+CoreQuestionSearchSharedBanksResponseDict = TypedDict('CoreQuestionSearchSharedBanksResponseDict', {
+    'sharedbanks': List['CoreQuestionSearchSharedBanksResponseSharedbanksInnerDict'],
+})
+
+
+CoreQuestionSearchSharedBanksResponseSharedbanksInnerDict = TypedDict('CoreQuestionSearchSharedBanksResponseSharedbanksInnerDict', {
+    'label': Optional[str],
+    'value': Optional[int],
+})
+
+
+CoreQuestionUpdateFlagResponseDict = TypedDict('CoreQuestionUpdateFlagResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreRatingAddRatingResponseDict = TypedDict('CoreRatingAddRatingResponseDict', {
+    'aggregate': NotRequired[Optional[str]],
+    'count': NotRequired[Optional[int]],
+    'itemid': NotRequired[Optional[int]],
+    'success': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreRatingGetItemRatingsResponseDict = TypedDict('CoreRatingGetItemRatingsResponseDict', {
+    'ratings': List['CoreRatingGetItemRatingsResponseRatingsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreRatingGetItemRatingsResponseRatingsInnerDict = TypedDict('CoreRatingGetItemRatingsResponseRatingsInnerDict', {
+    'id': Optional[int],
+    'rating': Optional[str],
+    'timemodified': Optional[int],
+    'userfullname': Optional[str],
+    'userid': Optional[int],
+    'userpictureurl': Optional[str],
+})
+
+
+CoreReportbuilderCanViewSystemReportParametersParametersInnerDict = TypedDict('CoreReportbuilderCanViewSystemReportParametersParametersInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreReportbuilderColumnsAddResponseDict = TypedDict('CoreReportbuilderColumnsAddResponseDict', {
+    'hassortablecolumns': bool,
+    'helpicon': str,
+    'sortablecolumns': List['CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict'],
+})
+
+
+CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict = TypedDict('CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict', {
+    'heading': str,
+    'id': int,
+    'movetitle': str,
+    'sortdirection': int,
+    'sortenabled': bool,
+    'sortenabledtitle': str,
+    'sorticon': 'CoreReportbuilderColumnsAddResponseSortablecolumnsInnerSorticonDict',
+    'sortorder': int,
+    'title': str,
+})
+
+
+CoreReportbuilderColumnsAddResponseSortablecolumnsInnerSorticonDict = TypedDict('CoreReportbuilderColumnsAddResponseSortablecolumnsInnerSorticonDict', {
+    'component': str,
+    'key': str,
+    'title': str,
+})
+
+
+CoreReportbuilderColumnsDeleteResponseDict = TypedDict('CoreReportbuilderColumnsDeleteResponseDict', {
+    'hassortablecolumns': bool,
+    'helpicon': str,
+    'sortablecolumns': List['CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict'],
+})
+
+
+CoreReportbuilderColumnsSortGetResponseDict = TypedDict('CoreReportbuilderColumnsSortGetResponseDict', {
+    'hassortablecolumns': bool,
+    'helpicon': str,
+    'sortablecolumns': List['CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict'],
+})
+
+
+CoreReportbuilderColumnsSortReorderResponseDict = TypedDict('CoreReportbuilderColumnsSortReorderResponseDict', {
+    'hassortablecolumns': bool,
+    'helpicon': str,
+    'sortablecolumns': List['CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict'],
+})
+
+
+CoreReportbuilderColumnsSortToggleResponseDict = TypedDict('CoreReportbuilderColumnsSortToggleResponseDict', {
+    'hassortablecolumns': bool,
+    'helpicon': str,
+    'sortablecolumns': List['CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict'],
+})
+
+
+CoreReportbuilderConditionsAddResponseDict = TypedDict('CoreReportbuilderConditionsAddResponseDict', {
+    'activeconditionsform': str,
+    'availableconditions': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactiveconditions': bool,
+    'hasavailableconditions': bool,
+    'helpicon': str,
+    'javascript': NotRequired[Optional[str]],
+})
+
+
+CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict = TypedDict('CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict', {
+    'optiongroup': 'CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupDict',
+})
+
+
+CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupDict = TypedDict('CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupDict', {
+    'text': str,
+    'values': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupValuesInnerDict'],
+})
+
+
+CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupValuesInnerDict = TypedDict('CoreReportbuilderConditionsAddResponseAvailableconditionsInnerOptiongroupValuesInnerDict', {
+    'value': str,
+    'visiblename': str,
+})
+
+
+CoreReportbuilderConditionsDeleteResponseDict = TypedDict('CoreReportbuilderConditionsDeleteResponseDict', {
+    'activeconditionsform': str,
+    'availableconditions': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactiveconditions': bool,
+    'hasavailableconditions': bool,
+    'helpicon': str,
+    'javascript': NotRequired[Optional[str]],
+})
+
+
+CoreReportbuilderConditionsReorderResponseDict = TypedDict('CoreReportbuilderConditionsReorderResponseDict', {
+    'activeconditionsform': str,
+    'availableconditions': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactiveconditions': bool,
+    'hasavailableconditions': bool,
+    'helpicon': str,
+    'javascript': NotRequired[Optional[str]],
+})
+
+
+CoreReportbuilderConditionsResetResponseDict = TypedDict('CoreReportbuilderConditionsResetResponseDict', {
+    'activeconditionsform': str,
+    'availableconditions': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactiveconditions': bool,
+    'hasavailableconditions': bool,
+    'helpicon': str,
+    'javascript': NotRequired[Optional[str]],
+})
+
+
+CoreReportbuilderFiltersAddResponseDict = TypedDict('CoreReportbuilderFiltersAddResponseDict', {
+    'activefilters': List['CoreReportbuilderFiltersAddResponseActivefiltersInnerDict'],
+    'availablefilters': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactivefilters': bool,
+    'hasavailablefilters': bool,
+    'helpicon': str,
+})
+
+
+CoreReportbuilderFiltersAddResponseActivefiltersInnerDict = TypedDict('CoreReportbuilderFiltersAddResponseActivefiltersInnerDict', {
+    'entityname': str,
+    'heading': str,
+    'headingeditable': str,
+    'id': int,
+    'movetitle': str,
+    'sortorder': int,
+})
+
+
+CoreReportbuilderFiltersDeleteResponseDict = TypedDict('CoreReportbuilderFiltersDeleteResponseDict', {
+    'activefilters': List['CoreReportbuilderFiltersAddResponseActivefiltersInnerDict'],
+    'availablefilters': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactivefilters': bool,
+    'hasavailablefilters': bool,
+    'helpicon': str,
+})
+
+
+CoreReportbuilderFiltersReorderResponseDict = TypedDict('CoreReportbuilderFiltersReorderResponseDict', {
+    'activefilters': List['CoreReportbuilderFiltersAddResponseActivefiltersInnerDict'],
+    'availablefilters': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactivefilters': bool,
+    'hasavailablefilters': bool,
+    'helpicon': str,
+})
+
+
+CoreReportbuilderListReportsResponseDict = TypedDict('CoreReportbuilderListReportsResponseDict', {
+    'reports': List['CoreReportbuilderListReportsResponseReportsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreReportbuilderListReportsResponseReportsInnerDict = TypedDict('CoreReportbuilderListReportsResponseReportsInnerDict', {
+    'area': str,
+    'component': str,
+    'conditiondata': Optional[str],
+    'contextid': int,
+    'customfields': 'CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDict',
+    'id': int,
+    'itemid': int,
+    'modifiedby': 'CoreCompetencyCreatePlanResponseReviewerDict',
+    'name': Optional[str],
+    'settingsdata': Optional[str],
+    'source': str,
+    'sourcename': Optional[str],
+    'tags': List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict'],
+    'timecreated': int,
+    'timemodified': int,
+    'type': int,
+    'uniquerows': bool,
+    'usercreated': int,
+    'usermodified': int,
+})
+
+
+CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDict = TypedDict('CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDict', {
+    'data': List['CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDataInnerDict'],
+})
+
+
+CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDataInnerDict = TypedDict('CoreReportbuilderListReportsResponseReportsInnerCustomfieldsDataInnerDict', {
+    'hasvalue': bool,
+    'instanceid': int,
+    'name': str,
+    'shortname': str,
+    'type': str,
+    'value': Optional[str],
+})
+
+
+CoreReportbuilderReportsGetResponseDict = TypedDict('CoreReportbuilderReportsGetResponseDict', {
+    'area': str,
+    'attributes': List['CoreReportbuilderReportsGetResponseAttributesInnerDict'],
+    'button': NotRequired[Optional['CoreReportbuilderReportsGetResponseButtonDict']],
+    'cardview': NotRequired[Optional['CoreReportbuilderReportsGetResponseCardviewDict']],
+    'classes': str,
+    'component': str,
+    'conditiondata': Optional[str],
+    'conditions': NotRequired[Optional['CoreReportbuilderReportsGetResponseConditionsDict']],
+    'contextid': int,
+    'editmode': bool,
+    'filters': NotRequired[Optional['CoreReportbuilderReportsGetResponseFiltersDict']],
+    'filtersapplied': int,
+    'filtersform': str,
+    'filterspresent': bool,
+    'id': int,
+    'infocontainer': str,
+    'itemid': int,
+    'javascript': str,
+    'name': Optional[str],
+    'settingsdata': Optional[str],
+    'sidebarmenucards': NotRequired[Optional['CoreReportbuilderReportsGetResponseSidebarmenucardsDict']],
+    'sorting': NotRequired[Optional['CoreReportbuilderReportsGetResponseSortingDict']],
+    'source': str,
+    'table': str,
+    'timecreated': int,
+    'timemodified': int,
+    'type': int,
+    'uniquerows': bool,
+    'usercreated': int,
+    'usermodified': int,
+})
+
+
+CoreReportbuilderReportsGetResponseAttributesInnerDict = TypedDict('CoreReportbuilderReportsGetResponseAttributesInnerDict', {
+    'name': str,
+    'value': str,
+})
+
+
+CoreReportbuilderReportsGetResponseButtonDict = TypedDict('CoreReportbuilderReportsGetResponseButtonDict', {
+    'attributes': List['CoreReportbuilderReportsGetResponseButtonAttributesInnerDict'],
+    'tag': str,
+    'title': str,
+})
+
+
+CoreReportbuilderReportsGetResponseButtonAttributesInnerDict = TypedDict('CoreReportbuilderReportsGetResponseButtonAttributesInnerDict', {
+    'name': NotRequired[Optional[str]],
+    'value': NotRequired[Optional[str]],
+})
+
+
+CoreReportbuilderReportsGetResponseCardviewDict = TypedDict('CoreReportbuilderReportsGetResponseCardviewDict', {
+    'form': str,
+    'helpicon': str,
+})
+
+
+CoreReportbuilderReportsGetResponseConditionsDict = TypedDict('CoreReportbuilderReportsGetResponseConditionsDict', {
+    'activeconditionsform': str,
+    'availableconditions': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactiveconditions': bool,
+    'hasavailableconditions': bool,
+    'helpicon': str,
+    'javascript': NotRequired[Optional[str]],
+})
+
+
+CoreReportbuilderReportsGetResponseFiltersDict = TypedDict('CoreReportbuilderReportsGetResponseFiltersDict', {
+    'activefilters': List['CoreReportbuilderFiltersAddResponseActivefiltersInnerDict'],
+    'availablefilters': List['CoreReportbuilderConditionsAddResponseAvailableconditionsInnerDict'],
+    'hasactivefilters': bool,
+    'hasavailablefilters': bool,
+    'helpicon': str,
+})
+
+
+CoreReportbuilderReportsGetResponseSidebarmenucardsDict = TypedDict('CoreReportbuilderReportsGetResponseSidebarmenucardsDict', {
+    'menucards': NotRequired[Optional[List['CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerDict']]],
+})
+
+
+CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerDict = TypedDict('CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerDict', {
+    'items': NotRequired[Optional[List['CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInnerDict']]],
+    'key': str,
+    'name': str,
+})
+
+
+CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInnerDict = TypedDict('CoreReportbuilderReportsGetResponseSidebarmenucardsMenucardsInnerItemsInnerDict', {
+    'action': str,
+    'disabled': NotRequired[Optional[bool]],
+    'identifier': str,
+    'name': str,
+    'title': str,
+})
+
+
+CoreReportbuilderReportsGetResponseSortingDict = TypedDict('CoreReportbuilderReportsGetResponseSortingDict', {
+    'hassortablecolumns': bool,
+    'helpicon': str,
+    'sortablecolumns': List['CoreReportbuilderColumnsAddResponseSortablecolumnsInnerDict'],
+})
+
+
+CoreReportbuilderRetrieveReportResponseDict = TypedDict('CoreReportbuilderRetrieveReportResponseDict', {
+    'data': 'CoreReportbuilderRetrieveReportResponseDataDict',
+    'details': 'CoreReportbuilderListReportsResponseReportsInnerDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreReportbuilderRetrieveReportResponseDataDict = TypedDict('CoreReportbuilderRetrieveReportResponseDataDict', {
+    'headers': List[str],
+    'rows': List['CoreReportbuilderRetrieveReportResponseDataRowsInnerDict'],
+    'totalrowcount': int,
+})
+
+
+CoreReportbuilderRetrieveReportResponseDataRowsInnerDict = TypedDict('CoreReportbuilderRetrieveReportResponseDataRowsInnerDict', {
+    'columns': List[str],
+})
+
+
+CoreReportbuilderRetrieveSystemReportResponseDict = TypedDict('CoreReportbuilderRetrieveSystemReportResponseDict', {
+    'data': 'CoreReportbuilderRetrieveReportResponseDataDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreReportbuilderViewReportResponseDict = TypedDict('CoreReportbuilderViewReportResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreRoleAssignRolesParametersAssignmentsInnerDict = TypedDict('CoreRoleAssignRolesParametersAssignmentsInnerDict', {
+    'contextid': NotRequired[Optional[int]],
+    'contextlevel': NotRequired[Optional[str]],
+    'instanceid': NotRequired[Optional[int]],
+    'roleid': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreRoleUnassignRolesParametersUnassignmentsInnerDict = TypedDict('CoreRoleUnassignRolesParametersUnassignmentsInnerDict', {
+    'contextid': NotRequired[Optional[int]],
+    'contextlevel': NotRequired[Optional[str]],
+    'instanceid': NotRequired[Optional[int]],
+    'roleid': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreSearchGetRelevantUsersResponseInnerDict = TypedDict('CoreSearchGetRelevantUsersResponseInnerDict', {
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'profileimageurlsmall': Optional[str],
+})
+
+
+CoreSearchGetResultsParametersFiltersDict = TypedDict('CoreSearchGetResultsParametersFiltersDict', {
+    'areaids': NotRequired[Optional[List[str]]],
+    'cat': NotRequired[Optional[str]],
+    'contextids': NotRequired[Optional[List[int]]],
+    'courseids': NotRequired[Optional[List[int]]],
+    'groupids': NotRequired[Optional[List[int]]],
+    'mycoursesonly': NotRequired[Optional[bool]],
+    'order': NotRequired[Optional[str]],
+    'timeend': NotRequired[Optional[int]],
+    'timestart': NotRequired[Optional[int]],
+    'title': NotRequired[Optional[str]],
+    'userids': NotRequired[Optional[List[int]]],
+})
+
+
+CoreSearchGetResultsResponseDict = TypedDict('CoreSearchGetResultsResponseDict', {
+    'results': List['CoreSearchGetResultsResponseResultsInnerDict'],
+    'totalcount': Optional[int],
+})
+
+
+CoreSearchGetResultsResponseResultsInnerDict = TypedDict('CoreSearchGetResultsResponseResultsInnerDict', {
+    'areaname': str,
+    'componentname': str,
+    'content': NotRequired[Optional[str]],
+    'contextid': int,
+    'contexturl': str,
+    'coursefullname': str,
+    'courseurl': str,
+    'description1': NotRequired[Optional[str]],
+    'description2': NotRequired[Optional[str]],
+    'docurl': str,
+    'filename': NotRequired[Optional[str]],
+    'filenames': NotRequired[Optional[str]],
+    'iconurl': NotRequired[Optional[str]],
+    'itemid': int,
+    'multiplefiles': NotRequired[Optional[int]],
+    'textformat': int,
+    'timemodified': int,
+    'title': str,
+    'userfullname': NotRequired[Optional[str]],
+    'userid': NotRequired[Optional[int]],
+    'userurl': NotRequired[Optional[str]],
+})
+
+
+CoreSearchGetSearchAreasListResponseDict = TypedDict('CoreSearchGetSearchAreasListResponseDict', {
+    'areas': List['CoreSearchGetSearchAreasListResponseAreasInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreSearchGetSearchAreasListResponseAreasInnerDict = TypedDict('CoreSearchGetSearchAreasListResponseAreasInnerDict', {
+    'categoryid': Optional[str],
+    'categoryname': Optional[str],
+    'id': Optional[str],
+    'name': Optional[str],
+})
+
+
+CoreSearchGetTopResultsResponseDict = TypedDict('CoreSearchGetTopResultsResponseDict', {
+    'results': List['CoreSearchGetResultsResponseResultsInnerDict'],
+})
+
+
+CoreSearchViewResultsParametersFiltersDict = TypedDict('CoreSearchViewResultsParametersFiltersDict', {
+    'areaids': NotRequired[Optional[List[str]]],
+    'courseids': NotRequired[Optional[List[int]]],
+    'timeend': NotRequired[Optional[int]],
+    'timestart': NotRequired[Optional[int]],
+    'title': NotRequired[Optional[str]],
+})
+
+
+CoreSearchViewResultsResponseDict = TypedDict('CoreSearchViewResultsResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreSessionTimeRemainingResponseDict = TypedDict('CoreSessionTimeRemainingResponseDict', {
+    'timeremaining': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreSmsSetGatewayStatusResponseDict = TypedDict('CoreSmsSetGatewayStatusResponseDict', {
+    'message': Optional[str],
+    'messagetype': Optional[str],
+    'result': Optional[bool],
+})
+
+
+CoreTableGetDynamicTableContentParametersFiltersInnerDict = TypedDict('CoreTableGetDynamicTableContentParametersFiltersInnerDict', {
+    'filteroptions': NotRequired[Optional[List['CoreTableGetDynamicTableContentParametersFiltersInnerFilteroptionsInnerDict']]],
+    'jointype': Optional[int],
+    'name': Optional[str],
+    'values': List[str],
+})
+
+
+CoreTableGetDynamicTableContentParametersFiltersInnerFilteroptionsInnerDict = TypedDict('CoreTableGetDynamicTableContentParametersFiltersInnerFilteroptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreTableGetDynamicTableContentParametersSortdataInnerDict = TypedDict('CoreTableGetDynamicTableContentParametersSortdataInnerDict', {
+    'sortby': Optional[str],
+    'sortorder': Optional[str],
+})
+
+
+CoreTableGetDynamicTableContentResponseDict = TypedDict('CoreTableGetDynamicTableContentResponseDict', {
+    'html': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreTagGetTagAreasResponseDict = TypedDict('CoreTagGetTagAreasResponseDict', {
+    'areas': List['CoreTagGetTagAreasResponseAreasInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreTagGetTagAreasResponseAreasInnerDict = TypedDict('CoreTagGetTagAreasResponseAreasInnerDict', {
+    'callback': Optional[str],
+    'callbackfile': Optional[str],
+    'component': str,
+    'enabled': bool,
+    'id': int,
+    'itemtype': str,
+    'locked': NotRequired[Optional[bool]],
+    'multiplecontexts': bool,
+    'showstandard': int,
+    'tagcollid': int,
+})
+
+
+CoreTagGetTagCloudResponseDict = TypedDict('CoreTagGetTagCloudResponseDict', {
+    'tags': List['CoreTagGetTagCloudResponseTagsInnerDict'],
+    'tagscount': Optional[int],
+    'totalcount': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreTagGetTagCloudResponseTagsInnerDict = TypedDict('CoreTagGetTagCloudResponseTagsInnerDict', {
+    'count': NotRequired[Optional[int]],
+    'flag': NotRequired[Optional[bool]],
+    'isstandard': NotRequired[Optional[bool]],
+    'name': Optional[str],
+    'size': NotRequired[Optional[int]],
+    'viewurl': Optional[str],
+})
+
+
+CoreTagGetTagCollectionsResponseDict = TypedDict('CoreTagGetTagCollectionsResponseDict', {
+    'collections': List['CoreTagGetTagCollectionsResponseCollectionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreTagGetTagCollectionsResponseCollectionsInnerDict = TypedDict('CoreTagGetTagCollectionsResponseCollectionsInnerDict', {
+    'component': Optional[str],
+    'customurl': Optional[str],
+    'id': int,
+    'isdefault': bool,
+    'name': Optional[str],
+    'searchable': bool,
+    'sortorder': int,
+})
+
+
+CoreTagGetTagindexParametersTagindexDict = TypedDict('CoreTagGetTagindexParametersTagindexDict', {
+    'ctx': NotRequired[Optional[int]],
+    'excl': NotRequired[Optional[bool]],
+    'from': NotRequired[Optional[int]],
+    'page': NotRequired[Optional[int]],
+    'rec': NotRequired[Optional[int]],
+    'ta': Optional[int],
+    'tag': Optional[str],
+    'tc': Optional[int],
+})
+
+
+CoreTagGetTagindexPerAreaParametersTagindexDict = TypedDict('CoreTagGetTagindexPerAreaParametersTagindexDict', {
+    'ctx': NotRequired[Optional[int]],
+    'excl': NotRequired[Optional[bool]],
+    'from': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'page': NotRequired[Optional[int]],
+    'rec': NotRequired[Optional[int]],
+    'ta': NotRequired[Optional[int]],
+    'tag': NotRequired[Optional[str]],
+    'tc': NotRequired[Optional[int]],
+})
+
+
+CoreTagGetTagindexPerAreaResponseInnerDict = TypedDict('CoreTagGetTagindexPerAreaResponseInnerDict', {
+    'anchor': NotRequired[Optional[str]],
+    'component': Optional[str],
+    'content': Optional[str],
+    'exclusivetext': NotRequired[Optional[str]],
+    'exclusiveurl': NotRequired[Optional[str]],
+    'hascontent': Optional[int],
+    'itemtype': Optional[str],
+    'nextpageurl': NotRequired[Optional[str]],
+    'prevpageurl': NotRequired[Optional[str]],
+    'ta': Optional[int],
+    'tagid': Optional[int],
+    'title': Optional[str],
+})
+
+
+CoreTagGetTagindexResponseDict = TypedDict('CoreTagGetTagindexResponseDict', {
+    'anchor': NotRequired[Optional[str]],
+    'component': Optional[str],
+    'content': Optional[str],
+    'exclusivetext': NotRequired[Optional[str]],
+    'exclusiveurl': NotRequired[Optional[str]],
+    'hascontent': Optional[int],
+    'itemtype': Optional[str],
+    'nextpageurl': NotRequired[Optional[str]],
+    'prevpageurl': NotRequired[Optional[str]],
+    'ta': Optional[int],
+    'tagid': Optional[int],
+    'title': Optional[str],
+})
+
+
+CoreTagGetTagsParametersTagsInnerDict = TypedDict('CoreTagGetTagsParametersTagsInnerDict', {
+    'id': Optional[int],
+})
+
+
+CoreTagGetTagsResponseDict = TypedDict('CoreTagGetTagsResponseDict', {
+    'tags': List['CoreTagGetTagsResponseTagsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreTagGetTagsResponseTagsInnerDict = TypedDict('CoreTagGetTagsResponseTagsInnerDict', {
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'flag': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'isstandard': NotRequired[Optional[int]],
+    'name': Optional[str],
+    'official': NotRequired[Optional[int]],
+    'rawname': Optional[str],
+    'tagcollid': Optional[int],
+    'viewurl': Optional[str],
+})
+
+
+CoreTagUpdateTagsParametersTagsInnerDict = TypedDict('CoreTagUpdateTagsParametersTagsInnerDict', {
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'flag': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'isstandard': NotRequired[Optional[int]],
+    'official': NotRequired[Optional[int]],
+    'rawname': NotRequired[Optional[str]],
+})
+
+
+CoreTagUpdateTagsResponseDict = TypedDict('CoreTagUpdateTagsResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUpdateInplaceEditableResponseDict = TypedDict('CoreUpdateInplaceEditableResponseDict', {
+    'component': NotRequired[Optional[str]],
+    'displayvalue': Optional[str],
+    'edithint': NotRequired[Optional[str]],
+    'editicon': NotRequired[Optional['CoreUpdateInplaceEditableResponseEditiconDict']],
+    'editlabel': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[str]],
+    'itemtype': NotRequired[Optional[str]],
+    'linkeverything': NotRequired[Optional[int]],
+    'options': NotRequired[Optional[str]],
+    'type': NotRequired[Optional[str]],
+    'value': NotRequired[Optional[str]],
+})
+
+
+CoreUpdateInplaceEditableResponseEditiconDict = TypedDict('CoreUpdateInplaceEditableResponseEditiconDict', {
+    'component': NotRequired[Optional[str]],
+    'key': NotRequired[Optional[str]],
+    'title': NotRequired[Optional[str]],
+})
+
+
+CoreUserAgreeSitePolicyResponseDict = TypedDict('CoreUserAgreeSitePolicyResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserCreateUsersParametersUsersInnerDict = TypedDict('CoreUserCreateUsersParametersUsersInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'alternatename': NotRequired[Optional[str]],
+    'auth': NotRequired[Optional[str]],
+    'calendartype': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'createpassword': NotRequired[Optional[bool]],
+    'customfields': NotRequired[Optional[List['CoreUserCreateUsersParametersUsersInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'email': Optional[str],
+    'firstname': Optional[str],
+    'firstnamephonetic': NotRequired[Optional[str]],
+    'idnumber': NotRequired[Optional[str]],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'lastname': Optional[str],
+    'lastnamephonetic': NotRequired[Optional[str]],
+    'maildisplay': NotRequired[Optional[int]],
+    'mailformat': NotRequired[Optional[int]],
+    'middlename': NotRequired[Optional[str]],
+    'password': NotRequired[Optional[str]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['CoreUserCreateUsersParametersUsersInnerPreferencesInnerDict']]],
+    'theme': NotRequired[Optional[str]],
+    'timezone': NotRequired[Optional[str]],
+    'username': Optional[str],
+})
+
+
+CoreUserCreateUsersParametersUsersInnerCustomfieldsInnerDict = TypedDict('CoreUserCreateUsersParametersUsersInnerCustomfieldsInnerDict', {
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreUserCreateUsersParametersUsersInnerPreferencesInnerDict = TypedDict('CoreUserCreateUsersParametersUsersInnerPreferencesInnerDict', {
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreUserCreateUsersResponseInnerDict = TypedDict('CoreUserCreateUsersResponseInnerDict', {
+    'id': Optional[int],
+    'username': Optional[str],
+})
+
+
+CoreUserGetCourseUserProfilesParametersUserlistInnerDict = TypedDict('CoreUserGetCourseUserProfilesParametersUserlistInnerDict', {
+    'courseid': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreUserGetCourseUserProfilesResponseInnerDict = TypedDict('CoreUserGetCourseUserProfilesResponseInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'auth': NotRequired[Optional[str]],
+    'calendartype': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'confirmed': NotRequired[Optional[bool]],
+    'country': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreEnrolGetPotentialUsersResponseInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'email': NotRequired[Optional[str]],
+    'enrolledcourses': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerEnrolledcoursesInnerDict']]],
+    'firstaccess': NotRequired[Optional[int]],
+    'firstname': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'groups': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerGroupsInnerDict']]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'lastname': NotRequired[Optional[str]],
+    'mailformat': NotRequired[Optional[int]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['CoreEnrolGetPotentialUsersResponseInnerPreferencesInnerDict']]],
+    'profileimageurl': Optional[str],
+    'profileimageurlsmall': Optional[str],
+    'roles': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerRolesInnerDict']]],
+    'suspended': NotRequired[Optional[bool]],
+    'theme': NotRequired[Optional[str]],
+    'timezone': NotRequired[Optional[str]],
+    'trackforums': NotRequired[Optional[int]],
+    'username': NotRequired[Optional[str]],
+})
+
+
+CoreUserGetPrivateFilesInfoResponseDict = TypedDict('CoreUserGetPrivateFilesInfoResponseDict', {
+    'filecount': Optional[int],
+    'filesize': Optional[int],
+    'filesizewithoutreferences': Optional[int],
+    'foldercount': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserGetUserPreferencesResponseDict = TypedDict('CoreUserGetUserPreferencesResponseDict', {
+    'preferences': List['CoreUserGetUserPreferencesResponsePreferencesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserGetUserPreferencesResponsePreferencesInnerDict = TypedDict('CoreUserGetUserPreferencesResponsePreferencesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreUserGetUsersParametersCriteriaInnerDict = TypedDict('CoreUserGetUsersParametersCriteriaInnerDict', {
+    'key': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreUserGetUsersResponseDict = TypedDict('CoreUserGetUsersResponseDict', {
+    'users': List['CoreEnrolGetPotentialUsersResponseInnerDict'],
+    'warnings': NotRequired[Optional[List['CoreUserGetUsersResponseWarningsInnerDict']]],
+})
+
+
+CoreUserGetUsersResponseWarningsInnerDict = TypedDict('CoreUserGetUsersResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+CoreUserPreparePrivateFilesForEditionResponseDict = TypedDict('CoreUserPreparePrivateFilesForEditionResponseDict', {
+    'areaoptions': List['CoreBlogPrepareEntryForEditionResponseAreasInnerOptionsInnerDict'],
+    'draftitemid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserRemoveUserDeviceResponseDict = TypedDict('CoreUserRemoveUserDeviceResponseDict', {
+    'removed': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserSearchIdentityResponseDict = TypedDict('CoreUserSearchIdentityResponseDict', {
+    'list': List['CoreUserSearchIdentityResponseListInnerDict'],
+    'maxusersperpage': Optional[int],
+    'overflow': Optional[bool],
+})
+
+
+CoreUserSearchIdentityResponseListInnerDict = TypedDict('CoreUserSearchIdentityResponseListInnerDict', {
+    'extrafields': NotRequired[Optional[List['CoreUserSearchIdentityResponseListInnerExtrafieldsInnerDict']]],
+    'fullname': Optional[str],
+    'id': Optional[int],
+})
+
+
+CoreUserSearchIdentityResponseListInnerExtrafieldsInnerDict = TypedDict('CoreUserSearchIdentityResponseListInnerExtrafieldsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreUserSetUserPreferencesParametersDict = TypedDict('CoreUserSetUserPreferencesParametersDict', {
+    'preferences': List['CoreUserSetUserPreferencesParametersPreferencesInnerDict'],
+})
+
+
+CoreUserSetUserPreferencesParametersPreferencesInnerDict = TypedDict('CoreUserSetUserPreferencesParametersPreferencesInnerDict', {
+    'name': Optional[str],
+    'userid': NotRequired[Optional[int]],
+    'value': Optional[str],
+})
+
+
+CoreUserSetUserPreferencesResponseDict = TypedDict('CoreUserSetUserPreferencesResponseDict', {
+    'saved': List['CoreUserSetUserPreferencesResponseSavedInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserSetUserPreferencesResponseSavedInnerDict = TypedDict('CoreUserSetUserPreferencesResponseSavedInnerDict', {
+    'name': Optional[str],
+    'userid': Optional[int],
+})
+
+
+CoreUserUpdatePictureResponseDict = TypedDict('CoreUserUpdatePictureResponseDict', {
+    'profileimageurl': NotRequired[Optional[str]],
+    'success': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserUpdatePrivateFilesResponseDict = TypedDict('CoreUserUpdatePrivateFilesResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserUpdateUserDevicePublicKeyResponseDict = TypedDict('CoreUserUpdateUserDevicePublicKeyResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserUpdateUserPreferencesParametersPreferencesInnerDict = TypedDict('CoreUserUpdateUserPreferencesParametersPreferencesInnerDict', {
+    'type': Optional[str],
+    'value': NotRequired[Optional[str]],
+})
+
+
+CoreUserUpdateUsersParametersUsersInnerDict = TypedDict('CoreUserUpdateUsersParametersUsersInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'alternatename': NotRequired[Optional[str]],
+    'auth': NotRequired[Optional[str]],
+    'calendartype': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreUserCreateUsersParametersUsersInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'email': NotRequired[Optional[str]],
+    'firstname': NotRequired[Optional[str]],
+    'firstnamephonetic': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'lastname': NotRequired[Optional[str]],
+    'lastnamephonetic': NotRequired[Optional[str]],
+    'maildisplay': NotRequired[Optional[int]],
+    'mailformat': NotRequired[Optional[int]],
+    'middlename': NotRequired[Optional[str]],
+    'password': NotRequired[Optional[str]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['CoreUserCreateUsersParametersUsersInnerPreferencesInnerDict']]],
+    'suspended': NotRequired[Optional[bool]],
+    'theme': NotRequired[Optional[str]],
+    'timezone': NotRequired[Optional[str]],
+    'username': NotRequired[Optional[str]],
+    'userpicture': NotRequired[Optional[int]],
+})
+
+
+CoreUserUpdateUsersResponseDict = TypedDict('CoreUserUpdateUsersResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserViewUserListResponseDict = TypedDict('CoreUserViewUserListResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreUserViewUserProfileResponseDict = TypedDict('CoreUserViewUserProfileResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+CoreWebserviceGetSiteInfoResponseDict = TypedDict('CoreWebserviceGetSiteInfoResponseDict', {
+    'advancedfeatures': NotRequired[Optional[List['CoreWebserviceGetSiteInfoResponseAdvancedfeaturesInnerDict']]],
+    'downloadfiles': NotRequired[Optional[int]],
+    'firstname': Optional[str],
+    'fullname': Optional[str],
+    'functions': List['CoreWebserviceGetSiteInfoResponseFunctionsInnerDict'],
+    'lang': Optional[str],
+    'lastname': Optional[str],
+    'limitconcurrentlogins': NotRequired[Optional[int]],
+    'mobilecssurl': NotRequired[Optional[str]],
+    'policyagreed': NotRequired[Optional[int]],
+    'release': NotRequired[Optional[str]],
+    'sitecalendartype': NotRequired[Optional[str]],
+    'siteid': NotRequired[Optional[int]],
+    'sitename': Optional[str],
+    'siteurl': Optional[str],
+    'theme': NotRequired[Optional[str]],
+    'uploadfiles': NotRequired[Optional[int]],
+    'usercalendartype': NotRequired[Optional[str]],
+    'usercanmanageownfiles': NotRequired[Optional[bool]],
+    'userhomepage': NotRequired[Optional[int]],
+    'userhomepageurl': NotRequired[Optional[str]],
+    'userid': Optional[int],
+    'userissiteadmin': NotRequired[Optional[bool]],
+    'usermaxuploadfilesize': NotRequired[Optional[int]],
+    'username': Optional[str],
+    'userpictureurl': Optional[str],
+    'userprivateaccesskey': NotRequired[Optional[str]],
+    'userquota': NotRequired[Optional[int]],
+    'usersessionscount': NotRequired[Optional[int]],
+    'version': NotRequired[Optional[str]],
+})
+
+
+CoreWebserviceGetSiteInfoResponseAdvancedfeaturesInnerDict = TypedDict('CoreWebserviceGetSiteInfoResponseAdvancedfeaturesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[int],
+})
+
+
+CoreWebserviceGetSiteInfoResponseFunctionsInnerDict = TypedDict('CoreWebserviceGetSiteInfoResponseFunctionsInnerDict', {
+    'name': Optional[str],
+    'version': Optional[str],
+})
+
+
+CustomfieldNumberRecalculateValueResponseDict = TypedDict('CustomfieldNumberRecalculateValueResponseDict', {
+    'value': Optional[str],
+})
+
+
+EditorTinyGetConfigurationResponseDict = TypedDict('EditorTinyGetConfigurationResponseDict', {
+    'branding': Optional[bool],
+    'contextid': Optional[int],
+    'extendedvalidelements': Optional[str],
+    'installedlanguages': List['EditorTinyGetConfigurationResponseInstalledlanguagesInnerDict'],
+    'plugins': List['EditorTinyGetConfigurationResponsePluginsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+EditorTinyGetConfigurationResponseInstalledlanguagesInnerDict = TypedDict('EditorTinyGetConfigurationResponseInstalledlanguagesInnerDict', {
+    'lang': Optional[str],
+    'name': Optional[str],
+})
+
+
+EditorTinyGetConfigurationResponsePluginsInnerDict = TypedDict('EditorTinyGetConfigurationResponsePluginsInnerDict', {
+    'name': Optional[str],
+    'settings': List['EditorTinyGetConfigurationResponsePluginsInnerSettingsInnerDict'],
+})
+
+
+EditorTinyGetConfigurationResponsePluginsInnerSettingsInnerDict = TypedDict('EditorTinyGetConfigurationResponsePluginsInnerSettingsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+EnrolGuestGetInstanceInfoResponseDict = TypedDict('EnrolGuestGetInstanceInfoResponseDict', {
+    'instanceinfo': 'EnrolGuestGetInstanceInfoResponseInstanceinfoDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+EnrolGuestGetInstanceInfoResponseInstanceinfoDict = TypedDict('EnrolGuestGetInstanceInfoResponseInstanceinfoDict', {
+    'courseid': Optional[int],
+    'id': Optional[int],
+    'name': Optional[str],
+    'passwordrequired': Optional[bool],
+    'status': Optional[bool],
+    'type': Optional[str],
+})
+
+
+EnrolGuestValidatePasswordResponseDict = TypedDict('EnrolGuestValidatePasswordResponseDict', {
+    'hint': NotRequired[Optional[str]],
+    'validated': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+EnrolManualEnrolUsersParametersEnrolmentsInnerDict = TypedDict('EnrolManualEnrolUsersParametersEnrolmentsInnerDict', {
+    'courseid': Optional[int],
+    'roleid': Optional[int],
+    'suspend': NotRequired[Optional[int]],
+    'timeend': NotRequired[Optional[int]],
+    'timestart': NotRequired[Optional[int]],
+    'userid': Optional[int],
+})
+
+
+EnrolManualUnenrolUsersParametersEnrolmentsInnerDict = TypedDict('EnrolManualUnenrolUsersParametersEnrolmentsInnerDict', {
+    'courseid': Optional[int],
+    'roleid': NotRequired[Optional[int]],
+    'userid': Optional[int],
+})
+
+
+EnrolMetaAddInstancesParametersInstancesInnerDict = TypedDict('EnrolMetaAddInstancesParametersInstancesInnerDict', {
+    'courseid': Optional[str],
+    'creategroup': NotRequired[Optional[bool]],
+    'metacourseid': Optional[int],
+})
+
+
+EnrolMetaAddInstancesResponseInnerDict = TypedDict('EnrolMetaAddInstancesResponseInnerDict', {
+    'courseid': Optional[str],
+    'metacourseid': Optional[int],
+    'status': Optional[bool],
+})
+
+
+EnrolMetaDeleteInstancesParametersInstancesInnerDict = TypedDict('EnrolMetaDeleteInstancesParametersInstancesInnerDict', {
+    'courseid': Optional[str],
+    'metacourseid': Optional[int],
+})
+
+
+EnrolMetaDeleteInstancesResponseInnerDict = TypedDict('EnrolMetaDeleteInstancesResponseInnerDict', {
+    'courseid': Optional[str],
+    'metacourseid': Optional[int],
+    'status': Optional[bool],
+})
+
+
+EnrolSelfEnrolUserResponseDict = TypedDict('EnrolSelfEnrolUserResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+EnrolSelfGetInstanceInfoResponseDict = TypedDict('EnrolSelfGetInstanceInfoResponseDict', {
+    'courseid': Optional[int],
+    'enrolpassword': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'name': Optional[str],
+    'status': Optional[str],
+    'type': Optional[str],
+})
+
+
+GradereportGraderGetUsersInReportResponseDict = TypedDict('GradereportGraderGetUsersInReportResponseDict', {
+    'users': List['CoreEnrolGetPotentialUsersResponseInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradereportOverviewGetCourseGradesResponseDict = TypedDict('GradereportOverviewGetCourseGradesResponseDict', {
+    'grades': List['GradereportOverviewGetCourseGradesResponseGradesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradereportOverviewGetCourseGradesResponseGradesInnerDict = TypedDict('GradereportOverviewGetCourseGradesResponseGradesInnerDict', {
+    'courseid': Optional[int],
+    'grade': Optional[str],
+    'rank': NotRequired[Optional[int]],
+    'rawgrade': Optional[str],
+})
+
+
+GradereportOverviewViewGradeReportResponseDict = TypedDict('GradereportOverviewViewGradeReportResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradereportSingleviewGetGradeItemsForSearchWidgetResponseDict = TypedDict('GradereportSingleviewGetGradeItemsForSearchWidgetResponseDict', {
+    'gradeitems': List['GradereportSingleviewGetGradeItemsForSearchWidgetResponseGradeitemsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradereportSingleviewGetGradeItemsForSearchWidgetResponseGradeitemsInnerDict = TypedDict('GradereportSingleviewGetGradeItemsForSearchWidgetResponseGradeitemsInnerDict', {
+    'id': NotRequired[Optional[int]],
+    'name': NotRequired[Optional[str]],
+})
+
+
+GradereportUserGetAccessInformationResponseDict = TypedDict('GradereportUserGetAccessInformationResponseDict', {
+    'canviewallgrades': Optional[bool],
+    'canviewmygrades': Optional[bool],
+    'canviewusergradereport': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradereportUserGetGradeItemsResponseDict = TypedDict('GradereportUserGetGradeItemsResponseDict', {
+    'usergrades': List['GradereportUserGetGradeItemsResponseUsergradesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradereportUserGetGradeItemsResponseUsergradesInnerDict = TypedDict('GradereportUserGetGradeItemsResponseUsergradesInnerDict', {
+    'courseid': Optional[int],
+    'courseidnumber': Optional[str],
+    'gradeitems': List['GradereportUserGetGradeItemsResponseUsergradesInnerGradeitemsInnerDict'],
+    'maxdepth': Optional[int],
+    'userfullname': Optional[str],
+    'userid': Optional[int],
+    'useridnumber': Optional[str],
+})
+
+
+GradereportUserGetGradeItemsResponseUsergradesInnerGradeitemsInnerDict = TypedDict('GradereportUserGetGradeItemsResponseUsergradesInnerGradeitemsInnerDict', {
+    'averageformatted': NotRequired[Optional[str]],
+    'categoryid': Optional[int],
+    'cmid': NotRequired[Optional[int]],
+    'feedback': NotRequired[Optional[str]],
+    'feedbackformat': NotRequired[Optional[int]],
+    'gradedategraded': NotRequired[Optional[int]],
+    'gradedatesubmitted': NotRequired[Optional[int]],
+    'gradeformatted': NotRequired[Optional[str]],
+    'gradehiddenbydate': NotRequired[Optional[bool]],
+    'gradeishidden': NotRequired[Optional[bool]],
+    'gradeislocked': NotRequired[Optional[bool]],
+    'gradeisoverridden': NotRequired[Optional[bool]],
+    'grademax': NotRequired[Optional[float]],
+    'grademin': NotRequired[Optional[float]],
+    'gradeneedsupdate': NotRequired[Optional[bool]],
+    'graderaw': NotRequired[Optional[float]],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'iteminstance': Optional[int],
+    'itemmodule': Optional[str],
+    'itemname': Optional[str],
+    'itemnumber': Optional[int],
+    'itemtype': Optional[str],
+    'lettergradeformatted': NotRequired[Optional[str]],
+    'locked': NotRequired[Optional[bool]],
+    'numusers': NotRequired[Optional[int]],
+    'outcomeid': Optional[int],
+    'percentageformatted': NotRequired[Optional[str]],
+    'rangeformatted': NotRequired[Optional[str]],
+    'rank': NotRequired[Optional[int]],
+    'scaleid': Optional[int],
+    'status': NotRequired[Optional[str]],
+    'weightformatted': NotRequired[Optional[str]],
+    'weightraw': NotRequired[Optional[float]],
+})
+
+
+GradereportUserGetGradesTableResponseDict = TypedDict('GradereportUserGetGradesTableResponseDict', {
+    'tables': List['GradereportUserGetGradesTableResponseTablesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerDict', {
+    'courseid': Optional[int],
+    'maxdepth': Optional[int],
+    'tabledata': List['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerDict'],
+    'userfullname': Optional[str],
+    'userid': Optional[int],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerDict', {
+    'average': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerAverageDict']],
+    'contributiontocoursetotal': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerContributiontocoursetotalDict']],
+    'feedback': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerFeedbackDict']],
+    'grade': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerGradeDict']],
+    'itemname': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerItemnameDict']],
+    'leader': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerLeaderDict']],
+    'lettergrade': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerLettergradeDict']],
+    'parentcategories': List[int],
+    'percentage': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerPercentageDict']],
+    'range': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRangeDict']],
+    'rank': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRankDict']],
+    'weight': NotRequired[Optional['GradereportUserGetGradesTableResponseTablesInnerTabledataInnerWeightDict']],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerAverageDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerAverageDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerContributiontocoursetotalDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerContributiontocoursetotalDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerFeedbackDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerFeedbackDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerGradeDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerGradeDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerItemnameDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerItemnameDict', {
+    'class': Optional[str],
+    'colspan': Optional[int],
+    'content': Optional[str],
+    'id': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerLeaderDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerLeaderDict', {
+    'class': Optional[str],
+    'rowspan': Optional[int],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerLettergradeDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerLettergradeDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerPercentageDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerPercentageDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRangeDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRangeDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRankDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerRankDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserGetGradesTableResponseTablesInnerTabledataInnerWeightDict = TypedDict('GradereportUserGetGradesTableResponseTablesInnerTabledataInnerWeightDict', {
+    'class': Optional[str],
+    'content': Optional[str],
+    'headers': Optional[str],
+})
+
+
+GradereportUserViewGradeReportResponseDict = TypedDict('GradereportUserViewGradeReportResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradingformGuideGraderGradingpanelFetchResponseDict = TypedDict('GradingformGuideGraderGradingpanelFetchResponseDict', {
+    'grade': 'GradingformGuideGraderGradingpanelFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradingformGuideGraderGradingpanelFetchResponseGradeDict = TypedDict('GradingformGuideGraderGradingpanelFetchResponseGradeDict', {
+    'comments': List['GradingformGuideGraderGradingpanelFetchResponseGradeCommentsInnerDict'],
+    'criterion': List['GradingformGuideGraderGradingpanelFetchResponseGradeCriterionInnerDict'],
+    'gradedby': Optional[str],
+    'hascomments': Optional[bool],
+    'instanceid': Optional[int],
+    'maxgrade': Optional[str],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usergrade': Optional[str],
+})
+
+
+GradingformGuideGraderGradingpanelFetchResponseGradeCommentsInnerDict = TypedDict('GradingformGuideGraderGradingpanelFetchResponseGradeCommentsInnerDict', {
+    'description': Optional[str],
+    'id': Optional[int],
+    'sortorder': Optional[int],
+})
+
+
+GradingformGuideGraderGradingpanelFetchResponseGradeCriterionInnerDict = TypedDict('GradingformGuideGraderGradingpanelFetchResponseGradeCriterionInnerDict', {
+    'description': Optional[str],
+    'descriptionmarkers': Optional[str],
+    'id': Optional[int],
+    'maxscore': Optional[float],
+    'name': Optional[str],
+    'remark': NotRequired[Optional[str]],
+    'score': NotRequired[Optional[float]],
+})
+
+
+GradingformGuideGraderGradingpanelStoreResponseDict = TypedDict('GradingformGuideGraderGradingpanelStoreResponseDict', {
+    'grade': 'GradingformGuideGraderGradingpanelFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradingformRubricGraderGradingpanelFetchResponseDict = TypedDict('GradingformRubricGraderGradingpanelFetchResponseDict', {
+    'grade': 'GradingformRubricGraderGradingpanelFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+GradingformRubricGraderGradingpanelFetchResponseGradeDict = TypedDict('GradingformRubricGraderGradingpanelFetchResponseGradeDict', {
+    'canedit': Optional[bool],
+    'criteria': List['GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerDict'],
+    'gradedby': Optional[str],
+    'instanceid': Optional[int],
+    'maxgrade': Optional[str],
+    'rubricmode': Optional[str],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usergrade': Optional[str],
+})
+
+
+GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerDict = TypedDict('GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerDict', {
+    'description': Optional[str],
+    'id': Optional[int],
+    'levels': List['GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerLevelsInnerDict'],
+    'remark': NotRequired[Optional[str]],
+})
+
+
+GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerLevelsInnerDict = TypedDict('GradingformRubricGraderGradingpanelFetchResponseGradeCriteriaInnerLevelsInnerDict', {
+    'checked': Optional[bool],
+    'criterionid': Optional[int],
+    'definition': Optional[str],
+    'id': Optional[int],
+    'score': Optional[str],
+})
+
+
+GradingformRubricGraderGradingpanelStoreResponseDict = TypedDict('GradingformRubricGraderGradingpanelStoreResponseDict', {
+    'grade': 'GradingformRubricGraderGradingpanelFetchResponseGradeDict',
+    'hasgrade': Optional[bool],
+    'templatename': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+LoginToken200ResponseDict = TypedDict('LoginToken200ResponseDict', {
+    'privatetoken': str,
+    'token': str,
+})
+
+
+MediaVideojsGetLanguageParametersDict = TypedDict('MediaVideojsGetLanguageParametersDict', {
+    'lang': Optional[str],
+})
+
+
+MessageAirnotifierAreNotificationPreferencesConfiguredResponseDict = TypedDict('MessageAirnotifierAreNotificationPreferencesConfiguredResponseDict', {
+    'users': List['MessageAirnotifierAreNotificationPreferencesConfiguredResponseUsersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+MessageAirnotifierAreNotificationPreferencesConfiguredResponseUsersInnerDict = TypedDict('MessageAirnotifierAreNotificationPreferencesConfiguredResponseUsersInnerDict', {
+    'configured': Optional[int],
+    'userid': Optional[int],
+})
+
+
+MessageAirnotifierEnableDeviceResponseDict = TypedDict('MessageAirnotifierEnableDeviceResponseDict', {
+    'success': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+MessageAirnotifierGetUserDevicesResponseDict = TypedDict('MessageAirnotifierGetUserDevicesResponseDict', {
+    'devices': List['MessageAirnotifierGetUserDevicesResponseDevicesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+MessageAirnotifierGetUserDevicesResponseDevicesInnerDict = TypedDict('MessageAirnotifierGetUserDevicesResponseDevicesInnerDict', {
+    'appid': Optional[str],
+    'enable': Optional[int],
+    'id': Optional[int],
+    'model': Optional[str],
+    'name': Optional[str],
+    'platform': Optional[str],
+    'pushid': Optional[str],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'uuid': Optional[str],
+    'version': Optional[str],
+})
+
+
+MessagePopupGetPopupNotificationsResponseDict = TypedDict('MessagePopupGetPopupNotificationsResponseDict', {
+    'notifications': List['MessagePopupGetPopupNotificationsResponseNotificationsInnerDict'],
+    'unreadcount': Optional[int],
+})
+
+
+MessagePopupGetPopupNotificationsResponseNotificationsInnerDict = TypedDict('MessagePopupGetPopupNotificationsResponseNotificationsInnerDict', {
+    'component': NotRequired[Optional[str]],
+    'contexturl': Optional[str],
+    'contexturlname': Optional[str],
+    'customdata': NotRequired[Optional[str]],
+    'deleted': Optional[bool],
+    'eventtype': NotRequired[Optional[str]],
+    'fullmessage': Optional[str],
+    'fullmessageformat': Optional[int],
+    'fullmessagehtml': Optional[str],
+    'iconurl': Optional[str],
+    'id': Optional[int],
+    'read': Optional[bool],
+    'shortenedsubject': Optional[str],
+    'smallmessage': Optional[str],
+    'subject': Optional[str],
+    'text': Optional[str],
+    'timecreated': Optional[int],
+    'timecreatedpretty': Optional[str],
+    'timeread': Optional[int],
+    'useridfrom': Optional[int],
+    'useridto': Optional[int],
+})
+
+
+ModAssignGetAssignmentsResponseDict = TypedDict('ModAssignGetAssignmentsResponseDict', {
+    'courses': List['ModAssignGetAssignmentsResponseCoursesInnerDict'],
+    'warnings': NotRequired[Optional[List['ModAssignGetAssignmentsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetAssignmentsResponseCoursesInnerDict = TypedDict('ModAssignGetAssignmentsResponseCoursesInnerDict', {
+    'assignments': List['ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerDict'],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'shortname': Optional[str],
+    'timemodified': Optional[int],
+})
+
+
+ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerDict = TypedDict('ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerDict', {
+    'activity': NotRequired[Optional[str]],
+    'activityattachments': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'activityformat': NotRequired[Optional[int]],
+    'allowsubmissionsfromdate': Optional[int],
+    'attemptreopenmethod': Optional[str],
+    'blindmarking': Optional[int],
+    'cmid': Optional[int],
+    'completionsubmit': Optional[int],
+    'configs': List['ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerConfigsInnerDict'],
+    'course': Optional[int],
+    'cutoffdate': Optional[int],
+    'duedate': Optional[int],
+    'grade': Optional[int],
+    'gradepenalty': Optional[int],
+    'gradingduedate': Optional[int],
+    'hidegrader': Optional[int],
+    'id': Optional[int],
+    'intro': NotRequired[Optional[str]],
+    'introattachments': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'markingallocation': Optional[int],
+    'markinganonymous': Optional[int],
+    'markingworkflow': Optional[int],
+    'maxattempts': Optional[int],
+    'name': Optional[str],
+    'nosubmissions': Optional[int],
+    'preventsubmissionnotingroup': NotRequired[Optional[int]],
+    'requireallteammemberssubmit': Optional[int],
+    'requiresubmissionstatement': Optional[int],
+    'revealidentities': Optional[int],
+    'sendlatenotifications': Optional[int],
+    'sendnotifications': Optional[int],
+    'sendstudentnotifications': Optional[int],
+    'submissionattachments': NotRequired[Optional[int]],
+    'submissiondrafts': Optional[int],
+    'submissionstatement': NotRequired[Optional[str]],
+    'submissionstatementformat': NotRequired[Optional[int]],
+    'teamsubmission': Optional[int],
+    'teamsubmissiongroupingid': Optional[int],
+    'timelimit': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+})
+
+
+ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerConfigsInnerDict = TypedDict('ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerConfigsInnerDict', {
+    'assignment': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'name': Optional[str],
+    'plugin': Optional[str],
+    'subtype': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModAssignGetAssignmentsResponseWarningsInnerDict = TypedDict('ModAssignGetAssignmentsResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+ModAssignGetGradesResponseDict = TypedDict('ModAssignGetGradesResponseDict', {
+    'assignments': List['ModAssignGetGradesResponseAssignmentsInnerDict'],
+    'warnings': NotRequired[Optional[List['ModAssignGetGradesResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetGradesResponseAssignmentsInnerDict = TypedDict('ModAssignGetGradesResponseAssignmentsInnerDict', {
+    'assignmentid': Optional[int],
+    'grades': List['ModAssignGetGradesResponseAssignmentsInnerGradesInnerDict'],
+})
+
+
+ModAssignGetGradesResponseAssignmentsInnerGradesInnerDict = TypedDict('ModAssignGetGradesResponseAssignmentsInnerGradesInnerDict', {
+    'assignment': NotRequired[Optional[int]],
+    'attemptnumber': Optional[int],
+    'grade': Optional[str],
+    'gradefordisplay': NotRequired[Optional[str]],
+    'grader': Optional[int],
+    'id': Optional[int],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModAssignGetGradesResponseWarningsInnerDict = TypedDict('ModAssignGetGradesResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+ModAssignGetParticipantResponseDict = TypedDict('ModAssignGetParticipantResponseDict', {
+    'allowsubmissionsfromdate': Optional[int],
+    'blindmarking': Optional[bool],
+    'cutoffdate': Optional[int],
+    'duedate': Optional[int],
+    'duedatestr': Optional[str],
+    'fullname': Optional[str],
+    'grantedextension': Optional[bool],
+    'groupid': NotRequired[Optional[int]],
+    'groupname': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'requiregrading': Optional[bool],
+    'submissionstatus': NotRequired[Optional[str]],
+    'submitted': Optional[bool],
+    'user': NotRequired[Optional['CoreEnrolGetPotentialUsersResponseInnerDict']],
+})
+
+
+ModAssignGetSubmissionStatusResponseDict = TypedDict('ModAssignGetSubmissionStatusResponseDict', {
+    'assignmentdata': NotRequired[Optional['ModAssignGetSubmissionStatusResponseAssignmentdataDict']],
+    'feedback': NotRequired[Optional['ModAssignGetSubmissionStatusResponseFeedbackDict']],
+    'gradingsummary': NotRequired[Optional['ModAssignGetSubmissionStatusResponseGradingsummaryDict']],
+    'lastattempt': NotRequired[Optional['ModAssignGetSubmissionStatusResponseLastattemptDict']],
+    'previousattempts': NotRequired[Optional[List['ModAssignGetSubmissionStatusResponsePreviousattemptsInnerDict']]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetSubmissionStatusResponseAssignmentdataDict = TypedDict('ModAssignGetSubmissionStatusResponseAssignmentdataDict', {
+    'activity': NotRequired[Optional[str]],
+    'activityformat': NotRequired[Optional[int]],
+    'attachments': NotRequired[Optional['ModAssignGetSubmissionStatusResponseAssignmentdataAttachmentsDict']],
+})
+
+
+ModAssignGetSubmissionStatusResponseAssignmentdataAttachmentsDict = TypedDict('ModAssignGetSubmissionStatusResponseAssignmentdataAttachmentsDict', {
+    'activity': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'intro': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+})
+
+
+ModAssignGetSubmissionStatusResponseFeedbackDict = TypedDict('ModAssignGetSubmissionStatusResponseFeedbackDict', {
+    'grade': NotRequired[Optional['ModAssignGetGradesResponseAssignmentsInnerGradesInnerDict']],
+    'gradeddate': Optional[int],
+    'gradefordisplay': Optional[str],
+    'plugins': NotRequired[Optional[List['ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerDict']]],
+})
+
+
+ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerDict = TypedDict('ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerDict', {
+    'editorfields': NotRequired[Optional[List['ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerEditorfieldsInnerDict']]],
+    'fileareas': NotRequired[Optional[List['ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerFileareasInnerDict']]],
+    'name': Optional[str],
+    'type': Optional[str],
+})
+
+
+ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerEditorfieldsInnerDict = TypedDict('ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerEditorfieldsInnerDict', {
+    'description': Optional[str],
+    'format': Optional[int],
+    'name': Optional[str],
+    'text': Optional[str],
+})
+
+
+ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerFileareasInnerDict = TypedDict('ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerFileareasInnerDict', {
+    'area': Optional[str],
+    'files': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+})
+
+
+ModAssignGetSubmissionStatusResponseGradingsummaryDict = TypedDict('ModAssignGetSubmissionStatusResponseGradingsummaryDict', {
+    'participantcount': Optional[int],
+    'submissiondraftscount': Optional[int],
+    'submissionsenabled': Optional[bool],
+    'submissionsneedgradingcount': Optional[int],
+    'submissionssubmittedcount': Optional[int],
+    'warnofungroupedusers': Optional[str],
+})
+
+
+ModAssignGetSubmissionStatusResponseLastattemptDict = TypedDict('ModAssignGetSubmissionStatusResponseLastattemptDict', {
+    'blindmarking': Optional[bool],
+    'canedit': Optional[bool],
+    'caneditowner': Optional[bool],
+    'cansubmit': Optional[bool],
+    'extensionduedate': Optional[int],
+    'graded': Optional[bool],
+    'gradingstatus': Optional[str],
+    'locked': Optional[bool],
+    'submission': NotRequired[Optional['ModAssignGetSubmissionStatusResponseLastattemptSubmissionDict']],
+    'submissiongroup': NotRequired[Optional[int]],
+    'submissiongroupmemberswhoneedtosubmit': NotRequired[Optional[List[int]]],
+    'submissionsenabled': Optional[bool],
+    'teamsubmission': NotRequired[Optional['ModAssignGetSubmissionStatusResponseLastattemptSubmissionDict']],
+    'timelimit': NotRequired[Optional[int]],
+    'usergroups': List[int],
+})
+
+
+ModAssignGetSubmissionStatusResponseLastattemptSubmissionDict = TypedDict('ModAssignGetSubmissionStatusResponseLastattemptSubmissionDict', {
+    'assignment': NotRequired[Optional[int]],
+    'attemptnumber': Optional[int],
+    'gradingstatus': NotRequired[Optional[str]],
+    'groupid': Optional[int],
+    'id': Optional[int],
+    'latest': NotRequired[Optional[int]],
+    'plugins': NotRequired[Optional[List['ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerDict']]],
+    'status': Optional[str],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'timestarted': NotRequired[Optional[int]],
+    'userid': Optional[int],
+})
+
+
+ModAssignGetSubmissionStatusResponsePreviousattemptsInnerDict = TypedDict('ModAssignGetSubmissionStatusResponsePreviousattemptsInnerDict', {
+    'attemptnumber': Optional[int],
+    'feedbackplugins': NotRequired[Optional[List['ModAssignGetSubmissionStatusResponseFeedbackPluginsInnerDict']]],
+    'grade': NotRequired[Optional['ModAssignGetGradesResponseAssignmentsInnerGradesInnerDict']],
+    'submission': NotRequired[Optional['ModAssignGetSubmissionStatusResponseLastattemptSubmissionDict']],
+})
+
+
+ModAssignGetSubmissionsResponseDict = TypedDict('ModAssignGetSubmissionsResponseDict', {
+    'assignments': List['ModAssignGetSubmissionsResponseAssignmentsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetSubmissionsResponseAssignmentsInnerDict = TypedDict('ModAssignGetSubmissionsResponseAssignmentsInnerDict', {
+    'assignmentid': Optional[int],
+    'submissions': List['ModAssignGetSubmissionStatusResponseLastattemptSubmissionDict'],
+})
+
+
+ModAssignGetUserFlagsResponseDict = TypedDict('ModAssignGetUserFlagsResponseDict', {
+    'assignments': List['ModAssignGetUserFlagsResponseAssignmentsInnerDict'],
+    'warnings': NotRequired[Optional[List['ModAssignGetUserFlagsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetUserFlagsResponseAssignmentsInnerDict = TypedDict('ModAssignGetUserFlagsResponseAssignmentsInnerDict', {
+    'assignmentid': Optional[int],
+    'userflags': List['ModAssignGetUserFlagsResponseAssignmentsInnerUserflagsInnerDict'],
+})
+
+
+ModAssignGetUserFlagsResponseAssignmentsInnerUserflagsInnerDict = TypedDict('ModAssignGetUserFlagsResponseAssignmentsInnerUserflagsInnerDict', {
+    'allocatedmarker': Optional[int],
+    'extensionduedate': Optional[int],
+    'id': Optional[int],
+    'locked': Optional[int],
+    'mailed': Optional[int],
+    'userid': Optional[int],
+    'workflowstate': NotRequired[Optional[str]],
+})
+
+
+ModAssignGetUserFlagsResponseWarningsInnerDict = TypedDict('ModAssignGetUserFlagsResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+ModAssignGetUserMappingsResponseDict = TypedDict('ModAssignGetUserMappingsResponseDict', {
+    'assignments': List['ModAssignGetUserMappingsResponseAssignmentsInnerDict'],
+    'warnings': NotRequired[Optional[List['ModAssignGetUserMappingsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetUserMappingsResponseAssignmentsInnerDict = TypedDict('ModAssignGetUserMappingsResponseAssignmentsInnerDict', {
+    'assignmentid': Optional[int],
+    'mappings': List['ModAssignGetUserMappingsResponseAssignmentsInnerMappingsInnerDict'],
+})
+
+
+ModAssignGetUserMappingsResponseAssignmentsInnerMappingsInnerDict = TypedDict('ModAssignGetUserMappingsResponseAssignmentsInnerMappingsInnerDict', {
+    'id': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModAssignGetUserMappingsResponseWarningsInnerDict = TypedDict('ModAssignGetUserMappingsResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+ModAssignListParticipantsResponseInnerDict = TypedDict('ModAssignListParticipantsResponseInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['CoreEnrolGetPotentialUsersResponseInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'email': NotRequired[Optional[str]],
+    'enrolledcourses': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerEnrolledcoursesInnerDict']]],
+    'firstaccess': NotRequired[Optional[int]],
+    'firstname': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'grantedextension': Optional[bool],
+    'groupid': NotRequired[Optional[int]],
+    'groupname': NotRequired[Optional[str]],
+    'groups': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersWithCapabilityResponseInnerUsersInnerGroupsInnerDict']]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'lastname': NotRequired[Optional[str]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['CoreEnrolGetPotentialUsersResponseInnerPreferencesInnerDict']]],
+    'profileimageurl': NotRequired[Optional[str]],
+    'profileimageurlsmall': NotRequired[Optional[str]],
+    'recordid': Optional[int],
+    'requiregrading': Optional[bool],
+    'roles': NotRequired[Optional[List['CoreEnrolGetEnrolledUsersResponseInnerRolesInnerDict']]],
+    'submissionstatus': NotRequired[Optional[str]],
+    'submitted': Optional[bool],
+    'suspended': NotRequired[Optional[bool]],
+    'trackforums': NotRequired[Optional[int]],
+    'username': NotRequired[Optional[str]],
+})
+
+
+ModAssignRemoveSubmissionResponseDict = TypedDict('ModAssignRemoveSubmissionResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignSaveGradeParametersAdvancedgradingdataDict = TypedDict('ModAssignSaveGradeParametersAdvancedgradingdataDict', {
+    'guide': NotRequired[Optional['ModAssignSaveGradeParametersAdvancedgradingdataGuideDict']],
+    'rubric': NotRequired[Optional['ModAssignSaveGradeParametersAdvancedgradingdataRubricDict']],
+})
+
+
+ModAssignSaveGradeParametersAdvancedgradingdataGuideDict = TypedDict('ModAssignSaveGradeParametersAdvancedgradingdataGuideDict', {
+    'criteria': List['ModAssignSaveGradeParametersAdvancedgradingdataGuideCriteriaInnerDict'],
+})
+
+
+ModAssignSaveGradeParametersAdvancedgradingdataGuideCriteriaInnerDict = TypedDict('ModAssignSaveGradeParametersAdvancedgradingdataGuideCriteriaInnerDict', {
+    'criterionid': Optional[int],
+    'fillings': NotRequired[Optional[List['ModAssignSaveGradeParametersAdvancedgradingdataGuideCriteriaInnerFillingsInnerDict']]],
+})
+
+
+ModAssignSaveGradeParametersAdvancedgradingdataGuideCriteriaInnerFillingsInnerDict = TypedDict('ModAssignSaveGradeParametersAdvancedgradingdataGuideCriteriaInnerFillingsInnerDict', {
+    'criterionid': Optional[int],
+    'levelid': NotRequired[Optional[int]],
+    'remark': NotRequired[Optional[str]],
+    'remarkformat': NotRequired[Optional[int]],
+    'score': Optional[float],
+})
+
+
+ModAssignSaveGradeParametersAdvancedgradingdataRubricDict = TypedDict('ModAssignSaveGradeParametersAdvancedgradingdataRubricDict', {
+    'criteria': List['ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerDict'],
+})
+
+
+ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerDict = TypedDict('ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerDict', {
+    'criterionid': Optional[int],
+    'fillings': NotRequired[Optional[List['ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerFillingsInnerDict']]],
+})
+
+
+ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerFillingsInnerDict = TypedDict('ModAssignSaveGradeParametersAdvancedgradingdataRubricCriteriaInnerFillingsInnerDict', {
+    'criterionid': Optional[int],
+    'levelid': NotRequired[Optional[int]],
+    'remark': NotRequired[Optional[str]],
+    'remarkformat': NotRequired[Optional[int]],
+})
+
+
+ModAssignSaveGradeParametersPlugindataDict = TypedDict('ModAssignSaveGradeParametersPlugindataDict', {
+    'assignfeedbackcomments_editor': NotRequired[Optional['ModAssignSaveGradeParametersPlugindataAssignfeedbackcommentsEditorDict']],
+    'files_filemanager': NotRequired[Optional[int]],
+})
+
+
+ModAssignSaveGradeParametersPlugindataAssignfeedbackcommentsEditorDict = TypedDict('ModAssignSaveGradeParametersPlugindataAssignfeedbackcommentsEditorDict', {
+    'format': Optional[int],
+    'text': Optional[str],
+})
+
+
+ModAssignSaveGradesParametersGradesInnerDict = TypedDict('ModAssignSaveGradesParametersGradesInnerDict', {
+    'addattempt': Optional[bool],
+    'advancedgradingdata': NotRequired[Optional['ModAssignSaveGradeParametersAdvancedgradingdataDict']],
+    'attemptnumber': Optional[int],
+    'grade': Optional[float],
+    'plugindata': NotRequired[Optional['ModAssignSaveGradeParametersPlugindataDict']],
+    'userid': Optional[int],
+    'workflowstate': Optional[str],
+})
+
+
+ModAssignSaveSubmissionParametersPlugindataDict = TypedDict('ModAssignSaveSubmissionParametersPlugindataDict', {
+    'files_filemanager': NotRequired[Optional[int]],
+    'onlinetext_editor': NotRequired[Optional['ModAssignSaveSubmissionParametersPlugindataOnlinetextEditorDict']],
+})
+
+
+ModAssignSaveSubmissionParametersPlugindataOnlinetextEditorDict = TypedDict('ModAssignSaveSubmissionParametersPlugindataOnlinetextEditorDict', {
+    'format': Optional[int],
+    'itemid': Optional[int],
+    'text': Optional[str],
+})
+
+
+ModAssignSetUserFlagsParametersUserflagsInnerDict = TypedDict('ModAssignSetUserFlagsParametersUserflagsInnerDict', {
+    'allocatedmarker': NotRequired[Optional[int]],
+    'extensionduedate': NotRequired[Optional[int]],
+    'locked': NotRequired[Optional[int]],
+    'mailed': NotRequired[Optional[int]],
+    'userid': Optional[int],
+    'workflowstate': NotRequired[Optional[str]],
+})
+
+
+ModAssignSetUserFlagsResponseInnerDict = TypedDict('ModAssignSetUserFlagsResponseInnerDict', {
+    'errormessage': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModAssignStartSubmissionResponseDict = TypedDict('ModAssignStartSubmissionResponseDict', {
+    'submissionid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignViewAssignResponseDict = TypedDict('ModAssignViewAssignResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignViewGradingTableResponseDict = TypedDict('ModAssignViewGradingTableResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignViewSubmissionStatusResponseDict = TypedDict('ModAssignViewSubmissionStatusResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBigbluebuttonbnCanJoinResponseDict = TypedDict('ModBigbluebuttonbnCanJoinResponseDict', {
+    'can_join': Optional[bool],
+    'cmid': Optional[int],
+})
+
+
+ModBigbluebuttonbnCompletionValidateResponseDict = TypedDict('ModBigbluebuttonbnCompletionValidateResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBigbluebuttonbnEndMeetingResponseDict = TypedDict('ModBigbluebuttonbnEndMeetingResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBigbluebuttonbnGetBigbluebuttonbnsByCoursesResponseDict = TypedDict('ModBigbluebuttonbnGetBigbluebuttonbnsByCoursesResponseDict', {
+    'bigbluebuttonbns': List['ModBigbluebuttonbnGetBigbluebuttonbnsByCoursesResponseBigbluebuttonbnsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBigbluebuttonbnGetBigbluebuttonbnsByCoursesResponseBigbluebuttonbnsInnerDict = TypedDict('ModBigbluebuttonbnGetBigbluebuttonbnsByCoursesResponseBigbluebuttonbnsInnerDict', {
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'meetingid': Optional[str],
+    'name': Optional[str],
+    'section': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModBigbluebuttonbnGetJoinUrlResponseDict = TypedDict('ModBigbluebuttonbnGetJoinUrlResponseDict', {
+    'join_url': NotRequired[Optional[str]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBigbluebuttonbnGetRecordingsResponseDict = TypedDict('ModBigbluebuttonbnGetRecordingsResponseDict', {
+    'status': Optional[bool],
+    'tabledata': NotRequired[Optional['ModBigbluebuttonbnGetRecordingsResponseTabledataDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBigbluebuttonbnGetRecordingsResponseTabledataDict = TypedDict('ModBigbluebuttonbnGetRecordingsResponseTabledataDict', {
+    'activity': Optional[str],
+    'columns': List['ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInnerDict'],
+    'data': Optional[str],
+    'locale': Optional[str],
+    'ping_interval': Optional[int],
+    'profile_features': List[str],
+})
+
+
+ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInnerDict = TypedDict('ModBigbluebuttonbnGetRecordingsResponseTabledataColumnsInnerDict', {
+    'allowHTML': NotRequired[Optional[bool]],
+    'formatter': NotRequired[Optional[str]],
+    'key': Optional[str],
+    'label': Optional[str],
+    'sortable': NotRequired[Optional[bool]],
+    'type': NotRequired[Optional[str]],
+    'width': Optional[str],
+})
+
+
+ModBigbluebuttonbnGetRecordingsToImportResponseDict = TypedDict('ModBigbluebuttonbnGetRecordingsToImportResponseDict', {
+    'status': Optional[bool],
+    'tabledata': NotRequired[Optional['ModBigbluebuttonbnGetRecordingsResponseTabledataDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBigbluebuttonbnMeetingInfoResponseDict = TypedDict('ModBigbluebuttonbnMeetingInfoResponseDict', {
+    'bigbluebuttonbnid': Optional[str],
+    'canjoin': Optional[bool],
+    'closingtime': NotRequired[Optional[int]],
+    'cmid': Optional[int],
+    'features': NotRequired[Optional[List['ModBigbluebuttonbnMeetingInfoResponseFeaturesInnerDict']]],
+    'groupid': NotRequired[Optional[int]],
+    'guestaccessenabled': NotRequired[Optional[bool]],
+    'guestjoinurl': NotRequired[Optional[str]],
+    'guestpassword': NotRequired[Optional[str]],
+    'ismoderator': Optional[bool],
+    'joinurl': Optional[str],
+    'meetingid': Optional[str],
+    'moderatorcount': NotRequired[Optional[int]],
+    'moderatorplural': NotRequired[Optional[bool]],
+    'openingtime': NotRequired[Optional[int]],
+    'participantcount': NotRequired[Optional[int]],
+    'participantplural': NotRequired[Optional[bool]],
+    'presentations': List['ModBigbluebuttonbnMeetingInfoResponsePresentationsInnerDict'],
+    'showpresentations': NotRequired[Optional[bool]],
+    'startedat': NotRequired[Optional[int]],
+    'statusclosed': NotRequired[Optional[bool]],
+    'statusmessage': NotRequired[Optional[str]],
+    'statusopen': NotRequired[Optional[bool]],
+    'statusrunning': NotRequired[Optional[bool]],
+    'userlimit': Optional[int],
+})
+
+
+ModBigbluebuttonbnMeetingInfoResponseFeaturesInnerDict = TypedDict('ModBigbluebuttonbnMeetingInfoResponseFeaturesInnerDict', {
+    'isenabled': Optional[bool],
+    'name': Optional[str],
+})
+
+
+ModBigbluebuttonbnMeetingInfoResponsePresentationsInnerDict = TypedDict('ModBigbluebuttonbnMeetingInfoResponsePresentationsInnerDict', {
+    'icondesc': Optional[str],
+    'iconname': Optional[str],
+    'name': Optional[str],
+    'url': Optional[str],
+})
+
+
+ModBigbluebuttonbnViewBigbluebuttonbnResponseDict = TypedDict('ModBigbluebuttonbnViewBigbluebuttonbnResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBookGetBooksByCoursesResponseDict = TypedDict('ModBookGetBooksByCoursesResponseDict', {
+    'books': List['ModBookGetBooksByCoursesResponseBooksInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModBookGetBooksByCoursesResponseBooksInnerDict = TypedDict('ModBookGetBooksByCoursesResponseBooksInnerDict', {
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'customtitles': Optional[int],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'navstyle': Optional[int],
+    'numbering': Optional[int],
+    'revision': NotRequired[Optional[int]],
+    'section': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModBookViewBookResponseDict = TypedDict('ModBookViewBookResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModChoiceDeleteChoiceResponsesResponseDict = TypedDict('ModChoiceDeleteChoiceResponsesResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModChoiceGetChoiceOptionsResponseDict = TypedDict('ModChoiceGetChoiceOptionsResponseDict', {
+    'options': List['ModChoiceGetChoiceOptionsResponseOptionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModChoiceGetChoiceOptionsResponseOptionsInnerDict = TypedDict('ModChoiceGetChoiceOptionsResponseOptionsInnerDict', {
+    'checked': Optional[bool],
+    'countanswers': Optional[int],
+    'disabled': Optional[bool],
+    'displaylayout': Optional[bool],
+    'id': Optional[int],
+    'maxanswers': Optional[int],
+    'text': Optional[str],
+})
+
+
+ModChoiceGetChoiceResultsResponseDict = TypedDict('ModChoiceGetChoiceResultsResponseDict', {
+    'options': List['ModChoiceGetChoiceResultsResponseOptionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModChoiceGetChoiceResultsResponseOptionsInnerDict = TypedDict('ModChoiceGetChoiceResultsResponseOptionsInnerDict', {
+    'id': Optional[int],
+    'maxanswer': Optional[int],
+    'numberofuser': Optional[int],
+    'percentageamount': Optional[float],
+    'text': Optional[str],
+    'userresponses': List['ModChoiceGetChoiceResultsResponseOptionsInnerUserresponsesInnerDict'],
+})
+
+
+ModChoiceGetChoiceResultsResponseOptionsInnerUserresponsesInnerDict = TypedDict('ModChoiceGetChoiceResultsResponseOptionsInnerUserresponsesInnerDict', {
+    'answerid': NotRequired[Optional[int]],
+    'fullname': Optional[str],
+    'profileimageurl': Optional[str],
+    'timemodified': NotRequired[Optional[int]],
+    'userid': Optional[int],
+})
+
+
+ModChoiceGetChoicesByCoursesResponseDict = TypedDict('ModChoiceGetChoicesByCoursesResponseDict', {
+    'choices': List['ModChoiceGetChoicesByCoursesResponseChoicesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModChoiceGetChoicesByCoursesResponseChoicesInnerDict = TypedDict('ModChoiceGetChoicesByCoursesResponseChoicesInnerDict', {
+    'allowmultiple': NotRequired[Optional[bool]],
+    'allowupdate': NotRequired[Optional[bool]],
+    'completionsubmit': NotRequired[Optional[bool]],
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'display': NotRequired[Optional[int]],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'includeinactive': NotRequired[Optional[bool]],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'limitanswers': NotRequired[Optional[bool]],
+    'name': Optional[str],
+    'publish': NotRequired[Optional[bool]],
+    'section': NotRequired[Optional[int]],
+    'showavailable': NotRequired[Optional[bool]],
+    'showpreview': NotRequired[Optional[bool]],
+    'showresults': NotRequired[Optional[int]],
+    'showunanswered': NotRequired[Optional[bool]],
+    'timeclose': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'timeopen': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModChoiceSubmitChoiceResponseResponseDict = TypedDict('ModChoiceSubmitChoiceResponseResponseDict', {
+    'answers': List['ModChoiceSubmitChoiceResponseResponseAnswersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModChoiceSubmitChoiceResponseResponseAnswersInnerDict = TypedDict('ModChoiceSubmitChoiceResponseResponseAnswersInnerDict', {
+    'choiceid': Optional[int],
+    'id': Optional[int],
+    'optionid': Optional[int],
+    'timemodified': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModChoiceViewChoiceResponseDict = TypedDict('ModChoiceViewChoiceResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataAddEntryParametersDataInnerDict = TypedDict('ModDataAddEntryParametersDataInnerDict', {
+    'fieldid': Optional[int],
+    'subfield': NotRequired[Optional[str]],
+    'value': Optional[str],
+})
+
+
+ModDataAddEntryResponseDict = TypedDict('ModDataAddEntryResponseDict', {
+    'fieldnotifications': List['ModDataAddEntryResponseFieldnotificationsInnerDict'],
+    'generalnotifications': List[str],
+    'newentryid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataAddEntryResponseFieldnotificationsInnerDict = TypedDict('ModDataAddEntryResponseFieldnotificationsInnerDict', {
+    'fieldname': Optional[str],
+    'notification': Optional[str],
+})
+
+
+ModDataApproveEntryResponseDict = TypedDict('ModDataApproveEntryResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataDeleteEntryResponseDict = TypedDict('ModDataDeleteEntryResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataDeleteSavedPresetResponseDict = TypedDict('ModDataDeleteSavedPresetResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataGetDataAccessInformationResponseDict = TypedDict('ModDataGetDataAccessInformationResponseDict', {
+    'canaddentry': Optional[bool],
+    'canapprove': Optional[bool],
+    'canmanageentries': Optional[bool],
+    'entrieslefttoadd': Optional[int],
+    'entrieslefttoview': Optional[int],
+    'groupid': Optional[int],
+    'inreadonlyperiod': Optional[bool],
+    'numentries': Optional[int],
+    'timeavailable': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataGetDatabasesByCoursesResponseDict = TypedDict('ModDataGetDatabasesByCoursesResponseDict', {
+    'databases': List['ModDataGetDatabasesByCoursesResponseDatabasesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataGetDatabasesByCoursesResponseDatabasesInnerDict = TypedDict('ModDataGetDatabasesByCoursesResponseDatabasesInnerDict', {
+    'addtemplate': Optional[str],
+    'approval': bool,
+    'asearchtemplate': Optional[str],
+    'assessed': NotRequired[Optional[int]],
+    'assesstimefinish': NotRequired[Optional[int]],
+    'assesstimestart': NotRequired[Optional[int]],
+    'comments': bool,
+    'course': int,
+    'coursemodule': int,
+    'csstemplate': Optional[str],
+    'defaultsort': int,
+    'defaultsortdir': int,
+    'editany': NotRequired[Optional[bool]],
+    'id': int,
+    'intro': str,
+    'introfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'jstemplate': Optional[str],
+    'lang': Optional[str],
+    'listtemplate': Optional[str],
+    'listtemplatefooter': Optional[str],
+    'listtemplateheader': Optional[str],
+    'manageapproved': bool,
+    'maxentries': int,
+    'name': str,
+    'notification': NotRequired[Optional[int]],
+    'requiredentries': int,
+    'requiredentriestoview': int,
+    'rssarticles': int,
+    'rsstemplate': Optional[str],
+    'rsstitletemplate': Optional[str],
+    'scale': NotRequired[Optional[int]],
+    'singletemplate': Optional[str],
+    'timeavailablefrom': int,
+    'timeavailableto': int,
+    'timemodified': NotRequired[Optional[int]],
+    'timeviewfrom': int,
+    'timeviewto': int,
+})
+
+
+ModDataGetEntriesResponseDict = TypedDict('ModDataGetEntriesResponseDict', {
+    'entries': List['ModDataGetEntriesResponseEntriesInnerDict'],
+    'listviewcontents': NotRequired[Optional[str]],
+    'totalcount': Optional[int],
+    'totalfilesize': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataGetEntriesResponseEntriesInnerDict = TypedDict('ModDataGetEntriesResponseEntriesInnerDict', {
+    'approved': bool,
+    'canmanageentry': bool,
+    'contents': NotRequired[Optional[List['ModDataGetEntriesResponseEntriesInnerContentsInnerDict']]],
+    'dataid': int,
+    'fullname': NotRequired[Optional[str]],
+    'groupid': int,
+    'id': int,
+    'tags': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict']]],
+    'timecreated': int,
+    'timemodified': int,
+    'userid': int,
+})
+
+
+ModDataGetEntriesResponseEntriesInnerContentsInnerDict = TypedDict('ModDataGetEntriesResponseEntriesInnerContentsInnerDict', {
+    'content': Optional[str],
+    'content1': Optional[str],
+    'content2': Optional[str],
+    'content3': Optional[str],
+    'content4': Optional[str],
+    'fieldid': int,
+    'files': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'id': int,
+    'recordid': int,
+})
+
+
+ModDataGetEntryResponseDict = TypedDict('ModDataGetEntryResponseDict', {
+    'entry': 'ModDataGetEntriesResponseEntriesInnerDict',
+    'entryviewcontents': NotRequired[Optional[str]],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataGetEntryResponseRatinginfoDict = TypedDict('ModDataGetEntryResponseRatinginfoDict', {
+    'canviewall': NotRequired[Optional[bool]],
+    'canviewany': NotRequired[Optional[bool]],
+    'component': Optional[str],
+    'contextid': Optional[int],
+    'ratingarea': Optional[str],
+    'ratings': NotRequired[Optional[List['ModDataGetEntryResponseRatinginfoRatingsInnerDict']]],
+    'scales': NotRequired[Optional[List['ModDataGetEntryResponseRatinginfoScalesInnerDict']]],
+})
+
+
+ModDataGetEntryResponseRatinginfoRatingsInnerDict = TypedDict('ModDataGetEntryResponseRatinginfoRatingsInnerDict', {
+    'aggregate': NotRequired[Optional[float]],
+    'aggregatelabel': NotRequired[Optional[str]],
+    'aggregatestr': NotRequired[Optional[str]],
+    'canrate': NotRequired[Optional[bool]],
+    'canviewaggregate': NotRequired[Optional[bool]],
+    'count': NotRequired[Optional[int]],
+    'itemid': Optional[int],
+    'rating': NotRequired[Optional[int]],
+    'scaleid': NotRequired[Optional[int]],
+    'userid': NotRequired[Optional[int]],
+})
+
+
+ModDataGetEntryResponseRatinginfoScalesInnerDict = TypedDict('ModDataGetEntryResponseRatinginfoScalesInnerDict', {
+    'courseid': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'isnumeric': Optional[bool],
+    'items': NotRequired[Optional[List['ModDataGetEntryResponseRatinginfoScalesInnerItemsInnerDict']]],
+    'max': Optional[int],
+    'name': NotRequired[Optional[str]],
+})
+
+
+ModDataGetEntryResponseRatinginfoScalesInnerItemsInnerDict = TypedDict('ModDataGetEntryResponseRatinginfoScalesInnerItemsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[int],
+})
+
+
+ModDataGetFieldsResponseDict = TypedDict('ModDataGetFieldsResponseDict', {
+    'fields': List['ModDataGetFieldsResponseFieldsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataGetFieldsResponseFieldsInnerDict = TypedDict('ModDataGetFieldsResponseFieldsInnerDict', {
+    'dataid': int,
+    'description': str,
+    'id': int,
+    'name': str,
+    'param1': Optional[str],
+    'param10': Optional[str],
+    'param2': Optional[str],
+    'param3': Optional[str],
+    'param4': Optional[str],
+    'param5': Optional[str],
+    'param6': Optional[str],
+    'param7': Optional[str],
+    'param8': Optional[str],
+    'param9': Optional[str],
+    'required': bool,
+    'type': str,
+})
+
+
+ModDataGetMappingInformationResponseDict = TypedDict('ModDataGetMappingInformationResponseDict', {
+    'data': NotRequired[Optional['ModDataGetMappingInformationResponseDataDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataGetMappingInformationResponseDataDict = TypedDict('ModDataGetMappingInformationResponseDataDict', {
+    'fieldstocreate': Optional[str],
+    'fieldstoremove': Optional[str],
+    'needsmapping': Optional[bool],
+    'presetname': Optional[str],
+})
+
+
+ModDataSearchEntriesParametersAdvsearchInnerDict = TypedDict('ModDataSearchEntriesParametersAdvsearchInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModDataSearchEntriesResponseDict = TypedDict('ModDataSearchEntriesResponseDict', {
+    'entries': List['ModDataGetEntriesResponseEntriesInnerDict'],
+    'listviewcontents': NotRequired[Optional[str]],
+    'maxcount': NotRequired[Optional[int]],
+    'totalcount': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataUpdateEntryParametersDataInnerDict = TypedDict('ModDataUpdateEntryParametersDataInnerDict', {
+    'fieldid': Optional[int],
+    'subfield': NotRequired[Optional[str]],
+    'value': Optional[str],
+})
+
+
+ModDataUpdateEntryResponseDict = TypedDict('ModDataUpdateEntryResponseDict', {
+    'fieldnotifications': List['ModDataAddEntryResponseFieldnotificationsInnerDict'],
+    'generalnotifications': List[str],
+    'updated': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModDataViewDatabaseResponseDict = TypedDict('ModDataViewDatabaseResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetAnalysisResponseDict = TypedDict('ModFeedbackGetAnalysisResponseDict', {
+    'completedcount': Optional[int],
+    'itemscount': Optional[int],
+    'itemsdata': List['ModFeedbackGetAnalysisResponseItemsdataInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetAnalysisResponseItemsdataInnerDict = TypedDict('ModFeedbackGetAnalysisResponseItemsdataInnerDict', {
+    'data': List[str],
+    'item': 'ModFeedbackGetAnalysisResponseItemsdataInnerItemDict',
+})
+
+
+ModFeedbackGetAnalysisResponseItemsdataInnerItemDict = TypedDict('ModFeedbackGetAnalysisResponseItemsdataInnerItemDict', {
+    'dependitem': int,
+    'dependvalue': str,
+    'feedback': int,
+    'hasvalue': int,
+    'id': int,
+    'itemfiles': List['CoreCompetencyReadUserEvidenceResponseFilesInnerDict'],
+    'itemnumber': Optional[int],
+    'label': str,
+    'name': str,
+    'nameformat': NotRequired[Optional[int]],
+    'options': str,
+    'otherdata': Optional[str],
+    'position': int,
+    'presentation': str,
+    'presentationformat': NotRequired[Optional[int]],
+    'required': bool,
+    'template': int,
+    'typ': str,
+})
+
+
+ModFeedbackGetCurrentCompletedTmpResponseDict = TypedDict('ModFeedbackGetCurrentCompletedTmpResponseDict', {
+    'feedback': 'ModFeedbackGetCurrentCompletedTmpResponseFeedbackDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetCurrentCompletedTmpResponseFeedbackDict = TypedDict('ModFeedbackGetCurrentCompletedTmpResponseFeedbackDict', {
+    'anonymous_response': int,
+    'courseid': int,
+    'feedback': int,
+    'guestid': str,
+    'id': int,
+    'random_response': int,
+    'timemodified': int,
+    'userid': int,
+})
+
+
+ModFeedbackGetFeedbackAccessInformationResponseDict = TypedDict('ModFeedbackGetFeedbackAccessInformationResponseDict', {
+    'cancomplete': Optional[bool],
+    'candeletesubmissions': Optional[bool],
+    'canedititems': Optional[bool],
+    'cansubmit': Optional[bool],
+    'canviewanalysis': Optional[bool],
+    'canviewreports': Optional[bool],
+    'isalreadysubmitted': Optional[bool],
+    'isanonymous': Optional[bool],
+    'isempty': Optional[bool],
+    'isopen': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetFeedbacksByCoursesResponseDict = TypedDict('ModFeedbackGetFeedbacksByCoursesResponseDict', {
+    'feedbacks': List['ModFeedbackGetFeedbacksByCoursesResponseFeedbacksInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetFeedbacksByCoursesResponseFeedbacksInnerDict = TypedDict('ModFeedbackGetFeedbacksByCoursesResponseFeedbacksInnerDict', {
+    'anonymous': int,
+    'autonumbering': bool,
+    'completionsubmit': bool,
+    'course': int,
+    'coursemodule': int,
+    'email_notification': NotRequired[Optional[bool]],
+    'id': int,
+    'intro': str,
+    'introfiles': List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict'],
+    'introformat': NotRequired[Optional[int]],
+    'lang': Optional[str],
+    'multiple_submit': bool,
+    'name': str,
+    'page_after_submit': NotRequired[Optional[str]],
+    'page_after_submitformat': NotRequired[Optional[int]],
+    'pageaftersubmitfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'publish_stats': bool,
+    'site_after_submit': NotRequired[Optional[str]],
+    'timeclose': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'timeopen': NotRequired[Optional[int]],
+})
+
+
+ModFeedbackGetFinishedResponsesResponseDict = TypedDict('ModFeedbackGetFinishedResponsesResponseDict', {
+    'responses': List['ModFeedbackGetFinishedResponsesResponseResponsesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetFinishedResponsesResponseResponsesInnerDict = TypedDict('ModFeedbackGetFinishedResponsesResponseResponsesInnerDict', {
+    'completed': int,
+    'course_id': int,
+    'id': int,
+    'item': int,
+    'tmp_completed': int,
+    'value': str,
+})
+
+
+ModFeedbackGetItemsResponseDict = TypedDict('ModFeedbackGetItemsResponseDict', {
+    'items': List['ModFeedbackGetAnalysisResponseItemsdataInnerItemDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetLastCompletedResponseDict = TypedDict('ModFeedbackGetLastCompletedResponseDict', {
+    'completed': 'ModFeedbackGetLastCompletedResponseCompletedDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetLastCompletedResponseCompletedDict = TypedDict('ModFeedbackGetLastCompletedResponseCompletedDict', {
+    'anonymous_response': int,
+    'courseid': int,
+    'feedback': int,
+    'id': int,
+    'random_response': int,
+    'timemodified': int,
+    'userid': int,
+})
+
+
+ModFeedbackGetNonRespondentsResponseDict = TypedDict('ModFeedbackGetNonRespondentsResponseDict', {
+    'total': Optional[int],
+    'users': List['ModFeedbackGetNonRespondentsResponseUsersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetNonRespondentsResponseUsersInnerDict = TypedDict('ModFeedbackGetNonRespondentsResponseUsersInnerDict', {
+    'courseid': Optional[int],
+    'fullname': Optional[str],
+    'started': Optional[bool],
+    'userid': Optional[int],
+})
+
+
+ModFeedbackGetPageItemsResponseDict = TypedDict('ModFeedbackGetPageItemsResponseDict', {
+    'hasnextpage': Optional[bool],
+    'hasprevpage': Optional[bool],
+    'items': List['ModFeedbackGetAnalysisResponseItemsdataInnerItemDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetResponsesAnalysisResponseDict = TypedDict('ModFeedbackGetResponsesAnalysisResponseDict', {
+    'anonattempts': List['ModFeedbackGetResponsesAnalysisResponseAnonattemptsInnerDict'],
+    'attempts': List['ModFeedbackGetResponsesAnalysisResponseAttemptsInnerDict'],
+    'totalanonattempts': Optional[int],
+    'totalattempts': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetResponsesAnalysisResponseAnonattemptsInnerDict = TypedDict('ModFeedbackGetResponsesAnalysisResponseAnonattemptsInnerDict', {
+    'courseid': Optional[int],
+    'id': Optional[int],
+    'number': Optional[int],
+    'responses': List['ModFeedbackGetResponsesAnalysisResponseAnonattemptsInnerResponsesInnerDict'],
+})
+
+
+ModFeedbackGetResponsesAnalysisResponseAnonattemptsInnerResponsesInnerDict = TypedDict('ModFeedbackGetResponsesAnalysisResponseAnonattemptsInnerResponsesInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+    'printval': Optional[str],
+    'rawval': Optional[str],
+})
+
+
+ModFeedbackGetResponsesAnalysisResponseAttemptsInnerDict = TypedDict('ModFeedbackGetResponsesAnalysisResponseAttemptsInnerDict', {
+    'courseid': Optional[int],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'responses': List['ModFeedbackGetResponsesAnalysisResponseAnonattemptsInnerResponsesInnerDict'],
+    'timemodified': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModFeedbackGetUnfinishedResponsesResponseDict = TypedDict('ModFeedbackGetUnfinishedResponsesResponseDict', {
+    'responses': List['ModFeedbackGetUnfinishedResponsesResponseResponsesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackGetUnfinishedResponsesResponseResponsesInnerDict = TypedDict('ModFeedbackGetUnfinishedResponsesResponseResponsesInnerDict', {
+    'completed': int,
+    'course_id': int,
+    'id': int,
+    'item': int,
+    'tmp_completed': int,
+    'value': str,
+})
+
+
+ModFeedbackLaunchFeedbackResponseDict = TypedDict('ModFeedbackLaunchFeedbackResponseDict', {
+    'gopage': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackProcessPageParametersResponsesInnerDict = TypedDict('ModFeedbackProcessPageParametersResponsesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModFeedbackProcessPageResponseDict = TypedDict('ModFeedbackProcessPageResponseDict', {
+    'completed': Optional[bool],
+    'completionpagecontents': Optional[str],
+    'jumpto': Optional[int],
+    'siteaftersubmit': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFeedbackViewFeedbackResponseDict = TypedDict('ModFeedbackViewFeedbackResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFolderGetFoldersByCoursesResponseDict = TypedDict('ModFolderGetFoldersByCoursesResponseDict', {
+    'folders': List['ModFolderGetFoldersByCoursesResponseFoldersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModFolderGetFoldersByCoursesResponseFoldersInnerDict = TypedDict('ModFolderGetFoldersByCoursesResponseFoldersInnerDict', {
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'display': Optional[int],
+    'forcedownload': Optional[int],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'revision': Optional[int],
+    'section': NotRequired[Optional[int]],
+    'showdownloadfolder': Optional[int],
+    'showexpanded': Optional[int],
+    'timemodified': Optional[int],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModFolderViewFolderResponseDict = TypedDict('ModFolderViewFolderResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumAddDiscussionParametersOptionsInnerDict = TypedDict('ModForumAddDiscussionParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModForumAddDiscussionPostParametersOptionsInnerDict = TypedDict('ModForumAddDiscussionPostParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModForumAddDiscussionPostResponseDict = TypedDict('ModForumAddDiscussionPostResponseDict', {
+    'messages': NotRequired[Optional[List['ModForumAddDiscussionPostResponseMessagesInnerDict']]],
+    'post': 'ModForumAddDiscussionPostResponsePostDict',
+    'postid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumAddDiscussionPostResponseMessagesInnerDict = TypedDict('ModForumAddDiscussionPostResponseMessagesInnerDict', {
+    'message': Optional[str],
+    'type': Optional[str],
+})
+
+
+ModForumAddDiscussionPostResponsePostDict = TypedDict('ModForumAddDiscussionPostResponsePostDict', {
+    'attachments': List['ModForumAddDiscussionPostResponsePostAttachmentsInnerDict'],
+    'author': 'ModForumAddDiscussionPostResponsePostAuthorDict',
+    'capabilities': 'ModForumAddDiscussionPostResponsePostCapabilitiesDict',
+    'charcount': NotRequired[Optional[int]],
+    'discussionid': int,
+    'hasparent': bool,
+    'haswordcount': bool,
+    'html': NotRequired[Optional['ModForumAddDiscussionPostResponsePostHtmlDict']],
+    'id': int,
+    'isdeleted': bool,
+    'isprivatereply': bool,
+    'message': str,
+    'messageformat': Optional[int],
+    'messageinlinefiles': NotRequired[Optional[List['CoreCompetencyReadUserEvidenceResponseFilesInnerDict']]],
+    'parentid': NotRequired[Optional[int]],
+    'replysubject': str,
+    'subject': str,
+    'tags': NotRequired[Optional[List['ModForumAddDiscussionPostResponsePostTagsInnerDict']]],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'unread': NotRequired[Optional[bool]],
+    'urls': NotRequired[Optional['ModForumAddDiscussionPostResponsePostUrlsDict']],
+    'wordcount': NotRequired[Optional[int]],
+})
+
+
+ModForumAddDiscussionPostResponsePostAttachmentsInnerDict = TypedDict('ModForumAddDiscussionPostResponsePostAttachmentsInnerDict', {
+    'author': str,
+    'component': str,
+    'contextid': int,
+    'filearea': str,
+    'filename': str,
+    'filenameshort': str,
+    'filepath': str,
+    'filesize': int,
+    'filesizeformatted': str,
+    'html': 'ModForumAddDiscussionPostResponsePostAttachmentsInnerHtmlDict',
+    'icon': str,
+    'isdir': bool,
+    'isimage': bool,
+    'itemid': int,
+    'license': str,
+    'timecreated': int,
+    'timecreatedformatted': str,
+    'timemodified': int,
+    'timemodifiedformatted': str,
+    'url': str,
+    'urls': 'ModForumAddDiscussionPostResponsePostAttachmentsInnerUrlsDict',
+})
+
+
+ModForumAddDiscussionPostResponsePostAttachmentsInnerHtmlDict = TypedDict('ModForumAddDiscussionPostResponsePostAttachmentsInnerHtmlDict', {
+    'plagiarism': NotRequired[Optional[str]],
+})
+
+
+ModForumAddDiscussionPostResponsePostAttachmentsInnerUrlsDict = TypedDict('ModForumAddDiscussionPostResponsePostAttachmentsInnerUrlsDict', {
+    'export': NotRequired[Optional[str]],
+})
+
+
+ModForumAddDiscussionPostResponsePostAuthorDict = TypedDict('ModForumAddDiscussionPostResponsePostAuthorDict', {
+    'fullname': NotRequired[Optional[str]],
+    'groups': NotRequired[Optional[List['ModForumAddDiscussionPostResponsePostAuthorGroupsInnerDict']]],
+    'id': NotRequired[Optional[int]],
+    'isdeleted': NotRequired[Optional[bool]],
+    'urls': 'ModForumAddDiscussionPostResponsePostAuthorUrlsDict',
+})
+
+
+ModForumAddDiscussionPostResponsePostAuthorGroupsInnerDict = TypedDict('ModForumAddDiscussionPostResponsePostAuthorGroupsInnerDict', {
+    'id': int,
+    'name': str,
+    'urls': 'ModForumAddDiscussionPostResponsePostAuthorGroupsInnerUrlsDict',
+})
+
+
+ModForumAddDiscussionPostResponsePostAuthorGroupsInnerUrlsDict = TypedDict('ModForumAddDiscussionPostResponsePostAuthorGroupsInnerUrlsDict', {
+    'image': NotRequired[Optional[str]],
+})
+
+
+ModForumAddDiscussionPostResponsePostAuthorUrlsDict = TypedDict('ModForumAddDiscussionPostResponsePostAuthorUrlsDict', {
+    'profile': NotRequired[Optional[str]],
+    'profileimage': NotRequired[Optional[str]],
+})
+
+
+ModForumAddDiscussionPostResponsePostCapabilitiesDict = TypedDict('ModForumAddDiscussionPostResponsePostCapabilitiesDict', {
+    'canreplyprivately': Optional[bool],
+    'controlreadstatus': Optional[bool],
+    'delete': Optional[bool],
+    'edit': Optional[bool],
+    'export': Optional[bool],
+    'reply': Optional[bool],
+    'selfenrol': Optional[bool],
+    'split': Optional[bool],
+    'view': Optional[bool],
+})
+
+
+ModForumAddDiscussionPostResponsePostHtmlDict = TypedDict('ModForumAddDiscussionPostResponsePostHtmlDict', {
+    'authorsubheading': NotRequired[Optional[str]],
+    'rating': NotRequired[Optional[str]],
+    'taglist': NotRequired[Optional[str]],
+})
+
+
+ModForumAddDiscussionPostResponsePostTagsInnerDict = TypedDict('ModForumAddDiscussionPostResponsePostTagsInnerDict', {
+    'displayname': str,
+    'flag': bool,
+    'id': int,
+    'isstandard': bool,
+    'tagid': int,
+    'urls': 'ModForumAddDiscussionPostResponsePostTagsInnerUrlsDict',
+})
+
+
+ModForumAddDiscussionPostResponsePostTagsInnerUrlsDict = TypedDict('ModForumAddDiscussionPostResponsePostTagsInnerUrlsDict', {
+    'view': str,
+})
+
+
+ModForumAddDiscussionPostResponsePostUrlsDict = TypedDict('ModForumAddDiscussionPostResponsePostUrlsDict', {
+    'delete': NotRequired[Optional[str]],
+    'discuss': NotRequired[Optional[str]],
+    'edit': NotRequired[Optional[str]],
+    'export': NotRequired[Optional[str]],
+    'markasread': NotRequired[Optional[str]],
+    'markasunread': NotRequired[Optional[str]],
+    'reply': NotRequired[Optional[str]],
+    'split': NotRequired[Optional[str]],
+    'view': NotRequired[Optional[str]],
+    'viewisolated': NotRequired[Optional[str]],
+    'viewparent': NotRequired[Optional[str]],
+})
+
+
+ModForumAddDiscussionResponseDict = TypedDict('ModForumAddDiscussionResponseDict', {
+    'discussionid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumCanAddDiscussionResponseDict = TypedDict('ModForumCanAddDiscussionResponseDict', {
+    'cancreateattachment': NotRequired[Optional[bool]],
+    'canpindiscussions': NotRequired[Optional[bool]],
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumDeletePostResponseDict = TypedDict('ModForumDeletePostResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumGetDiscussionPostResponseDict = TypedDict('ModForumGetDiscussionPostResponseDict', {
+    'post': 'ModForumAddDiscussionPostResponsePostDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumGetDiscussionPostsByUseridResponseDict = TypedDict('ModForumGetDiscussionPostsByUseridResponseDict', {
+    'discussions': List['ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerDict = TypedDict('ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerDict', {
+    'authorfullname': Optional[str],
+    'id': Optional[int],
+    'name': Optional[str],
+    'posts': 'ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerPostsDict',
+    'timecreated': Optional[int],
+})
+
+
+ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerPostsDict = TypedDict('ModForumGetDiscussionPostsByUseridResponseDiscussionsInnerPostsDict', {
+    'parentposts': List['ModForumAddDiscussionPostResponsePostDict'],
+    'userposts': List['ModForumAddDiscussionPostResponsePostDict'],
+})
+
+
+ModForumGetDiscussionPostsResponseDict = TypedDict('ModForumGetDiscussionPostsResponseDict', {
+    'courseid': Optional[int],
+    'forumid': Optional[int],
+    'posts': List['ModForumAddDiscussionPostResponsePostDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumGetForumAccessInformationResponseDict = TypedDict('ModForumGetForumAccessInformationResponseDict', {
+    'canaddinstance': NotRequired[Optional[bool]],
+    'canaddnews': NotRequired[Optional[bool]],
+    'canaddquestion': NotRequired[Optional[bool]],
+    'canallowforcesubscribe': NotRequired[Optional[bool]],
+    'cancanmailnow': NotRequired[Optional[bool]],
+    'cancanoverridecutoff': NotRequired[Optional[bool]],
+    'cancanoverridediscussionlock': NotRequired[Optional[bool]],
+    'cancanposttomygroups': NotRequired[Optional[bool]],
+    'cancantogglefavourite': NotRequired[Optional[bool]],
+    'cancreateattachment': NotRequired[Optional[bool]],
+    'candeleteanypost': NotRequired[Optional[bool]],
+    'candeleteownpost': NotRequired[Optional[bool]],
+    'caneditanypost': NotRequired[Optional[bool]],
+    'canexportdiscussion': NotRequired[Optional[bool]],
+    'canexportforum': NotRequired[Optional[bool]],
+    'canexportownpost': NotRequired[Optional[bool]],
+    'canexportpost': NotRequired[Optional[bool]],
+    'cangrade': NotRequired[Optional[bool]],
+    'canmanagesubscriptions': NotRequired[Optional[bool]],
+    'canmovediscussions': NotRequired[Optional[bool]],
+    'canpindiscussions': NotRequired[Optional[bool]],
+    'canpostprivatereply': NotRequired[Optional[bool]],
+    'canpostwithoutthrottling': NotRequired[Optional[bool]],
+    'canrate': NotRequired[Optional[bool]],
+    'canreadprivatereplies': NotRequired[Optional[bool]],
+    'canreplynews': NotRequired[Optional[bool]],
+    'canreplypost': NotRequired[Optional[bool]],
+    'cansplitdiscussions': NotRequired[Optional[bool]],
+    'canstartdiscussion': NotRequired[Optional[bool]],
+    'canviewallratings': NotRequired[Optional[bool]],
+    'canviewanyrating': NotRequired[Optional[bool]],
+    'canviewdiscussion': NotRequired[Optional[bool]],
+    'canviewhiddentimedposts': NotRequired[Optional[bool]],
+    'canviewqandawithoutposting': NotRequired[Optional[bool]],
+    'canviewrating': NotRequired[Optional[bool]],
+    'canviewsubscribers': NotRequired[Optional[bool]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumGetForumDiscussionsResponseDict = TypedDict('ModForumGetForumDiscussionsResponseDict', {
+    'discussions': List['ModForumGetForumDiscussionsResponseDiscussionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumGetForumDiscussionsResponseDiscussionsInnerDict = TypedDict('ModForumGetForumDiscussionsResponseDiscussionsInnerDict', {
+    'attachment': Optional[str],
+    'attachments': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'canfavourite': Optional[bool],
+    'canlock': Optional[bool],
+    'canreply': Optional[bool],
+    'created': Optional[int],
+    'discussion': Optional[int],
+    'groupid': Optional[int],
+    'id': Optional[int],
+    'locked': Optional[bool],
+    'mailed': Optional[int],
+    'mailnow': Optional[int],
+    'message': Optional[str],
+    'messageformat': Optional[int],
+    'messageinlinefiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'messagetrust': Optional[int],
+    'modified': Optional[int],
+    'name': Optional[str],
+    'numreplies': Optional[int],
+    'numunread': Optional[int],
+    'parent': Optional[int],
+    'pinned': Optional[bool],
+    'starred': Optional[bool],
+    'subject': Optional[str],
+    'timeend': Optional[int],
+    'timemodified': Optional[int],
+    'timestart': Optional[int],
+    'totalscore': Optional[int],
+    'userfullname': Optional[str],
+    'userid': Optional[int],
+    'usermodified': Optional[int],
+    'usermodifiedfullname': Optional[str],
+    'usermodifiedpictureurl': Optional[str],
+    'userpictureurl': Optional[str],
+})
+
+
+ModForumGetForumsByCoursesResponseInnerDict = TypedDict('ModForumGetForumsByCoursesResponseInnerDict', {
+    'assessed': Optional[int],
+    'assesstimefinish': Optional[int],
+    'assesstimestart': Optional[int],
+    'blockafter': Optional[int],
+    'blockperiod': Optional[int],
+    'cancreatediscussions': NotRequired[Optional[bool]],
+    'cmid': Optional[int],
+    'completiondiscussions': Optional[int],
+    'completionposts': Optional[int],
+    'completionreplies': Optional[int],
+    'course': Optional[int],
+    'cutoffdate': NotRequired[Optional[int]],
+    'duedate': NotRequired[Optional[int]],
+    'forcesubscribe': Optional[int],
+    'grade_forum': Optional[int],
+    'grade_forum_notify': Optional[int],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'istracked': NotRequired[Optional[bool]],
+    'lang': NotRequired[Optional[str]],
+    'lockdiscussionafter': NotRequired[Optional[int]],
+    'maxattachments': Optional[int],
+    'maxbytes': Optional[int],
+    'name': Optional[str],
+    'numdiscussions': NotRequired[Optional[int]],
+    'rssarticles': Optional[int],
+    'rsstype': Optional[int],
+    'scale': Optional[int],
+    'timemodified': Optional[int],
+    'trackingtype': Optional[int],
+    'type': Optional[str],
+    'unreadpostscount': NotRequired[Optional[int]],
+    'warnafter': Optional[int],
+})
+
+
+ModForumPrepareDraftAreaForPostParametersFilestokeepInnerDict = TypedDict('ModForumPrepareDraftAreaForPostParametersFilestokeepInnerDict', {
+    'filename': Optional[str],
+    'filepath': Optional[str],
+})
+
+
+ModForumPrepareDraftAreaForPostResponseDict = TypedDict('ModForumPrepareDraftAreaForPostResponseDict', {
+    'areaoptions': List['CoreBlogPrepareEntryForEditionResponseAreasInnerOptionsInnerDict'],
+    'draftitemid': Optional[int],
+    'files': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'messagetext': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumSetLockStateResponseDict = TypedDict('ModForumSetLockStateResponseDict', {
+    'id': Optional[int],
+    'locked': Optional[bool],
+    'times': 'ModForumSetLockStateResponseTimesDict',
+})
+
+
+ModForumSetLockStateResponseTimesDict = TypedDict('ModForumSetLockStateResponseTimesDict', {
+    'locked': Optional[int],
+})
+
+
+ModForumSetPinStateResponseDict = TypedDict('ModForumSetPinStateResponseDict', {
+    'capabilities': 'ModForumSetPinStateResponseCapabilitiesDict',
+    'firstpostid': int,
+    'forumid': int,
+    'group': NotRequired[Optional['ModForumSetPinStateResponseGroupDict']],
+    'id': int,
+    'istimelocked': bool,
+    'locked': bool,
+    'name': str,
+    'pinned': bool,
+    'timed': 'ModForumSetPinStateResponseTimedDict',
+    'times': 'ModForumSetPinStateResponseTimesDict',
+    'urls': 'ModForumSetPinStateResponseUrlsDict',
+    'userstate': 'ModForumSetPinStateResponseUserstateDict',
+})
+
+
+ModForumSetPinStateResponseCapabilitiesDict = TypedDict('ModForumSetPinStateResponseCapabilitiesDict', {
+    'favourite': bool,
+    'manage': bool,
+    'move': bool,
+    'pin': bool,
+    'post': bool,
+    'subscribe': bool,
+})
+
+
+ModForumSetPinStateResponseGroupDict = TypedDict('ModForumSetPinStateResponseGroupDict', {
+    'name': str,
+    'urls': 'ModForumSetPinStateResponseGroupUrlsDict',
+})
+
+
+ModForumSetPinStateResponseGroupUrlsDict = TypedDict('ModForumSetPinStateResponseGroupUrlsDict', {
+    'picture': NotRequired[Optional[str]],
+    'userlist': NotRequired[Optional[str]],
+})
+
+
+ModForumSetPinStateResponseTimedDict = TypedDict('ModForumSetPinStateResponseTimedDict', {
+    'istimed': NotRequired[Optional[bool]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModForumSetPinStateResponseTimesDict = TypedDict('ModForumSetPinStateResponseTimesDict', {
+    'end': int,
+    'locked': int,
+    'modified': int,
+    'start': int,
+})
+
+
+ModForumSetPinStateResponseUrlsDict = TypedDict('ModForumSetPinStateResponseUrlsDict', {
+    'markasread': str,
+    'pin': NotRequired[Optional[str]],
+    'subscribe': str,
+    'view': str,
+    'viewfirstunread': NotRequired[Optional[str]],
+    'viewlatest': NotRequired[Optional[str]],
+})
+
+
+ModForumSetPinStateResponseUserstateDict = TypedDict('ModForumSetPinStateResponseUserstateDict', {
+    'favourited': bool,
+    'subscribed': bool,
+})
+
+
+ModForumSetSubscriptionStateResponseDict = TypedDict('ModForumSetSubscriptionStateResponseDict', {
+    'capabilities': 'ModForumSetPinStateResponseCapabilitiesDict',
+    'firstpostid': int,
+    'forumid': int,
+    'group': NotRequired[Optional['ModForumSetPinStateResponseGroupDict']],
+    'id': int,
+    'istimelocked': bool,
+    'locked': bool,
+    'name': str,
+    'pinned': bool,
+    'timed': 'ModForumSetPinStateResponseTimedDict',
+    'times': 'ModForumSetPinStateResponseTimesDict',
+    'urls': 'ModForumSetPinStateResponseUrlsDict',
+    'userstate': 'ModForumSetPinStateResponseUserstateDict',
+})
+
+
+ModForumToggleFavouriteStateResponseDict = TypedDict('ModForumToggleFavouriteStateResponseDict', {
+    'capabilities': 'ModForumSetPinStateResponseCapabilitiesDict',
+    'firstpostid': int,
+    'forumid': int,
+    'group': NotRequired[Optional['ModForumSetPinStateResponseGroupDict']],
+    'id': int,
+    'istimelocked': bool,
+    'locked': bool,
+    'name': str,
+    'pinned': bool,
+    'timed': 'ModForumSetPinStateResponseTimedDict',
+    'times': 'ModForumSetPinStateResponseTimesDict',
+    'urls': 'ModForumSetPinStateResponseUrlsDict',
+    'userstate': 'ModForumSetPinStateResponseUserstateDict',
+})
+
+
+ModForumUpdateDiscussionPostParametersOptionsInnerDict = TypedDict('ModForumUpdateDiscussionPostParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModForumUpdateDiscussionPostResponseDict = TypedDict('ModForumUpdateDiscussionPostResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumViewForumDiscussionResponseDict = TypedDict('ModForumViewForumDiscussionResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModForumViewForumResponseDict = TypedDict('ModForumViewForumResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryAddEntryParametersOptionsInnerDict = TypedDict('ModGlossaryAddEntryParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModGlossaryAddEntryResponseDict = TypedDict('ModGlossaryAddEntryResponseDict', {
+    'entryid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryDeleteEntryResponseDict = TypedDict('ModGlossaryDeleteEntryResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetAuthorsParametersOptionsDict = TypedDict('ModGlossaryGetAuthorsParametersOptionsDict', {
+    'includenotapproved': NotRequired[Optional[bool]],
+})
+
+
+ModGlossaryGetAuthorsResponseDict = TypedDict('ModGlossaryGetAuthorsResponseDict', {
+    'authors': List['ModGlossaryGetAuthorsResponseAuthorsInnerDict'],
+    'count': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetAuthorsResponseAuthorsInnerDict = TypedDict('ModGlossaryGetAuthorsResponseAuthorsInnerDict', {
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'pictureurl': Optional[str],
+})
+
+
+ModGlossaryGetCategoriesResponseDict = TypedDict('ModGlossaryGetCategoriesResponseDict', {
+    'categories': List['ModGlossaryGetCategoriesResponseCategoriesInnerDict'],
+    'count': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetCategoriesResponseCategoriesInnerDict = TypedDict('ModGlossaryGetCategoriesResponseCategoriesInnerDict', {
+    'glossaryid': Optional[int],
+    'id': Optional[int],
+    'name': Optional[str],
+    'usedynalink': Optional[bool],
+})
+
+
+ModGlossaryGetEntriesByAuthorIdParametersOptionsDict = TypedDict('ModGlossaryGetEntriesByAuthorIdParametersOptionsDict', {
+    'includenotapproved': NotRequired[Optional[bool]],
+})
+
+
+ModGlossaryGetEntriesByAuthorIdResponseDict = TypedDict('ModGlossaryGetEntriesByAuthorIdResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict = TypedDict('ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict', {
+    'approved': Optional[bool],
+    'attachment': Optional[bool],
+    'attachments': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'casesensitive': Optional[bool],
+    'concept': Optional[str],
+    'definition': Optional[str],
+    'definitionformat': Optional[int],
+    'definitioninlinefiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'definitiontrust': Optional[bool],
+    'fullmatch': Optional[bool],
+    'glossaryid': Optional[int],
+    'id': Optional[int],
+    'sourceglossaryid': Optional[int],
+    'tags': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict']]],
+    'teacherentry': Optional[bool],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usedynalink': Optional[bool],
+    'userfullname': Optional[str],
+    'userid': Optional[int],
+    'userpictureurl': Optional[str],
+})
+
+
+ModGlossaryGetEntriesByAuthorResponseDict = TypedDict('ModGlossaryGetEntriesByAuthorResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntriesByCategoryResponseDict = TypedDict('ModGlossaryGetEntriesByCategoryResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByCategoryResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntriesByCategoryResponseEntriesInnerDict = TypedDict('ModGlossaryGetEntriesByCategoryResponseEntriesInnerDict', {
+    'approved': Optional[bool],
+    'attachment': Optional[bool],
+    'attachments': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'casesensitive': Optional[bool],
+    'categoryid': NotRequired[Optional[int]],
+    'categoryname': NotRequired[Optional[str]],
+    'concept': Optional[str],
+    'definition': Optional[str],
+    'definitionformat': Optional[int],
+    'definitioninlinefiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'definitiontrust': Optional[bool],
+    'fullmatch': Optional[bool],
+    'glossaryid': Optional[int],
+    'id': Optional[int],
+    'sourceglossaryid': Optional[int],
+    'tags': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict']]],
+    'teacherentry': Optional[bool],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usedynalink': Optional[bool],
+    'userfullname': Optional[str],
+    'userid': Optional[int],
+    'userpictureurl': Optional[str],
+})
+
+
+ModGlossaryGetEntriesByDateResponseDict = TypedDict('ModGlossaryGetEntriesByDateResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntriesByLetterResponseDict = TypedDict('ModGlossaryGetEntriesByLetterResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntriesBySearchResponseDict = TypedDict('ModGlossaryGetEntriesBySearchResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntriesByTermResponseDict = TypedDict('ModGlossaryGetEntriesByTermResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntriesToApproveResponseDict = TypedDict('ModGlossaryGetEntriesToApproveResponseDict', {
+    'count': Optional[int],
+    'entries': List['ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict'],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntryByIdResponseDict = TypedDict('ModGlossaryGetEntryByIdResponseDict', {
+    'entry': 'ModGlossaryGetEntriesByAuthorIdResponseEntriesInnerDict',
+    'permissions': NotRequired[Optional['ModGlossaryGetEntryByIdResponsePermissionsDict']],
+    'ratinginfo': NotRequired[Optional['ModDataGetEntryResponseRatinginfoDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetEntryByIdResponsePermissionsDict = TypedDict('ModGlossaryGetEntryByIdResponsePermissionsDict', {
+    'candelete': Optional[bool],
+    'canupdate': Optional[bool],
+})
+
+
+ModGlossaryGetGlossariesByCoursesResponseDict = TypedDict('ModGlossaryGetGlossariesByCoursesResponseDict', {
+    'glossaries': List['ModGlossaryGetGlossariesByCoursesResponseGlossariesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryGetGlossariesByCoursesResponseGlossariesInnerDict = TypedDict('ModGlossaryGetGlossariesByCoursesResponseGlossariesInnerDict', {
+    'allowcomments': Optional[int],
+    'allowduplicatedentries': Optional[int],
+    'allowprintview': Optional[int],
+    'approvaldisplayformat': Optional[str],
+    'assessed': Optional[int],
+    'assesstimefinish': Optional[int],
+    'assesstimestart': Optional[int],
+    'browsemodes': List[str],
+    'canaddentry': NotRequired[Optional[int]],
+    'completionentries': Optional[int],
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'defaultapproval': Optional[int],
+    'displayformat': Optional[str],
+    'editalways': Optional[int],
+    'entbypage': Optional[int],
+    'globalglossary': Optional[int],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'mainglossary': Optional[int],
+    'name': Optional[str],
+    'rssarticles': Optional[int],
+    'rsstype': Optional[int],
+    'scale': Optional[int],
+    'section': NotRequired[Optional[int]],
+    'showall': Optional[int],
+    'showalphabet': Optional[int],
+    'showspecial': Optional[int],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'usedynalink': Optional[int],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModGlossaryPrepareEntryForEditionResponseDict = TypedDict('ModGlossaryPrepareEntryForEditionResponseDict', {
+    'aliases': List[str],
+    'areas': List['CoreBlogPrepareEntryForEditionResponseAreasInnerDict'],
+    'attachmentsid': Optional[int],
+    'categories': List[int],
+    'inlineattachmentsid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryUpdateEntryResponseDict = TypedDict('ModGlossaryUpdateEntryResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryViewEntryResponseDict = TypedDict('ModGlossaryViewEntryResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModGlossaryViewGlossaryResponseDict = TypedDict('ModGlossaryViewGlossaryResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModH5pactivityGetAttemptsResponseDict = TypedDict('ModH5pactivityGetAttemptsResponseDict', {
+    'activityid': Optional[int],
+    'usersattempts': List['ModH5pactivityGetAttemptsResponseUsersattemptsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModH5pactivityGetAttemptsResponseUsersattemptsInnerDict = TypedDict('ModH5pactivityGetAttemptsResponseUsersattemptsInnerDict', {
+    'attempts': List['ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInnerDict'],
+    'scored': NotRequired[Optional['ModH5pactivityGetAttemptsResponseUsersattemptsInnerScoredDict']],
+    'userid': Optional[int],
+})
+
+
+ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInnerDict = TypedDict('ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInnerDict', {
+    'attempt': Optional[int],
+    'completion': NotRequired[Optional[int]],
+    'duration': Optional[int],
+    'h5pactivityid': Optional[int],
+    'id': Optional[int],
+    'maxscore': Optional[int],
+    'rawscore': Optional[int],
+    'scaled': Optional[float],
+    'success': NotRequired[Optional[int]],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModH5pactivityGetAttemptsResponseUsersattemptsInnerScoredDict = TypedDict('ModH5pactivityGetAttemptsResponseUsersattemptsInnerScoredDict', {
+    'attempts': List['ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInnerDict'],
+    'grademethod': Optional[str],
+    'title': Optional[str],
+})
+
+
+ModH5pactivityGetH5pactivitiesByCoursesResponseDict = TypedDict('ModH5pactivityGetH5pactivitiesByCoursesResponseDict', {
+    'h5pactivities': List['ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInnerDict'],
+    'h5pglobalsettings': NotRequired[Optional['ModH5pactivityGetH5pactivitiesByCoursesResponseH5pglobalsettingsDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInnerDict = TypedDict('ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInnerDict', {
+    'contenthash': NotRequired[Optional[str]],
+    'context': int,
+    'course': int,
+    'coursemodule': int,
+    'deployedfile': NotRequired[Optional['ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInnerDeployedfileDict']],
+    'displayoptions': int,
+    'enabletracking': int,
+    'grade': NotRequired[Optional[int]],
+    'grademethod': int,
+    'id': int,
+    'intro': Optional[str],
+    'introfiles': List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict'],
+    'introformat': NotRequired[Optional[int]],
+    'name': str,
+    'package': List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict'],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+})
+
+
+ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInnerDeployedfileDict = TypedDict('ModH5pactivityGetH5pactivitiesByCoursesResponseH5pactivitiesInnerDeployedfileDict', {
+    'filename': NotRequired[Optional[str]],
+    'filepath': NotRequired[Optional[str]],
+    'filesize': NotRequired[Optional[int]],
+    'fileurl': NotRequired[Optional[str]],
+    'mimetype': NotRequired[Optional[str]],
+    'timemodified': NotRequired[Optional[int]],
+})
+
+
+ModH5pactivityGetH5pactivitiesByCoursesResponseH5pglobalsettingsDict = TypedDict('ModH5pactivityGetH5pactivitiesByCoursesResponseH5pglobalsettingsDict', {
+    'enablesavestate': Optional[bool],
+    'savestatefreq': NotRequired[Optional[int]],
+})
+
+
+ModH5pactivityGetH5pactivityAccessInformationResponseDict = TypedDict('ModH5pactivityGetH5pactivityAccessInformationResponseDict', {
+    'canaddinstance': NotRequired[Optional[bool]],
+    'canreviewattempts': NotRequired[Optional[bool]],
+    'cansubmit': NotRequired[Optional[bool]],
+    'canview': NotRequired[Optional[bool]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModH5pactivityGetResultsResponseDict = TypedDict('ModH5pactivityGetResultsResponseDict', {
+    'activityid': Optional[int],
+    'attempts': List['ModH5pactivityGetResultsResponseAttemptsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModH5pactivityGetResultsResponseAttemptsInnerDict = TypedDict('ModH5pactivityGetResultsResponseAttemptsInnerDict', {
+    'attempt': Optional[int],
+    'completion': NotRequired[Optional[int]],
+    'duration': Optional[int],
+    'h5pactivityid': Optional[int],
+    'id': Optional[int],
+    'maxscore': Optional[int],
+    'rawscore': Optional[int],
+    'results': NotRequired[Optional[List['ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerDict']]],
+    'scaled': Optional[float],
+    'success': NotRequired[Optional[int]],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerDict = TypedDict('ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerDict', {
+    'answerlabel': NotRequired[Optional[str]],
+    'attemptid': Optional[int],
+    'completion': NotRequired[Optional[int]],
+    'content': NotRequired[Optional[str]],
+    'correctlabel': NotRequired[Optional[str]],
+    'description': Optional[str],
+    'duration': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'interactiontype': Optional[str],
+    'maxscore': Optional[int],
+    'options': NotRequired[Optional[List['ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerDict']]],
+    'optionslabel': NotRequired[Optional[str]],
+    'rawscore': Optional[int],
+    'subcontent': Optional[str],
+    'success': NotRequired[Optional[int]],
+    'timecreated': Optional[int],
+    'track': NotRequired[Optional[bool]],
+})
+
+
+ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerDict = TypedDict('ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerDict', {
+    'correctanswer': NotRequired[Optional['ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerCorrectanswerDict']],
+    'description': NotRequired[Optional[str]],
+    'id': NotRequired[Optional[str]],
+    'useranswer': NotRequired[Optional['ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerUseranswerDict']],
+})
+
+
+ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerCorrectanswerDict = TypedDict('ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerCorrectanswerDict', {
+    'answer': NotRequired[Optional[str]],
+    'checked': NotRequired[Optional[bool]],
+    'correct': NotRequired[Optional[bool]],
+    'fail': NotRequired[Optional[bool]],
+    'incorrect': NotRequired[Optional[bool]],
+    'pass': NotRequired[Optional[bool]],
+    'text': NotRequired[Optional[bool]],
+    'unchecked': NotRequired[Optional[bool]],
+})
+
+
+ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerUseranswerDict = TypedDict('ModH5pactivityGetResultsResponseAttemptsInnerResultsInnerOptionsInnerUseranswerDict', {
+    'answer': NotRequired[Optional[str]],
+    'checked': NotRequired[Optional[bool]],
+    'correct': NotRequired[Optional[bool]],
+    'fail': NotRequired[Optional[bool]],
+    'incorrect': NotRequired[Optional[bool]],
+    'pass': NotRequired[Optional[bool]],
+    'text': NotRequired[Optional[bool]],
+    'unchecked': NotRequired[Optional[bool]],
+})
+
+
+ModH5pactivityGetUserAttemptsResponseDict = TypedDict('ModH5pactivityGetUserAttemptsResponseDict', {
+    'activityid': Optional[int],
+    'totalattempts': Optional[int],
+    'usersattempts': List['ModH5pactivityGetUserAttemptsResponseUsersattemptsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModH5pactivityGetUserAttemptsResponseUsersattemptsInnerDict = TypedDict('ModH5pactivityGetUserAttemptsResponseUsersattemptsInnerDict', {
+    'attempts': List['ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInnerDict'],
+    'scored': NotRequired[Optional['ModH5pactivityGetUserAttemptsResponseUsersattemptsInnerScoredDict']],
+    'userid': Optional[int],
+})
+
+
+ModH5pactivityGetUserAttemptsResponseUsersattemptsInnerScoredDict = TypedDict('ModH5pactivityGetUserAttemptsResponseUsersattemptsInnerScoredDict', {
+    'attempts': List['ModH5pactivityGetAttemptsResponseUsersattemptsInnerAttemptsInnerDict'],
+    'grademethod': Optional[str],
+    'title': Optional[str],
+})
+
+
+ModH5pactivityLogReportViewedResponseDict = TypedDict('ModH5pactivityLogReportViewedResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModH5pactivityViewH5pactivityResponseDict = TypedDict('ModH5pactivityViewH5pactivityResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModImscpGetImscpsByCoursesResponseDict = TypedDict('ModImscpGetImscpsByCoursesResponseDict', {
+    'imscps': List['ModImscpGetImscpsByCoursesResponseImscpsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModImscpGetImscpsByCoursesResponseImscpsInnerDict = TypedDict('ModImscpGetImscpsByCoursesResponseImscpsInnerDict', {
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': NotRequired[Optional[str]],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'keepold': NotRequired[Optional[int]],
+    'lang': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'revision': NotRequired[Optional[int]],
+    'section': NotRequired[Optional[int]],
+    'structure': NotRequired[Optional[str]],
+    'timemodified': NotRequired[Optional[str]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModImscpViewImscpResponseDict = TypedDict('ModImscpViewImscpResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLabelGetLabelsByCoursesResponseDict = TypedDict('ModLabelGetLabelsByCoursesResponseDict', {
+    'labels': List['ModLabelGetLabelsByCoursesResponseLabelsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLabelGetLabelsByCoursesResponseLabelsInnerDict = TypedDict('ModLabelGetLabelsByCoursesResponseLabelsInnerDict', {
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'section': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModLessonFinishAttemptResponseDict = TypedDict('ModLessonFinishAttemptResponseDict', {
+    'data': List['ModLessonFinishAttemptResponseDataInnerDict'],
+    'messages': List['ModLessonFinishAttemptResponseMessagesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonFinishAttemptResponseDataInnerDict = TypedDict('ModLessonFinishAttemptResponseDataInnerDict', {
+    'message': Optional[str],
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModLessonFinishAttemptResponseMessagesInnerDict = TypedDict('ModLessonFinishAttemptResponseMessagesInnerDict', {
+    'message': Optional[str],
+    'type': Optional[str],
+})
+
+
+ModLessonGetAttemptsOverviewResponseDict = TypedDict('ModLessonGetAttemptsOverviewResponseDict', {
+    'data': NotRequired[Optional['ModLessonGetAttemptsOverviewResponseDataDict']],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetAttemptsOverviewResponseDataDict = TypedDict('ModLessonGetAttemptsOverviewResponseDataDict', {
+    'avescore': Optional[float],
+    'avetime': Optional[int],
+    'highscore': Optional[float],
+    'hightime': Optional[int],
+    'lessonscored': Optional[bool],
+    'lowscore': Optional[float],
+    'lowtime': Optional[int],
+    'numofattempts': Optional[int],
+    'students': NotRequired[Optional[List['ModLessonGetAttemptsOverviewResponseDataStudentsInnerDict']]],
+})
+
+
+ModLessonGetAttemptsOverviewResponseDataStudentsInnerDict = TypedDict('ModLessonGetAttemptsOverviewResponseDataStudentsInnerDict', {
+    'attempts': List['ModLessonGetAttemptsOverviewResponseDataStudentsInnerAttemptsInnerDict'],
+    'bestgrade': Optional[float],
+    'fullname': Optional[str],
+    'id': Optional[int],
+})
+
+
+ModLessonGetAttemptsOverviewResponseDataStudentsInnerAttemptsInnerDict = TypedDict('ModLessonGetAttemptsOverviewResponseDataStudentsInnerAttemptsInnerDict', {
+    'end': Optional[int],
+    'grade': Optional[float],
+    'timeend': Optional[int],
+    'timestart': Optional[int],
+    'try': Optional[int],
+})
+
+
+ModLessonGetContentPagesViewedResponseDict = TypedDict('ModLessonGetContentPagesViewedResponseDict', {
+    'pages': List['ModLessonGetContentPagesViewedResponsePagesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetContentPagesViewedResponsePagesInnerDict = TypedDict('ModLessonGetContentPagesViewedResponsePagesInnerDict', {
+    'flag': Optional[int],
+    'id': Optional[int],
+    'lessonid': Optional[int],
+    'nextpageid': Optional[int],
+    'pageid': Optional[int],
+    'retry': Optional[int],
+    'timeseen': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModLessonGetLessonAccessInformationResponseDict = TypedDict('ModLessonGetLessonAccessInformationResponseDict', {
+    'attemptscount': Optional[int],
+    'cangrade': Optional[bool],
+    'canmanage': Optional[bool],
+    'canviewreports': Optional[bool],
+    'firstpageid': Optional[int],
+    'lastpageseen': Optional[int],
+    'leftduringtimedsession': Optional[bool],
+    'preventaccessreasons': List['ModLessonGetLessonAccessInformationResponsePreventaccessreasonsInnerDict'],
+    'reviewmode': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetLessonAccessInformationResponsePreventaccessreasonsInnerDict = TypedDict('ModLessonGetLessonAccessInformationResponsePreventaccessreasonsInnerDict', {
+    'data': Optional[str],
+    'message': Optional[str],
+    'reason': Optional[str],
+})
+
+
+ModLessonGetLessonResponseDict = TypedDict('ModLessonGetLessonResponseDict', {
+    'lesson': 'ModLessonGetLessonResponseLessonDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetLessonResponseLessonDict = TypedDict('ModLessonGetLessonResponseLessonDict', {
+    'activitylink': NotRequired[Optional[int]],
+    'allowofflineattempts': bool,
+    'available': NotRequired[Optional[int]],
+    'bgcolor': NotRequired[Optional[str]],
+    'completionendreached': NotRequired[Optional[int]],
+    'completiontimespent': NotRequired[Optional[int]],
+    'conditions': NotRequired[Optional[str]],
+    'course': int,
+    'coursemodule': int,
+    'custom': NotRequired[Optional[bool]],
+    'deadline': NotRequired[Optional[int]],
+    'dependency': NotRequired[Optional[int]],
+    'displayleft': NotRequired[Optional[bool]],
+    'displayleftif': NotRequired[Optional[int]],
+    'feedback': NotRequired[Optional[bool]],
+    'grade': NotRequired[Optional[int]],
+    'height': NotRequired[Optional[int]],
+    'id': int,
+    'intro': NotRequired[Optional[str]],
+    'introfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'lang': Optional[str],
+    'maxanswers': NotRequired[Optional[int]],
+    'maxattempts': NotRequired[Optional[int]],
+    'maxpages': NotRequired[Optional[int]],
+    'mediaclose': NotRequired[Optional[int]],
+    'mediafile': NotRequired[Optional[str]],
+    'mediafiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'mediaheight': NotRequired[Optional[int]],
+    'mediawidth': NotRequired[Optional[int]],
+    'minquestions': NotRequired[Optional[int]],
+    'modattempts': NotRequired[Optional[bool]],
+    'name': str,
+    'nextpagedefault': NotRequired[Optional[int]],
+    'ongoing': NotRequired[Optional[bool]],
+    'password': NotRequired[Optional[str]],
+    'practice': NotRequired[Optional[bool]],
+    'progressbar': NotRequired[Optional[bool]],
+    'retake': NotRequired[Optional[bool]],
+    'review': NotRequired[Optional[bool]],
+    'slideshow': NotRequired[Optional[bool]],
+    'timelimit': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'usemaxgrade': NotRequired[Optional[int]],
+    'usepassword': NotRequired[Optional[bool]],
+    'width': NotRequired[Optional[int]],
+})
+
+
+ModLessonGetLessonsByCoursesResponseDict = TypedDict('ModLessonGetLessonsByCoursesResponseDict', {
+    'lessons': List['ModLessonGetLessonResponseLessonDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetPageDataResponseDict = TypedDict('ModLessonGetPageDataResponseDict', {
+    'answers': List['ModLessonGetPageDataResponseAnswersInnerDict'],
+    'contentfiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'displaymenu': Optional[bool],
+    'messages': List['ModLessonFinishAttemptResponseMessagesInnerDict'],
+    'newpageid': Optional[int],
+    'ongoingscore': Optional[str],
+    'page': NotRequired[Optional['ModLessonGetPageDataResponsePageDict']],
+    'pagecontent': NotRequired[Optional[str]],
+    'progress': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetPageDataResponseAnswersInnerDict = TypedDict('ModLessonGetPageDataResponseAnswersInnerDict', {
+    'answer': NotRequired[Optional[str]],
+    'answerfiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'answerformat': NotRequired[Optional[int]],
+    'flags': NotRequired[Optional[int]],
+    'grade': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'jumpto': NotRequired[Optional[int]],
+    'response': NotRequired[Optional[str]],
+    'responsefiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'responseformat': NotRequired[Optional[int]],
+    'score': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+})
+
+
+ModLessonGetPageDataResponsePageDict = TypedDict('ModLessonGetPageDataResponsePageDict', {
+    'contents': NotRequired[Optional[str]],
+    'contentsformat': NotRequired[Optional[int]],
+    'display': Optional[int],
+    'displayinmenublock': Optional[bool],
+    'id': Optional[int],
+    'layout': Optional[int],
+    'lessonid': Optional[int],
+    'nextpageid': Optional[int],
+    'prevpageid': Optional[int],
+    'qoption': Optional[int],
+    'qtype': Optional[int],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'title': NotRequired[Optional[str]],
+    'type': Optional[int],
+    'typeid': Optional[int],
+    'typestring': Optional[str],
+})
+
+
+ModLessonGetPagesPossibleJumpsResponseDict = TypedDict('ModLessonGetPagesPossibleJumpsResponseDict', {
+    'jumps': List['ModLessonGetPagesPossibleJumpsResponseJumpsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetPagesPossibleJumpsResponseJumpsInnerDict = TypedDict('ModLessonGetPagesPossibleJumpsResponseJumpsInnerDict', {
+    'answerid': Optional[int],
+    'calculatedjump': Optional[int],
+    'jumpto': Optional[int],
+    'pageid': Optional[int],
+})
+
+
+ModLessonGetPagesResponseDict = TypedDict('ModLessonGetPagesResponseDict', {
+    'pages': List['ModLessonGetPagesResponsePagesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetPagesResponsePagesInnerDict = TypedDict('ModLessonGetPagesResponsePagesInnerDict', {
+    'answerids': List[int],
+    'filescount': Optional[int],
+    'filessizetotal': Optional[int],
+    'jumps': List[int],
+    'page': 'ModLessonGetPageDataResponsePageDict',
+})
+
+
+ModLessonGetQuestionsAttemptsResponseDict = TypedDict('ModLessonGetQuestionsAttemptsResponseDict', {
+    'attempts': List['ModLessonGetQuestionsAttemptsResponseAttemptsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetQuestionsAttemptsResponseAttemptsInnerDict = TypedDict('ModLessonGetQuestionsAttemptsResponseAttemptsInnerDict', {
+    'answerid': Optional[int],
+    'correct': Optional[int],
+    'id': Optional[int],
+    'lessonid': Optional[int],
+    'pageid': Optional[int],
+    'retry': Optional[int],
+    'timeseen': Optional[int],
+    'useranswer': Optional[str],
+    'userid': Optional[int],
+})
+
+
+ModLessonGetUserAttemptGradeResponseDict = TypedDict('ModLessonGetUserAttemptGradeResponseDict', {
+    'grade': 'ModLessonGetUserAttemptGradeResponseGradeDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetUserAttemptGradeResponseGradeDict = TypedDict('ModLessonGetUserAttemptGradeResponseGradeDict', {
+    'attempts': Optional[int],
+    'earned': Optional[float],
+    'grade': Optional[float],
+    'manualpoints': Optional[float],
+    'nmanual': Optional[int],
+    'nquestions': Optional[int],
+    'total': Optional[float],
+})
+
+
+ModLessonGetUserAttemptResponseDict = TypedDict('ModLessonGetUserAttemptResponseDict', {
+    'answerpages': List['ModLessonGetUserAttemptResponseAnswerpagesInnerDict'],
+    'userstats': 'ModLessonGetUserAttemptResponseUserstatsDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetUserAttemptResponseAnswerpagesInnerDict = TypedDict('ModLessonGetUserAttemptResponseAnswerpagesInnerDict', {
+    'answerdata': NotRequired[Optional['ModLessonGetUserAttemptResponseAnswerpagesInnerAnswerdataDict']],
+    'contents': Optional[str],
+    'grayout': Optional[int],
+    'page': NotRequired[Optional['ModLessonGetPageDataResponsePageDict']],
+    'qtype': Optional[str],
+    'title': Optional[str],
+})
+
+
+ModLessonGetUserAttemptResponseAnswerpagesInnerAnswerdataDict = TypedDict('ModLessonGetUserAttemptResponseAnswerpagesInnerAnswerdataDict', {
+    'answers': NotRequired[Optional[List[List[str]]]],
+    'response': Optional[str],
+    'responseformat': Optional[int],
+    'score': Optional[str],
+})
+
+
+ModLessonGetUserAttemptResponseUserstatsDict = TypedDict('ModLessonGetUserAttemptResponseUserstatsDict', {
+    'completed': Optional[int],
+    'grade': Optional[float],
+    'gradeinfo': NotRequired[Optional['ModLessonGetUserAttemptGradeResponseGradeDict']],
+    'timetotake': Optional[int],
+})
+
+
+ModLessonGetUserGradeResponseDict = TypedDict('ModLessonGetUserGradeResponseDict', {
+    'formattedgrade': Optional[str],
+    'grade': Optional[float],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetUserTimersResponseDict = TypedDict('ModLessonGetUserTimersResponseDict', {
+    'timers': List['ModLessonGetUserTimersResponseTimersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonGetUserTimersResponseTimersInnerDict = TypedDict('ModLessonGetUserTimersResponseTimersInnerDict', {
+    'completed': Optional[int],
+    'id': Optional[int],
+    'lessonid': Optional[int],
+    'lessontime': Optional[int],
+    'starttime': Optional[int],
+    'timemodifiedoffline': Optional[int],
+    'userid': Optional[int],
+})
+
+
+ModLessonLaunchAttemptResponseDict = TypedDict('ModLessonLaunchAttemptResponseDict', {
+    'messages': List['ModLessonFinishAttemptResponseMessagesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonProcessPageParametersDataInnerDict = TypedDict('ModLessonProcessPageParametersDataInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModLessonProcessPageResponseDict = TypedDict('ModLessonProcessPageResponseDict', {
+    'attemptsremaining': Optional[int],
+    'correctanswer': Optional[bool],
+    'displaymenu': Optional[bool],
+    'feedback': Optional[str],
+    'inmediatejump': Optional[bool],
+    'isessayquestion': Optional[bool],
+    'maxattemptsreached': Optional[bool],
+    'messages': List['ModLessonFinishAttemptResponseMessagesInnerDict'],
+    'newpageid': Optional[int],
+    'noanswer': Optional[bool],
+    'nodefaultresponse': Optional[bool],
+    'ongoingscore': Optional[str],
+    'progress': Optional[int],
+    'response': Optional[str],
+    'reviewmode': Optional[bool],
+    'studentanswer': Optional[str],
+    'userresponse': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLessonViewLessonResponseDict = TypedDict('ModLessonViewLessonResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLtiCreateToolProxyResponseDict = TypedDict('ModLtiCreateToolProxyResponseDict', {
+    'capabilityoffered': Optional[str],
+    'guid': Optional[str],
+    'id': Optional[int],
+    'name': Optional[str],
+    'regurl': Optional[str],
+    'secret': Optional[str],
+    'serviceoffered': Optional[str],
+    'state': Optional[int],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'toolproxy': Optional[str],
+    'vendorcode': Optional[str],
+})
+
+
+ModLtiCreateToolTypeResponseDict = TypedDict('ModLtiCreateToolTypeResponseDict', {
+    'capabilitygroups': NotRequired[Optional[List[str]]],
+    'clientid': Optional[str],
+    'courseid': NotRequired[Optional[int]],
+    'deploymentid': Optional[int],
+    'description': Optional[str],
+    'hascapabilitygroups': Optional[bool],
+    'id': Optional[int],
+    'instancecount': Optional[int],
+    'instanceids': NotRequired[Optional[List[int]]],
+    'name': Optional[str],
+    'platformid': Optional[str],
+    'state': 'ModLtiCreateToolTypeResponseStateDict',
+    'urls': 'ModLtiCreateToolTypeResponseUrlsDict',
+})
+
+
+ModLtiCreateToolTypeResponseStateDict = TypedDict('ModLtiCreateToolTypeResponseStateDict', {
+    'configured': Optional[bool],
+    'pending': Optional[bool],
+    'rejected': Optional[bool],
+    'text': Optional[str],
+    'unknown': Optional[bool],
+})
+
+
+ModLtiCreateToolTypeResponseUrlsDict = TypedDict('ModLtiCreateToolTypeResponseUrlsDict', {
+    'accesstoken': Optional[str],
+    'authrequest': Optional[str],
+    'course': NotRequired[Optional[str]],
+    'edit': Optional[str],
+    'icon': Optional[str],
+    'publickeyset': Optional[str],
+})
+
+
+ModLtiDeleteToolProxyResponseDict = TypedDict('ModLtiDeleteToolProxyResponseDict', {
+    'capabilityoffered': Optional[str],
+    'guid': Optional[str],
+    'id': Optional[int],
+    'name': Optional[str],
+    'regurl': Optional[str],
+    'secret': Optional[str],
+    'serviceoffered': Optional[str],
+    'state': Optional[int],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'toolproxy': Optional[str],
+    'vendorcode': Optional[str],
+})
+
+
+ModLtiDeleteToolTypeResponseDict = TypedDict('ModLtiDeleteToolTypeResponseDict', {
+    'id': Optional[int],
+})
+
+
+ModLtiGetLtisByCoursesResponseDict = TypedDict('ModLtiGetLtisByCoursesResponseDict', {
+    'ltis': List['ModLtiGetLtisByCoursesResponseLtisInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLtiGetLtisByCoursesResponseLtisInnerDict = TypedDict('ModLtiGetLtisByCoursesResponseLtisInnerDict', {
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'debuglaunch': NotRequired[Optional[int]],
+    'grade': NotRequired[Optional[int]],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'icon': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'instructorchoiceacceptgrades': NotRequired[Optional[int]],
+    'instructorchoiceallowroster': NotRequired[Optional[int]],
+    'instructorchoiceallowsetting': NotRequired[Optional[int]],
+    'instructorchoicesendemailaddr': NotRequired[Optional[int]],
+    'instructorchoicesendname': NotRequired[Optional[str]],
+    'instructorcustomparameters': NotRequired[Optional[str]],
+    'intro': NotRequired[Optional[str]],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'lang': NotRequired[Optional[str]],
+    'launchcontainer': NotRequired[Optional[int]],
+    'name': Optional[str],
+    'password': NotRequired[Optional[str]],
+    'resourcekey': NotRequired[Optional[str]],
+    'section': NotRequired[Optional[int]],
+    'secureicon': NotRequired[Optional[str]],
+    'securetoolurl': NotRequired[Optional[str]],
+    'servicesalt': NotRequired[Optional[str]],
+    'showdescriptionlaunch': NotRequired[Optional[int]],
+    'showtitlelaunch': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'toolurl': NotRequired[Optional[str]],
+    'typeid': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModLtiGetToolLaunchDataResponseDict = TypedDict('ModLtiGetToolLaunchDataResponseDict', {
+    'endpoint': Optional[str],
+    'parameters': List['ModLtiGetToolLaunchDataResponseParametersInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModLtiGetToolLaunchDataResponseParametersInnerDict = TypedDict('ModLtiGetToolLaunchDataResponseParametersInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModLtiGetToolProxiesResponseInnerDict = TypedDict('ModLtiGetToolProxiesResponseInnerDict', {
+    'capabilityoffered': Optional[str],
+    'guid': Optional[str],
+    'id': Optional[int],
+    'name': Optional[str],
+    'regurl': Optional[str],
+    'secret': Optional[str],
+    'serviceoffered': Optional[str],
+    'state': Optional[int],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'toolproxy': Optional[str],
+    'vendorcode': Optional[str],
+})
+
+
+ModLtiGetToolProxyRegistrationRequestResponseDict = TypedDict('ModLtiGetToolProxyRegistrationRequestResponseDict', {
+    'launch_presentation_return_url': Optional[str],
+    'lti_message_type': Optional[str],
+    'lti_version': Optional[str],
+    'reg_key': Optional[str],
+    'reg_password': Optional[str],
+    'reg_url': Optional[str],
+    'tc_profile_url': Optional[str],
+})
+
+
+ModLtiGetToolTypesAndProxiesCountResponseDict = TypedDict('ModLtiGetToolTypesAndProxiesCountResponseDict', {
+    'count': Optional[int],
+})
+
+
+ModLtiGetToolTypesAndProxiesResponseDict = TypedDict('ModLtiGetToolTypesAndProxiesResponseDict', {
+    'limit': NotRequired[Optional[int]],
+    'offset': NotRequired[Optional[int]],
+    'proxies': List['ModLtiGetToolProxiesResponseInnerDict'],
+    'types': List['ModLtiGetToolTypesAndProxiesResponseTypesInnerDict'],
+})
+
+
+ModLtiGetToolTypesAndProxiesResponseTypesInnerDict = TypedDict('ModLtiGetToolTypesAndProxiesResponseTypesInnerDict', {
+    'capabilitygroups': NotRequired[Optional[List[str]]],
+    'clientid': Optional[str],
+    'courseid': NotRequired[Optional[int]],
+    'deploymentid': Optional[int],
+    'description': Optional[str],
+    'hascapabilitygroups': Optional[bool],
+    'id': Optional[int],
+    'instancecount': Optional[int],
+    'instanceids': NotRequired[Optional[List[int]]],
+    'name': Optional[str],
+    'platformid': Optional[str],
+    'state': 'ModLtiCreateToolTypeResponseStateDict',
+    'urls': 'ModLtiCreateToolTypeResponseUrlsDict',
+})
+
+
+ModLtiIsCartridgeResponseDict = TypedDict('ModLtiIsCartridgeResponseDict', {
+    'iscartridge': Optional[bool],
+})
+
+
+ModLtiUpdateToolTypeResponseDict = TypedDict('ModLtiUpdateToolTypeResponseDict', {
+    'capabilitygroups': NotRequired[Optional[List[str]]],
+    'clientid': Optional[str],
+    'courseid': NotRequired[Optional[int]],
+    'deploymentid': Optional[int],
+    'description': Optional[str],
+    'hascapabilitygroups': Optional[bool],
+    'id': Optional[int],
+    'instancecount': Optional[int],
+    'instanceids': NotRequired[Optional[List[int]]],
+    'name': Optional[str],
+    'platformid': Optional[str],
+    'state': 'ModLtiCreateToolTypeResponseStateDict',
+    'urls': 'ModLtiCreateToolTypeResponseUrlsDict',
+})
+
+
+ModLtiViewLtiResponseDict = TypedDict('ModLtiViewLtiResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModPageGetPagesByCoursesResponseDict = TypedDict('ModPageGetPagesByCoursesResponseDict', {
+    'pages': List['ModPageGetPagesByCoursesResponsePagesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModPageGetPagesByCoursesResponsePagesInnerDict = TypedDict('ModPageGetPagesByCoursesResponsePagesInnerDict', {
+    'content': Optional[str],
+    'contentfiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'contentformat': Optional[int],
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'display': Optional[int],
+    'displayoptions': Optional[str],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'legacyfiles': Optional[int],
+    'legacyfileslast': Optional[int],
+    'name': Optional[str],
+    'revision': Optional[int],
+    'section': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModPageViewPageResponseDict = TypedDict('ModPageViewPageResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizAddRandomQuestionsResponseDict = TypedDict('ModQuizAddRandomQuestionsResponseDict', {
+    'message': NotRequired[Optional[str]],
+})
+
+
+ModQuizCreateGradeItemsParametersQuizgradeitemsInnerDict = TypedDict('ModQuizCreateGradeItemsParametersQuizgradeitemsInnerDict', {
+    'name': Optional[str],
+})
+
+
+ModQuizDeleteGradeItemsParametersQuizgradeitemsInnerDict = TypedDict('ModQuizDeleteGradeItemsParametersQuizgradeitemsInnerDict', {
+    'id': Optional[int],
+})
+
+
+ModQuizDeleteOverridesParametersDataDict = TypedDict('ModQuizDeleteOverridesParametersDataDict', {
+    'ids': List[int],
+    'quizid': Optional[int],
+})
+
+
+ModQuizDeleteOverridesResponseDict = TypedDict('ModQuizDeleteOverridesResponseDict', {
+    'ids': List[int],
+})
+
+
+ModQuizGetAttemptAccessInformationResponseDict = TypedDict('ModQuizGetAttemptAccessInformationResponseDict', {
+    'endtime': NotRequired[Optional[int]],
+    'isfinished': Optional[bool],
+    'ispreflightcheckrequired': NotRequired[Optional[bool]],
+    'preventnewattemptreasons': List[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetAttemptDataResponseDict = TypedDict('ModQuizGetAttemptDataResponseDict', {
+    'attempt': 'ModQuizGetAttemptDataResponseAttemptDict',
+    'messages': List[str],
+    'nextpage': Optional[int],
+    'questions': List['ModQuizGetAttemptDataResponseQuestionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetAttemptDataResponseAttemptDict = TypedDict('ModQuizGetAttemptDataResponseAttemptDict', {
+    'attempt': NotRequired[Optional[int]],
+    'currentpage': NotRequired[Optional[int]],
+    'gradednotificationsenttime': NotRequired[Optional[int]],
+    'gradeitemmarks': NotRequired[Optional[List['ModQuizGetAttemptDataResponseAttemptGradeitemmarksInnerDict']]],
+    'id': NotRequired[Optional[int]],
+    'layout': NotRequired[Optional[str]],
+    'preview': NotRequired[Optional[int]],
+    'quiz': NotRequired[Optional[int]],
+    'state': NotRequired[Optional[str]],
+    'sumgrades': NotRequired[Optional[float]],
+    'timecheckstate': NotRequired[Optional[int]],
+    'timefinish': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'timemodifiedoffline': NotRequired[Optional[int]],
+    'timestart': NotRequired[Optional[int]],
+    'uniqueid': NotRequired[Optional[int]],
+    'userid': NotRequired[Optional[int]],
+})
+
+
+ModQuizGetAttemptDataResponseAttemptGradeitemmarksInnerDict = TypedDict('ModQuizGetAttemptDataResponseAttemptGradeitemmarksInnerDict', {
+    'grade': Optional[float],
+    'maxgrade': Optional[float],
+    'name': Optional[str],
+})
+
+
+ModQuizGetAttemptDataResponseQuestionsInnerDict = TypedDict('ModQuizGetAttemptDataResponseQuestionsInnerDict', {
+    'blockedbyprevious': NotRequired[Optional[bool]],
+    'flagged': Optional[bool],
+    'hasautosavedstep': NotRequired[Optional[bool]],
+    'html': Optional[str],
+    'lastactiontime': NotRequired[Optional[int]],
+    'mark': NotRequired[Optional[str]],
+    'maxmark': NotRequired[Optional[float]],
+    'number': NotRequired[Optional[int]],
+    'page': Optional[int],
+    'questionnumber': Optional[str],
+    'responsefileareas': NotRequired[Optional[List['ModQuizGetAttemptDataResponseQuestionsInnerResponsefileareasInnerDict']]],
+    'sequencecheck': NotRequired[Optional[int]],
+    'settings': NotRequired[Optional[str]],
+    'slot': Optional[int],
+    'state': NotRequired[Optional[str]],
+    'stateclass': NotRequired[Optional[str]],
+    'status': NotRequired[Optional[str]],
+    'type': Optional[str],
+})
+
+
+ModQuizGetAttemptDataResponseQuestionsInnerResponsefileareasInnerDict = TypedDict('ModQuizGetAttemptDataResponseQuestionsInnerResponsefileareasInnerDict', {
+    'area': Optional[str],
+    'files': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+})
+
+
+ModQuizGetAttemptReviewResponseDict = TypedDict('ModQuizGetAttemptReviewResponseDict', {
+    'additionaldata': List['ModQuizGetAttemptReviewResponseAdditionaldataInnerDict'],
+    'attempt': 'ModQuizGetAttemptDataResponseAttemptDict',
+    'grade': Optional[str],
+    'questions': List['ModQuizGetAttemptDataResponseQuestionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetAttemptReviewResponseAdditionaldataInnerDict = TypedDict('ModQuizGetAttemptReviewResponseAdditionaldataInnerDict', {
+    'content': Optional[str],
+    'id': Optional[str],
+    'title': Optional[str],
+})
+
+
+ModQuizGetAttemptSummaryResponseDict = TypedDict('ModQuizGetAttemptSummaryResponseDict', {
+    'questions': List['ModQuizGetAttemptDataResponseQuestionsInnerDict'],
+    'totalunanswered': NotRequired[Optional[int]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetCombinedReviewOptionsResponseDict = TypedDict('ModQuizGetCombinedReviewOptionsResponseDict', {
+    'alloptions': List['ModQuizGetCombinedReviewOptionsResponseAlloptionsInnerDict'],
+    'someoptions': List['ModQuizGetCombinedReviewOptionsResponseAlloptionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetCombinedReviewOptionsResponseAlloptionsInnerDict = TypedDict('ModQuizGetCombinedReviewOptionsResponseAlloptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[int],
+})
+
+
+ModQuizGetOverridesResponseDict = TypedDict('ModQuizGetOverridesResponseDict', {
+    'overrides': List['ModQuizGetOverridesResponseOverridesInnerDict'],
+})
+
+
+ModQuizGetOverridesResponseOverridesInnerDict = TypedDict('ModQuizGetOverridesResponseOverridesInnerDict', {
+    'attempts': NotRequired[Optional[int]],
+    'groupid': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'password': NotRequired[Optional[str]],
+    'quiz': Optional[int],
+    'timeclose': NotRequired[Optional[int]],
+    'timelimit': NotRequired[Optional[int]],
+    'timeopen': NotRequired[Optional[int]],
+    'userid': NotRequired[Optional[int]],
+})
+
+
+ModQuizGetQuizAccessInformationResponseDict = TypedDict('ModQuizGetQuizAccessInformationResponseDict', {
+    'accessrules': List[str],
+    'activerulenames': List[str],
+    'canattempt': Optional[bool],
+    'canmanage': Optional[bool],
+    'canpreview': Optional[bool],
+    'canreviewmyattempts': Optional[bool],
+    'canviewreports': Optional[bool],
+    'preventaccessreasons': List[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetQuizFeedbackForGradeResponseDict = TypedDict('ModQuizGetQuizFeedbackForGradeResponseDict', {
+    'feedbackinlinefiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'feedbacktext': Optional[str],
+    'feedbacktextformat': NotRequired[Optional[int]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetQuizRequiredQtypesResponseDict = TypedDict('ModQuizGetQuizRequiredQtypesResponseDict', {
+    'questiontypes': List[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetQuizzesByCoursesResponseDict = TypedDict('ModQuizGetQuizzesByCoursesResponseDict', {
+    'quizzes': List['ModQuizGetQuizzesByCoursesResponseQuizzesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetQuizzesByCoursesResponseQuizzesInnerDict = TypedDict('ModQuizGetQuizzesByCoursesResponseQuizzesInnerDict', {
+    'allowofflineattempts': NotRequired[Optional[int]],
+    'attemptonlast': NotRequired[Optional[int]],
+    'attempts': NotRequired[Optional[int]],
+    'autosaveperiod': NotRequired[Optional[int]],
+    'browsersecurity': NotRequired[Optional[str]],
+    'canredoquestions': NotRequired[Optional[int]],
+    'completionattemptsexhausted': NotRequired[Optional[int]],
+    'completionpass': NotRequired[Optional[int]],
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'decimalpoints': NotRequired[Optional[int]],
+    'delay1': NotRequired[Optional[int]],
+    'delay2': NotRequired[Optional[int]],
+    'graceperiod': NotRequired[Optional[int]],
+    'grade': NotRequired[Optional[float]],
+    'grademethod': NotRequired[Optional[int]],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'hasfeedback': NotRequired[Optional[int]],
+    'hasquestions': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': NotRequired[Optional[str]],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'lang': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'navmethod': NotRequired[Optional[str]],
+    'overduehandling': NotRequired[Optional[str]],
+    'password': NotRequired[Optional[str]],
+    'precreateattempts': NotRequired[Optional[int]],
+    'preferredbehaviour': NotRequired[Optional[str]],
+    'questiondecimalpoints': NotRequired[Optional[int]],
+    'questionsperpage': NotRequired[Optional[int]],
+    'reviewattempt': NotRequired[Optional[int]],
+    'reviewcorrectness': NotRequired[Optional[int]],
+    'reviewgeneralfeedback': NotRequired[Optional[int]],
+    'reviewmarks': NotRequired[Optional[int]],
+    'reviewmaxmarks': NotRequired[Optional[int]],
+    'reviewoverallfeedback': NotRequired[Optional[int]],
+    'reviewrightanswer': NotRequired[Optional[int]],
+    'reviewspecificfeedback': NotRequired[Optional[int]],
+    'section': NotRequired[Optional[int]],
+    'showblocks': NotRequired[Optional[int]],
+    'showuserpicture': NotRequired[Optional[int]],
+    'shuffleanswers': NotRequired[Optional[int]],
+    'subnet': NotRequired[Optional[str]],
+    'sumgrades': NotRequired[Optional[float]],
+    'timeclose': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timelimit': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'timeopen': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModQuizGetUserAttemptsResponseDict = TypedDict('ModQuizGetUserAttemptsResponseDict', {
+    'attempts': List['ModQuizGetUserAttemptsResponseAttemptsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetUserAttemptsResponseAttemptsInnerDict = TypedDict('ModQuizGetUserAttemptsResponseAttemptsInnerDict', {
+    'attempt': NotRequired[Optional[int]],
+    'currentpage': NotRequired[Optional[int]],
+    'gradednotificationsenttime': NotRequired[Optional[int]],
+    'gradeitemmarks': NotRequired[Optional[List['ModQuizGetAttemptDataResponseAttemptGradeitemmarksInnerDict']]],
+    'id': NotRequired[Optional[int]],
+    'layout': NotRequired[Optional[str]],
+    'preview': NotRequired[Optional[int]],
+    'quiz': NotRequired[Optional[int]],
+    'state': NotRequired[Optional[str]],
+    'sumgrades': NotRequired[Optional[float]],
+    'timecheckstate': NotRequired[Optional[int]],
+    'timefinish': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'timemodifiedoffline': NotRequired[Optional[int]],
+    'timestart': NotRequired[Optional[int]],
+    'uniqueid': NotRequired[Optional[int]],
+    'userid': NotRequired[Optional[int]],
+})
+
+
+ModQuizGetUserBestGradeResponseDict = TypedDict('ModQuizGetUserBestGradeResponseDict', {
+    'grade': NotRequired[Optional[float]],
+    'gradetopass': NotRequired[Optional[float]],
+    'hasgrade': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizGetUserQuizAttemptsResponseDict = TypedDict('ModQuizGetUserQuizAttemptsResponseDict', {
+    'attempts': List['ModQuizGetAttemptDataResponseAttemptDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizProcessAttemptResponseDict = TypedDict('ModQuizProcessAttemptResponseDict', {
+    'state': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizSaveAttemptResponseDict = TypedDict('ModQuizSaveAttemptResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizSaveOverridesParametersDataDict = TypedDict('ModQuizSaveOverridesParametersDataDict', {
+    'overrides': List['ModQuizSaveOverridesParametersDataOverridesInnerDict'],
+    'quizid': Optional[int],
+})
+
+
+ModQuizSaveOverridesParametersDataOverridesInnerDict = TypedDict('ModQuizSaveOverridesParametersDataOverridesInnerDict', {
+    'attempts': NotRequired[Optional[int]],
+    'groupid': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'password': NotRequired[Optional[str]],
+    'timeclose': NotRequired[Optional[int]],
+    'timelimit': NotRequired[Optional[int]],
+    'timeopen': NotRequired[Optional[int]],
+    'userid': NotRequired[Optional[int]],
+})
+
+
+ModQuizSaveOverridesResponseDict = TypedDict('ModQuizSaveOverridesResponseDict', {
+    'ids': List[int],
+})
+
+
+ModQuizSetQuestionVersionResponseDict = TypedDict('ModQuizSetQuestionVersionResponseDict', {
+    'result': Optional[bool],
+})
+
+
+ModQuizStartAttemptResponseDict = TypedDict('ModQuizStartAttemptResponseDict', {
+    'attempt': 'ModQuizGetAttemptDataResponseAttemptDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizUpdateFilterConditionResponseDict = TypedDict('ModQuizUpdateFilterConditionResponseDict', {
+    'message': NotRequired[Optional[str]],
+})
+
+
+ModQuizUpdateGradeItemsParametersQuizgradeitemsInnerDict = TypedDict('ModQuizUpdateGradeItemsParametersQuizgradeitemsInnerDict', {
+    'id': Optional[int],
+    'name': NotRequired[Optional[str]],
+})
+
+
+ModQuizUpdateSlotsParametersSlotsInnerDict = TypedDict('ModQuizUpdateSlotsParametersSlotsInnerDict', {
+    'displaynumber': NotRequired[Optional[str]],
+    'id': Optional[int],
+    'maxmark': NotRequired[Optional[float]],
+    'quizgradeitemid': NotRequired[Optional[int]],
+    'requireprevious': NotRequired[Optional[bool]],
+})
+
+
+ModQuizViewAttemptResponseDict = TypedDict('ModQuizViewAttemptResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizViewAttemptReviewResponseDict = TypedDict('ModQuizViewAttemptReviewResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizViewAttemptSummaryResponseDict = TypedDict('ModQuizViewAttemptSummaryResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModQuizViewQuizResponseDict = TypedDict('ModQuizViewQuizResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModResourceGetResourcesByCoursesResponseDict = TypedDict('ModResourceGetResourcesByCoursesResponseDict', {
+    'resources': List['ModResourceGetResourcesByCoursesResponseResourcesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModResourceGetResourcesByCoursesResponseResourcesInnerDict = TypedDict('ModResourceGetResourcesByCoursesResponseResourcesInnerDict', {
+    'contentfiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'display': Optional[int],
+    'displayoptions': Optional[str],
+    'filterfiles': Optional[int],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'legacyfiles': Optional[int],
+    'legacyfileslast': Optional[int],
+    'name': Optional[str],
+    'revision': Optional[int],
+    'section': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+    'tobemigrated': Optional[int],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModResourceViewResourceResponseDict = TypedDict('ModResourceViewResourceResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormGetScormAccessInformationResponseDict = TypedDict('ModScormGetScormAccessInformationResponseDict', {
+    'canaddinstance': NotRequired[Optional[bool]],
+    'candeleteownresponses': NotRequired[Optional[bool]],
+    'candeleteresponses': NotRequired[Optional[bool]],
+    'cansavetrack': NotRequired[Optional[bool]],
+    'canskipview': NotRequired[Optional[bool]],
+    'canviewreport': NotRequired[Optional[bool]],
+    'canviewscores': NotRequired[Optional[bool]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormGetScormAttemptCountResponseDict = TypedDict('ModScormGetScormAttemptCountResponseDict', {
+    'attemptscount': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormGetScormScoTracksResponseDict = TypedDict('ModScormGetScormScoTracksResponseDict', {
+    'data': 'ModScormGetScormScoTracksResponseDataDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormGetScormScoTracksResponseDataDict = TypedDict('ModScormGetScormScoTracksResponseDataDict', {
+    'attempt': Optional[int],
+    'tracks': List['ModScormGetScormScoTracksResponseDataTracksInnerDict'],
+})
+
+
+ModScormGetScormScoTracksResponseDataTracksInnerDict = TypedDict('ModScormGetScormScoTracksResponseDataTracksInnerDict', {
+    'element': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModScormGetScormScoesResponseDict = TypedDict('ModScormGetScormScoesResponseDict', {
+    'scoes': List['ModScormGetScormScoesResponseScoesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormGetScormScoesResponseScoesInnerDict = TypedDict('ModScormGetScormScoesResponseScoesInnerDict', {
+    'extradata': NotRequired[Optional[List['ModScormGetScormScoesResponseScoesInnerExtradataInnerDict']]],
+    'id': Optional[int],
+    'identifier': Optional[str],
+    'launch': Optional[str],
+    'manifest': Optional[str],
+    'organization': Optional[str],
+    'parent': Optional[str],
+    'scorm': Optional[int],
+    'scormtype': Optional[str],
+    'sortorder': Optional[int],
+    'title': Optional[str],
+})
+
+
+ModScormGetScormScoesResponseScoesInnerExtradataInnerDict = TypedDict('ModScormGetScormScoesResponseScoesInnerExtradataInnerDict', {
+    'element': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModScormGetScormUserDataResponseDict = TypedDict('ModScormGetScormUserDataResponseDict', {
+    'data': List['ModScormGetScormUserDataResponseDataInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormGetScormUserDataResponseDataInnerDict = TypedDict('ModScormGetScormUserDataResponseDataInnerDict', {
+    'defaultdata': List['ModScormGetScormScoesResponseScoesInnerExtradataInnerDict'],
+    'scoid': Optional[int],
+    'userdata': List['ModScormGetScormScoesResponseScoesInnerExtradataInnerDict'],
+})
+
+
+ModScormGetScormsByCoursesResponseDict = TypedDict('ModScormGetScormsByCoursesResponseDict', {
+    'options': NotRequired[Optional[List['ModScormGetScormsByCoursesResponseOptionsInnerDict']]],
+    'scorms': List['ModScormGetScormsByCoursesResponseScormsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormGetScormsByCoursesResponseOptionsInnerDict = TypedDict('ModScormGetScormsByCoursesResponseOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModScormGetScormsByCoursesResponseScormsInnerDict = TypedDict('ModScormGetScormsByCoursesResponseScormsInnerDict', {
+    'auto': NotRequired[Optional[bool]],
+    'autocommit': NotRequired[Optional[bool]],
+    'completionscorerequired': NotRequired[Optional[int]],
+    'completionstatusallscos': NotRequired[Optional[int]],
+    'completionstatusrequired': NotRequired[Optional[int]],
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'displayattemptstatus': NotRequired[Optional[int]],
+    'displaycoursestructure': NotRequired[Optional[bool]],
+    'forcecompleted': NotRequired[Optional[bool]],
+    'forcenewattempt': NotRequired[Optional[int]],
+    'grademethod': NotRequired[Optional[int]],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'height': NotRequired[Optional[int]],
+    'hidebrowse': NotRequired[Optional[bool]],
+    'hidetoc': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'lastattemptlock': NotRequired[Optional[bool]],
+    'launch': NotRequired[Optional[int]],
+    'maxattempt': NotRequired[Optional[int]],
+    'maxgrade': NotRequired[Optional[int]],
+    'md5hash': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'nav': NotRequired[Optional[int]],
+    'navpositionleft': NotRequired[Optional[int]],
+    'navpositiontop': NotRequired[Optional[int]],
+    'options': NotRequired[Optional[str]],
+    'packagesize': NotRequired[Optional[int]],
+    'packageurl': NotRequired[Optional[str]],
+    'popup': NotRequired[Optional[int]],
+    'protectpackagedownloads': NotRequired[Optional[bool]],
+    'reference': NotRequired[Optional[str]],
+    'revision': NotRequired[Optional[int]],
+    'scormtype': NotRequired[Optional[str]],
+    'section': NotRequired[Optional[int]],
+    'sha1hash': NotRequired[Optional[str]],
+    'skipview': NotRequired[Optional[int]],
+    'timeclose': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'timeopen': NotRequired[Optional[int]],
+    'updatefreq': NotRequired[Optional[int]],
+    'version': NotRequired[Optional[str]],
+    'visible': NotRequired[Optional[bool]],
+    'whatgrade': NotRequired[Optional[int]],
+    'width': NotRequired[Optional[int]],
+})
+
+
+ModScormInsertScormTracksResponseDict = TypedDict('ModScormInsertScormTracksResponseDict', {
+    'trackids': List[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormLaunchScoResponseDict = TypedDict('ModScormLaunchScoResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModScormViewScormResponseDict = TypedDict('ModScormViewScormResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModUrlGetUrlsByCoursesResponseDict = TypedDict('ModUrlGetUrlsByCoursesResponseDict', {
+    'urls': List['ModUrlGetUrlsByCoursesResponseUrlsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModUrlGetUrlsByCoursesResponseUrlsInnerDict = TypedDict('ModUrlGetUrlsByCoursesResponseUrlsInnerDict', {
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'display': Optional[int],
+    'displayoptions': Optional[str],
+    'externalurl': Optional[str],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': Optional[str],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': Optional[int],
+    'lang': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'parameters': Optional[str],
+    'section': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+    'visible': NotRequired[Optional[bool]],
+})
+
+
+ModUrlViewUrlResponseDict = TypedDict('ModUrlViewUrlResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiEditPageResponseDict = TypedDict('ModWikiEditPageResponseDict', {
+    'pageid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiGetPageContentsResponseDict = TypedDict('ModWikiGetPageContentsResponseDict', {
+    'page': 'ModWikiGetPageContentsResponsePageDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiGetPageContentsResponsePageDict = TypedDict('ModWikiGetPageContentsResponsePageDict', {
+    'cachedcontent': Optional[str],
+    'caneditpage': Optional[bool],
+    'contentformat': NotRequired[Optional[int]],
+    'groupid': Optional[int],
+    'id': Optional[int],
+    'subwikiid': Optional[int],
+    'tags': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict']]],
+    'title': Optional[str],
+    'userid': Optional[int],
+    'version': NotRequired[Optional[int]],
+    'wikiid': Optional[int],
+})
+
+
+ModWikiGetPageForEditingResponseDict = TypedDict('ModWikiGetPageForEditingResponseDict', {
+    'pagesection': 'ModWikiGetPageForEditingResponsePagesectionDict',
+})
+
+
+ModWikiGetPageForEditingResponsePagesectionDict = TypedDict('ModWikiGetPageForEditingResponsePagesectionDict', {
+    'content': NotRequired[Optional[str]],
+    'contentformat': NotRequired[Optional[str]],
+    'version': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiGetSubwikiFilesResponseDict = TypedDict('ModWikiGetSubwikiFilesResponseDict', {
+    'files': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiGetSubwikiPagesParametersOptionsDict = TypedDict('ModWikiGetSubwikiPagesParametersOptionsDict', {
+    'includecontent': NotRequired[Optional[int]],
+    'sortby': NotRequired[Optional[str]],
+    'sortdirection': NotRequired[Optional[str]],
+})
+
+
+ModWikiGetSubwikiPagesResponseDict = TypedDict('ModWikiGetSubwikiPagesResponseDict', {
+    'pages': List['ModWikiGetSubwikiPagesResponsePagesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiGetSubwikiPagesResponsePagesInnerDict = TypedDict('ModWikiGetSubwikiPagesResponsePagesInnerDict', {
+    'cachedcontent': NotRequired[Optional[str]],
+    'caneditpage': Optional[bool],
+    'contentformat': NotRequired[Optional[int]],
+    'contentsize': NotRequired[Optional[int]],
+    'firstpage': Optional[bool],
+    'id': Optional[int],
+    'pageviews': Optional[int],
+    'readonly': Optional[int],
+    'subwikiid': Optional[int],
+    'tags': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerTagsInnerDict']]],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'timerendered': Optional[int],
+    'title': Optional[str],
+    'userid': Optional[int],
+})
+
+
+ModWikiGetSubwikisResponseDict = TypedDict('ModWikiGetSubwikisResponseDict', {
+    'subwikis': List['ModWikiGetSubwikisResponseSubwikisInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiGetSubwikisResponseSubwikisInnerDict = TypedDict('ModWikiGetSubwikisResponseSubwikisInnerDict', {
+    'canedit': Optional[bool],
+    'groupid': Optional[str],
+    'id': Optional[int],
+    'userid': Optional[int],
+    'wikiid': Optional[int],
+})
+
+
+ModWikiGetWikisByCoursesResponseDict = TypedDict('ModWikiGetWikisByCoursesResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+    'wikis': List['ModWikiGetWikisByCoursesResponseWikisInnerDict'],
+})
+
+
+ModWikiGetWikisByCoursesResponseWikisInnerDict = TypedDict('ModWikiGetWikisByCoursesResponseWikisInnerDict', {
+    'cancreatepages': Optional[bool],
+    'course': Optional[int],
+    'coursemodule': Optional[int],
+    'defaultformat': NotRequired[Optional[str]],
+    'editbegin': NotRequired[Optional[int]],
+    'editend': NotRequired[Optional[int]],
+    'firstpagetitle': NotRequired[Optional[str]],
+    'forceformat': NotRequired[Optional[int]],
+    'groupingid': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'intro': NotRequired[Optional[str]],
+    'introfiles': NotRequired[Optional[List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'lang': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'section': NotRequired[Optional[int]],
+    'timecreated': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'visible': NotRequired[Optional[bool]],
+    'wikimode': NotRequired[Optional[str]],
+})
+
+
+ModWikiNewPageResponseDict = TypedDict('ModWikiNewPageResponseDict', {
+    'pageid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiViewPageResponseDict = TypedDict('ModWikiViewPageResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWikiViewWikiResponseDict = TypedDict('ModWikiViewWikiResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopAddSubmissionResponseDict = TypedDict('ModWorkshopAddSubmissionResponseDict', {
+    'status': Optional[bool],
+    'submissionid': NotRequired[Optional[int]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopDeleteSubmissionResponseDict = TypedDict('ModWorkshopDeleteSubmissionResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopEvaluateAssessmentResponseDict = TypedDict('ModWorkshopEvaluateAssessmentResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopEvaluateSubmissionResponseDict = TypedDict('ModWorkshopEvaluateSubmissionResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetAssessmentFormDefinitionResponseDict = TypedDict('ModWorkshopGetAssessmentFormDefinitionResponseDict', {
+    'current': List['ModWorkshopGetAssessmentFormDefinitionResponseCurrentInnerDict'],
+    'descriptionfiles': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'dimensionsinfo': List['ModWorkshopGetAssessmentFormDefinitionResponseDimensionsinfoInnerDict'],
+    'dimenssionscount': Optional[int],
+    'fields': List['ModWorkshopGetAssessmentFormDefinitionResponseFieldsInnerDict'],
+    'options': List['ModWorkshopGetAssessmentFormDefinitionResponseOptionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetAssessmentFormDefinitionResponseCurrentInnerDict = TypedDict('ModWorkshopGetAssessmentFormDefinitionResponseCurrentInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModWorkshopGetAssessmentFormDefinitionResponseDimensionsinfoInnerDict = TypedDict('ModWorkshopGetAssessmentFormDefinitionResponseDimensionsinfoInnerDict', {
+    'id': Optional[int],
+    'max': Optional[float],
+    'min': Optional[float],
+    'scale': NotRequired[Optional[str]],
+    'weight': Optional[str],
+})
+
+
+ModWorkshopGetAssessmentFormDefinitionResponseFieldsInnerDict = TypedDict('ModWorkshopGetAssessmentFormDefinitionResponseFieldsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModWorkshopGetAssessmentFormDefinitionResponseOptionsInnerDict = TypedDict('ModWorkshopGetAssessmentFormDefinitionResponseOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModWorkshopGetAssessmentResponseDict = TypedDict('ModWorkshopGetAssessmentResponseDict', {
+    'assessment': 'ModWorkshopGetAssessmentResponseAssessmentDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetAssessmentResponseAssessmentDict = TypedDict('ModWorkshopGetAssessmentResponseAssessmentDict', {
+    'feedbackattachmentfiles': List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict'],
+    'feedbackauthor': Optional[str],
+    'feedbackauthorattachment': Optional[int],
+    'feedbackauthorformat': NotRequired[Optional[int]],
+    'feedbackcontentfiles': List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict'],
+    'feedbackreviewer': NotRequired[Optional[str]],
+    'feedbackreviewerformat': NotRequired[Optional[int]],
+    'grade': Optional[float],
+    'gradinggrade': Optional[float],
+    'gradinggradeover': Optional[float],
+    'gradinggradeoverby': Optional[int],
+    'id': int,
+    'reviewerid': int,
+    'submissionid': int,
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'weight': int,
+})
+
+
+ModWorkshopGetGradesReportResponseDict = TypedDict('ModWorkshopGetGradesReportResponseDict', {
+    'report': 'ModWorkshopGetGradesReportResponseReportDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetGradesReportResponseReportDict = TypedDict('ModWorkshopGetGradesReportResponseReportDict', {
+    'grades': List['ModWorkshopGetGradesReportResponseReportGradesInnerDict'],
+    'totalcount': Optional[int],
+})
+
+
+ModWorkshopGetGradesReportResponseReportGradesInnerDict = TypedDict('ModWorkshopGetGradesReportResponseReportGradesInnerDict', {
+    'gradinggrade': NotRequired[Optional[float]],
+    'reviewedby': NotRequired[Optional[List['ModWorkshopGetGradesReportResponseReportGradesInnerReviewedbyInnerDict']]],
+    'reviewerof': NotRequired[Optional[List['ModWorkshopGetGradesReportResponseReportGradesInnerReviewedbyInnerDict']]],
+    'submissiongrade': NotRequired[Optional[float]],
+    'submissiongradeover': NotRequired[Optional[float]],
+    'submissiongradeoverby': NotRequired[Optional[int]],
+    'submissionid': Optional[int],
+    'submissionmodified': Optional[int],
+    'submissionpublished': NotRequired[Optional[int]],
+    'submissiontitle': Optional[str],
+    'userid': Optional[int],
+})
+
+
+ModWorkshopGetGradesReportResponseReportGradesInnerReviewedbyInnerDict = TypedDict('ModWorkshopGetGradesReportResponseReportGradesInnerReviewedbyInnerDict', {
+    'assessmentid': Optional[int],
+    'grade': Optional[float],
+    'gradinggrade': Optional[float],
+    'gradinggradeover': Optional[float],
+    'submissionid': Optional[int],
+    'userid': Optional[int],
+    'weight': Optional[int],
+})
+
+
+ModWorkshopGetGradesResponseDict = TypedDict('ModWorkshopGetGradesResponseDict', {
+    'assessmentgradehidden': NotRequired[Optional[bool]],
+    'assessmentlongstrgrade': NotRequired[Optional[str]],
+    'assessmentrawgrade': NotRequired[Optional[float]],
+    'submissiongradehidden': NotRequired[Optional[bool]],
+    'submissionlongstrgrade': NotRequired[Optional[str]],
+    'submissionrawgrade': NotRequired[Optional[float]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetReviewerAssessmentsResponseDict = TypedDict('ModWorkshopGetReviewerAssessmentsResponseDict', {
+    'assessments': List['ModWorkshopGetAssessmentResponseAssessmentDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetSubmissionAssessmentsResponseDict = TypedDict('ModWorkshopGetSubmissionAssessmentsResponseDict', {
+    'assessments': List['ModWorkshopGetAssessmentResponseAssessmentDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetSubmissionResponseDict = TypedDict('ModWorkshopGetSubmissionResponseDict', {
+    'submission': 'ModWorkshopGetSubmissionResponseSubmissionDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetSubmissionResponseSubmissionDict = TypedDict('ModWorkshopGetSubmissionResponseSubmissionDict', {
+    'attachment': Optional[int],
+    'attachmentfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'authorid': int,
+    'content': Optional[str],
+    'contentfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'contentformat': NotRequired[Optional[int]],
+    'contenttrust': int,
+    'example': Optional[bool],
+    'feedbackauthor': NotRequired[Optional[str]],
+    'feedbackauthorformat': NotRequired[Optional[int]],
+    'grade': NotRequired[Optional[float]],
+    'gradeover': NotRequired[Optional[float]],
+    'gradeoverby': NotRequired[Optional[int]],
+    'id': int,
+    'late': int,
+    'published': Optional[bool],
+    'timecreated': int,
+    'timegraded': NotRequired[Optional[int]],
+    'timemodified': int,
+    'title': str,
+    'workshopid': int,
+})
+
+
+ModWorkshopGetSubmissionsResponseDict = TypedDict('ModWorkshopGetSubmissionsResponseDict', {
+    'submissions': List['ModWorkshopGetSubmissionResponseSubmissionDict'],
+    'totalcount': Optional[int],
+    'totalfilesize': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetUserPlanResponseDict = TypedDict('ModWorkshopGetUserPlanResponseDict', {
+    'userplan': 'ModWorkshopGetUserPlanResponseUserplanDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetUserPlanResponseUserplanDict = TypedDict('ModWorkshopGetUserPlanResponseUserplanDict', {
+    'examples': List['ModWorkshopGetUserPlanResponseUserplanExamplesInnerDict'],
+    'phases': List['ModWorkshopGetUserPlanResponseUserplanPhasesInnerDict'],
+})
+
+
+ModWorkshopGetUserPlanResponseUserplanExamplesInnerDict = TypedDict('ModWorkshopGetUserPlanResponseUserplanExamplesInnerDict', {
+    'assessmentid': Optional[int],
+    'grade': Optional[float],
+    'gradinggrade': Optional[float],
+    'id': Optional[int],
+    'title': Optional[str],
+})
+
+
+ModWorkshopGetUserPlanResponseUserplanPhasesInnerDict = TypedDict('ModWorkshopGetUserPlanResponseUserplanPhasesInnerDict', {
+    'actions': List['ModWorkshopGetUserPlanResponseUserplanPhasesInnerActionsInnerDict'],
+    'active': Optional[bool],
+    'code': Optional[int],
+    'tasks': List['ModWorkshopGetUserPlanResponseUserplanPhasesInnerTasksInnerDict'],
+    'title': Optional[str],
+})
+
+
+ModWorkshopGetUserPlanResponseUserplanPhasesInnerActionsInnerDict = TypedDict('ModWorkshopGetUserPlanResponseUserplanPhasesInnerActionsInnerDict', {
+    'label': NotRequired[Optional[str]],
+    'method': NotRequired[Optional[str]],
+    'type': NotRequired[Optional[str]],
+    'url': Optional[str],
+})
+
+
+ModWorkshopGetUserPlanResponseUserplanPhasesInnerTasksInnerDict = TypedDict('ModWorkshopGetUserPlanResponseUserplanPhasesInnerTasksInnerDict', {
+    'code': Optional[str],
+    'completed': Optional[str],
+    'details': NotRequired[Optional[str]],
+    'link': Optional[str],
+    'title': Optional[str],
+})
+
+
+ModWorkshopGetWorkshopAccessInformationResponseDict = TypedDict('ModWorkshopGetWorkshopAccessInformationResponseDict', {
+    'assessingallowed': Optional[bool],
+    'assessingexamplesallowed': Optional[bool],
+    'canaddinstance': Optional[bool],
+    'canallocate': Optional[bool],
+    'candeletesubmissions': Optional[bool],
+    'caneditdimensions': Optional[bool],
+    'canexportsubmissions': Optional[bool],
+    'canignoredeadlines': Optional[bool],
+    'canmanageexamples': Optional[bool],
+    'canoverridegrades': Optional[bool],
+    'canpeerassess': Optional[bool],
+    'canpublishsubmissions': Optional[bool],
+    'cansubmit': Optional[bool],
+    'canswitchphase': Optional[bool],
+    'canview': Optional[bool],
+    'canviewallassessments': Optional[bool],
+    'canviewallsubmissions': Optional[bool],
+    'canviewauthornames': Optional[bool],
+    'canviewauthorpublished': Optional[bool],
+    'canviewpublishedsubmissions': Optional[bool],
+    'canviewreviewernames': Optional[bool],
+    'creatingsubmissionallowed': Optional[bool],
+    'examplesassessedbeforeassessment': Optional[bool],
+    'examplesassessedbeforesubmission': Optional[bool],
+    'modifyingsubmissionallowed': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopGetWorkshopsByCoursesResponseDict = TypedDict('ModWorkshopGetWorkshopsByCoursesResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+    'workshops': List['ModWorkshopGetWorkshopsByCoursesResponseWorkshopsInnerDict'],
+})
+
+
+ModWorkshopGetWorkshopsByCoursesResponseWorkshopsInnerDict = TypedDict('ModWorkshopGetWorkshopsByCoursesResponseWorkshopsInnerDict', {
+    'assessmentend': NotRequired[Optional[int]],
+    'assessmentstart': NotRequired[Optional[int]],
+    'conclusion': NotRequired[Optional[str]],
+    'conclusionfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'conclusionformat': NotRequired[Optional[int]],
+    'course': int,
+    'coursemodule': int,
+    'evaluation': NotRequired[Optional[str]],
+    'examplesmode': NotRequired[Optional[int]],
+    'grade': NotRequired[Optional[float]],
+    'gradedecimals': NotRequired[Optional[int]],
+    'gradinggrade': NotRequired[Optional[float]],
+    'id': int,
+    'instructauthors': NotRequired[Optional[str]],
+    'instructauthorsfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'instructauthorsformat': NotRequired[Optional[int]],
+    'instructreviewers': NotRequired[Optional[str]],
+    'instructreviewersfiles': NotRequired[Optional[List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict']]],
+    'instructreviewersformat': NotRequired[Optional[int]],
+    'intro': Optional[str],
+    'introfiles': List['CoreBlogGetEntriesResponseEntriesInnerAttachmentfilesInnerDict'],
+    'introformat': NotRequired[Optional[int]],
+    'lang': Optional[str],
+    'latesubmissions': NotRequired[Optional[bool]],
+    'maxbytes': NotRequired[Optional[int]],
+    'name': str,
+    'nattachments': NotRequired[Optional[int]],
+    'overallfeedbackfiles': NotRequired[Optional[int]],
+    'overallfeedbackfiletypes': NotRequired[Optional[str]],
+    'overallfeedbackmaxbytes': NotRequired[Optional[int]],
+    'overallfeedbackmode': NotRequired[Optional[int]],
+    'phase': NotRequired[Optional[int]],
+    'phaseswitchassessment': NotRequired[Optional[bool]],
+    'strategy': NotRequired[Optional[str]],
+    'submissionend': NotRequired[Optional[int]],
+    'submissionfiletypes': NotRequired[Optional[str]],
+    'submissionstart': NotRequired[Optional[int]],
+    'submissiontypefile': NotRequired[Optional[int]],
+    'submissiontypetext': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'useexamples': NotRequired[Optional[bool]],
+    'usepeerassessment': NotRequired[Optional[bool]],
+    'useselfassessment': NotRequired[Optional[bool]],
+})
+
+
+ModWorkshopUpdateAssessmentParametersDataInnerDict = TypedDict('ModWorkshopUpdateAssessmentParametersDataInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModWorkshopUpdateAssessmentResponseDict = TypedDict('ModWorkshopUpdateAssessmentResponseDict', {
+    'rawgrade': NotRequired[Optional[float]],
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopUpdateSubmissionResponseDict = TypedDict('ModWorkshopUpdateSubmissionResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopViewSubmissionResponseDict = TypedDict('ModWorkshopViewSubmissionResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ModWorkshopViewWorkshopResponseDict = TypedDict('ModWorkshopViewWorkshopResponseDict', {
+    'status': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+PaygwPaypalCreateTransactionCompleteParametersDict = TypedDict('PaygwPaypalCreateTransactionCompleteParametersDict', {
+    'component': Optional[str],
+    'itemid': Optional[int],
+    'orderid': Optional[str],
+    'paymentarea': Optional[str],
+})
+
+
+PaygwPaypalCreateTransactionCompleteResponseDict = TypedDict('PaygwPaypalCreateTransactionCompleteResponseDict', {
+    'message': Optional[str],
+    'success': Optional[bool],
+})
+
+
+PaygwPaypalGetConfigForJsResponseDict = TypedDict('PaygwPaypalGetConfigForJsResponseDict', {
+    'brandname': Optional[str],
+    'clientid': Optional[str],
+    'cost': Optional[float],
+    'currency': Optional[str],
+})
+
+
+QbankEditquestionSetStatusResponseDict = TypedDict('QbankEditquestionSetStatusResponseDict', {
+    'error': Optional[str],
+    'status': Optional[bool],
+    'statusname': Optional[str],
+})
+
+
+QbankManagecategoriesMoveCategoryResponseInnerDict = TypedDict('QbankManagecategoriesMoveCategoryResponseInnerDict', {
+    'action': Optional[str],
+    'fields': 'QbankManagecategoriesMoveCategoryResponseInnerFieldsDict',
+    'name': Optional[str],
+})
+
+
+QbankManagecategoriesMoveCategoryResponseInnerFieldsDict = TypedDict('QbankManagecategoriesMoveCategoryResponseInnerFieldsDict', {
+    'context': NotRequired[Optional[int]],
+    'draghandle': NotRequired[Optional[bool]],
+    'id': Optional[int],
+    'parent': NotRequired[Optional[int]],
+    'sortorder': NotRequired[Optional[int]],
+})
+
+
+QbankTagquestionSubmitTagsFormResponseDict = TypedDict('QbankTagquestionSubmitTagsFormResponseDict', {
+    'status': Optional[bool],
+})
+
+
+QuizaccessSebValidateQuizKeysResponseDict = TypedDict('QuizaccessSebValidateQuizKeysResponseDict', {
+    'browserexamkey': bool,
+    'configkey': bool,
+})
+
+
+ReportCompetencyDataForReportResponseDict = TypedDict('ReportCompetencyDataForReportResponseDict', {
+    'course': 'BlockStarredcoursesGetStarredCoursesResponseInnerDict',
+    'courseid': Optional[int],
+    'pushratingstouserplans': Optional[bool],
+    'user': 'CoreCompetencyCreatePlanResponseReviewerDict',
+    'usercompetencies': List['ReportCompetencyDataForReportResponseUsercompetenciesInnerDict'],
+})
+
+
+ReportCompetencyDataForReportResponseUsercompetenciesInnerDict = TypedDict('ReportCompetencyDataForReportResponseUsercompetenciesInnerDict', {
+    'competency': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyDict',
+    'usercompetencycourse': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourseDict',
+})
+
+
+ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyDict = TypedDict('ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'comppath': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathDict',
+    'framework': 'CoreCompetencyListCompetencyFrameworksResponseInnerDict',
+    'hascourses': bool,
+    'hasrelatedcompetencies': bool,
+    'linkedcourses': List['BlockStarredcoursesGetStarredCoursesResponseInnerDict'],
+    'pluginbaseurl': str,
+    'relatedcompetencies': List['CoreCompetencyListCompetenciesInTemplateResponseInnerDict'],
+    'scaleconfiguration': str,
+    'scaleid': int,
+    'taxonomyterm': str,
+})
+
+
+ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathDict = TypedDict('ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathDict', {
+    'ancestors': List['ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInnerDict'],
+    'framework': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInnerDict',
+    'pagecontextid': int,
+    'pluginbaseurl': str,
+    'showlinks': bool,
+})
+
+
+ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInnerDict = TypedDict('ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathAncestorsInnerDict', {
+    'first': bool,
+    'id': Optional[int],
+    'last': bool,
+    'name': str,
+    'position': int,
+})
+
+
+ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourseDict = TypedDict('ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourseDict', {
+    'competencyid': int,
+    'courseid': int,
+    'grade': Optional[int],
+    'gradename': str,
+    'id': int,
+    'proficiency': Optional[bool],
+    'proficiencyname': str,
+    'timecreated': int,
+    'timemodified': int,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+ReportInsightsActionExecutedResponseDict = TypedDict('ReportInsightsActionExecutedResponseDict', {
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+TinyAutosaveResetSessionParametersDict = TypedDict('TinyAutosaveResetSessionParametersDict', {
+    'contextid': Optional[int],
+    'elementid': Optional[str],
+    'pagehash': Optional[str],
+    'pageinstance': Optional[str],
+})
+
+
+TinyAutosaveResumeSessionParametersDict = TypedDict('TinyAutosaveResumeSessionParametersDict', {
+    'contextid': Optional[int],
+    'draftid': Optional[int],
+    'elementid': Optional[str],
+    'pagehash': Optional[str],
+    'pageinstance': Optional[str],
+})
+
+
+TinyAutosaveResumeSessionResponseDict = TypedDict('TinyAutosaveResumeSessionResponseDict', {
+    'drafttext': Optional[str],
+})
+
+
+TinyAutosaveUpdateSessionParametersDict = TypedDict('TinyAutosaveUpdateSessionParametersDict', {
+    'contextid': Optional[int],
+    'drafttext': Optional[str],
+    'elementid': Optional[str],
+    'pagehash': Optional[str],
+    'pageinstance': Optional[str],
+})
+
+
+TinyEquationFilterResponseDict = TypedDict('TinyEquationFilterResponseDict', {
+    'content': Optional[str],
+})
+
+
+TinyMediaPreviewResponseDict = TypedDict('TinyMediaPreviewResponseDict', {
+    'content': Optional[str],
+})
+
+
+TinyPremiumGetApiKeyResponseDict = TypedDict('TinyPremiumGetApiKeyResponseDict', {
+    'apikey': Optional[str],
+})
+
+
+ToolAnalyticsPotentialContextsResponseInnerDict = TypedDict('ToolAnalyticsPotentialContextsResponseInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+ToolBehatGetEntityGeneratorResponseDict = TypedDict('ToolBehatGetEntityGeneratorResponseDict', {
+    'required': NotRequired[Optional[List[str]]],
+})
+
+
+ToolDataprivacyApproveDataRequestResponseDict = TypedDict('ToolDataprivacyApproveDataRequestResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyBulkApproveDataRequestsResponseDict = TypedDict('ToolDataprivacyBulkApproveDataRequestsResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyBulkDenyDataRequestsResponseDict = TypedDict('ToolDataprivacyBulkDenyDataRequestsResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyCancelDataRequestResponseDict = TypedDict('ToolDataprivacyCancelDataRequestResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyConfirmContextsForDeletionResponseDict = TypedDict('ToolDataprivacyConfirmContextsForDeletionResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyContactDpoResponseDict = TypedDict('ToolDataprivacyContactDpoResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyCreateCategoryFormResponseDict = TypedDict('ToolDataprivacyCreateCategoryFormResponseDict', {
+    'category': 'ToolDataprivacyCreateCategoryFormResponseCategoryDict',
+    'validationerrors': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyCreateCategoryFormResponseCategoryDict = TypedDict('ToolDataprivacyCreateCategoryFormResponseCategoryDict', {
+    'description': Optional[str],
+    'descriptionformat': NotRequired[Optional[int]],
+    'id': int,
+    'name': str,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+ToolDataprivacyCreateDataRequestResponseDict = TypedDict('ToolDataprivacyCreateDataRequestResponseDict', {
+    'datarequestid': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyCreatePurposeFormResponseDict = TypedDict('ToolDataprivacyCreatePurposeFormResponseDict', {
+    'purpose': 'ToolDataprivacyCreatePurposeFormResponsePurposeDict',
+    'validationerrors': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyCreatePurposeFormResponsePurposeDict = TypedDict('ToolDataprivacyCreatePurposeFormResponsePurposeDict', {
+    'description': Optional[str],
+    'descriptionformat': NotRequired[Optional[int]],
+    'formattedlawfulbases': List['ToolDataprivacyCreatePurposeFormResponsePurposeFormattedlawfulbasesInnerDict'],
+    'formattedretentionperiod': str,
+    'formattedsensitivedatareasons': NotRequired[Optional[List['ToolDataprivacyCreatePurposeFormResponsePurposeFormattedlawfulbasesInnerDict']]],
+    'id': int,
+    'lawfulbases': str,
+    'name': str,
+    'protected': int,
+    'retentionperiod': str,
+    'roleoverrides': str,
+    'sensitivedatareasons': Optional[str],
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+ToolDataprivacyCreatePurposeFormResponsePurposeFormattedlawfulbasesInnerDict = TypedDict('ToolDataprivacyCreatePurposeFormResponsePurposeFormattedlawfulbasesInnerDict', {
+    'description': str,
+    'name': str,
+})
+
+
+ToolDataprivacyDeleteCategoryResponseDict = TypedDict('ToolDataprivacyDeleteCategoryResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyDeletePurposeResponseDict = TypedDict('ToolDataprivacyDeletePurposeResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyDenyDataRequestResponseDict = TypedDict('ToolDataprivacyDenyDataRequestResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyGetAccessInformationResponseDict = TypedDict('ToolDataprivacyGetAccessInformationResponseDict', {
+    'cancontactdpo': Optional[bool],
+    'cancreatedatadeletionrequest': Optional[bool],
+    'cancreatedatadownloadrequest': Optional[bool],
+    'canmanagedatarequests': Optional[bool],
+    'hasongoingdatadeletionrequest': Optional[bool],
+    'hasongoingdatadownloadrequest': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyGetActivityOptionsResponseDict = TypedDict('ToolDataprivacyGetActivityOptionsResponseDict', {
+    'options': List['ToolDataprivacyGetActivityOptionsResponseOptionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyGetActivityOptionsResponseOptionsInnerDict = TypedDict('ToolDataprivacyGetActivityOptionsResponseOptionsInnerDict', {
+    'displayname': Optional[str],
+    'name': Optional[str],
+})
+
+
+ToolDataprivacyGetCategoryOptionsResponseDict = TypedDict('ToolDataprivacyGetCategoryOptionsResponseDict', {
+    'options': List['ToolDataprivacyGetCategoryOptionsResponseOptionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyGetCategoryOptionsResponseOptionsInnerDict = TypedDict('ToolDataprivacyGetCategoryOptionsResponseOptionsInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+ToolDataprivacyGetDataRequestResponseDict = TypedDict('ToolDataprivacyGetDataRequestResponseDict', {
+    'result': 'ToolDataprivacyGetDataRequestResponseResultDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyGetDataRequestResponseResultDict = TypedDict('ToolDataprivacyGetDataRequestResponseResultDict', {
+    'allowfiltering': NotRequired[Optional[bool]],
+    'approvedeny': NotRequired[Optional[bool]],
+    'canmarkcomplete': NotRequired[Optional[bool]],
+    'canreview': NotRequired[Optional[bool]],
+    'comments': str,
+    'commentsformat': int,
+    'creationmethod': int,
+    'downloadlink': NotRequired[Optional[str]],
+    'dpo': Optional[int],
+    'dpocomment': Optional[str],
+    'dpocommentformat': int,
+    'dpouser': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'foruser': 'CoreCompetencyCreatePlanResponseReviewerDict',
+    'id': int,
+    'messagehtml': NotRequired[Optional[str]],
+    'requestedby': int,
+    'requestedbyuser': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'status': int,
+    'statuslabel': str,
+    'statuslabelclass': str,
+    'systemapproved': bool,
+    'timecreated': int,
+    'timemodified': int,
+    'type': int,
+    'typename': str,
+    'typenameshort': str,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+ToolDataprivacyGetDataRequestsResponseDict = TypedDict('ToolDataprivacyGetDataRequestsResponseDict', {
+    'requests': List['ToolDataprivacyGetDataRequestResponseResultDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyGetPurposeOptionsResponseDict = TypedDict('ToolDataprivacyGetPurposeOptionsResponseDict', {
+    'options': List['ToolDataprivacyGetPurposeOptionsResponseOptionsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyGetPurposeOptionsResponseOptionsInnerDict = TypedDict('ToolDataprivacyGetPurposeOptionsResponseOptionsInnerDict', {
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+ToolDataprivacyMarkCompleteResponseDict = TypedDict('ToolDataprivacyMarkCompleteResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacySetContextDefaultsResponseDict = TypedDict('ToolDataprivacySetContextDefaultsResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacySetContextFormResponseDict = TypedDict('ToolDataprivacySetContextFormResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacySetContextlevelFormResponseDict = TypedDict('ToolDataprivacySetContextlevelFormResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacySubmitSelectedCoursesFormResponseDict = TypedDict('ToolDataprivacySubmitSelectedCoursesFormResponseDict', {
+    'result': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyTreeExtraBranchesResponseDict = TypedDict('ToolDataprivacyTreeExtraBranchesResponseDict', {
+    'branches': List['ToolDataprivacyTreeExtraBranchesResponseBranchesInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolDataprivacyTreeExtraBranchesResponseBranchesInnerDict = TypedDict('ToolDataprivacyTreeExtraBranchesResponseBranchesInnerDict', {
+    'branches': NotRequired[Optional[List['ToolDataprivacyTreeExtraBranchesResponseBranchesInnerBranchesInnerDict']]],
+    'contextid': Optional[int],
+    'contextlevel': Optional[int],
+    'expandcontextid': Optional[int],
+    'expanded': Optional[int],
+    'expandelement': Optional[str],
+    'text': Optional[str],
+})
+
+
+ToolDataprivacyTreeExtraBranchesResponseBranchesInnerBranchesInnerDict = TypedDict('ToolDataprivacyTreeExtraBranchesResponseBranchesInnerBranchesInnerDict', {
+    'branches': List[str],
+    'contextid': Optional[int],
+    'contextlevel': Optional[int],
+    'expandcontextid': Optional[int],
+    'expanded': Optional[int],
+    'expandelement': Optional[str],
+    'text': Optional[str],
+})
+
+
+ToolLpDataForCompetenciesManagePageResponseDict = TypedDict('ToolLpDataForCompetenciesManagePageResponseDict', {
+    'canmanage': Optional[bool],
+    'framework': 'CoreCompetencyListCompetencyFrameworksResponseInnerDict',
+    'pagecontextid': Optional[int],
+    'pluginbaseurl': Optional[str],
+    'rulesmodules': Optional[str],
+    'search': Optional[str],
+})
+
+
+ToolLpDataForCompetencyFrameworksManagePageResponseDict = TypedDict('ToolLpDataForCompetencyFrameworksManagePageResponseDict', {
+    'competencyframeworks': List['CoreCompetencyListCompetencyFrameworksResponseInnerDict'],
+    'navigation': List[str],
+    'pagecontextid': Optional[int],
+    'pluginbaseurl': Optional[str],
+})
+
+
+ToolLpDataForCompetencySummaryResponseDict = TypedDict('ToolLpDataForCompetencySummaryResponseDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'comppath': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathDict',
+    'framework': 'CoreCompetencyListCompetencyFrameworksResponseInnerDict',
+    'hascourses': bool,
+    'hasrelatedcompetencies': bool,
+    'linkedcourses': List['BlockStarredcoursesGetStarredCoursesResponseInnerDict'],
+    'pluginbaseurl': str,
+    'relatedcompetencies': List['CoreCompetencyListCompetenciesInTemplateResponseInnerDict'],
+    'scaleconfiguration': str,
+    'scaleid': int,
+    'taxonomyterm': str,
+})
+
+
+ToolLpDataForCourseCompetenciesPageResponseDict = TypedDict('ToolLpDataForCourseCompetenciesPageResponseDict', {
+    'canconfigurecoursecompetencies': Optional[bool],
+    'cangradecompetencies': Optional[bool],
+    'canmanagecompetencyframeworks': Optional[bool],
+    'canmanagecoursecompetencies': Optional[bool],
+    'competencies': List['ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerDict'],
+    'courseid': Optional[int],
+    'gradableuserid': NotRequired[Optional[int]],
+    'manageurl': Optional[str],
+    'pagecontextid': Optional[int],
+    'pluginbaseurl': Optional[str],
+    'settings': 'ToolLpDataForCourseCompetenciesPageResponseSettingsDict',
+    'statistics': 'ToolLpDataForCourseCompetenciesPageResponseStatisticsDict',
+})
+
+
+ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerDict = TypedDict('ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'comppath': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathDict',
+    'coursecompetency': 'CoreCompetencyListCourseCompetenciesResponseInnerCoursecompetencyDict',
+    'coursemodules': List['ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInnerDict'],
+    'plans': List['CoreCompetencyListUserPlansResponseInnerDict'],
+    'ruleoutcomeoptions': List['ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerRuleoutcomeoptionsInnerDict'],
+    'usercompetencycourse': NotRequired[Optional['ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourseDict']],
+})
+
+
+ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInnerDict = TypedDict('ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInnerDict', {
+    'iconurl': str,
+    'id': int,
+    'name': str,
+    'url': NotRequired[Optional[str]],
+})
+
+
+ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerRuleoutcomeoptionsInnerDict = TypedDict('ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerRuleoutcomeoptionsInnerDict', {
+    'selected': Optional[bool],
+    'text': Optional[str],
+    'value': Optional[int],
+})
+
+
+ToolLpDataForCourseCompetenciesPageResponseSettingsDict = TypedDict('ToolLpDataForCourseCompetenciesPageResponseSettingsDict', {
+    'courseid': int,
+    'id': int,
+    'pushratingstouserplans': bool,
+    'timecreated': int,
+    'timemodified': int,
+    'usermodified': int,
+})
+
+
+ToolLpDataForCourseCompetenciesPageResponseStatisticsDict = TypedDict('ToolLpDataForCourseCompetenciesPageResponseStatisticsDict', {
+    'canbegradedincourse': bool,
+    'canmanagecoursecompetencies': bool,
+    'competencycount': int,
+    'leastproficient': List['CoreCompetencyListCompetenciesInTemplateResponseInnerDict'],
+    'leastproficientcount': int,
+    'proficientcompetencycount': int,
+    'proficientcompetencypercentage': float,
+    'proficientcompetencypercentageformatted': str,
+})
+
+
+ToolLpDataForPlanPageResponseDict = TypedDict('ToolLpDataForPlanPageResponseDict', {
+    'competencies': List['ToolLpDataForPlanPageResponseCompetenciesInnerDict'],
+    'competencycount': Optional[int],
+    'contextid': Optional[int],
+    'plan': 'CoreCompetencyListUserPlansResponseInnerDict',
+    'pluginbaseurl': Optional[str],
+    'proficientcompetencycount': Optional[int],
+    'proficientcompetencypercentage': Optional[float],
+    'proficientcompetencypercentageformatted': Optional[str],
+})
+
+
+ToolLpDataForPlanPageResponseCompetenciesInnerDict = TypedDict('ToolLpDataForPlanPageResponseCompetenciesInnerDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'comppath': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyComppathDict',
+    'usercompetency': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyDict']],
+    'usercompetencyplan': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplanDict']],
+})
+
+
+ToolLpDataForPlansPageResponseDict = TypedDict('ToolLpDataForPlansPageResponseDict', {
+    'canmanageuserplans': Optional[bool],
+    'canreaduserevidence': Optional[bool],
+    'navigation': List[str],
+    'plans': List['CoreCompetencyListUserPlansResponseInnerDict'],
+    'pluginbaseurl': Optional[str],
+    'userid': Optional[int],
+})
+
+
+ToolLpDataForRelatedCompetenciesSectionResponseDict = TypedDict('ToolLpDataForRelatedCompetenciesSectionResponseDict', {
+    'relatedcompetencies': List['CoreCompetencyListCompetenciesInTemplateResponseInnerDict'],
+    'showdeleterelatedaction': Optional[bool],
+})
+
+
+ToolLpDataForTemplateCompetenciesPageResponseDict = TypedDict('ToolLpDataForTemplateCompetenciesPageResponseDict', {
+    'canmanagecompetencyframeworks': Optional[bool],
+    'canmanagetemplatecompetencies': Optional[bool],
+    'competencies': List['ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyDict'],
+    'manageurl': Optional[str],
+    'pagecontextid': Optional[int],
+    'pluginbaseurl': Optional[str],
+    'statistics': 'ToolLpDataForTemplateCompetenciesPageResponseStatisticsDict',
+    'template': 'CoreCompetencyCreatePlanResponseTemplateDict',
+})
+
+
+ToolLpDataForTemplateCompetenciesPageResponseStatisticsDict = TypedDict('ToolLpDataForTemplateCompetenciesPageResponseStatisticsDict', {
+    'competencycount': int,
+    'completedplancount': int,
+    'completedplanpercentage': float,
+    'completedplanpercentageformatted': str,
+    'leastproficient': List['CoreCompetencyListCompetenciesInTemplateResponseInnerDict'],
+    'leastproficientcount': int,
+    'linkedcompetencycount': int,
+    'linkedcompetencypercentage': float,
+    'linkedcompetencypercentageformatted': str,
+    'plancount': int,
+    'proficientusercompetencyplancount': int,
+    'proficientusercompetencyplanpercentage': float,
+    'proficientusercompetencyplanpercentageformatted': str,
+    'unlinkedcompetencycount': int,
+    'usercompetencyplancount': int,
+})
+
+
+ToolLpDataForTemplatesManagePageResponseDict = TypedDict('ToolLpDataForTemplatesManagePageResponseDict', {
+    'canmanage': Optional[bool],
+    'navigation': List[str],
+    'pagecontextid': Optional[int],
+    'pluginbaseurl': Optional[str],
+    'templates': List['CoreCompetencyCreatePlanResponseTemplateDict'],
+})
+
+
+ToolLpDataForUserCompetencySummaryInCourseResponseDict = TypedDict('ToolLpDataForUserCompetencySummaryInCourseResponseDict', {
+    'course': 'BlockStarredcoursesGetStarredCoursesResponseInnerDict',
+    'coursemodules': List['ToolLpDataForCourseCompetenciesPageResponseCompetenciesInnerCoursemodulesInnerDict'],
+    'plans': List['CoreCompetencyListUserPlansResponseInnerDict'],
+    'pluginbaseurl': str,
+    'usercompetencysummary': 'ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryDict',
+})
+
+
+ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryDict = TypedDict('ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryDict', {
+    'cangrade': bool,
+    'commentarea': NotRequired[Optional['CoreCompetencyCreatePlanResponseCommentareaDict']],
+    'competency': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyDict',
+    'evidence': List['ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryEvidenceInnerDict'],
+    'showrelatedcompetencies': bool,
+    'user': 'CoreCompetencyCreatePlanResponseReviewerDict',
+    'usercompetency': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyDict']],
+    'usercompetencycourse': NotRequired[Optional['ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourseDict']],
+    'usercompetencyplan': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplanDict']],
+})
+
+
+ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryEvidenceInnerDict = TypedDict('ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryEvidenceInnerDict', {
+    'action': int,
+    'actionuser': NotRequired[Optional['CoreCompetencyCreatePlanResponseReviewerDict']],
+    'actionuserid': Optional[int],
+    'candelete': bool,
+    'contextid': int,
+    'desca': Optional[str],
+    'desccomponent': str,
+    'descidentifier': str,
+    'description': str,
+    'grade': Optional[int],
+    'gradename': str,
+    'id': int,
+    'note': Optional[str],
+    'timecreated': int,
+    'timemodified': int,
+    'url': Optional[str],
+    'usercompetencyid': int,
+    'userdate': str,
+    'usermodified': int,
+})
+
+
+ToolLpDataForUserCompetencySummaryInPlanResponseDict = TypedDict('ToolLpDataForUserCompetencySummaryInPlanResponseDict', {
+    'plan': 'CoreCompetencyListUserPlansResponseInnerDict',
+    'usercompetencysummary': 'ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryDict',
+})
+
+
+ToolLpDataForUserCompetencySummaryResponseDict = TypedDict('ToolLpDataForUserCompetencySummaryResponseDict', {
+    'cangrade': bool,
+    'commentarea': NotRequired[Optional['CoreCompetencyCreatePlanResponseCommentareaDict']],
+    'competency': 'ReportCompetencyDataForReportResponseUsercompetenciesInnerCompetencyDict',
+    'evidence': List['ToolLpDataForUserCompetencySummaryInCourseResponseUsercompetencysummaryEvidenceInnerDict'],
+    'showrelatedcompetencies': bool,
+    'user': 'CoreCompetencyCreatePlanResponseReviewerDict',
+    'usercompetency': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyDict']],
+    'usercompetencycourse': NotRequired[Optional['ReportCompetencyDataForReportResponseUsercompetenciesInnerUsercompetencycourseDict']],
+    'usercompetencyplan': NotRequired[Optional['CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyplanDict']],
+})
+
+
+ToolLpDataForUserEvidenceListPageResponseDict = TypedDict('ToolLpDataForUserEvidenceListPageResponseDict', {
+    'canmanage': Optional[bool],
+    'evidence': List['ToolLpDataForUserEvidenceListPageResponseEvidenceInnerDict'],
+    'navigation': List[str],
+    'pluginbaseurl': Optional[str],
+    'userid': Optional[int],
+})
+
+
+ToolLpDataForUserEvidenceListPageResponseEvidenceInnerDict = TypedDict('ToolLpDataForUserEvidenceListPageResponseEvidenceInnerDict', {
+    'canmanage': bool,
+    'competencycount': int,
+    'description': str,
+    'descriptionformat': NotRequired[Optional[int]],
+    'filecount': int,
+    'files': List['CoreCompetencyReadUserEvidenceResponseFilesInnerDict'],
+    'hasurlorfiles': bool,
+    'id': int,
+    'name': str,
+    'timecreated': int,
+    'timemodified': int,
+    'url': str,
+    'urlshort': str,
+    'usercompetencies': NotRequired[Optional[List['ToolLpDataForUserEvidenceListPageResponseEvidenceInnerUsercompetenciesInnerDict']]],
+    'userhasplan': bool,
+    'userid': int,
+    'usermodified': int,
+})
+
+
+ToolLpDataForUserEvidenceListPageResponseEvidenceInnerUsercompetenciesInnerDict = TypedDict('ToolLpDataForUserEvidenceListPageResponseEvidenceInnerUsercompetenciesInnerDict', {
+    'competency': 'CoreCompetencyListCompetenciesInTemplateResponseInnerDict',
+    'usercompetency': 'CoreCompetencyListPlanCompetenciesResponseInnerUsercompetencyDict',
+})
+
+
+ToolLpDataForUserEvidencePageResponseDict = TypedDict('ToolLpDataForUserEvidencePageResponseDict', {
+    'pluginbaseurl': Optional[str],
+    'userevidence': 'ToolLpDataForUserEvidenceListPageResponseEvidenceInnerDict',
+})
+
+
+ToolLpSearchCohortsResponseDict = TypedDict('ToolLpSearchCohortsResponseDict', {
+    'cohorts': List['CoreCohortGetCohortsResponseInnerDict'],
+})
+
+
+ToolLpSearchUsersResponseDict = TypedDict('ToolLpSearchUsersResponseDict', {
+    'count': Optional[int],
+    'users': List['CoreCompetencyCreatePlanResponseReviewerDict'],
+})
+
+
+ToolMobileCallExternalFunctionsParametersRequestsInnerDict = TypedDict('ToolMobileCallExternalFunctionsParametersRequestsInnerDict', {
+    'arguments': NotRequired[Optional[str]],
+    'function': Optional[str],
+    'settingfileurl': NotRequired[Optional[bool]],
+    'settingfilter': NotRequired[Optional[bool]],
+    'settinglang': NotRequired[Optional[str]],
+    'settingraw': NotRequired[Optional[bool]],
+})
+
+
+ToolMobileCallExternalFunctionsResponseDict = TypedDict('ToolMobileCallExternalFunctionsResponseDict', {
+    'responses': List['ToolMobileCallExternalFunctionsResponseResponsesInnerDict'],
+})
+
+
+ToolMobileCallExternalFunctionsResponseResponsesInnerDict = TypedDict('ToolMobileCallExternalFunctionsResponseResponsesInnerDict', {
+    'data': NotRequired[Optional[str]],
+    'error': Optional[bool],
+    'exception': NotRequired[Optional[str]],
+})
+
+
+ToolMobileGetAutologinKeyResponseDict = TypedDict('ToolMobileGetAutologinKeyResponseDict', {
+    'autologinurl': Optional[str],
+    'key': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolMobileGetConfigResponseDict = TypedDict('ToolMobileGetConfigResponseDict', {
+    'settings': List['ToolMobileGetConfigResponseSettingsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolMobileGetConfigResponseSettingsInnerDict = TypedDict('ToolMobileGetConfigResponseSettingsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ToolMobileGetContentParametersArgsInnerDict = TypedDict('ToolMobileGetContentParametersArgsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ToolMobileGetContentResponseDict = TypedDict('ToolMobileGetContentResponseDict', {
+    'disabled': NotRequired[Optional[bool]],
+    'files': List['CoreBlockGetCourseBlocksResponseBlocksInnerContentsFilesInnerDict'],
+    'javascript': Optional[str],
+    'otherdata': List['ToolMobileGetContentResponseOtherdataInnerDict'],
+    'restrict': 'ToolMobileGetContentResponseRestrictDict',
+    'templates': List['ToolMobileGetContentResponseTemplatesInnerDict'],
+})
+
+
+ToolMobileGetContentResponseOtherdataInnerDict = TypedDict('ToolMobileGetContentResponseOtherdataInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ToolMobileGetContentResponseRestrictDict = TypedDict('ToolMobileGetContentResponseRestrictDict', {
+    'courses': NotRequired[Optional[List[int]]],
+    'users': NotRequired[Optional[List[int]]],
+})
+
+
+ToolMobileGetContentResponseTemplatesInnerDict = TypedDict('ToolMobileGetContentResponseTemplatesInnerDict', {
+    'html': Optional[str],
+    'id': Optional[str],
+})
+
+
+ToolMobileGetPluginsSupportingMobileResponseDict = TypedDict('ToolMobileGetPluginsSupportingMobileResponseDict', {
+    'plugins': List['ToolMobileGetPluginsSupportingMobileResponsePluginsInnerDict'],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolMobileGetPluginsSupportingMobileResponsePluginsInnerDict = TypedDict('ToolMobileGetPluginsSupportingMobileResponsePluginsInnerDict', {
+    'addon': Optional[str],
+    'component': Optional[str],
+    'dependencies': List[str],
+    'filehash': Optional[str],
+    'filesize': Optional[int],
+    'fileurl': Optional[str],
+    'handlers': NotRequired[Optional[str]],
+    'lang': NotRequired[Optional[str]],
+    'version': Optional[str],
+})
+
+
+ToolMobileGetPublicConfigResponseDict = TypedDict('ToolMobileGetPublicConfigResponseDict', {
+    'agedigitalconsentverification': NotRequired[Optional[bool]],
+    'authinstructions': Optional[str],
+    'authloginviaemail': Optional[int],
+    'authnoneenabled': Optional[int],
+    'autolang': NotRequired[Optional[int]],
+    'compactlogourl': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'enablemobilewebservice': Optional[int],
+    'enablewebservices': Optional[int],
+    'forgottenpasswordurl': Optional[str],
+    'guestlogin': Optional[int],
+    'httpswwwroot': Optional[str],
+    'identityproviders': NotRequired[Optional[List['ToolMobileGetPublicConfigResponseIdentityprovidersInnerDict']]],
+    'lang': NotRequired[Optional[str]],
+    'langlist': NotRequired[Optional[str]],
+    'langmenu': NotRequired[Optional[int]],
+    'launchurl': NotRequired[Optional[str]],
+    'locale': NotRequired[Optional[str]],
+    'logourl': NotRequired[Optional[str]],
+    'maintenanceenabled': Optional[int],
+    'maintenancemessage': Optional[str],
+    'mobilecssurl': NotRequired[Optional[str]],
+    'registerauth': Optional[str],
+    'rememberusername': Optional[int],
+    'showloginform': Optional[int],
+    'sitename': Optional[str],
+    'supportavailability': NotRequired[Optional[int]],
+    'supportemail': NotRequired[Optional[str]],
+    'supportname': NotRequired[Optional[str]],
+    'supportpage': NotRequired[Optional[str]],
+    'tool_mobile_androidappid': NotRequired[Optional[str]],
+    'tool_mobile_disabledfeatures': NotRequired[Optional[str]],
+    'tool_mobile_iosappid': NotRequired[Optional[str]],
+    'tool_mobile_minimumversion': NotRequired[Optional[str]],
+    'tool_mobile_qrcodetype': NotRequired[Optional[int]],
+    'tool_mobile_setuplink': NotRequired[Optional[str]],
+    'typeoflogin': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+    'wwwroot': Optional[str],
+})
+
+
+ToolMobileGetPublicConfigResponseIdentityprovidersInnerDict = TypedDict('ToolMobileGetPublicConfigResponseIdentityprovidersInnerDict', {
+    'iconurl': Optional[str],
+    'name': Optional[str],
+    'url': Optional[str],
+})
+
+
+ToolMobileGetTokensForQrLoginParametersDict = TypedDict('ToolMobileGetTokensForQrLoginParametersDict', {
+    'qrloginkey': Optional[str],
+    'userid': Optional[int],
+})
+
+
+ToolMobileGetTokensForQrLoginResponseDict = TypedDict('ToolMobileGetTokensForQrLoginResponseDict', {
+    'privatetoken': Optional[str],
+    'token': Optional[str],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolMobileValidateSubscriptionKeyParametersDict = TypedDict('ToolMobileValidateSubscriptionKeyParametersDict', {
+    'key': Optional[str],
+})
+
+
+ToolMobileValidateSubscriptionKeyResponseDict = TypedDict('ToolMobileValidateSubscriptionKeyResponseDict', {
+    'validated': Optional[bool],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolMoodlenetSearchCoursesResponseDict = TypedDict('ToolMoodlenetSearchCoursesResponseDict', {
+    'courses': List['ToolMoodlenetSearchCoursesResponseCoursesInnerDict'],
+})
+
+
+ToolMoodlenetSearchCoursesResponseCoursesInnerDict = TypedDict('ToolMoodlenetSearchCoursesResponseCoursesInnerDict', {
+    'coursecategory': Optional[str],
+    'courseimage': Optional[str],
+    'fullname': Optional[str],
+    'hidden': Optional[int],
+    'id': Optional[int],
+    'viewurl': Optional[str],
+})
+
+
+ToolMoodlenetVerifyWebfingerResponseDict = TypedDict('ToolMoodlenetVerifyWebfingerResponseDict', {
+    'domain': NotRequired[Optional[str]],
+    'message': Optional[str],
+    'result': Optional[bool],
+})
+
+
+ToolPolicyGetPolicyVersionParametersDict = TypedDict('ToolPolicyGetPolicyVersionParametersDict', {
+    'behalfid': NotRequired[Optional[int]],
+    'versionid': Optional[int],
+})
+
+
+ToolPolicyGetPolicyVersionResponseDict = TypedDict('ToolPolicyGetPolicyVersionResponseDict', {
+    'result': 'ToolPolicyGetPolicyVersionResponseResultDict',
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolPolicyGetPolicyVersionResponseResultDict = TypedDict('ToolPolicyGetPolicyVersionResponseResultDict', {
+    'policy': NotRequired[Optional['ToolPolicyGetPolicyVersionResponseResultPolicyDict']],
+})
+
+
+ToolPolicyGetPolicyVersionResponseResultPolicyDict = TypedDict('ToolPolicyGetPolicyVersionResponseResultPolicyDict', {
+    'content': NotRequired[Optional[str]],
+    'name': NotRequired[Optional[str]],
+    'versionid': NotRequired[Optional[int]],
+})
+
+
+ToolPolicyGetUserAcceptancesResponseDict = TypedDict('ToolPolicyGetUserAcceptancesResponseDict', {
+    'policies': NotRequired[Optional[List['ToolPolicyGetUserAcceptancesResponsePoliciesInnerDict']]],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolPolicyGetUserAcceptancesResponsePoliciesInnerDict = TypedDict('ToolPolicyGetUserAcceptancesResponsePoliciesInnerDict', {
+    'acceptance': NotRequired[Optional['ToolPolicyGetUserAcceptancesResponsePoliciesInnerAcceptanceDict']],
+    'agreementstyle': Optional[int],
+    'canaccept': Optional[bool],
+    'candecline': Optional[bool],
+    'canrevoke': Optional[bool],
+    'content': NotRequired[Optional[str]],
+    'contentformat': Optional[int],
+    'name': Optional[str],
+    'optional': Optional[int],
+    'policyid': Optional[int],
+    'revision': Optional[str],
+    'status': Optional[int],
+    'summary': NotRequired[Optional[str]],
+    'summaryformat': Optional[int],
+    'versionid': Optional[int],
+})
+
+
+ToolPolicyGetUserAcceptancesResponsePoliciesInnerAcceptanceDict = TypedDict('ToolPolicyGetUserAcceptancesResponsePoliciesInnerAcceptanceDict', {
+    'lang': Optional[str],
+    'modfullname': NotRequired[Optional[str]],
+    'note': NotRequired[Optional[str]],
+    'status': Optional[int],
+    'timemodified': Optional[int],
+    'usermodified': Optional[int],
+})
+
+
+ToolPolicySetAcceptancesStatusParametersPoliciesInnerDict = TypedDict('ToolPolicySetAcceptancesStatusParametersPoliciesInnerDict', {
+    'note': NotRequired[Optional[str]],
+    'status': Optional[int],
+    'versionid': Optional[int],
+})
+
+
+ToolPolicySetAcceptancesStatusResponseDict = TypedDict('ToolPolicySetAcceptancesStatusResponseDict', {
+    'policyagreed': Optional[int],
+    'warnings': NotRequired[Optional[List['AuthEmailGetSignupSettingsResponseWarningsInnerDict']]],
+})
+
+
+ToolTemplatelibraryListTemplatesParametersDict = TypedDict('ToolTemplatelibraryListTemplatesParametersDict', {
+    'component': NotRequired[Optional[str]],
+    'search': NotRequired[Optional[str]],
+    'themename': NotRequired[Optional[str]],
+})
+
+
+ToolTemplatelibraryLoadCanonicalTemplateParametersDict = TypedDict('ToolTemplatelibraryLoadCanonicalTemplateParametersDict', {
+    'component': Optional[str],
+    'template': Optional[str],
+})
+
+
+ToolUsertoursFetchAndStartTourResponseDict = TypedDict('ToolUsertoursFetchAndStartTourResponseDict', {
+    'tourconfig': NotRequired[Optional['ToolUsertoursFetchAndStartTourResponseTourconfigDict']],
+})
+
+
+ToolUsertoursFetchAndStartTourResponseTourconfigDict = TypedDict('ToolUsertoursFetchAndStartTourResponseTourconfigDict', {
+    'displaystepnumbers': Optional[bool],
+    'endtourlabel': Optional[str],
+    'name': Optional[str],
+    'steps': List['ToolUsertoursFetchAndStartTourResponseTourconfigStepsInnerDict'],
+})
+
+
+ToolUsertoursFetchAndStartTourResponseTourconfigStepsInnerDict = TypedDict('ToolUsertoursFetchAndStartTourResponseTourconfigStepsInnerDict', {
+    'backdrop': NotRequired[Optional[bool]],
+    'content': Optional[str],
+    'delay': NotRequired[Optional[int]],
+    'element': Optional[str],
+    'orphan': NotRequired[Optional[bool]],
+    'placement': Optional[str],
+    'reflex': NotRequired[Optional[bool]],
+    'stepid': NotRequired[Optional[int]],
+    'title': Optional[str],
+})
+
+
+ToolUsertoursResetTourResponseDict = TypedDict('ToolUsertoursResetTourResponseDict', {
+    'startTour': NotRequired[Optional[int]],
+})
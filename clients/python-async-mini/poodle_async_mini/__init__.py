@@ -18,11 +18,33 @@ __version__ = "5.0.2.post4"
 
 # Define package exports
 __all__ = [
+    "CoreCommentApi",
+    "CoreCourseApi",
+    "CoreEnrolApi",
+    "CoreGroupApi",
+    "CoreLoginApi",
+    "CoreWebserviceApi",
+    "GradereportUserApi",
+    "ModAssignApi",
+    "ToolMobileApi",
     "DefaultApi",
     "ApiResponse",
     "ApiClient",
     "Configuration",
     "settings",
+    "FileMirror",
+    "MirrorReport",
+    "CourseSync",
+    "CourseChange",
+    "PreparedCall",
+    "Paginator",
+    "ResponseCache",
+    "DiskResponseCache",
+    "ClientManager",
+    "TokenProvider",
+    "Instrumentation",
+    "PrometheusExporter",
+    "LogExporter",
     "OpenApiException",
     "ApiTypeError",
     "ApiValueError",
@@ -79,11 +101,33 @@ __all__ = [
 
 if __import__("typing").TYPE_CHECKING:
     # import apis into sdk package
+    from poodle_async_mini.api.core_comment_api import CoreCommentApi as CoreCommentApi
+    from poodle_async_mini.api.core_course_api import CoreCourseApi as CoreCourseApi
+    from poodle_async_mini.api.core_enrol_api import CoreEnrolApi as CoreEnrolApi
+    from poodle_async_mini.api.core_group_api import CoreGroupApi as CoreGroupApi
+    from poodle_async_mini.api.core_login_api import CoreLoginApi as CoreLoginApi
+    from poodle_async_mini.api.core_webservice_api import CoreWebserviceApi as CoreWebserviceApi
+    from poodle_async_mini.api.gradereport_user_api import GradereportUserApi as GradereportUserApi
+    from poodle_async_mini.api.mod_assign_api import ModAssignApi as ModAssignApi
+    from poodle_async_mini.api.tool_mobile_api import ToolMobileApi as ToolMobileApi
     from poodle_async_mini.api.default_api import DefaultApi as DefaultApi
     
     # import ApiClient
     from poodle_async_mini.api_response import ApiResponse as ApiResponse
     from poodle_async_mini.api_client import ApiClient as ApiClient
+    from poodle_async_mini.sync import FileMirror as FileMirror
+    from poodle_async_mini.sync import MirrorReport as MirrorReport
+    from poodle_async_mini.sync import CourseSync as CourseSync
+    from poodle_async_mini.sync import CourseChange as CourseChange
+    from poodle_async_mini.api_client import PreparedCall as PreparedCall
+    from poodle_async_mini.api_client import Paginator as Paginator
+    from poodle_async_mini.cache import ResponseCache as ResponseCache
+    from poodle_async_mini.cache import DiskResponseCache as DiskResponseCache
+    from poodle_async_mini.client_manager import ClientManager as ClientManager
+    from poodle_async_mini.tokens import TokenProvider as TokenProvider
+    from poodle_async_mini.instrumentation import Instrumentation as Instrumentation
+    from poodle_async_mini.instrumentation import PrometheusExporter as PrometheusExporter
+    from poodle_async_mini.instrumentation import LogExporter as LogExporter
     from poodle_async_mini.configuration import Configuration as Configuration
     from poodle_async_mini.configuration import settings as settings
     from poodle_async_mini.exceptions import OpenApiException as OpenApiException
@@ -150,11 +194,33 @@ else:
             ("__version__", __version__),
             ("__all__", __all__),
             """# import apis into sdk package
+from poodle_async_mini.api.core_comment_api import CoreCommentApi as CoreCommentApi
+from poodle_async_mini.api.core_course_api import CoreCourseApi as CoreCourseApi
+from poodle_async_mini.api.core_enrol_api import CoreEnrolApi as CoreEnrolApi
+from poodle_async_mini.api.core_group_api import CoreGroupApi as CoreGroupApi
+from poodle_async_mini.api.core_login_api import CoreLoginApi as CoreLoginApi
+from poodle_async_mini.api.core_webservice_api import CoreWebserviceApi as CoreWebserviceApi
+from poodle_async_mini.api.gradereport_user_api import GradereportUserApi as GradereportUserApi
+from poodle_async_mini.api.mod_assign_api import ModAssignApi as ModAssignApi
+from poodle_async_mini.api.tool_mobile_api import ToolMobileApi as ToolMobileApi
 from poodle_async_mini.api.default_api import DefaultApi as DefaultApi
 
 # import ApiClient
 from poodle_async_mini.api_response import ApiResponse as ApiResponse
 from poodle_async_mini.api_client import ApiClient as ApiClient
+from poodle_async_mini.sync import FileMirror as FileMirror
+from poodle_async_mini.sync import MirrorReport as MirrorReport
+from poodle_async_mini.sync import CourseSync as CourseSync
+from poodle_async_mini.sync import CourseChange as CourseChange
+from poodle_async_mini.api_client import PreparedCall as PreparedCall
+from poodle_async_mini.api_client import Paginator as Paginator
+from poodle_async_mini.cache import ResponseCache as ResponseCache
+from poodle_async_mini.cache import DiskResponseCache as DiskResponseCache
+from poodle_async_mini.client_manager import ClientManager as ClientManager
+from poodle_async_mini.tokens import TokenProvider as TokenProvider
+from poodle_async_mini.instrumentation import Instrumentation as Instrumentation
+from poodle_async_mini.instrumentation import PrometheusExporter as PrometheusExporter
+from poodle_async_mini.instrumentation import LogExporter as LogExporter
 from poodle_async_mini.configuration import Configuration as Configuration
 from poodle_async_mini.configuration import settings as settings
 from poodle_async_mini.exceptions import OpenApiException as OpenApiException
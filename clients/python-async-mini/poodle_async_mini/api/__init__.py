@@ -2,6 +2,15 @@
 
 if __import__("typing").TYPE_CHECKING:
     # import apis into api package
+    from poodle_async_mini.api.core_comment_api import CoreCommentApi
+    from poodle_async_mini.api.core_course_api import CoreCourseApi
+    from poodle_async_mini.api.core_enrol_api import CoreEnrolApi
+    from poodle_async_mini.api.core_group_api import CoreGroupApi
+    from poodle_async_mini.api.core_login_api import CoreLoginApi
+    from poodle_async_mini.api.core_webservice_api import CoreWebserviceApi
+    from poodle_async_mini.api.gradereport_user_api import GradereportUserApi
+    from poodle_async_mini.api.mod_assign_api import ModAssignApi
+    from poodle_async_mini.api.tool_mobile_api import ToolMobileApi
     from poodle_async_mini.api.default_api import DefaultApi
     
 else:
@@ -11,6 +20,15 @@ else:
         LazyModule(
             *as_package(__file__),
             """# import apis into api package
+from poodle_async_mini.api.core_comment_api import CoreCommentApi
+from poodle_async_mini.api.core_course_api import CoreCourseApi
+from poodle_async_mini.api.core_enrol_api import CoreEnrolApi
+from poodle_async_mini.api.core_group_api import CoreGroupApi
+from poodle_async_mini.api.core_login_api import CoreLoginApi
+from poodle_async_mini.api.core_webservice_api import CoreWebserviceApi
+from poodle_async_mini.api.gradereport_user_api import GradereportUserApi
+from poodle_async_mini.api.mod_assign_api import ModAssignApi
+from poodle_async_mini.api.tool_mobile_api import ToolMobileApi
 from poodle_async_mini.api.default_api import DefaultApi
 
 """,
@@ -0,0 +1,1247 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import warnings
+import json
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from typing_extensions import Annotated
+
+from pydantic import Field, StrictInt, StrictStr
+from typing import List, Optional
+from typing_extensions import Annotated
+from poodle_async_mini.models.core_comment_add_comments_parameters_comments_inner import CoreCommentAddCommentsParametersCommentsInner
+from poodle_async_mini.models.core_comment_add_comments_response_inner import CoreCommentAddCommentsResponseInner
+from poodle_async_mini.models.core_comment_get_comments_response import CoreCommentGetCommentsResponse
+
+from poodle_async_mini.api_client import ApiClient, Paginator, PreparedCall, RequestSerialized, iter_form, validate_call_unless_trusted
+from poodle_async_mini.api_response import ApiResponse
+from poodle_async_mini.rest import RESTResponseType
+
+
+class CoreCommentApi:
+    """NOTE: This class is auto generated by OpenAPI Generator
+    Ref: https://openapi-generator.tech
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, api_client: Optional[ApiClient] = None) -> None:
+        if api_client is None:
+            api_client = ApiClient.get_default()
+        self.api_client: ApiClient = api_client
+
+
+    @validate_call_unless_trusted
+    def core_comment_add_comments_args(
+        self,
+        comments: List[CoreCommentAddCommentsParametersCommentsInner],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ):
+        """Adds a comment or comments.
+
+        Adds a comment or comments.
+
+        :param comments: (required)
+        :type comments: List[CoreCommentAddCommentsParametersCommentsInner]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_add_comments_serialize(
+            comments=comments,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        return self.api_client.build_api_call(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_comment_add_comments(
+        self,
+        comments: List[CoreCommentAddCommentsParametersCommentsInner],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> List[CoreCommentAddCommentsResponseInner]:
+        """Adds a comment or comments.
+
+        Adds a comment or comments.
+
+        :param comments: (required)
+        :type comments: List[CoreCommentAddCommentsParametersCommentsInner]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_add_comments_serialize(
+            comments=comments,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreCommentAddCommentsResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=False
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    async def core_comment_add_comments_from_args(
+        self,
+        args,
+        _raw: Optional[StrictBool] = None
+    ) -> List[CoreCommentAddCommentsResponseInner]:
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreCommentAddCommentsResponseInner]",
+        }
+        response_data = await self.api_client.call_api_from_args(
+            args,
+            _read_only=False
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    def core_comment_add_comments_prepare(
+        self,
+        comments: List[CoreCommentAddCommentsParametersCommentsInner],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> PreparedCall:
+        """Adds a comment or comments.
+
+        Adds a comment or comments.
+
+        :param comments: (required)
+        :type comments: List[CoreCommentAddCommentsParametersCommentsInner]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_add_comments_serialize(
+            comments=comments,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreCommentAddCommentsResponseInner]",
+        }
+        return PreparedCall(
+            self.api_client,
+            *_param,
+            response_types_map=_response_types_map,
+            form_params={
+                'comments': 'comments',
+            },
+            _request_timeout=_request_timeout,
+            _read_only=False,
+            _raw=_raw
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_comment_add_comments_with_http_info(
+        self,
+        comments: List[CoreCommentAddCommentsParametersCommentsInner],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ApiResponse[List[CoreCommentAddCommentsResponseInner]]:
+        """Adds a comment or comments.
+
+        Adds a comment or comments.
+
+        :param comments: (required)
+        :type comments: List[CoreCommentAddCommentsParametersCommentsInner]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_add_comments_serialize(
+            comments=comments,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreCommentAddCommentsResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=False
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_comment_add_comments_stream(
+        self,
+        comments: List[CoreCommentAddCommentsParametersCommentsInner],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> AsyncIterator[CoreCommentAddCommentsResponseInner]:
+        """Adds a comment or comments.
+
+        Adds a comment or comments.
+
+        :param comments: (required)
+        :type comments: List[CoreCommentAddCommentsParametersCommentsInner]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_add_comments_serialize(
+            comments=comments,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreCommentAddCommentsResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=False
+        )
+        async for item in self.api_client.stream_items(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ):
+            yield item
+
+
+    @validate_call_unless_trusted
+    async def core_comment_add_comments_without_preload_content(
+        self,
+        comments: List[CoreCommentAddCommentsParametersCommentsInner],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Adds a comment or comments.
+
+        Adds a comment or comments.
+
+        :param comments: (required)
+        :type comments: List[CoreCommentAddCommentsParametersCommentsInner]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_add_comments_serialize(
+            comments=comments,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=False
+        )
+        # the caller reads the body
+        response_data.finish_timing()
+        return response_data.response
+
+
+    def _core_comment_add_comments_serialize(
+        self,
+        comments,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+            'comments': 'csv',
+        }
+
+        _resource_path = '/webservice/rest/server.php#core_comment_add_comments'.split('#')[0]
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if '/webservice/rest/server.php' in _resource_path:
+            _query_params.append(('moodlewsrestformat', 'json'))
+            _query_params.append(('wsfunction', 'core_comment_add_comments'))
+        if '/lib/ajax/service-nologin.php' in _resource_path:
+            _args_param: Optional[Tuple[str, Any]] = None
+            for _param in _query_params:
+                if _param[0] == 'args':
+                    _args_param = _param
+            if _args_param is not None:
+                _query_params.remove(_args_param)
+            else:
+                _args_param = ('args', {})
+            _new_args = ('args', self.api_client.configuration.json_codec.dumps([{
+                'index': 0,
+                'methodname': 'core_comment_add_comments',
+                'args': _args_param[1]
+            }]))
+            _query_params.append(_new_args)
+        # process the header parameters
+        # process the form parameters
+        if comments is not None:
+            _form_params.extend(iter_form({'comments': comments}))
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/x-www-form-urlencoded'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'wstoken'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path=_resource_path,
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call_unless_trusted
+    def core_comment_get_comments_args(
+        self,
+        component: Annotated[Optional[StrictStr], Field(description="component")],
+        contextlevel: Annotated[Optional[StrictStr], Field(description="contextlevel system, course, user...")],
+        instanceid: Annotated[Optional[StrictInt], Field(description="the Instance id of item associated with the context level")],
+        itemid: Annotated[Optional[StrictInt], Field(description="associated id")],
+        area: Annotated[Optional[StrictStr], Field(description="string comment area")] = None,
+        page: Annotated[Optional[StrictInt], Field(description="page number (0 based)")] = None,
+        sortdirection: Annotated[Optional[StrictStr], Field(description="Sort direction: ASC or DESC")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ):
+        """Returns comments.
+
+        Returns comments.
+
+        :param component: component (required)
+        :type component: str
+        :param contextlevel: contextlevel system, course, user... (required)
+        :type contextlevel: str
+        :param instanceid: the Instance id of item associated with the context level (required)
+        :type instanceid: int
+        :param itemid: associated id (required)
+        :type itemid: int
+        :param area: string comment area
+        :type area: str
+        :param page: page number (0 based)
+        :type page: int
+        :param sortdirection: Sort direction: ASC or DESC
+        :type sortdirection: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_get_comments_serialize(
+            component=component,
+            contextlevel=contextlevel,
+            instanceid=instanceid,
+            itemid=itemid,
+            area=area,
+            page=page,
+            sortdirection=sortdirection,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        return self.api_client.build_api_call(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_comment_get_comments(
+        self,
+        component: Annotated[Optional[StrictStr], Field(description="component")],
+        contextlevel: Annotated[Optional[StrictStr], Field(description="contextlevel system, course, user...")],
+        instanceid: Annotated[Optional[StrictInt], Field(description="the Instance id of item associated with the context level")],
+        itemid: Annotated[Optional[StrictInt], Field(description="associated id")],
+        area: Annotated[Optional[StrictStr], Field(description="string comment area")] = None,
+        page: Annotated[Optional[StrictInt], Field(description="page number (0 based)")] = None,
+        sortdirection: Annotated[Optional[StrictStr], Field(description="Sort direction: ASC or DESC")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> CoreCommentGetCommentsResponse:
+        """Returns comments.
+
+        Returns comments.
+
+        :param component: component (required)
+        :type component: str
+        :param contextlevel: contextlevel system, course, user... (required)
+        :type contextlevel: str
+        :param instanceid: the Instance id of item associated with the context level (required)
+        :type instanceid: int
+        :param itemid: associated id (required)
+        :type itemid: int
+        :param area: string comment area
+        :type area: str
+        :param page: page number (0 based)
+        :type page: int
+        :param sortdirection: Sort direction: ASC or DESC
+        :type sortdirection: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_get_comments_serialize(
+            component=component,
+            contextlevel=contextlevel,
+            instanceid=instanceid,
+            itemid=itemid,
+            area=area,
+            page=page,
+            sortdirection=sortdirection,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "CoreCommentGetCommentsResponse",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    async def core_comment_get_comments_from_args(
+        self,
+        args,
+        _raw: Optional[StrictBool] = None
+    ) -> CoreCommentGetCommentsResponse:
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "CoreCommentGetCommentsResponse",
+        }
+        response_data = await self.api_client.call_api_from_args(
+            args,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    def core_comment_get_comments_prepare(
+        self,
+        component: Annotated[Optional[StrictStr], Field(description="component")],
+        contextlevel: Annotated[Optional[StrictStr], Field(description="contextlevel system, course, user...")],
+        instanceid: Annotated[Optional[StrictInt], Field(description="the Instance id of item associated with the context level")],
+        itemid: Annotated[Optional[StrictInt], Field(description="associated id")],
+        area: Annotated[Optional[StrictStr], Field(description="string comment area")] = None,
+        page: Annotated[Optional[StrictInt], Field(description="page number (0 based)")] = None,
+        sortdirection: Annotated[Optional[StrictStr], Field(description="Sort direction: ASC or DESC")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> PreparedCall:
+        """Returns comments.
+
+        Returns comments.
+
+        :param component: component (required)
+        :type component: str
+        :param contextlevel: contextlevel system, course, user... (required)
+        :type contextlevel: str
+        :param instanceid: the Instance id of item associated with the context level (required)
+        :type instanceid: int
+        :param itemid: associated id (required)
+        :type itemid: int
+        :param area: string comment area
+        :type area: str
+        :param page: page number (0 based)
+        :type page: int
+        :param sortdirection: Sort direction: ASC or DESC
+        :type sortdirection: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_get_comments_serialize(
+            component=component,
+            contextlevel=contextlevel,
+            instanceid=instanceid,
+            itemid=itemid,
+            area=area,
+            page=page,
+            sortdirection=sortdirection,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "CoreCommentGetCommentsResponse",
+        }
+        return PreparedCall(
+            self.api_client,
+            *_param,
+            response_types_map=_response_types_map,
+            form_params={
+                'area': 'area',
+                'component': 'component',
+                'contextlevel': 'contextlevel',
+                'instanceid': 'instanceid',
+                'itemid': 'itemid',
+                'page': 'page',
+                'sortdirection': 'sortdirection',
+            },
+            _request_timeout=_request_timeout,
+            _read_only=True,
+            _raw=_raw
+        )
+
+
+    def iter_core_comment_get_comments(
+        self,
+        component: Annotated[Optional[StrictStr], Field(description="component")],
+        contextlevel: Annotated[Optional[StrictStr], Field(description="contextlevel system, course, user...")],
+        instanceid: Annotated[Optional[StrictInt], Field(description="the Instance id of item associated with the context level")],
+        itemid: Annotated[Optional[StrictInt], Field(description="associated id")],
+        area: Annotated[Optional[StrictStr], Field(description="string comment area")] = None,
+        page: Annotated[Optional[StrictInt], Field(description="page number (0 based)")] = None,
+        sortdirection: Annotated[Optional[StrictStr], Field(description="Sort direction: ASC or DESC")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+        _prefetch: int = 1,
+    ) -> Paginator:
+        """Iterates over the items of all pages of `core_comment_get_comments`,
+        see `Paginator`. Takes the same arguments, the `page` given is
+        the cursor of the first page.
+
+        :param _prefetch: number of pages fetched ahead of the consumer.
+        """ # noqa: E501
+        return Paginator(
+            self.core_comment_get_comments_prepare(
+                component=component,
+                contextlevel=contextlevel,
+                instanceid=instanceid,
+                itemid=itemid,
+                area=area,
+                page=page,
+                sortdirection=sortdirection,
+                _request_timeout=_request_timeout,
+                _request_auth=_request_auth,
+                _content_type=_content_type,
+                _headers=_headers,
+                _host_index=_host_index,
+                _raw=_raw
+            ),
+            {
+                'component': component,
+                'contextlevel': contextlevel,
+                'instanceid': instanceid,
+                'itemid': itemid,
+                'area': area,
+                'page': page,
+                'sortdirection': sortdirection,
+            },
+            kind='page',
+            cursor='page',
+            limit='',
+            items='comments',
+            key='',
+            prefetch=_prefetch
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_comment_get_comments_with_http_info(
+        self,
+        component: Annotated[Optional[StrictStr], Field(description="component")],
+        contextlevel: Annotated[Optional[StrictStr], Field(description="contextlevel system, course, user...")],
+        instanceid: Annotated[Optional[StrictInt], Field(description="the Instance id of item associated with the context level")],
+        itemid: Annotated[Optional[StrictInt], Field(description="associated id")],
+        area: Annotated[Optional[StrictStr], Field(description="string comment area")] = None,
+        page: Annotated[Optional[StrictInt], Field(description="page number (0 based)")] = None,
+        sortdirection: Annotated[Optional[StrictStr], Field(description="Sort direction: ASC or DESC")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ApiResponse[CoreCommentGetCommentsResponse]:
+        """Returns comments.
+
+        Returns comments.
+
+        :param component: component (required)
+        :type component: str
+        :param contextlevel: contextlevel system, course, user... (required)
+        :type contextlevel: str
+        :param instanceid: the Instance id of item associated with the context level (required)
+        :type instanceid: int
+        :param itemid: associated id (required)
+        :type itemid: int
+        :param area: string comment area
+        :type area: str
+        :param page: page number (0 based)
+        :type page: int
+        :param sortdirection: Sort direction: ASC or DESC
+        :type sortdirection: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_get_comments_serialize(
+            component=component,
+            contextlevel=contextlevel,
+            instanceid=instanceid,
+            itemid=itemid,
+            area=area,
+            page=page,
+            sortdirection=sortdirection,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "CoreCommentGetCommentsResponse",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_comment_get_comments_without_preload_content(
+        self,
+        component: Annotated[Optional[StrictStr], Field(description="component")],
+        contextlevel: Annotated[Optional[StrictStr], Field(description="contextlevel system, course, user...")],
+        instanceid: Annotated[Optional[StrictInt], Field(description="the Instance id of item associated with the context level")],
+        itemid: Annotated[Optional[StrictInt], Field(description="associated id")],
+        area: Annotated[Optional[StrictStr], Field(description="string comment area")] = None,
+        page: Annotated[Optional[StrictInt], Field(description="page number (0 based)")] = None,
+        sortdirection: Annotated[Optional[StrictStr], Field(description="Sort direction: ASC or DESC")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Returns comments.
+
+        Returns comments.
+
+        :param component: component (required)
+        :type component: str
+        :param contextlevel: contextlevel system, course, user... (required)
+        :type contextlevel: str
+        :param instanceid: the Instance id of item associated with the context level (required)
+        :type instanceid: int
+        :param itemid: associated id (required)
+        :type itemid: int
+        :param area: string comment area
+        :type area: str
+        :param page: page number (0 based)
+        :type page: int
+        :param sortdirection: Sort direction: ASC or DESC
+        :type sortdirection: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_comment_get_comments_serialize(
+            component=component,
+            contextlevel=contextlevel,
+            instanceid=instanceid,
+            itemid=itemid,
+            area=area,
+            page=page,
+            sortdirection=sortdirection,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=True
+        )
+        # the caller reads the body
+        response_data.finish_timing()
+        return response_data.response
+
+
+    def _core_comment_get_comments_serialize(
+        self,
+        component,
+        contextlevel,
+        instanceid,
+        itemid,
+        area,
+        page,
+        sortdirection,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _resource_path = '/webservice/rest/server.php#core_comment_get_comments'.split('#')[0]
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if '/webservice/rest/server.php' in _resource_path:
+            _query_params.append(('moodlewsrestformat', 'json'))
+            _query_params.append(('wsfunction', 'core_comment_get_comments'))
+        if '/lib/ajax/service-nologin.php' in _resource_path:
+            _args_param: Optional[Tuple[str, Any]] = None
+            for _param in _query_params:
+                if _param[0] == 'args':
+                    _args_param = _param
+            if _args_param is not None:
+                _query_params.remove(_args_param)
+            else:
+                _args_param = ('args', {})
+            _new_args = ('args', self.api_client.configuration.json_codec.dumps([{
+                'index': 0,
+                'methodname': 'core_comment_get_comments',
+                'args': _args_param[1]
+            }]))
+            _query_params.append(_new_args)
+        # process the header parameters
+        # process the form parameters
+        if area is not None:
+            _form_params.extend(iter_form({'area': area}))
+        if component is not None:
+            _form_params.extend(iter_form({'component': component}))
+        if contextlevel is not None:
+            _form_params.extend(iter_form({'contextlevel': contextlevel}))
+        if instanceid is not None:
+            _form_params.extend(iter_form({'instanceid': instanceid}))
+        if itemid is not None:
+            _form_params.extend(iter_form({'itemid': itemid}))
+        if page is not None:
+            _form_params.extend(iter_form({'page': page}))
+        if sortdirection is not None:
+            _form_params.extend(iter_form({'sortdirection': sortdirection}))
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/x-www-form-urlencoded'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'wstoken'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path=_resource_path,
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
@@ -0,0 +1,604 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import warnings
+import json
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from typing_extensions import Annotated
+
+from pydantic import Field, StrictBool, StrictInt
+from typing import List, Optional
+from typing_extensions import Annotated
+from poodle_async_mini.models.core_enrol_get_users_courses_response_inner import CoreEnrolGetUsersCoursesResponseInner
+
+from poodle_async_mini.api_client import ApiClient, Paginator, PreparedCall, RequestSerialized, iter_form, validate_call_unless_trusted
+from poodle_async_mini.api_response import ApiResponse
+from poodle_async_mini.rest import RESTResponseType
+
+
+class CoreEnrolApi:
+    """NOTE: This class is auto generated by OpenAPI Generator
+    Ref: https://openapi-generator.tech
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, api_client: Optional[ApiClient] = None) -> None:
+        if api_client is None:
+            api_client = ApiClient.get_default()
+        self.api_client: ApiClient = api_client
+
+
+    @validate_call_unless_trusted
+    def core_enrol_get_users_courses_args(
+        self,
+        userid: Annotated[Optional[StrictInt], Field(description="user id")],
+        returnusercount: Annotated[Optional[StrictBool], Field(description="Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ):
+        """Get the list of courses where a user is enrolled in
+
+        Get the list of courses where a user is enrolled in
+
+        :param userid: user id (required)
+        :type userid: int
+        :param returnusercount: Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.
+        :type returnusercount: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_enrol_get_users_courses_serialize(
+            userid=userid,
+            returnusercount=returnusercount,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        return self.api_client.build_api_call(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_enrol_get_users_courses(
+        self,
+        userid: Annotated[Optional[StrictInt], Field(description="user id")],
+        returnusercount: Annotated[Optional[StrictBool], Field(description="Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> List[CoreEnrolGetUsersCoursesResponseInner]:
+        """Get the list of courses where a user is enrolled in
+
+        Get the list of courses where a user is enrolled in
+
+        :param userid: user id (required)
+        :type userid: int
+        :param returnusercount: Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.
+        :type returnusercount: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_enrol_get_users_courses_serialize(
+            userid=userid,
+            returnusercount=returnusercount,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreEnrolGetUsersCoursesResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    async def core_enrol_get_users_courses_from_args(
+        self,
+        args,
+        _raw: Optional[StrictBool] = None
+    ) -> List[CoreEnrolGetUsersCoursesResponseInner]:
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreEnrolGetUsersCoursesResponseInner]",
+        }
+        response_data = await self.api_client.call_api_from_args(
+            args,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    def core_enrol_get_users_courses_prepare(
+        self,
+        userid: Annotated[Optional[StrictInt], Field(description="user id")],
+        returnusercount: Annotated[Optional[StrictBool], Field(description="Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> PreparedCall:
+        """Get the list of courses where a user is enrolled in
+
+        Get the list of courses where a user is enrolled in
+
+        :param userid: user id (required)
+        :type userid: int
+        :param returnusercount: Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.
+        :type returnusercount: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_enrol_get_users_courses_serialize(
+            userid=userid,
+            returnusercount=returnusercount,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreEnrolGetUsersCoursesResponseInner]",
+        }
+        return PreparedCall(
+            self.api_client,
+            *_param,
+            response_types_map=_response_types_map,
+            form_params={
+                'returnusercount': 'returnusercount',
+                'userid': 'userid',
+            },
+            _request_timeout=_request_timeout,
+            _read_only=True,
+            _raw=_raw
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_enrol_get_users_courses_with_http_info(
+        self,
+        userid: Annotated[Optional[StrictInt], Field(description="user id")],
+        returnusercount: Annotated[Optional[StrictBool], Field(description="Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ApiResponse[List[CoreEnrolGetUsersCoursesResponseInner]]:
+        """Get the list of courses where a user is enrolled in
+
+        Get the list of courses where a user is enrolled in
+
+        :param userid: user id (required)
+        :type userid: int
+        :param returnusercount: Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.
+        :type returnusercount: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_enrol_get_users_courses_serialize(
+            userid=userid,
+            returnusercount=returnusercount,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreEnrolGetUsersCoursesResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        )
+
+
+    @validate_call_unless_trusted
+    async def core_enrol_get_users_courses_stream(
+        self,
+        userid: Annotated[Optional[StrictInt], Field(description="user id")],
+        returnusercount: Annotated[Optional[StrictBool], Field(description="Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> AsyncIterator[CoreEnrolGetUsersCoursesResponseInner]:
+        """Get the list of courses where a user is enrolled in
+
+        Get the list of courses where a user is enrolled in
+
+        :param userid: user id (required)
+        :type userid: int
+        :param returnusercount: Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.
+        :type returnusercount: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_enrol_get_users_courses_serialize(
+            userid=userid,
+            returnusercount=returnusercount,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[CoreEnrolGetUsersCoursesResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=True
+        )
+        async for item in self.api_client.stream_items(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ):
+            yield item
+
+
+    @validate_call_unless_trusted
+    async def core_enrol_get_users_courses_without_preload_content(
+        self,
+        userid: Annotated[Optional[StrictInt], Field(description="user id")],
+        returnusercount: Annotated[Optional[StrictBool], Field(description="Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Get the list of courses where a user is enrolled in
+
+        Get the list of courses where a user is enrolled in
+
+        :param userid: user id (required)
+        :type userid: int
+        :param returnusercount: Include count of enrolled users for each course? This can add several seconds to the response time if a user is on several large courses, so set this to false if the value will not be used to improve performance.
+        :type returnusercount: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._core_enrol_get_users_courses_serialize(
+            userid=userid,
+            returnusercount=returnusercount,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=True
+        )
+        # the caller reads the body
+        response_data.finish_timing()
+        return response_data.response
+
+
+    def _core_enrol_get_users_courses_serialize(
+        self,
+        userid,
+        returnusercount,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _resource_path = '/webservice/rest/server.php#core_enrol_get_users_courses'.split('#')[0]
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if '/webservice/rest/server.php' in _resource_path:
+            _query_params.append(('moodlewsrestformat', 'json'))
+            _query_params.append(('wsfunction', 'core_enrol_get_users_courses'))
+        if '/lib/ajax/service-nologin.php' in _resource_path:
+            _args_param: Optional[Tuple[str, Any]] = None
+            for _param in _query_params:
+                if _param[0] == 'args':
+                    _args_param = _param
+            if _args_param is not None:
+                _query_params.remove(_args_param)
+            else:
+                _args_param = ('args', {})
+            _new_args = ('args', self.api_client.configuration.json_codec.dumps([{
+                'index': 0,
+                'methodname': 'core_enrol_get_users_courses',
+                'args': _args_param[1]
+            }]))
+            _query_params.append(_new_args)
+        # process the header parameters
+        # process the form parameters
+        if returnusercount is not None:
+            _form_params.extend(iter_form({'returnusercount': returnusercount}))
+        if userid is not None:
+            _form_params.extend(iter_form({'userid': userid}))
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/x-www-form-urlencoded'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'wstoken'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path=_resource_path,
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
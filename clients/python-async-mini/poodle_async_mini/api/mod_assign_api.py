@@ -0,0 +1,1884 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import warnings
+import json
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from typing_extensions import Annotated
+
+from pydantic import Field, StrictBool, StrictInt, StrictStr
+from typing import List, Optional
+from typing_extensions import Annotated
+from poodle_async_mini.models.mod_assign_get_assignments_response import ModAssignGetAssignmentsResponse
+from poodle_async_mini.models.mod_assign_get_submissions_response import ModAssignGetSubmissionsResponse
+from poodle_async_mini.models.mod_assign_list_participants_response_inner import ModAssignListParticipantsResponseInner
+
+from poodle_async_mini.api_client import ApiClient, Paginator, PreparedCall, RequestSerialized, iter_form, validate_call_unless_trusted
+from poodle_async_mini.api_response import ApiResponse
+from poodle_async_mini.rest import RESTResponseType
+
+
+class ModAssignApi:
+    """NOTE: This class is auto generated by OpenAPI Generator
+    Ref: https://openapi-generator.tech
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, api_client: Optional[ApiClient] = None) -> None:
+        if api_client is None:
+            api_client = ApiClient.get_default()
+        self.api_client: ApiClient = api_client
+
+
+    @validate_call_unless_trusted
+    def mod_assign_get_assignments_args(
+        self,
+        capabilities: Annotated[Optional[List[Optional[StrictStr]]], Field(description="list of capabilities used to filter courses")] = None,
+        courseids: Annotated[Optional[List[Optional[StrictInt]]], Field(description="0 or more course ids")] = None,
+        includenotenrolledcourses: Annotated[Optional[StrictBool], Field(description="whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ):
+        """Returns the courses and assignments for the users capability
+
+        Returns the courses and assignments for the users capability
+
+        :param capabilities: list of capabilities used to filter courses
+        :type capabilities: List[Optional[str]]
+        :param courseids: 0 or more course ids
+        :type courseids: List[Optional[int]]
+        :param includenotenrolledcourses: whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.
+        :type includenotenrolledcourses: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_assignments_serialize(
+            capabilities=capabilities,
+            courseids=courseids,
+            includenotenrolledcourses=includenotenrolledcourses,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        return self.api_client.build_api_call(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_assignments(
+        self,
+        capabilities: Annotated[Optional[List[Optional[StrictStr]]], Field(description="list of capabilities used to filter courses")] = None,
+        courseids: Annotated[Optional[List[Optional[StrictInt]]], Field(description="0 or more course ids")] = None,
+        includenotenrolledcourses: Annotated[Optional[StrictBool], Field(description="whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ModAssignGetAssignmentsResponse:
+        """Returns the courses and assignments for the users capability
+
+        Returns the courses and assignments for the users capability
+
+        :param capabilities: list of capabilities used to filter courses
+        :type capabilities: List[Optional[str]]
+        :param courseids: 0 or more course ids
+        :type courseids: List[Optional[int]]
+        :param includenotenrolledcourses: whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.
+        :type includenotenrolledcourses: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_assignments_serialize(
+            capabilities=capabilities,
+            courseids=courseids,
+            includenotenrolledcourses=includenotenrolledcourses,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetAssignmentsResponse",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_assignments_from_args(
+        self,
+        args,
+        _raw: Optional[StrictBool] = None
+    ) -> ModAssignGetAssignmentsResponse:
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetAssignmentsResponse",
+        }
+        response_data = await self.api_client.call_api_from_args(
+            args,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    def mod_assign_get_assignments_prepare(
+        self,
+        capabilities: Annotated[Optional[List[Optional[StrictStr]]], Field(description="list of capabilities used to filter courses")] = None,
+        courseids: Annotated[Optional[List[Optional[StrictInt]]], Field(description="0 or more course ids")] = None,
+        includenotenrolledcourses: Annotated[Optional[StrictBool], Field(description="whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> PreparedCall:
+        """Returns the courses and assignments for the users capability
+
+        Returns the courses and assignments for the users capability
+
+        :param capabilities: list of capabilities used to filter courses
+        :type capabilities: List[Optional[str]]
+        :param courseids: 0 or more course ids
+        :type courseids: List[Optional[int]]
+        :param includenotenrolledcourses: whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.
+        :type includenotenrolledcourses: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_assignments_serialize(
+            capabilities=capabilities,
+            courseids=courseids,
+            includenotenrolledcourses=includenotenrolledcourses,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetAssignmentsResponse",
+        }
+        return PreparedCall(
+            self.api_client,
+            *_param,
+            response_types_map=_response_types_map,
+            form_params={
+                'capabilities': 'capabilities',
+                'courseids': 'courseids',
+                'includenotenrolledcourses': 'includenotenrolledcourses',
+            },
+            _request_timeout=_request_timeout,
+            _read_only=True,
+            _raw=_raw
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_assignments_with_http_info(
+        self,
+        capabilities: Annotated[Optional[List[Optional[StrictStr]]], Field(description="list of capabilities used to filter courses")] = None,
+        courseids: Annotated[Optional[List[Optional[StrictInt]]], Field(description="0 or more course ids")] = None,
+        includenotenrolledcourses: Annotated[Optional[StrictBool], Field(description="whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ApiResponse[ModAssignGetAssignmentsResponse]:
+        """Returns the courses and assignments for the users capability
+
+        Returns the courses and assignments for the users capability
+
+        :param capabilities: list of capabilities used to filter courses
+        :type capabilities: List[Optional[str]]
+        :param courseids: 0 or more course ids
+        :type courseids: List[Optional[int]]
+        :param includenotenrolledcourses: whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.
+        :type includenotenrolledcourses: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_assignments_serialize(
+            capabilities=capabilities,
+            courseids=courseids,
+            includenotenrolledcourses=includenotenrolledcourses,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetAssignmentsResponse",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_assignments_without_preload_content(
+        self,
+        capabilities: Annotated[Optional[List[Optional[StrictStr]]], Field(description="list of capabilities used to filter courses")] = None,
+        courseids: Annotated[Optional[List[Optional[StrictInt]]], Field(description="0 or more course ids")] = None,
+        includenotenrolledcourses: Annotated[Optional[StrictBool], Field(description="whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Returns the courses and assignments for the users capability
+
+        Returns the courses and assignments for the users capability
+
+        :param capabilities: list of capabilities used to filter courses
+        :type capabilities: List[Optional[str]]
+        :param courseids: 0 or more course ids
+        :type courseids: List[Optional[int]]
+        :param includenotenrolledcourses: whether to return courses that the user can see                                                                     even if is not enroled in. This requires the parameter courseids                                                                     to not be empty.
+        :type includenotenrolledcourses: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_assignments_serialize(
+            capabilities=capabilities,
+            courseids=courseids,
+            includenotenrolledcourses=includenotenrolledcourses,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=True
+        )
+        # the caller reads the body
+        response_data.finish_timing()
+        return response_data.response
+
+
+    def _mod_assign_get_assignments_serialize(
+        self,
+        capabilities,
+        courseids,
+        includenotenrolledcourses,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+            'capabilities': 'csv',
+            'courseids': 'csv',
+        }
+
+        _resource_path = '/webservice/rest/server.php#mod_assign_get_assignments'.split('#')[0]
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if '/webservice/rest/server.php' in _resource_path:
+            _query_params.append(('moodlewsrestformat', 'json'))
+            _query_params.append(('wsfunction', 'mod_assign_get_assignments'))
+        if '/lib/ajax/service-nologin.php' in _resource_path:
+            _args_param: Optional[Tuple[str, Any]] = None
+            for _param in _query_params:
+                if _param[0] == 'args':
+                    _args_param = _param
+            if _args_param is not None:
+                _query_params.remove(_args_param)
+            else:
+                _args_param = ('args', {})
+            _new_args = ('args', self.api_client.configuration.json_codec.dumps([{
+                'index': 0,
+                'methodname': 'mod_assign_get_assignments',
+                'args': _args_param[1]
+            }]))
+            _query_params.append(_new_args)
+        # process the header parameters
+        # process the form parameters
+        if capabilities is not None:
+            _form_params.extend(iter_form({'capabilities': capabilities}))
+        if courseids is not None:
+            _form_params.extend(iter_form({'courseids': courseids}))
+        if includenotenrolledcourses is not None:
+            _form_params.extend(iter_form({'includenotenrolledcourses': includenotenrolledcourses}))
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/x-www-form-urlencoded'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'wstoken'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path=_resource_path,
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call_unless_trusted
+    def mod_assign_get_submissions_args(
+        self,
+        assignmentids: Annotated[List[Optional[StrictInt]], Field(description="1 or more assignment ids")],
+        before: Annotated[Optional[StrictInt], Field(description="submitted before")] = None,
+        since: Annotated[Optional[StrictInt], Field(description="submitted since")] = None,
+        status: Annotated[Optional[StrictStr], Field(description="status")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ):
+        """Returns the submissions for assignments
+
+        Returns the submissions for assignments
+
+        :param assignmentids: 1 or more assignment ids (required)
+        :type assignmentids: List[Optional[int]]
+        :param before: submitted before
+        :type before: int
+        :param since: submitted since
+        :type since: int
+        :param status: status
+        :type status: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_submissions_serialize(
+            assignmentids=assignmentids,
+            before=before,
+            since=since,
+            status=status,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        return self.api_client.build_api_call(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_submissions(
+        self,
+        assignmentids: Annotated[List[Optional[StrictInt]], Field(description="1 or more assignment ids")],
+        before: Annotated[Optional[StrictInt], Field(description="submitted before")] = None,
+        since: Annotated[Optional[StrictInt], Field(description="submitted since")] = None,
+        status: Annotated[Optional[StrictStr], Field(description="status")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ModAssignGetSubmissionsResponse:
+        """Returns the submissions for assignments
+
+        Returns the submissions for assignments
+
+        :param assignmentids: 1 or more assignment ids (required)
+        :type assignmentids: List[Optional[int]]
+        :param before: submitted before
+        :type before: int
+        :param since: submitted since
+        :type since: int
+        :param status: status
+        :type status: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_submissions_serialize(
+            assignmentids=assignmentids,
+            before=before,
+            since=since,
+            status=status,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetSubmissionsResponse",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_submissions_from_args(
+        self,
+        args,
+        _raw: Optional[StrictBool] = None
+    ) -> ModAssignGetSubmissionsResponse:
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetSubmissionsResponse",
+        }
+        response_data = await self.api_client.call_api_from_args(
+            args,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    def mod_assign_get_submissions_prepare(
+        self,
+        assignmentids: Annotated[List[Optional[StrictInt]], Field(description="1 or more assignment ids")],
+        before: Annotated[Optional[StrictInt], Field(description="submitted before")] = None,
+        since: Annotated[Optional[StrictInt], Field(description="submitted since")] = None,
+        status: Annotated[Optional[StrictStr], Field(description="status")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> PreparedCall:
+        """Returns the submissions for assignments
+
+        Returns the submissions for assignments
+
+        :param assignmentids: 1 or more assignment ids (required)
+        :type assignmentids: List[Optional[int]]
+        :param before: submitted before
+        :type before: int
+        :param since: submitted since
+        :type since: int
+        :param status: status
+        :type status: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_submissions_serialize(
+            assignmentids=assignmentids,
+            before=before,
+            since=since,
+            status=status,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetSubmissionsResponse",
+        }
+        return PreparedCall(
+            self.api_client,
+            *_param,
+            response_types_map=_response_types_map,
+            form_params={
+                'assignmentids': 'assignmentids',
+                'before': 'before',
+                'since': 'since',
+                'status': 'status',
+            },
+            _request_timeout=_request_timeout,
+            _read_only=True,
+            _raw=_raw
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_submissions_with_http_info(
+        self,
+        assignmentids: Annotated[List[Optional[StrictInt]], Field(description="1 or more assignment ids")],
+        before: Annotated[Optional[StrictInt], Field(description="submitted before")] = None,
+        since: Annotated[Optional[StrictInt], Field(description="submitted since")] = None,
+        status: Annotated[Optional[StrictStr], Field(description="status")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ApiResponse[ModAssignGetSubmissionsResponse]:
+        """Returns the submissions for assignments
+
+        Returns the submissions for assignments
+
+        :param assignmentids: 1 or more assignment ids (required)
+        :type assignmentids: List[Optional[int]]
+        :param before: submitted before
+        :type before: int
+        :param since: submitted since
+        :type since: int
+        :param status: status
+        :type status: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_submissions_serialize(
+            assignmentids=assignmentids,
+            before=before,
+            since=since,
+            status=status,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ModAssignGetSubmissionsResponse",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_get_submissions_without_preload_content(
+        self,
+        assignmentids: Annotated[List[Optional[StrictInt]], Field(description="1 or more assignment ids")],
+        before: Annotated[Optional[StrictInt], Field(description="submitted before")] = None,
+        since: Annotated[Optional[StrictInt], Field(description="submitted since")] = None,
+        status: Annotated[Optional[StrictStr], Field(description="status")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Returns the submissions for assignments
+
+        Returns the submissions for assignments
+
+        :param assignmentids: 1 or more assignment ids (required)
+        :type assignmentids: List[Optional[int]]
+        :param before: submitted before
+        :type before: int
+        :param since: submitted since
+        :type since: int
+        :param status: status
+        :type status: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_get_submissions_serialize(
+            assignmentids=assignmentids,
+            before=before,
+            since=since,
+            status=status,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=True
+        )
+        # the caller reads the body
+        response_data.finish_timing()
+        return response_data.response
+
+
+    def _mod_assign_get_submissions_serialize(
+        self,
+        assignmentids,
+        before,
+        since,
+        status,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+            'assignmentids': 'csv',
+        }
+
+        _resource_path = '/webservice/rest/server.php#mod_assign_get_submissions'.split('#')[0]
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if '/webservice/rest/server.php' in _resource_path:
+            _query_params.append(('moodlewsrestformat', 'json'))
+            _query_params.append(('wsfunction', 'mod_assign_get_submissions'))
+        if '/lib/ajax/service-nologin.php' in _resource_path:
+            _args_param: Optional[Tuple[str, Any]] = None
+            for _param in _query_params:
+                if _param[0] == 'args':
+                    _args_param = _param
+            if _args_param is not None:
+                _query_params.remove(_args_param)
+            else:
+                _args_param = ('args', {})
+            _new_args = ('args', self.api_client.configuration.json_codec.dumps([{
+                'index': 0,
+                'methodname': 'mod_assign_get_submissions',
+                'args': _args_param[1]
+            }]))
+            _query_params.append(_new_args)
+        # process the header parameters
+        # process the form parameters
+        if assignmentids is not None:
+            _form_params.extend(iter_form({'assignmentids': assignmentids}))
+        if before is not None:
+            _form_params.extend(iter_form({'before': before}))
+        if since is not None:
+            _form_params.extend(iter_form({'since': since}))
+        if status is not None:
+            _form_params.extend(iter_form({'status': status}))
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/x-www-form-urlencoded'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'wstoken'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path=_resource_path,
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call_unless_trusted
+    def mod_assign_list_participants_args(
+        self,
+        assignid: Annotated[Optional[StrictInt], Field(description="assign instance id")],
+        filter: Annotated[Optional[StrictStr], Field(description="search string to filter the results")],
+        groupid: Annotated[Optional[StrictInt], Field(description="group id")],
+        includeenrolments: Annotated[Optional[StrictBool], Field(description="Do return courses where the user is enrolled")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="maximum number of records to return")] = None,
+        onlyids: Annotated[Optional[StrictBool], Field(description="Do not return all user fields")] = None,
+        skip: Annotated[Optional[StrictInt], Field(description="number of records to skip")] = None,
+        tablesort: Annotated[Optional[StrictBool], Field(description="Apply current user table sorting preferences.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ):
+        """List the participants for a single assignment, with some summary info about their submissions.
+
+        List the participants for a single assignment, with some summary info about their submissions.
+
+        :param assignid: assign instance id (required)
+        :type assignid: int
+        :param filter: search string to filter the results (required)
+        :type filter: str
+        :param groupid: group id (required)
+        :type groupid: int
+        :param includeenrolments: Do return courses where the user is enrolled
+        :type includeenrolments: bool
+        :param limit: maximum number of records to return
+        :type limit: int
+        :param onlyids: Do not return all user fields
+        :type onlyids: bool
+        :param skip: number of records to skip
+        :type skip: int
+        :param tablesort: Apply current user table sorting preferences.
+        :type tablesort: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_list_participants_serialize(
+            assignid=assignid,
+            filter=filter,
+            groupid=groupid,
+            includeenrolments=includeenrolments,
+            limit=limit,
+            onlyids=onlyids,
+            skip=skip,
+            tablesort=tablesort,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        return self.api_client.build_api_call(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_list_participants(
+        self,
+        assignid: Annotated[Optional[StrictInt], Field(description="assign instance id")],
+        filter: Annotated[Optional[StrictStr], Field(description="search string to filter the results")],
+        groupid: Annotated[Optional[StrictInt], Field(description="group id")],
+        includeenrolments: Annotated[Optional[StrictBool], Field(description="Do return courses where the user is enrolled")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="maximum number of records to return")] = None,
+        onlyids: Annotated[Optional[StrictBool], Field(description="Do not return all user fields")] = None,
+        skip: Annotated[Optional[StrictInt], Field(description="number of records to skip")] = None,
+        tablesort: Annotated[Optional[StrictBool], Field(description="Apply current user table sorting preferences.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> List[ModAssignListParticipantsResponseInner]:
+        """List the participants for a single assignment, with some summary info about their submissions.
+
+        List the participants for a single assignment, with some summary info about their submissions.
+
+        :param assignid: assign instance id (required)
+        :type assignid: int
+        :param filter: search string to filter the results (required)
+        :type filter: str
+        :param groupid: group id (required)
+        :type groupid: int
+        :param includeenrolments: Do return courses where the user is enrolled
+        :type includeenrolments: bool
+        :param limit: maximum number of records to return
+        :type limit: int
+        :param onlyids: Do not return all user fields
+        :type onlyids: bool
+        :param skip: number of records to skip
+        :type skip: int
+        :param tablesort: Apply current user table sorting preferences.
+        :type tablesort: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_list_participants_serialize(
+            assignid=assignid,
+            filter=filter,
+            groupid=groupid,
+            includeenrolments=includeenrolments,
+            limit=limit,
+            onlyids=onlyids,
+            skip=skip,
+            tablesort=tablesort,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ModAssignListParticipantsResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_list_participants_from_args(
+        self,
+        args,
+        _raw: Optional[StrictBool] = None
+    ) -> List[ModAssignListParticipantsResponseInner]:
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ModAssignListParticipantsResponseInner]",
+        }
+        response_data = await self.api_client.call_api_from_args(
+            args,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ).data
+
+
+    @validate_call_unless_trusted
+    def mod_assign_list_participants_prepare(
+        self,
+        assignid: Annotated[Optional[StrictInt], Field(description="assign instance id")],
+        filter: Annotated[Optional[StrictStr], Field(description="search string to filter the results")],
+        groupid: Annotated[Optional[StrictInt], Field(description="group id")],
+        includeenrolments: Annotated[Optional[StrictBool], Field(description="Do return courses where the user is enrolled")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="maximum number of records to return")] = None,
+        onlyids: Annotated[Optional[StrictBool], Field(description="Do not return all user fields")] = None,
+        skip: Annotated[Optional[StrictInt], Field(description="number of records to skip")] = None,
+        tablesort: Annotated[Optional[StrictBool], Field(description="Apply current user table sorting preferences.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> PreparedCall:
+        """List the participants for a single assignment, with some summary info about their submissions.
+
+        List the participants for a single assignment, with some summary info about their submissions.
+
+        :param assignid: assign instance id (required)
+        :type assignid: int
+        :param filter: search string to filter the results (required)
+        :type filter: str
+        :param groupid: group id (required)
+        :type groupid: int
+        :param includeenrolments: Do return courses where the user is enrolled
+        :type includeenrolments: bool
+        :param limit: maximum number of records to return
+        :type limit: int
+        :param onlyids: Do not return all user fields
+        :type onlyids: bool
+        :param skip: number of records to skip
+        :type skip: int
+        :param tablesort: Apply current user table sorting preferences.
+        :type tablesort: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_list_participants_serialize(
+            assignid=assignid,
+            filter=filter,
+            groupid=groupid,
+            includeenrolments=includeenrolments,
+            limit=limit,
+            onlyids=onlyids,
+            skip=skip,
+            tablesort=tablesort,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ModAssignListParticipantsResponseInner]",
+        }
+        return PreparedCall(
+            self.api_client,
+            *_param,
+            response_types_map=_response_types_map,
+            form_params={
+                'assignid': 'assignid',
+                'filter': 'filter',
+                'groupid': 'groupid',
+                'includeenrolments': 'includeenrolments',
+                'limit': 'limit',
+                'onlyids': 'onlyids',
+                'skip': 'skip',
+                'tablesort': 'tablesort',
+            },
+            _request_timeout=_request_timeout,
+            _read_only=True,
+            _raw=_raw
+        )
+
+
+    def iter_mod_assign_list_participants(
+        self,
+        assignid: Annotated[Optional[StrictInt], Field(description="assign instance id")],
+        filter: Annotated[Optional[StrictStr], Field(description="search string to filter the results")],
+        groupid: Annotated[Optional[StrictInt], Field(description="group id")],
+        includeenrolments: Annotated[Optional[StrictBool], Field(description="Do return courses where the user is enrolled")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="maximum number of records to return")] = None,
+        onlyids: Annotated[Optional[StrictBool], Field(description="Do not return all user fields")] = None,
+        skip: Annotated[Optional[StrictInt], Field(description="number of records to skip")] = None,
+        tablesort: Annotated[Optional[StrictBool], Field(description="Apply current user table sorting preferences.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+        _prefetch: int = 1,
+    ) -> Paginator:
+        """Iterates over the items of all pages of `mod_assign_list_participants`,
+        see `Paginator`. Takes the same arguments, the `skip` given is
+        the cursor of the first page.
+
+        :param _prefetch: number of pages fetched ahead of the consumer.
+        """ # noqa: E501
+        return Paginator(
+            self.mod_assign_list_participants_prepare(
+                assignid=assignid,
+                filter=filter,
+                groupid=groupid,
+                includeenrolments=includeenrolments,
+                limit=limit,
+                onlyids=onlyids,
+                skip=skip,
+                tablesort=tablesort,
+                _request_timeout=_request_timeout,
+                _request_auth=_request_auth,
+                _content_type=_content_type,
+                _headers=_headers,
+                _host_index=_host_index,
+                _raw=_raw
+            ),
+            {
+                'assignid': assignid,
+                'filter': filter,
+                'groupid': groupid,
+                'includeenrolments': includeenrolments,
+                'limit': limit,
+                'onlyids': onlyids,
+                'skip': skip,
+                'tablesort': tablesort,
+            },
+            kind='offset',
+            cursor='skip',
+            limit='limit',
+            items='',
+            key='',
+            prefetch=_prefetch
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_list_participants_with_http_info(
+        self,
+        assignid: Annotated[Optional[StrictInt], Field(description="assign instance id")],
+        filter: Annotated[Optional[StrictStr], Field(description="search string to filter the results")],
+        groupid: Annotated[Optional[StrictInt], Field(description="group id")],
+        includeenrolments: Annotated[Optional[StrictBool], Field(description="Do return courses where the user is enrolled")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="maximum number of records to return")] = None,
+        onlyids: Annotated[Optional[StrictBool], Field(description="Do not return all user fields")] = None,
+        skip: Annotated[Optional[StrictInt], Field(description="number of records to skip")] = None,
+        tablesort: Annotated[Optional[StrictBool], Field(description="Apply current user table sorting preferences.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> ApiResponse[List[ModAssignListParticipantsResponseInner]]:
+        """List the participants for a single assignment, with some summary info about their submissions.
+
+        List the participants for a single assignment, with some summary info about their submissions.
+
+        :param assignid: assign instance id (required)
+        :type assignid: int
+        :param filter: search string to filter the results (required)
+        :type filter: str
+        :param groupid: group id (required)
+        :type groupid: int
+        :param includeenrolments: Do return courses where the user is enrolled
+        :type includeenrolments: bool
+        :param limit: maximum number of records to return
+        :type limit: int
+        :param onlyids: Do not return all user fields
+        :type onlyids: bool
+        :param skip: number of records to skip
+        :type skip: int
+        :param tablesort: Apply current user table sorting preferences.
+        :type tablesort: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_list_participants_serialize(
+            assignid=assignid,
+            filter=filter,
+            groupid=groupid,
+            includeenrolments=includeenrolments,
+            limit=limit,
+            onlyids=onlyids,
+            skip=skip,
+            tablesort=tablesort,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ModAssignListParticipantsResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _read_only=True
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        )
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_list_participants_stream(
+        self,
+        assignid: Annotated[Optional[StrictInt], Field(description="assign instance id")],
+        filter: Annotated[Optional[StrictStr], Field(description="search string to filter the results")],
+        groupid: Annotated[Optional[StrictInt], Field(description="group id")],
+        includeenrolments: Annotated[Optional[StrictBool], Field(description="Do return courses where the user is enrolled")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="maximum number of records to return")] = None,
+        onlyids: Annotated[Optional[StrictBool], Field(description="Do not return all user fields")] = None,
+        skip: Annotated[Optional[StrictInt], Field(description="number of records to skip")] = None,
+        tablesort: Annotated[Optional[StrictBool], Field(description="Apply current user table sorting preferences.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+        _raw: Optional[StrictBool] = None,
+    ) -> AsyncIterator[ModAssignListParticipantsResponseInner]:
+        """List the participants for a single assignment, with some summary info about their submissions.
+
+        List the participants for a single assignment, with some summary info about their submissions.
+
+        :param assignid: assign instance id (required)
+        :type assignid: int
+        :param filter: search string to filter the results (required)
+        :type filter: str
+        :param groupid: group id (required)
+        :type groupid: int
+        :param includeenrolments: Do return courses where the user is enrolled
+        :type includeenrolments: bool
+        :param limit: maximum number of records to return
+        :type limit: int
+        :param onlyids: Do not return all user fields
+        :type onlyids: bool
+        :param skip: number of records to skip
+        :type skip: int
+        :param tablesort: Apply current user table sorting preferences.
+        :type tablesort: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :param _raw: return the parsed JSON instead of a model, defaults to
+                     `Configuration.raw_responses`.
+        :type _raw: bool, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_list_participants_serialize(
+            assignid=assignid,
+            filter=filter,
+            groupid=groupid,
+            includeenrolments=includeenrolments,
+            limit=limit,
+            onlyids=onlyids,
+            skip=skip,
+            tablesort=tablesort,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ModAssignListParticipantsResponseInner]",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=True
+        )
+        async for item in self.api_client.stream_items(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+            raw=_raw,
+        ):
+            yield item
+
+
+    @validate_call_unless_trusted
+    async def mod_assign_list_participants_without_preload_content(
+        self,
+        assignid: Annotated[Optional[StrictInt], Field(description="assign instance id")],
+        filter: Annotated[Optional[StrictStr], Field(description="search string to filter the results")],
+        groupid: Annotated[Optional[StrictInt], Field(description="group id")],
+        includeenrolments: Annotated[Optional[StrictBool], Field(description="Do return courses where the user is enrolled")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="maximum number of records to return")] = None,
+        onlyids: Annotated[Optional[StrictBool], Field(description="Do not return all user fields")] = None,
+        skip: Annotated[Optional[StrictInt], Field(description="number of records to skip")] = None,
+        tablesort: Annotated[Optional[StrictBool], Field(description="Apply current user table sorting preferences.")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """List the participants for a single assignment, with some summary info about their submissions.
+
+        List the participants for a single assignment, with some summary info about their submissions.
+
+        :param assignid: assign instance id (required)
+        :type assignid: int
+        :param filter: search string to filter the results (required)
+        :type filter: str
+        :param groupid: group id (required)
+        :type groupid: int
+        :param includeenrolments: Do return courses where the user is enrolled
+        :type includeenrolments: bool
+        :param limit: maximum number of records to return
+        :type limit: int
+        :param onlyids: Do not return all user fields
+        :type onlyids: bool
+        :param skip: number of records to skip
+        :type skip: int
+        :param tablesort: Apply current user table sorting preferences.
+        :type tablesort: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mod_assign_list_participants_serialize(
+            assignid=assignid,
+            filter=filter,
+            groupid=groupid,
+            includeenrolments=includeenrolments,
+            limit=limit,
+            onlyids=onlyids,
+            skip=skip,
+            tablesort=tablesort,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _batchable=False,
+            _read_only=True
+        )
+        # the caller reads the body
+        response_data.finish_timing()
+        return response_data.response
+
+
+    def _mod_assign_list_participants_serialize(
+        self,
+        assignid,
+        filter,
+        groupid,
+        includeenrolments,
+        limit,
+        onlyids,
+        skip,
+        tablesort,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _resource_path = '/webservice/rest/server.php#mod_assign_list_participants'.split('#')[0]
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if '/webservice/rest/server.php' in _resource_path:
+            _query_params.append(('moodlewsrestformat', 'json'))
+            _query_params.append(('wsfunction', 'mod_assign_list_participants'))
+        if '/lib/ajax/service-nologin.php' in _resource_path:
+            _args_param: Optional[Tuple[str, Any]] = None
+            for _param in _query_params:
+                if _param[0] == 'args':
+                    _args_param = _param
+            if _args_param is not None:
+                _query_params.remove(_args_param)
+            else:
+                _args_param = ('args', {})
+            _new_args = ('args', self.api_client.configuration.json_codec.dumps([{
+                'index': 0,
+                'methodname': 'mod_assign_list_participants',
+                'args': _args_param[1]
+            }]))
+            _query_params.append(_new_args)
+        # process the header parameters
+        # process the form parameters
+        if assignid is not None:
+            _form_params.extend(iter_form({'assignid': assignid}))
+        if filter is not None:
+            _form_params.extend(iter_form({'filter': filter}))
+        if groupid is not None:
+            _form_params.extend(iter_form({'groupid': groupid}))
+        if includeenrolments is not None:
+            _form_params.extend(iter_form({'includeenrolments': includeenrolments}))
+        if limit is not None:
+            _form_params.extend(iter_form({'limit': limit}))
+        if onlyids is not None:
+            _form_params.extend(iter_form({'onlyids': onlyids}))
+        if skip is not None:
+            _form_params.extend(iter_form({'skip': skip}))
+        if tablesort is not None:
+            _form_params.extend(iter_form({'tablesort': tablesort}))
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/x-www-form-urlencoded'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'wstoken'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path=_resource_path,
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
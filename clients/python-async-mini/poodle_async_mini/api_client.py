@@ -12,25 +12,31 @@
 """  # noqa: E501
 
 
+import asyncio
+from collections import deque
+import copy
 import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
-import json
+import functools
+import inspect
 import mimetypes
 import os
 import re
 import tempfile
+import time
 import uuid
 
-from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+from typing import Any, AsyncIterator, Callable, Deque, Iterator, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr, TypeAdapter, ValidationError, validate_call
 
-from poodle_async_mini.configuration import Configuration
-from poodle_async_mini.api_response import ApiResponse, T as ApiResponseT
+from poodle_async_mini.configuration import Configuration, settings
+from poodle_async_mini.api_response import ApiResponse
 import poodle_async_mini.models
 from poodle_async_mini import rest
+from poodle_async_mini.coalescing import RequestBatcher, SingleFlight
 from poodle_async_mini.exceptions import (
     ApiValueError,
     ApiException,
@@ -43,6 +49,83 @@ from poodle_async_mini.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+
+def fix_file_url(url: str, token: str) -> str:
+    return re.sub(
+        r"(\/webservice)?\/pluginfile\.php", f"/tokenpluginfile.php/{token}", url
+    )
+
+
+def _with_token(url: str, token: str) -> str:
+    """Returns `url` with its `wstoken` query parameter set to `token`."""
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name != 'wstoken']
+    query.append(('wstoken', token))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def iter_form(data: Any, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Yields the form fields encoding `data` as PHP parses nested form
+    parameters, e.g. `('options[0][name]', 'value')`.
+
+    Models are walked by their declared field aliases; None values are
+    skipped. The walk is iterative, so deeply nested or very large payloads
+    are encoded in linear time.
+    """
+    stack: List[Tuple[str, Any]] = [(prefix, data)]
+    while stack:
+        key, value = stack.pop()
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            yield key, "true" if value else "false"
+            continue
+        if isinstance(value, (int, float, str)):
+            yield key, str(value)
+            continue
+        items: List[Tuple[Any, Any]]
+        if isinstance(value, (list, tuple, set)):
+            items = list(enumerate(value))
+        elif isinstance(value, BaseModel):
+            items = [
+                (field.alias or name, getattr(value, name))
+                for name, field in type(value).model_fields.items()
+            ]
+        else:
+            items = list(value.items())
+        for child, child_value in reversed(items):
+            stack.append((f"{child}" if key == "" else f"{key}[{child}]", child_value))
+
+
+def parse_form(data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    return list(iter_form(data))
+
+
+def validate_call_unless_trusted(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Like pydantic's `validate_call` for methods of the api classes, but
+    the arguments are only validated while `client_side_validation` of the
+    api's ApiClient is enabled, which is the default.
+
+    Trusted callers, which already pass arguments of the annotated types,
+    can disable it to skip the validation. Models may then be passed as
+    plain dicts too, see `typed_dicts`.
+    """
+    validated = validate_call(func)
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if self.api_client.client_side_validation:
+                return await validated(self, *args, **kwargs)
+            return await func(self, *args, **kwargs)
+    else:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.api_client.client_side_validation:
+                return validated(self, *args, **kwargs)
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -93,6 +176,20 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/5.0.2.post4/python'
         self.client_side_validation = configuration.client_side_validation
+        # decoder plans, keyed by response type
+        self._decoders: Dict[Any, Callable[[Any], Any]] = {}
+        # adapters validating responses straight from JSON, keyed by response type
+        self._adapters: Dict[Any, Optional[TypeAdapter[Any]]] = {}
+        # userprivateaccesskey per token, see `file_access_key`
+        self._file_access_keys: Dict[Optional[str], "asyncio.Future[str]"] = {}
+        self.batcher = None
+        if configuration.batch_window is not None:
+            self.batcher = RequestBatcher(
+                self,
+                window=configuration.batch_window,
+                max_size=configuration.batch_max_size,
+            )
+        self.in_flight = SingleFlight() if configuration.single_flight else None
 
     async def __aenter__(self):
         return self
@@ -209,7 +306,9 @@ class ApiClient:
         # post parameters
         if post_params or files:
             post_params = post_params if post_params else []
-            post_params = self.sanitize_for_serialization(post_params)
+            # the operations encode their form fields to str with `iter_form`
+            if not all(isinstance(v, str) for _, v in post_params):
+                post_params = self.sanitize_for_serialization(post_params)
             post_params = self.parameters_to_tuples(
                 post_params,
                 collection_formats
@@ -292,7 +391,9 @@ class ApiClient:
         header_params=None,
         body=None,
         post_params=None,
-        _request_timeout=None
+        _request_timeout=None,
+        _batchable=True,
+        _read_only=None
     ) -> rest.RESTResponse:
         """Makes the HTTP request (synchronous)
         :param method: Method to call.
@@ -303,48 +404,438 @@ class ApiClient:
         :param post_params dict: Request post form parameters,
             for `application/x-www-form-urlencoded`, `multipart/form-data`.
         :param _request_timeout: timeout setting for this request.
+        :param _batchable: whether the request may be sent as part of a
+            batch. Callers needing the underlying HTTP response must pass
+            False.
+        :param _read_only: whether the called wsfunction is read-only,
+            used to decide whether the request may be retried or cached.
         :return: RESTResponse
         """
 
+        instrumentation = self.configuration.instrumentation
+        timing = instrumentation.start(url) if instrumentation is not None else None
+        # recorded into by the rest client and the batcher meanwhile
+        previous_timing = rest.CALL_TIMING.set(timing)
+        try:
+            token_provider = self.configuration.token_provider
+            if token_provider is not None and token_provider.accepts(self, url):
+                token = await token_provider.token(self)
+                response_data = await self.__call_api(
+                    method, _with_token(url, token), header_params, body, post_params,
+                    _request_timeout, _batchable, _read_only
+                )
+                # callers of unbatchable calls read the response themselves
+                if _batchable and token_provider.rejected(await response_data.read()):
+                    token = await token_provider.renew(self, token)
+                    response_data = await self.__call_api(
+                        method, _with_token(url, token), header_params, body, post_params,
+                        _request_timeout, _batchable, _read_only
+                    )
+            else:
+                response_data = await self.__call_api(
+                    method, url, header_params, body, post_params,
+                    _request_timeout, _batchable, _read_only
+                )
+        except BaseException as e:
+            if timing is not None:
+                timing.finish(None, e)
+            raise
+        finally:
+            rest.CALL_TIMING.reset(previous_timing)
+        # finished once the response is deserialized or consumed
+        response_data.timing = timing
+        return response_data
+
+    async def __call_api(
+        self,
+        method,
+        url,
+        header_params,
+        body,
+        post_params,
+        _request_timeout,
+        _batchable,
+        _read_only
+    ) -> rest.RESTResponse:
+        cache = self.configuration.response_cache
+        cache_key = None
+        if cache is not None and _batchable and _read_only and body is None:
+            cache_key = cache.key(url, post_params)
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        if self.in_flight is not None and _batchable and _read_only and body is None:
+            flight_key = self.in_flight.key(method, url, post_params)
+            if flight_key is not None:
+                return await self.in_flight.share(flight_key, lambda: self.__send(
+                    method, url, header_params, body, post_params,
+                    _request_timeout, _batchable, _read_only, cache, cache_key
+                ))
+        return await self.__send(
+            method, url, header_params, body, post_params,
+            _request_timeout, _batchable, _read_only, cache, cache_key
+        )
+
+    async def __send(
+        self,
+        method,
+        url,
+        header_params,
+        body,
+        post_params,
+        _request_timeout,
+        _batchable,
+        _read_only,
+        cache,
+        cache_key
+    ) -> rest.RESTResponse:
         try:
             # perform request and return response
-            response_data = await self.rest_client.request(
-                method, url,
-                headers=header_params,
-                body=body, post_params=post_params,
-                _request_timeout=_request_timeout
-            )
+            if _batchable and self.batcher is not None and self.batcher.accepts(method, url, body, post_params):
+                response_data = await self.batcher.submit(
+                    url,
+                    header_params=header_params,
+                    post_params=post_params,
+                    _request_timeout=_request_timeout,
+                    _read_only=_read_only
+                )
+            else:
+                response_data = await self.rest_client.request(
+                    method, url,
+                    headers=header_params,
+                    body=body, post_params=post_params,
+                    _request_timeout=_request_timeout,
+                    _read_only=_read_only
+                )
 
         except ApiException as e:
             raise e
 
+        if cache_key is not None:
+            await response_data.read()
+            cache.put(cache_key, response_data)
         return response_data
 
     async def call_api_from_args(
         self,
-        args
+        args,
+        _read_only=None,
+        _preload_content=True
     ) -> rest.RESTResponse:
+        """Makes the HTTP request built by `build_api_call`
+        :param args: keyword arguments of the request.
+        :param _read_only: whether the called wsfunction is read-only,
+            used to decide whether the request may be retried or cached.
+        :param _preload_content: whether the caller reads the whole body.
+            Callers streaming it must pass False, the response is then not
+            cached, shared or checked for a rejected token.
+        :return: RESTResponse
+        """
+        instrumentation = self.configuration.instrumentation
+        timing = instrumentation.start(args['url']) if instrumentation is not None else None
+        # recorded into by the rest client meanwhile
+        previous_timing = rest.CALL_TIMING.set(timing)
+        try:
+            token_provider = self.configuration.token_provider
+            if token_provider is not None and token_provider.accepts(self, args['url']):
+                token = await token_provider.token(self)
+                response_data = await self.__call_api_from_args(
+                    dict(args, url=_with_token(args['url'], token)), _read_only, _preload_content
+                )
+                # callers streaming the response read it themselves
+                if _preload_content and token_provider.rejected(await response_data.read()):
+                    token = await token_provider.renew(self, token)
+                    response_data = await self.__call_api_from_args(
+                        dict(args, url=_with_token(args['url'], token)), _read_only, _preload_content
+                    )
+            else:
+                response_data = await self.__call_api_from_args(args, _read_only, _preload_content)
+        except BaseException as e:
+            if timing is not None:
+                timing.finish(None, e)
+            raise
+        finally:
+            rest.CALL_TIMING.reset(previous_timing)
+        # finished once the response is deserialized or consumed
+        response_data.timing = timing
+        return response_data
+
+    async def __call_api_from_args(self, args, _read_only, _preload_content) -> rest.RESTResponse:
+        cache = self.configuration.response_cache
+        cache_key = None
+        if (
+            cache is not None
+            and _read_only
+            and _preload_content
+            and args['headers'].get('Content-Type') == 'application/x-www-form-urlencoded'
+        ):
+            cache_key = cache.key(args['url'], args.get('data'))
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        if (
+            self.in_flight is not None
+            and _read_only
+            and _preload_content
+            and args['headers'].get('Content-Type') == 'application/x-www-form-urlencoded'
+        ):
+            flight_key = self.in_flight.key(args['method'], args['url'], args.get('data'))
+            if flight_key is not None:
+                return await self.in_flight.share(
+                    flight_key, lambda: self.__send_args(args, _read_only, cache, cache_key)
+                )
+        return await self.__send_args(args, _read_only, cache, cache_key)
+
+    async def __send_args(self, args, _read_only, cache, cache_key) -> rest.RESTResponse:
         try:
             # perform request and return response
             response_data = await self.rest_client.do_request(
-                args
+                args,
+                _read_only=_read_only
             )
 
         except ApiException as e:
             raise e
 
+        if cache_key is not None:
+            await response_data.read()
+            cache.put(cache_key, response_data)
         return response_data
 
+    async def open_file(
+        self,
+        url,
+        offset=0,
+        _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Requests a file without reading its body, see `RESTResponse.iter_chunked`.
+
+        :param url: file url, including the access key.
+        :param offset: byte offset to start from, sent as `Range` header.
+            Servers may ignore it and answer with the whole file (200)
+            instead of the requested part (206).
+        :param _request_timeout: timeout setting for this request,
+            defaults to `rest.STREAM_TIMEOUT`.
+        :return: RESTResponse
+        """
+        header_params = {'Range': f'bytes={offset}-'} if offset else None
+        response_data = await self.call_api(
+            'GET', url,
+            header_params=header_params,
+            _request_timeout=_request_timeout or rest.STREAM_TIMEOUT,
+            _read_only=True
+        )
+        if not 200 <= response_data.status <= 299:
+            body = await response_data.read()
+            raise ApiException.from_response(
+                http_resp=response_data,
+                body=body.decode('utf-8', 'replace'),
+                data=None,
+            )
+        return response_data
+
+    async def download_file(
+        self,
+        url,
+        path,
+        filesize=None,
+        timemodified=None,
+        chunk_size=rest.STREAM_CHUNK_SIZE,
+        _request_timeout=None
+    ) -> str:
+        """Streams a file to `path`, resuming an interrupted download.
+
+        The file is written to `path + '.part'` and moved to `path` once
+        complete. An existing part is resumed with a `Range` request, unless
+        its modification time shows it belongs to another `timemodified`.
+        If `filesize` and `timemodified` (as in the file entries of
+        `core_course_get_contents`) are given, a `path` already matching
+        them is not downloaded again, and the download is verified against
+        `filesize`.
+
+        :param url: file url, including the access key.
+        :param path: destination path.
+        :param filesize: expected size in bytes.
+        :param timemodified: modification time of the file, as unix
+            timestamp. Set as modification time of the downloaded file.
+        :param chunk_size: maximum number of bytes held in memory.
+        :param _request_timeout: timeout setting for this request,
+            defaults to `rest.STREAM_TIMEOUT`.
+        :return: path of the downloaded file.
+        """
+        if self.is_file_current(path, filesize, timemodified):
+            return path
+
+        part = path + '.part'
+        offset = 0
+        if os.path.exists(part):
+            stat = os.stat(part)
+            if timemodified is None or int(stat.st_mtime) == timemodified:
+                offset = stat.st_size
+            if filesize is not None and offset > filesize:
+                offset = 0
+
+        if filesize is None or offset < filesize:
+            try:
+                response_data = await self.open_file(url, offset, _request_timeout)
+            except ApiException as e:
+                # the part may already be complete, if the size was unknown
+                if e.status != 416 or not offset:
+                    raise
+                _, total = self.__content_range((e.headers or {}).get('Content-Range'))
+                if total != offset:
+                    os.remove(part)
+                    return await self.download_file(
+                        url, path, filesize, timemodified, chunk_size, _request_timeout
+                    )
+            else:
+                if response_data.status == 206:
+                    start, _ = self.__content_range(response_data.getheader('Content-Range'))
+                    if start != offset:
+                        response_data.response.release()
+                        raise ApiException(
+                            status=0,
+                            reason="Unexpected `Content-Range` resuming `{0}` at {1}".format(path, offset)
+                        )
+                    mode = 'ab'
+                else:
+                    mode = 'wb'
+                try:
+                    with open(part, mode) as f:
+                        async for chunk in response_data.iter_chunked(chunk_size):
+                            f.write(chunk)
+                finally:
+                    # mark which revision the part belongs to, to resume it
+                    if timemodified is not None:
+                        os.utime(part, (timemodified, timemodified))
+
+        size = os.path.getsize(part)
+        if filesize is not None and size != filesize:
+            os.remove(part)
+            raise ApiException(
+                status=0,
+                reason="Downloaded {0} bytes of `{1}`, expected {2}".format(size, path, filesize)
+            )
+        os.replace(part, path)
+        if timemodified is not None:
+            os.utime(path, (timemodified, timemodified))
+        return path
+
+    async def file_access_key(self, fetch) -> str:
+        """Returns the `userprivateaccesskey` for the current token, used
+        to download files.
+
+        The key is fetched once per token and cached; concurrent callers
+        share a pending fetch. See `invalidate_file_access_key`.
+
+        :param fetch: coroutine function fetching the key, e.g. using
+            `core_webservice_get_site_info`.
+        :return: the access key.
+        """
+        token = self.configuration.get_api_key_with_prefix('wstoken')
+        key = self._file_access_keys.get(token)
+        if key is None or (key.done() and (key.cancelled() or key.exception() is not None)):
+            key = asyncio.ensure_future(fetch())
+            self._file_access_keys[token] = key
+        # a cancelled caller must not cancel the fetch of the others
+        return await asyncio.shield(key)
+
+    def invalidate_file_access_key(self, rejected=None) -> None:
+        """Drops the cached `userprivateaccesskey` of the current token,
+        e.g. after the server rejected it.
+
+        :param rejected: the rejected key. If given, a different key cached
+            meanwhile is kept.
+        """
+        token = self.configuration.get_api_key_with_prefix('wstoken')
+        key = self._file_access_keys.get(token)
+        if key is None:
+            return
+        stale = rejected is None or (
+            key.done()
+            and not key.cancelled()
+            and key.exception() is None
+            and key.result() == rejected
+        )
+        if stale:
+            del self._file_access_keys[token]
+
+    @staticmethod
+    def is_file_current(path, filesize=None, timemodified=None) -> bool:
+        """Whether `path` exists and matches the given size and modification
+        time. Always False if neither is given.
+        """
+        if filesize is None and timemodified is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        return (
+            (filesize is None or stat.st_size == filesize)
+            and (timemodified is None or int(stat.st_mtime) == timemodified)
+        )
+
+    @staticmethod
+    def __content_range(value):
+        """Parses a `Content-Range` header into start and total length,
+        either may be None if unknown.
+        """
+        m = re.match(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)', value or '')
+        if m is None:
+            return None, None
+        start, total = m.groups()
+        return (
+            int(start) if start is not None else None,
+            int(total) if total != '*' else None,
+        )
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
-        response_types_map: Optional[Dict[str, ApiResponseT]]=None
-    ) -> ApiResponse[ApiResponseT]:
+        response_types_map: Optional[Dict[str, Optional[str]]]=None,
+        raw: Optional[bool]=None
+    ) -> ApiResponse[Any]:
         """Deserializes response into an object.
         :param response_data: RESTResponse object to be deserialized.
         :param response_types_map: dict of response types.
+        :param raw: return the parsed JSON instead of models, defaults to
+            `Configuration.raw_responses`.
         :return: ApiResponse
         """
+        timing = response_data.timing
+        if timing is None:
+            return self.__response_deserialize(response_data, response_types_map, raw)
+
+        # parsing is timed by `deserialize`
+        previous_timing = rest.CALL_TIMING.set(timing)
+        started = time.monotonic()
+        error = None
+        try:
+            return self.__response_deserialize(response_data, response_types_map, raw)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            rest.CALL_TIMING.reset(previous_timing)
+            timing.model_build = time.monotonic() - started - (timing.json_parse or 0.0)
+            timing.response_bytes = len(response_data.data or b'')
+            timing.finish(response_data.status, error)
+
+    def __response_deserialize(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Optional[Dict[str, Optional[str]]],
+        raw: Optional[bool]
+    ) -> ApiResponse[Any]:
+        if raw is None:
+            raw = self.configuration.raw_responses
+        if response_types_map is None:
+            response_types_map = {}
 
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
         assert response_data.data is not None, msg
@@ -368,8 +859,29 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                utf8_json = (
+                    200 <= response_data.status <= 299
+                    and encoding.lower() in ('utf-8', 'utf8')
+                    and content_type is not None
+                    and re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE)
+                )
+                adapter = self.__adapter(response_type) if utf8_json and not raw else None
+                if adapter is not None and not self._may_be_error(response_data.data):
+                    try:
+                        # parse and validate in one pass, without building dicts first
+                        return_data = adapter.validate_json(response_data.data)
+                    except ValidationError:
+                        # e.g. fields left out, which `from_dict` sets to null;
+                        # it raises if the data is invalid indeed. Other
+                        # responses of the type are still validated by the
+                        # adapter, as they may well have all their fields.
+                        return_data = self.deserialize(response_data.data, response_type, content_type, raw)
+                elif utf8_json:
+                    # the codec parses the bytes, without decoding them first
+                    return_data = self.deserialize(response_data.data, response_type, content_type, raw)
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type, raw)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -385,6 +897,116 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    async def stream_items(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Dict[str, Optional[str]],
+        raw: Optional[bool]=None,
+        chunk_size: int=64 * 1024
+    ) -> AsyncIterator[Any]:
+        """Yields the items of a JSON array response one at a time, as the
+        body arrives, so only one item is held in memory instead of the
+        whole response. Used by the `<operation>_stream` methods.
+
+        Responses which are no array of a list type, e.g. Moodle errors,
+        are read whole and deserialized by `response_deserialize`, which
+        raises for errors. So are arrays whose first item may be an error,
+        and responses read already.
+
+        :param response_data: RESTResponse whose body was not read yet.
+        :param response_types_map: dict of response types.
+        :param raw: yield the parsed JSON instead of models, defaults to
+            `Configuration.raw_responses`.
+        :param chunk_size: maximum number of bytes read at once.
+        """
+        if raw is None:
+            raw = self.configuration.raw_responses
+        response_type = response_types_map.get(str(response_data.status))
+        m = re.match(r'List\[(.*)]$', response_type or '')
+        content_type = response_data.getheader('content-type') or ''
+        if (
+            m is None
+            # e.g. cached
+            or response_data.data is not None
+            or not 200 <= response_data.status <= 299
+            or not re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE)
+            or re.search(r'charset=(?!utf-?8\b)', content_type, re.IGNORECASE)
+        ):
+            await response_data.read()
+            for item in self.response_deserialize(response_data, response_types_map, raw).data or []:
+                yield item
+            return
+
+        # finished here rather than once the chunks are read
+        timing, response_data.timing = response_data.timing, None
+        size = 0
+        error = None
+        item_type = m.group(1)
+        json_codec = self.configuration.json_codec
+        adapter = None if raw else self.__adapter(item_type)
+        decode = None if raw or adapter is not None else self.__decoder(item_type)
+        splitter = JsonArraySplitter()
+        # the body up to the first item, read whole if it is no array
+        head: Optional[bytearray] = bytearray()
+        chunks = response_data.iter_chunked(chunk_size)
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if head is None:
+                    elements = splitter.feed(chunk)
+                else:
+                    head += chunk
+                    if not head.strip():
+                        continue
+                    if not head.lstrip().startswith(b'['):
+                        break
+                    elements = splitter.feed(chunk)
+                    if not elements and not splitter.closed:
+                        continue
+                    if elements and self._may_be_error(elements[0]):
+                        break
+                    head = None
+                for element in elements:
+                    started = time.monotonic() if timing is not None else 0.0
+                    if adapter is not None and element != b'null':
+                        try:
+                            item = adapter.validate_json(element)
+                        except ValidationError:
+                            # as in `response_deserialize`, e.g. fields left out
+                            if decode is None:
+                                decode = self.__decoder(item_type)
+                            item = decode(json_codec.loads(element))
+                    else:
+                        item = json_codec.loads(element)
+                        if decode is not None:
+                            item = decode(item)
+                    if timing is not None:
+                        timing.add('model_build', time.monotonic() - started)
+                    yield item
+
+            if head is not None:
+                head += b''.join([chunk async for chunk in chunks])
+                buffered = rest.RESTBufferedResponse(
+                    response_data.status,
+                    response_data.reason,
+                    response_data.getheaders(),
+                    bytes(head)
+                )
+                # finished by `response_deserialize`
+                buffered.timing, timing = timing, None
+                for item in self.response_deserialize(buffered, response_types_map, raw).data or []:
+                    yield item
+            else:
+                splitter.close()
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            await chunks.aclose()
+            if timing is not None:
+                timing.response_bytes = size
+                timing.finish(response_data.status, error)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -446,28 +1068,33 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(self, response_text: Union[str, bytes], response_type: str, content_type: Optional[str], raw: bool = False):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body, bytes must be UTF-8 encoded.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
+        :param raw: skip building models and return the parsed JSON.
 
         :return: deserialized object.
         """
 
+        timing = rest.CALL_TIMING.get()
+        started = time.monotonic() if timing is not None else 0.0
+
         # fetch data from response object
+        json_codec = self.configuration.json_codec
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
             except ValueError:
                 data = response_text
         elif re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
-            if response_text == "":
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -476,13 +1103,16 @@ class ApiClient:
                 reason="Unsupported content type: {0}".format(content_type)
             )
 
-        return self.__deserialize(data, response_type)
+        if timing is not None:
+            timing.add('json_parse', time.monotonic() - started)
+        return self.__deserialize(data, response_type, raw)
 
-    def __deserialize(self, data, klass):
+    def __deserialize(self, data, klass, raw=False):
         """Deserializes dict, list, str into an object.
 
         :param data: dict, list or str.
         :param klass: class literal, or string of class name.
+        :param raw: only check for Moodle errors and return `data` as is.
 
         :return: object.
         """
@@ -508,20 +1138,54 @@ class ApiClient:
                 )
             data = _data["data"]
 
+        if raw:
+            return data
+        return self.__decoder(klass)(data)
+
+    def __decoder(self, klass):
+        """Returns the decoder plan for a response type.
+
+        Plans are built once per type and cached, so type strings are parsed
+        and model classes resolved once rather than for every element. They
+        hold no reference to the client, so clients can share them.
+
+        :param klass: class literal, or string of class name.
+        :return: callable deserializing data into the type.
+        """
+        decoder = self._decoders.get(klass)
+        if decoder is None:
+            decoder = self.__build_decoder(klass)
+            self._decoders[klass] = decoder
+        return decoder
+
+    def __build_decoder(self, klass):
+        """Builds the decoder plan for a response type.
+
+        :param klass: class literal, or string of class name.
+        :return: callable deserializing data into the type.
+        """
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                decode_item = self.__decoder(m.group(1))
+
+                def decode_list(data):
+                    if data is None:
+                        return None
+                    return [decode_item(sub_data) for sub_data in data]
+                return decode_list
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                decode_value = self.__decoder(m.group(2))
+
+                def decode_dict(data):
+                    if data is None:
+                        return None
+                    return {k: decode_value(v) for k, v in data.items()}
+                return decode_dict
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -529,20 +1193,80 @@ class ApiClient:
             else:
                 klass = getattr(poodle_async_mini.models, klass)
 
+        decode: Callable[[Any], Any]
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            decode = functools.partial(self.__deserialize_primitive, klass=klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            decode = self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            decode = self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            decode = self.__deserialize_datetime
         elif klass == decimal.Decimal:
-            return decimal.Decimal(data)
+            decode = decimal.Decimal
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            decode = functools.partial(self.__deserialize_enum, klass=klass)
         else:
-            return self.__deserialize_model(data, klass)
+            # from_dict maps None to None itself
+            return klass.from_dict
+
+        def decode_optional(data):
+            return None if data is None else decode(data)
+        return decode_optional
+
+    def __adapter(self, klass):
+        """Returns the adapter validating a response type straight from the
+        JSON bytes, or None if the type has to be deserialized by
+        `deserialize` as it contains no models. Responses leaving out
+        fields, which the adapter rejects but `from_dict` sets to null, are
+        deserialized by `deserialize` one by one.
+
+        :param klass: string of class name.
+        :return: TypeAdapter or None.
+        """
+        if settings.relaxe_all_models or settings.relaxed_models:
+            # relaxed models are built without validation by from_dict
+            return None
+        if klass not in self._adapters:
+            model_type = self.__model_type(klass)
+            self._adapters[klass] = None if model_type is None else TypeAdapter(model_type)
+        return self._adapters[klass]
+
+    def __model_type(self, klass):
+        """Resolves a response type string containing models to a type.
+
+        :param klass: string of class name.
+        :return: type, or None if the type contains no models.
+        """
+        m = re.match(r'List\[(.*)]$', klass)
+        if m:
+            item_type = self.__model_type(m.group(1))
+            return None if item_type is None else List[Optional[item_type]]  # type: ignore[valid-type]
+        m = re.match(r'Dict\[([^,]*), (.*)]$', klass)
+        if m:
+            value_type = self.__model_type(m.group(2))
+            return None if value_type is None else Dict[str, Optional[value_type]]  # type: ignore[valid-type]
+        if klass in self.NATIVE_TYPES_MAPPING:
+            return None
+        model = getattr(poodle_async_mini.models, klass, None)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            return model
+        return None
+
+    @staticmethod
+    def _may_be_error(data: bytes) -> bool:
+        """Returns whether a response body may be a Moodle error, or anything
+        but a JSON object or array.
+
+        Errors are objects with an "exception" or "error" key, or arrays
+        wrapping such an object for ajax. Any body naming one of these keys
+        is passed to `deserialize`, which raises for actual errors.
+        """
+        return (
+            re.match(rb'\s*[\[{]', data) is None
+            or b'"exception"' in data
+            or b'"error"' in data
+        )
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -590,7 +1314,7 @@ class ApiClient:
             if isinstance(v, (int, float)):
                 v = str(v)
             if isinstance(v, dict):
-                v = json.dumps(v)
+                v = self.configuration.json_codec.dumps(v)
 
             if k in collection_formats:
                 collection_format = collection_formats[k]
@@ -787,7 +1511,8 @@ class ApiClient:
 
         return path
 
-    def __deserialize_primitive(self, data, klass):
+    @staticmethod
+    def __deserialize_primitive(data, klass):
         """Deserializes string to primitive type.
 
         :param data: str.
@@ -802,14 +1527,16 @@ class ApiClient:
         except TypeError:
             return data
 
-    def __deserialize_object(self, value):
+    @staticmethod
+    def __deserialize_object(value):
         """Return an original value.
 
         :return: object.
         """
         return value
 
-    def __deserialize_date(self, string):
+    @staticmethod
+    def __deserialize_date(string):
         """Deserializes string to date.
 
         :param string: str.
@@ -825,7 +1552,8 @@ class ApiClient:
                 reason="Failed to parse `{0}` as date object".format(string)
             )
 
-    def __deserialize_datetime(self, string):
+    @staticmethod
+    def __deserialize_datetime(string):
         """Deserializes string to datetime.
 
         The string should be in iso8601 datetime format.
@@ -846,7 +1574,8 @@ class ApiClient:
                 )
             )
 
-    def __deserialize_enum(self, data, klass):
+    @staticmethod
+    def __deserialize_enum(data, klass):
         """Deserializes primitive type to enum.
 
         :param data: primitive type.
@@ -873,3 +1602,334 @@ class ApiClient:
         """
 
         return klass.from_dict(data)
+
+
+class JsonArraySplitter:
+    """Splits a JSON array arriving in chunks into the JSON texts of its
+    elements, without parsing them. Only the incomplete element is kept
+    between chunks.
+    """
+
+    _STRUCTURE = re.compile(rb'[\[\]{}",]')
+    _STRING = re.compile(rb'["\\]')
+
+    def __init__(self) -> None:
+        # nesting depth, 1 within the elements of the array
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.closed = False
+        self._element = bytearray()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Returns the elements completed by `chunk`."""
+        elements: List[bytes] = []
+        start = 0
+        pos = 0
+        while pos < len(chunk) and not self.closed:
+            if self.escaped:
+                self.escaped = False
+                pos += 1
+            elif self.in_string:
+                m = self._STRING.search(chunk, pos)
+                if m is None:
+                    break
+                pos = m.end()
+                if chunk[m.start()] == 0x5c:
+                    self.escaped = True
+                else:
+                    self.in_string = False
+            else:
+                m = self._STRUCTURE.search(chunk, pos)
+                if m is None:
+                    break
+                char = chunk[m.start()]
+                pos = m.end()
+                if char == 0x22:
+                    self.in_string = True
+                elif char in (0x5b, 0x7b):
+                    if self.depth == 0:
+                        if char != 0x5b or chunk[:m.start()].strip():
+                            raise ValueError("Response is not a JSON array")
+                        start = pos
+                    self.depth += 1
+                elif char in (0x5d, 0x7d):
+                    self.depth -= 1
+                    if self.depth == 0:
+                        self._complete(chunk[start:m.start()], elements)
+                        self.closed = True
+                elif self.depth == 1:
+                    self._complete(chunk[start:m.start()], elements)
+                    start = pos
+        if self.depth > 0:
+            self._element += chunk[start:]
+        return elements
+
+    def _complete(self, tail: bytes, elements: List[bytes]) -> None:
+        self._element += tail
+        element = bytes(self._element).strip()
+        self._element.clear()
+        if element:
+            elements.append(element)
+
+    def close(self) -> None:
+        """Raises if the array is incomplete."""
+        if not self.closed:
+            raise ValueError("Truncated JSON array")
+
+
+class PreparedCall:
+    """A call of an operation whose request is built once, to be sent
+    repeatedly with little client side work, e.g. when polling. Created by
+    the `<operation>_prepare` methods of the apis, which take the same
+    arguments as the operation.
+
+    Awaiting a call sends the request and returns the deserialized
+    response. Form parameters can be swapped for a single call, or for a
+    copy with `replace`; only these are encoded again. `with_token`
+    returns a copy sending another webservice token, e.g. to poll for many
+    users::
+
+        prepared = api.core_calendar_get_action_events_by_timesort_prepare(timesortfrom=0)
+        for token in tokens:
+            events = await prepared.with_token(token)(timesortfrom=now)
+
+    Swapped parameters are not validated, see `validate_call_unless_trusted`.
+    Changes of the configuration after preparing the call do not apply.
+    """
+
+    def __init__(
+        self,
+        api_client,
+        method,
+        url,
+        header_params,
+        body,
+        post_params,
+        response_types_map,
+        form_params=None,
+        _request_timeout=None,
+        _read_only=False,
+        _raw=None
+    ) -> None:
+        """
+        :param form_params: wire names of the form parameters that can be
+            swapped, by parameter name.
+        """
+        self.api_client = api_client
+        self.response_types_map = response_types_map
+        self.form_params: Dict[str, str] = form_params or {}
+        self.read_only = _read_only
+        self.raw = _raw
+        self._args = api_client.build_api_call(
+            method, url,
+            header_params=header_params,
+            body=body,
+            post_params=post_params,
+            _request_timeout=_request_timeout
+        )
+        if not isinstance(self._args.get('data'), (str, bytes)) and self._args.get('data') is not None:
+            raise ApiValueError("Calls uploading files can't be prepared")
+        # encoded form fields by parameter, so one can be swapped alone
+        fields: Dict[str, List[Tuple[str, str]]] = {}
+        for key, value in post_params or []:
+            fields.setdefault(key.split('[', 1)[0], []).append((key, value))
+        self._fields = {name: rest.encode_form(items) for name, items in fields.items()}
+        if isinstance(self._args.get('data'), str):
+            self._args['data'] = self._args['data'].encode('utf-8')
+
+    def _swap(self, params: Dict[str, Any]) -> Dict[str, str]:
+        """Returns the encoded form fields with `params` swapped."""
+        fields = dict(self._fields)
+        for name, value in params.items():
+            if name not in self.form_params:
+                raise ApiValueError(f"`{name}` is not a form parameter of the call")
+            base_name = self.form_params[name]
+            fields[base_name] = rest.encode_form(iter_form({base_name: value}))
+        return fields
+
+    def _request(self, fields: Dict[str, str]) -> Dict[str, Any]:
+        """Returns the request args sending the encoded form `fields`."""
+        data = '&'.join(field for field in fields.values() if field)
+        return dict(self._args, data=data.encode('utf-8'))
+
+    def replace(self, **params) -> "PreparedCall":
+        """Returns a copy of the call with form parameters swapped."""
+        prepared = copy.copy(self)
+        prepared._fields = self._swap(params)
+        prepared._args = self._request(prepared._fields)
+        return prepared
+
+    def with_token(self, token: str) -> "PreparedCall":
+        """Returns a copy of the call sending `token` as webservice token."""
+        parts = urlsplit(self._args['url'])
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k != 'wstoken']
+        query.append(('wstoken', token))
+        prepared = copy.copy(self)
+        prepared._args = dict(self._args, url=urlunsplit(parts._replace(query=urlencode(query))))
+        return prepared
+
+    async def __call__(self, **params) -> Any:
+        """Sends the request, with form parameters swapped for this call.
+
+        :return: the deserialized response.
+        """
+        args = self._request(self._swap(params)) if params else self._args
+        response_data = await self.api_client.call_api_from_args(
+            args,
+            _read_only=self.read_only
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=self.response_types_map,
+            raw=self.raw,
+        ).data
+
+
+class Paginator:
+    """Async iterator over the items of all pages of a paged wsfunction.
+    Created by the `iter_<operation>` methods of the apis, which know the
+    cursor of each function, e.g.::
+
+        async for participant in api.iter_mod_assign_list_participants(assignid, '', 0):
+            ...
+
+    The cursor is a page number (`page`), the number of items to skip
+    (`offset`), or the key of the last item seen (`after`). Functions
+    taking a page size get `page_size` items per page unless the call
+    gives its own. Iteration stops at an empty page or one shorter than
+    the page size, which is the size of the first page if the function
+    takes none.
+
+    While the items of a page are consumed, the next `prefetch` pages are
+    fetched, so at most `prefetch + 1` pages are held in memory. Pages of
+    kind `after`, and the second page of kind `offset` without a page
+    size, can only be requested once the previous one arrived, so at most
+    one is fetched ahead. Leaving the iteration early should be
+    done with `aclose`, or by using the paginator as async context
+    manager, to cancel the pages fetched ahead.
+    """
+
+    DEFAULT_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        call: PreparedCall,
+        arguments: Dict[str, Any],
+        kind: str,
+        cursor: str,
+        items: str='',
+        limit: str='',
+        key: str='',
+        page_size: Optional[int]=None,
+        prefetch: int=1
+    ) -> None:
+        """
+        :param call: the call of the first page.
+        :param arguments: arguments of the call, by parameter name.
+        :param kind: kind of cursor, `page`, `offset` or `after`.
+        :param cursor: parameter holding the cursor.
+        :param items: dotted path of the items in the response, empty if
+            the response is the list of items.
+        :param limit: parameter holding the page size, if any.
+        :param key: field of the items holding the cursor of kind `after`.
+        """
+        if kind not in ('page', 'offset', 'after'):
+            raise ApiValueError(f"Unknown kind of cursor `{kind}`")
+        if kind == 'after' and not key:
+            raise ApiValueError("A cursor of kind `after` needs the `key` of the items")
+        self.call = call
+        self.kind = kind
+        self.cursor = cursor
+        self.items = items.split('.') if items else []
+        self.limit = limit or None
+        self.key = key
+        self.page_size: Optional[int] = None
+        if self.limit is not None:
+            self.page_size = arguments.get(self.limit) or page_size or self.DEFAULT_PAGE_SIZE
+        self.prefetch = max(0, prefetch)
+        self._next: Any = arguments.get(cursor)
+        if self._next is None and kind != 'after':
+            self._next = 0
+        self._pages: "Deque[asyncio.Future[Any]]" = deque()
+        self._items: Iterator[Any] = iter(())
+        self._started = False
+        # no further pages are requested
+        self._last = False
+
+    def __aiter__(self) -> "Paginator":
+        return self
+
+    async def __aenter__(self) -> "Paginator":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def __anext__(self) -> Any:
+        if not self._started:
+            self._started = True
+            self._fill()
+        for item in self._items:
+            return item
+        while self._pages:
+            try:
+                # a cancelled consumer must not cancel the pages fetched ahead
+                page = self._extract(await asyncio.shield(self._pages[0]))
+            except BaseException:
+                if self._pages and self._pages[0].done():
+                    await self.aclose()
+                raise
+            self._pages.popleft()
+            if not page or (self.page_size is not None and len(page) < self.page_size):
+                await self.aclose()
+            else:
+                if self.page_size is None:
+                    self.page_size = len(page)
+                    if self.kind == 'offset':
+                        # not known when this page was requested
+                        self._next += self.page_size
+                if self.kind == 'after':
+                    last = page[-1]
+                    self._next = last[self.key] if isinstance(last, dict) else getattr(last, self.key)
+                self._fill()
+            self._items = iter(page)
+            for item in self._items:
+                return item
+        raise StopAsyncIteration
+
+    def _fill(self) -> None:
+        """Requests the pages up to `prefetch` ahead."""
+        ahead = 1 if self.kind == 'after' else 1 + self.prefetch
+        while not self._last and len(self._pages) < ahead:
+            params: Dict[str, Any] = {}
+            if self._next is not None:
+                params[self.cursor] = self._next
+            if self.limit is not None:
+                params[self.limit] = self.page_size
+            self._pages.append(asyncio.ensure_future(self.call(**params)))
+            if self.kind == 'page':
+                self._next += 1
+            elif self.kind == 'offset' and self.page_size is not None:
+                self._next += self.page_size
+            else:
+                # the next cursor is known once this page arrived
+                break
+
+    def _extract(self, response: Any) -> List[Any]:
+        for name in self.items:
+            response = response[name] if isinstance(response, dict) else getattr(response, name)
+        return response or []
+
+    async def aclose(self) -> None:
+        """Stops the iteration, cancelling the pages fetched ahead."""
+        self._last = True
+        while self._pages:
+            page = self._pages.popleft()
+            if page.done():
+                if not page.cancelled():
+                    # retrieved, so it is not reported as unhandled
+                    page.exception()
+            else:
+                page.cancel()
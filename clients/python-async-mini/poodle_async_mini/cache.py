@@ -0,0 +1,363 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from poodle_async_mini.api_client import ApiClient
+from poodle_async_mini import rest
+
+
+# never cached, whatever the API description declares
+MUTATING_FUNCTION_PATTERN = re.compile(r'(^|_)(save|create|update|view|delete)_')
+
+
+class ResponseCache:
+    """Bounded in-memory cache of responses of read-only wsfunctions, see
+    `Configuration.response_cache`.
+
+    Entries are keyed by host, token, wsfunction and the canonicalized
+    arguments. Only the received bodies are kept, so each hit is
+    deserialized again and callers never share models. Responses expire
+    after the TTL of their wsfunction; once the cached bodies exceed
+    `max_bytes`, the least recently used ones are evicted.
+
+    Mutating functions are never cached, nor are Moodle errors. Functions
+    which are polled for changes, like `core_course_get_updates_since` by
+    `CourseSync`, should get a TTL of 0 in `ttls`.
+
+    :param ttl: seconds to keep responses of functions not in `ttls`.
+    :param ttls: seconds to keep responses, by wsfunction. 0 disables
+        caching of a function.
+    :param max_bytes: upper bound of the size of the cached entries.
+    """
+
+    # approximate size of an entry besides its body and key
+    ENTRY_OVERHEAD = 256
+
+    def __init__(
+        self,
+        ttl: float=60.0,
+        ttls: Optional[Dict[str, float]]=None,
+        max_bytes: int=64 * 1024 * 1024
+    ) -> None:
+        self.ttl = ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[Tuple[str, Optional[str], str, str], Tuple[float, int, bytes]] = OrderedDict()
+
+    def key(
+        self,
+        url: str,
+        form: Union[None, str, bytes, List[Tuple[str, Any]]]
+    ) -> Optional[Tuple[str, Optional[str], str, str]]:
+        """Returns the key of a request, or None if it must not be cached.
+
+        :param url: request url, including the query string.
+        :param form: the form fields, or the url encoded form body.
+        """
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query)
+        params = dict(query)
+        wsfunction = params.get('wsfunction')
+        if wsfunction is None or MUTATING_FUNCTION_PATTERN.search(wsfunction):
+            return None
+        if self.ttls.get(wsfunction, self.ttl) <= 0:
+            return None
+        if isinstance(form, list):
+            if not all(isinstance(v, str) for _, v in form):
+                # file uploads
+                return None
+            form = rest.encode_form(form)
+        elif isinstance(form, bytes):
+            form = form.decode('utf-8')
+        fields = [f'{k}={v}' for k, v in query if k != 'wstoken']
+        if form:
+            fields.extend(form.split('&'))
+        return (parts.netloc + parts.path, params.get('wstoken'), wsfunction, '&'.join(sorted(fields)))
+
+    def get(self, key) -> Optional[rest.RESTResponse]:
+        """Returns the cached response, or None on a miss."""
+        data = self._load(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return rest.RESTBufferedResponse(200, 'OK', {'Content-Type': 'application/json; charset=utf-8'}, data)
+
+    def put(self, key, response_data: rest.RESTResponse) -> None:
+        """Caches a read response, unless it is a Moodle error."""
+        data = response_data.data
+        if not 200 <= response_data.status <= 299 or data is None or ApiClient._may_be_error(data):
+            return
+        size = len(data) + sum(len(part or '') for part in key) + self.ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        self._store(key, data, size, self.ttls.get(key[2], self.ttl))
+
+    def _load(self, key) -> Optional[bytes]:
+        """Returns the body of the entry, None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def _store(self, key, data: bytes, size: int, ttl: float) -> None:
+        """Adds the entry and evicts the least recently used ones."""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, size, data)
+        self.size += size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key) -> None:
+        self.size -= self._entries.pop(key)[1]
+
+    def invalidate(
+        self,
+        wsfunction: Optional[str]=None,
+        token: Optional[str]=None,
+        host: Optional[str]=None
+    ) -> int:
+        """Removes the entries matching all given criteria, all entries
+        if none are given.
+
+        :param host: host of the site, with the port if not the default
+            one, e.g. `moodle.example` or `localhost:8080`.
+        :return: number of removed entries.
+        """
+        keys = [
+            key for key in self._entries
+            if (wsfunction is None or key[2] == wsfunction)
+            and (token is None or key[1] == token)
+            and (host is None or key[0].split('/', 1)[0] == host)
+        ]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Returns the hit/miss metrics and the current size."""
+        entries, size = self._usage()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': entries,
+            'bytes': size,
+        }
+
+    def _usage(self) -> Tuple[int, int]:
+        """Returns the number of entries and their size."""
+        return len(self._entries), self.size
+
+
+class DiskResponseCache(ResponseCache):
+    """`ResponseCache` in a sqlite database, which survives restarts and
+    can be shared by the processes of a host, e.g. the workers of a web
+    application.
+
+    Each process opens its own connection. The database is in WAL mode,
+    so readers don't block each other nor the writer. The calls run in the
+    event loop, so they wait only `timeout` seconds for the lock held by
+    another writer: a lookup then is a miss and the response is not
+    stored. Entries expire by wall clock time.
+    Tokens are only stored as their SHA-256 hash, the bodies as received.
+
+    `stats` counts the hits and misses of this process, but the entries
+    and bytes of the whole database.
+
+    :param path: file of the database, created if missing.
+    :param ttl: seconds to keep responses of functions not in `ttls`.
+    :param ttls: seconds to keep responses, by wsfunction. 0 disables
+        caching of a function.
+    :param max_bytes: upper bound of the size of the cached entries.
+    :param timeout: seconds to wait for the lock of the database, also by
+        `invalidate` and `clear`, which raise `sqlite3.OperationalError`
+        if it is still held.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key BLOB PRIMARY KEY,
+            host TEXT NOT NULL,
+            token BLOB,
+            wsfunction TEXT NOT NULL,
+            expires REAL NOT NULL,
+            used REAL NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_used ON responses (used, size);
+        CREATE INDEX IF NOT EXISTS responses_wsfunction ON responses (wsfunction);
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        ttl: float=60.0,
+        ttls: Optional[Dict[str, float]]=None,
+        max_bytes: int=256 * 1024 * 1024,
+        timeout: float=0.05
+    ) -> None:
+        super().__init__(ttl, ttls, max_bytes)
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        # creates the database, so that a bad path fails early
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # a connection must not be used by a forked process
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(self.SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        """Closes the connection of this process, the next use reopens it."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    @staticmethod
+    def _hash(value: str) -> bytes:
+        return hashlib.sha256(value.encode('utf-8')).digest()
+
+    def _row_key(self, key) -> bytes:
+        return self._hash('\0'.join(part or '' for part in key))
+
+    @staticmethod
+    def _locked(error: sqlite3.OperationalError) -> bool:
+        return 'locked' in str(error) or 'busy' in str(error)
+
+    def _load(self, key) -> Optional[bytes]:
+        now = time.time()
+        row_key = self._row_key(key)
+        connection = self._connect()
+        row = None
+        try:
+            row = connection.execute('SELECT expires, data FROM responses WHERE key = ?', (row_key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] <= now:
+                connection.execute('DELETE FROM responses WHERE key = ? AND expires <= ?', (row_key, now))
+                self.expirations += 1
+                return None
+            # at most one write per second and entry for the recency
+            connection.execute('UPDATE responses SET used = ? WHERE key = ? AND used < ?', (now, row_key, now - 1))
+        except sqlite3.OperationalError as e:
+            if not self._locked(e):
+                raise
+            # another process is writing, the recency is left as it is
+            if row is None or row[0] <= now:
+                return None
+        return row[1]
+
+    def _store(self, key, data: bytes, size: int, ttl: float) -> None:
+        now = time.time()
+        connection = self._connect()
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+        except sqlite3.OperationalError as e:
+            if not self._locked(e):
+                raise
+            # another process is writing, rather than blocking the event loop
+            return
+        try:
+            connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    self._row_key(key),
+                    key[0].split('/', 1)[0],
+                    None if key[1] is None else self._hash(key[1]),
+                    key[2],
+                    now + ttl,
+                    now,
+                    size,
+                    data,
+                )
+            )
+            self.expirations += connection.execute('DELETE FROM responses WHERE expires <= ?', (now,)).rowcount
+            excess = connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0] - self.max_bytes
+            if excess > 0:
+                evicted = []
+                for row_key, row_size in connection.execute('SELECT key, size FROM responses ORDER BY used'):
+                    evicted.append((row_key,))
+                    excess -= row_size
+                    if excess <= 0:
+                        break
+                connection.executemany('DELETE FROM responses WHERE key = ?', evicted)
+                self.evictions += len(evicted)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def invalidate(
+        self,
+        wsfunction: Optional[str]=None,
+        token: Optional[str]=None,
+        host: Optional[str]=None
+    ) -> int:
+        criteria = []
+        values: List[Any] = []
+        if wsfunction is not None:
+            criteria.append('wsfunction = ?')
+            values.append(wsfunction)
+        if token is not None:
+            criteria.append('token = ?')
+            values.append(self._hash(token))
+        if host is not None:
+            criteria.append('host = ?')
+            values.append(host)
+        where = ' WHERE ' + ' AND '.join(criteria) if criteria else ''
+        return self._connect().execute('DELETE FROM responses' + where, values).rowcount
+
+    def clear(self) -> None:
+        self._connect().execute('DELETE FROM responses')
+
+    def _usage(self) -> Tuple[int, int]:
+        entries, size = self._connect().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        return entries, size
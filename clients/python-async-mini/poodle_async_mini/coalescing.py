@@ -0,0 +1,297 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import asyncio
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from poodle_async_mini import rest
+
+
+def _unflatten_form(params):
+    """Rebuilds the nested arguments encoded as `key[0][name]` form fields.
+
+    :param params: list of (key, value) tuples as produced by `parse_form`.
+    :return: dict, with runs of numeric keys turned back into lists.
+    """
+    root: Dict[str, Any] = {}
+    for key, value in params:
+        parts = re.findall(r'[^\[\]]+', key)
+        node = root
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+    return _listify(root)
+
+
+def _listify(node):
+    if not isinstance(node, dict):
+        return node
+    items = {key: _listify(value) for key, value in node.items()}
+    if items and all(key.isdigit() for key in items):
+        return [items[key] for key in sorted(items, key=int)]
+    return items
+
+
+class RequestBatcher:
+    """Coalesces concurrent webservice calls into a single request.
+
+    Calls made within `window` seconds of each other, using the same site
+    and token, are sent as one `tool_mobile_call_external_functions`
+    request. The combined response is split back into one buffered
+    response per caller, so each caller deserializes its own entry and an
+    entry with `error=true` raises an ApiException for that caller only.
+
+    :param api_client: ApiClient used to send the combined request.
+    :param window: seconds to wait for further calls before sending.
+    :param max_size: send immediately once this many calls are queued.
+    """
+
+    FUNCTION = 'tool_mobile_call_external_functions'
+
+    def __init__(self, api_client, window=0.005, max_size=25) -> None:
+        self.api_client = api_client
+        self.window = window
+        self.max_size = max_size
+        self._pending: Dict[Tuple[str, str], List[Tuple[str, Dict[str, Any], List[Tuple[str, str]], Optional[bool], "asyncio.Future[rest.RESTResponse]", Optional[rest.CallTiming]]]] = {}
+
+    def accepts(self, method, url, body, post_params) -> bool:
+        """Returns whether a request can be sent as part of a batch."""
+        if method != 'POST' or body or rest.WEBSERVICE_PATH not in url:
+            return False
+        if any(isinstance(value, tuple) for _, value in post_params or []):
+            # file uploads can't be expressed as json arguments
+            return False
+        query = dict(parse_qsl(url.partition('?')[2]))
+        return (
+            'wstoken' in query
+            and query.get('wsfunction') not in (None, self.FUNCTION)
+        )
+
+    async def submit(
+        self,
+        url,
+        header_params=None,
+        post_params=None,
+        _request_timeout=None,
+        _read_only=None
+    ) -> rest.RESTResponse:
+        """Queues a call and waits for its share of the batched response."""
+        base, _, query = url.partition('?')
+        query_params = dict(parse_qsl(query))
+        key = (base, query_params['wstoken'])
+        future = asyncio.get_running_loop().create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            asyncio.get_running_loop().call_later(
+                self.window, self._flush, key, batch, _request_timeout
+            )
+        batch.append((
+            query_params['wsfunction'],
+            header_params or {},
+            post_params or [],
+            _read_only,
+            future,
+            rest.CALL_TIMING.get(),
+        ))
+        if len(batch) >= self.max_size:
+            self._flush(key, batch, _request_timeout)
+
+        return await future
+
+    def _flush(self, key, batch, _request_timeout) -> None:
+        if self._pending.get(key) is not batch:
+            # already sent because it reached max_size
+            return
+        del self._pending[key]
+        asyncio.ensure_future(self._send(key, batch, _request_timeout))
+
+    def _url(self, base, token, function) -> str:
+        return base + '?' + self.api_client.parameters_to_url_query(
+            [
+                ('moodlewsrestformat', 'json'),
+                ('wsfunction', function),
+                ('wstoken', token),
+            ],
+            None
+        )
+
+    async def _send(self, key, batch, _request_timeout) -> None:
+        entries = [entry for entry in batch if not entry[4].done()]
+        if not entries:
+            return
+        base, token = key
+        rest_client = self.api_client.rest_client
+        json_codec = self.api_client.configuration.json_codec
+        # the timings of the calls take the phases of the batched request
+        timings = [entry[5] for entry in entries if entry[5] is not None]
+        batch_timing = rest.CallTiming(self.FUNCTION, '', lambda timing: None) if timings else None
+        rest.CALL_TIMING.set(batch_timing)
+        try:
+            if len(entries) == 1:
+                function, header_params, post_params, read_only, future, _ = entries[0]
+                response = await rest_client.request(
+                    'POST', self._url(base, token, function),
+                    headers=header_params,
+                    post_params=post_params,
+                    _request_timeout=_request_timeout,
+                    _read_only=read_only
+                )
+                for timing in timings:
+                    timing.adopt(batch_timing)
+                if not future.done():
+                    future.set_result(response)
+                return
+
+            form = []
+            for index, (function, _, post_params, _, _, _) in enumerate(entries):
+                form.append(('requests[%d][function]' % index, function))
+                form.append((
+                    'requests[%d][arguments]' % index,
+                    json_codec.dumps(_unflatten_form(post_params)),
+                ))
+            header_params = dict(entries[0][1])
+            header_params['Content-Type'] = 'application/x-www-form-urlencoded'
+            response = await rest_client.request(
+                'POST', self._url(base, token, self.FUNCTION),
+                headers=header_params,
+                post_params=form,
+                _request_timeout=_request_timeout,
+                # the batch may only be retried if every call in it may
+                _read_only=all(entry[3] for entry in entries)
+            )
+            data = await response.read()
+            for timing in timings:
+                timing.adopt(batch_timing)
+        except BaseException as e:
+            for entry in entries:
+                if not entry[4].done():
+                    entry[4].set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        results = None
+        if 200 <= response.status <= 299:
+            try:
+                payload = json_codec.loads(data)
+            except ValueError:
+                payload = None
+            if isinstance(payload, dict) and isinstance(payload.get('responses'), list):
+                results = payload['responses']
+
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        for index, (_, _, _, _, future, _) in enumerate(entries):
+            if future.done():
+                continue
+            if results is None or index >= len(results):
+                # the batch as a whole failed, every caller gets the error
+                future.set_result(rest.RESTBufferedResponse(
+                    response.status,
+                    response.reason,
+                    response.getheaders(),
+                    data,
+                ))
+                continue
+            result = results[index]
+            body = result.get('exception') if result.get('error') else result.get('data')
+            future.set_result(rest.RESTBufferedResponse(
+                200,
+                'OK',
+                headers,
+                (body if body is not None else 'null').encode('utf-8'),
+            ))
+
+
+class SingleFlight:
+    """Shares one request among identical concurrent calls of read-only
+    wsfunctions, see `Configuration.single_flight`.
+
+    Calls are identical if their method, url (including the token) and
+    form match. The first call sends the request in its own task, calls
+    made until it completes wait for that task and get the same response
+    body, which each call deserializes into its own models.
+
+    A cancelled call only stops waiting, the others still get the
+    response. Only once all calls waiting for a request are cancelled, the
+    request is cancelled as well and a later call sends a new one.
+    """
+
+    def __init__(self) -> None:
+        # request task and number of waiting calls, by request
+        self._flights: Dict[Tuple[str, str, str], Tuple["asyncio.Task[rest.RESTResponse]", List[int]]] = {}
+        # calls which got the response of another call's request
+        self.shared = 0
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        form: Union[None, str, bytes, List[Tuple[str, Any]]]
+    ) -> Optional[Tuple[str, str, str]]:
+        """Returns the key of a request, or None if it must not be shared,
+        e.g. file downloads and uploads.
+
+        :param form: the form fields, or the url encoded form body.
+        """
+        if 'wsfunction' not in dict(parse_qsl(urlsplit(url).query)):
+            return None
+        if isinstance(form, list):
+            if not all(isinstance(v, str) for _, v in form):
+                return None
+            form = rest.encode_form(form)
+        elif isinstance(form, bytes):
+            form = form.decode('utf-8')
+        return (method, url, form or '')
+
+    async def share(
+        self,
+        key: Tuple[str, str, str],
+        send: Callable[[], Awaitable[rest.RESTResponse]]
+    ) -> rest.RESTResponse:
+        """Returns the response of the request in flight for `key`, or
+        sends it by awaiting `send()`.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(self._fly(send))
+            flight = self._flights[key] = (task, [0])
+            task.add_done_callback(lambda _: self._land(key, flight))
+        else:
+            self.shared += 1
+        task, waiting = flight
+        waiting[0] += 1
+        try:
+            # a cancelled call must not cancel the request of the others
+            response = await asyncio.shield(task)
+        finally:
+            waiting[0] -= 1
+            if not waiting[0] and not task.done():
+                # all calls were cancelled
+                self._land(key, flight)
+                task.cancel()
+        # each call gets its own response, which carries its timing
+        return rest.RESTBufferedResponse(response.status, response.reason, response.getheaders(), await response.read())
+
+    @staticmethod
+    async def _fly(send) -> rest.RESTResponse:
+        response = await send()
+        await response.read()
+        return response
+
+    def _land(self, key, flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -14,21 +14,193 @@
 
 import copy
 import http.client as httplib
+import json
 import logging
+import re
 from logging import FileHandler
 import sys
-from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, FrozenSet, Iterable, List, Literal, Optional, TypedDict, Union
+from urllib.parse import parse_qsl, urlsplit
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
 
+if TYPE_CHECKING:
+    from poodle_async_mini.cache import ResponseCache
+    from poodle_async_mini.instrumentation import Instrumentation
+    from poodle_async_mini.tokens import TokenProvider
+    from poodle_async_mini.rest import ConnectionPool, RateLimiter
+
+class JsonCodec:
+    """Encodes and decodes JSON with the `json` module of the standard
+    library. See `json_codec` for faster ones.
+    """
+
+    name = 'json'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parses a JSON document, bytes are expected to be UTF-8.
+
+        :raises ValueError: if the document is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def dumpb(self, obj: Any) -> bytes:
+        """Like `dumps`, but returns UTF-8 encoded bytes."""
+        return json.dumps(obj).encode('utf-8')
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes JSON with `orjson`."""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumpb(obj).decode('utf-8')
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+
+class MsgspecCodec(JsonCodec):
+    """Encodes and decodes JSON with `msgspec`."""
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+        self._error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode('utf-8')
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+JSON_CODECS = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec,
+}
+
+
+def json_codec(name: str='auto') -> JsonCodec:
+    """Returns the JSON codec of the given name, one of `JSON_CODECS`.
+
+    'auto' picks the fastest installed one, falling back to the standard
+    library.
+
+    :raises ImportError: if the library of the codec is not installed.
+    """
+    if name != 'auto':
+        return JSON_CODECS[name]()
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JsonCodec()
+
+
 class _Settings:
     relaxe_all_models: bool = False
     relaxed_models: set[str] = set()
+    json_codec: JsonCodec = JsonCodec()
+    """Codec of the models' `to_json` and `from_json`, which have no
+    configuration.
+    """
 
 settings = _Settings()
 
+IDEMPOTENT_METHODS = frozenset({'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'})
+
+READ_ONLY_FUNCTION_PATTERN = re.compile(r'(^|_)get_')
+
+
+class RetryPolicy:
+    """Decides which requests may be retried and how.
+
+    Requests with an idempotent HTTP method are always retryable. Moodle
+    webservice calls are all POSTs, so those are decided per wsfunction:
+    functions the API description marks as read-only are retried, mutating
+    ones only when listed in `allow`. Functions listed in `deny` are never
+    retried.
+
+    Retryable requests are attempted `attempts` times unless
+    `Configuration.retries` says otherwise.
+
+    :param allow: wsfunctions to retry even though they are not read-only.
+    :param deny: wsfunctions never to retry.
+    :param statuses: HTTP statuses to retry on, in addition to 5xx.
+    :param start_timeout: initial backoff in seconds.
+    :param max_timeout: upper bound of a single backoff in seconds.
+    :param factor: backoff growth factor per attempt.
+    :param jitter: upper bound of the random interval in seconds added to
+        each backoff, so concurrent callers don't retry in lockstep.
+    :param attempts: attempts of a retryable request when
+        `Configuration.retries` is None.
+    """
+
+    def __init__(
+        self,
+        allow: Optional[Iterable[str]]=None,
+        deny: Optional[Iterable[str]]=None,
+        statuses: Optional[Iterable[int]]=None,
+        start_timeout: float=0.1,
+        max_timeout: float=30.0,
+        factor: float=2.0,
+        jitter: float=1.0,
+        attempts: int=3,
+    ) -> None:
+        self.allow: FrozenSet[str] = frozenset(allow or ())
+        self.deny: FrozenSet[str] = frozenset(deny or ())
+        self.statuses: FrozenSet[int] = frozenset(statuses or (429, 502, 503, 504))
+        self.start_timeout = start_timeout
+        self.max_timeout = max_timeout
+        self.factor = factor
+        self.jitter = jitter
+        self.attempts = attempts
+
+    def is_retryable(self, method: str, url: str, read_only: Optional[bool]=None) -> bool:
+        """Returns whether a request may be retried.
+
+        :param method: HTTP method of the request.
+        :param url: request url, including the query string.
+        :param read_only: whether the called wsfunction is read-only, as
+            declared by the generated operation. If None, functions named
+            like `*_get_*` are considered read-only.
+        """
+        wsfunction = dict(parse_qsl(urlsplit(url).query)).get('wsfunction')
+        if wsfunction is None:
+            return method in IDEMPOTENT_METHODS
+        if wsfunction in self.deny:
+            return False
+        if wsfunction in self.allow:
+            return True
+        if read_only is None:
+            read_only = READ_ONLY_FUNCTION_PATTERN.search(wsfunction) is not None
+        return read_only
+
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
     'minimum', 'exclusiveMinimum', 'maxLength',
@@ -127,7 +299,7 @@ AuthSettings = TypedDict(
 class HostSettingVariable(TypedDict):
     description: str
     default_value: str
-    enum_values: List[str]
+    enum_values: NotRequired[List[str]]
 
 
 class HostSetting(TypedDict):
@@ -165,7 +337,9 @@ class Configuration:
       values before.
     :param ssl_ca_cert: str - the path to a file of concatenated CA certificates
       in PEM format.
-    :param retries: Number of retries for API requests.
+    :param retries: Number of attempts of retryable API requests, see
+      `RetryPolicy`. None for the attempts of the retry policy, 1 or 0
+      to disable retries.
     :param ca_cert_data: verify the peer using concatenated CA certificate data
       in PEM (str) or DER (bytes) format.
 
@@ -243,13 +417,16 @@ conf = poodle_async_mini.Configuration(
         """dict to store API prefix (e.g. Bearer)
         """
         self.refresh_api_key_hook = None
-        """function hook to refresh API key if expired
+        """function hook to refresh API key if expired. The wstoken of a
+           `token_provider` takes precedence over the one it refreshes.
         """
         self.username = username
-        """Username for HTTP basic authentication
+        """Username for HTTP basic authentication, and to log in with
+           `token_provider`
         """
         self.password = password
-        """Password for HTTP basic authentication
+        """Password for HTTP basic authentication, and to log in with
+           `token_provider`
         """
         self.access_token = access_token
         """Access token
@@ -308,6 +485,29 @@ conf = poodle_async_mini.Configuration(
         """This value is passed to the aiohttp to limit simultaneous connections.
            Default values is 100, None means no-limit.
         """
+        self.connection_pool_per_host = 0
+        """Limit of simultaneous connections to the same host.
+           Default value is 0, which means no-limit.
+        """
+        self.keepalive_timeout = 15.0
+        """Seconds to keep idle connections open for reuse.
+        """
+        self.dns_cache_ttl: Optional[int] = 10
+        """Seconds to cache resolved host names, None caches them forever.
+        """
+        self.connection_pool: Optional["ConnectionPool"] = None
+        """A `rest.ConnectionPool` to share with other ApiClients, e.g. when
+           using one ApiClient per user token, see `client_manager.ClientManager`. It is
+           not closed with the ApiClient, and its own limits apply instead
+           of the ones above.
+           None (the default) gives every ApiClient its own pool.
+        """
+        self.rate_limiter: Optional["RateLimiter"] = None
+        """A `rest.RateLimiter` throttling the requests per host and token,
+           with a concurrency limit adapting to the load of the server. It
+           can be shared with other ApiClients. None (the default) disables
+           throttling.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -319,10 +519,61 @@ conf = poodle_async_mini.Configuration(
         """Safe chars for path_param
         """
         self.retries = retries
-        """Adding retries to override urllib3 default value 3
+        """Number of attempts of retryable requests, None for the
+           attempts of `retry_policy`
+        """
+        self.retry_policy = RetryPolicy()
+        """Decides which requests are retried and how
+        """
+        self.batch_window: Optional[float] = None
+        """Seconds to collect concurrent webservice calls into a single
+           `tool_mobile_call_external_functions` request.
+           None (the default) disables batching.
+        """
+        self.batch_max_size = 25
+        """Maximum number of calls sent in one batched request.
+        """
+        self.response_cache: Optional["ResponseCache"] = None
+        """A `cache.ResponseCache` of responses of read-only
+           wsfunctions, or a `DiskResponseCache` to keep them across
+           restarts. It can be shared with other ApiClients, entries are
+           kept per token. None (the default) disables caching.
+        """
+        self.token_provider: Optional["TokenProvider"] = None
+        """A `tokens.TokenProvider` obtaining the wstoken by
+           `login_token` with `username` and `password`, instead of
+           `api_key` and `refresh_api_key_hook`, and renewing it when
+           Moodle rejects it. It can be shared with other ApiClients,
+           tokens are kept per site and user. None (the default) uses
+           `api_key` as is.
+        """
+        self.single_flight = False
+        """Send identical concurrent calls of read-only wsfunctions only
+           once, see `coalescing.SingleFlight`.
+        """
+        self.instrumentation: Optional["Instrumentation"] = None
+        """An `instrumentation.Instrumentation` recording the phases of each
+           webservice call, from waiting for the rate limiter to building
+           the models, and passing them to its exporters. It can be shared
+           with other ApiClients. None (the default) records nothing.
+        """
+        self.raw_responses = False
+        """Return responses as parsed JSON (dicts and lists) instead of
+           models. Moodle errors are still raised as `ApiException`.
+           Operations can override this with their `_raw` argument, see
+           `typed_dicts` for types of the returned dicts.
+        """
+        self.json_codec: JsonCodec = settings.json_codec
+        """Encodes request and decodes response bodies, e.g.
+           `json_codec('orjson')`. Defaults to `settings.json_codec`,
+           which uses the standard library unless changed.
         """
-        # Enable client side validation
         self.client_side_validation = True
+        """Validate the arguments of operations with pydantic.
+           Trusted callers can disable it to save the validation, which
+           for long lists of arguments costs more than sending them.
+           `ApiClient.client_side_validation` can be changed as well.
+        """
 
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
@@ -341,8 +592,15 @@ conf = poodle_async_mini.Configuration(
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'connection_pool', 'rate_limiter', 'json_codec', 'response_cache', 'token_provider', 'instrumentation'):
                 setattr(result, k, copy.deepcopy(v, memo))
+        # the connection pool, the limiter, the stateless codec, the cache, the tokens and the metrics are shared on purpose
+        result.connection_pool = self.connection_pool
+        result.rate_limiter = self.rate_limiter
+        result.json_codec = self.json_codec
+        result.response_cache = self.response_cache
+        result.token_provider = self.token_provider
+        result.instrumentation = self.instrumentation
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
         # use setters to configure loggers
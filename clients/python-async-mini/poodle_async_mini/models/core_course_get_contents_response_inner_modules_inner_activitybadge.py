@@ -18,10 +18,12 @@ import pprint
 from pydantic import BaseModel, ConfigDict, Field, StrictStr, ValidationError, field_validator
 from typing import Any, List, Optional
 from poodle_async_mini.models.core_course_get_contents_response_inner_modules_inner_activitybadge_one_of import CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf
-from pydantic import StrictStr, Field
-from typing import Union, List, Set, Optional, Dict
+from pydantic import StrictStr, Field, ValidationInfo, ValidatorFunctionWrapHandler, model_validator
+from typing import Any, Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
+from poodle_async_mini.configuration import settings
+
 CORECOURSEGETCONTENTSRESPONSEINNERMODULESINNERACTIVITYBADGE_ONE_OF_SCHEMAS = ["CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf", "List[CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf]"]
 
 class CoreCourseGetContentsResponseInnerModulesInnerActivitybadge(BaseModel):
@@ -76,27 +78,64 @@ class CoreCourseGetContentsResponseInnerModulesInnerActivitybadge(BaseModel):
         else:
             return v
 
+    @model_validator(mode='wrap')
+    @classmethod
+    def validate_value(cls, data: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Self:
+        """Accepts the plain value as well, so fields of this type can be
+        validated by pydantic, e.g. by `model_validate_json` of a model
+        containing it.
+        """
+        if isinstance(data, cls):
+            return handler(data)
+        if (
+            # JSON holds the plain value only
+            info.mode == 'python'
+            and isinstance(data, dict)
+            # the keyword arguments of the constructor, not an empty value
+            and 'actual_instance' in data
+            and data.keys() <= cls.model_fields.keys()
+        ):
+            return handler(data)
+        return cls.from_dict(data)
+
     @classmethod
-    def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
-        return cls.from_json(json.dumps(obj))
+    def from_dict(cls, obj: Any) -> Self:
+        """Returns the object represented by the already parsed JSON value
+
+        The schema is picked by the shape of the value. Only if several
+        schemas accept that shape, they are tried in turn by `from_json`.
+        """
+        matches = [schema for schema, shape in (
+            ("CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf", dict),
+            ("List[CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf]", list),
+        ) if isinstance(obj, shape)]
+        if len(matches) != 1:
+            return cls.from_json(settings.json_codec.dumps(obj))
+
+        if matches[0] == "CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf":
+            return cls.model_construct(actual_instance=CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf.from_dict(obj))
+        if matches[0] == "List[CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf]":
+            return cls.model_construct(actual_instance=[CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf.from_dict(item) for item in obj])
+        raise ValueError("No match found when deserializing the value into CoreCourseGetContentsResponseInnerModulesInnerActivitybadge with oneOf schemas: CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf, List[CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf]")
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
         instance = cls.model_construct()
+        data = settings.json_codec.loads(json_str)
         error_messages = []
         match = 0
 
         # deserialize data into CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf
         try:
-            instance.actual_instance = CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf.from_json(json_str)
+            instance.actual_instance = CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf.from_dict(data)
             match += 1
         except (ValidationError, ValueError) as e:
             error_messages.append(str(e))
         # deserialize data into List[CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf]
         try:
             # validation
-            instance.oneof_schema_2_validator = json.loads(json_str)
+            instance.oneof_schema_2_validator = data
             # assign value to actual_instance
             instance.actual_instance = instance.oneof_schema_2_validator
             match += 1
@@ -120,7 +159,7 @@ class CoreCourseGetContentsResponseInnerModulesInnerActivitybadge(BaseModel):
         if hasattr(self.actual_instance, "to_json") and callable(self.actual_instance.to_json):
             return self.actual_instance.to_json()
         else:
-            return json.dumps(self.actual_instance)
+            return settings.json_codec.dumps(self.actual_instance)
 
     def to_dict(self) -> Optional[Union[Dict[str, Any], CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf, List[CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf]]]:
         """Returns the dict representation of the actual instance"""
@@ -0,0 +1,401 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import asyncio
+import json
+import os
+import posixpath
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+def _field(entry, name):
+    """Returns a field of a model, or of its dict representation."""
+    if isinstance(entry, dict):
+        return entry.get(name)
+    return getattr(entry, name, None)
+
+
+def _replace(entry, **fields):
+    """Returns a copy of a model, or of its dict representation, with
+    fields replaced."""
+    if isinstance(entry, dict):
+        return dict(entry, **fields)
+    return entry.model_copy(update=fields)
+
+
+class MirrorReport:
+    """Progress of a `FileMirror.mirror` run."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.downloaded = 0
+        self.skipped = 0
+        self.failed: List[Tuple[str, Exception]] = []
+        self.bytes = 0
+        self.started = time.monotonic()
+
+    @property
+    def done(self) -> int:
+        return self.downloaded + self.skipped + len(self.failed)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Downloaded bytes per second."""
+        elapsed = self.elapsed
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return "{0}/{1} files, {2} skipped, {3} failed, {4:.1f} MiB at {5:.1f} MiB/s".format(
+            self.done,
+            self.total,
+            self.skipped,
+            len(self.failed),
+            self.bytes / 2**20,
+            self.throughput / 2**20,
+        )
+
+
+class FileMirror:
+    """Mirrors files into a local directory with a bounded number of
+    concurrent downloads.
+
+    Files are given as entries with `fileurl`, `filename`, `filepath`,
+    `filesize` and `timemodified`, like the `contents` of the modules
+    returned by `core_course_get_contents`, see `course_files`. A manifest
+    in the directory records the `filesize` and `timemodified` each file
+    was mirrored at, so unchanged files are skipped without a request. It
+    is saved every `save_every` downloaded files and once the mirror
+    ends, so a mirror which is interrupted skips the files downloaded so
+    far when run again. Interrupted downloads are resumed, see
+    `ApiClient.download_file`.
+
+    :param api: api to download with, e.g. DefaultApi.
+    :param directory: directory to mirror into.
+    :param workers: maximum number of concurrent downloads.
+    :param per_host: maximum number of concurrent downloads per host.
+    :param manifest: file name of the manifest in `directory`.
+    :param on_progress: callback called with the `MirrorReport` after each
+        file.
+    :param save_every: number of downloaded files after which the manifest
+        is saved.
+    """
+
+    def __init__(
+        self,
+        api,
+        directory: str,
+        workers: int = 8,
+        per_host: int = 4,
+        manifest: str = '.manifest.json',
+        on_progress: Optional[Callable[[MirrorReport], None]] = None,
+        save_every: int = 20,
+    ) -> None:
+        self.api = api
+        self.directory = directory
+        self.workers = workers
+        self.per_host = per_host
+        self.manifest = os.path.join(directory, manifest)
+        self.on_progress = on_progress
+        self.save_every = save_every
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def course_files(sections) -> List[Tuple[str, Any]]:
+        """Returns the files of a `core_course_get_contents` response, each
+        in a directory named after the id of its module.
+        """
+        files = []
+        for section in sections:
+            for module in _field(section, 'modules') or []:
+                for content in _field(module, 'contents') or []:
+                    files.append((str(_field(module, 'id')), content))
+        return files
+
+    async def mirror(self, files) -> MirrorReport:
+        """Downloads all new or changed files.
+
+        Failed downloads do not stop the others; they are collected in
+        `MirrorReport.failed`.
+
+        :param files: file entries, or (subdirectory, entry) tuples.
+        :return: MirrorReport
+        """
+        report = MirrorReport()
+        manifest = self._load_manifest()
+        queue: "asyncio.Queue[Tuple[str, Any]]" = asyncio.Queue()
+        for entry in files:
+            subdirectory, entry = entry if isinstance(entry, tuple) else ('', entry)
+            # skip folders, links and inline content
+            if _field(entry, 'fileurl') and _field(entry, 'type') in (None, 'file'):
+                queue.put_nowait((subdirectory, entry))
+                report.total += 1
+
+        workers = [
+            asyncio.ensure_future(self._work(queue, manifest, report))
+            for _ in range(min(self.workers, report.total))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self._save_manifest(manifest)
+        return report
+
+    async def _work(self, queue, manifest, report) -> None:
+        while not queue.empty():
+            subdirectory, entry = queue.get_nowait()
+            name = posixpath.normpath(posixpath.join(
+                '/',
+                subdirectory,
+                (_field(entry, 'filepath') or '/').lstrip('/'),
+                _field(entry, 'filename') or '',
+            )).lstrip('/')
+            state = {
+                'filesize': _field(entry, 'filesize'),
+                'timemodified': _field(entry, 'timemodified'),
+            }
+            path = os.path.join(self.directory, *name.split('/'))
+            if manifest.get(name) == state and os.path.exists(path):
+                report.skipped += 1
+            else:
+                url = _field(entry, 'fileurl')
+                host = urlsplit(url).netloc
+                semaphore = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+                try:
+                    async with semaphore:
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        await self.api.download_to(url, path, **state)
+                except Exception as e:
+                    report.failed.append((name, e))
+                else:
+                    manifest[name] = state
+                    report.downloaded += 1
+                    report.bytes += state['filesize'] or os.path.getsize(path)
+                    if report.downloaded % self.save_every == 0:
+                        self._save_manifest(manifest)
+            if self.on_progress is not None:
+                self.on_progress(report)
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.manifest + '.tmp', 'w') as f:
+            json.dump(manifest, f)
+        os.replace(self.manifest + '.tmp', self.manifest)
+
+
+class CourseChange:
+    """A change of a course module found by `CourseSync`.
+
+    :param kind: one of `ADDED`, `UPDATED` or `REMOVED`.
+    :param courseid: id of the course.
+    :param cmid: id of the course module.
+    :param module: the module as returned by `core_course_get_contents`,
+        None if removed.
+    :param areas: names of the updated areas reported by
+        `core_course_get_updates_since`, e.g. `configuration`, if known.
+    """
+
+    ADDED = 'added'
+    UPDATED = 'updated'
+    REMOVED = 'removed'
+
+    def __init__(self, kind, courseid, cmid, module=None, areas=None) -> None:
+        self.kind = kind
+        self.courseid = courseid
+        self.cmid = cmid
+        self.module = module
+        self.areas = areas or []
+
+    def __repr__(self) -> str:
+        return "CourseChange({0!r}, courseid={1}, cmid={2}, areas={3})".format(
+            self.kind, self.courseid, self.cmid, self.areas
+        )
+
+
+class CourseSync:
+    """Keeps snapshots of course contents up to date with few requests.
+
+    The first sync of a course fetches its contents with
+    `core_course_get_contents`. Later syncs ask
+    `core_course_get_updates_since` for the modules changed since the
+    previous sync and fetch only those (using the `cmid` option), unless
+    more than `max_changed` changed. Module removals and section changes
+    are not reported by Moodle, so the full contents are fetched again
+    every `full_sync_interval` seconds.
+
+    Moodle answers `core_course_get_updates_since` by checking every
+    module of the course as `core_course_check_updates` does, so modules
+    added since are found too, which a check of the known modules would
+    miss. Snapshots are replaced rather than modified, so sections and
+    modules handed out before stay as they were.
+
+    :param api: api providing `core_course_get_contents` and
+        `core_course_get_updates_since`, e.g. DefaultApi.
+    :param full_sync_interval: seconds between full syncs of a course,
+        None to never fetch the full contents again.
+    :param max_changed: number of changed modules from which the full
+        contents are fetched instead.
+    :param skew: seconds subtracted from the time of the previous sync,
+        to allow for clock skew between client and server.
+    :param filter: areas to check for updates, see
+        `core_course_get_updates_since`.
+    """
+
+    def __init__(
+        self,
+        api,
+        full_sync_interval: Optional[float] = 24 * 60 * 60,
+        max_changed: int = 20,
+        skew: int = 60,
+        filter: Optional[List[str]] = None,
+    ) -> None:
+        self.api = api
+        self.full_sync_interval = full_sync_interval
+        self.max_changed = max_changed
+        self.skew = skew
+        self.filter = filter
+        # courseid -> sections as returned by core_course_get_contents
+        self.snapshots: Dict[int, List[Any]] = {}
+        # courseid -> time of the last sync, and of the last full sync
+        self._synced: Dict[int, Tuple[int, float]] = {}
+
+    async def sync(self, courseid: int) -> List[CourseChange]:
+        """Updates the snapshot of a course.
+
+        :param courseid: id of the course.
+        :return: the changes since the previous sync, empty on the first.
+        """
+        started = int(time.time())
+        previous = self._synced.get(courseid)
+        if previous is None or (
+            self.full_sync_interval is not None
+            and time.monotonic() - previous[1] >= self.full_sync_interval
+        ):
+            return await self._full_sync(courseid, started)
+
+        since = previous[0] - self.skew
+        if self.filter is None:
+            response = await self.api.core_course_get_updates_since(courseid=courseid, since=since)
+        else:
+            response = await self.api.core_course_get_updates_since(courseid=courseid, since=since, filter=self.filter)
+        updated = {
+            _field(instance, 'id'): [_field(update, 'name') for update in _field(instance, 'updates') or []]
+            for instance in _field(response, 'instances') or []
+            if _field(instance, 'contextlevel') == 'module'
+        }
+        if len(updated) > self.max_changed:
+            return await self._full_sync(courseid, started, updated)
+
+        fetched = await asyncio.gather(*[
+            self.api.core_course_get_contents(
+                courseid=courseid,
+                options=[{'name': 'cmid', 'value': str(cmid)}],
+            )
+            for cmid in updated
+        ])
+        sections = list(self.snapshots[courseid])
+        changes = []
+        for (cmid, areas), response in zip(updated.items(), fetched):
+            old = self._locate(sections, cmid)
+            new = self._locate(response, cmid)
+            if new is not None and old is None:
+                index = next((
+                    i for i, section in enumerate(sections)
+                    if _field(section, 'id') == _field(response[new[0]], 'id')
+                ), None)
+                if index is None:
+                    # moved into a new section
+                    return await self._full_sync(courseid, started, updated)
+                modules = list(_field(sections[index], 'modules') or []) + [new[1]]
+                sections[index] = _replace(sections[index], modules=modules)
+                changes.append(CourseChange(CourseChange.ADDED, courseid, cmid, new[1], areas))
+            elif new is None and old is not None:
+                modules = [module for module in _field(sections[old[0]], 'modules') if module is not old[1]]
+                sections[old[0]] = _replace(sections[old[0]], modules=modules)
+                changes.append(CourseChange(CourseChange.REMOVED, courseid, cmid, None, areas))
+            elif new is not None and old is not None and new[1] != old[1]:
+                if _field(response[new[0]], 'id') != _field(sections[old[0]], 'id'):
+                    # moved to another section
+                    return await self._full_sync(courseid, started, updated)
+                modules = [new[1] if module is old[1] else module for module in _field(sections[old[0]], 'modules')]
+                sections[old[0]] = _replace(sections[old[0]], modules=modules)
+                changes.append(CourseChange(CourseChange.UPDATED, courseid, cmid, new[1], areas))
+        self.snapshots[courseid] = sections
+        self._synced[courseid] = (started, self._synced[courseid][1])
+        return changes
+
+    async def watch(self, courseids: List[int], interval: float) -> AsyncIterator[CourseChange]:
+        """Syncs the courses every `interval` seconds and yields their
+        changes.
+
+        :param courseids: ids of the courses to watch.
+        :param interval: seconds between syncs.
+        """
+        while True:
+            for changes in await asyncio.gather(*[self.sync(courseid) for courseid in courseids]):
+                for change in changes:
+                    yield change
+            await asyncio.sleep(interval)
+
+    async def _full_sync(self, courseid, started, updated=None) -> List[CourseChange]:
+        sections = await self.api.core_course_get_contents(courseid=courseid)
+        old = self.snapshots.get(courseid)
+        self.snapshots[courseid] = sections
+        self._synced[courseid] = (started, time.monotonic())
+        if old is None:
+            return []
+
+        updated = updated or {}
+        old_modules = self._modules(old)
+        new_modules = self._modules(sections)
+        changes = []
+        for cmid, module in new_modules.items():
+            if cmid not in old_modules:
+                changes.append(CourseChange(CourseChange.ADDED, courseid, cmid, module, updated.get(cmid)))
+            elif module != old_modules[cmid]:
+                changes.append(CourseChange(CourseChange.UPDATED, courseid, cmid, module, updated.get(cmid)))
+        for cmid in old_modules.keys() - new_modules.keys():
+            changes.append(CourseChange(CourseChange.REMOVED, courseid, cmid, None, updated.get(cmid)))
+        return changes
+
+    @staticmethod
+    def _modules(sections) -> Dict[int, Any]:
+        return {
+            _field(module, 'id'): module
+            for section in sections
+            for module in _field(section, 'modules') or []
+        }
+
+    @staticmethod
+    def _locate(sections, cmid) -> Optional[Tuple[int, Any]]:
+        """Returns the index of the section containing a module, and the
+        module."""
+        for index, section in enumerate(sections):
+            for module in _field(section, 'modules') or []:
+                if _field(module, 'id') == cmid:
+                    return index, module
+        return None
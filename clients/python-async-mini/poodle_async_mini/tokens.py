@@ -0,0 +1,130 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+import asyncio
+from typing import Dict, Tuple
+
+from poodle_async_mini.api_client import ApiClient
+from poodle_async_mini import rest
+
+
+class TokenProvider:
+    """Obtains wstokens by `login_token`, with the `username` and `password`
+    of the client's configuration, see `Configuration.token_provider`.
+
+    Tokens are cached per site, user and service, and shared by all
+    clients using the provider. When Moodle rejects a token as invalid,
+    e.g. once it expired, the call logs in again and is retried once with
+    the new token. Concurrent callers share a pending login, so a rejected
+    token is renewed by a single `login_token` request.
+
+    Calls sent with `_batchable=False`, e.g. by the `_stream` and
+    `_without_preload_content` methods, or with `_preload_content=False` by
+    `call_api_from_args`, get a token but are not retried, as their
+    response is read by the caller.
+
+    The provider replaces `Configuration.refresh_api_key_hook`: the token
+    it sets takes precedence over a wstoken in `api_key`, whether
+    refreshed by the hook or not.
+
+    :param service: shortname of the external service issuing the tokens.
+    """
+
+    RESOURCE_PATH = '/login/token.php'
+
+    def __init__(self, service: str='moodle_mobile_app') -> None:
+        self.service = service
+        self._tokens: Dict[Tuple[str, str, str], "asyncio.Future[str]"] = {}
+        self.logins = 0
+        self.renewals = 0
+
+    def accepts(self, api_client, url: str) -> bool:
+        """Returns whether the provider sets the token of a request."""
+        return (
+            api_client.configuration.username is not None
+            and rest.WEBSERVICE_PATH in url
+        )
+
+    @staticmethod
+    def rejected(data: bytes) -> bool:
+        """Returns whether a response body rejects the token as invalid."""
+        return ApiClient._may_be_error(data) and b'"invalidtoken"' in data
+
+    def _key(self, api_client) -> Tuple[str, str, str]:
+        configuration = api_client.configuration
+        return (configuration.host, configuration.username, self.service)
+
+    async def token(self, api_client) -> str:
+        """Returns the token of the client's user, logging in if none is
+        cached yet.
+        """
+        key = self._key(api_client)
+        token = self._tokens.get(key)
+        if token is None or (token.done() and (token.cancelled() or token.exception() is not None)):
+            token = asyncio.ensure_future(self._login(api_client))
+            self._tokens[key] = token
+        # a cancelled caller must not cancel the login of the others
+        return await asyncio.shield(token)
+
+    async def renew(self, api_client, rejected: str) -> str:
+        """Returns a new token for the client's user after `rejected` was
+        rejected. A different token cached meanwhile is returned as is.
+        """
+        key = self._key(api_client)
+        token = self._tokens.get(key)
+        if (
+            token is not None
+            and token.done()
+            and not token.cancelled()
+            and token.exception() is None
+            and token.result() == rejected
+        ):
+            del self._tokens[key]
+            self.renewals += 1
+        return await self.token(api_client)
+
+    async def _login(self, api_client) -> str:
+        configuration = api_client.configuration
+        method, url, header_params, body, post_params = api_client.param_serialize(
+            method='POST',
+            resource_path=self.RESOURCE_PATH,
+            header_params={
+                'Accept': 'application/json',
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            post_params=[
+                ('username', configuration.username),
+                ('password', configuration.password),
+                ('service', self.service),
+            ],
+            auth_settings=[]
+        )
+        self.logins += 1
+        # sent by the rest client, bypassing the cache and the batcher
+        response_data = await api_client.rest_client.request(
+            method, url,
+            headers=header_params,
+            post_params=post_params,
+            _read_only=False
+        )
+        await response_data.read()
+        # raw, as Moodle errors are raised regardless of the model
+        return api_client.response_deserialize(
+            response_data, {'200': 'LoginToken200Response'}, raw=True
+        ).data['token']
+
+    def invalidate(self, api_client) -> None:
+        """Drops the cached token of the client's user, e.g. after logging
+        out.
+        """
+        self._tokens.pop(self._key(api_client), None)
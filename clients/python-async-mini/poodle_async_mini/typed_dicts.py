@@ -0,0 +1,633 @@
+# coding: utf-8
+
+"""
+    Moodle Webservice API
+
+    Auto-generated OpenAPI spec for Moodle's Webservice API.
+
+    The version of the OpenAPI document: 5.0.2 (Build: 20250811)
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any, List, Optional, TypedDict  # noqa: F401
+from typing_extensions import NotRequired
+
+# The responses returned in raw mode (`Configuration.raw_responses` or the
+# `_raw` argument of an operation), typed by JSON key. Only used for static
+# typing, e.g. `cast(CoreWebserviceGetSiteInfoResponseDict, info)`.
+
+
+CoreCommentAddCommentsParametersCommentsInnerDict = TypedDict('CoreCommentAddCommentsParametersCommentsInnerDict', {
+    'area': NotRequired[Optional[str]],
+    'component': Optional[str],
+    'content': Optional[str],
+    'contextlevel': Optional[str],
+    'instanceid': Optional[int],
+    'itemid': Optional[int],
+})
+
+
+CoreCommentAddCommentsResponseInnerDict = TypedDict('CoreCommentAddCommentsResponseInnerDict', {
+    'avatar': Optional[str],
+    'content': Optional[str],
+    'delete': NotRequired[Optional[bool]],
+    'format': Optional[int],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'profileurl': Optional[str],
+    'strftimeformat': Optional[str],
+    'time': Optional[str],
+    'timecreated': Optional[int],
+    'userid': Optional[int],
+})
+
+
+CoreCommentGetCommentsResponseDict = TypedDict('CoreCommentGetCommentsResponseDict', {
+    'canpost': NotRequired[Optional[bool]],
+    'comments': List['CoreCommentAddCommentsResponseInnerDict'],
+    'count': NotRequired[Optional[int]],
+    'perpage': NotRequired[Optional[int]],
+    'warnings': NotRequired[Optional[List['CoreCommentGetCommentsResponseWarningsInnerDict']]],
+})
+
+
+CoreCommentGetCommentsResponseWarningsInnerDict = TypedDict('CoreCommentGetCommentsResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+CoreCourseGetContentsParametersOptionsInnerDict = TypedDict('CoreCourseGetContentsParametersOptionsInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+CoreCourseGetContentsResponseInnerDict = TypedDict('CoreCourseGetContentsResponseInnerDict', {
+    'availabilityinfo': NotRequired[Optional[str]],
+    'component': NotRequired[Optional[str]],
+    'hiddenbynumsections': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'itemid': NotRequired[Optional[int]],
+    'modules': List['CoreCourseGetContentsResponseInnerModulesInnerDict'],
+    'name': Optional[str],
+    'section': NotRequired[Optional[int]],
+    'summary': Optional[str],
+    'summaryformat': Optional[int],
+    'uservisible': NotRequired[Optional[bool]],
+    'visible': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerDict', {
+    'activitybadge': NotRequired[Optional['CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeDict']],
+    'afterlink': NotRequired[Optional[str]],
+    'availability': NotRequired[Optional[str]],
+    'availabilityinfo': NotRequired[Optional[str]],
+    'branded': NotRequired[Optional[bool]],
+    'completion': NotRequired[Optional[int]],
+    'completiondata': NotRequired[Optional['CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDict']],
+    'contents': NotRequired[Optional[List['CoreCourseGetContentsResponseInnerModulesInnerContentsInnerDict']]],
+    'contentsinfo': NotRequired[Optional['CoreCourseGetContentsResponseInnerModulesInnerContentsinfoDict']],
+    'contextid': NotRequired[Optional[int]],
+    'customdata': NotRequired[Optional[str]],
+    'dates': NotRequired[Optional[List['CoreCourseGetContentsResponseInnerModulesInnerDatesInnerDict']]],
+    'description': NotRequired[Optional[str]],
+    'downloadcontent': NotRequired[Optional[int]],
+    'groupmode': NotRequired[Optional[int]],
+    'id': Optional[int],
+    'indent': Optional[int],
+    'instance': NotRequired[Optional[int]],
+    'modicon': Optional[str],
+    'modname': Optional[str],
+    'modplural': Optional[str],
+    'name': Optional[str],
+    'noviewlink': NotRequired[Optional[bool]],
+    'onclick': NotRequired[Optional[str]],
+    'purpose': Optional[str],
+    'url': NotRequired[Optional[str]],
+    'uservisible': NotRequired[Optional[bool]],
+    'visible': NotRequired[Optional[int]],
+    'visibleoncoursepage': NotRequired[Optional[int]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeDict = Any
+
+
+CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfDict', {
+    'badgecontent': NotRequired[Optional[str]],
+    'badgeelementid': NotRequired[Optional[str]],
+    'badgeextraattributes': NotRequired[Optional[List['CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfBadgeextraattributesInnerDict']]],
+    'badgestyle': NotRequired[Optional[str]],
+    'badgeurl': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfBadgeextraattributesInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOfBadgeextraattributesInnerDict', {
+    'name': NotRequired[Optional[str]],
+    'value': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDict', {
+    'details': List['CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerDict'],
+    'hascompletion': bool,
+    'isautomatic': bool,
+    'isoverallcomplete': NotRequired[Optional[bool]],
+    'istrackeduser': bool,
+    'overrideby': Optional[int],
+    'state': int,
+    'timecompleted': int,
+    'uservisible': bool,
+    'valueused': bool,
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerDict', {
+    'rulename': str,
+    'rulevalue': 'CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerRulevalueDict',
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerRulevalueDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerCompletiondataDetailsInnerRulevalueDict', {
+    'description': str,
+    'status': int,
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerContentsInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerContentsInnerDict', {
+    'author': Optional[str],
+    'content': NotRequired[Optional[str]],
+    'filename': Optional[str],
+    'filepath': Optional[str],
+    'filesize': Optional[int],
+    'fileurl': NotRequired[Optional[str]],
+    'isexternalfile': NotRequired[Optional[bool]],
+    'license': Optional[str],
+    'mimetype': NotRequired[Optional[str]],
+    'repositorytype': NotRequired[Optional[str]],
+    'sortorder': Optional[int],
+    'tags': NotRequired[Optional[List['CoreCourseGetContentsResponseInnerModulesInnerContentsInnerTagsInnerDict']]],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'type': Optional[str],
+    'userid': Optional[int],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerContentsInnerTagsInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerContentsInnerTagsInnerDict', {
+    'flag': Optional[int],
+    'id': int,
+    'isstandard': bool,
+    'itemid': int,
+    'name': str,
+    'ordering': int,
+    'rawname': str,
+    'tagcollid': int,
+    'taginstancecontextid': int,
+    'taginstanceid': int,
+    'viewurl': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerContentsinfoDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerContentsinfoDict', {
+    'filescount': Optional[int],
+    'filessize': Optional[int],
+    'lastmodified': Optional[int],
+    'mimetypes': List[str],
+    'repositorytype': NotRequired[Optional[str]],
+})
+
+
+CoreCourseGetContentsResponseInnerModulesInnerDatesInnerDict = TypedDict('CoreCourseGetContentsResponseInnerModulesInnerDatesInnerDict', {
+    'dataid': NotRequired[Optional[str]],
+    'label': Optional[str],
+    'relativeto': NotRequired[Optional[int]],
+    'timestamp': Optional[int],
+})
+
+
+CoreEnrolGetUsersCoursesResponseInnerDict = TypedDict('CoreEnrolGetUsersCoursesResponseInnerDict', {
+    'category': NotRequired[Optional[int]],
+    'completed': NotRequired[Optional[bool]],
+    'completionhascriteria': NotRequired[Optional[bool]],
+    'completionusertracked': NotRequired[Optional[bool]],
+    'courseimage': NotRequired[Optional[str]],
+    'displayname': NotRequired[Optional[str]],
+    'enablecompletion': NotRequired[Optional[bool]],
+    'enddate': NotRequired[Optional[int]],
+    'enrolledusercount': NotRequired[Optional[int]],
+    'format': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'hidden': NotRequired[Optional[bool]],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'isfavourite': NotRequired[Optional[bool]],
+    'lang': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'marker': NotRequired[Optional[int]],
+    'overviewfiles': NotRequired[Optional[List['CoreEnrolGetUsersCoursesResponseInnerOverviewfilesInnerDict']]],
+    'progress': NotRequired[Optional[float]],
+    'shortname': Optional[str],
+    'showactivitydates': Optional[bool],
+    'showcompletionconditions': Optional[bool],
+    'showgrades': NotRequired[Optional[bool]],
+    'startdate': NotRequired[Optional[int]],
+    'summary': NotRequired[Optional[str]],
+    'summaryformat': NotRequired[Optional[int]],
+    'timemodified': NotRequired[Optional[int]],
+    'visible': Optional[int],
+})
+
+
+CoreEnrolGetUsersCoursesResponseInnerOverviewfilesInnerDict = TypedDict('CoreEnrolGetUsersCoursesResponseInnerOverviewfilesInnerDict', {
+    'filename': NotRequired[Optional[str]],
+    'filepath': NotRequired[Optional[str]],
+    'filesize': NotRequired[Optional[int]],
+    'fileurl': NotRequired[Optional[str]],
+    'icon': NotRequired[Optional[str]],
+    'isexternalfile': NotRequired[Optional[bool]],
+    'mimetype': NotRequired[Optional[str]],
+    'repositorytype': NotRequired[Optional[str]],
+    'timemodified': NotRequired[Optional[int]],
+})
+
+
+CoreGroupGetCourseGroupsResponseInnerDict = TypedDict('CoreGroupGetCourseGroupsResponseInnerDict', {
+    'courseid': Optional[int],
+    'description': Optional[str],
+    'descriptionformat': Optional[int],
+    'enrolmentkey': Optional[str],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'name': Optional[str],
+    'participation': Optional[bool],
+    'visibility': Optional[int],
+})
+
+
+CoreWebserviceGetSiteInfoResponseDict = TypedDict('CoreWebserviceGetSiteInfoResponseDict', {
+    'advancedfeatures': NotRequired[Optional[List['CoreWebserviceGetSiteInfoResponseAdvancedfeaturesInnerDict']]],
+    'downloadfiles': NotRequired[Optional[int]],
+    'firstname': Optional[str],
+    'fullname': Optional[str],
+    'functions': List['CoreWebserviceGetSiteInfoResponseFunctionsInnerDict'],
+    'lang': Optional[str],
+    'lastname': Optional[str],
+    'limitconcurrentlogins': NotRequired[Optional[int]],
+    'mobilecssurl': NotRequired[Optional[str]],
+    'policyagreed': NotRequired[Optional[int]],
+    'release': NotRequired[Optional[str]],
+    'sitecalendartype': NotRequired[Optional[str]],
+    'siteid': NotRequired[Optional[int]],
+    'sitename': Optional[str],
+    'siteurl': Optional[str],
+    'theme': NotRequired[Optional[str]],
+    'uploadfiles': NotRequired[Optional[int]],
+    'usercalendartype': NotRequired[Optional[str]],
+    'usercanmanageownfiles': NotRequired[Optional[bool]],
+    'userhomepage': NotRequired[Optional[int]],
+    'userhomepageurl': NotRequired[Optional[str]],
+    'userid': Optional[int],
+    'userissiteadmin': NotRequired[Optional[bool]],
+    'usermaxuploadfilesize': NotRequired[Optional[int]],
+    'username': Optional[str],
+    'userpictureurl': Optional[str],
+    'userprivateaccesskey': NotRequired[Optional[str]],
+    'userquota': NotRequired[Optional[int]],
+    'usersessionscount': NotRequired[Optional[int]],
+    'version': NotRequired[Optional[str]],
+})
+
+
+CoreWebserviceGetSiteInfoResponseAdvancedfeaturesInnerDict = TypedDict('CoreWebserviceGetSiteInfoResponseAdvancedfeaturesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[int],
+})
+
+
+CoreWebserviceGetSiteInfoResponseFunctionsInnerDict = TypedDict('CoreWebserviceGetSiteInfoResponseFunctionsInnerDict', {
+    'name': Optional[str],
+    'version': Optional[str],
+})
+
+
+GradereportUserGetGradeItemsResponseDict = TypedDict('GradereportUserGetGradeItemsResponseDict', {
+    'usergrades': List['GradereportUserGetGradeItemsResponseUsergradesInnerDict'],
+    'warnings': NotRequired[Optional[List['CoreCommentGetCommentsResponseWarningsInnerDict']]],
+})
+
+
+GradereportUserGetGradeItemsResponseUsergradesInnerDict = TypedDict('GradereportUserGetGradeItemsResponseUsergradesInnerDict', {
+    'courseid': Optional[int],
+    'courseidnumber': Optional[str],
+    'gradeitems': List['GradereportUserGetGradeItemsResponseUsergradesInnerGradeitemsInnerDict'],
+    'maxdepth': Optional[int],
+    'userfullname': Optional[str],
+    'userid': Optional[int],
+    'useridnumber': Optional[str],
+})
+
+
+GradereportUserGetGradeItemsResponseUsergradesInnerGradeitemsInnerDict = TypedDict('GradereportUserGetGradeItemsResponseUsergradesInnerGradeitemsInnerDict', {
+    'averageformatted': NotRequired[Optional[str]],
+    'categoryid': Optional[int],
+    'cmid': NotRequired[Optional[int]],
+    'feedback': NotRequired[Optional[str]],
+    'feedbackformat': NotRequired[Optional[int]],
+    'gradedategraded': NotRequired[Optional[int]],
+    'gradedatesubmitted': NotRequired[Optional[int]],
+    'gradeformatted': NotRequired[Optional[str]],
+    'gradehiddenbydate': NotRequired[Optional[bool]],
+    'gradeishidden': NotRequired[Optional[bool]],
+    'gradeislocked': NotRequired[Optional[bool]],
+    'gradeisoverridden': NotRequired[Optional[bool]],
+    'grademax': NotRequired[Optional[float]],
+    'grademin': NotRequired[Optional[float]],
+    'gradeneedsupdate': NotRequired[Optional[bool]],
+    'graderaw': NotRequired[Optional[float]],
+    'id': Optional[int],
+    'idnumber': Optional[str],
+    'iteminstance': Optional[int],
+    'itemmodule': Optional[str],
+    'itemname': Optional[str],
+    'itemnumber': Optional[int],
+    'itemtype': Optional[str],
+    'lettergradeformatted': NotRequired[Optional[str]],
+    'locked': NotRequired[Optional[bool]],
+    'numusers': NotRequired[Optional[int]],
+    'outcomeid': Optional[int],
+    'percentageformatted': NotRequired[Optional[str]],
+    'rangeformatted': NotRequired[Optional[str]],
+    'rank': NotRequired[Optional[int]],
+    'scaleid': Optional[int],
+    'status': NotRequired[Optional[str]],
+    'weightformatted': NotRequired[Optional[str]],
+    'weightraw': NotRequired[Optional[float]],
+})
+
+
+LoginToken200ResponseDict = TypedDict('LoginToken200ResponseDict', {
+    'privatetoken': str,
+    'token': str,
+})
+
+
+ModAssignGetAssignmentsResponseDict = TypedDict('ModAssignGetAssignmentsResponseDict', {
+    'courses': List['ModAssignGetAssignmentsResponseCoursesInnerDict'],
+    'warnings': NotRequired[Optional[List['ModAssignGetAssignmentsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetAssignmentsResponseCoursesInnerDict = TypedDict('ModAssignGetAssignmentsResponseCoursesInnerDict', {
+    'assignments': List['ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerDict'],
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'shortname': Optional[str],
+    'timemodified': Optional[int],
+})
+
+
+ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerDict = TypedDict('ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerDict', {
+    'activity': NotRequired[Optional[str]],
+    'activityattachments': NotRequired[Optional[List['CoreEnrolGetUsersCoursesResponseInnerOverviewfilesInnerDict']]],
+    'activityformat': NotRequired[Optional[int]],
+    'allowsubmissionsfromdate': Optional[int],
+    'attemptreopenmethod': Optional[str],
+    'blindmarking': Optional[int],
+    'cmid': Optional[int],
+    'completionsubmit': Optional[int],
+    'configs': List['ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerConfigsInnerDict'],
+    'course': Optional[int],
+    'cutoffdate': Optional[int],
+    'duedate': Optional[int],
+    'grade': Optional[int],
+    'gradepenalty': Optional[int],
+    'gradingduedate': Optional[int],
+    'hidegrader': Optional[int],
+    'id': Optional[int],
+    'intro': NotRequired[Optional[str]],
+    'introattachments': NotRequired[Optional[List['CoreEnrolGetUsersCoursesResponseInnerOverviewfilesInnerDict']]],
+    'introfiles': NotRequired[Optional[List['CoreEnrolGetUsersCoursesResponseInnerOverviewfilesInnerDict']]],
+    'introformat': NotRequired[Optional[int]],
+    'markingallocation': Optional[int],
+    'markinganonymous': Optional[int],
+    'markingworkflow': Optional[int],
+    'maxattempts': Optional[int],
+    'name': Optional[str],
+    'nosubmissions': Optional[int],
+    'preventsubmissionnotingroup': NotRequired[Optional[int]],
+    'requireallteammemberssubmit': Optional[int],
+    'requiresubmissionstatement': Optional[int],
+    'revealidentities': Optional[int],
+    'sendlatenotifications': Optional[int],
+    'sendnotifications': Optional[int],
+    'sendstudentnotifications': Optional[int],
+    'submissionattachments': NotRequired[Optional[int]],
+    'submissiondrafts': Optional[int],
+    'submissionstatement': NotRequired[Optional[str]],
+    'submissionstatementformat': NotRequired[Optional[int]],
+    'teamsubmission': Optional[int],
+    'teamsubmissiongroupingid': Optional[int],
+    'timelimit': NotRequired[Optional[int]],
+    'timemodified': Optional[int],
+})
+
+
+ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerConfigsInnerDict = TypedDict('ModAssignGetAssignmentsResponseCoursesInnerAssignmentsInnerConfigsInnerDict', {
+    'assignment': NotRequired[Optional[int]],
+    'id': NotRequired[Optional[int]],
+    'name': Optional[str],
+    'plugin': Optional[str],
+    'subtype': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModAssignGetAssignmentsResponseWarningsInnerDict = TypedDict('ModAssignGetAssignmentsResponseWarningsInnerDict', {
+    'item': NotRequired[Optional[str]],
+    'itemid': NotRequired[Optional[int]],
+    'message': Optional[str],
+    'warningcode': Optional[str],
+})
+
+
+ModAssignGetSubmissionsResponseDict = TypedDict('ModAssignGetSubmissionsResponseDict', {
+    'assignments': List['ModAssignGetSubmissionsResponseAssignmentsInnerDict'],
+    'warnings': NotRequired[Optional[List['CoreCommentGetCommentsResponseWarningsInnerDict']]],
+})
+
+
+ModAssignGetSubmissionsResponseAssignmentsInnerDict = TypedDict('ModAssignGetSubmissionsResponseAssignmentsInnerDict', {
+    'assignmentid': Optional[int],
+    'submissions': List['ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerDict'],
+})
+
+
+ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerDict = TypedDict('ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerDict', {
+    'assignment': NotRequired[Optional[int]],
+    'attemptnumber': Optional[int],
+    'gradingstatus': NotRequired[Optional[str]],
+    'groupid': Optional[int],
+    'id': Optional[int],
+    'latest': NotRequired[Optional[int]],
+    'plugins': NotRequired[Optional[List['ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerDict']]],
+    'status': Optional[str],
+    'timecreated': Optional[int],
+    'timemodified': Optional[int],
+    'timestarted': NotRequired[Optional[int]],
+    'userid': Optional[int],
+})
+
+
+ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerDict = TypedDict('ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerDict', {
+    'editorfields': NotRequired[Optional[List['ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerEditorfieldsInnerDict']]],
+    'fileareas': NotRequired[Optional[List['ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerFileareasInnerDict']]],
+    'name': Optional[str],
+    'type': Optional[str],
+})
+
+
+ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerEditorfieldsInnerDict = TypedDict('ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerEditorfieldsInnerDict', {
+    'description': Optional[str],
+    'format': Optional[int],
+    'name': Optional[str],
+    'text': Optional[str],
+})
+
+
+ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerFileareasInnerDict = TypedDict('ModAssignGetSubmissionsResponseAssignmentsInnerSubmissionsInnerPluginsInnerFileareasInnerDict', {
+    'area': Optional[str],
+    'files': NotRequired[Optional[List['CoreEnrolGetUsersCoursesResponseInnerOverviewfilesInnerDict']]],
+})
+
+
+ModAssignListParticipantsResponseInnerDict = TypedDict('ModAssignListParticipantsResponseInnerDict', {
+    'address': NotRequired[Optional[str]],
+    'city': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'customfields': NotRequired[Optional[List['ModAssignListParticipantsResponseInnerCustomfieldsInnerDict']]],
+    'department': NotRequired[Optional[str]],
+    'description': NotRequired[Optional[str]],
+    'descriptionformat': NotRequired[Optional[int]],
+    'email': NotRequired[Optional[str]],
+    'enrolledcourses': NotRequired[Optional[List['ModAssignListParticipantsResponseInnerEnrolledcoursesInnerDict']]],
+    'firstaccess': NotRequired[Optional[int]],
+    'firstname': NotRequired[Optional[str]],
+    'fullname': Optional[str],
+    'grantedextension': Optional[bool],
+    'groupid': NotRequired[Optional[int]],
+    'groupname': NotRequired[Optional[str]],
+    'groups': NotRequired[Optional[List['ModAssignListParticipantsResponseInnerGroupsInnerDict']]],
+    'id': Optional[int],
+    'idnumber': NotRequired[Optional[str]],
+    'institution': NotRequired[Optional[str]],
+    'interests': NotRequired[Optional[str]],
+    'lastaccess': NotRequired[Optional[int]],
+    'lastname': NotRequired[Optional[str]],
+    'phone1': NotRequired[Optional[str]],
+    'phone2': NotRequired[Optional[str]],
+    'preferences': NotRequired[Optional[List['ModAssignListParticipantsResponseInnerPreferencesInnerDict']]],
+    'profileimageurl': NotRequired[Optional[str]],
+    'profileimageurlsmall': NotRequired[Optional[str]],
+    'recordid': Optional[int],
+    'requiregrading': Optional[bool],
+    'roles': NotRequired[Optional[List['ModAssignListParticipantsResponseInnerRolesInnerDict']]],
+    'submissionstatus': NotRequired[Optional[str]],
+    'submitted': Optional[bool],
+    'suspended': NotRequired[Optional[bool]],
+    'trackforums': NotRequired[Optional[int]],
+    'username': NotRequired[Optional[str]],
+})
+
+
+ModAssignListParticipantsResponseInnerCustomfieldsInnerDict = TypedDict('ModAssignListParticipantsResponseInnerCustomfieldsInnerDict', {
+    'displayvalue': NotRequired[Optional[str]],
+    'name': Optional[str],
+    'shortname': Optional[str],
+    'type': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModAssignListParticipantsResponseInnerEnrolledcoursesInnerDict = TypedDict('ModAssignListParticipantsResponseInnerEnrolledcoursesInnerDict', {
+    'fullname': Optional[str],
+    'id': Optional[int],
+    'shortname': Optional[str],
+})
+
+
+ModAssignListParticipantsResponseInnerGroupsInnerDict = TypedDict('ModAssignListParticipantsResponseInnerGroupsInnerDict', {
+    'description': Optional[str],
+    'id': Optional[int],
+    'name': Optional[str],
+})
+
+
+ModAssignListParticipantsResponseInnerPreferencesInnerDict = TypedDict('ModAssignListParticipantsResponseInnerPreferencesInnerDict', {
+    'name': Optional[str],
+    'value': Optional[str],
+})
+
+
+ModAssignListParticipantsResponseInnerRolesInnerDict = TypedDict('ModAssignListParticipantsResponseInnerRolesInnerDict', {
+    'name': Optional[str],
+    'roleid': Optional[int],
+    'shortname': Optional[str],
+    'sortorder': Optional[int],
+})
+
+
+ToolMobileGetPublicConfigResponseDict = TypedDict('ToolMobileGetPublicConfigResponseDict', {
+    'agedigitalconsentverification': NotRequired[Optional[bool]],
+    'authinstructions': Optional[str],
+    'authloginviaemail': Optional[int],
+    'authnoneenabled': Optional[int],
+    'autolang': NotRequired[Optional[int]],
+    'compactlogourl': NotRequired[Optional[str]],
+    'country': NotRequired[Optional[str]],
+    'enablemobilewebservice': Optional[int],
+    'enablewebservices': Optional[int],
+    'forgottenpasswordurl': Optional[str],
+    'guestlogin': Optional[int],
+    'httpswwwroot': Optional[str],
+    'identityproviders': NotRequired[Optional[List['ToolMobileGetPublicConfigResponseIdentityprovidersInnerDict']]],
+    'lang': NotRequired[Optional[str]],
+    'langlist': NotRequired[Optional[str]],
+    'langmenu': NotRequired[Optional[int]],
+    'launchurl': NotRequired[Optional[str]],
+    'locale': NotRequired[Optional[str]],
+    'logourl': NotRequired[Optional[str]],
+    'maintenanceenabled': Optional[int],
+    'maintenancemessage': Optional[str],
+    'mobilecssurl': NotRequired[Optional[str]],
+    'registerauth': Optional[str],
+    'rememberusername': Optional[int],
+    'showloginform': Optional[int],
+    'sitename': Optional[str],
+    'supportavailability': NotRequired[Optional[int]],
+    'supportemail': NotRequired[Optional[str]],
+    'supportname': NotRequired[Optional[str]],
+    'supportpage': NotRequired[Optional[str]],
+    'tool_mobile_androidappid': NotRequired[Optional[str]],
+    'tool_mobile_disabledfeatures': NotRequired[Optional[str]],
+    'tool_mobile_iosappid': NotRequired[Optional[str]],
+    'tool_mobile_minimumversion': NotRequired[Optional[str]],
+    'tool_mobile_qrcodetype': NotRequired[Optional[int]],
+    'tool_mobile_setuplink': NotRequired[Optional[str]],
+    'typeoflogin': Optional[int],
+    'warnings': NotRequired[Optional[List['CoreCommentGetCommentsResponseWarningsInnerDict']]],
+    'wwwroot': Optional[str],
+})
+
+
+ToolMobileGetPublicConfigResponseIdentityprovidersInnerDict = TypedDict('ToolMobileGetPublicConfigResponseIdentityprovidersInnerDict', {
+    'iconurl': Optional[str],
+    'name': Optional[str],
+    'url': Optional[str],
+})
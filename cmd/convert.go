@@ -104,7 +104,7 @@ func NewConvertCommand() *cobra.Command {
 	cmd.Flags().BoolVar(&skipAddLoginTokenPath, "skip-add-login-token-path", false, "do not add path /login/token.php")
 	cmd.Flags().BoolVar(&skipFixActivityBadge, "skip-fix-activity-badge", false, "don't set core_course_get_contents::modules::activitybadge to be a list or an object rather than only an object")
 	cmd.Flags().BoolVar(&skipFixDefaults, "skip-fix-defaults", false, "don't fix default values to match types")
-	cmd.Flags().BoolVar(&skipAddTags, "skip-add-tags", false, "do not set operation::tags to method::component (tags might result in multiple client classes)")
+	cmd.Flags().BoolVar(&skipAddTags, "skip-add-tags", false, "do not set operation::tags to method::component or the core subsystem (tags result in one client class per component)")
 	cmd.Flags().BoolVar(&skipPrettier, "skip-prettier", false, "don't format result with prettier")
 	cmd.Flags().BoolVar(&parents, "parents", false, "make parent directories of path given with --outpath")
 
@@ -18,6 +18,7 @@ func NewGenerateCommand() *cobra.Command {
 		parents            bool
 		templateDir        string
 		ignoreFileOverride string
+		configFile         string
 		generatorArgs      []string
 		imageVersion       string
 		useDocker          bool
@@ -47,6 +48,12 @@ func NewGenerateCommand() *cobra.Command {
 					return err
 				}
 			}
+			if configFile != "" {
+				err := util.IsValidFile(configFile)
+				if err != nil {
+					return err
+				}
+			}
 			if parents {
 				err = util.MakeDirAllIfNotExists(outPath, true)
 				if err != nil {
@@ -59,7 +66,7 @@ func NewGenerateCommand() *cobra.Command {
 				}
 			}
 
-			generator := internal.NewGenerator(generatorName, input, outPath, templateDir, ignoreFileOverride, generatorArgs, imageVersion, useDocker)
+			generator := internal.NewGenerator(generatorName, input, outPath, templateDir, ignoreFileOverride, configFile, generatorArgs, imageVersion, useDocker)
 			err = generator.Generate()
 			if err != nil {
 				fmt.Fprintf(os.Stderr, "Error: %s", err)
@@ -73,6 +80,7 @@ func NewGenerateCommand() *cobra.Command {
 	cmd.Flags().BoolVar(&parents, "parents", false, "make parent directories of path given with --outpath")
 	cmd.Flags().StringVarP(&templateDir, "template", "t", "", "path to custom template")
 	cmd.Flags().StringVar(&ignoreFileOverride, "ignore-file-override", "", "path to .openapi-generator-ignore")
+	cmd.Flags().StringVarP(&configFile, "config", "c", "", "path to openapi-generator-cli config file")
 	cmd.Flags().StringSliceVarP(&generatorArgs, "generator-args", "a", nil, "arguments that are forwarded to openapi-generator-cli (multiple occurrences possible, format \"--arg1 --arg2\" possible)")
 	cmd.Flags().StringVarP(&imageVersion, "image-version", "i", "latest", "docker image version of openapitools/openapi-generator-cli to use if --use-docker flag is set")
 	cmd.Flags().BoolVarP(&useDocker, "use-docker", "d", false, "use openapitools/openapi-generator-cli image instead of native installation")
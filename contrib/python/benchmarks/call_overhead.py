@@ -0,0 +1,80 @@
+"""Benchmarks the client side overhead of calling an operation.
+
+Builds the request of a few operations with their `*_args` helpers, so no
+request is sent, once with the arguments validated by pydantic (the default)
+and once in trusted mode (`client_side_validation` disabled).
+
+Usage (with a generated client installed, or on PYTHONPATH):
+
+    PYTHONPATH=clients/python-async-mini python contrib/python/benchmarks/call_overhead.py [--package poodle_async_mini] [--items 500]
+"""
+
+import argparse
+import importlib
+import timeit
+
+COMMENT = "CoreCommentAddCommentsParametersCommentsInner"
+
+
+def comment_fixture(items: int):
+    """Returns `items` comments on assignment submissions."""
+    return [
+        {
+            "contextlevel": "module",
+            "instanceid": 10 + index,
+            "component": "assignsubmission_comments",
+            "content": f"<p>Comment {index}</p>",
+            "itemid": index,
+            "area": "submission_comments",
+        }
+        for index in range(items)
+    ]
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--package", default="poodle_async_mini")
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--number", type=int, default=100)
+    args = parser.parse_args()
+
+    package = importlib.import_module(args.package)
+    comment_cls = getattr(importlib.import_module(f"{args.package}.models"), COMMENT)
+    client = package.ApiClient(package.Configuration(host="https://moodle.example"))
+    api = package.DefaultApi(client)
+
+    comments = comment_fixture(args.items)
+    comment_models = [comment_cls.from_dict(comment) for comment in comments]
+    assignmentids = list(range(args.items))
+
+    cases = [
+        ("core_webservice_get_site_info", lambda: api.core_webservice_get_site_info_args()),
+        ("core_enrol_get_users_courses", lambda: api.core_enrol_get_users_courses_args(2, True)),
+        (f"mod_assign_get_submissions ({args.items} ids)", lambda: api.mod_assign_get_submissions_args(assignmentids)),
+        (f"core_comment_add_comments ({args.items} models)", lambda: api.core_comment_add_comments_args(comment_models)),
+    ]
+
+    print(f"{'operation':<48} {'validated':>12} {'trusted':>12}")
+    for label, call in cases:
+        client.client_side_validation = True
+        validated = bench(call, args.number)
+        client.client_side_validation = False
+        trusted = bench(call, args.number)
+        print(f"{label:<48} {validated * 1e6:9.1f} us {trusted * 1e6:9.1f} us {validated / trusted:6.1f} x")
+
+    # only trusted callers may pass the models as plain dicts, the validation
+    # would build the models from them
+    client.client_side_validation = True
+    validated = bench(lambda: api.core_comment_add_comments_args(comments), args.number)
+    client.client_side_validation = False
+    trusted = bench(lambda: api.core_comment_add_comments_args(comments), args.number)
+    label = f"core_comment_add_comments ({args.items} dicts)"
+    print(f"{label:<48} {validated * 1e6:9.1f} us {trusted * 1e6:9.1f} us {validated / trusted:6.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmarks decoding of oneOf models on a large core_course_get_contents response.
+
+Compares the shape based `from_dict` of the generated oneOf wrappers with the
+previous JSON round-trip (`from_json(json.dumps(obj))`), both for the
+activity badges alone and for the whole response.
+
+Usage (with a generated client installed, or on PYTHONPATH):
+
+    PYTHONPATH=clients/python-async-mini python contrib/python/benchmarks/oneof_decode.py [--package poodle_async_mini] [--modules 400]
+"""
+
+import argparse
+import importlib
+import json
+import timeit
+
+RESPONSE_TYPE = "List[CoreCourseGetContentsResponseInner]"
+BADGE = "CoreCourseGetContentsResponseInnerModulesInnerActivitybadge"
+
+
+def course_fixture(modules: int, sections: int = 20):
+    """Returns a course with `modules` modules spread over `sections` sections."""
+    badge = {
+        "badgecontent": "Due tomorrow",
+        "badgestyle": "badge-warning",
+        "badgeurl": "https://moodle.example/mod/assign/view.php?id=1",
+        "badgeelementid": "badge-1",
+        "badgeextraattributes": [{"name": "data-action", "value": "open"}],
+    }
+    course = []
+    for section in range(sections):
+        course.append({
+            "id": section,
+            "name": f"Section {section}",
+            "visible": 1,
+            "summary": "",
+            "summaryformat": 1,
+            "section": section,
+            "hiddenbynumsections": 0,
+            "uservisible": True,
+            "modules": [],
+        })
+    for module in range(modules):
+        course[module % sections]["modules"].append({
+            "id": module,
+            "url": f"https://moodle.example/mod/assign/view.php?id={module}",
+            "name": f"Assignment {module}",
+            "instance": module,
+            "contextid": 100 + module,
+            "visible": 1,
+            "uservisible": True,
+            "visibleoncoursepage": 1,
+            "modicon": "https://moodle.example/theme/image.php/boost/assign/1/monologo",
+            "modname": "assign",
+            "modplural": "Assignments",
+            "indent": 0,
+            "onclick": "",
+            "customdata": "{}",
+            "noviewlink": False,
+            "completion": 1,
+            # alternate between both oneOf schemas
+            "activitybadge": badge if module % 2 else [badge, badge],
+        })
+    return course
+
+
+def bench(label, func, number):
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{label:<40} {best * 1000:9.3f} ms")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--package", default="poodle_async_mini")
+    parser.add_argument("--modules", type=int, default=400)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    package = importlib.import_module(args.package)
+    badge_cls = getattr(importlib.import_module(f"{args.package}.models"), BADGE)
+    client = package.ApiClient()
+
+    course = course_fixture(args.modules)
+    text = json.dumps(course)
+    badges = [m["activitybadge"] for s in course for m in s["modules"]]
+
+    def roundtrip(cls, obj):
+        return cls.from_json(json.dumps(obj))
+
+    print(f"{args.modules} modules, {len(badges)} activity badges")
+    shape = bench("badges: shape dispatch", lambda: [badge_cls.from_dict(b) for b in badges], args.number)
+    legacy = bench("badges: json round-trip", lambda: [roundtrip(badge_cls, b) for b in badges], args.number)
+    print(f"{'':<40} {legacy / shape:9.1f} x")
+
+    def decode():
+        return client.deserialize(text, RESPONSE_TYPE, "application/json")
+
+    shape = bench("response: shape dispatch", decode, args.number)
+    from_dict = badge_cls.__dict__["from_dict"]
+    badge_cls.from_dict = classmethod(roundtrip)
+    try:
+        legacy = bench("response: json round-trip", decode, args.number)
+    finally:
+        badge_cls.from_dict = from_dict
+    print(f"{'':<40} {legacy / shape:9.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -108,14 +108,12 @@ SPEC=$(mktemp -p "" spec.XXXXXXXXXX.json)
 if [[ "$WHITELIST" == "" ]]; then
     "$POODLE" convert \
         -m "$MOODLE" \
-        --skip-add-tags \
         -o "$SPEC" \
         "$METHODS"
 else
     "$POODLE" convert \
         -m "$MOODLE" \
         --whitelist "$DIR/whitelist.txt" \
-        --skip-add-tags \
         -o "$SPEC" \
         "$METHODS"
 fi
@@ -124,12 +122,47 @@ if [[ "$PACKAGE_BUILD" != "0" ]]; then
     PACKAGE_VERSION="$PACKAGE_VERSION.post$PACKAGE_BUILD"
 fi
 
+# The DefaultApi facade over the per-component api classes, the TypedDicts of
+# the models and the engines kept out of api_client.py, e.g. the request
+# batcher, are supporting files; their destination is not templated, so it has
+# to name the package.
+CONFIG=$(mktemp -p "" config.XXXXXXXXXX.yaml)
+
+cat >"$CONFIG" <<EOF
+files:
+  default_api.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/api/default_api.py
+  typed_dicts.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/typed_dicts.py
+  coalescing.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/coalescing.py
+  sync.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/sync.py
+  cache.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/cache.py
+  client_manager.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/client_manager.py
+  tokens.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/tokens.py
+  instrumentation.mustache:
+    templateType: SupportingFiles
+    destinationFilename: $PACKAGE_NAME/instrumentation.py
+EOF
+
 "$POODLE" generate \
     "$GENERATOR" \
     --parents -o "$OUT" \
     -di "$OPENAPI_GENERATOR_CLI_VERSION" \
     -t "$TEMPLATE" \
     --ignore-file-override="$DIR/openapi-generator-ignore" \
+    --config "$CONFIG" \
     -a "--global-property apiTests=false" \
     -a "--global-property modelTests=false" \
     -a "--global-property apiDocs=false" \
@@ -0,0 +1,113 @@
+"""Shared setup of the tests of the generated clients.
+
+The tests run against the checked-in mini client:
+
+    python -m pytest contrib/python/tests
+"""
+
+import asyncio
+import inspect
+import json
+import pathlib
+import sys
+import threading
+
+import pytest
+from aiohttp import web
+
+CLIENT = pathlib.Path(__file__).resolve().parents[3] / "clients" / "python-async-mini"
+
+if str(CLIENT) not in sys.path:
+    sys.path.insert(0, str(CLIENT))
+
+
+class FakeMoodle:
+    """A Moodle site answering with canned responses.
+
+    Served from its own thread, so tests can run their event loops with
+    `asyncio.run`. `functions` maps a wsfunction, or the path of other
+    endpoints, to a callable taking the query and form parameters and
+    returning the JSON data or an aiohttp response, or a coroutine of
+    them. A path ending with "/" stands for all paths below it. `calls`
+    logs the wsfunctions or paths called with their parameters, and
+    `requests` the requests themselves, e.g. for their headers.
+
+    Batches of tool_mobile_call_external_functions are answered like
+    Moodle does, by calling the functions of the batch.
+    """
+
+    def __init__(self):
+        self.functions = {"tool_mobile_call_external_functions": self._batch}
+        self.calls = []
+        self.requests = []
+        self.url = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._runner = None
+
+    def _function(self, name):
+        if name in self.functions:
+            return self.functions[name]
+        prefixes = [path for path in self.functions if path.endswith("/") and name.startswith(path)]
+        return self.functions[max(prefixes, key=len)]
+
+    async def _call(self, name, params):
+        response = self._function(name)(params)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    async def _batch(self, params):
+        responses = []
+        i = 0
+        while "requests[%d][function]" % i in params:
+            function = params["requests[%d][function]" % i]
+            arguments = json.loads(params["requests[%d][arguments]" % i])
+            self.calls.append((function, arguments))
+            data = await self._call(function, arguments)
+            if isinstance(data, dict) and "exception" in data:
+                responses.append({"error": True, "exception": json.dumps(data)})
+            else:
+                responses.append({"error": False, "data": json.dumps(data)})
+            i += 1
+        return {"responses": responses}
+
+    async def _handle(self, request):
+        params = dict(request.query, **await request.post())
+        function = params.get("wsfunction", request.path)
+        self.calls.append((function, params))
+        self.requests.append(request)
+        response = await self._call(function, params)
+        if isinstance(response, web.StreamResponse):
+            return response
+        return web.json_response(response)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def start(self):
+        self._thread.start()
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        self._run(self._runner.setup())
+        self._run(web.TCPSite(self._runner, "127.0.0.1", 0).start())
+        self.url = "http://127.0.0.1:%d" % self._runner.addresses[0][1]
+
+    def stop(self):
+        self._run(self._runner.cleanup())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def called(self, function):
+        """Returns the parameters of the calls of a wsfunction or path."""
+        return [params for name, params in self.calls if name == function]
+
+
+@pytest.fixture
+def moodle():
+    server = FakeMoodle()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,120 @@
+"""Tests the caching of the userprivateaccesskey used to download files."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi
+from poodle_async_mini.exceptions import ApiException, ForbiddenException
+
+SITE_INFO = {
+    "firstname": "Ada",
+    "fullname": "Ada Lovelace",
+    "functions": [],
+    "lang": "en",
+    "lastname": "Lovelace",
+    "sitename": "Moodle",
+    "siteurl": "https://moodle.example",
+    "userid": 2,
+    "username": "ada",
+    "userpictureurl": "",
+}
+
+URL = "/webservice/pluginfile.php/1/file.txt"
+
+
+class Site:
+    """Hands out `key`, and serves files only for it."""
+
+    def __init__(self, moodle):
+        self.key = "key1"
+        moodle.functions["core_webservice_get_site_info"] = self.site_info
+        moodle.functions["/tokenpluginfile.php/"] = self.file
+        self.moodle = moodle
+
+    async def site_info(self, params):
+        await asyncio.sleep(0.05)
+        return dict(SITE_INFO, userprivateaccesskey=self.key)
+
+    def file(self, params):
+        key = self.moodle.requests[-1].path.split("/")[2]
+        if key != self.key:
+            return web.Response(status=403)
+        return web.Response(body=b"content")
+
+
+@pytest.fixture
+def site(moodle):
+    return Site(moodle)
+
+
+def get_files(moodle, count=1, token="token"):
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": token})
+        async with ApiClient(configuration) as client:
+            api = DefaultApi(client)
+            responses = await asyncio.gather(*[api.get_file(moodle.url + URL) for _ in range(count)])
+            return [await response.read() for response in responses]
+
+    return asyncio.run(main())
+
+
+def test_key_is_fetched_once(moodle, site):
+    assert get_files(moodle, 3) == [b"content"] * 3
+    assert len(moodle.called("core_webservice_get_site_info")) == 1
+    assert len(moodle.called("/tokenpluginfile.php/key1/1/file.txt")) == 3
+
+
+def test_key_is_cached_per_token(moodle, site):
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token1"})
+        async with ApiClient(configuration) as client:
+            api = DefaultApi(client)
+            await api.get_file(moodle.url + URL)
+            await api.get_file(moodle.url + URL)
+            configuration.api_key["wstoken"] = "token2"
+            await api.get_file(moodle.url + URL)
+
+    asyncio.run(main())
+    assert [params["wstoken"] for params in moodle.called("core_webservice_get_site_info")] == ["token1", "token2"]
+
+
+def test_rejected_key_is_fetched_again(moodle, site):
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            api = DefaultApi(client)
+            await api.get_file(moodle.url + URL)
+            site.key = "key2"
+            return await (await api.get_file(moodle.url + URL)).read()
+
+    assert asyncio.run(main()) == b"content"
+    assert len(moodle.called("core_webservice_get_site_info")) == 2
+    assert len(moodle.called("/tokenpluginfile.php/key1/1/file.txt")) == 2
+    assert len(moodle.called("/tokenpluginfile.php/key2/1/file.txt")) == 1
+
+
+def test_explicit_key_is_not_retried(moodle, site):
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            await DefaultApi(client).get_file(moodle.url + URL, "other")
+
+    with pytest.raises(ForbiddenException):
+        asyncio.run(main())
+    assert not moodle.called("core_webservice_get_site_info")
+
+
+def test_failed_fetch_is_not_cached(moodle, site):
+    moodle.functions["core_webservice_get_site_info"] = lambda params: {
+        "exception": "moodle_exception", "errorcode": "error", "message": "Failure"
+    }
+
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            api = DefaultApi(client)
+            with pytest.raises(ApiException, match="Failure"):
+                await api.get_file(moodle.url + URL)
+            moodle.functions["core_webservice_get_site_info"] = site.site_info
+            return await (await api.get_file(moodle.url + URL)).read()
+
+    assert asyncio.run(main()) == b"content"
@@ -0,0 +1,130 @@
+"""Tests the batching of concurrent calls into one
+tool_mobile_call_external_functions request."""
+
+import asyncio
+
+from poodle_async_mini import ApiClient, ApiException, Configuration, DefaultApi
+from poodle_async_mini.models import CoreCourseGetContentsParametersOptionsInner
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+NO_COURSE = {"exception": "dml_missing_record_exception", "errorcode": "invalidrecord", "message": "No course"}
+
+
+def course_groups(params):
+    if int(params["courseid"]) != 2:
+        return NO_COURSE
+    return [GROUP]
+
+
+def configuration(moodle, window=0.05):
+    configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+    configuration.batch_window = window
+    return configuration
+
+
+def test_concurrent_calls_share_a_request(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            return await asyncio.gather(*[api.core_group_get_course_groups(2) for _ in range(3)])
+
+    results = asyncio.run(main())
+    assert [[group.name for group in groups] for groups in results] == [["Group"]] * 3
+    assert [name for name, _ in moodle.calls].count("tool_mobile_call_external_functions") == 1
+    # the arguments of each call, unflattened
+    assert moodle.called("core_group_get_course_groups") == [{"courseid": "2"}] * 3
+
+
+def test_failing_call_raises_for_its_caller_only(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            return await asyncio.gather(
+                api.core_group_get_course_groups(2),
+                api.core_group_get_course_groups(3),
+                return_exceptions=True,
+            )
+
+    groups, error = asyncio.run(main())
+    assert groups[0].name == "Group"
+    assert isinstance(error, ApiException)
+    assert "No course" in str(error)
+    assert len(moodle.called("tool_mobile_call_external_functions")) == 1
+
+
+def test_full_batch_is_sent_at_once(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        # the window is never waited for
+        configuration_ = configuration(moodle, window=60)
+        configuration_.batch_max_size = 2
+        async with ApiClient(configuration_) as client:
+            api = DefaultApi(client)
+            return await asyncio.wait_for(
+                asyncio.gather(*[api.core_group_get_course_groups(2) for _ in range(4)]), 10
+            )
+
+    assert len(asyncio.run(main())) == 4
+    assert len(moodle.called("tool_mobile_call_external_functions")) == 2
+
+
+def test_without_batch_window(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            api = DefaultApi(client)
+            await asyncio.gather(*[api.core_group_get_course_groups(2) for _ in range(2)])
+
+    asyncio.run(main())
+    assert [name for name, _ in moodle.calls] == ["core_group_get_course_groups"] * 2
+
+
+def test_nested_arguments_are_unflattened(moodle):
+    moodle.functions["core_course_get_contents"] = lambda params: []
+    options = [
+        CoreCourseGetContentsParametersOptionsInner(name="excludemodules", value="1"),
+        CoreCourseGetContentsParametersOptionsInner(name="modname", value="forum"),
+    ]
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            await asyncio.gather(*[api.core_course_get_contents(2, options=options) for _ in range(2)])
+
+    asyncio.run(main())
+    assert moodle.called("core_course_get_contents")[0] == {
+        "courseid": "2",
+        "options": [{"name": "excludemodules", "value": "1"}, {"name": "modname", "value": "forum"}],
+    }
+
+
+def test_unread_responses_are_not_batched(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            responses = await asyncio.gather(
+                *[api.core_group_get_course_groups_without_preload_content(2) for _ in range(2)]
+            )
+            return [await response.read() for response in responses]
+
+    assert all(b'"Group"' in body for body in asyncio.run(main()))
+    assert [name for name, _ in moodle.calls] == ["core_group_get_course_groups"] * 2
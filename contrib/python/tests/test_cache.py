@@ -0,0 +1,133 @@
+"""Tests the in-memory cache of read-only responses."""
+
+import asyncio
+import time
+
+from poodle_async_mini import ApiClient, ApiException, Configuration, DefaultApi, ResponseCache
+from poodle_async_mini.rest import RESTBufferedResponse
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+NO_COURSE = {"exception": "dml_missing_record_exception", "errorcode": "invalidrecord", "message": "No course"}
+
+
+def course_groups(params):
+    if int(params["courseid"]) != 2:
+        return NO_COURSE
+    return [GROUP]
+
+
+def call(moodle, cache, *courseids, token="token"):
+    """Calls core_group_get_course_groups for each course in turn."""
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": token})
+        configuration.response_cache = cache
+        async with ApiClient(configuration) as client:
+            api = DefaultApi(client)
+            results = []
+            for courseid in courseids:
+                try:
+                    results.append(await api.core_group_get_course_groups(courseid))
+                except ApiException as e:
+                    results.append(e)
+            return results
+
+    try:
+        return asyncio.run(main())
+    finally:
+        moodle.calls.clear()
+
+
+def response(body):
+    return RESTBufferedResponse(200, "OK", {}, body)
+
+
+def test_hits_are_deserialized_again(moodle):
+    cache = ResponseCache()
+    first, second = call(moodle, cache, 2, 2)
+    assert first == second
+    assert first[0] is not second[0]
+    assert cache.stats()["hits"] == 1
+    # shared by the clients of the same token
+    call(moodle, cache, 2)
+    assert cache.stats()["hits"] == 2
+
+
+def test_keys(moodle):
+    cache = ResponseCache()
+    call(moodle, cache, 2)
+    assert cache.stats()["entries"] == 1
+    call(moodle, cache, 2, token="other")
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["hits"] == 0
+    a = cache.key("https://moodle.example/ws?wsfunction=f&wstoken=t", [("a", "1"), ("b", "2")])
+    b = cache.key("https://moodle.example/ws?wstoken=t&wsfunction=f", "b=2&a=1")
+    assert a == b
+
+
+def test_errors_are_not_cached(moodle):
+    cache = ResponseCache()
+    assert all(isinstance(result, ApiException) for result in call(moodle, cache, 3, 3))
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["misses"] == 2
+
+
+def test_mutating_functions_are_not_cached():
+    cache = ResponseCache()
+    assert cache.key("https://moodle.example/ws?wsfunction=core_comment_delete_comments", []) is None
+    assert cache.key("https://moodle.example/ws?wsfunction=mod_forum_view_forum", []) is None
+    assert cache.key("https://moodle.example/ws?wsfunction=core_course_get_contents", []) is not None
+
+
+def test_ttls():
+    cache = ResponseCache(ttl=60, ttls={"f": 0.01, "g": 0})
+    key = cache.key("https://moodle.example/ws?wsfunction=f", [])
+    cache.put(key, response(b"[]"))
+    assert cache.get(key).data == b"[]"
+    time.sleep(0.02)
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.key("https://moodle.example/ws?wsfunction=g", []) is None
+
+
+def test_least_recently_used_are_evicted():
+    cache = ResponseCache()
+    keys = [cache.key("https://moodle.example/ws?wsfunction=f", [("i", str(i))]) for i in range(3)]
+    cache.put(keys[0], response(b"[0]"))
+    cache.max_bytes = 3 * cache.size - 1
+    cache.put(keys[1], response(b"[1]"))
+    cache.get(keys[0])
+    cache.put(keys[2], response(b"[2]"))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]).data == b"[0]"
+    assert cache.get(keys[2]).data == b"[2]"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_invalidate():
+    cache = ResponseCache()
+    for url in [
+        "https://a.example/ws?wsfunction=f&wstoken=t1",
+        "https://a.example/ws?wsfunction=f&wstoken=t2",
+        "https://a.example/ws?wsfunction=g&wstoken=t1",
+        "https://b.example/ws?wsfunction=f&wstoken=t1",
+    ]:
+        cache.put(cache.key(url, []), response(b"[]"))
+    assert cache.invalidate(wsfunction="f", token="t1", host="a.example") == 1
+    assert cache.invalidate(token="t1") == 2
+    assert cache.stats()["entries"] == 1
+    cache.clear()
+    assert cache.stats()["entries"] == cache.stats()["bytes"] == 0
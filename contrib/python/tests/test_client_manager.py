@@ -0,0 +1,101 @@
+"""Tests the clients handed out per token and site by ClientManager."""
+
+import asyncio
+import datetime
+import gc
+import time
+import weakref
+
+from poodle_async_mini import ClientManager, Configuration, DefaultApi
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+def test_clients_per_token(moodle):
+    moodle.functions["core_group_get_course_groups"] = lambda params: [GROUP]
+
+    async def main():
+        async with ClientManager(Configuration(host=moodle.url)) as manager:
+            for token in ["token1", "token2", "token1"]:
+                await DefaultApi(manager.client(token)).core_group_get_course_groups(2)
+            assert manager.client("token1") is manager.client("token1")
+            assert manager.client("token1") is not manager.client("token2")
+            stats = manager.stats()
+            session = manager.configuration.connection_pool.session
+        assert session.closed
+        return stats
+
+    stats = asyncio.run(main())
+    assert [params["wstoken"] for params in moodle.called("core_group_get_course_groups")] == [
+        "token1", "token2", "token1"
+    ]
+    assert (stats["clients"], stats["hits"], stats["misses"]) == (2, 5, 2)
+    # one session and SSL context, and its idle connection
+    assert stats["pool"] == {"ssl_contexts": 1, "acquired": 0, "idle": 1}
+
+
+def test_template_is_kept():
+    configuration = Configuration(host="https://a.example", api_key={"wstoken": "template"})
+    manager = ClientManager(configuration)
+    client = manager.client("token", "https://b.example")
+    assert client.configuration.host == "https://b.example"
+    assert client.configuration.api_key["wstoken"] == "token"
+    assert manager.client("token").configuration.host == "https://a.example"
+    assert configuration.api_key == {"wstoken": "template"}
+    assert configuration.connection_pool is None
+
+
+def test_least_recently_used_are_dropped():
+    manager = ClientManager(Configuration(host="https://moodle.example"), max_clients=2)
+    first = manager.client("token1")
+    manager.client("token2")
+    manager.client("token1")
+    manager.client("token3")
+    assert manager.stats()["evictions"] == 1
+    assert manager.client("token1") is first
+    assert manager.stats()["misses"] == 3
+    manager.client("token2")
+    assert manager.stats()["misses"] == 4
+
+
+def test_idle_clients_are_dropped():
+    manager = ClientManager(Configuration(host="https://moodle.example"), idle_timeout=0.01)
+    first = manager.client("token1")
+    time.sleep(0.02)
+    assert manager.client("token1") is not first
+    assert manager.stats()["evictions"] == 1
+
+
+def test_discard():
+    manager = ClientManager(Configuration(host="https://moodle.example"))
+    first = manager.client("token")
+    manager.discard("token")
+    assert manager.client("token") is not first
+    assert manager.stats()["clients"] == 1
+
+
+def test_shared_decoders_keep_no_client():
+    manager = ClientManager(Configuration(host="https://moodle.example"))
+    client = manager.client("token1")
+    assert client.deserialize("[1]", "List[int]", "application/json") == [1]
+    assert client.deserialize('{"a": {}}', "Dict[str, object]", "application/json") == {"a": {}}
+    assert client.deserialize('["2024-01-02"]', "List[date]", "application/json") == [datetime.date(2024, 1, 2)]
+    dropped = weakref.ref(client)
+    manager.discard("token1")
+    del client
+    gc.collect()
+    assert dropped() is None
+    # the next client uses the decoders built before
+    decoders = dict(manager._decoders)
+    assert manager.client("token2").deserialize("[1]", "List[int]", "application/json") == [1]
+    assert manager._decoders == decoders
@@ -0,0 +1,71 @@
+"""Tests the lazy loading of the component apis by DefaultApi."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from poodle_async_mini import ApiClient, Configuration, CoreGroupApi, DefaultApi
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+def imported_apis(code):
+    """Runs `code` in a fresh interpreter, returning the component api
+    modules imported by then."""
+    code += """
+import sys
+print(" ".join(sorted(m for m in sys.modules if m.startswith("poodle_async_mini.api.") and m.endswith("_api"))))
+"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True
+    ).stdout.split()
+
+
+def test_components_are_imported_on_first_use():
+    assert imported_apis("import poodle_async_mini") == []
+    assert imported_apis(
+        "from poodle_async_mini import DefaultApi\n"
+        "DefaultApi()"
+    ) == ["poodle_async_mini.api.default_api"]
+    assert imported_apis(
+        "from poodle_async_mini import DefaultApi\n"
+        "DefaultApi().core_group_get_course_groups_with_http_info"
+    ) == ["poodle_async_mini.api.core_group_api", "poodle_async_mini.api.default_api"]
+
+
+def test_facade_calls_the_component(moodle):
+    moodle.functions["core_group_get_course_groups"] = lambda params: [GROUP]
+
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            api = DefaultApi(client)
+            groups = await api.core_group_get_course_groups(2)
+            component = api.api_for("core_group_get_course_groups")
+            assert isinstance(component, CoreGroupApi)
+            assert component.api_client is client
+            assert api.api_for("core_group_get_course_groups") is component
+            return groups
+
+    assert [group.name for group in asyncio.run(main())] == ["Group"]
+
+
+def test_operations_are_listed():
+    api = DefaultApi(ApiClient(Configuration(host="https://moodle.example")))
+    assert "core_course_get_contents" in dir(api)
+    assert "mod_assign_get_assignments" in dir(api)
+    with pytest.raises(AttributeError):
+        api.core_course_unknown
@@ -0,0 +1,84 @@
+"""Tests the sharing of connections by ConnectionPool."""
+
+import asyncio
+import copy
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi
+from poodle_async_mini.rest import ConnectionPool
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+def serve(moodle):
+    """Answers core_group_get_course_groups, recording the client port of
+    each request."""
+    ports = []
+
+    def course_groups(params):
+        ports.append(moodle.requests[-1].transport.get_extra_info("peername")[1])
+        return [GROUP]
+
+    moodle.functions["core_group_get_course_groups"] = course_groups
+    return ports
+
+
+def configuration(moodle, pool=None, token="token"):
+    configuration = Configuration(host=moodle.url, api_key={"wstoken": token})
+    configuration.connection_pool = pool
+    return configuration
+
+
+def test_clients_share_connections(moodle):
+    ports = serve(moodle)
+
+    async def main():
+        async with ConnectionPool() as pool:
+            for token in ["token1", "token2", "token3"]:
+                async with ApiClient(configuration(moodle, pool, token)) as client:
+                    await DefaultApi(client).core_group_get_course_groups(2)
+            # still open, after its clients were closed
+            assert not pool.session.closed
+            session = pool.session
+        assert session.closed
+
+    asyncio.run(main())
+    assert len(ports) == 3
+    assert len(set(ports)) == 1
+
+
+def test_clients_own_their_pool(moodle):
+    ports = serve(moodle)
+
+    async def main():
+        for token in ["token1", "token2"]:
+            client = ApiClient(configuration(moodle, token=token))
+            await DefaultApi(client).core_group_get_course_groups(2)
+            session = client.rest_client.pool.session
+            await client.close()
+            assert session.closed
+
+    asyncio.run(main())
+    assert len(set(ports)) == 2
+
+
+def test_copies_share_the_pool():
+    pool = ConnectionPool()
+    configuration_ = Configuration(host="https://moodle.example")
+    configuration_.connection_pool = pool
+    assert copy.deepcopy(configuration_).connection_pool is pool
+
+
+def test_ssl_context_per_settings():
+    pool = ConnectionPool()
+    assert pool.ssl_context() is pool.ssl_context()
+    assert pool.ssl_context(verify=False) is not pool.ssl_context()
@@ -0,0 +1,210 @@
+"""Tests the incremental sync of course contents by CourseSync."""
+
+import asyncio
+import copy
+
+import pytest
+
+from poodle_async_mini import CourseChange, CourseSync
+from poodle_async_mini.models import CoreCourseGetContentsResponseInner
+
+
+def module(cmid, name="Module"):
+    return {"id": cmid, "name": name, "contents": []}
+
+
+class Api:
+    """Serves the contents of one course, and the modules changed since
+    the last sync, like Moodle does."""
+
+    def __init__(self, sections):
+        self.sections = sections
+        self.updated = []
+        self.calls = []
+
+    async def core_course_get_contents(self, courseid, options=None):
+        self.calls.append(("core_course_get_contents", options))
+        sections = copy.deepcopy(self.sections)
+        if options:
+            cmid = int(options[0]["value"])
+            for section in sections:
+                section["modules"] = [m for m in section["modules"] if m["id"] == cmid]
+        return sections
+
+    async def core_course_get_updates_since(self, courseid, since):
+        self.calls.append(("core_course_get_updates_since", since))
+        updated, self.updated = self.updated, []
+        return {
+            "instances": [
+                {"contextlevel": "module", "id": cmid, "updates": [{"name": "configuration"}]}
+                for cmid in updated
+            ]
+        }
+
+
+def course():
+    return [{"id": 10, "modules": [module(1), module(2)]}, {"id": 11, "modules": [module(3)]}]
+
+
+def changes(result):
+    return sorted((change.kind, change.cmid) for change in result)
+
+
+def field(entry, name):
+    return entry[name] if isinstance(entry, dict) else getattr(entry, name)
+
+
+def test_first_sync_fetches_the_contents():
+    api = Api(course())
+    sync = CourseSync(api)
+    assert asyncio.run(sync.sync(5)) == []
+    assert sync.snapshots[5] == course()
+    assert api.calls == [("core_course_get_contents", None)]
+
+
+def test_updated_modules_are_fetched():
+    api = Api(course())
+    sync = CourseSync(api, skew=60)
+
+    async def main():
+        await sync.sync(5)
+        api.sections[0]["modules"][1]["name"] = "Renamed"
+        api.sections[1]["modules"].append(module(4))
+        api.updated = [2, 4]
+        return await sync.sync(5)
+
+    result = asyncio.run(main())
+    assert changes(result) == [(CourseChange.ADDED, 4), (CourseChange.UPDATED, 2)]
+    assert [change.areas for change in result] == [["configuration"]] * 2
+    assert sync.snapshots[5] == api.sections
+    assert [name for name, _ in api.calls] == [
+        "core_course_get_contents",
+        "core_course_get_updates_since",
+        "core_course_get_contents",
+        "core_course_get_contents",
+    ]
+
+
+def test_unchanged_course():
+    api = Api(course())
+    sync = CourseSync(api)
+
+    async def main():
+        await sync.sync(5)
+        return await sync.sync(5)
+
+    assert asyncio.run(main()) == []
+    assert len(api.calls) == 2
+
+
+def test_many_changes_fetch_the_full_contents():
+    api = Api(course())
+    sync = CourseSync(api, max_changed=1)
+
+    async def main():
+        await sync.sync(5)
+        del api.sections[0]["modules"][0]
+        api.sections[1]["modules"][0]["name"] = "Renamed"
+        api.updated = [2, 3]
+        return await sync.sync(5)
+
+    assert changes(asyncio.run(main())) == [(CourseChange.REMOVED, 1), (CourseChange.UPDATED, 3)]
+    assert api.calls[-1] == ("core_course_get_contents", None)
+
+
+def test_module_moved_to_a_new_section():
+    api = Api(course())
+    sync = CourseSync(api)
+
+    async def main():
+        await sync.sync(5)
+        api.sections.append({"id": 12, "modules": [api.sections[1]["modules"].pop()]})
+        api.sections[2]["modules"][0]["name"] = "Moved"
+        api.updated = [3]
+        return await sync.sync(5)
+
+    assert changes(asyncio.run(main())) == [(CourseChange.UPDATED, 3)]
+    assert sync.snapshots[5] == api.sections
+    assert api.calls[-1] == ("core_course_get_contents", None)
+
+
+def test_full_sync_interval():
+    api = Api(course())
+    sync = CourseSync(api, full_sync_interval=0)
+
+    async def main():
+        await sync.sync(5)
+        del api.sections[1]["modules"][0]
+        return await sync.sync(5)
+
+    assert changes(asyncio.run(main())) == [(CourseChange.REMOVED, 3)]
+    assert [name for name, _ in api.calls] == ["core_course_get_contents"] * 2
+
+
+def test_watch():
+    api = Api(course())
+    sync = CourseSync(api)
+
+    async def main():
+        await sync.sync(5)
+        api.updated = [2]
+        api.sections[0]["modules"][1]["name"] = "Renamed"
+        stream = sync.watch([5], interval=0.01)
+        received = []
+        async for change in stream:
+            received.append((change.kind, change.courseid, change.cmid, change.module["name"]))
+            if len(received) == 2:
+                break
+            api.updated = [1]
+            api.sections[0]["modules"][0]["name"] = "Renamed"
+        await stream.aclose()
+        return received
+
+    assert asyncio.run(asyncio.wait_for(main(), 10)) == [
+        (CourseChange.UPDATED, 5, 2, "Renamed"),
+        (CourseChange.UPDATED, 5, 1, "Renamed"),
+    ]
+
+
+class ModelApi(Api):
+    """Serves the contents as models."""
+
+    async def core_course_get_contents(self, courseid, options=None):
+        sections = await super().core_course_get_contents(courseid, options)
+        return [
+            CoreCourseGetContentsResponseInner.from_dict(dict(
+                section,
+                name="Section",
+                summary="",
+                summaryformat=1,
+                modules=[
+                    dict(module, indent=0, modicon="", modname="resource", modplural="Files")
+                    for module in section["modules"]
+                ],
+            ))
+            for section in sections
+        ]
+
+
+@pytest.mark.parametrize("api_class", [Api, ModelApi])
+def test_snapshots_are_replaced(api_class):
+    api = api_class(course())
+    sync = CourseSync(api)
+
+    async def main():
+        await sync.sync(5)
+        snapshot = sync.snapshots[5]
+        handed_out = copy.deepcopy(snapshot)
+        del api.sections[0]["modules"][0]
+        api.sections[0]["modules"][0]["name"] = "Renamed"
+        api.sections[1]["modules"].append(module(4))
+        api.updated = [1, 2, 4]
+        result = await sync.sync(5)
+        assert snapshot == handed_out
+        return result
+
+    result = asyncio.run(main())
+    assert changes(result) == [(CourseChange.ADDED, 4), (CourseChange.REMOVED, 1), (CourseChange.UPDATED, 2)]
+    snapshot = sync.snapshots[5]
+    assert [[field(module, "id") for module in field(section, "modules")] for section in snapshot] == [[2], [3, 4]]
+    assert field(field(snapshot[0], "modules")[0], "name") == "Renamed"
@@ -0,0 +1,66 @@
+"""Tests the decoding of responses by the plans cached per response type."""
+
+import json
+
+import pytest
+
+from poodle_async_mini import ApiClient, ApiException, Configuration
+from poodle_async_mini.models import CoreGroupGetCourseGroupsResponseInner
+from poodle_async_mini.rest import RESTBufferedResponse
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+@pytest.fixture
+def client():
+    return ApiClient(Configuration(host="https://moodle.example"))
+
+
+def deserialize(client, response_type, data):
+    response = RESTBufferedResponse(200, "OK", {"Content-Type": "application/json"}, json.dumps(data).encode())
+    return client.response_deserialize(response, {"200": response_type}).data
+
+
+@pytest.mark.parametrize(
+    "response_type, data, expected",
+    [
+        ("List[CoreGroupGetCourseGroupsResponseInner]", [GROUP], [CoreGroupGetCourseGroupsResponseInner.from_dict(GROUP)]),
+        ("Dict[str, CoreGroupGetCourseGroupsResponseInner]", {"a": GROUP}, {"a": CoreGroupGetCourseGroupsResponseInner.from_dict(GROUP)}),
+        ("List[List[int]]", [[1, 2], [], None], [[1, 2], [], None]),
+        ("Dict[str, List[str]]", {"a": ["b"], "c": None}, {"a": ["b"], "c": None}),
+        ("List[int]", [1, None], [1, None]),
+        ("bool", True, True),
+        ("str", "text", "text"),
+        ("object", {"any": [1]}, {"any": [1]}),
+    ],
+)
+def test_types(client, response_type, data, expected):
+    assert deserialize(client, response_type, data) == expected
+    # and again, by the cached plan
+    assert deserialize(client, response_type, data) == expected
+
+
+def test_plans_are_cached_per_type(client):
+    text = json.dumps([GROUP])
+    client.deserialize(text, "List[CoreGroupGetCourseGroupsResponseInner]", "application/json")
+    plan = client._decoders["List[CoreGroupGetCourseGroupsResponseInner]"]
+    assert "CoreGroupGetCourseGroupsResponseInner" in client._decoders
+    client.deserialize(text, "List[CoreGroupGetCourseGroupsResponseInner]", "application/json")
+    assert client._decoders["List[CoreGroupGetCourseGroupsResponseInner]"] is plan
+
+
+def test_moodle_errors_raise(client):
+    error = {"exception": "moodle_exception", "errorcode": "nopermissions", "message": "No permission"}
+    with pytest.raises(ApiException) as raised:
+        deserialize(client, "List[CoreGroupGetCourseGroupsResponseInner]", error)
+    assert "No permission" in str(raised.value)
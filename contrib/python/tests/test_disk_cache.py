@@ -0,0 +1,111 @@
+"""Tests the sqlite backed response cache."""
+
+import asyncio
+import sqlite3
+import time
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi, DiskResponseCache
+from poodle_async_mini.rest import RESTBufferedResponse
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+def response(body):
+    return RESTBufferedResponse(200, "OK", {}, body)
+
+
+def key(cache, wsfunction="f", token="secret", host="moodle.example", i=0):
+    return cache.key("https://%s/ws?wsfunction=%s&wstoken=%s" % (host, wsfunction, token), [("i", str(i))])
+
+
+def test_shared_by_instances(moodle, tmp_path):
+    moodle.functions["core_group_get_course_groups"] = lambda params: [GROUP]
+
+    async def main(cache):
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+        configuration.response_cache = cache
+        async with ApiClient(configuration) as client:
+            return await DefaultApi(client).core_group_get_course_groups(2)
+
+    first = asyncio.run(main(DiskResponseCache(tmp_path / "cache.db")))
+    # e.g. another process, or after a restart
+    cache = DiskResponseCache(tmp_path / "cache.db")
+    assert asyncio.run(main(cache)) == first
+    assert len(moodle.calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_tokens_are_hashed(tmp_path):
+    cache = DiskResponseCache(tmp_path / "cache.db")
+    cache.put(key(cache), response(b"[]"))
+    cache.close()
+    rows = sqlite3.connect(tmp_path / "cache.db").execute("SELECT * FROM responses").fetchall()
+    assert len(rows) == 1
+    assert not any(isinstance(value, str) and "secret" in value for value in rows[0])
+    assert b"secret" not in (tmp_path / "cache.db").read_bytes()
+
+
+def test_expiry(tmp_path):
+    cache = DiskResponseCache(tmp_path / "cache.db", ttls={"f": 0.01})
+    cache.put(key(cache), response(b"[]"))
+    assert cache.get(key(cache)).data == b"[]"
+    time.sleep(0.02)
+    assert cache.get(key(cache)) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    cache = DiskResponseCache(tmp_path / "cache.db")
+    cache.put(key(cache, i=0), response(b"[0]"))
+    cache.max_bytes = 2 * cache.stats()["bytes"]
+    time.sleep(1.1)
+    cache.put(key(cache, i=1), response(b"[1]"))
+    cache.get(key(cache, i=0))
+    cache.put(key(cache, i=2), response(b"[2]"))
+    assert cache.get(key(cache, i=1)) is None
+    assert cache.get(key(cache, i=0)).data == b"[0]"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate(tmp_path):
+    cache = DiskResponseCache(tmp_path / "cache.db")
+    cache.put(key(cache, "f", "t1", "a.example"), response(b"[]"))
+    cache.put(key(cache, "f", "t2", "a.example"), response(b"[]"))
+    cache.put(key(cache, "g", "t1", "a.example"), response(b"[]"))
+    cache.put(key(cache, "f", "t1", "b.example"), response(b"[]"))
+    assert cache.invalidate(wsfunction="f", token="t1", host="a.example") == 1
+    assert cache.invalidate(token="t1") == 2
+    assert cache.stats()["entries"] == 1
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
+def test_locked_database_is_a_miss(tmp_path):
+    cache = DiskResponseCache(tmp_path / "cache.db")
+    cache.put(key(cache, i=0), response(b"[0]"))
+    # e.g. another process writing
+    writer = sqlite3.connect(tmp_path / "cache.db", isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        cache.put(key(cache, i=1), response(b"[1]"))
+        assert cache.get(key(cache, i=1)) is None
+        # readers are not blocked by the writer
+        assert cache.get(key(cache, i=0)).data == b"[0]"
+        assert time.monotonic() - started < 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    cache.put(key(cache, i=1), response(b"[1]"))
+    assert cache.get(key(cache, i=1)).data == b"[1]"
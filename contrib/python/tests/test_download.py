@@ -0,0 +1,142 @@
+"""Tests the streamed file downloads and their Range resume."""
+
+import asyncio
+import os
+import re
+
+import pytest
+from aiohttp import web
+
+from poodle_async_mini import ApiClient, ApiException, Configuration, DefaultApi
+
+CONTENT = bytes(range(256)) * 64
+TIMEMODIFIED = 1700000000
+
+
+class File:
+    """Serves `content`, honouring Range requests if `ranges`."""
+
+    def __init__(self, content=CONTENT, ranges=True):
+        self.content = content
+        self.ranges = ranges
+
+    async def respond(self, request):
+        m = re.match(r"bytes=(\d+)-", request.headers.get("Range", ""))
+        if not self.ranges or m is None:
+            return web.Response(body=self.content)
+        start = int(m.group(1))
+        total = len(self.content)
+        if start >= total:
+            return web.Response(status=416, headers={"Content-Range": "bytes */%d" % total})
+        return web.Response(
+            status=206,
+            body=self.content[start:],
+            headers={"Content-Range": "bytes %d-%d/%d" % (start, total - 1, total)},
+        )
+
+
+@pytest.fixture
+def file(moodle):
+    served = File()
+
+    async def handler(params):
+        return await served.respond(moodle.requests[-1])
+
+    moodle.functions["/pluginfile.php/"] = handler
+    moodle.functions["/tokenpluginfile.php/"] = handler
+    return served
+
+
+def download(moodle, path, **kwargs):
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url)) as client:
+            return await client.download_file(moodle.url + "/pluginfile.php/1/file.bin", str(path), **kwargs)
+
+    return asyncio.run(main())
+
+
+def ranges(moodle):
+    return [request.headers.get("Range") for request in moodle.requests]
+
+
+def test_download(moodle, file, tmp_path):
+    path = tmp_path / "file.bin"
+    download(moodle, path, filesize=len(CONTENT), timemodified=TIMEMODIFIED, chunk_size=1000)
+    assert path.read_bytes() == CONTENT
+    assert int(os.stat(path).st_mtime) == TIMEMODIFIED
+    assert not (tmp_path / "file.bin.part").exists()
+    assert ranges(moodle) == [None]
+
+
+def test_current_file_is_skipped(moodle, file, tmp_path):
+    path = tmp_path / "file.bin"
+    download(moodle, path, filesize=len(CONTENT), timemodified=TIMEMODIFIED)
+    download(moodle, path, filesize=len(CONTENT), timemodified=TIMEMODIFIED)
+    assert len(moodle.requests) == 1
+
+
+def test_part_is_resumed(moodle, file, tmp_path):
+    path = tmp_path / "file.bin"
+    part = tmp_path / "file.bin.part"
+    part.write_bytes(CONTENT[:1000])
+    os.utime(part, (TIMEMODIFIED, TIMEMODIFIED))
+    download(moodle, path, filesize=len(CONTENT), timemodified=TIMEMODIFIED)
+    assert path.read_bytes() == CONTENT
+    assert ranges(moodle) == ["bytes=1000-"]
+
+
+def test_stale_part_is_discarded(moodle, file, tmp_path):
+    path = tmp_path / "file.bin"
+    part = tmp_path / "file.bin.part"
+    part.write_bytes(b"x" * 1000)
+    os.utime(part, (TIMEMODIFIED - 1, TIMEMODIFIED - 1))
+    download(moodle, path, filesize=len(CONTENT), timemodified=TIMEMODIFIED)
+    assert path.read_bytes() == CONTENT
+    assert ranges(moodle) == [None]
+
+
+def test_ignored_range_restarts(moodle, file, tmp_path):
+    file.ranges = False
+    path = tmp_path / "file.bin"
+    (tmp_path / "file.bin.part").write_bytes(CONTENT[:1000])
+    download(moodle, path)
+    assert path.read_bytes() == CONTENT
+    assert ranges(moodle) == ["bytes=1000-"]
+
+
+def test_complete_part_of_unknown_size(moodle, file, tmp_path):
+    path = tmp_path / "file.bin"
+    (tmp_path / "file.bin.part").write_bytes(CONTENT)
+    download(moodle, path)
+    assert path.read_bytes() == CONTENT
+    # answered with 416, as the part is complete
+    assert ranges(moodle) == ["bytes=%d-" % len(CONTENT)]
+
+
+def test_overlong_part_of_unknown_size(moodle, file, tmp_path):
+    path = tmp_path / "file.bin"
+    (tmp_path / "file.bin.part").write_bytes(CONTENT + b"x")
+    download(moodle, path)
+    assert path.read_bytes() == CONTENT
+    assert ranges(moodle) == ["bytes=%d-" % (len(CONTENT) + 1), None]
+
+
+def test_size_mismatch(moodle, file, tmp_path):
+    path = tmp_path / "file.bin"
+    with pytest.raises(ApiException, match="expected"):
+        download(moodle, path, filesize=len(CONTENT) + 1)
+    assert not path.exists()
+    assert not (tmp_path / "file.bin.part").exists()
+
+
+def test_file_stream_from_offset(moodle, file):
+    async def main(offset):
+        async with ApiClient(Configuration(host=moodle.url)) as client:
+            api = DefaultApi(client)
+            url = moodle.url + "/webservice/pluginfile.php/1/file.bin"
+            return b"".join([chunk async for chunk in api.get_file_stream(url, "key", offset, chunk_size=1000)])
+
+    assert asyncio.run(main(1000)) == CONTENT[1000:]
+    file.ranges = False
+    assert asyncio.run(main(1000)) == CONTENT[1000:]
+    assert len(moodle.called("/tokenpluginfile.php/key/1/file.bin")) == 2
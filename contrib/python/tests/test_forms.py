@@ -0,0 +1,67 @@
+"""Tests the encoding of arguments as PHP style form fields."""
+
+import asyncio
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi
+from poodle_async_mini.models import (
+    CoreCommentAddCommentsParametersCommentsInner,
+    CoreCourseGetContentsParametersOptionsInner,
+)
+
+
+def comment(i, content="Hello"):
+    return CoreCommentAddCommentsParametersCommentsInner(
+        component="mod_forum",
+        content=content,
+        contextlevel="module",
+        instanceid=7,
+        itemid=i,
+    )
+
+
+def sent_form(moodle, operation, *args, **kwargs):
+    moodle.functions[operation] = lambda params: []
+
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            await getattr(DefaultApi(client), operation)(*args, **kwargs)
+
+    asyncio.run(main())
+    (params,) = moodle.called(operation)
+    return {key: value for key, value in params.items() if key not in ("wstoken", "wsfunction", "moodlewsrestformat")}
+
+
+def test_nested_models(moodle):
+    form = sent_form(moodle, "core_comment_add_comments", [comment(1), comment(2, "World")])
+    assert form == {
+        "comments[0][area]": "",
+        "comments[0][component]": "mod_forum",
+        "comments[0][content]": "Hello",
+        "comments[0][contextlevel]": "module",
+        "comments[0][instanceid]": "7",
+        "comments[0][itemid]": "1",
+        "comments[1][area]": "",
+        "comments[1][component]": "mod_forum",
+        "comments[1][content]": "World",
+        "comments[1][contextlevel]": "module",
+        "comments[1][instanceid]": "7",
+        "comments[1][itemid]": "2",
+    }
+
+
+def test_fields_keep_their_order(moodle):
+    options = [CoreCourseGetContentsParametersOptionsInner(name="modname", value="forum")]
+    form = sent_form(moodle, "core_course_get_contents", 2, options=options)
+    assert list(form) == ["courseid", "options[0][name]", "options[0][value]"]
+
+
+def test_none_is_left_out(moodle):
+    form = sent_form(moodle, "core_comment_add_comments", [comment(1).model_copy(update={"itemid": None})])
+    assert "comments[0][itemid]" not in form
+
+
+def test_many_items(moodle):
+    # PHP parses up to max_input_vars fields, 1000 by default
+    form = sent_form(moodle, "core_comment_add_comments", [comment(i) for i in range(150)])
+    assert len(form) == 6 * 150
+    assert form["comments[149][itemid]"] == "149"
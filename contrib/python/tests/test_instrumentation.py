@@ -0,0 +1,107 @@
+"""Tests the instrumentation of calls and its exporters."""
+
+import asyncio
+import re
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi, Instrumentation, PrometheusExporter
+from poodle_async_mini.rest import CALL_TIMING, CallTiming
+
+SAMPLE = re.compile(r'^(\w+)\{((?:\w+="(?:[^"\\]|\\.)*",?)*)\} \S+$')
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def unescape(value):
+    return re.sub(r'\\(.)', lambda m: '\n' if m.group(1) == 'n' else m.group(1), value)
+
+
+def record(exporter, wsfunction, error=None):
+    timing = CallTiming(wsfunction, "moodle.example", exporter)
+    timing.ttfb = 0.02
+    timing.response_bytes = 100
+    timing.finish(200, error)
+
+
+def test_prometheus_series_are_unique():
+    exporter = PrometheusExporter()
+    for wsfunction in ("core_webservice_get_site_info", "mod_assign_get_assignments"):
+        record(exporter, wsfunction)
+        record(exporter, wsfunction, TimeoutError())
+    series = []
+    for line in exporter.render().splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        series.append((match.group(1), frozenset(LABEL.findall(match.group(2)))))
+    assert len(series) == len(set(series))
+    assert ("moodle_ws_phase_seconds_count", frozenset({("wsfunction", "mod_assign_get_assignments"), ("phase", "ttfb")})) in series
+
+
+def test_prometheus_label_values_are_escaped():
+    wsfunction = 'local_"quoted"\\path\nname'
+    exporter = PrometheusExporter()
+    record(exporter, wsfunction)
+    lines = [line for line in exporter.render().splitlines() if not line.startswith("#")]
+    for line in lines:
+        match = SAMPLE.match(line)
+        assert match, line
+        assert unescape(dict(LABEL.findall(match.group(2)))["wsfunction"]) == wsfunction
+
+
+SITE_INFO = {
+    "sitename": "Moodle",
+    "username": "student",
+    "firstname": "Student",
+    "lastname": "One",
+    "fullname": "Student One",
+    "lang": "en",
+    "userid": 2,
+    "siteurl": "https://moodle.example",
+    "userpictureurl": "",
+    "functions": [],
+}
+
+
+def test_calls_do_not_leak_their_timing(moodle):
+    moodle.functions["core_webservice_get_site_info"] = lambda params: SITE_INFO
+    timings = []
+
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+        configuration.instrumentation = Instrumentation(timings.append)
+        async with ApiClient(configuration) as client:
+            api = DefaultApi(client)
+            await api.core_webservice_get_site_info()
+            assert CALL_TIMING.get() is None
+            response = await api.core_webservice_get_site_info_without_preload_content()
+            await response.read()
+            assert CALL_TIMING.get() is None
+        # a client without instrumentation in the same task records nothing
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            await DefaultApi(client).core_webservice_get_site_info()
+
+    asyncio.run(main())
+    assert [timing.outcome for timing in timings] == ["ok", "ok"]
+
+
+def test_unread_responses_finish_their_timing(moodle):
+    moodle.functions["core_webservice_get_site_info"] = lambda params: SITE_INFO
+    timings = []
+
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+        configuration.instrumentation = Instrumentation(timings.append)
+        async with ApiClient(configuration) as client:
+            api = DefaultApi(client)
+            response = await api.core_webservice_get_site_info_without_preload_content()
+            assert len(timings) == 1
+            await response.read()
+            args = api.core_webservice_get_site_info_args()
+            response = await client.call_api_from_args(args, _preload_content=False)
+            assert len(timings) == 1
+            return b"".join([chunk async for chunk in response.iter_chunked(16)])
+
+    body = asyncio.run(main())
+    assert [timing.outcome for timing in timings] == ["ok", "ok"]
+    assert timings[0].body_read is None
+    assert timings[1].response_bytes == len(body)
@@ -0,0 +1,81 @@
+"""Tests the pluggable JSON codecs."""
+
+import asyncio
+
+import pytest
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi
+from poodle_async_mini.configuration import JSON_CODECS, JsonCodec, json_codec
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Gruppe ä",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+@pytest.fixture(params=sorted(JSON_CODECS))
+def codec(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return json_codec(request.param)
+
+
+class RecordingCodec(JsonCodec):
+    def __init__(self):
+        self.loaded = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+def test_round_trip(codec):
+    data = {"a": [1, 2.5, None, True], "b": "ä"}
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumpb(data)) == data
+    assert codec.loads(codec.dumpb(data).decode("utf-8")) == data
+
+
+def test_invalid_json(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"{")
+
+
+def test_auto_picks_an_installed_codec():
+    assert json_codec("auto").name in JSON_CODECS
+
+
+def test_responses_are_decoded_from_bytes(moodle):
+    moodle.functions["core_group_get_course_groups"] = lambda params: [GROUP]
+    recording = RecordingCodec()
+
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+        configuration.json_codec = recording
+        async with ApiClient(configuration) as client:
+            return await DefaultApi(client).core_group_get_course_groups(2, _raw=True)
+
+    assert asyncio.run(main()) == [GROUP]
+    assert [type(data) for data in recording.loaded] == [bytes]
+
+
+def test_batches_use_the_codec(moodle, codec):
+    moodle.functions["core_group_get_course_groups"] = lambda params: [GROUP]
+
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+        configuration.json_codec = codec
+        configuration.batch_window = 0.05
+        async with ApiClient(configuration) as client:
+            api = DefaultApi(client)
+            return await asyncio.gather(*[api.core_group_get_course_groups(2) for _ in range(2)])
+
+    assert [[group.name for group in groups] for groups in asyncio.run(main())] == [["Gruppe ä"]] * 2
+    assert moodle.called("core_group_get_course_groups") == [{"courseid": "2"}] * 2
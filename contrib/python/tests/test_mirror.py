@@ -0,0 +1,173 @@
+"""Tests the mirroring of course files by FileMirror."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi, FileMirror
+
+SITE_INFO = {
+    "firstname": "Ada",
+    "fullname": "Ada Lovelace",
+    "functions": [],
+    "lang": "en",
+    "lastname": "Lovelace",
+    "sitename": "Moodle",
+    "siteurl": "https://moodle.example",
+    "userid": 2,
+    "username": "ada",
+    "userpictureurl": "",
+    "userprivateaccesskey": "key",
+}
+
+
+class Files:
+    """Serves the files below /tokenpluginfile.php/key/, recording the
+    highest number of concurrent requests."""
+
+    def __init__(self, moodle):
+        self.contents = {}
+        self.active = 0
+        self.concurrent = 0
+        self.moodle = moodle
+        moodle.functions["core_webservice_get_site_info"] = lambda params: SITE_INFO
+        moodle.functions["/tokenpluginfile.php/key/"] = self.file
+
+    def entry(self, name, content, timemodified=1700000000, **fields):
+        self.contents["/tokenpluginfile.php/key/" + name] = content
+        return dict(
+            type="file",
+            fileurl=self.moodle.url + "/webservice/pluginfile.php/" + name,
+            filename=name.rsplit("/", 1)[-1],
+            filepath="/",
+            filesize=len(content),
+            timemodified=timemodified,
+            **fields,
+        )
+
+    async def file(self, params):
+        content = self.contents.get(self.moodle.requests[-1].path)
+        self.active += 1
+        self.concurrent = max(self.concurrent, self.active)
+        try:
+            await asyncio.sleep(0.02)
+            if content is None:
+                return web.Response(status=404)
+            return web.Response(body=content)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def files(moodle):
+    return Files(moodle)
+
+
+def mirror(moodle, directory, entries, **kwargs):
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            return await FileMirror(DefaultApi(client), str(directory), **kwargs).mirror(entries)
+
+    return asyncio.run(main())
+
+
+def downloads(moodle):
+    return [name for name, _ in moodle.calls if name.startswith("/tokenpluginfile.php/")]
+
+
+def test_mirror(moodle, files, tmp_path):
+    entries = [files.entry("1/a.txt", b"a"), files.entry("2/b.txt", b"bb")]
+    progress = []
+    report = mirror(moodle, tmp_path, entries, on_progress=lambda report: progress.append(report.done))
+    assert (report.total, report.downloaded, report.skipped, report.failed, report.bytes) == (2, 2, 0, [], 3)
+    assert (tmp_path / "a.txt").read_bytes() == b"a"
+    assert (tmp_path / "b.txt").read_bytes() == b"bb"
+    assert sorted(progress) == [1, 2]
+    assert json.loads((tmp_path / ".manifest.json").read_text()) == {
+        "a.txt": {"filesize": 1, "timemodified": 1700000000},
+        "b.txt": {"filesize": 2, "timemodified": 1700000000},
+    }
+
+
+def test_unchanged_files_are_skipped(moodle, files, tmp_path):
+    entries = [files.entry("1/a.txt", b"a"), files.entry("2/b.txt", b"bb")]
+    mirror(moodle, tmp_path, entries)
+    entries[1] = files.entry("2/b.txt", b"bbb", timemodified=1700000001)
+    report = mirror(moodle, tmp_path, entries)
+    assert (report.downloaded, report.skipped) == (1, 1)
+    assert sorted(downloads(moodle)) == [
+        "/tokenpluginfile.php/key/1/a.txt",
+        "/tokenpluginfile.php/key/2/b.txt",
+        "/tokenpluginfile.php/key/2/b.txt",
+    ]
+    assert (tmp_path / "b.txt").read_bytes() == b"bbb"
+
+
+def test_failures_are_collected(moodle, files, tmp_path):
+    entries = [files.entry("1/a.txt", b"a"), files.entry("2/b.txt", b"b")]
+    del files.contents["/tokenpluginfile.php/key/1/a.txt"]
+    report = mirror(moodle, tmp_path, entries)
+    assert report.downloaded == 1
+    assert [name for name, _ in report.failed] == ["a.txt"]
+    assert json.loads((tmp_path / ".manifest.json").read_text()) == {
+        "b.txt": {"filesize": 1, "timemodified": 1700000000}
+    }
+
+
+def test_concurrency_per_host(moodle, files, tmp_path):
+    entries = [files.entry("%d/f.txt" % i, b"f") for i in range(10)]
+    course = [{"modules": [{"id": i, "contents": [entry]}]} for i, entry in enumerate(entries)]
+    report = mirror(moodle, tmp_path, FileMirror.course_files(course), workers=8, per_host=3)
+    assert report.downloaded == 10
+    assert files.concurrent == 3
+    assert (tmp_path / "9" / "f.txt").read_bytes() == b"f"
+
+
+def test_only_files_are_mirrored(moodle, files, tmp_path):
+    entries = [
+        files.entry("1/a.txt", b"a"),
+        dict(files.entry("1/b", b""), type="url"),
+        dict(files.entry("1/c.txt", b"c"), fileurl=None),
+    ]
+    report = mirror(moodle, tmp_path, entries)
+    assert (report.total, report.downloaded) == (1, 1)
+
+
+def test_paths_stay_in_the_directory(moodle, files, tmp_path):
+    entry = dict(files.entry("1/a.txt", b"a"), filepath="/../../")
+    mirror(moodle, tmp_path / "mirror", [("..", entry)])
+    assert (tmp_path / "mirror" / "a.txt").read_bytes() == b"a"
+
+
+def test_manifest_is_saved_while_mirroring(moodle, files, tmp_path):
+    entries = [files.entry("%d/f%d.txt" % (i, i), b"f") for i in range(5)]
+    manifest = tmp_path / ".manifest.json"
+    saved = []
+    report = mirror(
+        moodle,
+        tmp_path,
+        entries,
+        workers=1,
+        save_every=2,
+        on_progress=lambda report: saved.append(len(json.loads(manifest.read_text())) if manifest.exists() else 0),
+    )
+    assert report.downloaded == 5
+    assert saved == [0, 2, 2, 4, 4]
+    assert len(json.loads(manifest.read_text())) == 5
+
+
+def test_manifest_is_saved_when_interrupted(moodle, files, tmp_path):
+    entries = [files.entry("%d/f%d.txt" % (i, i), b"f") for i in range(5)]
+
+    def interrupt(report):
+        if report.done == 2:
+            raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        mirror(moodle, tmp_path, entries, workers=1, on_progress=interrupt)
+    assert sorted(json.loads((tmp_path / ".manifest.json").read_text())) == ["f0.txt", "f1.txt"]
+    # the next run downloads the rest only
+    report = mirror(moodle, tmp_path, entries)
+    assert (report.downloaded, report.skipped) == (3, 2)
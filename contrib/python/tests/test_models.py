@@ -0,0 +1,110 @@
+"""Tests the decoding of responses into models.
+
+Moodle leaves out optional fields of its responses, e.g. `idnumber` of
+courses without one. `from_dict` sets them to null. Responses are validated
+straight from the JSON bytes first, which rejects missing fields, and have
+to decode the same nonetheless.
+"""
+
+import json
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from poodle_async_mini import ApiClient, Configuration
+from poodle_async_mini.models import (
+    CoreCourseGetContentsResponseInner,
+    CoreEnrolGetUsersCoursesResponseInner,
+    ModAssignListParticipantsResponseInner,
+)
+from poodle_async_mini.rest import RESTBufferedResponse
+
+# no idnumber, visible, showactivitydates, showcompletionconditions
+COURSES = [{"id": 2, "fullname": "Course", "shortname": "C"}]
+
+# no author, license, sortorder, timecreated, userid of the content and no
+# purpose of the module
+CONTENTS = [
+    {
+        "id": 1,
+        "name": "General",
+        "summary": "",
+        "summaryformat": 1,
+        "modules": [
+            {
+                "id": 7,
+                "name": "Slides",
+                "modname": "resource",
+                "modplural": "Files",
+                "modicon": "https://moodle.example/theme/image.php/icon",
+                "indent": 0,
+                "contents": [
+                    {
+                        "type": "file",
+                        "filename": "slides.pdf",
+                        "filepath": "/",
+                        "filesize": 1024,
+                        "timemodified": 1700000000,
+                    }
+                ],
+            }
+        ],
+    }
+]
+
+# no recordid
+PARTICIPANTS = [
+    {"id": 3, "fullname": "Student", "grantedextension": False, "requiregrading": False, "submitted": True}
+]
+
+CASES = [
+    ("List[CoreEnrolGetUsersCoursesResponseInner]", CoreEnrolGetUsersCoursesResponseInner, COURSES),
+    ("List[CoreCourseGetContentsResponseInner]", CoreCourseGetContentsResponseInner, CONTENTS),
+    ("List[ModAssignListParticipantsResponseInner]", ModAssignListParticipantsResponseInner, PARTICIPANTS),
+]
+
+
+def deserialize(response_type, data, client=None):
+    client = client or ApiClient(Configuration(host="https://moodle.example"))
+    response = RESTBufferedResponse(200, "OK", {"Content-Type": "application/json"}, json.dumps(data).encode())
+    return client.response_deserialize(response, {"200": response_type}).data
+
+
+@pytest.mark.parametrize("response_type, model, data", CASES, ids=[case[0] for case in CASES])
+def test_missing_optional_fields_decode_as_from_dict(response_type, model, data):
+    assert deserialize(response_type, data) == [model.from_dict(item) for item in data]
+
+
+def test_missing_fields_are_null():
+    course = deserialize(CASES[0][0], COURSES)[0]
+    assert course.idnumber is None
+    assert course.visible is None
+    content = deserialize(CASES[1][0], CONTENTS)[0].modules[0]
+    assert content.purpose is None
+    assert content.contents[0].author is None
+    assert deserialize(CASES[2][0], PARTICIPANTS)[0].recordid is None
+
+
+def test_required_fields_are_still_required():
+    with pytest.raises(ValidationError):
+        deserialize(CASES[1][0], [{"id": 1, "name": "General", "summary": "", "summaryformat": 1}])
+    with pytest.raises(ValidationError):
+        CoreEnrolGetUsersCoursesResponseInner(id=2, fullname="Course", shortname="C")
+
+
+
+def test_complete_responses_are_still_validated_from_json(monkeypatch):
+    validated = []
+    validate_json = TypeAdapter.validate_json
+
+    def record(adapter, data, *args, **kwargs):
+        validated.append(data)
+        return validate_json(adapter, data, *args, **kwargs)
+
+    monkeypatch.setattr(TypeAdapter, "validate_json", record)
+    client = ApiClient(Configuration(host="https://moodle.example"))
+    response_type, model, data = CASES[0]
+    complete = [model.from_dict(item).model_dump(by_alias=True) for item in data]
+    assert deserialize(response_type, data, client) == deserialize(response_type, complete, client)
+    # the first response was rejected, the second one validated all the same
+    assert validated == [json.dumps(data).encode(), json.dumps(complete).encode()]
@@ -0,0 +1,49 @@
+"""Tests the decoding of oneOf models by the shape of their value."""
+
+import json
+
+import pytest
+
+from poodle_async_mini.models import CoreCourseGetContentsResponseInnerModulesInner
+from poodle_async_mini.models.core_course_get_contents_response_inner_modules_inner_activitybadge import (
+    CoreCourseGetContentsResponseInnerModulesInnerActivitybadge as Activitybadge,
+)
+from poodle_async_mini.models.core_course_get_contents_response_inner_modules_inner_activitybadge_one_of import (
+    CoreCourseGetContentsResponseInnerModulesInnerActivitybadgeOneOf as Badge,
+)
+
+MODULE = {
+    "id": 7,
+    "name": "Slides",
+    "modname": "resource",
+    "modplural": "Files",
+    "modicon": "https://moodle.example/theme/image.php/icon",
+    "indent": 0,
+    "purpose": "content",
+}
+
+BADGE = {"badgecontent": "New", "badgestyle": "badge-info"}
+
+
+@pytest.mark.parametrize("value", [BADGE, [BADGE, BADGE]], ids=["object", "array"])
+def test_shapes(value):
+    badge = Activitybadge.from_dict(value)
+    expected = Badge.from_dict(BADGE)
+    assert badge.actual_instance == (expected if isinstance(value, dict) else [expected] * 2)
+
+
+@pytest.mark.parametrize("value", [BADGE, {}, [BADGE]], ids=["object", "empty", "array"])
+def test_fields_are_decoded_alike(value):
+    data = dict(MODULE, activitybadge=value)
+    expected = CoreCourseGetContentsResponseInnerModulesInner.from_dict(data).activitybadge
+    assert CoreCourseGetContentsResponseInnerModulesInner.model_validate_json(json.dumps(data)).activitybadge == expected
+    assert CoreCourseGetContentsResponseInnerModulesInner.model_validate(data).activitybadge == expected
+    # an empty object is a badge without content, not an empty wrapper
+    assert expected.actual_instance is not None
+
+
+def test_constructor():
+    badge = Badge.from_dict(BADGE)
+    assert Activitybadge(badge).actual_instance == badge
+    assert Activitybadge(actual_instance=badge).actual_instance == badge
+    assert Activitybadge.model_validate(Activitybadge(badge)).actual_instance == badge
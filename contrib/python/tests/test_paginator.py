@@ -0,0 +1,135 @@
+"""Tests the iteration over the pages of paged wsfunctions."""
+
+import asyncio
+
+import pytest
+
+from poodle_async_mini import ApiClient, ApiValueError, Configuration, DefaultApi, Paginator
+
+PARTICIPANTS = [{"id": i, "fullname": "User %d" % i} for i in range(5)]
+
+
+def comment(i):
+    return {
+        "avatar": "",
+        "content": "Comment %d" % i,
+        "format": 1,
+        "fullname": "",
+        "id": i,
+        "profileurl": "",
+        "strftimeformat": "",
+        "time": "",
+        "timecreated": 0,
+        "userid": 2,
+    }
+
+
+def get_comments(params):
+    page = int(params.get("page", 0))
+    return {"comments": [comment(i) for i in range(page * 2, min(page * 2 + 2, 5))], "perpage": 2}
+
+
+def list_participants(params):
+    skip, limit = int(params["skip"]), int(params["limit"])
+    return PARTICIPANTS[skip:skip + limit]
+
+
+def iterate(moodle, operation, *args, count=None, **kwargs):
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            items = []
+            async with getattr(DefaultApi(client), operation)(*args, **kwargs) as paginator:
+                async for item in paginator:
+                    items.append(item)
+                    if len(items) == count:
+                        break
+            return items
+
+    return asyncio.run(main())
+
+
+def test_pages(moodle):
+    moodle.functions["core_comment_get_comments"] = get_comments
+    comments = iterate(moodle, "iter_core_comment_get_comments", "mod_assign", "module", 3, 4)
+    assert [c.content for c in comments] == ["Comment %d" % i for i in range(5)]
+    # the pages fetched ahead may arrive in any order
+    pages = sorted(int(params["page"]) for params in moodle.called("core_comment_get_comments"))
+    assert pages[:3] == [0, 1, 2]
+
+
+def test_offsets(moodle):
+    moodle.functions["mod_assign_list_participants"] = list_participants
+    participants = iterate(moodle, "iter_mod_assign_list_participants", 1, "", 0, limit=2, _raw=True)
+    assert participants == PARTICIPANTS
+    calls = moodle.called("mod_assign_list_participants")
+    assert sorted((int(params["skip"]), params["limit"]) for params in calls)[:3] == [(0, "2"), (2, "2"), (4, "2")]
+
+
+def test_first_cursor_is_given(moodle):
+    moodle.functions["mod_assign_list_participants"] = list_participants
+    participants = iterate(moodle, "iter_mod_assign_list_participants", 1, "", 0, skip=3, _raw=True)
+    assert participants == PARTICIPANTS[3:]
+    assert moodle.called("mod_assign_list_participants")[0]["limit"] == str(Paginator.DEFAULT_PAGE_SIZE)
+
+
+def test_leaving_early(moodle):
+    moodle.functions["core_comment_get_comments"] = get_comments
+    comments = iterate(moodle, "iter_core_comment_get_comments", "mod_assign", "module", 3, 4, count=1, _prefetch=0)
+    assert len(comments) == 1
+    assert len(moodle.called("core_comment_get_comments")) == 1
+
+
+class Call:
+    """Stands for a PreparedCall of a function paged by the id of the last
+    item."""
+
+    def __init__(self, items, size):
+        self.items = items
+        self.size = size
+        self.cursors = []
+
+    async def __call__(self, **params):
+        after = params.get("after")
+        self.cursors.append(after)
+        start = 0 if after is None else next(i for i, item in enumerate(self.items) if item["id"] == after) + 1
+        return {"result": {"items": self.items[start:start + self.size]}}
+
+
+def test_after():
+    call = Call([{"id": i * 10} for i in range(5)], 2)
+
+    async def main():
+        return [item async for item in Paginator(call, {}, "after", "after", items="result.items", key="id")]
+
+    assert asyncio.run(main()) == call.items
+    assert call.cursors == [None, 10, 30]
+
+
+class OffsetCall:
+    """Stands for a PreparedCall of a function paged by offset, with a
+    page size of its own."""
+
+    def __init__(self, items, size):
+        self.items = items
+        self.size = size
+        self.offsets = []
+
+    async def __call__(self, **params):
+        self.offsets.append(params["from"])
+        return self.items[params["from"]:params["from"] + self.size]
+
+
+def test_offsets_without_page_size():
+    call = OffsetCall(list(range(7)), 3)
+
+    async def main():
+        return [item async for item in Paginator(call, {}, "offset", "from", prefetch=2)]
+
+    assert asyncio.run(main()) == call.items
+    # the second page is requested once the size of the first is known
+    assert call.offsets[:3] == [0, 3, 6]
+
+
+def test_after_needs_a_key():
+    with pytest.raises(ApiValueError):
+        Paginator(Call([], 2), {}, "after", "after")
@@ -0,0 +1,64 @@
+"""Tests the calls prepared once and sent repeatedly."""
+
+import asyncio
+
+import pytest
+
+from poodle_async_mini import ApiClient, ApiValueError, Configuration, DefaultApi
+
+COMMENTS = {"comments": [], "count": 0, "perpage": 15, "canpost": True, "warnings": []}
+
+
+def get_comments(params):
+    return COMMENTS
+
+
+def test_prepared_call(moodle):
+    moodle.functions["core_comment_get_comments"] = get_comments
+
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token1"})) as client:
+            prepared = DefaultApi(client).core_comment_get_comments_prepare(
+                "mod_assign", "module", 3, 4, area="submission_comments", page=0
+            )
+            first = await prepared()
+            await prepared(page=1)
+            await prepared.replace(page=2)()
+            await prepared.with_token("token2")()
+            await prepared()
+            return first
+
+    assert asyncio.run(main()).count == 0
+    calls = moodle.called("core_comment_get_comments")
+    assert [(params["page"], params["wstoken"]) for params in calls] == [
+        ("0", "token1"),
+        ("1", "token1"),
+        ("2", "token1"),
+        ("0", "token2"),
+        ("0", "token1"),
+    ]
+    assert all(params["area"] == "submission_comments" and params["itemid"] == "4" for params in calls)
+
+
+def test_nested_parameters_are_swapped(moodle):
+    moodle.functions["core_course_get_contents"] = lambda params: []
+
+    async def main():
+        async with ApiClient(Configuration(host=moodle.url, api_key={"wstoken": "token"})) as client:
+            prepared = DefaultApi(client).core_course_get_contents_prepare(
+                2, options=[{"name": "excludemodules", "value": "1"}]
+            )
+            await prepared(options=[{"name": "cmid", "value": "5"}])
+
+    asyncio.run(main())
+    assert moodle.called("core_course_get_contents") == [
+        {"wstoken": "token", "wsfunction": "core_course_get_contents", "moodlewsrestformat": "json",
+         "courseid": "2", "options[0][name]": "cmid", "options[0][value]": "5"}
+    ]
+
+
+def test_unknown_parameter():
+    client = ApiClient(Configuration(host="https://moodle.example", api_key={"wstoken": "token"}))
+    prepared = DefaultApi(client).core_course_get_contents_prepare(2)
+    with pytest.raises(ApiValueError):
+        prepared.replace(unknown=1)
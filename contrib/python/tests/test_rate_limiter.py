@@ -0,0 +1,147 @@
+"""Tests the adaptive rate limiting of requests per host and token."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from poodle_async_mini import ApiClient, ApiException, Configuration, DefaultApi
+from poodle_async_mini.rest import AdaptiveConcurrency, RateLimiter, TokenBucket
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+class Server:
+    """Answers core_group_get_course_groups slowly, recording the highest
+    number of concurrent requests."""
+
+    def __init__(self, moodle, status=200):
+        self.status = status
+        self.active = 0
+        self.concurrent = 0
+        moodle.functions["core_group_get_course_groups"] = self.course_groups
+
+    async def course_groups(self, params):
+        self.active += 1
+        self.concurrent = max(self.concurrent, self.active)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.active -= 1
+        if self.status != 200:
+            return web.Response(status=self.status)
+        return [GROUP]
+
+
+def call(moodle, limiter, count, tokens=("token",)):
+    async def main():
+        clients = []
+        for token in tokens:
+            configuration = Configuration(host=moodle.url, api_key={"wstoken": token})
+            configuration.rate_limiter = limiter
+            clients.append(ApiClient(configuration))
+        try:
+            return await asyncio.gather(
+                *[DefaultApi(client).core_group_get_course_groups(2) for client in clients for _ in range(count)],
+                return_exceptions=True,
+            )
+        finally:
+            for client in clients:
+                await client.close()
+
+    return asyncio.run(main())
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+    bucket.refund()
+    assert 0.19 < bucket.reserve() <= 0.2
+
+
+def test_aimd():
+    async def main():
+        limit = AdaptiveConcurrency(limit=4, min_limit=1, max_limit=5, backoff=0.5)
+        epochs = [await limit.acquire() for _ in range(4)]
+        waiter = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+        assert limit.queued == 1
+        # one decrease per round of requests
+        limit.release(epochs[0], True)
+        limit.release(epochs[1], True)
+        assert (limit.limit, limit.decreases) == (2.0, 1)
+        assert limit.queued == 1
+        # healthy responses while the limit is used up grow it by 1/limit
+        limit.release(epochs[2], False)
+        assert limit.limit == 2.5
+        await waiter
+        limit.release(epochs[3], False)
+        assert limit.limit == pytest.approx(2.9)
+        assert (limit.in_flight, limit.queued) == (1, 0)
+        # but not while it isn't
+        limit.release(await limit.acquire(), False)
+        grown = limit.limit
+        limit.release(await limit.acquire(), False)
+        assert limit.limit == grown
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter():
+    async def main():
+        limit = AdaptiveConcurrency(limit=1)
+        epoch = await limit.acquire()
+        waiter = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert limit.queued == 0
+        limit.release(epoch, None)
+        assert limit.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_concurrency_limit(moodle):
+    server = Server(moodle)
+    limiter = RateLimiter(concurrency=2, max_concurrency=2)
+    assert all(isinstance(groups, list) for groups in call(moodle, limiter, 6, tokens=("token1", "token2")))
+    assert server.concurrent == 2
+    assert limiter.metrics()[moodle.url.split("//")[1]] == {
+        "limit": 2, "in_flight": 0, "queued": 0, "throttled": 0, "decreases": 0
+    }
+
+
+def test_congestion_decreases_the_limit(moodle):
+    Server(moodle, status=503)
+    limiter = RateLimiter(concurrency=8)
+    results = call(moodle, limiter, 4)
+    assert all(isinstance(result, ApiException) for result in results)
+    metrics = limiter.metrics()[moodle.url.split("//")[1]]
+    assert (metrics["limit"], metrics["decreases"]) == (4, 1)
+
+
+def test_rate_per_token(moodle):
+    Server(moodle)
+    limiter = RateLimiter(token_rate=20, token_burst=1)
+    start = time.monotonic()
+    call(moodle, limiter, 3)
+    assert time.monotonic() - start >= 0.1
+    start = time.monotonic()
+    # other tokens have their own buckets
+    call(moodle, limiter, 1, tokens=("token1", "token2", "token3"))
+    assert time.monotonic() - start < 0.1 + 0.05 * 3
@@ -0,0 +1,69 @@
+"""Tests the raw decode mode, returning the parsed JSON."""
+
+import asyncio
+import inspect
+
+import pytest
+
+from poodle_async_mini import ApiClient, ApiException, Configuration, DefaultApi
+from poodle_async_mini.models import CoreGroupGetCourseGroupsResponseInner
+from poodle_async_mini.typed_dicts import CoreGroupGetCourseGroupsResponseInnerDict
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+def course_groups(moodle, raw_responses=False, **kwargs):
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+        configuration.raw_responses = raw_responses
+        async with ApiClient(configuration) as client:
+            return await DefaultApi(client).core_group_get_course_groups(2, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_raw_argument(moodle):
+    moodle.functions["core_group_get_course_groups"] = lambda params: [GROUP]
+    assert course_groups(moodle, _raw=True) == [GROUP]
+    assert course_groups(moodle) == [CoreGroupGetCourseGroupsResponseInner.from_dict(GROUP)]
+
+
+def test_raw_configuration(moodle):
+    moodle.functions["core_group_get_course_groups"] = lambda params: [GROUP]
+    assert course_groups(moodle, raw_responses=True) == [GROUP]
+    assert course_groups(moodle, raw_responses=True, _raw=False) == [
+        CoreGroupGetCourseGroupsResponseInner.from_dict(GROUP)
+    ]
+
+
+def test_raw_errors_raise(moodle):
+    moodle.functions["core_group_get_course_groups"] = lambda params: {
+        "exception": "moodle_exception", "errorcode": "nopermissions", "message": "No permission"
+    }
+    with pytest.raises(ApiException, match="No permission"):
+        course_groups(moodle, _raw=True)
+
+
+def test_raw_only_where_responses_are_decoded():
+    api = DefaultApi(ApiClient(Configuration(host="https://moodle.example")))
+    for suffix in ["", "_with_http_info", "_stream", "_prepare", "_from_args"]:
+        assert "_raw" in inspect.signature(getattr(api, "core_group_get_course_groups" + suffix)).parameters
+    for suffix in ["_args", "_without_preload_content"]:
+        assert "_raw" not in inspect.signature(getattr(api, "core_group_get_course_groups" + suffix)).parameters
+
+
+def test_typed_dicts():
+    assert CoreGroupGetCourseGroupsResponseInnerDict.__required_keys__ >= {"id", "courseid", "name"}
+    assert set(CoreGroupGetCourseGroupsResponseInnerDict.__annotations__) == set(
+        CoreGroupGetCourseGroupsResponseInner.model_fields
+    )
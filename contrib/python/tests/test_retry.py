@@ -0,0 +1,94 @@
+"""Tests the retries of read-only wsfunction calls."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from poodle_async_mini import ApiClient, ApiException, Configuration, DefaultApi
+from poodle_async_mini.configuration import RetryPolicy
+
+
+class Flaky:
+    """Fails the first calls with 503 Service Unavailable."""
+
+    def __init__(self, failures, data):
+        self.failures = failures
+        self.data = data
+        self.calls = 0
+
+    def __call__(self, params):
+        self.calls += 1
+        if self.calls <= self.failures:
+            return web.Response(status=503)
+        return self.data
+
+
+def configuration(moodle, retries=3, **policy):
+    configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"}, retries=retries)
+    configuration.retry_policy = RetryPolicy(start_timeout=0.01, jitter=0, **policy)
+    return configuration
+
+
+def call(configuration, operation, *args):
+    async def main():
+        async with ApiClient(configuration) as client:
+            return await getattr(DefaultApi(client), operation)(*args)
+
+    return asyncio.run(main())
+
+
+def test_read_only_call_is_retried(moodle):
+    moodle.functions["core_course_get_contents"] = contents = Flaky(2, [])
+    assert call(configuration(moodle), "core_course_get_contents", 2) == []
+    assert contents.calls == 3
+
+
+def test_retries_are_bounded(moodle):
+    moodle.functions["core_course_get_contents"] = contents = Flaky(5, [])
+    with pytest.raises(ApiException) as raised:
+        call(configuration(moodle), "core_course_get_contents", 2)
+    assert raised.value.status == 503
+    assert contents.calls == 3
+
+
+def test_mutating_call_is_not_retried(moodle):
+    moodle.functions["core_comment_add_comments"] = comments = Flaky(1, [])
+    with pytest.raises(ApiException):
+        call(configuration(moodle), "core_comment_add_comments", [])
+    assert comments.calls == 1
+
+
+def test_allowed_mutating_call_is_retried(moodle):
+    moodle.functions["core_comment_add_comments"] = comments = Flaky(1, [])
+    call(configuration(moodle, allow=["core_comment_add_comments"]), "core_comment_add_comments", [])
+    assert comments.calls == 2
+
+
+def test_denied_call_is_not_retried(moodle):
+    moodle.functions["core_course_get_contents"] = contents = Flaky(1, [])
+    with pytest.raises(ApiException):
+        call(configuration(moodle, deny=["core_course_get_contents"]), "core_course_get_contents", 2)
+    assert contents.calls == 1
+
+
+def test_read_only_call_is_retried_by_default(moodle):
+    moodle.functions["core_course_get_contents"] = contents = Flaky(5, [])
+    with pytest.raises(ApiException):
+        call(configuration(moodle, retries=None), "core_course_get_contents", 2)
+    assert contents.calls == RetryPolicy().attempts
+
+
+def test_mutating_call_is_not_retried_by_default(moodle):
+    moodle.functions["core_comment_add_comments"] = comments = Flaky(1, [])
+    with pytest.raises(ApiException):
+        call(configuration(moodle, retries=None), "core_comment_add_comments", [])
+    assert comments.calls == 1
+
+
+@pytest.mark.parametrize("retries", [0, 1])
+def test_retries_can_be_disabled(moodle, retries):
+    moodle.functions["core_course_get_contents"] = contents = Flaky(1, [])
+    with pytest.raises(ApiException):
+        call(configuration(moodle, retries=retries), "core_course_get_contents", 2)
+    assert contents.calls == 1
@@ -0,0 +1,113 @@
+"""Tests the sharing of identical concurrent requests."""
+
+import asyncio
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi
+
+GROUP = {
+    "id": 1,
+    "courseid": 2,
+    "name": "Group",
+    "description": "",
+    "descriptionformat": 1,
+    "enrolmentkey": "",
+    "idnumber": "",
+    "participation": True,
+    "visibility": 0,
+}
+
+
+async def course_groups(params):
+    await asyncio.sleep(0.1)
+    return [dict(GROUP, courseid=int(params["courseid"]))]
+
+
+def configuration(moodle, single_flight=True):
+    configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+    configuration.single_flight = single_flight
+    return configuration
+
+
+def test_identical_calls_share_a_request(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            results = await asyncio.gather(
+                *[api.core_group_get_course_groups(2) for _ in range(3)],
+                api.core_group_get_course_groups(3),
+            )
+            assert client.in_flight.shared == 2
+            # and a later call sends its own
+            await api.core_group_get_course_groups(2)
+            return results
+
+    results = asyncio.run(main())
+    assert [groups[0].courseid for groups in results] == [2, 2, 2, 3]
+    courseids = [params["courseid"] for params in moodle.called("core_group_get_course_groups")]
+    assert sorted(courseids[:2]) == ["2", "3"]
+    assert courseids[2:] == ["2"]
+
+
+def test_calls_get_their_own_models(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            return await asyncio.gather(*[api.core_group_get_course_groups(2) for _ in range(2)])
+
+    first, second = asyncio.run(main())
+    assert len(moodle.called("core_group_get_course_groups")) == 1
+    assert first == second
+    first[0].name = "Renamed"
+    assert second[0].name == "Group"
+
+
+def test_disabled_by_default(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle, single_flight=False)) as client:
+            api = DefaultApi(client)
+            await asyncio.gather(*[api.core_group_get_course_groups(2) for _ in range(2)])
+
+    asyncio.run(main())
+    assert len(moodle.called("core_group_get_course_groups")) == 2
+
+
+def test_cancelled_call_leaves_the_request(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            first = asyncio.ensure_future(api.core_group_get_course_groups(2))
+            second = asyncio.ensure_future(api.core_group_get_course_groups(2))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            groups = await second
+            assert first.cancelled()
+            return groups
+
+    assert asyncio.run(main())[0].courseid == 2
+    assert len(moodle.called("core_group_get_course_groups")) == 1
+
+
+def test_request_is_cancelled_with_all_calls(moodle):
+    moodle.functions["core_group_get_course_groups"] = course_groups
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            calls = [asyncio.ensure_future(api.core_group_get_course_groups(2)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            for call in calls:
+                call.cancel()
+            await asyncio.gather(*calls, return_exceptions=True)
+            assert not client.in_flight._flights
+            return await api.core_group_get_course_groups(2)
+
+    assert asyncio.run(main())[0].courseid == 2
+    assert len(moodle.called("core_group_get_course_groups")) == 2
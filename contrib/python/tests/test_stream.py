@@ -0,0 +1,27 @@
+"""Tests the `<operation>_stream` methods yielding the items of list responses."""
+
+import asyncio
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi
+from poodle_async_mini.models import ModAssignListParticipantsResponseInner
+
+# the first one complete, the others without recordid or requiregrading
+PARTICIPANTS = [
+    {"id": 1, "fullname": "First", "grantedextension": False, "recordid": 1, "requiregrading": False, "submitted": True},
+    {"id": 2, "fullname": "Second", "grantedextension": False, "requiregrading": True, "submitted": True},
+    {"id": 3, "fullname": "Third", "grantedextension": False, "recordid": 3, "submitted": False},
+]
+
+
+async def stream_participants(url):
+    configuration = Configuration(host=url, api_key={"wstoken": "token"})
+    async with ApiClient(configuration) as client:
+        return [item async for item in DefaultApi(client).mod_assign_list_participants_stream(1, "", 0)]
+
+
+def test_items_without_optional_fields(moodle):
+    moodle.functions["mod_assign_list_participants"] = lambda params: PARTICIPANTS
+    items = asyncio.run(stream_participants(moodle.url))
+    assert items == [ModAssignListParticipantsResponseInner.from_dict(item) for item in PARTICIPANTS]
+    assert items[1].recordid is None
+    assert items[2].requiregrading is None
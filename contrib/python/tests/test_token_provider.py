@@ -0,0 +1,100 @@
+"""Tests the TokenProvider logging in to obtain and renew wstokens."""
+
+import asyncio
+import json
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi, TokenProvider
+
+SITE_INFO = {
+    "sitename": "Moodle",
+    "username": "student",
+    "firstname": "Student",
+    "lastname": "One",
+    "fullname": "Student One",
+    "lang": "en",
+    "userid": 2,
+    "siteurl": "https://moodle.example",
+    "userpictureurl": "",
+    "functions": [],
+}
+
+INVALID_TOKEN = {"exception": "moodle_exception", "errorcode": "invalidtoken", "message": "Invalid token - token expired"}
+
+
+class Site:
+    """Issues tokens at `login/token.php`, of which only the last one is valid."""
+
+    def __init__(self, moodle):
+        self.tokens = []
+        moodle.functions["/login/token.php"] = self.login
+        moodle.functions["core_webservice_get_site_info"] = self.site_info
+
+    def login(self, params):
+        self.tokens.append("token%d" % len(self.tokens))
+        return {"token": self.tokens[-1]}
+
+    def site_info(self, params):
+        return SITE_INFO if self.tokens and params["wstoken"] == self.tokens[-1] else INVALID_TOKEN
+
+    def expire(self):
+        self.tokens.append(None)
+
+
+def configuration(moodle):
+    configuration = Configuration(host=moodle.url, username="student", password="secret")
+    configuration.token_provider = TokenProvider()
+    return configuration
+
+
+def test_rejected_token_is_renewed(moodle):
+    site = Site(moodle)
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            first = await api.core_webservice_get_site_info_prepare()()
+            site.expire()
+            second = await api.core_webservice_get_site_info_prepare()()
+            return first, second
+
+    first, second = asyncio.run(main())
+    assert first.username == second.username == "student"
+    assert site.tokens == ["token0", None, "token2"]
+
+
+def test_unread_response_is_passed_on(moodle):
+    site = Site(moodle)
+
+    async def main():
+        async with ApiClient(configuration(moodle)) as client:
+            api = DefaultApi(client)
+            await api.core_webservice_get_site_info()
+            site.expire()
+            args = api.core_webservice_get_site_info_args()
+            response = await client.call_api_from_args(args, _preload_content=False)
+            assert response.data is None
+            return b"".join([chunk async for chunk in response.iter_chunked(1024)])
+
+    assert json.loads(asyncio.run(main())) == INVALID_TOKEN
+    # not renewed, the caller decides what to do with the rejection
+    assert site.tokens == ["token0", None]
+
+
+def test_token_takes_precedence_over_the_refresh_hook(moodle):
+    site = Site(moodle)
+    refreshed = []
+
+    def refresh(configuration):
+        refreshed.append(True)
+        configuration.api_key = {"wstoken": "refreshed"}
+
+    async def main():
+        configuration_ = configuration(moodle)
+        configuration_.api_key = {"wstoken": "stale"}
+        configuration_.refresh_api_key_hook = refresh
+        async with ApiClient(configuration_) as client:
+            return await DefaultApi(client).core_webservice_get_site_info_prepare()()
+
+    assert asyncio.run(main()).sitename == "Moodle"
+    assert refreshed
+    assert moodle.called("core_webservice_get_site_info")[0]["wstoken"] == site.tokens[-1]
@@ -0,0 +1,61 @@
+"""Tests the trusted mode skipping the validation of arguments."""
+
+import asyncio
+from urllib.parse import urlencode
+
+import pydantic
+import pytest
+
+from poodle_async_mini import ApiClient, Configuration, DefaultApi
+from poodle_async_mini.models import CoreCommentAddCommentsParametersCommentsInner
+from poodle_async_mini.rest import encode_form
+
+COMMENT = {
+    "contextlevel": "module",
+    "instanceid": 3,
+    "component": "mod_assign",
+    "content": "Hello & welcome?",
+    "itemid": 4,
+    "area": "submission_comments",
+}
+
+
+def add_comments(moodle, comments, validation=True):
+    moodle.functions["core_comment_add_comments"] = lambda params: []
+
+    async def main():
+        configuration = Configuration(host=moodle.url, api_key={"wstoken": "token"})
+        configuration.client_side_validation = validation
+        async with ApiClient(configuration) as client:
+            return await DefaultApi(client).core_comment_add_comments(comments)
+
+    return asyncio.run(main())
+
+
+def test_arguments_are_validated(moodle):
+    with pytest.raises(pydantic.ValidationError):
+        add_comments(moodle, [dict(COMMENT, instanceid="three")])
+    assert not moodle.calls
+
+
+def test_trusted_mode_accepts_dicts(moodle):
+    add_comments(moodle, [COMMENT], validation=False)
+    add_comments(moodle, [CoreCommentAddCommentsParametersCommentsInner.from_dict(COMMENT)])
+    expected = {"comments[0][%s]" % key: str(value) for key, value in COMMENT.items()}
+    first, second = moodle.called("core_comment_add_comments")
+    assert {key: first[key] for key in expected} == expected
+    assert {key: second[key] for key in expected} == expected
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        [],
+        [("a", "b")],
+        [("comments[0][content]", "Hello & welcome?"), ("comments[0][instanceid]", "3")],
+        [("key", "ä ß/€"), ("bytes", b"\xff "), ("number", 1.5)],
+        [("a b", "+=&%")],
+    ],
+)
+def test_encode_form(params):
+    assert encode_form(params) == urlencode(params)
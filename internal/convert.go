@@ -139,6 +139,14 @@ func (p *Converter) Convert() error {
 		fixActivityBadge(methods)
 	}
 
+	var subsystems map[string]bool
+	if p.AddTags {
+		subsystems, err = p.Moodle.GetSubsystems()
+		if err != nil {
+			return err
+		}
+	}
+
 	p.Log.Printf("Converting (fixing defaults: %v, adding tags: %v) ...", p.FixDefaults, p.AddTags)
 	mapOfPathItemValues := make(map[string]openapi31.PathItem)
 	if p.AddLoginTokenPath {
@@ -178,6 +186,9 @@ func (p *Converter) Convert() error {
 		}
 		operation := openapi31.Operation{}
 		operation.WithID("login_token")
+		if p.AddTags {
+			operation.WithTags("core_login")
+		}
 		operation.WithRequestBody(openapi31.RequestBodyOrReference{
 			RequestBody: &requestBody,
 		})
@@ -210,15 +221,25 @@ func (p *Converter) Convert() error {
 		}
 
 		if p.AddTags {
-			operation.WithTags(method.Component)
+			operation.WithTags(componentTag(name, method.Component, subsystems))
 		}
 
 		if method.LoginRequired {
 			operation.WithSecurity(map[string][]string{"wstoken": {}})
 		}
 
+		// Mark functions that don't change state, so clients may retry them.
+		if method.Type == "read" || bool(method.ReadOnlySession) {
+			operation.WithMapOfAnythingItem("x-moodle-readonly", true)
+		}
+
 		paramsSchema := parseDynamicContentToSchema(method.ParametersDesc, p.FixDefaults)
 		params, _ := paramsSchema.ToSchemaOrBool().ToSimpleMap()
+
+		// Describe the cursor of paged functions, so clients may iterate over all pages.
+		if pagination, ok := paginations[name]; ok && hasParams(paramsSchema, pagination["cursor"], pagination["limit"]) {
+			operation.WithMapOfAnythingItem("x-moodle-pagination", pagination)
+		}
 		id := util.SnakeToPascal(name) + "Parameters"
 		ref := "#/components/schemas/" + id
 		spec.Components.WithSchemasItem(id, params)
@@ -338,6 +359,22 @@ func (p *Converter) Convert() error {
 	return err
 }
 
+// componentTag returns the tag grouping a method into a client class.
+// Plugin methods are tagged with their component. Core methods all report
+// the component "moodle" and are tagged with the subsystem encoded in their
+// name instead (core_course_get_contents -> core_course), or "core" if the
+// name does not start with a known subsystem.
+func componentTag(name string, component string, subsystems map[string]bool) string {
+	if component != "" && component != "moodle" && component != "core" {
+		return component
+	}
+	parts := strings.SplitN(name, "_", 3)
+	if len(parts) == 3 && parts[0] == "core" && subsystems[parts[1]] {
+		return "core_" + parts[1]
+	}
+	return "core"
+}
+
 func parseSchemaType(vartype string) jsonschema.SimpleType {
 	switch vartype {
 	case "object":
@@ -545,6 +582,31 @@ func parseDynamicContentToSchema(desc util.DynamicContent, fixDefaults bool) *js
 	return schema
 }
 
+// Cursor conventions of paged functions:
+// kind is "page" (page number), "offset" (items to skip) or "after" (key of
+// the last item seen), cursor and limit name the parameters holding the
+// cursor and the page size, items is the dotted path of the list of items
+// in the response, empty for the response itself, and key the item field
+// holding the cursor of kind "after".
+var paginations = map[string]map[string]string{
+	"core_calendar_get_action_events_by_timesort": {"kind": "after", "cursor": "aftereventid", "limit": "limitnum", "items": "events", "key": "id"},
+	"core_comment_get_comments":                   {"kind": "page", "cursor": "page", "limit": "", "items": "comments", "key": ""},
+	"core_message_get_conversation_messages":      {"kind": "offset", "cursor": "limitfrom", "limit": "limitnum", "items": "messages", "key": ""},
+	"core_reportbuilder_retrieve_report":          {"kind": "page", "cursor": "page", "limit": "perpage", "items": "data.rows", "key": ""},
+	"core_search_get_results":                     {"kind": "page", "cursor": "page", "limit": "", "items": "results", "key": ""},
+	"mod_assign_list_participants":                {"kind": "offset", "cursor": "skip", "limit": "limit", "items": "", "key": ""},
+}
+
+// hasParams reports whether the schema has all the given, non-empty properties.
+func hasParams(schema *jsonschema.Schema, names ...string) bool {
+	for _, name := range names {
+		if _, ok := schema.Properties[name]; name != "" && !ok {
+			return false
+		}
+	}
+	return true
+}
+
 func filterMethodsBlacklist(methods util.Methods, blacklist []string) {
 	for _, entry := range blacklist {
 		delete(methods, entry)
@@ -18,19 +18,21 @@ type Generator struct {
 	OutPath            string
 	TemplateDir        string
 	IgnoreFileOverride string
+	ConfigFile         string
 	GeneratorArgs      []string
 	ImageVersion       string
 	UseDocker          bool
 	Log                *log.Logger
 }
 
-func NewGenerator(generatorName string, input string, outPath string, templateDir string, ignoreFileOverride string, generatorArgs []string, imageVerison string, useDocker bool) *Generator {
+func NewGenerator(generatorName string, input string, outPath string, templateDir string, ignoreFileOverride string, configFile string, generatorArgs []string, imageVerison string, useDocker bool) *Generator {
 	return &Generator{
 		GeneratorName:      generatorName,
 		Input:              input,
 		OutPath:            outPath,
 		TemplateDir:        templateDir,
 		IgnoreFileOverride: ignoreFileOverride,
+		ConfigFile:         configFile,
 		GeneratorArgs:      generatorArgs,
 		ImageVersion:       imageVerison,
 		UseDocker:          useDocker,
@@ -92,6 +94,19 @@ func (g *Generator) ProcessDocker() error {
 		)
 	}
 
+	configName := ""
+	if g.ConfigFile != "" {
+		absConfigPath, err := filepath.Abs(g.ConfigFile)
+		if err != nil {
+			return err
+		}
+		configName = filepath.Base(absConfigPath)
+		args = append(args,
+			"-v",
+			fmt.Sprintf("%s:/config_%s", absConfigPath, configName),
+		)
+	}
+
 	args = append(args,
 		"-u",
 		fmt.Sprintf("%s:%s", user.Uid, user.Gid),
@@ -108,6 +123,13 @@ func (g *Generator) ProcessDocker() error {
 		)
 	}
 
+	if g.ConfigFile != "" {
+		args = append(args,
+			"-c",
+			fmt.Sprintf("/config_%s", configName),
+		)
+	}
+
 	args = append(args,
 		"-i",
 		fmt.Sprintf("/input_%s", inputName),
@@ -155,6 +177,13 @@ func (g *Generator) ProcessNative() error {
 		)
 	}
 
+	if g.ConfigFile != "" {
+		args = append(args,
+			"-c",
+			g.ConfigFile,
+		)
+	}
+
 	args = append(args,
 		"-i",
 		g.Input,
@@ -1,6 +1,7 @@
 package util
 
 import (
+	"encoding/json"
 	"errors"
 	"fmt"
 	"os"
@@ -132,3 +133,27 @@ func (moodle *Moodle) GetGitCommit() (string, error) {
 	}
 	return ref.Hash().String()[:7], nil
 }
+
+// GetSubsystems returns the core subsystems listed in lib/components.json.
+func (moodle *Moodle) GetSubsystems() (map[string]bool, error) {
+	content, err := os.ReadFile(moodle.Path + "/lib/components.json")
+	if errors.Is(err, os.ErrNotExist) {
+		content, err = os.ReadFile(moodle.Path + "/public/lib/components.json")
+	}
+	if err != nil {
+		return nil, err
+	}
+
+	var components struct {
+		Subsystems map[string]*string `json:"subsystems"`
+	}
+	if err := json.Unmarshal(content, &components); err != nil {
+		return nil, fmt.Errorf("failed to parse components.json: %w", err)
+	}
+
+	subsystems := make(map[string]bool, len(components.Subsystems))
+	for name := range components.Subsystems {
+		subsystems[name] = true
+	}
+	return subsystems, nil
+}